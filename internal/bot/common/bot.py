@@ -325,6 +325,7 @@ class TheBot:
                 inlineKeyboard=self._keyboardToMax(inlineKeyboard) if inlineKeyboard is not None else None,
                 format=maxModels.TextFormat.MARKDOWN if useMarkdown else None,
             )
+            return True
         else:
             logger.error(f"Can not edit message in platform {self.botProvider}")
         return False
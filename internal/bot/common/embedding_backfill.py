@@ -0,0 +1,457 @@
+"""Concurrent embedding backfill engine.
+
+Drains the backlog of un-embedded messages of every chat with
+embeddings enabled. ``ChatSearchHandler._dtCronJob`` only discovers the
+eligible chats (and their embedding models) and hands them to
+:meth:`EmbeddingBackfillEngine.syncChats`; the engine then runs a
+bounded pool of workers that:
+
+- always pick the runnable chat with the highest priority (bigger
+  backlog first, recently active chats boosted), one batch at a time,
+  so priorities are re-evaluated after every batch and no chat is ever
+  processed by two workers at once;
+- share one global embeddings-per-second budget, so the embedding
+  backend sees a steady, configurable load no matter how many chats
+  are pending;
+- walk each chat with a keyset cursor (``date``, ``message_id``) that
+  is persisted in the ``settings`` table after every batch, so a
+  restart resumes where it stopped instead of rescanning the chat from
+  its newest message.
+
+Per-chat throughput, backlog and ETA are available via
+:meth:`EmbeddingBackfillEngine.getStats`.
+"""
+
+import asyncio
+import datetime
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from internal.bot.common.embedding_utils import embedAndSaveMessages
+from internal.bot.models import EnsuredMessage, MediaAttachmentLookup
+from internal.models import MessageId
+
+if TYPE_CHECKING:
+    from internal.database import Database
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_SETTINGS_KEY_PREFIX: str = "embeddings-backfill:"
+"""Prefix of the ``settings`` table keys holding per-chat backfill progress."""
+
+BACKFILL_THROUGHPUT_SMOOTHING: float = 0.3
+"""Weight of the newest batch in the per-chat throughput moving average."""
+
+
+class _EmbeddingsBudget:
+    """Global embeddings-per-second budget shared by all backfill workers.
+
+    Reserve-then-sleep pacing: every :meth:`acquire` books its share of
+    the timeline up front and then sleeps until its slot starts, so
+    concurrent workers are serialised fairly without a lock.
+    """
+
+    __slots__ = ("rate", "_nextFree")
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the budget.
+
+        Args:
+            rate: Embeddings per second; ``<= 0`` disables pacing.
+        """
+        self.rate: float = rate
+        self._nextFree: float = 0.0
+
+    async def acquire(self, count: int) -> None:
+        """Wait until ``count`` embeddings fit into the budget.
+
+        Args:
+            count: Number of embeddings about to be generated.
+        """
+        if self.rate <= 0 or count <= 0:
+            return
+        now = time.monotonic()
+        startAt = max(self._nextFree, now)
+        self._nextFree = startAt + count / self.rate
+        if startAt > now:
+            await asyncio.sleep(startAt - now)
+
+
+class BackfillChatState:
+    """Backfill progress and statistics of one chat.
+
+    Attributes:
+        chatId: Chat identifier.
+        modelName: Embedding model the chat is backfilled with.
+        backlog: Estimated number of pending messages (``None`` if unknown).
+        cursorDate: ``date`` of the last processed message, or ``None``
+            to start from the newest message.
+        cursorMessageId: ``message_id`` of the last processed message.
+        completedAt: When the last full pass finished (``None`` while
+            a pass is in progress).
+        embeddedTotal: Messages embedded by the backfill so far.
+        throughput: Moving average of embedded messages per second.
+        lastActivity: Monotonic time of the last live message in the chat.
+        inFlight: Whether a worker is currently processing this chat.
+    """
+
+    __slots__ = (
+        "chatId",
+        "modelName",
+        "backlog",
+        "cursorDate",
+        "cursorMessageId",
+        "completedAt",
+        "embeddedTotal",
+        "throughput",
+        "lastActivity",
+        "inFlight",
+    )
+
+    def __init__(self, chatId: int, modelName: str) -> None:
+        """Initialize an empty (not yet started) state.
+
+        Args:
+            chatId: Chat identifier.
+            modelName: Embedding model name.
+        """
+        self.chatId: int = chatId
+        self.modelName: str = modelName
+        self.backlog: Optional[int] = None
+        self.cursorDate: Optional[datetime.datetime] = None
+        self.cursorMessageId: Optional[MessageId] = None
+        self.completedAt: Optional[datetime.datetime] = None
+        self.embeddedTotal: int = 0
+        self.throughput: float = 0.0
+        self.lastActivity: float = 0.0
+        self.inFlight: bool = False
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds until the backlog is drained (``None`` if unknown)."""
+        if self.completedAt is not None or self.backlog == 0:
+            return 0.0
+        if self.backlog is None or self.throughput <= 0:
+            return None
+        return self.backlog / self.throughput
+
+    def restart(self) -> None:
+        """Forget the cursor and start a new pass from the newest message."""
+        self.cursorDate = None
+        self.cursorMessageId = None
+        self.completedAt = None
+
+    def toJson(self) -> str:
+        """Serialise the persistent part of the state."""
+        return json.dumps(
+            {
+                "model": self.modelName,
+                "cursorDate": self.cursorDate.isoformat() if self.cursorDate is not None else None,
+                "cursorMessageId": self.cursorMessageId.asStr() if self.cursorMessageId is not None else None,
+                "completedAt": self.completedAt.isoformat() if self.completedAt is not None else None,
+                "embedded": self.embeddedTotal,
+            }
+        )
+
+    def loadJson(self, data: str) -> None:
+        """Restore the persistent part of the state.
+
+        Progress stored for another model is ignored: the new model has
+        to re-embed the whole chat anyway.
+
+        Args:
+            data: JSON produced by :meth:`toJson`.
+
+        Raises:
+            ValueError: If ``data`` is malformed.
+        """
+        stored: Dict[str, Any] = json.loads(data)
+        if not isinstance(stored, dict):
+            raise ValueError(f"backfill state must be an object, got {type(stored).__name__}")
+        self.embeddedTotal = int(stored.get("embedded", 0) or 0)
+        if stored.get("model") != self.modelName:
+            return
+        if stored.get("cursorDate") and stored.get("cursorMessageId") is not None:
+            self.cursorDate = datetime.datetime.fromisoformat(stored["cursorDate"])
+            self.cursorMessageId = MessageId(stored["cursorMessageId"])
+        if stored.get("completedAt"):
+            self.completedAt = datetime.datetime.fromisoformat(stored["completedAt"])
+
+
+class EmbeddingBackfillEngine:
+    """Bounded worker pool draining embedding backlogs across chats.
+
+    Workers are spawned on demand by :meth:`start` and exit as soon as
+    no chat has pending work, so an idle engine holds no tasks.
+
+    Attributes:
+        db: Database wrapper.
+        workers: Max number of concurrently processed chats.
+        batchSize: Messages fetched and embedded per batch.
+        activityWindow: Seconds a live message keeps its chat boosted.
+        activityBoost: Priority multiplier of recently active chats.
+        rescanInterval: Seconds before a completed chat is checked again.
+    """
+
+    __slots__ = (
+        "db",
+        "workers",
+        "batchSize",
+        "activityWindow",
+        "activityBoost",
+        "rescanInterval",
+        "_budget",
+        "_chats",
+        "_tasks",
+        "_stopping",
+    )
+
+    def __init__(
+        self,
+        db: "Database",
+        *,
+        workers: int = 4,
+        embeddingsPerSecond: float = 0.0,
+        batchSize: int = 50,
+        activityWindow: float = 600.0,
+        activityBoost: float = 4.0,
+        rescanInterval: float = 3600.0,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            db: Database wrapper.
+            workers: Max concurrent workers (default: 4).
+            embeddingsPerSecond: Global embedding budget; ``<= 0`` means
+                unlimited (default: 0).
+            batchSize: Messages per batch (default: 50).
+            activityWindow: Seconds a chat counts as recently active
+                after a live message (default: 600).
+            activityBoost: Priority multiplier for recently active chats
+                (default: 4).
+            rescanInterval: Seconds after which a completed chat is
+                counted again to pick up failed rows (default: 3600).
+        """
+        self.db = db
+        self.workers: int = max(1, workers)
+        self.batchSize: int = max(1, batchSize)
+        self.activityWindow: float = activityWindow
+        self.activityBoost: float = activityBoost
+        self.rescanInterval: float = rescanInterval
+        self._budget = _EmbeddingsBudget(embeddingsPerSecond)
+        self._chats: Dict[int, BackfillChatState] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._stopping: bool = False
+
+    @staticmethod
+    def _settingsKey(chatId: int) -> str:
+        return f"{BACKFILL_SETTINGS_KEY_PREFIX}{chatId}"
+
+    async def syncChats(self, chats: Dict[int, str]) -> None:
+        """Reconcile the tracked chats with the currently eligible ones.
+
+        New chats get their persisted progress loaded and their backlog
+        counted; chats that switched models restart from scratch; chats
+        that are no longer eligible are dropped; completed chats are
+        recounted every ``rescanInterval`` seconds.
+
+        Args:
+            chats: Eligible chats, ``chatId -> embedding model name``.
+        """
+        for chatId in list(self._chats):
+            if chatId not in chats:
+                del self._chats[chatId]
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        for chatId, modelName in chats.items():
+            state = self._chats.get(chatId)
+            if state is None:
+                state = BackfillChatState(chatId, modelName)
+                await self._loadState(state)
+                self._chats[chatId] = state
+                await self._countBacklog(state)
+                if state.backlog == 0 and state.completedAt is None:
+                    state.restart()
+                    state.completedAt = now
+            elif state.modelName != modelName:
+                state.modelName = modelName
+                state.restart()
+                state.throughput = 0.0
+                await self._countBacklog(state)
+            elif (
+                state.completedAt is not None
+                and not state.inFlight
+                and (now - state.completedAt).total_seconds() >= self.rescanInterval
+            ):
+                await self._countBacklog(state)
+                if state.backlog:
+                    state.restart()
+                else:
+                    state.completedAt = now
+
+    def noteActivity(self, chatId: int) -> None:
+        """Boost the priority of ``chatId`` for the next ``activityWindow`` seconds.
+
+        Args:
+            chatId: Chat that just received a message.
+        """
+        state = self._chats.get(chatId)
+        if state is not None:
+            state.lastActivity = time.monotonic()
+
+    def start(self) -> None:
+        """Spawn workers for the runnable chats (up to ``workers`` in total)."""
+        if self._stopping:
+            return
+        runnable = sum(1 for state in self._chats.values() if state.completedAt is None and not state.inFlight)
+        for _ in range(min(runnable, self.workers - len(self._tasks))):
+            task = asyncio.create_task(self._worker())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def waitIdle(self) -> None:
+        """Wait until all running workers have finished."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def stop(self) -> None:
+        """Cancel the workers; progress up to the last finished batch is kept."""
+        self._stopping = True
+        for task in list(self._tasks):
+            task.cancel()
+        await self.waitIdle()
+
+    def getStats(self) -> List[Dict[str, Any]]:
+        """Return per-chat backfill statistics, biggest backlog first.
+
+        Returns:
+            One dict per tracked chat with ``chatId``, ``model``,
+            ``backlog``, ``embedded``, ``throughput`` (messages per
+            second), ``eta`` (seconds, ``None`` if unknown), ``completed``
+            and ``active`` (whether a worker is processing it right now).
+        """
+        ret = [
+            {
+                "chatId": state.chatId,
+                "model": state.modelName,
+                "backlog": state.backlog,
+                "embedded": state.embeddedTotal,
+                "throughput": state.throughput,
+                "eta": state.eta,
+                "completed": state.completedAt is not None,
+                "active": state.inFlight,
+            }
+            for state in self._chats.values()
+        ]
+        ret.sort(key=lambda item: -(item["backlog"] or 0))
+        return ret
+
+    def _priority(self, state: BackfillChatState, now: float) -> float:
+        priority = float(state.backlog if state.backlog is not None else self.batchSize)
+        if state.lastActivity and now - state.lastActivity <= self.activityWindow:
+            priority *= self.activityBoost
+        return priority
+
+    def _pickChat(self) -> Optional[BackfillChatState]:
+        now = time.monotonic()
+        candidates = [state for state in self._chats.values() if state.completedAt is None and not state.inFlight]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda state: self._priority(state, now))
+
+    async def _worker(self) -> None:
+        while not self._stopping:
+            state = self._pickChat()
+            if state is None:
+                return
+            state.inFlight = True
+            try:
+                await self._runBatch(state)
+            except Exception as e:
+                # A failing chat must not kill the worker; it is retried
+                # after the rescan interval.
+                logger.error("Backfill: batch for chat %d failed: %s", state.chatId, e)
+                state.completedAt = datetime.datetime.now(datetime.timezone.utc)
+            finally:
+                state.inFlight = False
+
+    async def _runBatch(self, state: BackfillChatState) -> None:
+        startTime = time.monotonic()
+        rows = await self.db.chatEmbeddings.getMessagesWithoutEmbeddings(
+            state.chatId,
+            limit=self.batchSize,
+            modelName=state.modelName,
+            beforeDate=state.cursorDate,
+            beforeMessageId=state.cursorMessageId,
+        )
+        if not rows:
+            state.restart()
+            state.completedAt = datetime.datetime.now(datetime.timezone.utc)
+            state.backlog = 0
+            await self._saveState(state)
+            logger.info("Backfill: chat %d is fully embedded (%d total)", state.chatId, state.embeddedTotal)
+            return
+
+        await self._budget.acquire(len(rows))
+
+        # One media lookup for the batch: attachments are loaded with a couple of queries
+        mediaLookup = MediaAttachmentLookup(self.db)
+        ensuredMessages: List[EnsuredMessage] = [
+            ensuredMessage
+            for ensuredMessage in await EnsuredMessage.fromDBChatMessages(rows, self.db, mediaLookup=mediaLookup)
+            if ensuredMessage.messageText.strip()
+        ]
+        results = await embedAndSaveMessages(
+            ensuredMessages=ensuredMessages, modelName=state.modelName, db=self.db, mediaLookup=mediaLookup
+        )
+        embedded = sum(results)
+
+        # Failed rows are passed too; the next pass after ``rescanInterval``
+        # picks them up again.
+        state.cursorDate = rows[-1]["date"]
+        state.cursorMessageId = rows[-1]["message_id"]
+        state.embeddedTotal += embedded
+        if state.backlog is not None:
+            state.backlog = max(0, state.backlog - len(rows))
+
+        elapsed = max(time.monotonic() - startTime, 1e-3)
+        rate = embedded / elapsed
+        if state.throughput <= 0:
+            state.throughput = rate
+        else:
+            state.throughput += BACKFILL_THROUGHPUT_SMOOTHING * (rate - state.throughput)
+
+        await self._saveState(state)
+        logger.debug(
+            "Backfill: embedded %d/%d messages in chat %d (%.2f seconds)",
+            embedded,
+            len(rows),
+            state.chatId,
+            elapsed,
+        )
+
+    async def _loadState(self, state: BackfillChatState) -> None:
+        try:
+            storedData = await self.db.common.getSetting(self._settingsKey(state.chatId))
+            if storedData:
+                state.loadJson(storedData)
+        except Exception as e:
+            logger.error("Backfill: failed to load progress for chat %d: %s", state.chatId, e)
+            state.restart()
+
+    async def _saveState(self, state: BackfillChatState) -> None:
+        try:
+            await self.db.common.setSetting(self._settingsKey(state.chatId), state.toJson())
+        except Exception as e:
+            logger.error("Backfill: failed to save progress for chat %d: %s", state.chatId, e)
+
+    async def _countBacklog(self, state: BackfillChatState) -> None:
+        try:
+            state.backlog = await self.db.chatEmbeddings.countMessagesWithoutEmbeddings(
+                state.chatId, modelName=state.modelName
+            )
+        except Exception as e:
+            logger.error("Backfill: failed to count backlog for chat %d: %s", state.chatId, e)
+            state.backlog = None
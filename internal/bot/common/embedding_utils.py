@@ -14,16 +14,22 @@ Extracting the recipe into a single helper keeps the per-message
 error-isolation contract (``return False on any failure, never raise``)
 in one place and avoids drift between the two call sites when the
 recipe grows (e.g. telemetry, cache invalidation, retry policy).
+
+``embedAndSaveMessages`` is the batched flavour of the same recipe
+(one ``model.generateEmbeddingsBatch`` call for many messages), used by
+the backfill worker directly and by ``EmbeddingBatcher``, which
+coalesces live per-message requests into short-lived micro-batches.
 """
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 from internal.bot.models import LLMMessageFormat
 from internal.models import MessageId
 
 if TYPE_CHECKING:
-    from internal.bot.models import EnsuredMessage
+    from internal.bot.models import EnsuredMessage, MediaAttachmentLookup
     from internal.database import Database
 
 logger = logging.getLogger(__name__)
@@ -122,3 +128,229 @@ async def embedAndSaveMessage(
         return False
 
     return True
+
+
+async def embedAndSaveMessages(
+    ensuredMessages: Sequence["EnsuredMessage"],
+    modelName: str,
+    db: "Database",
+    *,
+    mediaLookup: Optional["MediaAttachmentLookup"] = None,
+) -> List[bool]:
+    """Generate embeddings for several messages in one batch and persist them.
+
+    Batched counterpart of :func:`embedAndSaveMessage` with the same
+    never-raise contract. All texts go through a single
+    ``model.generateEmbeddingsBatch`` call (the model splits it into
+    backend-sized chunks). If the batch call fails as a whole, every
+    message is retried on its own through ``model.generateEmbeddings`` so
+    one poisoned text cannot cost the rest of the batch its embeddings.
+
+    Args:
+        ensuredMessages: Messages to embed, typically from a single chat.
+        modelName: Embedding model name (per-chat ``EMBEDDING_MODEL``
+            setting).
+        db: Database wrapper providing ``chatEmbeddings``.
+        mediaLookup: Media attachments cache the messages were created
+            with (see ``EnsuredMessage.fromDBChatMessages``), saves a media
+            query per message.
+
+    Returns:
+        One flag per input message, in input order: True when its
+        embedding was generated and saved, False otherwise (including
+        messages whose LLM-formatted text is empty).
+    """
+    # Imported here (rather than at module scope) to avoid a circular
+    # import: LLMService -> ... -> embedding_utils -> LLMService.
+    from internal.services.llm.service import LLMService
+
+    ret: List[bool] = [False] * len(ensuredMessages)
+    if not ensuredMessages:
+        return ret
+
+    try:
+        model = LLMService.getInstance().getLLMManager().getModel(modelName)
+    except Exception:
+        logger.exception("Failed to resolve embedding model %r for %d messages", modelName, len(ensuredMessages))
+        return ret
+
+    if model is None or not model.supportsEmbedding:
+        logger.warning(
+            "Embedding model %r not found or does not support embeddings; skipping %d messages",
+            modelName,
+            len(ensuredMessages),
+        )
+        return ret
+
+    indices: List[int] = []
+    texts: List[str] = []
+    for i, ensuredMessage in enumerate(ensuredMessages):
+        try:
+            messageText = await ensuredMessage.formatForLLM(
+                db, format=LLMMessageFormat.TEXT, useSingleMedia=False, mediaLookup=mediaLookup
+            )
+        except Exception:
+            logger.exception(
+                "Failed to format message %s in chat %d for embedding",
+                ensuredMessage.messageId,
+                ensuredMessage.recipient.id,
+            )
+            continue
+        if messageText.strip():
+            indices.append(i)
+            texts.append(messageText)
+    if not texts:
+        return ret
+
+    embeddings: List[Optional[List[float]]] = [None] * len(texts)
+    try:
+        embeddings = list(await model.generateEmbeddingsBatch(texts))
+    except Exception as e:
+        logger.warning(
+            "Batch embedding of %d messages with model %r failed, falling back to one by one: %s",
+            len(texts),
+            modelName,
+            e,
+        )
+        for pos, text in enumerate(texts):
+            ensuredMessage = ensuredMessages[indices[pos]]
+            try:
+                embeddings[pos] = await model.generateEmbeddings(text)
+            except Exception:
+                logger.exception(
+                    "Failed to generate embedding for message %s in chat %d with model %r",
+                    ensuredMessage.messageId,
+                    ensuredMessage.recipient.id,
+                    modelName,
+                )
+
+    for pos, embedding in enumerate(embeddings):
+        if embedding is None:
+            continue
+        ensuredMessage = ensuredMessages[indices[pos]]
+        try:
+            await db.chatEmbeddings.saveMessageEmbedding(
+                chatId=ensuredMessage.recipient.id,
+                messageId=ensuredMessage.messageId,
+                embedding=embedding,
+                model=modelName,
+                date=ensuredMessage.date.isoformat() if ensuredMessage.date is not None else None,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to save embedding for message %s in chat %d with model %r",
+                ensuredMessage.messageId,
+                ensuredMessage.recipient.id,
+                modelName,
+            )
+            continue
+        ret[indices[pos]] = True
+
+    return ret
+
+
+class EmbeddingBatcher:
+    """Coalesce live per-message embedding requests into micro-batches.
+
+    Every :meth:`submit` call joins the pending batch of its model. The
+    submitter that opened the batch waits up to ``maxDelay`` seconds for
+    company and then flushes it; a batch that reaches ``maxBatchSize``
+    is flushed immediately by the submitter that filled it. Flushing goes
+    through :func:`embedAndSaveMessages`, so a burst of chat traffic costs
+    one embedding request instead of one per message.
+
+    No helper tasks are spawned: the flush always runs inside one of the
+    submitters, which the caller already tracks as a background task.
+
+    Attributes:
+        db: Database wrapper passed to :func:`embedAndSaveMessages`.
+        maxBatchSize: Flush a batch as soon as it holds this many messages.
+        maxDelay: Max seconds the first message of a batch waits for more.
+    """
+
+    __slots__ = ("db", "maxBatchSize", "maxDelay", "_pending")
+
+    def __init__(self, db: "Database", *, maxBatchSize: int = 32, maxDelay: float = 0.25) -> None:
+        """Initialize the batcher.
+
+        Args:
+            db: Database wrapper providing ``chatEmbeddings``.
+            maxBatchSize: Flush threshold in messages (default: 32).
+            maxDelay: Linger time of an open batch in seconds (default: 0.25).
+        """
+        self.db = db
+        self.maxBatchSize: int = max(1, maxBatchSize)
+        self.maxDelay: float = max(0.0, maxDelay)
+        self._pending: Dict[str, List[Tuple["EnsuredMessage", "asyncio.Future[bool]"]]] = {}
+
+    async def submit(self, ensuredMessage: "EnsuredMessage", modelName: str) -> bool:
+        """Embed and save ``ensuredMessage`` as part of the next micro-batch.
+
+        Never raises (except for cancellation of the caller itself).
+
+        Args:
+            ensuredMessage: The persisted message to embed.
+            modelName: Embedding model name (per-chat ``EMBEDDING_MODEL``).
+
+        Returns:
+            True when the embedding was generated and saved, False otherwise.
+        """
+        batch = self._pending.get(modelName)
+        isLeader = batch is None
+        if batch is None:
+            batch = []
+            self._pending[modelName] = batch
+        future: "asyncio.Future[bool]" = asyncio.get_running_loop().create_future()
+        batch.append((ensuredMessage, future))
+
+        if len(batch) >= self.maxBatchSize:
+            self._detach(modelName, batch)
+            await self._flush(modelName, batch)
+        elif isLeader:
+            try:
+                # Wakes early if another submitter fills and flushes the batch.
+                await asyncio.wait((future,), timeout=self.maxDelay)
+            except asyncio.CancelledError:
+                # Nobody would flush this batch any more, so resolve it
+                # right away instead of leaving the other waiters hanging.
+                if self._detach(modelName, batch):
+                    for _, pendingFuture in batch:
+                        if not pendingFuture.done():
+                            pendingFuture.set_result(False)
+                raise
+            if self._detach(modelName, batch):
+                await self._flush(modelName, batch)
+
+        return await future
+
+    def _detach(self, modelName: str, batch: List[Any]) -> bool:
+        """Remove ``batch`` from the pending map if it is still the open one.
+
+        Args:
+            modelName: Model the batch belongs to.
+            batch: The batch list to detach.
+
+        Returns:
+            True if ``batch`` was still pending and is now owned by the caller.
+        """
+        if self._pending.get(modelName) is batch:
+            del self._pending[modelName]
+            return True
+        return False
+
+    async def _flush(self, modelName: str, batch: List[Tuple["EnsuredMessage", "asyncio.Future[bool]"]]) -> None:
+        """Embed a detached batch and resolve its futures.
+
+        Args:
+            modelName: Embedding model name.
+            batch: Detached ``(message, future)`` pairs.
+        """
+        results: List[bool] = [False] * len(batch)
+        try:
+            results = await embedAndSaveMessages([item[0] for item in batch], modelName, self.db)
+        except Exception:
+            logger.exception("Failed to flush embedding batch of %d messages for model %r", len(batch), modelName)
+        finally:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
@@ -50,6 +50,7 @@ from internal.bot.models import (
     EnsuredMessage,
     FormatEntity,
     LLMMessageFormat,
+    MediaAttachmentLookup,
     MediaProcessingInfo,
     MentionCheckResult,
     MessageRecipient,
@@ -727,7 +728,10 @@ class BaseBotHandler(CommandHandlerMixin):
         keepFirstN = 1
         keepLastN = 1
 
-        eRootMessage = await EnsuredMessage.fromDBChatMessage(dbMessageList[0], self.db)
+        # Convert the whole thread at once to load media with batch queries, dood!
+        mediaLookup = MediaAttachmentLookup(self.db)
+        eMessageList = await EnsuredMessage.fromDBChatMessages(dbMessageList, self.db, mediaLookup=mediaLookup)
+        eRootMessage = eMessageList[0]
         await self._updateEMessageUserData(eRootMessage)
         condenseCache = eRootMessage.metadata.get("condensedThread", [])
         condenseCacheMessages: List[ModelMessage] = []
@@ -735,7 +739,7 @@ class BaseBotHandler(CommandHandlerMixin):
             # First - add skipped messages to result.
             # It should be ony starting message
             for i in range(min(keepFirstN, len(dbMessageList))):
-                eMessage = await EnsuredMessage.fromDBChatMessage(dbMessageList[i], self.db)
+                eMessage = eMessageList[i]
                 await self._updateEMessageUserData(eMessage)
                 ret.extend(
                     await eMessage.toModelMessageList(
@@ -743,6 +747,7 @@ class BaseBotHandler(CommandHandlerMixin):
                         format=llmMFormat,
                         outputFormat=outputFormat,
                         role=MessageCategory.fromStr(dbMessageList[i]["message_category"]).toRole(),
+                        mediaLookup=mediaLookup,
                     )
                 )
 
@@ -762,9 +767,9 @@ class BaseBotHandler(CommandHandlerMixin):
                     if dbMessage["message_id"] == condensedMessage["tillMessageId"] or dbMessage["date"] > lastDT:
                         break
                 dbMessageList = dbMessageList[skippedMessages:]
+                eMessageList = eMessageList[skippedMessages:]
 
-        for dbMessage in dbMessageList:
-            eMessage = await EnsuredMessage.fromDBChatMessage(dbMessage, self.db)
+        for dbMessage, eMessage in zip(dbMessageList, eMessageList):
             await self._updateEMessageUserData(eMessage)
             ret.extend(
                 await eMessage.toModelMessageList(
@@ -772,6 +777,7 @@ class BaseBotHandler(CommandHandlerMixin):
                     format=llmMFormat,
                     outputFormat=outputFormat,
                     role=MessageCategory.fromStr(dbMessage["message_category"]).toRole(),
+                    mediaLookup=mediaLookup,
                 )
             )
 
@@ -783,7 +789,7 @@ class BaseBotHandler(CommandHandlerMixin):
         # If we need condencind, assume that we sould use no more than 50% of the context size
         maxTokens = int(llmModel.contextSize * 0.5)
 
-        currentTokens = llmModel.getEstimateTokensCount([v.toDict() for v in ret])
+        currentTokens = llmModel.getEstimateMessagesTokensCount(ret)
         if currentTokens < maxTokens:
             return ret
 
@@ -808,7 +814,7 @@ class BaseBotHandler(CommandHandlerMixin):
         # logger.debug(f"lastM = {lastCondensedMessage}")
 
         condenseCacheMessages.extend(condensedRet)
-        currentTokens = llmModel.getEstimateTokensCount([v.toDict() for v in condenseCacheMessages])
+        currentTokens = llmModel.getEstimateMessagesTokensCount(condenseCacheMessages)
         if currentTokens > maxTokens:
             # If there are too many condensed entries in cache, condense them as well
             keepFirstN = 1
@@ -1866,8 +1872,8 @@ class BaseBotHandler(CommandHandlerMixin):
             # Store the attachment in the storage only if it doesn't exist
             # As we getting SHA512 hash of the attachment,
             # we can check if it exists in the storage with hight probability
-            if not self.storage.exists(key):
-                self.storage.store(key, data)
+            if not await self.storage.exists(key):
+                await self.storage.store(key, data)
             return key
         except Exception as e:
             logger.error(f"Error storing attachment: {e}")
@@ -28,7 +28,7 @@ from enum import StrEnum
 from typing import Any, Dict, List, Optional, cast
 
 import lib.utils as libUtils
-from internal.bot.common.embedding_utils import embedAndSaveMessage
+from internal.bot.common.embedding_backfill import EmbeddingBackfillEngine
 from internal.bot.common.models import UpdateObjectType
 from internal.bot.common.typing_manager import TypingManager
 from internal.bot.models import (
@@ -41,6 +41,7 @@ from internal.bot.models import (
     CommandHandlerOrder,
     CommandPermission,
     EnsuredMessage,
+    MediaAttachmentLookup,
     MessageRecipient,
     commandHandlerV2,
 )
@@ -52,7 +53,7 @@ from internal.models import MessageId
 from internal.services.queue_service.types import DelayedTask, DelayedTaskFunction
 from lib.ai import LLMFunctionParameter, LLMParameterType
 
-from .base import BaseBotHandler
+from .base import BaseBotHandler, HandlerResultStatus
 
 logger = logging.getLogger(__name__)
 
@@ -66,19 +67,17 @@ SEARCH_DEFAULT_DAYS: int = 30
 Matches the TOML default in `configs/00-defaults/search-history.toml`."""
 
 BACKFILL_DEFAULT_BATCH_SIZE: int = 50
-"""Default per-tick batch size for the backfill CRON_JOB when
+"""Default per-batch size of the embedding backfill when
 ``[search-history.embeddings].reindex-batch-size`` is unset."""
 
+BACKFILL_DEFAULT_WORKERS: int = 4
+"""Default number of concurrent backfill workers when
+``[search-history.embeddings].backfill-workers`` is unset."""
+
 SEARCH_TOOL_MAX_MESSAGE_LENGTH: int = 512
 """Max chars per message text in LLM tool search results. Longer texts
 are truncated with ``…`` to avoid blowing up the LLM context window."""
 
-BACKFILL_INTER_MESSAGE_DELAY_SECS: float = 0.1
-"""Pause inserted between consecutive embedding API calls within a
-backfill batch. ``LLMService`` already rate-limits at the provider level,
-but a small extra cushion keeps the handler from monopolising the
-asyncio loop and leaves headroom for user-facing message traffic."""
-
 
 class _CategoryGroup(StrEnum):
     """User-facing category aliases accepted by `/search` `category:` arg.
@@ -135,16 +134,19 @@ class ChatSearchHandler(BaseBotHandler):
        ``EMBEDDING_MODEL`` supports it) so the repository can do a
        semantic ranking pass on top of the SQL filter.
     2. The `_dtCronJob` background task (registered against
-       ``DelayedTaskFunction.CRON_JOB``): every minute, pick one chat
-       with ``REGENERATE_EMBEDDINGS=true`` in round-robin order and embed
-       a small batch of its un-embedded messages. Catches up chats that
-       flipped the feature on with pre-existing messages.
+       ``DelayedTaskFunction.CRON_JOB``): every minute, collect all chats
+       with ``REGENERATE_EMBEDDINGS=true`` and hand them to the
+       :class:`EmbeddingBackfillEngine`, which embeds their un-embedded
+       messages concurrently under a global embeddings-per-second
+       budget. Catches up chats that flipped the feature on with
+       pre-existing messages.
 
     The handler is purely additive — `newMessageHandler` always returns
     `SKIPPED` so other handlers in the chain (notably `LLMMessageHandler`)
-    can still process the same message. The work happens in the
-    command method (dispatched by `HandlersManager.handleCommand`) and
-    in the backfill CRON_JOB (dispatched by `QueueService`).
+    can still process the same message; it only records chat activity
+    for the backfill priorities. The work happens in the command methods
+    (dispatched by `HandlersManager.handleCommand`) and in the backfill
+    engine (fed by the CRON_JOB dispatched by `QueueService`).
     """
 
     def __init__(self, *, configManager: ConfigManager, database: Database, botProvider: BotProvider) -> None:
@@ -171,16 +173,16 @@ class ChatSearchHandler(BaseBotHandler):
         defaultsConfig: Dict[str, Any] = searchConfig.get("defaults", {}) or {}
         self._maxResults: int = int(defaultsConfig.get("max-results", SEARCH_DEFAULT_MAX_RESULTS))
         self._defaultDays: int = int(defaultsConfig.get("default-days", SEARCH_DEFAULT_DAYS))
-        # Cache the per-tick batch size for the backfill CRON_JOB so
-        # `_dtCronJob` does not have to re-read the config every minute.
-        # A config flip therefore requires a bot restart to take effect.
+        # The backfill engine is configured once from
+        # `[search-history.embeddings]`, so a config flip requires a bot
+        # restart to take effect.
         embeddingsConfig: Dict[str, Any] = searchConfig.get("embeddings", {}) or {}
-        self._reindexBatchSize: int = int(embeddingsConfig.get("reindex-batch-size", BACKFILL_DEFAULT_BATCH_SIZE))
-
-        # Round-robin index for the backfill CRON_JOB. Survives across
-        # ticks so a long backlog gets drained chat-by-chat in stable
-        # order rather than re-shuffling every minute.
-        self._backfillIndex: int = 0
+        self._backfill = EmbeddingBackfillEngine(
+            self.db,
+            workers=int(embeddingsConfig.get("backfill-workers", BACKFILL_DEFAULT_WORKERS)),
+            embeddingsPerSecond=float(embeddingsConfig.get("backfill-embeddings-per-second", 0)),
+            batchSize=int(embeddingsConfig.get("reindex-batch-size", BACKFILL_DEFAULT_BATCH_SIZE)),
+        )
 
         # In-memory tracking of the last embedding model seen per chat
         # (``chatId -> modelKey``). ``modelKey`` is ``modelName`` alone
@@ -194,10 +196,9 @@ class ChatSearchHandler(BaseBotHandler):
         # the same `DelayedTaskFunction` (they run in registration order
         # — see `QueueService.registerDelayedTaskHandler`), so the
         # HandlersManager's own `CRON_JOB` cleanup tick keeps running
-        # unaffected. The `DO_EXIT` task is handled by the queue
-        # service's own built-in handler — registering an extra no-op
-        # subscriber here would be redundant.
+        # unaffected. `DO_EXIT` stops the backfill workers.
         self.queueService.registerDelayedTaskHandler(DelayedTaskFunction.CRON_JOB, self._dtCronJob)
+        self.queueService.registerDelayedTaskHandler(DelayedTaskFunction.DO_EXIT, self._dtOnExit)
 
         # Register LLM tool: semantic search over chat history.
         self.llmService.registerTool(
@@ -235,6 +236,7 @@ class ChatSearchHandler(BaseBotHandler):
                 ),
             ],
             handler=self._llmToolSearchMessages,
+            parallelSafe=True,
         )
 
         # Register LLM tool: list users with activity stats.
@@ -256,6 +258,7 @@ class ChatSearchHandler(BaseBotHandler):
                 ),
             ],
             handler=self._llmToolListUsers,
+            parallelSafe=True,
         )
 
         # Register LLM tool: get conversation thread for a message.
@@ -274,14 +277,44 @@ class ChatSearchHandler(BaseBotHandler):
                 ),
             ],
             handler=self._llmToolGetThread,
+            parallelSafe=True,
         )
 
     ###
     # Backfill CRON_JOB
     ###
 
+    async def newMessageHandler(
+        self,
+        ensuredMessage: EnsuredMessage,
+        updateObj: UpdateObjectType,
+    ) -> HandlerResultStatus:
+        """Record chat activity for the backfill priorities.
+
+        Recently active chats get their backlog drained first. The
+        message itself is not processed here.
+
+        Args:
+            ensuredMessage: The incoming message.
+            updateObj: Raw update object from the platform (unused).
+
+        Returns:
+            Always ``HandlerResultStatus.SKIPPED``.
+        """
+        self._backfill.noteActivity(ensuredMessage.recipient.id)
+        return HandlerResultStatus.SKIPPED
+
+    async def _dtOnExit(self, task: DelayedTask) -> None:
+        """Stop the backfill workers on shutdown.
+
+        Args:
+            task: The DO_EXIT delayed task. Ignored.
+        """
+        await self._backfill.stop()
+        logger.debug("Backfill: workers stopped")
+
     async def _dtCronJob(self, task: DelayedTask) -> None:
-        """Process one batch of embeddings per CRON_JOB tick.
+        """Feed the eligible chats to the backfill engine.
 
         Runs every 60 seconds (the ``CRON_JOB`` cadence in
         :class:`QueueService`). Per tick:
@@ -295,16 +328,14 @@ class ChatSearchHandler(BaseBotHandler):
            defaults to ``false`` so any chat that explicitly enabled it
            always has a DB row — see the inline comment at the query
            site.)
-        2. Skip chats where ``REGENERATE_EMBEDDINGS`` is explicitly set
-           to ``"false"`` — because the setting defaults to true, a chat
-           that never touched it is automatically opted in for the
-           backfill pass.
-        3. Round-robin: pick the next chat in stable order, advance
-           ``_backfillIndex``.
-        4. Resolve the chat's embedding model from its ``EMBEDDING_MODEL``
-           setting. Bail out if the model is missing, unknown, or does
-           not support embeddings.
-        5. **Clean up obsolete embeddings on model change**: Call
+        2. For every such chat, skip it when ``REGENERATE_EMBEDDINGS`` is
+           explicitly set to ``"false"`` — because the setting defaults
+           to true, a chat that never touched it is automatically opted
+           in for the backfill pass.
+        3. Resolve the chat's embedding model from its ``EMBEDDING_MODEL``
+           setting. Skip the chat if the model is missing, unknown, or
+           does not support embeddings.
+        4. **Clean up obsolete embeddings on model change**: Call
            ``ChatEmbeddingsRepository.deleteObsoleteModelEmbeddings``
            which removes rows from both ``message_embeddings`` and all
            ``vec_message_embeddings_{N}`` tables where the stored model
@@ -312,15 +343,11 @@ class ChatSearchHandler(BaseBotHandler):
            dict (``_embeddingModelTracker``) so cleanup only fires once
            per model switch — subsequent ticks are no-ops until the
            model changes again.
-        6. Fetch up to ``[search-history.embeddings].reindex-batch-size``
-           (default ``BACKFILL_DEFAULT_BATCH_SIZE``) messages without
-           embeddings and embed them one by one, with a small inter-call
-           sleep to keep the asyncio loop responsive.
-        7. Per-message errors are caught and logged — one bad row never
-           aborts the batch.
-        8. No self-resetting of ``REGENERATE_EMBEDDINGS``: the per-tick
-           batch is small and the next minute's tick will pick up where
-           this one left off.
+        5. Hand the ``chatId -> modelName`` map to
+           :meth:`EmbeddingBackfillEngine.syncChats` and start the
+           workers. The engine fetches ``reindex-batch-size`` messages
+           per batch, resumes from the persisted per-chat cursor, and
+           never raises — per-message errors are caught and logged.
 
         Args:
             task: The CRON_JOB delayed task firing this handler. Ignored.
@@ -328,7 +355,6 @@ class ChatSearchHandler(BaseBotHandler):
         Returns:
             None
         """
-        startTime = libUtils.now()
         # Gate 1: discover chats that explicitly opted in to a backfill
         # pass via `REGENERATE_EMBEDDINGS = true`.
         try:
@@ -343,33 +369,43 @@ class ChatSearchHandler(BaseBotHandler):
         enabledChats: List[int] = sorted(
             [chatId for chatId, value in chatMap.items() if ChatSettingsValue(value).toBool()]
         )
-        if not enabledChats:
-            return
 
-        # Round-robin pick across ``enabledChats`` sorted by chat ID for
-        # stable ordering across CRON_JOB ticks. ``% len`` is safe because
-        # ``enabledChats`` is non-empty (checked above), so a zero-division
-        # never lands.
-        chatId = enabledChats[self._backfillIndex % len(enabledChats)]
-        self._backfillIndex += 1
-        self._backfillIndex %= len(enabledChats)
+        eligibleChats: Dict[int, str] = {}
+        for chatId in enabledChats:
+            modelName = await self._resolveBackfillModel(chatId)
+            if modelName is not None:
+                eligibleChats[chatId] = modelName
+
+        await self._backfill.syncChats(eligibleChats)
+        self._backfill.start()
 
-        # Gate 3: resolve the embedding model.
+    async def _resolveBackfillModel(self, chatId: int) -> Optional[str]:
+        """Return the embedding model to backfill ``chatId`` with, if any.
+
+        Also deletes embeddings of a previous model the first time a
+        model switch is seen (see :meth:`_dtCronJob`, step 4).
+
+        Args:
+            chatId: Chat with ``EMBEDDINGS_ENABLED=true``.
+
+        Returns:
+            The model name, or ``None`` if the chat must not be backfilled.
+        """
         try:
             chatSettings = await self.getChatSettings(chatId=chatId)
         except Exception as e:
             logger.warning("Backfill: failed to read chat settings for %d: %s", chatId, e)
-            return
+            return None
         if not chatSettings[ChatSettingsKey.REGENERATE_EMBEDDINGS].toBool():
             # Regenerating embeddings is disabled for given chat
-            return
+            return None
 
         modelName = chatSettings[ChatSettingsKey.EMBEDDING_MODEL].toStr()
         if not modelName:
-            return
+            return None
         model = self.llmService.getLLMManager().getModel(modelName)
         if model is None or not model.supportsEmbedding:
-            return
+            return None
 
         # Delete obsolete embeddings (both message_embeddings and vec0)
         # when the model changed since the last cleanup for this chat.
@@ -397,51 +433,7 @@ class ChatSearchHandler(BaseBotHandler):
             ):
                 self._embeddingModelTracker[chatId] = modelKey
 
-        # Gate 4: fetch the batch. ``_reindexBatchSize`` is cached in
-        # `__init__` so this read costs nothing per tick. ``modelName``
-        # is forwarded so rows with a stored embedding under a *different*
-        # model (e.g. after a model swap) are re-embedded — the
-        # `getMessagesWithoutEmbeddings` repo method matches that
-        # contract.
-        pendingMessagesList: List[ChatMessageDict] = []
-        try:
-            pendingMessagesList = await self.db.chatEmbeddings.getMessagesWithoutEmbeddings(
-                chatId,
-                limit=self._reindexBatchSize,
-                modelName=modelName,
-            )
-        except Exception as e:
-            logger.warning("Backfill: failed to list pending messages for chat %d: %s", chatId, e)
-            return
-        if not pendingMessagesList:
-            return
-
-        # Embed each message via the shared helper. The helper has its
-        # own try/except boundary and never raises, so a single bad row
-        # cannot abort the batch; the small inter-call sleep keeps the
-        # asyncio loop responsive between embeddings.
-        embedded = 0
-        for pendingMessage in pendingMessagesList:
-            ensuredMessage = await EnsuredMessage.fromDBChatMessage(data=pendingMessage, db=self.db)
-            if not ensuredMessage.messageText.strip():
-                continue
-
-            if await embedAndSaveMessage(
-                ensuredMessage=ensuredMessage,
-                modelName=modelName,
-                db=self.db,
-            ):
-                embedded += 1
-            await asyncio.sleep(BACKFILL_INTER_MESSAGE_DELAY_SECS)
-
-        if embedded > 0:
-            elapsedTime = libUtils.now() - startTime
-            logger.info(
-                "Backfill: embedded %d messages in chat %d (elapsed %.2f seconds)",
-                embedded,
-                chatId,
-                elapsedTime.total_seconds(),
-            )
+        return modelName
 
     ###
     # LLM tool: semantic search over chat history
@@ -563,8 +555,10 @@ class ChatSearchHandler(BaseBotHandler):
         # ``return_exceptions=True`` so a single bad row never aborts
         # the batch.
         try:
+            mediaLookup = MediaAttachmentLookup(self.db)
+            await mediaLookup.prefetchMessages(results)
             rawFormatted = await asyncio.gather(
-                *[self._formatMessageDict(r) for r in results],
+                *[self._formatMessageDict(r, mediaLookup=mediaLookup) for r in results],
                 return_exceptions=True,
             )
         except Exception:
@@ -660,7 +654,9 @@ class ChatSearchHandler(BaseBotHandler):
     # LLM tool: get conversation thread
     ###
 
-    async def _formatMessageDict(self, msg: ChatMessageDict) -> Dict[str, Any]:
+    async def _formatMessageDict(
+        self, msg: ChatMessageDict, *, mediaLookup: Optional[MediaAttachmentLookup] = None
+    ) -> Dict[str, Any]:
         """Convert a ``ChatMessageDict`` row to a JSON-safe dict for LLM tool output.
 
         Uses :meth:`EnsuredMessage.formatForLLM` with JSON format so the
@@ -668,14 +664,20 @@ class ChatSearchHandler(BaseBotHandler):
 
         Args:
             msg: A ``ChatMessageDict`` row from the repository.
+            mediaLookup: Media attachments cache shared by the rows formatted
+                together (see :meth:`MediaAttachmentLookup.prefetchMessages`).
 
         Returns:
             JSON-safe dict with ``message_id``, ``message_text``,
             ``username``, ``full_name``, ``date``, ``reply_id``,
             and ``thread_id``.
         """
-        eMessage = await EnsuredMessage.fromDBChatMessage(msg, self.db)
-        return json.loads(await eMessage.formatForLLM(self.db, format=LLMMessageFormat.JSON, useSingleMedia=False))
+        eMessage = await EnsuredMessage.fromDBChatMessage(msg, self.db, mediaLookup=mediaLookup)
+        return json.loads(
+            await eMessage.formatForLLM(
+                self.db, format=LLMMessageFormat.JSON, useSingleMedia=False, mediaLookup=mediaLookup
+            )
+        )
 
     async def _llmToolGetThread(
         self,
@@ -733,11 +735,20 @@ class ChatSearchHandler(BaseBotHandler):
             return {"done": False, "error": "Целевое сообщение не найдено"}
 
         try:
-            rootFormatted = await self._formatMessageDict(rootMsg) if rootMsg is not None else None
-            targetFormatted = await self._formatMessageDict(targetMsg)
+            # Load media of the whole thread with batch queries
+            mediaLookup = MediaAttachmentLookup(self.db)
+            await mediaLookup.prefetchMessages(
+                ([rootMsg] if rootMsg is not None else []) + [targetMsg] + list(threadMessages)
+            )
+            rootFormatted = (
+                await self._formatMessageDict(rootMsg, mediaLookup=mediaLookup) if rootMsg is not None else None
+            )
+            targetFormatted = await self._formatMessageDict(targetMsg, mediaLookup=mediaLookup)
             # Format remaining thread messages in parallel since they are
             # independent of each other.
-            formattedThreadMessages = await asyncio.gather(*[self._formatMessageDict(m) for m in threadMessages])
+            formattedThreadMessages = await asyncio.gather(
+                *[self._formatMessageDict(m, mediaLookup=mediaLookup) for m in threadMessages]
+            )
         except Exception:
             logger.exception("get_thread: failed to format thread messages")
             return {"done": False, "error": "Не удалось отформатировать тред"}
@@ -850,6 +861,66 @@ class ChatSearchHandler(BaseBotHandler):
             typingManager=typingManager,
         )
 
+    ###
+    # /backfill_stats command
+    ###
+
+    @commandHandlerV2(
+        commands=("backfill_stats",),
+        shortDescription="- Show embedding backfill progress per chat",
+        helpMessage=": Показать прогресс фоновой генерации эмбеддингов по чатам (скорость, очередь, ETA).",
+        visibility={CommandPermission.BOT_OWNER},
+        availableFor={CommandPermission.BOT_OWNER},
+        helpOrder=CommandHandlerOrder.NORMAL,
+        category=CommandCategory.TECHNICAL,
+    )
+    async def backfillStatsCommand(
+        self,
+        ensuredMessage: EnsuredMessage,
+        command: str,
+        args: str,
+        updateObj: UpdateObjectType,
+        typingManager: Optional[TypingManager],
+    ) -> None:
+        """Handle the ``/backfill_stats`` slash command.
+
+        Lists every chat tracked by the embedding backfill engine with its
+        backlog, throughput and ETA, biggest backlog first.
+
+        Args:
+            ensuredMessage: The originating user message.
+            command: The command name (``"backfill_stats"``).
+            args: Raw argument string after the command (unused).
+            updateObj: Raw update object from the platform (unused).
+            typingManager: Optional typing indicator manager.
+        """
+        stats = self._backfill.getStats()
+        if not stats:
+            replyText = "Фоновая генерация эмбеддингов не отслеживает ни одного чата."
+        else:
+            lines: List[str] = []
+            for item in stats:
+                backlog = "?" if item["backlog"] is None else f"{item['backlog']:,}"
+                if item["completed"]:
+                    eta = "готово"
+                elif item["eta"] is None:
+                    eta = "?"
+                else:
+                    eta = str(datetime.timedelta(seconds=int(item["eta"])))
+                marker = "▶️ " if item["active"] else ""
+                lines.append(
+                    f"{marker}`{item['chatId']}` ({item['model']}): очередь {backlog}, "
+                    f"готово {item['embedded']:,}, {item['throughput']:.1f} сообщ./с, ETA {eta}"
+                )
+            replyText = f"🧮 Фоновая генерация эмбеддингов ({len(stats)} чатов):\n\n" + "\n".join(lines)
+
+        await self.sendMessage(
+            ensuredMessage,
+            messageText=replyText,
+            messageCategory=MessageCategory.BOT_COMMAND_REPLY,
+            typingManager=typingManager,
+        )
+
     ###
     # /search command
     ###
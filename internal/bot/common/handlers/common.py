@@ -76,6 +76,7 @@ class CommonHandler(BaseBotHandler):
             description="Get current date and time",
             parameters=[],
             handler=self._llmToolGetCurrentDateTime,
+            parallelSafe=True,
         )
 
         self.queueService.registerDelayedTaskHandler(
@@ -465,6 +465,7 @@ class DevCommandsHandler(BaseBotHandler):
             /test delayedQueue - Display delayed actions queue state
             /test backgroundTasks - Display background tasks state
             /test cacheStats - Display cache statistics
+            /test toolStats - Display LLM tool calls latency metrics
             /test dumpCache - Dump all cache contents
             /test dumpEntities - Dump message entities (must reply to a message)
             /test dumpNativeEntities - Dump native message entities (must reply to a message)
@@ -474,9 +475,10 @@ class DevCommandsHandler(BaseBotHandler):
 
         Test Suites:
             long: Sends multiple messages with configurable iterations and delay
-            delayedQueue: Shows the delayed actions queue and its size
+            delayedQueue: Shows the delayed actions queue, its size and scheduler metrics
             backgroundTasks: Shows currently running background tasks
             cacheStats: Displays cache statistics in JSON format
+            toolStats: Displays per-tool LLM tool calls metrics in JSON format
             dumpCache: Dumps all cache namespaces and dirty keys
             dumpEntities: Dumps formatted entities from a replied message
             dumpNativeEntities: Dumps native entities from a replied message
@@ -547,7 +549,8 @@ class DevCommandsHandler(BaseBotHandler):
                 await self.sendMessage(
                     ensuredMessage,
                     messageText=f"```\n{self.queueService.delayedActionsQueue}\n\n"
-                    f"{self.queueService.delayedActionsQueue.qsize()}\n```",
+                    f"{self.queueService.delayedActionsQueue.qsize()}\n```\n"
+                    f"```json\n{utils.jsonDumps(self.queueService.getStats(), indent=2)}\n```",
                     messageCategory=MessageCategory.BOT_COMMAND_REPLY,
                 )
 
@@ -565,6 +568,13 @@ class DevCommandsHandler(BaseBotHandler):
                     messageCategory=MessageCategory.BOT_COMMAND_REPLY,
                 )
 
+            case "toolStats":
+                await self.sendMessage(
+                    ensuredMessage,
+                    messageText=f"```json\n{utils.jsonDumps(self.llmService.getStats(), indent=2)}\n```",
+                    messageCategory=MessageCategory.BOT_COMMAND_REPLY,
+                )
+
             case "dumpCache":
                 for ns in CacheNamespace:
                     await self.sendMessage(
@@ -34,6 +34,7 @@ import telegram
 import lib.utils as utils
 from internal.bot import constants
 from internal.bot.common.models import TypingAction, UpdateObjectType
+from internal.bot.common.streaming_sink import StreamingMessageSink
 from internal.bot.common.typing_manager import TypingManager
 from internal.bot.models import (
     BotProvider,
@@ -45,6 +46,7 @@ from internal.bot.models import (
     CommandPermission,
     EnsuredMessage,
     LLMMessageFormat,
+    MediaAttachmentLookup,
     MessageType,
     commandHandlerV2,
 )
@@ -103,6 +105,7 @@ class LLMMessageHandler(BaseBotHandler):
         keepFirstN: int = 0,
         keepLastN: int = 1,
         maxTokensCoeff: float = 0.8,
+        streamingSink: Optional[StreamingMessageSink] = None,
     ) -> ModelRunResult:
         """Generate text response using LLM with fallback support.
 
@@ -121,6 +124,8 @@ class LLMMessageHandler(BaseBotHandler):
             keepFirstN (int, optional): Number of first messages to keep in context. Defaults to 0.
             keepLastN (int, optional): Number of last messages to keep in context. Defaults to 1.
             maxTokensCoeff (float, optional): Coefficient for calculating max tokens. Defaults to 0.8.
+            streamingSink (Optional[StreamingMessageSink], optional): Sink showing the reply while
+                it is generated. Intermediate messages are finalized in it. Defaults to None.
 
         Returns:
             ModelRunResult: Result containing generated text, status, and metadata.
@@ -140,18 +145,27 @@ class LLMMessageHandler(BaseBotHandler):
             Returns:
                 None
             """
-            if mRet.resultText.strip() and sendIntermediateMessages:
+            intermediateText = mRet.resultText.strip()
+            if streamingSink is not None and (not intermediateText or not sendIntermediateMessages):
+                # Streamed text of this turn won't be sent (e.g. it was a tool call in disguise)
+                await streamingSink.discard()
+
+            if intermediateText and sendIntermediateMessages:
                 try:
                     logger.debug(f"Sending intermediate message. LLM Result status is: {mRet.status}")
                     prefixStr = chatSettings[ChatSettingsKey.INTERMEDIATE_MESSAGE_PREFIX].toStr()
                     if mRet.isFallback:
                         prefixStr += chatSettings[ChatSettingsKey.FALLBACK_HAPPENED_PREFIX].toStr()
-                    await self.sendMessage(
-                        ensuredMessage,
-                        mRet.resultText,
-                        messageCategory=MessageCategory.BOT,
-                        addMessagePrefix=prefixStr,
-                    )
+                    sentMessages = None
+                    if streamingSink is not None:
+                        sentMessages = await streamingSink.finalize(mRet.resultText, prefix=prefixStr)
+                    if sentMessages is None:
+                        await self.sendMessage(
+                            ensuredMessage,
+                            mRet.resultText,
+                            messageCategory=MessageCategory.BOT,
+                            addMessagePrefix=prefixStr,
+                        )
                     # Add more timeout + ping typing manager
                     typingManager.addTimeout(120)
                     await typingManager.sendTypingAction()
@@ -167,6 +181,7 @@ class LLMMessageHandler(BaseBotHandler):
             useTools=useTools,
             callId=f"{ensuredMessage.recipient.id}:{ensuredMessage.messageId}",
             callback=processIntermediateMessages,
+            streamCallback=streamingSink.feed if streamingSink is not None else None,
             extraData={
                 "ensuredMessage": ensuredMessage,
                 "typingManager": typingManager,
@@ -174,6 +189,7 @@ class LLMMessageHandler(BaseBotHandler):
             keepFirstN=keepFirstN,
             keepLastN=keepLastN,
             maxTokensCoeff=maxTokensCoeff,
+            condensedContextKey=f"{ensuredMessage.recipient.id}:{ensuredMessage.threadId or 0}",
         )
         return ret
 
@@ -201,6 +217,7 @@ class LLMMessageHandler(BaseBotHandler):
         - Tool usage indicators
         - Fallback model indicators
         - Error recovery and user notification
+        - Showing the reply while it is generated (``llm-streaming`` chat setting)
 
         Args:
             ensuredMessage (EnsuredMessage): The message to respond to.
@@ -226,6 +243,14 @@ class LLMMessageHandler(BaseBotHandler):
         llmMessageFormat = LLMMessageFormat(chatSettings[ChatSettingsKey.LLM_MESSAGE_FORMAT].toStr())
         mlRet: Optional[ModelRunResult] = None
 
+        streamingSink: Optional[StreamingMessageSink] = None
+        if (
+            self._bot is not None
+            and llmMessageFormat != LLMMessageFormat.JSON
+            and chatSettings[ChatSettingsKey.LLM_STREAMING].toBool()
+        ):
+            streamingSink = StreamingMessageSink(self, self._bot, ensuredMessage)
+
         try:
             mlRet = await self._generateTextViaLLM(
                 messages=messagesHistory,
@@ -236,11 +261,14 @@ class LLMMessageHandler(BaseBotHandler):
                 keepFirstN=keepFirstN,
                 keepLastN=keepLastN,
                 maxTokensCoeff=maxTokensCoeff,
+                streamingSink=streamingSink,
             )
             # logger.debug(f"LLM Response: {mlRet}")
         except Exception as e:
             logger.error(f"Error while sending LLM request: {type(e).__name__}#{e}")
             logger.exception(e)
+            if streamingSink is not None:
+                await streamingSink.discard()
             await self.sendMessage(
                 ensuredMessage,
                 messageText=f"Error while sending LLM request: {type(e).__name__}",
@@ -298,6 +326,8 @@ class LLMMessageHandler(BaseBotHandler):
 
         # TODO: Add separate method for generating+sending photo
         if imagePrompt is not None:
+            if streamingSink is not None:
+                await streamingSink.discard()
             typingManager.action = TypingAction.UPLOAD_PHOTO
             await typingManager.sendTypingAction()
             imgMLRet = await self.llmService.generateImage(
@@ -330,6 +360,16 @@ class LLMMessageHandler(BaseBotHandler):
             # Something went wrong, log and fallback to ordinary message
             logger.error(f"Failed to generate Image by prompt '{imagePrompt}': {imgMLRet}")
 
+        if streamingSink is not None:
+            sentMessages = await streamingSink.finalize(
+                lmRetText,
+                prefix=addPrefix,
+                toolsHistory=mlRet.toolUsageHistory,
+                typingManager=typingManager if stopTypingOnSend else None,
+            )
+            if sentMessages is not None:
+                return True
+
         return (
             await self.sendMessage(
                 ensuredMessage,
@@ -707,16 +747,21 @@ class LLMMessageHandler(BaseBotHandler):
                 # And we do not want to reverse db result as we do not want to process ALL retrieved
                 # messages if some message already has summarized context (i.e. metadata["randomContext"])
                 contextMessages = deque[ModelMessage]()
-                for storedMsg in await self.db.chatMessages.getChatMessagesSince(
-                    chatId=chatId,
-                    threadId=ensuredMessage.threadId if ensuredMessage.threadId is not None else 0,
-                    limit=constants.RANDOM_ANSWER_CONTEXT_LENGTH,
-                    # messageCategory=[MessageCategory.USER, MessageCategory.BOT, MessageCategory.CHANNEL],
-                ):
-                    if storedMsg["message_id"] == ensuredMessage.messageId:
-                        # Skip current message from context
-                        continue
-                    eMsg = await EnsuredMessage.fromDBChatMessage(storedMsg, self.db)
+                storedMsgs = [
+                    storedMsg
+                    for storedMsg in await self.db.chatMessages.getChatMessagesSince(
+                        chatId=chatId,
+                        threadId=ensuredMessage.threadId if ensuredMessage.threadId is not None else 0,
+                        limit=constants.RANDOM_ANSWER_CONTEXT_LENGTH,
+                        # messageCategory=[MessageCategory.USER, MessageCategory.BOT, MessageCategory.CHANNEL],
+                    )
+                    # Skip current message from context
+                    if storedMsg["message_id"] != ensuredMessage.messageId
+                ]
+                # Load media of all messages with batch queries
+                mediaLookup = MediaAttachmentLookup(self.db)
+                eMsgs = await EnsuredMessage.fromDBChatMessages(storedMsgs, self.db, mediaLookup=mediaLookup)
+                for storedMsg, eMsg in zip(storedMsgs, eMsgs):
                     await self._updateEMessageUserData(eMsg)
 
                     # We need to use `reversed` as deque.extendleft will add messages in reversed order
@@ -729,6 +774,7 @@ class LLMMessageHandler(BaseBotHandler):
                                 self.db,
                                 format=llmMessageFormat,
                                 role=MessageCategory.fromStr(storedMsg["message_category"]).toRole(),
+                                mediaLookup=mediaLookup,
                             )
                         )
                     )
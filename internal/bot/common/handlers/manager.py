@@ -32,7 +32,7 @@ import time
 from collections import deque
 from collections.abc import Coroutine, MutableSet
 from enum import IntEnum, auto
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from telegram.ext import ExtBot
 
@@ -116,13 +116,14 @@ class MessageQueueRecord:
         message: The normalized message object to be processed
         updateObj: The original update object from the platform
         lock: Async lock for thread-safe operations on this record
+        stepChanged: Condition (on lock) notified when step or handled changes
         handled: Event that is set when the message has been fully processed
-        step: Current processing step index (which handler is processing)
+        step: Index of the last completed processing step (handler)
         _id: Cached unique identifier for this message record
         _stateId: Cached state identifier for the chat/thread
     """
 
-    __slots__ = ("message", "updateObj", "lock", "handled", "step", "_id", "_stateId")
+    __slots__ = ("message", "updateObj", "lock", "stepChanged", "handled", "step", "_id", "_stateId")
 
     def __init__(self, message: EnsuredMessage, updateObj: UpdateObjectType, stateId: Optional[str] = None) -> None:
         """Initialize a message queue record.
@@ -135,6 +136,7 @@ class MessageQueueRecord:
         self.message = message
         self.updateObj = updateObj
         self.lock: asyncio.Lock = asyncio.Lock()
+        self.stepChanged: asyncio.Condition = asyncio.Condition(self.lock)
         self.handled: asyncio.Event = asyncio.Event()
         self.step: int = -1
         self._id: Optional[str] = None
@@ -183,17 +185,47 @@ class MessageQueueRecord:
             f"{self.handled}, {self.step}, {self._id}, {self._stateId})"
         )
 
+    def _isStepDone(self, step: int) -> bool:
+        """Check whether the message is fully handled or reached the step.
+
+        Args:
+            step: The step index to check (0-based handler index)
+
+        Returns:
+            True if waiting for the step is not needed anymore
+        """
+        return self.handled.is_set() or self.step >= step
+
+    async def setStepDone(self, step: int) -> None:
+        """Mark a processing step as completed and wake up waiting messages.
+
+        Args:
+            step: The completed step index (0-based handler index)
+        """
+        async with self.stepChanged:
+            self.step = step
+            self.stepChanged.notify_all()
+
+    async def setHandled(self) -> None:
+        """Mark the message as fully processed and wake up waiting messages."""
+        async with self.stepChanged:
+            self.handled.set()
+            self.stepChanged.notify_all()
+
     async def awaitStepDone(self, step: int) -> None:
         """Wait until a specific processing step is completed.
 
         This method blocks until either the message is fully handled or
-        the processing reaches the specified step index.
+        the processing reaches the specified step index. Waiters are woken
+        up by setStepDone() and setHandled(), no polling is involved.
 
         Args:
             step: The step index to wait for (0-based handler index)
         """
-        while not self.handled.is_set() and self.step < step:
-            await asyncio.sleep(0.1)
+        if self._isStepDone(step):
+            return
+        async with self.stepChanged:
+            await self.stepChanged.wait_for(lambda: self._isStepDone(step))
 
 
 class ChatProcessingState:
@@ -208,12 +240,13 @@ class ChatProcessingState:
         threadId: Optional thread identifier for threaded conversations
         queue: Deque of MessageQueueRecord objects awaiting processing
         lock: Async lock for thread-safe queue operations
+        queueChanged: Condition (on lock) notified when a message leaves the queue
         shutdownEvent: Event that is set when the chat state is shutting down
         _queueKey: Cached unique key for this chat/thread state
         _updateAt: Timestamp of the last state update (for cleanup)
     """
 
-    __slots__ = ("chatId", "threadId", "queue", "lock", "shutdownEvent", "_queueKey", "_updateAt")
+    __slots__ = ("chatId", "threadId", "queue", "lock", "queueChanged", "shutdownEvent", "_queueKey", "_updateAt")
 
     def __init__(self, chatId: int, threadId: Optional[int] = None, queueKey: Optional[str] = None) -> None:
         """Initialize a chat processing state.
@@ -227,6 +260,7 @@ class ChatProcessingState:
         self.threadId: Optional[int] = threadId
         self.queue = deque[MessageQueueRecord]()
         self.lock = asyncio.Lock()
+        self.queueChanged = asyncio.Condition(self.lock)
         self.shutdownEvent = asyncio.Event()
         self._queueKey: Optional[str] = queueKey
         self._updateAt: float = time.time()
@@ -281,8 +315,8 @@ class ChatProcessingState:
         """Mark a message as processed and remove it from the queue.
 
         Waits for all previous messages to be processed first, then removes
-        the specified message from the front of the queue. Updates the last
-        update timestamp.
+        the specified message from the front of the queue and wakes up the
+        next message waiting for its turn. Updates the last update timestamp.
 
         Args:
             message: The message record to mark as processed
@@ -296,15 +330,15 @@ class ChatProcessingState:
 
         messageId = message.getId()
 
-        while self.queue and self.queue[0].getId() != messageId:
+        async with self.queueChanged:
             # Wait for previous messages to be processed and removed
-            await asyncio.sleep(0.1)
+            await self.queueChanged.wait_for(lambda: not self.queue or self.queue[0].getId() == messageId)
 
-        async with self.lock:
             self._updateAt = time.time()
-            if self.queue[0].getId() != messageId:
+            if not self.queue or self.queue[0].getId() != messageId:
                 raise RuntimeError(f"Race detected: record {message} not found in queue {self.getQueueKey()}")
             self.queue.popleft()
+            self.queueChanged.notify_all()
 
     async def getPreviousMessage(self, message: MessageQueueRecord) -> Optional[MessageQueueRecord]:
         """Get the previous message in the queue before the specified message.
@@ -359,6 +393,7 @@ class HandlersManager(CommandHandlerGetterInterface):
         handlers: List of (handler, parallelism) tuples in execution order
         chatStates: Dictionary mapping queue keys to ChatProcessingState objects
         handlerTasks: Set of active handler tasks for tracking
+        taskSlots: Semaphore admitting at most maxTasks concurrent handler tasks
         stateLock: Global lock for queue management operations
         _shutdownEvent: Event set when the manager is shutting down
     """
@@ -556,6 +591,11 @@ class HandlersManager(CommandHandlerGetterInterface):
 
         self.chatStates: Dict[str, ChatProcessingState] = {}
         self.handlerTasks: MutableSet[asyncio.Task] = set[asyncio.Task]()
+        self.taskSlots = asyncio.Semaphore(self.maxTasks)
+        """Admission control: one slot per running handler task"""
+        self._waitingForSlot: int = 0
+        self._stepWaitStats: Dict[str, Dict[str, float]] = {}
+        """Per handler metrics of waiting for the same step of the previous message"""
         self.stateLock = asyncio.Lock()
         """Global Lock for Queue management (checking, creating, deleting)"""
 
@@ -580,9 +620,10 @@ class HandlersManager(CommandHandlerGetterInterface):
     async def _dtCronJob(self, task: DelayedTask) -> None:
         """Periodic cron job to clean up stalled chat states.
 
-        Runs every 30 minutes to identify and remove chat states that have been
-        inactive for more than 1 hour with empty message queues. This prevents
-        memory leaks from abandoned chat sessions.
+        Runs every 30 minutes to log message processing metrics (see getStats())
+        and to identify and remove chat states that have been inactive for more
+        than 1 hour with empty message queues. This prevents memory leaks from
+        abandoned chat sessions.
 
         Args:
             task: DelayedTask instance containing task execution context
@@ -605,6 +646,8 @@ class HandlersManager(CommandHandlerGetterInterface):
         if nowMinutes % 30 != 0:
             return
 
+        logger.info(f"Message processing stats: {utils.jsonDumps(self.getStats())}")
+
         logger.debug("Running cleanup for obsolete chat states...")
         async with self.stateLock:
             stalledStateNames: List[str] = []
@@ -693,15 +736,84 @@ class HandlersManager(CommandHandlerGetterInterface):
         Raises:
             asyncio.TimeoutError: If the coroutine execution exceeds the timeout
         """
-        while len(self.handlerTasks) >= self.maxTasks:
-            await asyncio.sleep(0.5)
-        if timeout is not None and timeout > 0:
-            func = asyncio.wait_for(func, timeout=timeout)
-        task = asyncio.create_task(func)
+        # Wait for a free slot if maxTasks tasks are already running
+        self._waitingForSlot += 1
+        try:
+            await self.taskSlots.acquire()
+        finally:
+            self._waitingForSlot -= 1
+
+        try:
+            if timeout is not None and timeout > 0:
+                func = asyncio.wait_for(func, timeout=timeout)
+            task = asyncio.create_task(func)
+        except BaseException:
+            self.taskSlots.release()
+            raise
         self.handlerTasks.add(task)
-        task.add_done_callback(self.handlerTasks.discard)
+        task.add_done_callback(self._onTaskDone)
         return task
 
+    def _onTaskDone(self, task: asyncio.Task) -> None:
+        """Forget a finished handler task and free its slot.
+
+        Args:
+            task: The finished task
+        """
+        self.handlerTasks.discard(task)
+        self.taskSlots.release()
+
+    def _getStepWaitStats(self, handlerName: str) -> Dict[str, float]:
+        """Get (creating if needed) the step wait metrics of a handler.
+
+        Args:
+            handlerName: Handler class name
+
+        Returns:
+            Mutable metrics dict of the handler
+        """
+        stats = self._stepWaitStats.get(handlerName)
+        if stats is None:
+            stats = {
+                "waits": 0,
+                "waiting": 0,
+                "waitTotal": 0.0,
+                "waitMax": 0.0,
+            }
+            self._stepWaitStats[handlerName] = stats
+        return stats
+
+    def getStats(self) -> Dict[str, Any]:
+        """Get message processing metrics.
+
+        Returns:
+            A dictionary with:
+            - runningTasks: Number of running handler tasks
+            - waitingForSlot: Number of tasks waiting for admission (maxTasks reached)
+            - maxTasks: Admission limit
+            - queueDepth: Per chat/thread queue depth (only non-empty queues)
+            - handlers: Per handler step wait metrics: waits, waiting,
+              avgWait and maxWait (seconds spent waiting for the same step
+              of the previous message)
+        """
+        handlers: Dict[str, Any] = {}
+        for name, stats in self._stepWaitStats.items():
+            waits = stats["waits"]
+            handlers[name] = {
+                "waits": int(waits),
+                "waiting": int(stats["waiting"]),
+                "avgWait": stats["waitTotal"] / waits if waits else 0.0,
+                "maxWait": stats["waitMax"],
+            }
+
+        return {
+            "runningTasks": len(self.handlerTasks),
+            "waitingForSlot": self._waitingForSlot,
+            "maxTasks": self.maxTasks,
+            "queueDepth": {k: len(v.queue) for k, v in self.chatStates.items() if v.queue},
+            "handlers": handlers,
+        }
+
     async def addMessageToChatQueue(
         self, message: EnsuredMessage, updateObj: UpdateObjectType
     ) -> Optional[MessageQueueRecord]:
@@ -985,7 +1097,7 @@ class HandlersManager(CommandHandlerGetterInterface):
                         pass
                     case HandlerParallelism.SEQUENTIAL:
                         if previousRec is not None:
-                            await previousRec.awaitStepDone(stepIndex)
+                            await self._awaitPreviousStep(previousRec, stepIndex, type(handler).__name__)
                     case _:
                         raise ValueError(f"Unknown parallelism: {parallelism}")
 
@@ -993,7 +1105,7 @@ class HandlersManager(CommandHandlerGetterInterface):
                     handler.newMessageHandler(ensuredMessage, updateObj),
                     timeout=self.handlerTimeout,
                 )
-                messageRec.step = stepIndex
+                await messageRec.setStepDone(stepIndex)
                 resultSet.add(ret)
                 if ret.needLogs():
                     logger.debug(f"Handler {type(handler).__name__} returned {ret.value}")
@@ -1013,9 +1125,29 @@ class HandlersManager(CommandHandlerGetterInterface):
                 f"(resultSet: {resultSet})"
             )
 
-            messageRec.handled.set()
+            await messageRec.setHandled()
             await chatState.messageProcessed(messageRec)
 
+    async def _awaitPreviousStep(self, previousRec: MessageQueueRecord, stepIndex: int, handlerName: str) -> None:
+        """Wait for the previous message to pass a step, recording the wait time.
+
+        Args:
+            previousRec: The previous message in the chat queue
+            stepIndex: The step index to wait for
+            handlerName: Name of the handler at this step (metrics key)
+        """
+        stats = self._getStepWaitStats(handlerName)
+        stats["waiting"] += 1
+        startTime = time.perf_counter()
+        try:
+            await previousRec.awaitStepDone(stepIndex)
+        finally:
+            waitTime = time.perf_counter() - startTime
+            stats["waiting"] -= 1
+            stats["waits"] += 1
+            stats["waitTotal"] += waitTime
+            stats["waitMax"] = max(stats["waitMax"], waitTime)
+
     async def handleCallback(
         self,
         ensuredMessage: EnsuredMessage,
@@ -32,6 +32,7 @@ from internal.bot.models import (
     CommandPermission,
     EnsuredMessage,
     LLMMessageFormat,
+    MediaAttachmentLookup,
     MessageType,
     commandHandlerV2,
 )
@@ -641,14 +642,20 @@ class MediaHandler(BaseBotHandler):
                     role="system",
                 ),
             ]
-            for msg in reversed(
-                await self.db.chatMessages.getChatMessagesByUser(
-                    ensuredMessage.recipient.id,
-                    ensuredMessage.sender.id,
-                    limit=10,
-                )
+            mediaLookup = MediaAttachmentLookup(self.db)
+            for eMsg in await EnsuredMessage.fromDBChatMessages(
+                list(
+                    reversed(
+                        await self.db.chatMessages.getChatMessagesByUser(
+                            ensuredMessage.recipient.id,
+                            ensuredMessage.sender.id,
+                            limit=10,
+                        )
+                    )
+                ),
+                self.db,
+                mediaLookup=mediaLookup,
             ):
-                eMsg = await EnsuredMessage.fromDBChatMessage(msg, self.db)
                 await self._updateEMessageUserData(eMsg)
                 latestMessages.append(
                     await eMsg.toModelMessage(
@@ -656,6 +663,7 @@ class MediaHandler(BaseBotHandler):
                         format=LLMMessageFormat(
                             chatSettings[ChatSettingsKey.LLM_MESSAGE_FORMAT].toStr(),
                         ),
+                        mediaLookup=mediaLookup,
                     )
                 )
 
@@ -14,7 +14,7 @@ from typing import Optional
 
 import telegram
 
-from internal.bot.common.embedding_utils import embedAndSaveMessage
+from internal.bot.common.embedding_utils import EmbeddingBatcher
 from internal.bot.common.models import UpdateObjectType
 from internal.bot.models import BotProvider, EnsuredMessage, MessageRecipient, MessageSender
 from internal.bot.models.chat_settings import ChatSettingsKey
@@ -44,6 +44,9 @@ class MessagePreprocessorHandler(BaseBotHandler):
             handler construction time. Read once in :meth:`__init__` so
             every message dispatch avoids a `ConfigManager` round-trip;
             a config-flip requires a bot restart.
+        _embeddingBatcher: Coalesces the per-message embedding jobs into
+            micro-batches (``[search-history.embeddings].live-batch-size``
+            / ``live-batch-delay``).
     """
 
     def __init__(self, *, configManager: ConfigManager, database: Database, botProvider: BotProvider) -> None:
@@ -64,7 +67,14 @@ class MessagePreprocessorHandler(BaseBotHandler):
             botProvider: The bot platform provider (Telegram or Max).
         """
         super().__init__(configManager=configManager, database=database, botProvider=botProvider)
-        self._searchEnabled: bool = bool(self.configManager.getSearchHistoryConfig().get("enabled", False))
+        searchConfig = self.configManager.getSearchHistoryConfig()
+        self._searchEnabled: bool = bool(searchConfig.get("enabled", False))
+        embeddingsConfig = searchConfig.get("embeddings", {}) or {}
+        self._embeddingBatcher: EmbeddingBatcher = EmbeddingBatcher(
+            self.db,
+            maxBatchSize=int(embeddingsConfig.get("live-batch-size", 32)),
+            maxDelay=float(embeddingsConfig.get("live-batch-delay", 0.25)),
+        )
 
     async def newMessageHandler(
         self, ensuredMessage: EnsuredMessage, updateObj: UpdateObjectType
@@ -114,9 +124,9 @@ class MessagePreprocessorHandler(BaseBotHandler):
         # if the search-history feature is enabled at the server level AND the chat
         # opts in via the EMBEDDINGS_ENABLED per-chat setting. The dispatch is
         # non-blocking: the task is created synchronously and only registered with
-        # the queue service, so the handler returns immediately. Any error inside
-        # the background task is caught and logged inside embedAndSaveMessage
-        # and never propagates here.
+        # the queue service, so the handler returns immediately. The batcher
+        # coalesces jobs from concurrent messages into one embedding request;
+        # any error inside it is caught and logged and never propagates here.
         if self._searchEnabled:
             try:
                 chatSettings = await self.getChatSettings(ensuredMessage.recipient.id)
@@ -126,10 +136,9 @@ class MessagePreprocessorHandler(BaseBotHandler):
                         if ensuredMessage.messageText and ensuredMessage.messageText.strip():
                             await self.queueService.addBackgroundTask(
                                 asyncio.create_task(
-                                    embedAndSaveMessage(
+                                    self._embeddingBatcher.submit(
                                         ensuredMessage=ensuredMessage,
                                         modelName=embeddingModelName,
-                                        db=self.db,
                                     )
                                 )
                             )
@@ -372,7 +372,7 @@ class ResenderHandler(BaseBotHandler):
                                 logger.debug(f"Processing media {media}")
                                 if not media["local_url"]:
                                     continue
-                                mediaData = self.storage.get(media["local_url"])
+                                mediaData = await self.storage.get(media["local_url"])
                                 if mediaData is None:
                                     continue
 
@@ -16,7 +16,7 @@ import asyncio
 import logging
 import time
 import zlib
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import telegram
 
@@ -48,7 +48,13 @@ from internal.database.models import (
 from internal.models import MessageId
 from internal.services.cache import HCSpamWarningMessageInfo
 from internal.services.queue_service import DelayedTaskFunction
-from lib.bayes_filter import BayesConfig, NaiveBayesFilter, TokenizerConfig
+from lib.bayes_filter import (
+    BayesConfig,
+    BayesStorageInterface,
+    CachedBayesStorage,
+    NaiveBayesFilter,
+    TokenizerConfig,
+)
 
 from .base import BaseBotHandler, HandlerResultStatus
 
@@ -96,6 +102,7 @@ class SpamHandler(BaseBotHandler):
             - Minimum token count of 2
             - Default spam threshold of 50.0
             - Trigram tokenization enabled
+            - In-memory model cache (``bayes-cache-*`` bot settings)
         """
         # Initialize the mixin (discovers handlers)
         super().__init__(configManager=configManager, database=database, botProvider=botProvider)
@@ -104,7 +111,15 @@ class SpamHandler(BaseBotHandler):
         # self.config = configManager.getBotConfig()
 
         # Initialize Bayes spam filter
-        bayesStorage = DatabaseBayesStorage(database)
+        bayesStorage: BayesStorageInterface = DatabaseBayesStorage(database)
+        # Keep models in memory so classification does not hit the database
+        bayesCacheMaxTokens = int(self.config.get("bayes-cache-max-tokens", 500000))
+        if bayesCacheMaxTokens > 0:
+            bayesStorage = CachedBayesStorage(
+                bayesStorage,
+                maxCachedTokens=bayesCacheMaxTokens,
+                reconcileInterval=float(self.config.get("bayes-cache-reconcile-interval", 600)),
+            )
         bayesConfig = BayesConfig(
             perChatStats=True,  # Use per-chat learning
             alpha=1.0,  # Laplace smoothing
@@ -749,14 +764,11 @@ class SpamHandler(BaseBotHandler):
             # Learn from existing spam messages
             spam_messages = await self.db.spam.getSpamMessages(limit=limit)  # Get all spam messages
             spamUsersIds: Set[int] = {-1}
+            trainingMessages: List[Tuple[str, bool, Optional[int]]] = []
             for spamMsg in spam_messages:
                 if spamMsg["chat_id"] == chatId and spamMsg["text"]:
                     spamUsersIds.add(spamMsg["user_id"])
-                    success = await self.bayesFilter.learnSpam(messageText=spamMsg["text"], chatId=chatId)
-                    if success:
-                        stats["spam_learned"] += 1
-                    else:
-                        stats["failed"] += 1
+                    trainingMessages.append((spamMsg["text"], True, chatId))
 
             # Learn from regular user messages as ham
             hamMessages = await self.db.chatMessages.getChatMessagesSince(
@@ -771,11 +783,12 @@ class SpamHandler(BaseBotHandler):
                         hamMsg["user_id"] not in spamUsersIds,
                     )
                 ):
-                    success = await self.bayesFilter.learnHam(messageText=hamMsg["message_text"], chatId=chatId)
-                    if success:
-                        stats["ham_learned"] += 1
-                    else:
-                        stats["failed"] += 1
+                    trainingMessages.append((hamMsg["message_text"], False, chatId))
+
+            # Learn everything at once: tokens are aggregated and written in bulk
+            learnStats = await self.bayesFilter.batch_learn(trainingMessages)
+            for key in stats:
+                stats[key] += learnStats[key]
 
             logger.info(f"Bayes training completed for chat {chatId}: {stats}, dood!")
             return stats
@@ -814,13 +827,11 @@ class SpamHandler(BaseBotHandler):
             # Learn from existing spam messages
             spam_messages = await self.db.spam.getSpamMessages(limit=limit)  # Get all spam messages
             logger.debug(f"Got {len(spam_messages)} spam messages")
-            for spamMsg in spam_messages:
-                if spamMsg["text"]:
-                    success = await self.bayesFilter.learnSpam(messageText=spamMsg["text"], chatId=chatId)
-                    if success:
-                        stats["spam_learned"] += 1
-                    else:
-                        stats["failed"] += 1
+            learnStats = await self.bayesFilter.batch_learn(
+                [(spamMsg["text"], True, chatId) for spamMsg in spam_messages if spamMsg["text"]]
+            )
+            for key in stats:
+                stats[key] += learnStats[key]
 
             logger.info(f"Bayes SPAM training completed for chat {chatId}: {stats}, dood!")
             return stats
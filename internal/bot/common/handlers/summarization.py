@@ -6,11 +6,11 @@ including interactive wizards for selecting chats, topics, and time ranges,
 as well as direct command-based summarization.
 """
 
+import asyncio
 import datetime
 import json
 import logging
-import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 import lib.utils as utils
 from internal.bot import constants
@@ -27,6 +27,7 @@ from internal.bot.models import (
     CommandPermission,
     EnsuredMessage,
     LLMMessageFormat,
+    MediaAttachmentLookup,
     MessageSender,
     commandHandlerV2,
 )
@@ -37,7 +38,7 @@ from internal.database.models import (
 )
 from internal.models import MessageId
 from internal.services.cache import UserActiveActionEnum, UserActiveConfigurationDict
-from lib.ai import ModelMessage, ModelRunResult
+from lib.ai import AbstractModel, MessageTokensCounter, ModelMessage
 
 from .base import BaseBotHandler, HandlerResultStatus
 
@@ -130,9 +131,13 @@ class SummarizationHandler(BaseBotHandler):
         """
         Perform chat summarization and send results.
 
-        Retrieves messages from the database, processes them in batches through
-        an LLM, and sends the summarized results. Handles token limits by
-        splitting large message sets into manageable batches.
+        Retrieves messages from the database and summarizes them map-reduce
+        style: the history is split into batches fitting the model context,
+        batches are summarized concurrently (at most
+        SUMMARIZATION_MAX_PARALLEL_BATCHES at a time, each call rate-limited
+        per chat) and their summaries are sent as they complete, in
+        chronological order. If there are several partial summaries, a final
+        reduce step merges them into one.
 
         Args:
             ensuredMessage: Message to reply to with the summary.
@@ -152,7 +157,8 @@ class SummarizationHandler(BaseBotHandler):
         Note:
             Either sinceDT or maxMessages must be provided, but not both.
             Messages are processed in batches to respect token limits.
-            Results are cached for reuse if useCache is True.
+            If useCache is True, both the whole result and each batch summary
+            are cached, so overlapping ranges reuse already summarized batches.
         """
 
         if sinceDT is None and maxMessages is None:
@@ -186,42 +192,38 @@ class SummarizationHandler(BaseBotHandler):
         if useCache and len(messages) > 1:
             cache = await self.db.chatSummarization.getChatSummarization(
                 chatId=chatId,
-                topicId=None,
+                topicId=threadId,
                 firstMessageId=messages[-1]["message_id"],
                 lastMessageId=messages[0]["message_id"],
                 prompt=summarizationPrompt,
             )
             if cache is not None:
-                resMessages = json.loads(cache["summary"])
-                maxIdx = len(resMessages) - 1
-                for idx, msg in enumerate(resMessages):
-                    await self.sendMessage(
-                        ensuredMessage,
-                        messageText=msg,
-                        messageCategory=MessageCategory.BOT_SUMMARY,
-                        typingManager=typingManager if idx >= maxIdx else None,
-                    )
-                    time.sleep(0.5)
+                await self._sendSummaryMessages(ensuredMessage, json.loads(cache["summary"]), typingManager)
                 return
 
         systemMessage = ModelMessage(role="system", content=summarizationPrompt)
         parsedMessages: List[ModelMessage] = []
 
-        for msg in reversed(messages):
+        # Load media of all messages with batch queries, dood!
+        mediaLookup = MediaAttachmentLookup(self.db)
+        for eMessage in await EnsuredMessage.fromDBChatMessages(
+            list(reversed(messages)), self.db, mediaLookup=mediaLookup
+        ):
             parsedMessages.append(
                 ModelMessage(
                     role="user",
-                    content=await (await EnsuredMessage.fromDBChatMessage(msg, self.db)).formatForLLM(
-                        self.db, LLMMessageFormat.JSON, stripAtsign=True
+                    content=await eMessage.formatForLLM(
+                        self.db, LLMMessageFormat.JSON, stripAtsign=True, mediaLookup=mediaLookup
                     ),
                 )
             )
 
-        reqMessages: List[ModelMessage] = [systemMessage, *parsedMessages]
-
         llmModel = chatSettings[ChatSettingsKey.SUMMARY_MODEL].toModel()
         maxTokens = llmModel.contextSize
-        tokensCount = llmModel.getEstimateTokensCount(reqMessages)
+        # Count each message once, batch sizes are then found from prefix sums
+        counter = MessageTokensCounter.estimate(llmModel, parsedMessages)
+        systemTokens = llmModel.getEstimateMessageTokensCount(systemMessage)
+        tokensCount = systemTokens + counter.total()
 
         # -256 or *0.9 to ensure everything will be ok
         batchesCount = tokensCount // max(maxTokens - 256, maxTokens * 0.9) + 1
@@ -238,76 +240,115 @@ class SummarizationHandler(BaseBotHandler):
             f"{batchesCount}/{batchLength}"
         )
 
-        resMessages = []
         if not parsedMessages:
-            resMessages.append("No messages to summarize")
-        startPos: int = 0
-
-        fallbackPrefix = chatSettings[ChatSettingsKey.FALLBACK_HAPPENED_PREFIX].toStr()
+            await self._sendSummaryMessages(ensuredMessage, ["No messages to summarize"], typingManager)
+            return
 
-        # Summarise each chunk of messages
+        # Split messages into batches fitting into the model context.
+        # Each batch is (startPos, endPos) or an error text if it can't fit at all
+        batches: List[Union[Tuple[int, int], str]] = []
+        startPos: int = 0
         while startPos < len(parsedMessages):
-            currentBatchLen = int(min(batchLength, len(parsedMessages) - startPos))
-            batchSummarized = False
-            while not batchSummarized:
-                batchRequest: List[ModelMessage] = [
-                    systemMessage,
-                    *parsedMessages[startPos : startPos + currentBatchLen],
-                ]
-                tokensCount = llmModel.getEstimateTokensCount(batchRequest)
-                if tokensCount > maxTokens:
-                    if currentBatchLen == 1:
-                        resMessages.append(
-                            f"Error while running LLM for batch {startPos}:{startPos + currentBatchLen}: "
-                            f"Batch has too many tokens ({tokensCount})"
-                        )
-                        break
-                    currentBatchLen = int(currentBatchLen // (tokensCount / maxTokens))
-                    currentBatchLen -= 2
-                    if currentBatchLen < 1:
-                        currentBatchLen = 1
-                    continue
-                batchSummarized = True
-
-                mlRet: Optional[ModelRunResult] = None
-                try:
-                    logger.debug(f"LLM Request messages: {batchRequest}")
-                    mlRet = await self.llmService.generateText(
-                        batchRequest,
-                        chatId=chatId,
-                        chatSettings=chatSettings,
-                        modelKey=llmModel,
-                        fallbackKey=ChatSettingsKey.SUMMARY_FALLBACK_MODEL,
-                    )
-                    logger.debug(f"LLM Response: {mlRet}")
-                except Exception as e:
-                    logger.error(  # type: ignore
-                        f"Error while running LLM for batch {startPos}:{startPos + currentBatchLen}: "
-                        f"{type(e).__name__}#{e}"
-                    )
-                    resMessages.append(
-                        f"Error while running LLM for batch {startPos}:{startPos + currentBatchLen}: {type(e).__name__}"
-                    )
-                    break
-
-                respText = mlRet.resultText
-                if mlRet.isFallback:
-                    respText = f"{fallbackPrefix} {respText}"
-                resMessages.append(mlRet.resultText)
-
-            startPos += currentBatchLen
+            currentBatchLen = max(1, int(min(batchLength, len(parsedMessages) - startPos)))
+            endPos = counter.fitEnd(maxTokens - systemTokens, startPos, startPos + currentBatchLen)
+            if endPos > startPos:
+                batches.append((startPos, endPos))
+                startPos = endPos
+                continue
+            batches.append(
+                f"Error while running LLM for batch {startPos}:{startPos + 1}: "
+                f"Batch has too many tokens ({systemTokens + counter.total(startPos, startPos + 1)})"
+            )
+            startPos += 1
 
-        # If any message is too long, just split it into multiple messages
-        tmpResMessages = []
-        for msg in resMessages:
-            while len(msg) > constants.TELEGRAM_MAX_MESSAGE_LENGTH:
-                head = msg[: constants.TELEGRAM_MAX_MESSAGE_LENGTH]
-                msg = msg[constants.TELEGRAM_MAX_MESSAGE_LENGTH :]
-                tmpResMessages.append(head)
-            if msg:
-                tmpResMessages.append(msg)
+        fallbackPrefix = chatSettings[ChatSettingsKey.FALLBACK_HAPPENED_PREFIX].toStr()
+        semaphore = asyncio.Semaphore(constants.SUMMARIZATION_MAX_PARALLEL_BATCHES)
+
+        async def summarizeBatch(batchStart: int, batchEnd: int) -> Tuple[str, bool]:
+            """Summarize one batch (map step), reusing its cached summary if any.
+
+            Returns:
+                Summary text (or error text) and whether it is a summary.
+            """
+            # messages are newest first, parsedMessages are oldest first
+            firstMessageId = messages[len(messages) - 1 - batchStart]["message_id"]
+            lastMessageId = messages[len(messages) - batchEnd]["message_id"]
+            batchPrompt = constants.SUMMARIZATION_BATCH_CACHE_PREFIX + summarizationPrompt
+            if useCache:
+                cache = await self.db.chatSummarization.getChatSummarization(
+                    chatId=chatId,
+                    topicId=threadId,
+                    firstMessageId=firstMessageId,
+                    lastMessageId=lastMessageId,
+                    prompt=batchPrompt,
+                )
+                if cache is not None:
+                    return cache["summary"], True
 
-        resMessages = tmpResMessages
+            async with semaphore:
+                respText = await self._runSummarizationLLM(
+                    [systemMessage, *parsedMessages[batchStart:batchEnd]],
+                    chatId=chatId,
+                    chatSettings=chatSettings,
+                    llmModel=llmModel,
+                    fallbackPrefix=fallbackPrefix,
+                )
+            if respText is None:
+                return f"Error while running LLM for batch {batchStart}:{batchEnd}", False
+
+            if useCache:
+                await self.db.chatSummarization.addChatSummarization(
+                    chatId=chatId,
+                    topicId=threadId,
+                    firstMessageId=firstMessageId,
+                    lastMessageId=lastMessageId,
+                    prompt=batchPrompt,
+                    summary=respText,
+                )
+            return respText, True
+
+        # Map: summarise batches concurrently, batches that can't fit have no task
+        tasks: List[Optional[asyncio.Task[Tuple[str, bool]]]] = [
+            None if isinstance(batch, str) else asyncio.create_task(summarizeBatch(*batch)) for batch in batches
+        ]
+
+        resMessages: List[str] = []
+        partialSummaries: List[str] = []
+        intermediatePrefix = chatSettings[ChatSettingsKey.INTERMEDIATE_MESSAGE_PREFIX].toStr()
+        try:
+            # Stream partial results in chronological order as soon as they are ready
+            for idx, (batch, task) in enumerate(zip(batches, tasks)):
+                if task is None:
+                    text = str(batch)
+                else:
+                    text, isSummary = await task
+                    if isSummary:
+                        partialSummaries.append(text)
+                if len(batches) > 1:
+                    text = f"{intermediatePrefix} {text}"
+                batchMessages = self._splitSummaryText(text)
+                resMessages.extend(batchMessages)
+                # Stop typing with the last message if there is nothing to merge
+                isFinal = idx == len(batches) - 1 and len(partialSummaries) < 2
+                await self._sendSummaryMessages(ensuredMessage, batchMessages, typingManager if isFinal else None)
+        finally:
+            for task in tasks:
+                if task is not None:
+                    task.cancel()
+
+        # Reduce: merge partial summaries into one
+        finalMessages: List[str] = []
+        if len(partialSummaries) > 1:
+            finalMessages = self._splitSummaryText(
+                await self._reduceSummaries(
+                    partialSummaries,
+                    chatId=chatId,
+                    chatSettings=chatSettings,
+                    llmModel=llmModel,
+                    fallbackPrefix=fallbackPrefix,
+                )
+            )
+            resMessages.extend(finalMessages)
 
         if useCache and len(messages) > 1:
             await self.db.chatSummarization.addChatSummarization(
@@ -319,15 +360,156 @@ class SummarizationHandler(BaseBotHandler):
                 summary=utils.jsonDumps(resMessages),
             )
 
-        maxIdx = len(resMessages) - 1
-        for idx, msg in enumerate(resMessages):
+        if finalMessages:
+            await self._sendSummaryMessages(ensuredMessage, finalMessages, typingManager)
+
+    async def _runSummarizationLLM(
+        self,
+        request: List[ModelMessage],
+        *,
+        chatId: int,
+        chatSettings: ChatSettingsDict,
+        llmModel: AbstractModel,
+        fallbackPrefix: str,
+    ) -> Optional[str]:
+        """
+        Run a single summarization LLM request.
+
+        Args:
+            request: Messages to send, starting with the system prompt.
+            chatId: Chat ID, used for rate limiting.
+            chatSettings: Chat configuration with the fallback model.
+            llmModel: Model to run the request with.
+            fallbackPrefix: Prefix added to the result if the fallback model answered.
+
+        Returns:
+            Result text, or None if the LLM call failed.
+        """
+        try:
+            logger.debug(f"LLM Request messages: {request}")
+            mlRet = await self.llmService.generateText(
+                request,
+                chatId=chatId,
+                chatSettings=chatSettings,
+                modelKey=llmModel,
+                fallbackKey=ChatSettingsKey.SUMMARY_FALLBACK_MODEL,
+            )
+            logger.debug(f"LLM Response: {mlRet}")
+        except Exception as e:
+            logger.error(f"Error while running LLM for summarization: {type(e).__name__}#{e}")
+            return None
+
+        respText = mlRet.resultText
+        if mlRet.isFallback:
+            respText = f"{fallbackPrefix} {respText}"
+        return respText
+
+    async def _reduceSummaries(
+        self,
+        summaries: List[str],
+        *,
+        chatId: int,
+        chatSettings: ChatSettingsDict,
+        llmModel: AbstractModel,
+        fallbackPrefix: str,
+    ) -> str:
+        """
+        Merge partial summaries into one summary (reduce step).
+
+        Summaries are grouped so every request fits into the model context.
+        Groups are merged concurrently and the step repeats until a single
+        summary is left.
+
+        Args:
+            summaries: Partial summaries in chronological order.
+            chatId: Chat ID, used for rate limiting.
+            chatSettings: Chat configuration with the reduce prompt.
+            llmModel: Model to run the requests with.
+            fallbackPrefix: Prefix added to results produced by the fallback model.
+
+        Returns:
+            Merged summary. If summaries can't be merged further, they are
+            joined with blank lines.
+        """
+        systemMessage = ModelMessage(role="system", content=chatSettings[ChatSettingsKey.SUMMARY_REDUCE_PROMPT].toStr())
+        maxTokens = llmModel.contextSize
+        semaphore = asyncio.Semaphore(constants.SUMMARIZATION_MAX_PARALLEL_BATCHES)
+
+        async def reduceGroup(group: List[str]) -> str:
+            if len(group) == 1:
+                return group[0]
+            async with semaphore:
+                respText = await self._runSummarizationLLM(
+                    [systemMessage, *[ModelMessage(role="user", content=summary) for summary in group]],
+                    chatId=chatId,
+                    chatSettings=chatSettings,
+                    llmModel=llmModel,
+                    fallbackPrefix=fallbackPrefix,
+                )
+            # On error keep partial summaries as is
+            return respText if respText is not None else "\n\n".join(group)
+
+        systemTokens = llmModel.getEstimateMessageTokensCount(systemMessage)
+        while len(summaries) > 1:
+            groups: List[List[str]] = [[]]
+            groupTokens = systemTokens
+            for summary in summaries:
+                summaryTokens = llmModel.getEstimateMessageTokensCount(ModelMessage(role="user", content=summary))
+                if groups[-1] and groupTokens + summaryTokens > maxTokens:
+                    groups.append([])
+                    groupTokens = systemTokens
+                groups[-1].append(summary)
+                groupTokens += summaryTokens
+
+            if len(groups) == len(summaries):
+                # No two summaries fit into the context together
+                break
+            summaries = list(await asyncio.gather(*[reduceGroup(group) for group in groups]))
+
+        return "\n\n".join(summaries)
+
+    def _splitSummaryText(self, text: str) -> List[str]:
+        """
+        Split summary text into chunks fitting into a single message.
+
+        Args:
+            text: Summary text.
+
+        Returns:
+            List of message texts, empty for empty text.
+        """
+        ret: List[str] = []
+        while len(text) > constants.TELEGRAM_MAX_MESSAGE_LENGTH:
+            ret.append(text[: constants.TELEGRAM_MAX_MESSAGE_LENGTH])
+            text = text[constants.TELEGRAM_MAX_MESSAGE_LENGTH :]
+        if text:
+            ret.append(text)
+        return ret
+
+    async def _sendSummaryMessages(
+        self,
+        ensuredMessage: EnsuredMessage,
+        texts: List[str],
+        typingManager: Optional[TypingManager],
+    ) -> None:
+        """
+        Send summary messages one by one.
+
+        Args:
+            ensuredMessage: Message to reply to.
+            texts: Message texts to send.
+            typingManager: Typing manager passed with the last message (to stop
+                typing), or None to keep typing after these messages.
+        """
+        maxIdx = len(texts) - 1
+        for idx, msg in enumerate(texts):
             await self.sendMessage(
                 ensuredMessage,
                 messageText=msg,
                 messageCategory=MessageCategory.BOT_SUMMARY,
                 typingManager=typingManager if idx >= maxIdx else None,
             )
-            time.sleep(0.5)
+            await asyncio.sleep(0.5)
 
     async def _handle_summarization(
         self,
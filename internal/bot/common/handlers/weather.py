@@ -89,12 +89,16 @@ class WeatherHandler(BaseBotHandler):
                 CacheType.WEATHER,
                 keyGenerator=StringKeyGenerator(),
                 valueConverter=JsonValueConverter(),
+                staleWhileRevalidate=int(openWeatherMapConfig.get("weather-stale-while-revalidate", 0)),
+                staleIfError=int(openWeatherMapConfig.get("weather-stale-if-error", 0)),
             ),
             geocodingCache=GenericDatabaseCache(
                 self.db,
                 CacheType.GEOCODING,
                 keyGenerator=StringKeyGenerator(),
                 valueConverter=JsonValueConverter(),
+                staleWhileRevalidate=int(openWeatherMapConfig.get("geocoding-stale-while-revalidate", 0)),
+                staleIfError=int(openWeatherMapConfig.get("geocoding-stale-if-error", 0)),
             ),
             geocodingTTL=openWeatherMapConfig.get("geocoding-cache-ttl", None),
             weatherTTL=openWeatherMapConfig.get("weather-cache-ttl", None),
@@ -115,6 +119,8 @@ class WeatherHandler(BaseBotHandler):
                 logger.info(f"Proxy enabled for Geocode Maps: {maskedProxyUrl}")
 
             geocodeTTL = int(geocodeMapsConfig.get("cache-ttl", 2592000))
+            geocodeStaleWhileRevalidate = int(geocodeMapsConfig.get("stale-while-revalidate", 0))
+            geocodeStaleIfError = int(geocodeMapsConfig.get("stale-if-error", 0))
             self.geocodeMapsClient = GeocodeMapsClient(
                 apiKey=geocodeMapsConfig["api-key"],
                 searchCache=GenericDatabaseCache(
@@ -122,18 +128,24 @@ class WeatherHandler(BaseBotHandler):
                     CacheType.GM_SEARCH,
                     keyGenerator=JsonKeyGenerator(hash=False),
                     valueConverter=JsonValueConverter(),
+                    staleWhileRevalidate=geocodeStaleWhileRevalidate,
+                    staleIfError=geocodeStaleIfError,
                 ),
                 reverseCache=GenericDatabaseCache(
                     self.db,
                     CacheType.GM_REVERSE,
                     keyGenerator=JsonKeyGenerator(hash=False),
                     valueConverter=JsonValueConverter(),
+                    staleWhileRevalidate=geocodeStaleWhileRevalidate,
+                    staleIfError=geocodeStaleIfError,
                 ),
                 lookupCache=GenericDatabaseCache(
                     self.db,
                     CacheType.GM_LOOKUP,
                     keyGenerator=JsonKeyGenerator(hash=False),
                     valueConverter=JsonValueConverter(),
+                    staleWhileRevalidate=geocodeStaleWhileRevalidate,
+                    staleIfError=geocodeStaleIfError,
                 ),
                 searchTTL=geocodeTTL,
                 reverseTTL=geocodeTTL,
@@ -170,6 +182,7 @@ class WeatherHandler(BaseBotHandler):
                     ),
                 ],
                 handler=self._llmToolGetWeatherByCity,
+                parallelSafe=True,
             )
         else:
             # Geocode Maps client activated - we can geocode any address
@@ -189,6 +202,7 @@ class WeatherHandler(BaseBotHandler):
                     ),
                 ],
                 handler=self._llmToolGetWeatherByAddress,
+                parallelSafe=True,
             )
 
         self.llmService.registerTool(
@@ -213,6 +227,7 @@ class WeatherHandler(BaseBotHandler):
                 ),
             ],
             handler=self._llmToolGetWeatherByCoords,
+            parallelSafe=True,
         )
 
     async def _llmToolGetWeatherByCity(
@@ -55,12 +55,21 @@ from lib.ai import (
 )
 from lib.ai.models import ModelMessage, ModelResultStatus
 from lib.cache import JsonKeyGenerator, JsonValueConverter, StringKeyGenerator, StringValueConverter
+from lib.http_client import HttpClientRegistry
 from lib.yandex_search import SearchRequestKeyGenerator, YandexSearchClient
 
 from .base import BaseBotHandler
 
 logger = logging.getLogger(__name__)
 
+_FETCH_HEADERS: Dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (compatible; Gromozeka/1.0)",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ru-RU,ru,en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate",
+}
+"""Request headers sent when fetching pages for the LLM web-fetch tool."""
+
 
 class YandexSearchHandler(BaseBotHandler):
     """
@@ -124,6 +133,8 @@ class YandexSearchHandler(BaseBotHandler):
                 namespace=CacheType.YANDEX_SEARCH,
                 keyGenerator=SearchRequestKeyGenerator(),
                 valueConverter=JsonValueConverter(),
+                staleWhileRevalidate=int(ysConfig.get("stale-while-revalidate", 0)),
+                staleIfError=int(ysConfig.get("stale-if-error", 0)),
             ),
             cacheTTL=int(ysConfig.get("cache-ttl", 30)),
             rateLimiterQueue=ysConfig.get("ratelimiter-queue", "yandex-search"),
@@ -175,6 +186,8 @@ class YandexSearchHandler(BaseBotHandler):
                 ),
             ],
             handler=self._llmToolWebSearch,
+            parallelSafe=True,
+            timeout=120,  # Fetching and condensing pages takes a while
         )
 
         self.llmService.registerTool(
@@ -202,6 +215,8 @@ class YandexSearchHandler(BaseBotHandler):
                 ),
             ],
             handler=self._llmToolGetUrlContent,
+            parallelSafe=True,
+            timeout=120,  # Fetching and condensing pages takes a while
         )
 
         self.urlContentCache = GenericDatabaseCache(
@@ -471,47 +486,32 @@ class YandexSearchHandler(BaseBotHandler):
                 - 'error' (str): Error message if download failed
 
         Note:
-            Uses HTTP/2 (unless SOCKS5 proxy is active, which requires HTTP/1.1)
-            with a 60-second timeout, follows up to 5 redirects, and sets a
-            user agent header to avoid blocking.
+            Uses the shared pooled client of the handler's proxy route (HTTP/2
+            where the pool and the proxy support it) with a 60-second timeout,
+            follows redirects, and sets a user agent header to avoid blocking.
         """
         try:
-            # SOCKS5 transport does not support HTTP/2; disable it when proxy is SOCKS5
-            proxyKwargs = self._proxyConfig.toKwargs()
-            useHttp2 = "transport" not in proxyKwargs
-            if not useHttp2:
-                logger.warning("HTTP/2 disabled for web-fetch: SOCKS5 transport does not support HTTP/2")
-
-            async with httpx.AsyncClient(
-                **proxyKwargs,
-                http2=useHttp2,
+            client = HttpClientRegistry.getInstance().getClient(self._proxyConfig)
+            response = await client.get(
+                url,
                 timeout=httpx.Timeout(60),  # Set Timeout to 1 minute for everything
                 follow_redirects=True,
-                max_redirects=5,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; Gromozeka/1.0)",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "ru-RU,ru,en-US,en;q=0.5",
-                    "Accept-Encoding": "gzip, deflate",
-                },
-            ) as client:
-                # response: requests.Response = requests.get(url, timeout=(120.0, 120.0))
-                response = await client.get(url)
-                await response.aread()
-
-                if response.status_code < 200 or response.status_code >= 300:
-                    return {
-                        "done": False,
-                        "error": f"Request failed with status {response.status_code}: {response.reason_phrase}",
-                    }
-                contentType = response.headers.get("Content-Type")
-                if contentType is None:
-                    contentType = "test/html"
+                headers=_FETCH_HEADERS,
+            )
+
+            if response.status_code < 200 or response.status_code >= 300:
                 return {
-                    "done": True,
-                    "content": response.text,
-                    "contentType": contentType,
+                    "done": False,
+                    "error": f"Request failed with status {response.status_code}: {response.reason_phrase}",
                 }
+            contentType = response.headers.get("Content-Type")
+            if contentType is None:
+                contentType = "test/html"
+            return {
+                "done": True,
+                "content": response.text,
+                "contentType": contentType,
+            }
         except Exception as e:
             logger.error(f"Error getting content from {url}: {e}")
             return {
@@ -0,0 +1,331 @@
+"""Streaming message sink for showing LLM replies while they are generated.
+
+Provides StreamingMessageSink, which receives streamed LLM chunks and keeps a
+draft reply in the chat up to date by editing it. Edits are throttled to stay
+within Telegram and Max edit-rate limits, and long replies are split into
+several messages at the platform message length limit.
+"""
+
+import logging
+import re
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, List, Optional
+
+import lib.max_bot as libMax
+from internal.bot import constants
+from internal.bot.common.bot import TheBot
+from internal.bot.common.typing_manager import TypingManager
+from internal.bot.models import BotProvider, ChatType, EnsuredMessage
+from internal.database.models import MessageCategory
+from lib.ai import ModelMessage, ModelResultChunk
+
+if TYPE_CHECKING:
+    from internal.bot.common.handlers.base import BaseBotHandler
+
+logger = logging.getLogger(__name__)
+
+_NOT_STREAMABLE_RE = re.compile(r"^\s*`*\s*(?:{|\[|<media-description)")
+"""Replies which need post-processing before sending (JSON, tool calls, images) and are never streamed."""
+
+
+class StreamingMessageSink:
+    """Shows a streamed LLM reply in the chat by editing draft messages.
+
+    Chunks are passed to feed(). Once the reply is long enough, the first
+    draft is sent as a reply to the user message; afterwards the drafts are
+    edited at most once per editInterval seconds. Text beyond maxLength goes to
+    additional draft messages. Drafts are sent without formatting and are not
+    saved to the database: finalize() edits them to the post-processed final
+    text (with Markdown) and saves them, discard() deletes them.
+
+    Attributes:
+        handler: Handler used to send overflow messages and save the final reply
+        bot: Bot client used to send, edit and delete drafts
+        replyToMessage: The user message being answered
+        editInterval: Minimum delay in seconds between two draft updates
+        maxLength: Maximum length of a single message
+        minDraftLength: Number of characters to receive before the first draft is sent
+        text: Text received since the last finalize() or discard()
+        drafts: Draft messages sent so far
+        shownParts: Text currently shown in each draft message
+        lastUpdateTime: Monotonic time of the last draft update
+        disabled: Whether streaming was turned off for the current reply
+    """
+
+    __slots__ = (
+        "handler",
+        "bot",
+        "replyToMessage",
+        "editInterval",
+        "maxLength",
+        "minDraftLength",
+        "text",
+        "drafts",
+        "shownParts",
+        "lastUpdateTime",
+        "disabled",
+    )
+
+    def __init__(
+        self,
+        handler: "BaseBotHandler",
+        bot: TheBot,
+        replyToMessage: EnsuredMessage,
+        *,
+        editInterval: Optional[float] = None,
+        maxLength: Optional[int] = None,
+        minDraftLength: int = constants.STREAMING_MIN_DRAFT_LENGTH,
+    ) -> None:
+        """Initialize the sink for a reply to the given message.
+
+        Args:
+            handler: Handler used to send overflow messages and save the final reply
+            bot: Bot client used to send, edit and delete drafts
+            replyToMessage: The user message being answered
+            editInterval: Minimum delay in seconds between draft updates
+                (None - choose by platform and chat type, see getEditInterval())
+            maxLength: Maximum length of a single message (None - platform limit)
+            minDraftLength: Number of characters to receive before the first draft is sent
+        """
+        self.handler: "BaseBotHandler" = handler
+        self.bot: TheBot = bot
+        self.replyToMessage: EnsuredMessage = replyToMessage
+        self.editInterval: float = (
+            editInterval
+            if editInterval is not None
+            else self.getEditInterval(bot.botProvider, replyToMessage.recipient.chatType)
+        )
+        self.maxLength: int = maxLength if maxLength is not None else self.getMaxLength(bot.botProvider)
+        self.minDraftLength: int = minDraftLength
+
+        self.text: str = ""
+        self.drafts: List[EnsuredMessage] = []
+        self.shownParts: List[str] = []
+        self.lastUpdateTime: float = 0.0
+        self.disabled: bool = False
+
+    @staticmethod
+    def getEditInterval(botProvider: BotProvider, chatType: ChatType) -> float:
+        """Get the minimum delay between draft updates for a chat.
+
+        Args:
+            botProvider: Platform of the chat
+            chatType: Type of the chat
+
+        Returns:
+            Delay in seconds which keeps edits within the platform rate limits
+        """
+        if botProvider == BotProvider.MAX:
+            return constants.STREAMING_EDIT_INTERVAL_MAX
+        if chatType == ChatType.PRIVATE:
+            return constants.STREAMING_EDIT_INTERVAL_TELEGRAM_PRIVATE
+        return constants.STREAMING_EDIT_INTERVAL_TELEGRAM_GROUP
+
+    @staticmethod
+    def getMaxLength(botProvider: BotProvider) -> int:
+        """Get the maximum message length of a platform.
+
+        Args:
+            botProvider: Platform to get the limit for
+
+        Returns:
+            Maximum number of characters in a single message
+        """
+        if botProvider == BotProvider.MAX:
+            return libMax.MAX_MESSAGE_LENGTH
+        return constants.TELEGRAM_MAX_MESSAGE_LENGTH
+
+    def hasDrafts(self) -> bool:
+        """Check whether any draft message was sent for the current reply.
+
+        Returns:
+            True if there are drafts to finalize or discard
+        """
+        return bool(self.drafts)
+
+    def _split(self, text: str, prefix: str = "") -> List[str]:
+        """Split text into parts fitting into one message together with the prefix.
+
+        Args:
+            text: Text to split
+            prefix: Prefix added to every part
+
+        Returns:
+            List of parts (a single empty part for empty text)
+        """
+        partLength = max(1, self.maxLength - len(prefix))
+        if not text:
+            return [""]
+        return [text[i : i + partLength] for i in range(0, len(text), partLength)]
+
+    async def _editDraft(self, index: int, text: str, *, useMarkdown: bool) -> None:
+        """Edit a draft message, falling back to plain text if Markdown is rejected.
+
+        Args:
+            index: Index of the draft in self.drafts
+            text: New text of the message
+            useMarkdown: Whether to try Markdown formatting first
+        """
+        draft = self.drafts[index]
+        if useMarkdown:
+            try:
+                await self.bot.editMessage(draft.messageId, draft.recipient.id, text=text, useMarkdown=True)
+                self.shownParts[index] = text
+                return
+            except Exception as e:
+                logger.warning(f"Failed to edit streamed message with Markdown: {type(e).__name__}#{e}")
+            if self.shownParts[index] == text:
+                # Plain text is already shown, editing to the same text would fail
+                return
+
+        await self.bot.editMessage(draft.messageId, draft.recipient.id, text=text, useMarkdown=False)
+        self.shownParts[index] = text
+
+    async def _updateDrafts(self) -> None:
+        """Bring the draft messages in line with the received text."""
+        self.lastUpdateTime = time.monotonic()
+        for i, part in enumerate(self._split(self.text)):
+            if i < len(self.drafts):
+                if self.shownParts[i] != part:
+                    await self._editDraft(i, part, useMarkdown=False)
+                continue
+
+            sent = await self.bot.sendMessage(
+                replyToMessage=self.replyToMessage,
+                messageText=part,
+                tryMarkdownV2=False,
+                sendErrorIfAny=False,
+                skipLogs=True,
+                splitIfTooLong=False,
+            )
+            if not sent:
+                raise RuntimeError("Failed to send draft message")
+            self.drafts.append(sent[0])
+            self.shownParts.append(part)
+
+    async def feed(self, chunk: ModelResultChunk) -> None:
+        """Receive a streamed chunk and update the drafts if it is time to.
+
+        The final chunk (the one carrying the result) is ignored: the final
+        text is post-processed by the caller and passed to finalize().
+
+        Args:
+            chunk: Chunk from the LLM stream
+        """
+        if chunk.result is not None or self.disabled or not chunk.textDelta:
+            return
+        self.text += chunk.textDelta
+
+        if not self.drafts:
+            if len(self.text.strip()) < self.minDraftLength:
+                return
+            if _NOT_STREAMABLE_RE.match(self.text):
+                logger.debug("Reply needs post-processing, not streaming it")
+                self.disabled = True
+                return
+        elif time.monotonic() - self.lastUpdateTime < self.editInterval:
+            return
+
+        try:
+            await self._updateDrafts()
+        except Exception as e:
+            logger.error(f"Failed to update streamed message: {type(e).__name__}#{e}")
+            self.lastUpdateTime = time.monotonic()
+
+    def _reset(self) -> None:
+        """Forget the current reply so the sink can be used for the next one."""
+        self.text = ""
+        self.drafts = []
+        self.shownParts = []
+        self.lastUpdateTime = 0.0
+        self.disabled = False
+
+    async def finalize(
+        self,
+        text: str,
+        *,
+        prefix: str = "",
+        messageCategory: MessageCategory = MessageCategory.BOT,
+        toolsHistory: Optional[Sequence[ModelMessage]] = None,
+        typingManager: Optional[TypingManager] = None,
+    ) -> Optional[List[EnsuredMessage]]:
+        """Turn the drafts into the final reply, dood!
+
+        Drafts are edited to the final text (split at maxLength, with the
+        prefix on every part), missing parts are sent as new messages and
+        surplus drafts are deleted. All parts are saved to the database.
+
+        Args:
+            text: Final (post-processed) reply text
+            prefix: Prefix added to every part of the reply
+            messageCategory: Category to save the messages with
+            toolsHistory: History of tool calls used for the reply
+            typingManager: Typing manager to stop before the final edit
+
+        Returns:
+            Messages of the final reply, or None if no drafts were sent (the
+            caller then sends the reply as usual)
+        """
+        if not self.drafts:
+            self._reset()
+            return None
+
+        if typingManager is not None:
+            await typingManager.stopTask()
+
+        if not text:
+            await self.discard()
+            return []
+
+        drafts = self.drafts
+        parts = self._split(text, prefix)
+        ret: List[EnsuredMessage] = []
+
+        for i, part in enumerate(parts):
+            if i >= len(drafts):
+                ret.extend(
+                    await self.handler.sendMessage(
+                        self.replyToMessage,
+                        messageText=part,
+                        addMessagePrefix=prefix,
+                        messageCategory=messageCategory,
+                        toolsHistory=toolsHistory,
+                    )
+                )
+                continue
+
+            try:
+                await self._editDraft(i, prefix + part, useMarkdown=True)
+            except Exception as e:
+                logger.error(f"Failed to finalize streamed message: {type(e).__name__}#{e}")
+
+            draft = drafts[i]
+            draft.messageText = part
+            if prefix:
+                draft.setMessagePrefix(prefix)
+            if toolsHistory:
+                draft.metadata["usedTools"] = [v.toDict() for v in toolsHistory]
+            await self.handler.saveChatMessage(draft, messageCategory=messageCategory)
+            ret.append(draft)
+
+        surplus = drafts[len(parts) :]
+        if surplus:
+            try:
+                await self.bot.deleteMessagesById(self.replyToMessage.recipient.id, [v.messageId for v in surplus])
+            except Exception as e:
+                logger.error(f"Failed to delete surplus streamed messages: {type(e).__name__}#{e}")
+
+        self._reset()
+        return ret
+
+    async def discard(self) -> None:
+        """Delete the drafts of the current reply and reset the sink."""
+        drafts = self.drafts
+        self._reset()
+        if not drafts:
+            return
+        try:
+            await self.bot.deleteMessagesById(self.replyToMessage.recipient.id, [v.messageId for v in drafts])
+        except Exception as e:
+            logger.error(f"Failed to delete streamed messages: {type(e).__name__}#{e}")
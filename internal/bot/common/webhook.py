@@ -0,0 +1,118 @@
+"""Webhook ingestion mode shared by the Telegram and Max bot applications.
+
+Builds the WebhookServer from the ``[bot.webhook]`` config section and runs the
+webhook mode coroutine until the process is asked to stop, dood!
+"""
+
+import asyncio
+import logging
+import signal
+from collections.abc import Coroutine
+from typing import Any, Dict, Optional
+
+from internal.database import Database
+from internal.database.generic_cache import GenericDatabaseCache
+from internal.database.models import CacheType
+from lib.cache import CacheInterface, StringKeyGenerator
+from lib.webhook import WebhookHandler, WebhookServer
+from lib.webhook.server import DEFAULT_DEDUP_TTL, DEFAULT_HEALTH_PATH, DEFAULT_QUEUE_SIZE, UpdateIdGetter
+
+logger = logging.getLogger(__name__)
+
+
+def getWebhookConfig(botConfig: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Get the webhook config if webhook mode is enabled.
+
+    Args:
+        botConfig: The ``[bot]`` config section
+
+    Returns:
+        The ``[bot.webhook]`` config section, or None if webhook mode is disabled
+
+    Raises:
+        ValueError: If webhook mode is enabled and registration is requested without a URL
+    """
+    webhookConfig = botConfig.get("webhook", {})
+    if not webhookConfig.get("enabled", False):
+        return None
+    if webhookConfig.get("register", True) and not webhookConfig.get("url"):
+        raise ValueError("bot.webhook.url should be specified to register the webhook")
+    return webhookConfig
+
+
+def createWebhookServer(
+    webhookConfig: Dict[str, Any],
+    database: Database,
+    handler: WebhookHandler,
+    *,
+    secretHeader: str,
+    dedupPrefix: str,
+    getUpdateId: Optional[UpdateIdGetter] = None,
+) -> WebhookServer:
+    """Create the webhook server from the webhook config.
+
+    Args:
+        webhookConfig: The ``[bot.webhook]`` config section
+        database: Database for the shared deduplication cache
+        handler: Function called for every accepted update
+        secretHeader: Name of the header the platform sends the secret in
+        dedupPrefix: Prefix of the deduplication keys (platform and bot ID)
+        getUpdateId: Function returning the update ID for deduplication
+            (None - a hash of the request body is used)
+
+    Returns:
+        Webhook server, not started yet
+    """
+    dedupTtl = int(webhookConfig.get("dedup-ttl", DEFAULT_DEDUP_TTL))
+    dedupCache: Optional[CacheInterface[str, float]] = None
+    if webhookConfig.get("shared-dedup", False):
+        # Redeliveries may hit another instance behind the load balancer
+        dedupCache = GenericDatabaseCache[str, float](
+            database, CacheType.WEBHOOK_UPDATES, keyGenerator=StringKeyGenerator()
+        )
+
+    return WebhookServer(
+        handler,
+        host=str(webhookConfig.get("listen-host", "0.0.0.0")),
+        port=int(webhookConfig.get("listen-port", 8080)),
+        path=str(webhookConfig.get("path", "/webhook")),
+        healthPath=str(webhookConfig.get("health-path", DEFAULT_HEALTH_PATH)),
+        secret=webhookConfig.get("secret") or None,
+        secretHeader=secretHeader,
+        getUpdateId=getUpdateId,
+        queueSize=int(webhookConfig.get("queue-size", DEFAULT_QUEUE_SIZE)),
+        dedupCache=dedupCache,
+        dedupTtl=dedupTtl,
+        dedupPrefix=dedupPrefix,
+    )
+
+
+def runUntilStopped(loop: asyncio.AbstractEventLoop, coroutine: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine until it ends or the process gets SIGINT/SIGTERM.
+
+    On a signal the coroutine is cancelled, so its cleanup (finally blocks) runs
+    on the loop before this function returns.
+
+    Args:
+        loop: Event loop to run the coroutine on
+        coroutine: Coroutine to run
+    """
+    task = loop.create_task(coroutine)
+    stopSignals = (signal.SIGINT, signal.SIGTERM)
+    for stopSignal in stopSignals:
+        try:
+            loop.add_signal_handler(stopSignal, task.cancel)
+        except (NotImplementedError, RuntimeError):
+            # Not supported on this platform or not in the main thread
+            pass
+
+    try:
+        loop.run_until_complete(task)
+    except asyncio.CancelledError:
+        logger.info("Stop signal received, webhook mode stopped")
+    finally:
+        for stopSignal in stopSignals:
+            try:
+                loop.remove_signal_handler(stopSignal)
+            except (NotImplementedError, RuntimeError):
+                pass
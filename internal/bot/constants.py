@@ -40,6 +40,31 @@ This value is retrieved from the telegram.constants module to ensure
 it stays synchronized with the Telegram API specification.
 """
 
+# LLM response streaming
+STREAMING_EDIT_INTERVAL_TELEGRAM_PRIVATE: float = 1.0
+"""Minimum delay in seconds between edits of a streamed reply in Telegram private chats.
+
+Telegram allows about one message per second in a private chat; editing
+faster than that gets the bot throttled with RetryAfter errors.
+"""
+
+STREAMING_EDIT_INTERVAL_TELEGRAM_GROUP: float = 3.0
+"""Minimum delay in seconds between edits of a streamed reply in Telegram groups.
+
+Telegram allows about 20 messages per minute in a group, so edits are
+spaced three seconds apart.
+"""
+
+STREAMING_EDIT_INTERVAL_MAX: float = 2.0
+"""Minimum delay in seconds between edits of a streamed reply in Max chats."""
+
+STREAMING_MIN_DRAFT_LENGTH: int = 32
+"""Number of characters to receive before the first draft of a streamed reply is sent.
+
+Short replies are sent once as usual, and the first characters are enough
+to tell JSON or <media-description> replies (which are never streamed) apart.
+"""
+
 # Processing settings
 PROCESSING_TIMEOUT: int = 30 * 60  # 30 minutes
 """Maximum time in seconds allowed for processing a single request.
@@ -63,6 +88,20 @@ When summarizing long conversations, messages are processed in batches
 of this size to manage memory usage and API rate limits.
 """
 
+SUMMARIZATION_MAX_PARALLEL_BATCHES: int = 4
+"""Maximum number of summarization batches sent to the LLM concurrently.
+
+Batches of one summarization run are summarized in parallel (each call still
+goes through the chat's LLM rate limiter), at most this many at a time.
+"""
+
+SUMMARIZATION_BATCH_CACHE_PREFIX: str = "batch:"
+"""Prefix added to the prompt when caching the summary of a single batch.
+
+Keeps per-batch entries in chat_summarization_cache apart from the cached
+result of a whole summarization run over the same message range.
+"""
+
 # Weather conversion
 HPA_TO_MMHG: float = 0.75006157584567
 """Conversion coefficient from hectopascals (hPa) to millimeters of mercury (mmHg).
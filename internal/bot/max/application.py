@@ -7,11 +7,12 @@ import logging
 import random
 import sys
 from collections.abc import MutableSet
-from typing import Optional
+from typing import Any, Dict, Optional
 
 import lib.max_bot as libMax
 import lib.max_bot.models as maxModels
 from internal.bot.common.handlers.manager import HandlersManager
+from internal.bot.common.webhook import createWebhookServer, getWebhookConfig, runUntilStopped
 from internal.bot.models import BotProvider, EnsuredMessage
 from internal.bot.models.ensured_message import ChatType, MessageRecipient, MessageSender
 from internal.config.manager import ConfigManager
@@ -22,6 +23,7 @@ from lib import utils
 
 # from lib import utils
 from lib.rate_limiter import RateLimiterManager
+from lib.webhook import WebhookServer
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +49,7 @@ class MaxBotApplication:
         queueService: Queue service for managing delayed tasks
         maxBot: Max bot client instance for API communication
         _tasks: Set of active async tasks managed by the application
-        maxTasks: Maximum number of concurrent tasks allowed (default: 128)
+        maxTasks: Maximum number of updates handled concurrently (default: 128)
     """
 
     def __init__(
@@ -154,6 +156,12 @@ class MaxBotApplication:
 
         logger.info("Starting Gromozeka Max bot, dood!")
 
+        webhookConfig = getWebhookConfig(self.configManager.getBotConfig())
+        if webhookConfig is not None:
+            logger.info("Receiving updates via webhook")
+            runUntilStopped(loop, self._runWebhook(webhookConfig))
+            return
+
         # Start the bot on the shared event loop
         loop.run_until_complete(self._runPolling())
 
@@ -299,6 +307,7 @@ class MaxBotApplication:
                 types=None,
                 timeout=30,
                 errorHandler=self.maxExceptionHandler,
+                maxConcurrency=self.maxTasks,
             )
 
             # TODO: Somehow allow to await it properly
@@ -307,5 +316,71 @@ class MaxBotApplication:
             logger.info("After polling...")
         finally:
             logger.info("Work is done, exiting...")
+            # Wait for already received updates to be handled
+            await self.maxBot.stopPolling()
+            logger.info(f"Update dispatching stats: {utils.jsonDumps(self.maxBot.getPollingStats())}")
+            await self.postStop()
+            await self.maxBot.aclose()
+
+    async def _runWebhook(self, webhookConfig: Dict[str, Any]) -> None:
+        """Run the Max Messenger bot receiving updates via webhook until cancelled.
+
+        Updates accepted by the webhook server are parsed and passed to the
+        same per-chat update dispatcher the polling loop uses, so webhook and
+        polling modes handle updates alike.
+
+        Args:
+            webhookConfig: The ``[bot.webhook]`` config section
+
+        Returns:
+            None
+        """
+        botConfig = self.configManager.getBotConfig()
+        proxyConfig = ProxyService.getInstance().resolveProxy(botConfig, "max-bot")
+        maskedUrl = proxyConfig.getProxyURL(maskPassword=True)
+        if maskedUrl:
+            logger.info("Proxy enabled for Max bot: %s", maskedUrl)
+
+        self.maxBot = libMax.MaxBotClient(self.botToken, proxyConfig=proxyConfig)
+        dispatcher = libMax.UpdateDispatcher(
+            self.maxHandler,
+            self.maxExceptionHandler,
+            maxConcurrency=self.maxTasks,
+        )
+
+        async def dispatchUpdate(data: Dict[str, Any]) -> None:
+            await dispatcher.dispatch(maxModels.parseUpdate(data))
+
+        server: Optional[WebhookServer] = None
+        try:
+            botInfo = await self.maxBot.getMyInfo()
+            logger.debug(botInfo)
+
+            await self.postInit()
+
+            server = createWebhookServer(
+                webhookConfig,
+                self.database,
+                dispatchUpdate,
+                secretHeader="X-Max-Bot-Api-Secret",
+                # Max updates have no ID, the request body hash is used instead
+                dedupPrefix=f"max:{botInfo.user_id}:",
+            )
+            await server.start()
+
+            if webhookConfig.get("register", True):
+                await self.maxBot.setWebhook(webhookConfig["url"], secret=webhookConfig.get("secret") or None)
+                logger.info(f"Webhook registered at {webhookConfig['url']}")
+
+            # Run until cancelled by a stop signal
+            await asyncio.Event().wait()
+        finally:
+            logger.info("Work is done, exiting...")
+            # The webhook stays registered: other instances may still serve it
+            if server is not None:
+                await server.stop()
+            # Wait for already received updates to be handled
+            await dispatcher.join()
+            logger.info(f"Update dispatching stats: {utils.jsonDumps(dispatcher.getStats())}")
             await self.postStop()
             await self.maxBot.aclose()
@@ -41,7 +41,14 @@ from .command_handlers import (
 )
 
 # Ensured Message (already exists)
-from .ensured_message import ChatType, EnsuredMessage, MentionCheckResult, MessageRecipient, MessageSender
+from .ensured_message import (
+    ChatType,
+    EnsuredMessage,
+    MediaAttachmentLookup,
+    MentionCheckResult,
+    MessageRecipient,
+    MessageSender,
+)
 
 # Enums
 from .enums import (
@@ -92,6 +99,7 @@ __all__ = [
     "ChatSettingsDict",
     # Ensured Message
     "EnsuredMessage",
+    "MediaAttachmentLookup",
     "MentionCheckResult",
     "MessageSender",
     "MessageRecipient",
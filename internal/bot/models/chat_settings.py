@@ -309,6 +309,8 @@ class ChatSettingsKey(StrEnum):
     # Prompts for different actions
     SUMMARY_PROMPT = "summary-prompt"
     """System prompt for message summarization."""
+    SUMMARY_REDUCE_PROMPT = "summary-reduce-prompt"
+    """System prompt for merging partial summaries of a long history into one."""
     PARSE_IMAGE_PROMPT = "parse-image-prompt"
     """System prompt for image analysis and parsing."""
     CHAT_PROMPT = "chat-prompt"
@@ -349,6 +351,8 @@ class ChatSettingsKey(StrEnum):
     """Message format for LLM (text, json, smart)."""
     USE_TOOLS = "use-tools"
     """Whether bot can use tools (web, images, memory, etc.)."""
+    LLM_STREAMING = "llm-streaming"
+    """Whether bot shows LLM replies while they are generated (by editing the reply)."""
     PARSE_ATTACHMENTS = "parse-attachments"
     """Whether bot analyzes attachments (images, stickers)."""
     SAVE_ATTACHMENTS = "save-attachments"
@@ -659,6 +663,12 @@ _chatSettingsInfo: Dict[ChatSettingsKey, ChatSettingsInfoValue] = {
         "long": "Промпт по умолчанию для скммаризации сообщений \n" "(можно изменить во время суммаризации)).",
         "page": ChatSettingsPage.LLM_BASE,
     },
+    ChatSettingsKey.SUMMARY_REDUCE_PROMPT: {
+        "type": ChatSettingsType.STRING,
+        "short": "Промпт для объединения частичных суммаризаций",
+        "long": "Промпт, которым частичные суммаризации длинной переписки объединяются в одну итоговую.",
+        "page": ChatSettingsPage.LLM_BASE,
+    },
     ChatSettingsKey.PARSE_IMAGE_PROMPT: {
         "type": ChatSettingsType.STRING,
         "short": "Промпт для анализа изображений",
@@ -803,6 +813,14 @@ _chatSettingsInfo: Dict[ChatSettingsKey, ChatSettingsInfoValue] = {
         ),
         "page": ChatSettingsPage.PAID,
     },
+    ChatSettingsKey.LLM_STREAMING: {
+        "type": ChatSettingsType.BOOL,
+        "short": "Показывать ответ по мере генерации",
+        "long": "Отправлять ответ LLM сразу, как появится начало текста, и дописывать его, "
+        "редактируя сообщение, пока генерация не закончится.\n"
+        "Ответы в формате JSON и ответы с генерацией изображений отправляются целиком.",
+        "page": ChatSettingsPage.EXTENDED,
+    },
     ChatSettingsKey.PARSE_ATTACHMENTS: {
         "type": ChatSettingsType.BOOL,
         "short": "Обрабатывать вложения",
@@ -348,6 +348,101 @@ class MediaContent:
         return f"MediaContent(id={self.id}, content={self.content}, processingInfo={self.processingInfo})"
 
 
+class MediaAttachmentLookup:
+    """Per-request cache of media attachments shared while converting a batch of messages.
+
+    Rebuilding hundreds of stored messages one by one queries the database for
+    every media group and then for every media description. prefetch() loads
+    them with a couple of batch queries instead; attachments missing from the
+    cache are still loaded one by one. Create one lookup per request and pass it
+    to both EnsuredMessage.fromDBChatMessages() and formatForLLM() (or
+    toModelMessage*()), so the whole conversion shares it.
+
+    Attributes:
+        db: Database wrapper for loading attachments
+        attachments: Loaded attachments keyed by media ID
+        groups: Loaded media group attachments keyed by media group ID
+    """
+
+    __slots__ = ("db", "attachments", "groups")
+
+    def __init__(self, db: Database) -> None:
+        """Initialize an empty lookup.
+
+        Args:
+            db: Database wrapper for loading attachments
+        """
+        self.db = db
+        """Database wrapper for loading attachments"""
+        self.attachments: Dict[str, MediaAttachmentDict] = {}
+        """Loaded attachments keyed by media ID"""
+        self.groups: Dict[str, List[MediaAttachmentDict]] = {}
+        """Loaded media group attachments keyed by media group ID"""
+
+    async def prefetch(self, *, mediaIds: Sequence[str] = (), mediaGroupIds: Sequence[str] = ()) -> None:
+        """Load attachments and media groups not cached yet with batch queries.
+
+        Args:
+            mediaIds: Media IDs to load
+            mediaGroupIds: Media group IDs to load (with all their attachments)
+        """
+        missingGroupIds = [mediaGroupId for mediaGroupId in mediaGroupIds if mediaGroupId not in self.groups]
+        if missingGroupIds:
+            for mediaGroupId, group in (
+                await self.db.mediaAttachments.getMediaAttachmentsByGroupIds(missingGroupIds)
+            ).items():
+                self._setGroup(mediaGroupId, group)
+
+        missingIds = [mediaId for mediaId in mediaIds if mediaId not in self.attachments]
+        if missingIds:
+            self.attachments.update(await self.db.mediaAttachments.getMediaAttachmentsByIds(missingIds))
+
+    async def prefetchMessages(self, dataList: Sequence[ChatMessageDict], forceGetAllMedia: bool = False) -> None:
+        """Load the media of database chat messages with batch queries.
+
+        Loads what EnsuredMessage.fromDBChatMessage() and formatForLLM() need
+        for these messages.
+
+        Args:
+            dataList: Chat message data from the database
+            forceGetAllMedia: Whether all media group attachments will be retrieved (default: False)
+        """
+        await self.prefetch(
+            mediaIds=[data["media_id"] for data in dataList if data["media_id"]],
+            mediaGroupIds=[
+                data["media_group_id"]
+                for data in dataList
+                if data["media_group_id"] is not None and (not data["media_id"] or forceGetAllMedia)
+            ],
+        )
+
+    async def getGroup(self, mediaGroupId: str) -> List[MediaAttachmentDict]:
+        """Get the attachments of a media group, loading it if not cached.
+
+        Args:
+            mediaGroupId: Media group ID
+
+        Returns:
+            List of the media group attachments
+        """
+        group = self.groups.get(mediaGroupId)
+        if group is None:
+            group = await self.db.mediaAttachments.getMediaAttachmentsByGroupId(mediaGroupId)
+            self._setGroup(mediaGroupId, group)
+        return group
+
+    def _setGroup(self, mediaGroupId: str, group: List[MediaAttachmentDict]) -> None:
+        """Cache a media group together with its attachments.
+
+        Args:
+            mediaGroupId: Media group ID
+            group: Attachments of the media group
+        """
+        self.groups[mediaGroupId] = group
+        for media in group:
+            self.attachments[media["file_unique_id"]] = media
+
+
 class EnsuredMessage:
     """
     Wrapper class that ensures presence of essential Telegram message attributes.
@@ -818,7 +913,12 @@ class EnsuredMessage:
 
     @classmethod
     async def fromDBChatMessage(
-        cls, data: ChatMessageDict, db: Database, forceGetAllMedia: bool = False
+        cls,
+        data: ChatMessageDict,
+        db: Database,
+        forceGetAllMedia: bool = False,
+        *,
+        mediaLookup: Optional[MediaAttachmentLookup] = None,
     ) -> "EnsuredMessage":
         """
         Create an EnsuredMessage from a database ChatMessageDict.
@@ -831,6 +931,7 @@ class EnsuredMessage:
             data: Dictionary containing chat message data from the database
             db: Database wrapper instance for accessing media attachments
             forceGetAllMedia: Whether to force retrieval of all media attachments (default: False)
+            mediaLookup: Cache of media attachments shared by the request (default: None)
 
         Returns:
             A fully initialized EnsuredMessage instance populated with database data
@@ -881,7 +982,11 @@ class EnsuredMessage:
         ensuredMessage.mediaId = data["media_id"]
 
         if data["media_group_id"] is not None and (not data["media_id"] or forceGetAllMedia):
-            for media in await db.mediaAttachments.getMediaAttachmentsByGroupId(data["media_group_id"]):
+            if mediaLookup is not None:
+                mediaGroup = await mediaLookup.getGroup(data["media_group_id"])
+            else:
+                mediaGroup = await db.mediaAttachments.getMediaAttachmentsByGroupId(data["media_group_id"])
+            for media in mediaGroup:
                 ensuredMessage.addMedia(
                     mediaId=media["file_unique_id"],
                     mediaContent=media["description"],
@@ -898,6 +1003,39 @@ class EnsuredMessage:
         # logger.debug(f"Ensured Message from DB Chat: {ensuredMessage}")
         return ensuredMessage
 
+    @classmethod
+    async def fromDBChatMessages(
+        cls,
+        dataList: Sequence[ChatMessageDict],
+        db: Database,
+        forceGetAllMedia: bool = False,
+        *,
+        mediaLookup: Optional[MediaAttachmentLookup] = None,
+    ) -> List["EnsuredMessage"]:
+        """
+        Create EnsuredMessages from a list of database ChatMessageDicts.
+
+        Batch version of fromDBChatMessage(): media groups and attachments of
+        all messages are loaded with a couple of batch queries before the
+        conversion instead of one query per message.
+
+        Args:
+            dataList: Chat message data from the database
+            db: Database wrapper instance for accessing media attachments
+            forceGetAllMedia: Whether to force retrieval of all media attachments (default: False)
+            mediaLookup: Cache of media attachments shared by the request. Pass the
+                same lookup to formatForLLM() to format the messages without
+                further queries (default: None, a new lookup is used)
+
+        Returns:
+            List of EnsuredMessage instances in the order of dataList
+        """
+        if mediaLookup is None:
+            mediaLookup = MediaAttachmentLookup(db)
+
+        await mediaLookup.prefetchMessages(dataList, forceGetAllMedia)
+        return [await cls.fromDBChatMessage(data, db, forceGetAllMedia, mediaLookup=mediaLookup) for data in dataList]
+
     def setUserData(self, userData: Dict[str, Any]) -> None:
         """
         Set additional user data for this message.
@@ -984,7 +1122,7 @@ class EnsuredMessage:
         if setMediaId:
             self.mediaId = mediaProcessingInfo.id
 
-    async def updateMediaContent(self, db: Database) -> None:
+    async def updateMediaContent(self, db: Database, *, mediaLookup: Optional[MediaAttachmentLookup] = None) -> None:
         """
         Update the media content description from the database.
 
@@ -994,19 +1132,24 @@ class EnsuredMessage:
 
         Args:
             db: Database wrapper instance for accessing media attachments
+            mediaLookup: Cache of media attachments shared by the request (default: None)
         """
+        if mediaLookup is None:
+            # The primary media is usually in mediaList too, load it once
+            mediaLookup = MediaAttachmentLookup(db)
+
         for media in self.mediaList:
             if media.processingInfo:
                 await media.processingInfo.awaitResult()
 
-            mediaAttachment = await self.__class__._awaitMedia(db, media.id)
+            mediaAttachment = await self.__class__._awaitMedia(db, media.id, mediaLookup)
             if mediaAttachment and mediaAttachment.get("description", None) is not None:
                 media.content = mediaAttachment["description"]
 
         if self.mediaId is None:
             return
 
-        mediaAttachment = await self.__class__._awaitMedia(db, self.mediaId)
+        mediaAttachment = await self.__class__._awaitMedia(db, self.mediaId, mediaLookup)
         if mediaAttachment and mediaAttachment.get("description", None) is not None:
             self.mediaContent = mediaAttachment["description"]
             self.mediaPrompt = mediaAttachment["prompt"]
@@ -1022,7 +1165,9 @@ class EnsuredMessage:
         self.metadata["messagePrefix"] = messagePrefix
 
     @classmethod
-    async def _awaitMedia(cls, db: Database, mediaId: str) -> Optional[MediaAttachmentDict]:
+    async def _awaitMedia(
+        cls, db: Database, mediaId: str, mediaLookup: Optional[MediaAttachmentLookup] = None
+    ) -> Optional[MediaAttachmentDict]:
         """
         Wait for media processing to complete and retrieve media attachment.
 
@@ -1032,17 +1177,26 @@ class EnsuredMessage:
         Args:
             db: Database wrapper instance for accessing media attachments
             mediaId: Unique identifier of the media attachment to retrieve
+            mediaLookup: Cache of media attachments, checked before the first
+                query (default: None)
 
         Returns:
             MediaAttachmentDict if found and processed, None if not found or timed out
         """
         startTime = time.time()
         mediaAttachment: Optional[MediaAttachmentDict] = None
+        cachedAttachment = mediaLookup.attachments.get(mediaId) if mediaLookup is not None else None
         while time.time() - startTime < MAX_MEDIA_AWAIT_SECS:
-            mediaAttachment = await db.mediaAttachments.getMediaAttachment(mediaId)
-            if mediaAttachment is None:
-                logger.error(f"Media#{mediaId} not found")
-                return None
+            if cachedAttachment is not None:
+                # Only the first check may use the cache, pending media is polled from the database
+                mediaAttachment, cachedAttachment = cachedAttachment, None
+            else:
+                mediaAttachment = await db.mediaAttachments.getMediaAttachment(mediaId)
+                if mediaAttachment is None:
+                    logger.error(f"Media#{mediaId} not found")
+                    return None
+                if mediaLookup is not None:
+                    mediaLookup.attachments[mediaId] = mediaAttachment
 
             logger.debug(
                 f"Media#{mediaId} awaiting for proper status (current: "
@@ -1082,6 +1236,8 @@ class EnsuredMessage:
         stripAtsign: bool = False,
         outputFormat: OutputFormat = OutputFormat.MARKDOWN,
         useSingleMedia: bool = True,
+        *,
+        mediaLookup: Optional[MediaAttachmentLookup] = None,
     ) -> str:
         """
         Format the message for LLM consumption.
@@ -1097,6 +1253,7 @@ class EnsuredMessage:
             stripAtsign: Whether to strip @ from usernames, default is False
             outputFormat: Output format for message text parsing (default: MARKDOWN)
             useSingleMedia: Whether to use single media content or media list (default: True)
+            mediaLookup: Cache of media attachments shared by the request (default: None)
 
         Returns:
             Formatted string representation of the message for LLM processing
@@ -1104,7 +1261,7 @@ class EnsuredMessage:
         Raises:
             ValueError: If an invalid format is specified.
         """
-        await self.updateMediaContent(db)
+        await self.updateMediaContent(db, mediaLookup=mediaLookup)
         mediaContent = self.mediaContent
         if not useSingleMedia or self.mediaContent is None:
             mediaContent = [v.content for v in self.mediaList if v.content]
@@ -1158,6 +1315,8 @@ class EnsuredMessage:
         role: str = "user",
         outputFormat: OutputFormat = OutputFormat.MARKDOWN,
         useSingleMedia: bool = True,
+        *,
+        mediaLookup: Optional[MediaAttachmentLookup] = None,
     ) -> List[ModelMessage]:
         """
         Convert the message to a list of ModelMessage objects including tools history.
@@ -1173,6 +1332,7 @@ class EnsuredMessage:
             role: The role for the model message (e.g., "user", "assistant"), default is "user"
             outputFormat: Output format for message text parsing (default: MARKDOWN)
             useSingleMedia: Whether to use single media content or media list (default: True)
+            mediaLookup: Cache of media attachments shared by the request (default: None)
 
         Returns:
             List of ModelMessage objects including system context, tools history, and the main message
@@ -1197,6 +1357,7 @@ class EnsuredMessage:
                 role=role,
                 outputFormat=outputFormat,
                 useSingleMedia=useSingleMedia,
+                mediaLookup=mediaLookup,
             )
         )
         return ret
@@ -1210,6 +1371,8 @@ class EnsuredMessage:
         role: str = "user",
         outputFormat: OutputFormat = OutputFormat.MARKDOWN,
         useSingleMedia: bool = True,
+        *,
+        mediaLookup: Optional[MediaAttachmentLookup] = None,
     ) -> ModelMessage:
         """
         Convert the message to a ModelMessage for AI model interactions.
@@ -1227,6 +1390,7 @@ class EnsuredMessage:
             role: The role for the model message (e.g., "user", "assistant"), default is "user"
             outputFormat: Output format for message text parsing (default: MARKDOWN)
             useSingleMedia: Whether to use single media content or media list (default: True)
+            mediaLookup: Cache of media attachments shared by the request (default: None)
 
         Returns:
             ModelMessage object ready for AI model consumption.
@@ -1248,6 +1412,7 @@ class EnsuredMessage:
                 stripAtsign=stripAtsign,
                 outputFormat=outputFormat,
                 useSingleMedia=useSingleMedia,
+                mediaLookup=mediaLookup,
             ),
         )
 
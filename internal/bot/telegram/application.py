@@ -6,7 +6,7 @@ import asyncio
 import logging
 import random
 import sys
-from typing import Awaitable, List, Optional
+from typing import Any, Awaitable, Dict, List, Optional
 
 import telegram
 from telegram.ext import (
@@ -20,6 +20,7 @@ from telegram.ext import (
 from telegram.request import HTTPXRequest
 
 from internal.bot.common.handlers import HandlersManager
+from internal.bot.common.webhook import createWebhookServer, getWebhookConfig, runUntilStopped
 from internal.bot.models import BotProvider, CommandPermission, EnsuredMessage, MessageSender
 from internal.bot.models.ensured_message import MessageRecipient
 from internal.config.manager import ConfigManager
@@ -29,6 +30,7 @@ from internal.services.proxy import ProxyService
 from internal.services.queue_service import QueueService
 from lib import utils
 from lib.proxy import ProxyType
+from lib.webhook import WebhookServer
 
 logger = logging.getLogger(__name__)
 
@@ -324,12 +326,71 @@ class TelegramBotApplication:
         logger.info("Step 1: Stopping HandlerManager...")
         await self.handlerManager.shutdown()
 
+    async def _runWebhook(self, webhookConfig: Dict[str, Any]) -> None:
+        """Run the bot receiving updates via webhook until cancelled, dood!
+
+        Mirrors the lifecycle of PTB's run_polling(): initialize, post_init,
+        start, then stop, post_stop and shutdown. Updates accepted by the
+        webhook server are processed one by one like the polling updates, so a
+        busy bot fills the webhook queue instead of buffering without limit.
+
+        Args:
+            webhookConfig: The ``[bot.webhook]`` config section
+        """
+        application = self.application
+        if application is None:
+            raise RuntimeError("Application not initialized")
+        bot = application.bot
+
+        async def processUpdate(data: Dict[str, Any]) -> None:
+            update = telegram.Update.de_json(data, bot)
+            await application.process_update(update)
+
+        server: Optional[WebhookServer] = None
+        await application.initialize()
+        try:
+            if application.post_init is not None:
+                await application.post_init(application)
+            await application.start()
+
+            server = createWebhookServer(
+                webhookConfig,
+                self.database,
+                processUpdate,
+                secretHeader="X-Telegram-Bot-Api-Secret-Token",
+                dedupPrefix=f"telegram:{bot.id}:",
+                getUpdateId=lambda data: str(data["update_id"]) if "update_id" in data else None,
+            )
+            await server.start()
+
+            if webhookConfig.get("register", True):
+                await bot.set_webhook(
+                    url=webhookConfig["url"],
+                    secret_token=webhookConfig.get("secret") or None,
+                    allowed_updates=telegram.Update.ALL_TYPES,
+                )
+                logger.info(f"Webhook registered at {webhookConfig['url']}")
+
+            # Run until cancelled by a stop signal
+            await asyncio.Event().wait()
+        finally:
+            logger.info("Work is done, exiting...")
+            # The webhook stays registered: other instances may still serve it
+            if server is not None:
+                await server.stop()
+            if application.running:
+                await application.stop()
+            if application.post_stop is not None:
+                await application.post_stop(application)
+            await application.shutdown()
+
     def run(self, loop: asyncio.AbstractEventLoop):
         """Start the Telegram bot application.
 
         Args:
-            loop: The shared asyncio event loop. Not used directly here;
-                PTB reuses the loop set by main() via asyncio.set_event_loop().
+            loop: The shared asyncio event loop. In polling mode it's not used
+                directly: PTB reuses the loop set by main() via
+                asyncio.set_event_loop().
         """
         if self.botToken in ["", "YOUR_BOT_TOKEN_HERE"]:
             logger.error("Please set your bot token in config.toml!")
@@ -396,6 +457,12 @@ class TelegramBotApplication:
 
         logger.info("Starting Gromozeka Telegram bot, dood!")
 
+        webhookConfig = getWebhookConfig(botConfig)
+        if webhookConfig is not None:
+            logger.info("Receiving updates via webhook")
+            runUntilStopped(loop, self._runWebhook(webhookConfig))
+            return
+
         # PTB's run_polling() calls asyncio.get_event_loop() internally,
         # which returns the loop main() set. close_loop=False so main.py's
         # finally block retains ownership of the loop lifecycle.
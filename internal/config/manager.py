@@ -505,6 +505,22 @@ class ConfigManager:
         """
         return self.get("stats", {})
 
+    def getHttpClientConfig(self) -> Dict[str, Any]:
+        """Get shared HTTP client pool configuration.
+
+        Returns:
+            A dictionary containing the [http-client] settings consumed by
+            HttpClientRegistry.configure() (http2, timeouts and pool limits).
+            Returns an empty dict if not configured.
+
+        Example:
+            >>> config_manager = ConfigManager()
+            >>> http_client_config = config_manager.getHttpClientConfig()
+            >>> print(http_client_config.get("max-connections-per-host"))
+            10
+        """
+        return self.get("http-client", {})
+
     def getProxyConfig(self) -> ProxyConfigDict:
         """Get global proxy configuration.
 
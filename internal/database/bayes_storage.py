@@ -106,6 +106,10 @@ class DatabaseBayesStorage(BayesStorageInterface):
 
         Returns:
             ClassStats object containing messageCount and tokenCount
+
+        Raises:
+            Exception: If the query fails (logged and re-raised, so cached
+                models are never built from a failed read)
         """
         try:
             sqlProvider = await self.db.manager.getProvider(dataSource=self.dataSource, readonly=True)
@@ -118,12 +122,13 @@ class DatabaseBayesStorage(BayesStorageInterface):
                 """,
                 {"is_spam": is_spam, "chat_id": chat_id},
             )
-            if row:
-                return ClassStats(message_count=row["message_count"], token_count=row["token_count"])
-            return ClassStats(message_count=0, token_count=0)
         except Exception as e:
             logger.error(f"Failed to get class stats for is_spam={is_spam}: {e}, dood!")
-            return ClassStats(message_count=0, token_count=0)
+            raise
+
+        if row:
+            return ClassStats(message_count=row["message_count"], token_count=row["token_count"])
+        return ClassStats(message_count=0, token_count=0)
 
     async def updateTokenStats(
         self,
@@ -236,6 +241,43 @@ class DatabaseBayesStorage(BayesStorageInterface):
             logger.error(f"Failed to get all tokens: {e}, dood!")
             return []
 
+    async def getAllTokenStats(self, chatId: Optional[int] = None) -> Dict[str, TokenStats]:
+        """
+        Get statistics for every token of the vocabulary in one query.
+
+        Args:
+            chatId: Optional chat ID for chat-specific statistics, None for global
+
+        Returns:
+            Dictionary mapping token strings to TokenStats objects
+
+        Raises:
+            Exception: If the query fails (logged and re-raised, so cached
+                models are never built from a failed read)
+        """
+        try:
+            sqlProvider = await self.db.manager.getProvider(chatId=chatId, dataSource=self.dataSource, readonly=True)
+            rows = await sqlProvider.executeFetchAll(
+                """
+                SELECT token, spam_count, ham_count, total_count FROM bayes_tokens
+                WHERE ((:chat_id IS NULL AND chat_id IS NULL) OR chat_id = :chat_id)
+                """,
+                {"chat_id": chatId},
+            )
+        except Exception as e:
+            logger.error(f"Failed to get all token stats: {e}, dood!")
+            raise
+
+        return {
+            row["token"]: TokenStats(
+                token=row["token"],
+                spamCount=row["spam_count"],
+                hamCount=row["ham_count"],
+                totalCount=row["total_count"],
+            )
+            for row in rows
+        }
+
     async def getVocabularySize(self, chatId: Optional[int] = None) -> int:
         """
         Get the size of the vocabulary (number of unique tokens).
@@ -348,6 +390,10 @@ class DatabaseBayesStorage(BayesStorageInterface):
         """
         Update multiple tokens in a single batch operation for performance.
 
+        Updates are merged per token in memory (spam and ham increments of the
+        same token become one row) and written with a single multi-row upsert
+        in one transaction.
+
         Args:
             tokenUpdates: List of dictionaries, each containing 'token', 'is_spam',
                          and 'increment' keys
@@ -360,36 +406,40 @@ class DatabaseBayesStorage(BayesStorageInterface):
             return True
 
         try:
-            sqlProvider = await self.db.manager.getProvider(chatId=chatId, dataSource=self.dataSource, readonly=False)
+            # token -> [spam increment, ham increment]
+            counts: Dict[str, List[int]] = {}
+            for update in tokenUpdates:
+                counts.setdefault(update["token"], [0, 0])[0 if update["is_spam"] else 1] += update["increment"]
+
             # Generate timestamp once for all batch items
             currentTimestamp = dbUtils.getCurrentTimestamp()
-            for update in tokenUpdates:
-                token = update["token"]
-                isSpam = update["is_spam"]
-                increment = update["increment"]
-
-                # Use the same logic as update_token_stats but in batch
-                await sqlProvider.upsert(
-                    table="bayes_tokens",
-                    values={
-                        "token": token,
-                        "chat_id": chatId,
-                        "spam_count": increment if isSpam else 0,
-                        "ham_count": increment if not isSpam else 0,
-                        "total_count": increment,
-                        "created_at": currentTimestamp,
-                        "updated_at": currentTimestamp,
-                    },
-                    conflictColumns=["token", "chat_id"],
-                    updateExpressions={
-                        "spam_count": "spam_count + :spam_count",
-                        "ham_count": "ham_count + :ham_count",
-                        "total_count": "total_count + :total_count",
-                        "updated_at": ExcludedValue(),
-                    },
-                )
+            rows = [
+                {
+                    "token": token,
+                    "chat_id": chatId,
+                    "spam_count": spamCount,
+                    "ham_count": hamCount,
+                    "total_count": spamCount + hamCount,
+                    "created_at": currentTimestamp,
+                    "updated_at": currentTimestamp,
+                }
+                for token, (spamCount, hamCount) in counts.items()
+            ]
+
+            sqlProvider = await self.db.manager.getProvider(chatId=chatId, dataSource=self.dataSource, readonly=False)
+            await sqlProvider.upsertMany(
+                table="bayes_tokens",
+                rows=rows,
+                conflictColumns=["token", "chat_id"],
+                updateExpressions={
+                    "spam_count": "spam_count + :spam_count",
+                    "ham_count": "ham_count + :ham_count",
+                    "total_count": "total_count + :total_count",
+                    "updated_at": ExcludedValue(),
+                },
+            )
 
-            logger.debug(f"Batch updated {len(tokenUpdates)} tokens, dood!")
+            logger.debug(f"Batch updated {len(rows)} tokens, dood!")
             return True
         except Exception as e:
             logger.error(f"Failed to batch update tokens: {e}, dood!")
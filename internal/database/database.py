@@ -34,6 +34,7 @@ import logging
 import types
 from typing import Optional
 
+from .embeddings_index import EmbeddingsIndex
 from .manager import DatabaseManager, DatabaseManagerConfig
 from .migrations import MigrationManager
 from .providers import BaseSQLProvider
@@ -72,6 +73,8 @@ class Database:
 
     Attributes:
         manager: Database manager handling connections and multi-source operations.
+        embeddingsIndex: Resident embeddings index shared by ``chatEmbeddings``
+            (writes) and ``chatSearch`` (semantic queries).
         common: Repository for common database functions and utilities.
         chatMessages: Repository for chat message storage and retrieval.
         chatEmbeddings: Repository for message embeddings CRUD and the
@@ -105,6 +108,7 @@ class Database:
 
     __slots__ = (
         "manager",
+        "embeddingsIndex",
         "common",
         "chatMessages",
         "chatEmbeddings",
@@ -125,6 +129,9 @@ class Database:
     manager: DatabaseManager
     """Database manager handling connections and multi-source operations."""
 
+    embeddingsIndex: EmbeddingsIndex
+    """Resident embeddings index shared by ``chatEmbeddings`` (writes) and ``chatSearch`` (semantic queries)."""
+
     common: CommonFunctionsRepository
     """Repository for common database functions and utilities."""
 
@@ -192,13 +199,18 @@ class Database:
         """
         logger.info("Initializing database")
         self.manager = DatabaseManager(config)
+        self.embeddingsIndex = EmbeddingsIndex(config.get("embeddingsIndex"))
 
         # Repositories with queries to DB
         self.common = CommonFunctionsRepository(self.manager)
-        self.chatMessages = ChatMessagesRepository(self.manager)
-        self.chatEmbeddings = ChatEmbeddingsRepository(self.manager)
-        self.chatSearch = ChatSearchRepository(self.manager)
-        self.chatUsers = ChatUsersRepository(self.manager)
+        self.chatMessages = ChatMessagesRepository(self.manager, ingestionConfig=config.get("messageIngestion"))
+        self.chatEmbeddings = ChatEmbeddingsRepository(
+            self.manager, embeddingsIndex=self.embeddingsIndex, ingestion=self.chatMessages.ingestion
+        )
+        self.chatSearch = ChatSearchRepository(
+            self.manager, embeddingsIndex=self.embeddingsIndex, ingestion=self.chatMessages.ingestion
+        )
+        self.chatUsers = ChatUsersRepository(self.manager, ingestion=self.chatMessages.ingestion)
         self.chatSettings = ChatSettingsRepository(self.manager)
         self.chatInfo = ChatInfoRepository(self.manager)
         self.chatSummarization = ChatSummarizationRepository(self.manager)
@@ -272,6 +284,22 @@ class Database:
         await self._migrationManager.migrate(sqlProvider=sqlProvider)
         logger.info(f"Database initialization complete for provider '{providerName}', dood!")
 
+    async def close(self) -> None:
+        """Commit queued chat messages and close all database connections.
+
+        Should be called during application shutdown instead of
+        ``manager.closeAll()`` so messages waiting for a group commit are
+        not lost.
+
+        Returns:
+            None
+        """
+        try:
+            await self.chatMessages.ingestion.aclose()
+        except Exception as e:
+            logger.error(f"Error flushing queued chat messages: {e}")
+        await self.manager.closeAll()
+
     async def __aenter__(self) -> "Database":
         """Enter the async context manager.
 
@@ -297,8 +325,9 @@ class Database:
     ) -> None:
         """Exit the async context manager and cleanup all database connections.
 
-        This method is called when exiting the async context manager. It closes all
-        database connections managed by the DatabaseManager, ensuring proper resource
+        This method is called when exiting the async context manager. It commits
+        queued chat messages and closes all database connections managed by the
+        DatabaseManager (see :meth:`close`), ensuring proper resource
         cleanup. If an exception occurred during the context, it logs the error and
         re-raises the exception.
 
@@ -315,7 +344,7 @@ class Database:
             This method automatically closes all database connections, so explicit
             cleanup is not required when using the async context manager.
         """
-        await self.manager.closeAll()
+        await self.close()
         if exc_type is not None:
             assert exc is not None
             assert tb is not None
@@ -0,0 +1,659 @@
+"""Resident in-process vector index for chat message embeddings.
+
+This module provides :class:`EmbeddingsIndex`, a process-wide store of
+per-``(chatId, model)`` embedding matrices used by
+:class:`ChatSearchRepository` when the provider has no native vector
+search (no sqlite-vec). Without the index, every semantic query reloads
+every ``message_embeddings`` BLOB of the chat, decodes it into a Python
+``list`` and normalises a freshly built matrix before a single matmul.
+
+Each :class:`EmbeddingsIndexEntry` keeps:
+
+- a contiguous, pre-normalised ``float32`` matrix (rows are grown
+  geometrically, deletes swap the last row into the freed slot so the
+  live rows stay contiguous),
+- a parallel ``float64`` array of message timestamps (used to honour the
+  ``maxMessages`` cap without going back to the database),
+- an optional IVF (inverted file) coarse quantiser for approximate
+  search on large chats.
+
+Entries are loaded lazily on the first query, kept current by the write
+path in :class:`ChatEmbeddingsRepository` (``saveMessageEmbedding``,
+``deleteObsoleteModelEmbeddings``, ``deleteChatEmbeddings``) and evicted
+in LRU order once the configured memory budget is exceeded.
+
+``message_embeddings`` stays the authoritative store: the index only
+caches vectors, every hit set is still resolved against ``chat_messages``
+by the repository, so rows deleted behind the index's back simply drop
+out of the results.
+"""
+
+import asyncio
+import datetime
+import logging
+import math
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Dict, List, Optional, Tuple, TypedDict
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MEMORY_MB: int = 256
+"""Default memory budget (in MiB) shared by all resident index entries."""
+
+DEFAULT_IVF_MIN_ROWS: int = 20000
+"""Default row count from which an entry builds its IVF quantiser (approximate mode only)."""
+
+DEFAULT_IVF_PROBES: int = 8
+"""Default number of IVF lists scanned per query (approximate mode only)."""
+
+_IVF_TRAIN_ITERATIONS: int = 8
+"""Number of k-means iterations used when (re)training the IVF centroids."""
+
+_IVF_TRAIN_SAMPLES_PER_LIST: int = 32
+"""Number of rows sampled per IVF list to train the centroids."""
+
+_INITIAL_CAPACITY: int = 64
+"""Initial row capacity of a freshly created entry."""
+
+_PER_ROW_OVERHEAD_BYTES: int = 96
+"""Rough per-row Python overhead (message ID string + dict slot) for memory accounting."""
+
+
+class EmbeddingsIndexConfig(TypedDict, total=False):
+    """Configuration of the resident embeddings index (``[database.embeddingsIndex]``)."""
+
+    enabled: bool
+    """Whether the index is used at all. Defaults to ``True``."""
+    maxMemoryMb: int
+    """Memory budget for all resident entries, in MiB."""
+    approximate: bool
+    """Enable the IVF approximate mode for large entries. Defaults to ``False`` (exact search)."""
+    ivfMinRows: int
+    """Row count from which an entry builds its IVF quantiser."""
+    ivfProbes: int
+    """Number of IVF lists scanned per query."""
+
+
+IndexRow = Tuple[str, bytes, Optional[float]]
+"""One row produced by an index loader: ``(messageId, float32 BLOB, timestamp or None)``."""
+
+IndexLoader = Callable[[], Awaitable[Sequence[IndexRow]]]
+"""Async callable returning all rows of one ``(chatId, model)`` pair."""
+
+
+def toTimestamp(value: Optional[datetime.datetime | str]) -> float:
+    """Convert a message date into a POSIX timestamp for the index.
+
+    Args:
+        value: ``datetime`` or ISO-8601 string. Naive values are treated
+            as UTC (the database stores dates in UTC).
+
+    Returns:
+        POSIX timestamp, or the current time when ``value`` is ``None``
+        or cannot be parsed.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            value = None
+    if value is None:
+        return datetime.datetime.now(datetime.timezone.utc).timestamp()
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return value.timestamp()
+
+
+class EmbeddingsIndexEntry:
+    """Resident embedding matrix for a single ``(chatId, model)`` pair.
+
+    Attributes:
+        chatId: Chat identifier.
+        model: Embedding model name.
+        dimensions: Vector dimensionality shared by every row.
+        count: Number of live rows (rows ``[0, count)`` of ``matrix``).
+        matrix: Pre-normalised ``float32`` matrix of shape ``(capacity, dimensions)``.
+        timestamps: Message timestamps aligned with ``matrix`` rows.
+        messageIds: Message IDs (``MessageId.asStr()``) aligned with ``matrix`` rows.
+    """
+
+    __slots__ = (
+        "chatId",
+        "model",
+        "dimensions",
+        "count",
+        "matrix",
+        "timestamps",
+        "messageIds",
+        "_rowByMessageId",
+        "_centroids",
+        "_assignments",
+        "_trainedAtCount",
+    )
+
+    def __init__(self, chatId: int, model: str, dimensions: int, *, capacity: int = _INITIAL_CAPACITY) -> None:
+        """Create an empty entry.
+
+        Args:
+            chatId: Chat identifier.
+            model: Embedding model name.
+            dimensions: Vector dimensionality.
+            capacity: Initial row capacity.
+        """
+        self.chatId: int = chatId
+        self.model: str = model
+        self.dimensions: int = dimensions
+        self.count: int = 0
+        capacity = max(int(capacity), 1)
+        self.matrix: np.ndarray = np.zeros((capacity, dimensions), dtype=np.float32)
+        self.timestamps: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self.messageIds: List[str] = []
+        self._rowByMessageId: Dict[str, int] = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments: np.ndarray = np.zeros(capacity, dtype=np.int32)
+        self._trainedAtCount: int = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint of the entry, in bytes."""
+        total = self.matrix.nbytes + self.timestamps.nbytes + self._assignments.nbytes
+        if self._centroids is not None:
+            total += self._centroids.nbytes
+        return total + len(self.messageIds) * _PER_ROW_OVERHEAD_BYTES
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, messageId: str) -> bool:
+        return messageId in self._rowByMessageId
+
+    def _ensureCapacity(self, needed: int) -> None:
+        """Grow the backing arrays geometrically so that ``needed`` rows fit."""
+        capacity = self.matrix.shape[0]
+        if needed <= capacity:
+            return
+        newCapacity = max(needed, capacity + max(_INITIAL_CAPACITY, capacity // 4))
+        matrix = np.zeros((newCapacity, self.dimensions), dtype=np.float32)
+        matrix[: self.count] = self.matrix[: self.count]
+        timestamps = np.zeros(newCapacity, dtype=np.float64)
+        timestamps[: self.count] = self.timestamps[: self.count]
+        assignments = np.zeros(newCapacity, dtype=np.int32)
+        assignments[: self.count] = self._assignments[: self.count]
+        self.matrix, self.timestamps, self._assignments = matrix, timestamps, assignments
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        """Return L2-normalised rows; zero vectors stay zero."""
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0.0] = 1.0
+        return vectors / norms
+
+    def upsert(self, messageId: str, vector: np.ndarray, timestamp: float) -> None:
+        """Insert or replace the vector of ``messageId``.
+
+        Args:
+            messageId: Message ID (``MessageId.asStr()``).
+            vector: Raw (not normalised) ``float32`` vector of ``dimensions`` length.
+            timestamp: Message POSIX timestamp.
+
+        Raises:
+            ValueError: If the vector length does not match ``dimensions``.
+        """
+        if vector.shape[-1] != self.dimensions:
+            raise ValueError(f"Vector of {vector.shape[-1]} dimensions does not fit index of {self.dimensions}")
+        row = self._rowByMessageId.get(messageId)
+        if row is None:
+            self._ensureCapacity(self.count + 1)
+            row = self.count
+            self.count += 1
+            self.messageIds.append(messageId)
+            self._rowByMessageId[messageId] = row
+        normalized = self._normalize(vector.astype(np.float32, copy=False))
+        self.matrix[row] = normalized
+        self.timestamps[row] = timestamp
+        if self._centroids is not None:
+            self._assignments[row] = int(np.argmax(self._centroids @ normalized))
+
+    def bulkLoad(self, messageIds: Sequence[str], matrix: np.ndarray, timestamps: np.ndarray) -> None:
+        """Append many rows at once (used by the initial load).
+
+        Args:
+            messageIds: Message IDs aligned with ``matrix`` rows. Must not be
+                present in the entry yet.
+            matrix: Raw ``float32`` matrix of shape ``(n, dimensions)``.
+            timestamps: Timestamps aligned with ``matrix`` rows.
+        """
+        n = len(messageIds)
+        if n == 0:
+            return
+        self._ensureCapacity(self.count + n)
+        start = self.count
+        self.matrix[start : start + n] = self._normalize(matrix)
+        self.timestamps[start : start + n] = timestamps
+        for offset, messageId in enumerate(messageIds):
+            self._rowByMessageId[messageId] = start + offset
+        self.messageIds.extend(messageIds)
+        self.count += n
+
+    def remove(self, messageId: str) -> bool:
+        """Remove ``messageId`` from the entry.
+
+        The last live row is moved into the freed slot so the live rows
+        stay contiguous.
+
+        Returns:
+            ``True`` if the message was present.
+        """
+        row = self._rowByMessageId.pop(messageId, None)
+        if row is None:
+            return False
+        last = self.count - 1
+        if row != last:
+            movedId = self.messageIds[last]
+            self.matrix[row] = self.matrix[last]
+            self.timestamps[row] = self.timestamps[last]
+            self._assignments[row] = self._assignments[last]
+            self.messageIds[row] = movedId
+            self._rowByMessageId[movedId] = row
+        self.messageIds.pop()
+        self.count = last
+        return True
+
+    def _maybeTrainIvf(self, minRows: int) -> None:
+        """(Re)build the IVF quantiser when the entry is large enough.
+
+        Centroids are trained with a few spherical k-means iterations over
+        a random sample and retrained once the entry doubles in size.
+        """
+        if self.count < minRows:
+            self._centroids = None
+            return
+        if self._centroids is not None and self.count < self._trainedAtCount * 2:
+            return
+
+        nLists = max(1, int(math.sqrt(self.count)))
+        rng = np.random.default_rng(self.count)
+        live = self.matrix[: self.count]
+        sampleSize = min(self.count, nLists * _IVF_TRAIN_SAMPLES_PER_LIST)
+        sample = live[rng.choice(self.count, size=sampleSize, replace=False)]
+        centroids = sample[rng.choice(sampleSize, size=nLists, replace=False)].copy()
+        for _ in range(_IVF_TRAIN_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            # Lists that lost all members keep their previous centroid.
+            empty = np.bincount(labels, minlength=nLists) == 0
+            sums[empty] = centroids[empty]
+            centroids = self._normalize(sums)
+
+        # Assign in chunks to bound the temporary (rows x lists) matrix.
+        chunk = 8192
+        for start in range(0, self.count, chunk):
+            stop = min(start + chunk, self.count)
+            self._assignments[start:stop] = np.argmax(live[start:stop] @ centroids.T, axis=1)
+        self._centroids = centroids
+        self._trainedAtCount = self.count
+        logger.debug(f"Trained IVF index with {nLists} lists for chat {self.chatId}, model {self.model}")
+
+    def score(
+        self,
+        queryEmbedding: Sequence[float],
+        *,
+        maxMessages: Optional[int] = None,
+        approximate: bool = False,
+        ivfMinRows: int = DEFAULT_IVF_MIN_ROWS,
+        ivfProbes: int = DEFAULT_IVF_PROBES,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute cosine similarities of the candidate rows against a query.
+
+        Args:
+            queryEmbedding: Query vector (not necessarily normalised).
+            maxMessages: When set, only the ``maxMessages`` most recent rows
+                (by message date) are candidates. Rows sharing the cutoff
+                date may be resolved differently from the SQL
+                ``ORDER BY date DESC, message_id DESC`` tie-break.
+            approximate: Restrict the candidates to the ``ivfProbes`` IVF
+                lists closest to the query when the entry has at least
+                ``ivfMinRows`` rows.
+            ivfMinRows: Row count from which the IVF quantiser is used.
+            ivfProbes: Number of IVF lists scanned.
+
+        Returns:
+            ``(rows, similarities)`` — candidate row indices (into
+            ``messageIds``) and their cosine similarities, unordered.
+
+        Raises:
+            ValueError: If the query dimensionality does not match the entry.
+        """
+        queryVec = np.asarray(queryEmbedding, dtype=np.float32)
+        if queryVec.shape[-1] != self.dimensions:
+            raise ValueError(f"Query of {queryVec.shape[-1]} dimensions does not fit index of {self.dimensions}")
+        queryNorm = float(np.linalg.norm(queryVec))
+        queryVec = queryVec / (queryNorm or 1.0)
+
+        rows: Optional[np.ndarray] = None
+        if maxMessages is not None and maxMessages < self.count:
+            rows = np.argpartition(-self.timestamps[: self.count], maxMessages - 1)[:maxMessages]
+
+        if approximate:
+            self._maybeTrainIvf(ivfMinRows)
+            if self._centroids is not None:
+                probes = min(max(int(ivfProbes), 1), self._centroids.shape[0])
+                listScores = self._centroids @ queryVec
+                probed = np.argpartition(-listScores, probes - 1)[:probes]
+                assignments = self._assignments[: self.count] if rows is None else self._assignments[rows]
+                mask = np.isin(assignments, probed)
+                rows = np.flatnonzero(mask) if rows is None else rows[mask]
+
+        if rows is None:
+            return np.arange(self.count), self.matrix[: self.count] @ queryVec
+        return rows, self.matrix[rows] @ queryVec
+
+
+class _PendingLoad:
+    """Load of one ``(chatId, model)`` entry in flight.
+
+    The loader may or may not see writes made while it runs, so they are
+    buffered here and replayed onto the loaded entry (replaying a write the
+    loader already saw is a no-op).
+
+    Attributes:
+        task: Task running the load, shared by all concurrent readers.
+        writes: ``(model, messageId, vector, timestamp)`` of the embeddings
+            saved in the chat during the load.
+        stale: Set when entries of the chat were dropped during the load;
+            the loaded snapshot is then discarded.
+        requiredDimensions: Dimensionality the entry must have to be kept,
+            set by :meth:`EmbeddingsIndex.dropObsolete` during the load.
+    """
+
+    __slots__ = ("task", "writes", "stale", "requiredDimensions")
+
+    def __init__(self) -> None:
+        self.task: Optional[asyncio.Task] = None
+        self.writes: List[Tuple[str, str, np.ndarray, float]] = []
+        self.stale: bool = False
+        self.requiredDimensions: Optional[int] = None
+
+
+class EmbeddingsIndex:
+    """Process-wide LRU store of :class:`EmbeddingsIndexEntry` objects.
+
+    Shared by :class:`ChatEmbeddingsRepository` (which keeps it current on
+    writes) and :class:`ChatSearchRepository` (which queries it). Entries
+    are keyed by ``(chatId, model)`` and loaded on demand through a loader
+    supplied by the search repository.
+
+    Concurrent readers of an entry that is not resident share one load.
+    Embeddings saved while it runs are replayed onto the loaded entry;
+    dropping entries of the chat meanwhile discards the load result instead
+    of installing a stale snapshot.
+    """
+
+    __slots__ = (
+        "enabled",
+        "maxMemoryBytes",
+        "approximate",
+        "ivfMinRows",
+        "ivfProbes",
+        "_entries",
+        "_loading",
+        "_hits",
+        "_misses",
+        "_evictions",
+    )
+
+    def __init__(self, config: Optional[EmbeddingsIndexConfig] = None) -> None:
+        """Initialise the index.
+
+        Args:
+            config: Optional configuration, see :class:`EmbeddingsIndexConfig`.
+        """
+        config = config or {}
+        self.enabled: bool = bool(config.get("enabled", True))
+        self.maxMemoryBytes: int = int(config.get("maxMemoryMb", DEFAULT_MAX_MEMORY_MB)) * 1024 * 1024
+        self.approximate: bool = bool(config.get("approximate", False))
+        self.ivfMinRows: int = int(config.get("ivfMinRows", DEFAULT_IVF_MIN_ROWS))
+        self.ivfProbes: int = int(config.get("ivfProbes", DEFAULT_IVF_PROBES))
+        self._entries: OrderedDict[Tuple[int, str], EmbeddingsIndexEntry] = OrderedDict()
+        self._loading: Dict[Tuple[int, str], _PendingLoad] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    @property
+    def memoryUsage(self) -> int:
+        """Approximate memory used by all resident entries, in bytes."""
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def getStats(self) -> Dict[str, int]:
+        """Return index counters for diagnostics.
+
+        Returns:
+            Dict with ``entries``, ``rows``, ``memoryBytes``, ``hits``,
+            ``misses`` and ``evictions``.
+        """
+        return {
+            "entries": len(self._entries),
+            "rows": sum(entry.count for entry in self._entries.values()),
+            "memoryBytes": self.memoryUsage,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+        }
+
+    def _pendingLoads(self, chatId: int) -> List[Tuple[str, _PendingLoad]]:
+        """Return ``(model, load)`` of the loads of ``chatId`` in flight."""
+        return [(key[1], pending) for key, pending in self._loading.items() if key[0] == chatId]
+
+    def _evict(self, *, keep: Optional[Tuple[int, str]] = None) -> None:
+        """Evict least recently used entries until the memory budget is met."""
+        usage = self.memoryUsage
+        for key in list(self._entries.keys()):
+            if usage <= self.maxMemoryBytes:
+                break
+            if key == keep:
+                continue
+            entry = self._entries.pop(key)
+            usage -= entry.nbytes
+            self._evictions += 1
+            logger.debug(f"Evicted embeddings index entry for chat {key[0]}, model {key[1]}")
+
+    async def getOrLoad(self, chatId: int, model: str, loader: IndexLoader) -> Optional[EmbeddingsIndexEntry]:
+        """Return the resident entry for ``(chatId, model)``, loading it if needed.
+
+        Args:
+            chatId: Chat identifier.
+            model: Embedding model name.
+            loader: Async callable producing every row of the pair.
+
+        Returns:
+            The entry, or ``None`` when the index is disabled, the chat has
+            no embeddings, the rows do not fit the memory budget, or entries
+            of the chat were dropped during the load (callers then fall back
+            to reading ``message_embeddings`` directly).
+        """
+        if not self.enabled:
+            return None
+        key = (chatId, model)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+        pending = self._loading.get(key)
+        if pending is None:
+            self._misses += 1
+            pending = _PendingLoad()
+            self._loading[key] = pending
+            pending.task = asyncio.create_task(
+                self._load(chatId, model, loader, pending), name=f"embeddings-index-load-{chatId}"
+            )
+            pending.task.add_done_callback(self._onLoadDone)
+        else:
+            self._hits += 1
+        assert pending.task is not None
+        # Shield the shared load from the cancellation of one of its readers
+        return await asyncio.shield(pending.task)
+
+    async def _load(
+        self, chatId: int, model: str, loader: IndexLoader, pending: _PendingLoad
+    ) -> Optional[EmbeddingsIndexEntry]:
+        """Load an entry, replay the writes made meanwhile and install it.
+
+        Args:
+            chatId: Chat identifier.
+            model: Embedding model name.
+            loader: Async callable producing every row of the pair.
+            pending: Load state, collecting the concurrent writes.
+
+        Returns:
+            The installed entry, or ``None`` if it is not cached.
+        """
+        key = (chatId, model)
+        try:
+            rows = await loader()
+            entry = self._buildEntry(chatId, model, rows)
+            if entry is None:
+                return None
+            if pending.stale or (
+                pending.requiredDimensions is not None and entry.dimensions != pending.requiredDimensions
+            ):
+                logger.debug(f"Embeddings index entries of chat {chatId} were dropped while loading, not installing")
+                return None
+            for writeModel, messageId, vector, timestamp in pending.writes:
+                if writeModel != model:
+                    entry.remove(messageId)
+                elif vector.shape[-1] != entry.dimensions:
+                    # Model reconfigured to another dimensionality, as in upsert()
+                    return None
+                else:
+                    entry.upsert(messageId, vector, timestamp)
+            if entry.nbytes > self.maxMemoryBytes:
+                logger.warning(
+                    f"Embeddings for chat {chatId} (model {model}) need {entry.nbytes} bytes, "
+                    f"over the index budget of {self.maxMemoryBytes}; not caching"
+                )
+                return None
+            self._entries[key] = entry
+            self._evict(keep=key)
+            return entry
+        finally:
+            self._loading.pop(key, None)
+
+    @staticmethod
+    def _onLoadDone(task: asyncio.Task) -> None:
+        """Log failed loads, including those whose readers were all cancelled."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Failed to load embeddings index entry: {task.exception()}")
+
+    @staticmethod
+    def _buildEntry(chatId: int, model: str, rows: Sequence[IndexRow]) -> Optional[EmbeddingsIndexEntry]:
+        """Decode loader rows into a new entry, skipping malformed BLOBs."""
+        if not rows:
+            return None
+        dimensions = len(rows[0][1]) // 4
+        if dimensions == 0:
+            return None
+
+        messageIds: List[str] = []
+        blobs: List[bytes] = []
+        timestamps: List[float] = []
+        for messageId, blob, timestamp in rows:
+            if len(blob) != dimensions * 4:
+                logger.warning(
+                    f"Skipping embedding with mismatched dimensions for message {messageId} in chat {chatId}: "
+                    f"expected {dimensions}, got {len(blob) / 4}"
+                )
+                continue
+            messageIds.append(messageId)
+            blobs.append(blob)
+            timestamps.append(timestamp if timestamp is not None else 0.0)
+
+        # One contiguous decode of all BLOBs instead of a list per row.
+        matrix = np.frombuffer(b"".join(blobs), dtype=np.float32).reshape(len(blobs), dimensions)
+        entry = EmbeddingsIndexEntry(chatId, model, dimensions, capacity=len(messageIds))
+        entry.bulkLoad(messageIds, matrix, np.asarray(timestamps, dtype=np.float64))
+        return entry
+
+    def get(self, chatId: int, model: str) -> Optional[EmbeddingsIndexEntry]:
+        """Return the resident entry for ``(chatId, model)`` without loading it."""
+        return self._entries.get((chatId, model))
+
+    def upsert(
+        self,
+        chatId: int,
+        model: str,
+        messageId: str,
+        embedding: Sequence[float],
+        *,
+        date: Optional[datetime.datetime | str] = None,
+    ) -> None:
+        """Reflect a saved embedding in the index.
+
+        ``message_embeddings`` holds one row per message, so the message is
+        also removed from any other resident model of the same chat. When
+        ``(chatId, model)`` is not resident nothing is loaded — the next
+        query picks the row up from the database, a load in flight gets the
+        write replayed.
+
+        Args:
+            chatId: Chat identifier.
+            model: Embedding model name.
+            messageId: Message ID (``MessageId.asStr()``).
+            embedding: Raw embedding vector.
+            date: Message date (``datetime`` or ISO-8601 string).
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        timestamp = toTimestamp(date)
+        for _, pending in self._pendingLoads(chatId):
+            pending.writes.append((model, messageId, vector, timestamp))
+        for (entryChatId, entryModel), entry in list(self._entries.items()):
+            if entryChatId == chatId and entryModel != model:
+                entry.remove(messageId)
+
+        key = (chatId, model)
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        if vector.shape[-1] != entry.dimensions:
+            # Model reconfigured to another dimensionality: drop the stale entry.
+            self._entries.pop(key, None)
+            return
+        entry.upsert(messageId, vector, timestamp)
+        self._evict(keep=key)
+
+    def dropObsolete(self, chatId: int, currentModel: str, currentDimensions: Optional[int] = None) -> None:
+        """Drop entries of ``chatId`` that no longer match the active model.
+
+        Mirrors :meth:`ChatEmbeddingsRepository.deleteObsoleteModelEmbeddings`:
+        entries of other models are dropped, and so is the current model's
+        entry when its dimensionality differs from ``currentDimensions``.
+        """
+        for loadModel, pending in self._pendingLoads(chatId):
+            if loadModel != currentModel:
+                pending.stale = True
+            elif currentDimensions is not None:
+                pending.requiredDimensions = currentDimensions
+        for key, entry in list(self._entries.items()):
+            if key[0] != chatId:
+                continue
+            if key[1] != currentModel or (currentDimensions is not None and entry.dimensions != currentDimensions):
+                del self._entries[key]
+
+    def dropChat(self, chatId: int) -> None:
+        """Drop every entry of ``chatId``."""
+        for _, pending in self._pendingLoads(chatId):
+            pending.stale = True
+        for key in [key for key in self._entries if key[0] == chatId]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every resident entry."""
+        for pending in self._loading.values():
+            pending.stale = True
+        self._entries.clear()
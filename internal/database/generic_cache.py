@@ -9,8 +9,18 @@ and configurable key/value conversion strategies.
 import logging
 from typing import Any, Dict, Optional
 
-from lib.cache import CacheInterface, HashKeyGenerator, JsonValueConverter, K, KeyGenerator, V, ValueConverter
-
+from lib.cache import (
+    CacheEntry,
+    CacheInterface,
+    HashKeyGenerator,
+    JsonValueConverter,
+    K,
+    KeyGenerator,
+    V,
+    ValueConverter,
+)
+
+from . import utils as dbUtils
 from .database import Database
 from .models import CacheType
 
@@ -61,6 +71,8 @@ class GenericDatabaseCache(CacheInterface[K, V]):
         valueConverter: Optional[ValueConverter[V]] = None,
         *,
         dataSource: Optional[str] = None,
+        staleWhileRevalidate: int = 0,
+        staleIfError: int = 0,
     ):
         """
         Initialize cache with database wrapper.
@@ -73,7 +85,13 @@ class GenericDatabaseCache(CacheInterface[K, V]):
             valueConverter: Optional ValueConverter instance for serializing/deserializing values.
                            If None, uses JsonValueConverter by default.
             dataSource: Optional data source identifier for multi-source configurations.
+            staleWhileRevalidate: Seconds past the TTL a stale entry is served by
+                getOrFetch() while refreshed in the background (0 - disabled,
+                negative - no limit).
+            staleIfError: Seconds past the TTL a stale entry is served by
+                getOrFetch() when fetching fails (0 - disabled, negative - no limit).
         """
+        super().__init__(staleWhileRevalidate=staleWhileRevalidate, staleIfError=staleIfError)
         self.db = db
         self.dataSource = dataSource
         self.namespace = namespace
@@ -100,12 +118,53 @@ class GenericDatabaseCache(CacheInterface[K, V]):
                 _key, cacheType=self.namespace, ttl=ttl, dataSource=self.dataSource
             )
             if cacheEntry is not None:
+                self.hits += 1
                 return self.valueConverter.decode(cacheEntry["data"])
+            self.misses += 1
             return None
         except Exception as e:
             logger.error(f"Failed to get cache entry {key}: {e}")
             return None
 
+    async def getEntry(self, key: K, ttl: Optional[int] = None, maxStale: int = 0) -> Optional[CacheEntry[V]]:
+        """
+        Get cached entry with its freshness.
+
+        The entry age is taken from its ``updated_at`` timestamp, so entries
+        past the TTL are returned as stale until maxStale runs out.
+
+        Args:
+            key: Cache key to retrieve
+            ttl: Optional TTL in seconds (None - never expires, 0 or negative - bypass the cache)
+            maxStale: How long past the TTL a stale entry is still returned
+                (0 - never, negative - no limit)
+
+        Returns:
+            Optional[CacheEntry[V]]: Fresh or stale entry, None if not found or on error.
+        """
+        if ttl is not None and ttl <= 0:
+            return None
+
+        maxAge = None if ttl is None or maxStale < 0 else ttl + maxStale
+        try:
+            _key = self.keyGenerator.generateKey(key)
+            cacheEntry = await self.db.cache.getCacheEntry(
+                _key, cacheType=self.namespace, ttl=maxAge, dataSource=self.dataSource
+            )
+            if cacheEntry is None:
+                return None
+
+            value = self.valueConverter.decode(cacheEntry["data"])
+            if ttl is None:
+                return CacheEntry(value)
+            age = (dbUtils.getCurrentTimestamp() - cacheEntry["updated_at"]).total_seconds()
+            if age <= ttl:
+                return CacheEntry(value)
+            return CacheEntry(value, stale=True, staleFor=age - ttl)
+        except Exception as e:
+            logger.error(f"Failed to get cache entry {key}: {e}")
+            return None
+
     async def set(self, key: K, value: V) -> bool:
         """
         Store data in cache.
@@ -140,9 +199,8 @@ class GenericDatabaseCache(CacheInterface[K, V]):
         """
         Get cache statistics.
 
-        Returns basic statistics about the cache state including the namespace
-        and enabled status. Additional statistics could be added in the future
-        such as entry count, hit/miss ratios, and size information.
+        Returns basic statistics about the cache state including the namespace,
+        enabled status, stale windows and lookup counters.
 
         Returns:
             Dict[str, Any]: Dictionary containing cache statistics with keys:
@@ -151,6 +209,9 @@ class GenericDatabaseCache(CacheInterface[K, V]):
                 - backend: str backend type identifier
                 - keyGenerator: str key generator class name
                 - valueConverter: str value converter class name
+                - staleWhileRevalidate, staleIfError: int stale windows in seconds
+                - hits, misses, staleHits, staleOnError, refreshes, refreshErrors,
+                  refreshing: int lookup counters
         """
         return {
             "enabled": True,
@@ -158,4 +219,7 @@ class GenericDatabaseCache(CacheInterface[K, V]):
             "backend": "database",
             "keyGenerator": type(self.keyGenerator).__name__,
             "valueConverter": type(self.valueConverter).__name__,
+            "staleWhileRevalidate": self.staleWhileRevalidate,
+            "staleIfError": self.staleIfError,
+            **self.getCounters(),
         }
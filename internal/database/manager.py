@@ -2,9 +2,12 @@
 
 import logging
 from collections.abc import Awaitable, Callable
-from typing import Dict, List, Optional, TypedDict
+from typing import Dict, List, NotRequired, Optional, TypedDict
 
-from .providers import BaseSQLProvider, SQLProviderConfig, getSqlProvider
+from .embeddings_index import EmbeddingsIndexConfig
+from .message_ingestion import ChatMessageIngestionConfig
+from .providers import BaseSQLProvider, SQLite3Provider, SQLProviderConfig, getSqlProvider
+from .providers.sqlite3_pool import SQLite3PoolStats
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +37,10 @@ class DatabaseManagerConfig(TypedDict):
     """Mapping of chat IDs to data source provider names."""
     providers: Dict[str, SQLProviderConfig]
     """Dictionary of provider configurations keyed by provider name."""
+    embeddingsIndex: NotRequired[EmbeddingsIndexConfig]
+    """Optional configuration of the resident embeddings index used by semantic search."""
+    messageIngestion: NotRequired[ChatMessageIngestionConfig]
+    """Optional configuration of the group-commit queue of saved chat messages."""
 
 
 class DatabaseManager:
@@ -111,6 +118,9 @@ class DatabaseManager:
 
         Provider selection priority: dataSource > chatId mapping > default source.
         Initializes provider on first access and validates readonly constraints.
+        Read-only requests get the provider's read provider (see
+        :meth:`BaseSQLProvider.getReadProvider`), e.g. the reader pool of a
+        pooled SQLite3 provider.
 
         Args:
             chatId: Optional chat ID for provider mapping lookup
@@ -184,8 +194,25 @@ class DatabaseManager:
                 f"This source is configured as readonly."
             )
 
+        if readonly:
+            return sourceProvider.getReadProvider()
         return sourceProvider
 
+    def getPoolStats(self) -> Dict[str, SQLite3PoolStats]:
+        """Get connection pool metrics of the initialized pooled providers.
+
+        Returns:
+            Dict mapping provider name to its pool utilisation and wait-time
+            metrics, for providers running with a connection pool.
+        """
+        ret: Dict[str, SQLite3PoolStats] = {}
+        for providerName, provider in self._providers.items():
+            if isinstance(provider, SQLite3Provider):
+                stats = provider.getPoolStats()
+                if stats is not None:
+                    ret[providerName] = stats
+        return ret
+
     async def closeAll(self) -> None:
         """Close all database connections and cleanup resources.
 
@@ -0,0 +1,291 @@
+"""Group-commit ingestion queue for chat messages.
+
+This module provides :class:`ChatMessageIngestion`, the write-behind stage of
+:meth:`ChatMessagesRepository.saveChatMessage`. Instead of committing every
+message on its own (an INSERT, a ``chat_users`` update and two stats upserts,
+i.e. one fsync per statement on SQLite), saves from all chats are queued and
+written every ``flushInterval`` seconds (or once ``maxBatchSize`` messages are
+pending) by a writer callback supplied by the repository. The writer stores a
+whole group in one transaction with multi-row inserts and pre-aggregated stat
+increments, so ingest throughput scales with the batch size instead of the
+fsync rate.
+
+:meth:`ChatMessageIngestion.submit` returns once the message's group is
+committed, with the result of the write, so callers still learn about failed
+saves (e.g. duplicates). Concurrent saves from other chats share the commit.
+
+Read-your-writes: readers call :meth:`ChatMessageIngestion.flush` with their
+``chatId`` first; it commits the queue if the chat has anything pending (or
+waits for the in-flight group holding the chat's messages). The queue is
+flushed on :meth:`ChatMessageIngestion.aclose`, which ``Database.close()``
+calls before closing the providers.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Dict, Optional, TypedDict
+
+from .providers.base import BaseSQLProvider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL: float = 0.03
+"""Default maximum seconds a message waits in the queue before its group is committed."""
+
+DEFAULT_MAX_BATCH_SIZE: int = 256
+"""Default number of pending messages that triggers an immediate commit (also the maximum group size)."""
+
+DEFAULT_MAX_PENDING: int = 10000
+"""Default queue capacity; saves beyond it wait for a flush instead of growing the queue."""
+
+
+class ChatMessageIngestionConfig(TypedDict, total=False):
+    """Configuration of the chat message ingestion queue (``[database.messageIngestion]``)."""
+
+    enabled: bool
+    """Whether saves are group-committed. Defaults to ``False`` (every save commits on its own)."""
+    flushInterval: float
+    """Maximum seconds a message waits before its group is committed."""
+    maxBatchSize: int
+    """Pending messages that trigger an immediate commit, also the maximum group size."""
+    maxPending: int
+    """Queue capacity; saves beyond it wait for a flush."""
+
+
+class ChatMessageIngestionStats(TypedDict):
+    """Counters reported by :meth:`ChatMessageIngestion.getStats`."""
+
+    pending: int
+    """Messages waiting in the queue or in the group being committed."""
+    written: int
+    """Messages committed so far."""
+    failed: int
+    """Messages the writer could not store."""
+    flushes: int
+    """Number of groups committed."""
+    maxGroupSize: int
+    """Largest group committed so far."""
+
+
+class PendingChatMessage:
+    """Queued chat message: target provider plus the ``chat_messages`` row values."""
+
+    __slots__ = ("provider", "chatId", "values", "stored", "result")
+
+    def __init__(self, provider: BaseSQLProvider, chatId: int, values: Dict[str, Any]) -> None:
+        self.provider: BaseSQLProvider = provider
+        """Writable provider the chat is routed to."""
+        self.chatId: int = chatId
+        """Chat identifier, used for read-your-writes."""
+        self.values: Dict[str, Any] = values
+        """Named parameters of the ``chat_messages`` INSERT."""
+        self.stored: bool = False
+        """Set by the writer once the message is committed."""
+        self.result: Optional[asyncio.Future[bool]] = None
+        """Resolved with :attr:`stored` once the message's group is written."""
+
+
+ChatMessagesWriter = Callable[[Sequence[PendingChatMessage]], Awaitable[int]]
+"""Async callback storing a group of messages.
+
+Sets :attr:`PendingChatMessage.stored` on every message it commits.
+
+Args:
+    messages: Messages to store, in submission order
+
+Returns:
+    Number of messages stored successfully (failures are logged by the writer)
+"""
+
+
+class ChatMessageIngestion:
+    """Write-behind queue committing chat messages in groups.
+
+    :meth:`submit` appends to an in-memory queue and waits for the commit. A
+    background task hands the queue to the writer whenever ``maxBatchSize``
+    messages are pending or ``flushInterval`` seconds have passed. Groups are
+    written one at a time and in submission order. After :meth:`aclose` (or
+    when disabled) every message is written through immediately.
+    """
+
+    __slots__ = (
+        "enabled",
+        "flushInterval",
+        "maxBatchSize",
+        "maxPending",
+        "_writer",
+        "_queue",
+        "_pendingByChat",
+        "_submitted",
+        "_taken",
+        "_wakeup",
+        "_flushLock",
+        "_flusherTask",
+        "_closed",
+        "_written",
+        "_failed",
+        "_flushes",
+        "_maxGroupSize",
+    )
+
+    def __init__(self, writer: ChatMessagesWriter, config: Optional[ChatMessageIngestionConfig] = None) -> None:
+        """Initialise the queue.
+
+        Args:
+            writer: Callback storing a group of messages in one transaction.
+            config: Optional configuration, see :class:`ChatMessageIngestionConfig`.
+        """
+        config = config or {}
+        self.enabled: bool = bool(config.get("enabled", False))
+        self.flushInterval: float = float(config.get("flushInterval", DEFAULT_FLUSH_INTERVAL))
+        self.maxBatchSize: int = max(1, int(config.get("maxBatchSize", DEFAULT_MAX_BATCH_SIZE)))
+        self.maxPending: int = max(self.maxBatchSize, int(config.get("maxPending", DEFAULT_MAX_PENDING)))
+        self._writer: ChatMessagesWriter = writer
+        self._queue: deque[PendingChatMessage] = deque()
+        # Queued or in-flight messages per chat, decremented once their group is written
+        self._pendingByChat: Dict[int, int] = {}
+        # Messages ever queued / ever taken from the queue, flush() drains up to a snapshot of the former
+        self._submitted: int = 0
+        self._taken: int = 0
+        self._wakeup = asyncio.Event()
+        self._flushLock = asyncio.Lock()
+        self._flusherTask: Optional[asyncio.Task] = None
+        self._closed: bool = False
+        self._written: int = 0
+        self._failed: int = 0
+        self._flushes: int = 0
+        self._maxGroupSize: int = 0
+
+    async def submit(self, message: PendingChatMessage) -> bool:
+        """Store a message with the next group commit.
+
+        Writes the message through right away when the queue is disabled or
+        closed. Waits for a flush when ``maxPending`` messages are queued.
+
+        Args:
+            message: Message to store.
+
+        Returns:
+            True once the message is committed, False if the writer failed to store it.
+        """
+        if not self.enabled or self._closed:
+            return await self._writeGroup([message]) == 1
+
+        if len(self._queue) >= self.maxPending:
+            logger.warning(f"Chat message queue is full ({self.maxPending}), flushing inline")
+            await self.flush()
+
+        result: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        message.result = result
+        self._queue.append(message)
+        self._submitted += 1
+        self._pendingByChat[message.chatId] = self._pendingByChat.get(message.chatId, 0) + 1
+        if len(self._queue) >= self.maxBatchSize:
+            self._wakeup.set()
+
+        if self._flusherTask is None or self._flusherTask.done():
+            self._flusherTask = asyncio.create_task(self._flushLoop(), name="chat-messages-flusher")
+        # A cancelled caller doesn't cancel the write of its message
+        return await asyncio.shield(result)
+
+    async def flush(self, chatId: Optional[int] = None) -> int:
+        """Commit pending messages.
+
+        Only messages queued before the call are written, so a reader is not
+        held up by messages submitted while it waits.
+
+        Args:
+            chatId: If given, only flush when this chat has pending messages,
+                so reads of other chats do not pay for a commit.
+
+        Returns:
+            Number of messages written by this call.
+        """
+        if chatId is not None and not self._pendingByChat.get(chatId):
+            return 0
+
+        written = 0
+        upTo = self._submitted
+        async with self._flushLock:
+            while self._queue and self._taken < upTo:
+                groupSize = min(self.maxBatchSize, len(self._queue), upTo - self._taken)
+                group = [self._queue.popleft() for _ in range(groupSize)]
+                self._taken += groupSize
+                try:
+                    written += await self._writeGroup(group)
+                finally:
+                    for message in group:
+                        left = self._pendingByChat[message.chatId] - 1
+                        if left:
+                            self._pendingByChat[message.chatId] = left
+                        else:
+                            del self._pendingByChat[message.chatId]
+        return written
+
+    async def aclose(self) -> None:
+        """Stop the background flusher and commit everything still queued."""
+        self._closed = True
+        self._wakeup.set()
+        if self._flusherTask is not None:
+            await self._flusherTask
+            self._flusherTask = None
+        await self.flush()
+
+    def getStats(self) -> ChatMessageIngestionStats:
+        """Get queue counters.
+
+        Returns:
+            Snapshot of the queue counters.
+        """
+        return {
+            "pending": sum(self._pendingByChat.values()),
+            "written": self._written,
+            "failed": self._failed,
+            "flushes": self._flushes,
+            "maxGroupSize": self._maxGroupSize,
+        }
+
+    async def _writeGroup(self, group: Sequence[PendingChatMessage]) -> int:
+        """Hand a group to the writer and account the result.
+
+        Args:
+            group: Messages to store.
+
+        Returns:
+            Number of messages stored.
+        """
+        try:
+            written = await self._writer(group)
+        except Exception as e:
+            logger.error(f"Failed to write {len(group)} chat messages: {e}")
+            written = 0
+        finally:
+            for message in group:
+                if message.result is not None and not message.result.done():
+                    message.result.set_result(message.stored)
+        self._flushes += 1
+        self._maxGroupSize = max(self._maxGroupSize, len(group))
+        self._written += written
+        self._failed += len(group) - written
+        return written
+
+    async def _flushLoop(self) -> None:
+        """Flush on a full group or after ``flushInterval`` until the queue drains.
+
+        The task exits once nothing is queued; the next :meth:`submit` starts
+        a new one, so an idle bot has no timer running.
+        """
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flushInterval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Chat message flush failed: {e}")
+            if not self._queue:
+                break
@@ -387,6 +387,10 @@ class CacheType(StrEnum):
     """Cached content of URL (url -> content+contentType)."""
     URL_CONTENT_CONDENSED = "url_content_condensed"
     """Cached condensed content of URL (url+max_size -> content)."""
+    CONDENSED_CONTEXT = "condensed_context"
+    """Rolling summaries of condensed LLM contexts (chat:thread:first message digest -> summary)."""
+    WEBHOOK_UPDATES = "webhook_updates"
+    """Recently received webhook updates, shared by bot instances (update ID -> receive time)."""
 
     # Geocode Maps cache
     GM_SEARCH = "geocode_maps_search"
@@ -12,6 +12,8 @@ from collections.abc import Mapping, Sequence
 from enum import Enum, StrEnum
 from typing import Any, Dict, List, NotRequired, Optional, TypedDict
 
+from . import utils
+
 logger = logging.getLogger(__name__)
 
 
@@ -413,6 +415,72 @@ class BaseSQLProvider(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def getUpsertQuery(
+        self,
+        table: str,
+        columns: Sequence[str],
+        conflictColumns: List[str],
+        updateExpressions: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build provider-specific single-row upsert query with named ``:column`` placeholders.
+
+        Args:
+            table: Table name.
+            columns: Column names to insert, one ``:column`` placeholder each.
+            conflictColumns: List of columns that define the conflict target.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause,
+                same semantics as in :meth:`upsert`.
+
+        Returns:
+            SQL query string.
+
+        Raises:
+            NotImplementedError: Must be overridden by subclasses.
+        """
+        raise NotImplementedError
+
+    async def upsertMany(
+        self,
+        table: str,
+        rows: Sequence[Dict[str, Any]],
+        conflictColumns: List[str],
+        updateExpressions: Optional[Dict[str, Any]] = None,
+        *,
+        extraQueries: Sequence[ParametrizedQuery] = (),
+    ) -> bool:
+        """Upsert many rows in a single transaction.
+
+        Default implementation runs one :meth:`getUpsertQuery` statement per row
+        through :meth:`batchExecute`. Providers override it to use their driver's
+        ``executemany`` so the whole batch costs a single round-trip.
+
+        Args:
+            table: Table name.
+            rows: Rows to upsert. Every row must have the same set of columns.
+            conflictColumns: List of columns that define the conflict target.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause,
+                same semantics as in :meth:`upsert`. Expressions may reference
+                the current row's values via ``:column`` placeholders.
+            extraQueries: Queries executed after the upsert in the same transaction
+                (e.g. marking source rows as processed).
+
+        Returns:
+            True if successful.
+
+        Raises:
+            ValueError: If rows have different sets of columns.
+        """
+        columns = utils.getRowsColumns(rows)
+        queries: List[ParametrizedQuery] = []
+        if columns:
+            query = self.getUpsertQuery(table, columns, conflictColumns, updateExpressions)
+            queries.extend(ParametrizedQuery(query, row) for row in rows)
+        queries.extend(extraQueries)
+        if queries:
+            await self.batchExecute(queries)
+        return True
+
     @abstractmethod
     async def isReadOnly(self) -> bool:
         """Check if this provider is in read-only mode.
@@ -425,6 +493,17 @@ class BaseSQLProvider(ABC):
         """
         raise NotImplementedError
 
+    def getReadProvider(self) -> "BaseSQLProvider":
+        """Return the provider to use for read-only operations.
+
+        Providers with dedicated read connections return a provider bound to
+        them. The default implementation returns ``self``.
+
+        Returns:
+            The provider for read-only operations.
+        """
+        return self
+
     @abstractmethod
     def applyPagination(self, query: str, limit: Optional[int], offset: int = 0) -> str:
         """Apply RDBMS-specific pagination to query.
@@ -348,6 +348,58 @@ class MySQLProvider(BaseSQLProvider):
         """
         return f"LOWER({column}) LIKE LOWER(:{param})"
 
+    def getUpsertQuery(
+        self,
+        table: str,
+        columns: Sequence[str],
+        conflictColumns: List[str],
+        updateExpressions: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build MySQL-specific upsert query.
+
+        Args:
+            table: Table name.
+            columns: Column names to insert, one ``:column`` placeholder each.
+            conflictColumns: List of columns that define the conflict target.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause,
+                same semantics as in :meth:`upsert`.
+
+        Returns:
+            The ``INSERT ... ON DUPLICATE KEY UPDATE`` statement.
+        """
+        if updateExpressions is None:
+            updateExpressions = {col: ExcludedValue() for col in columns if col not in conflictColumns}
+
+        colsStr = ", ".join(columns)
+        placeholders = ", ".join([f":{col}" for col in columns])
+
+        # Handle empty updateExpressions - do nothing on conflict
+        if not updateExpressions:
+            query = f"""
+                INSERT IGNORE INTO {table} ({colsStr})
+                VALUES ({placeholders})
+            """
+        else:
+            # Translate ExcludedValue to MySQL syntax
+            translatedExpressions: Dict[str, str] = {}
+            for col, expr in updateExpressions.items():
+                if isinstance(expr, ExcludedValue):
+                    columnName = expr.column if expr.column else col
+                    translatedExpressions[col] = f"VALUES({columnName})"
+                else:
+                    translatedExpressions[col] = str(expr)
+
+            updateStr = ", ".join([f"{col} = {expr}" for col, expr in translatedExpressions.items()])
+
+            query = f"""
+                INSERT INTO {table} ({colsStr})
+                VALUES ({placeholders})
+                ON DUPLICATE KEY UPDATE
+                    {updateStr}
+            """
+
+        return query
+
     async def upsert(
         self,
         table: str,
@@ -388,36 +440,44 @@ class MySQLProvider(BaseSQLProvider):
             DatabaseError: If the SQL execution fails due to invalid table name,
             missing columns, type mismatches, or constraint violations.
         """
-        if updateExpressions is None:
-            updateExpressions = {col: ExcludedValue() for col in values.keys() if col not in conflictColumns}
+        query = self.getUpsertQuery(table, list(values.keys()), conflictColumns, updateExpressions)
+        await self.execute(query, values)
+        return True
 
-        colsStr = ", ".join(values.keys())
-        placeholders = ", ".join([f":{col}" for col in values.keys()])
+    async def upsertMany(
+        self,
+        table: str,
+        rows: Sequence[Dict[str, Any]],
+        conflictColumns: List[str],
+        updateExpressions: Optional[Dict[str, Any]] = None,
+        *,
+        extraQueries: Sequence[ParametrizedQuery] = (),
+    ) -> bool:
+        """Upsert many rows via ``executemany`` in a single transaction.
 
-        # Handle empty updateExpressions - do nothing on conflict
-        if not updateExpressions:
-            query = f"""
-                INSERT IGNORE INTO {table} ({colsStr})
-                VALUES ({placeholders})
-            """
-        else:
-            # Translate ExcludedValue to MySQL syntax
-            translatedExpressions: Dict[str, str] = {}
-            for col, expr in updateExpressions.items():
-                if isinstance(expr, ExcludedValue):
-                    columnName = expr.column if expr.column else col
-                    translatedExpressions[col] = f"VALUES({columnName})"
-                else:
-                    translatedExpressions[col] = str(expr)
+        ``aiomysql`` rewrites an ``INSERT ... VALUES (...)`` passed to
+        ``executemany`` into multi-row ``VALUES`` lists, so the batch is sent
+        in as few statements as the server packet size allows.
 
-            updateStr = ", ".join([f"{col} = {expr}" for col, expr in translatedExpressions.items()])
+        Args:
+            table: Table name.
+            rows: Rows to upsert. Every row must have the same set of columns.
+            conflictColumns: List of columns that define the conflict target.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause,
+                same semantics as in :meth:`upsert`.
+            extraQueries: Queries executed after the upsert in the same transaction.
 
-            query = f"""
-                INSERT INTO {table} ({colsStr})
-                VALUES ({placeholders})
-                ON DUPLICATE KEY UPDATE
-                    {updateStr}
-            """
+        Returns:
+            True if successful.
 
-        await self.execute(query, values)
+        Raises:
+            ValueError: If rows have different sets of columns.
+        """
+        columns = utils.getRowsColumns(rows)
+        async with self.cursor() as cursor:
+            if columns:
+                query = self.getUpsertQuery(table, columns, conflictColumns, updateExpressions)
+                await cursor.executemany(query, [utils.convertContainerElementsToSQLite(row) for row in rows])
+            for extraQuery in extraQueries:
+                await cursor.execute(extraQuery.query, utils.convertContainerElementsToSQLite(extraQuery.params))
         return True
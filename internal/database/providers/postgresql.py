@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional, cast
 
 import asyncpg  # type: ignore[reportMissingImports]
 
+from . import utils
 from .base import BaseSQLProvider, ExcludedValue, FetchType, ParametrizedQuery, QueryResult
 
 logger = logging.getLogger(__name__)
@@ -241,11 +242,7 @@ class PostgreSQLProvider(BaseSQLProvider):
 
             if isinstance(params, dict):
                 # Convert named parameters to positional
-                paramNames = list(params.keys())
-                paramValues = list(params.values())
-                for idx, name in enumerate(paramNames, 1):
-                    queryStr = queryStr.replace(f":{name}", f"${idx}")
-                params = paramValues
+                queryStr, params = utils.convertNamedToPositional(queryStr, params)
             elif isinstance(params, Sequence):
                 params = list(params)
 
@@ -281,11 +278,7 @@ class PostgreSQLProvider(BaseSQLProvider):
                 params = query.params
 
                 if isinstance(params, dict):
-                    paramNames = list(params.keys())
-                    paramValues = list(params.values())
-                    for idx, name in enumerate(paramNames, 1):
-                        queryStr = queryStr.replace(f":{name}", f"${idx}")
-                    params = paramValues
+                    queryStr, params = utils.convertNamedToPositional(queryStr, params)
                 elif isinstance(params, Sequence):
                     params = list(params)
 
@@ -374,38 +367,30 @@ class PostgreSQLProvider(BaseSQLProvider):
         """
         return f"LOWER({column}) LIKE LOWER(:{param})"
 
-    async def upsert(
+    def getUpsertQuery(
         self,
         table: str,
-        values: Dict[str, Any],
+        columns: Sequence[str],
         conflictColumns: List[str],
         updateExpressions: Optional[Dict[str, Any]] = None,
-    ) -> bool:
-        """Execute PostgreSQL-specific upsert operation.
-
-        Uses PostgreSQL's ``ON CONFLICT`` clause to either insert a new row
-        or update an existing row on conflict. Supports both simple
-        updates with ``EXCLUDED.column`` references and complex expressions,
-        atomic counters, or conditional updates.
+    ) -> str:
+        """Build PostgreSQL-specific upsert query.
 
         Args:
             table: Table name.
-            values: Dictionary of column names and values to insert.
+            columns: Column names to insert, one ``:column`` placeholder each.
             conflictColumns: List of columns that define the conflict target.
-            updateExpressions: Optional dict of column -> expression for UPDATE clause.
-                If ``None``, all non-conflict columns are updated with their values.
-                If empty dict {}, do nothing on conflict (ON CONFLICT DO NOTHING).
-                Supports complex expressions like "messages_count = messages_count + 1"
-                or ExcludedValue() to set to excluded value.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause,
+                same semantics as in :meth:`upsert`.
 
         Returns:
-            ``True`` if successful.
+            The ``ON CONFLICT ... DO UPDATE`` statement.
         """
         if updateExpressions is None:
-            updateExpressions = {col: ExcludedValue() for col in values.keys() if col not in conflictColumns}
+            updateExpressions = {col: ExcludedValue() for col in columns if col not in conflictColumns}
 
-        colsStr = ", ".join(values.keys())
-        placeholders = ", ".join([f":{col}" for col in values.keys()])
+        colsStr = ", ".join(columns)
+        placeholders = ", ".join([f":{col}" for col in columns])
         conflictStr = ", ".join(conflictColumns)
 
         # Handle empty updateExpressions - do nothing on conflict
@@ -434,5 +419,80 @@ class PostgreSQLProvider(BaseSQLProvider):
                     {updateStr}
             """
 
+        return query
+
+    async def upsert(
+        self,
+        table: str,
+        values: Dict[str, Any],
+        conflictColumns: List[str],
+        updateExpressions: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Execute PostgreSQL-specific upsert operation.
+
+        Uses PostgreSQL's ``ON CONFLICT`` clause to either insert a new row
+        or update an existing row on conflict. Supports both simple
+        updates with ``EXCLUDED.column`` references and complex expressions,
+        atomic counters, or conditional updates.
+
+        Args:
+            table: Table name.
+            values: Dictionary of column names and values to insert.
+            conflictColumns: List of columns that define the conflict target.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause.
+                If ``None``, all non-conflict columns are updated with their values.
+                If empty dict {}, do nothing on conflict (ON CONFLICT DO NOTHING).
+                Supports complex expressions like "messages_count = messages_count + 1"
+                or ExcludedValue() to set to excluded value.
+
+        Returns:
+            ``True`` if successful.
+        """
+        query = self.getUpsertQuery(table, list(values.keys()), conflictColumns, updateExpressions)
         await self.execute(query, values)
         return True
+
+    async def upsertMany(
+        self,
+        table: str,
+        rows: Sequence[Dict[str, Any]],
+        conflictColumns: List[str],
+        updateExpressions: Optional[Dict[str, Any]] = None,
+        *,
+        extraQueries: Sequence[ParametrizedQuery] = (),
+    ) -> bool:
+        """Upsert many rows via ``executemany`` in a single transaction.
+
+        The statement is prepared once and ``asyncpg`` pipelines all argument
+        sets to the server. Unlike a single multi-row ``VALUES`` list, this also
+        accepts several rows hitting the same conflict target.
+
+        Args:
+            table: Table name.
+            rows: Rows to upsert. Every row must have the same set of columns.
+            conflictColumns: List of columns that define the conflict target.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause,
+                same semantics as in :meth:`upsert`.
+            extraQueries: Queries executed after the upsert in the same transaction.
+
+        Returns:
+            True if successful.
+
+        Raises:
+            ValueError: If rows have different sets of columns.
+        """
+        columns = utils.getRowsColumns(rows)
+        async with self.cursor() as conn:
+            if columns:
+                query = self.getUpsertQuery(table, columns, conflictColumns, updateExpressions)
+                # Replace longer names first so ``:labels`` does not clobber ``:labels_hash``
+                for name in sorted(columns, key=len, reverse=True):
+                    query = query.replace(f":{name}", f"${columns.index(name) + 1}")
+                await conn.executemany(query, [[row[col] for col in columns] for row in rows])
+            for extraQuery in extraQueries:
+                queryStr = extraQuery.query
+                params = extraQuery.params
+                if isinstance(params, dict):
+                    queryStr, params = utils.convertNamedToPositional(queryStr, params)
+                await conn.execute(queryStr, *params)
+        return True
@@ -318,33 +318,30 @@ class SQLinkProvider(BaseSQLProvider):
         """
         return f"LOWER({column}) LIKE LOWER(:{param})"
 
-    async def upsert(
+    def getUpsertQuery(
         self,
         table: str,
-        values: Dict[str, Any],
+        columns: Sequence[str],
         conflictColumns: List[str],
         updateExpressions: Optional[Dict[str, Any]] = None,
-    ) -> bool:
-        """Execute SQLite-specific upsert operation via SQLink.
+    ) -> str:
+        """Build SQLite-specific upsert query for SQLink.
 
         Args:
             table: Table name.
-            values: Dictionary of column names and values to insert.
+            columns: Column names to insert, one ``:column`` placeholder each.
             conflictColumns: List of columns that define the conflict target.
-            updateExpressions: Optional dict of column -> expression for UPDATE clause.
-                If None, all non-conflict columns are updated with their values.
-                If empty dict {}, do nothing on conflict (ON CONFLICT DO NOTHING).
-                Supports complex expressions like "messages_count = messages_count + 1"
-                or ExcludedValue() to set to excluded value.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause,
+                same semantics as in :meth:`upsert`.
 
         Returns:
-            True if successful.
+            The ``ON CONFLICT ... DO UPDATE`` statement.
         """
         if updateExpressions is None:
-            updateExpressions = {col: ExcludedValue() for col in values.keys() if col not in conflictColumns}
+            updateExpressions = {col: ExcludedValue() for col in columns if col not in conflictColumns}
 
-        colsStr = ", ".join(values.keys())
-        placeholders = ", ".join([f":{col}" for col in values.keys()])
+        colsStr = ", ".join(columns)
+        placeholders = ", ".join([f":{col}" for col in columns])
         conflictStr = ", ".join(conflictColumns)
 
         # Handle empty updateExpressions - do nothing on conflict
@@ -373,5 +370,30 @@ class SQLinkProvider(BaseSQLProvider):
                     {updateStr}
             """
 
+        return query
+
+    async def upsert(
+        self,
+        table: str,
+        values: Dict[str, Any],
+        conflictColumns: List[str],
+        updateExpressions: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Execute SQLite-specific upsert operation via SQLink.
+
+        Args:
+            table: Table name.
+            values: Dictionary of column names and values to insert.
+            conflictColumns: List of columns that define the conflict target.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause.
+                If None, all non-conflict columns are updated with their values.
+                If empty dict {}, do nothing on conflict (ON CONFLICT DO NOTHING).
+                Supports complex expressions like "messages_count = messages_count + 1"
+                or ExcludedValue() to set to excluded value.
+
+        Returns:
+            True if successful.
+        """
+        query = self.getUpsertQuery(table, list(values.keys()), conflictColumns, updateExpressions)
         await self.execute(query, values)
         return True
@@ -5,6 +5,7 @@ wraps the :mod:`aiosqlite` library with a fully async interface.
 """
 
 import asyncio
+import copy
 import logging
 from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
@@ -24,6 +25,7 @@ from .base import (
     VectorDistanceMetric,
     VectorSearchResult,
 )
+from .sqlite3_pool import SQLite3ConnectionPool, SQLite3PoolStats
 
 # Optional dependency for native vector search.
 try:
@@ -81,11 +83,21 @@ class SQLite3Provider(BaseSQLProvider):
 
     Uses :mod:`aiosqlite` for a fully non-blocking async interface.
 
+    With ``readerPoolSize > 0`` the provider runs in pooled mode: one
+    long-lived writer connection and up to ``readerPoolSize`` WAL reader
+    connections, each on its own thread (see :class:`SQLite3ConnectionPool`).
+    :meth:`getReadProvider` returns a view of the provider running its queries
+    on the readers, which :class:`DatabaseManager` hands out for
+    ``readonly=True`` requests.
+
     Attributes:
         dbPath: Filesystem path to the SQLite3 database file.
         readOnly: When ``True``, the connection is opened in query-only mode.
         useWal: When ``True``, WAL journal mode is enabled on the connection.
         timeout: Seconds to wait for the database lock before raising an error.
+        readerPoolSize: Number of reader connections in pooled mode, ``0`` disables pooling.
+        statementCacheSize: Number of prepared statements cached per connection.
+        healthCheckInterval: Idle seconds after which a pooled connection is checked before use.
     """
 
     __slots__ = (
@@ -95,10 +107,16 @@ class SQLite3Provider(BaseSQLProvider):
         "timeout",
         "enableForeignKeys",
         "keepConnection",
+        "readerPoolSize",
+        "statementCacheSize",
+        "healthCheckInterval",
         "_connection",
         "_connectLock",
         "_vectorExtensionPath",
         "_vectorSearchAvailable",
+        "_pool",
+        "_primary",
+        "_readProvider",
     )
 
     def __init__(
@@ -111,6 +129,9 @@ class SQLite3Provider(BaseSQLProvider):
         enableForeignKeys: bool = True,
         keepConnection: Optional[bool] = None,
         vectorExtensionPath: Optional[str] = None,
+        readerPoolSize: int = 0,
+        statementCacheSize: int = 128,
+        healthCheckInterval: float = 30.0,
     ) -> None:
         """Initialise the SQLite3 provider, dood!
 
@@ -131,6 +152,17 @@ class SQLite3Provider(BaseSQLProvider):
                 extension to be loaded from a source-built binary. When
                 ``None`` and the pip package is available, the package's
                 bundled ``loadable_path()`` is used.
+            readerPoolSize: If greater than ``0``, enable pooled mode with one
+                writer and up to this many reader connections. Requires a file
+                database; WAL mode is enabled automatically. Defaults to ``0``.
+            statementCacheSize: Number of prepared statements cached per
+                connection; defaults to ``128``.
+            healthCheckInterval: In pooled mode, seconds a connection may stay
+                idle before it is checked with ``SELECT 1`` on its next use;
+                defaults to ``30``.
+
+        Raises:
+            ValueError: If pooled mode is requested for an in-memory database.
         """
         super().__init__()
         self._vectorSearchAvailable: bool = False
@@ -158,16 +190,44 @@ class SQLite3Provider(BaseSQLProvider):
         """Lock to prevent race conditions during connection creation."""
         self._vectorExtensionPath: Optional[str] = vectorExtensionPath
         """Filesystem path to a prebuilt sqlite-vec shared library, or ``None``."""
+        self.readerPoolSize: int = readerPoolSize
+        """Number of reader connections in pooled mode, ``0`` disables pooling."""
+        self.statementCacheSize: int = statementCacheSize
+        """Number of prepared statements cached per connection."""
+        self.healthCheckInterval: float = healthCheckInterval
+        """Idle seconds after which a pooled connection is health-checked before use."""
+
+        self._pool: Optional[SQLite3ConnectionPool] = None
+        """Connection pool in pooled mode, shared with the read provider."""
+        self._primary: Optional["SQLite3Provider"] = None
+        """For the read provider, the provider it was created from, else ``None``."""
+        self._readProvider: Optional["SQLite3Provider"] = None
+        """Cached read provider returned by :meth:`getReadProvider`."""
+        if readerPoolSize > 0:
+            if dbPath == ":memory:":
+                raise ValueError("Pooled mode (readerPoolSize > 0) is not supported for in-memory databases")
+            # Readers only run concurrently with the writer in WAL mode
+            self.useWal = True
+            self._pool = SQLite3ConnectionPool(
+                lambda readOnly: self._openConnection(readOnly=readOnly or self.readOnly),
+                readerPoolSize=readerPoolSize,
+                healthCheckInterval=healthCheckInterval,
+            )
 
     async def connect(self) -> None:
         """Open the aiosqlite connection, dood!
 
         Applies ``PRAGMA query_only`` when :attr:`readOnly` is set, and
-        ``PRAGMA journal_mode = WAL`` when :attr:`useWal` is set.
+        ``PRAGMA journal_mode = WAL`` when :attr:`useWal` is set. In pooled
+        mode opens the writer connection of the pool.
 
         Uses a lock to prevent race conditions when multiple coroutines
         try to connect simultaneously.
         """
+        if self._pool is not None:
+            await self._pool.connect()
+            return
+
         # Fast path: if already connected, return immediately
         if self._connection is not None:
             return
@@ -178,54 +238,79 @@ class SQLite3Provider(BaseSQLProvider):
             if self._connection is not None:
                 return
 
-            connection: aiosqlite.Connection = await aiosqlite.connect(
-                self.dbPath,
-                timeout=self.timeout,
-            )
+            self._connection = await self._openConnection(readOnly=self.readOnly)
 
-            connection.row_factory = aiosqlite.Row
-            if self.readOnly:
-                await connection.execute("PRAGMA query_only = ON")
-            if self.useWal:
-                await connection.execute("PRAGMA journal_mode = WAL")
-            if self.enableForeignKeys:
-                await connection.execute("PRAGMA foreign_keys = ON")
-
-            # Attempt to load sqlite-vec for native vector search.
-            # self._vectorSearchAvailable = False
-
-            extensionSource: Optional[str] = None
-            if _SQLITE_VEC_AVAILABLE:
-                # Package installed — use its bundled .so (version-matched, reliable).
-                extensionSource = sqlite_vec.loadable_path()
-            elif self._vectorExtensionPath is not None:
-                # No pip package, but a custom build path is configured (e.g. Alpine
-                # Linux where the extension was built from source). See
-                # ``vectorExtensionPath`` config key under
-                # ``[database.providers.<name>.parameters]``.
-                extensionSource = self._vectorExtensionPath
-
-            if extensionSource is not None:
-                version = await _loadSqliteVecExtension(connection, extensionSource)
-                if version is not None:
-                    self._vectorSearchAvailable = True
-                    logger.info("sqlite-vec %s loaded from %s", version, extensionSource)
-                else:
-                    self._vectorSearchAvailable = False
-                    logger.warning(
-                        "sqlite-vec extension failed to load from %s; native vector search disabled",
-                        extensionSource,
-                    )
+    async def _openConnection(self, *, readOnly: bool) -> aiosqlite.Connection:
+        """Open and configure a new aiosqlite connection, dood!
+
+        Applies the PRAGMAs and loads sqlite-vec (updating
+        :attr:`_vectorSearchAvailable`).
+
+        Args:
+            readOnly: Apply ``PRAGMA query_only`` to the connection.
+
+        Returns:
+            The open connection.
+        """
+        connection: aiosqlite.Connection = await aiosqlite.connect(
+            self.dbPath,
+            timeout=self.timeout,
+            cached_statements=self.statementCacheSize,
+        )
+
+        connection.row_factory = aiosqlite.Row
+        if readOnly:
+            await connection.execute("PRAGMA query_only = ON")
+        if self.useWal:
+            await connection.execute("PRAGMA journal_mode = WAL")
+        if self.enableForeignKeys:
+            await connection.execute("PRAGMA foreign_keys = ON")
+
+        # Attempt to load sqlite-vec for native vector search.
+        # self._vectorSearchAvailable = False
+
+        extensionSource: Optional[str] = None
+        if _SQLITE_VEC_AVAILABLE:
+            # Package installed — use its bundled .so (version-matched, reliable).
+            extensionSource = sqlite_vec.loadable_path()
+        elif self._vectorExtensionPath is not None:
+            # No pip package, but a custom build path is configured (e.g. Alpine
+            # Linux where the extension was built from source). See
+            # ``vectorExtensionPath`` config key under
+            # ``[database.providers.<name>.parameters]``.
+            extensionSource = self._vectorExtensionPath
+
+        if extensionSource is not None:
+            version = await _loadSqliteVecExtension(connection, extensionSource)
+            if version is not None:
+                self._vectorSearchAvailable = True
+                logger.info("sqlite-vec %s loaded from %s", version, extensionSource)
             else:
                 self._vectorSearchAvailable = False
+                logger.warning(
+                    "sqlite-vec extension failed to load from %s; native vector search disabled",
+                    extensionSource,
+                )
+        else:
+            self._vectorSearchAvailable = False
 
-            self._connection = connection
-            logger.debug(
-                f"Connected to SQLite3 database at {self.dbPath} with readOnly={self.readOnly} and useWal={self.useWal}"
-            )
+        logger.debug(
+            f"Connected to SQLite3 database at {self.dbPath} with readOnly={readOnly} and useWal={self.useWal}"
+        )
+        return connection
 
     async def disconnect(self) -> None:
-        """Close the aiosqlite connection, dood!"""
+        """Close the aiosqlite connection, dood!
+
+        In pooled mode closes all pool connections. The read provider does
+        not own the pool, so disconnecting it is a no-op.
+        """
+        if self._pool is not None:
+            if self._primary is None:
+                await self._pool.close()
+                logger.debug(f"Closed SQLite3 connection pool for {self.dbPath}")
+            return
+
         if self._connection is not None:
             await self._connection.close()
             self._connection = None
@@ -238,7 +323,39 @@ class SQLite3Provider(BaseSQLProvider):
             ``True`` if the provider is in read-only mode, ``False`` otherwise.
         """
 
-        return self.readOnly
+        return self.readOnly or self._primary is not None
+
+    def getReadProvider(self) -> "SQLite3Provider":
+        """Return the provider to use for read-only operations, dood!
+
+        In pooled mode this is a view of this provider sharing its pool and
+        running every query on a reader connection. Otherwise it is ``self``.
+
+        Returns:
+            The read provider.
+        """
+        if self._pool is None or self._primary is not None:
+            return self
+
+        if self._readProvider is None:
+            readProvider = copy.copy(self)
+            readProvider._primary = self
+            self._readProvider = readProvider
+        return self._readProvider
+
+    def getPoolStats(self) -> Optional[SQLite3PoolStats]:
+        """Return connection pool utilisation and wait-time metrics, dood!
+
+        Returns:
+            Pool metrics in pooled mode, ``None`` otherwise.
+        """
+        return self._pool.getStats() if self._pool is not None else None
+
+    def _isVectorSearchLoaded(self) -> bool:
+        """Return whether sqlite-vec was loaded, as seen by the connection owner."""
+        if self._primary is not None:
+            return self._primary._vectorSearchAvailable
+        return self._vectorSearchAvailable
 
     @asynccontextmanager
     async def cursor(self, *, keepConnection: Optional[bool] = None) -> AsyncGenerator[aiosqlite.Cursor, None]:
@@ -253,6 +370,9 @@ class SQLite3Provider(BaseSQLProvider):
                 closed before entering this context manager. If None (default),
                 uses the instance-level ``keepConnection`` setting.
 
+        In pooled mode the cursor runs on the writer connection, or on a reader
+        connection for the read provider, and ``keepConnection`` is ignored.
+
         Yields:
             An open :class:`aiosqlite.Cursor` ready for query execution.
 
@@ -260,6 +380,13 @@ class SQLite3Provider(BaseSQLProvider):
             Exception: Re-raises any exception that occurs during execution
                 after rolling back the transaction.
         """
+        if self._pool is not None:
+            poolConnection = self._pool.reader() if self._primary is not None else self._pool.writer()
+            async with poolConnection as connection:
+                async with self._transaction(connection) as cursor:
+                    yield cursor
+            return
+
         # Use instance-level keepConnection if not explicitly provided
         effectiveKeepConnection = keepConnection if keepConnection is not None else self.keepConnection
 
@@ -273,21 +400,36 @@ class SQLite3Provider(BaseSQLProvider):
 
         assert self._connection is not None
 
-        cursor = await self._connection.cursor()
+        try:
+            async with self._transaction(self._connection) as cursor:
+                yield cursor
+        finally:
+            # Only disconnect if we opened the connection ourselves AND keepConnection is False
+            if not wasConnected and not effectiveKeepConnection:
+                await self.disconnect()
+
+    @asynccontextmanager
+    async def _transaction(self, connection: aiosqlite.Connection) -> AsyncGenerator[aiosqlite.Cursor, None]:
+        """Yield a cursor, committing on success and rolling back on error, dood!
+
+        Args:
+            connection: Connection to run the transaction on.
+
+        Yields:
+            An open :class:`aiosqlite.Cursor`, closed when the context exits.
+        """
+        cursor = await connection.cursor()
         try:
             yield cursor
-            await self._connection.commit()
+            await connection.commit()
         except Exception as e:
-            await self._connection.rollback()
+            await connection.rollback()
             logger.error(f"Database operation failed: {e}")
             logger.exception(e)
             raise
         finally:
             # Close cursor before disconnecting to avoid "Connection closed" error
             await cursor.close()
-            # Only disconnect if we opened the connection ourselves AND keepConnection is False
-            if not wasConnected and not effectiveKeepConnection:
-                await self.disconnect()
 
     async def _makeQueryResult(self, cursor: aiosqlite.Cursor, fetchType: FetchType) -> QueryResult:
         """Convert a cursor's pending rows into the appropriate result type, dood!
@@ -401,33 +543,30 @@ class SQLite3Provider(BaseSQLProvider):
         """
         return f"LOWER({column}) LIKE LOWER(:{param})"
 
-    async def upsert(
+    def getUpsertQuery(
         self,
         table: str,
-        values: Dict[str, Any],
+        columns: Sequence[str],
         conflictColumns: List[str],
         updateExpressions: Optional[Dict[str, Any]] = None,
-    ) -> bool:
-        """Execute SQLite-specific upsert operation, dood!
+    ) -> str:
+        """Build SQLite-specific upsert query, dood!
 
         Args:
             table: Table name.
-            values: Dictionary of column names and values to insert.
+            columns: Column names to insert, one ``:column`` placeholder each.
             conflictColumns: List of columns that define the conflict target.
-            updateExpressions: Optional dict of column -> expression for UPDATE clause.
-                If None, all non-conflict columns are updated with their values.
-                If empty dict {}, do nothing on conflict (ON CONFLICT DO NOTHING).
-                Supports complex expressions like "messages_count = messages_count + 1"
-                or ExcludedValue() to set to excluded value.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause,
+                same semantics as in :meth:`upsert`.
 
         Returns:
-            True if successful.
+            The ``ON CONFLICT ... DO UPDATE`` statement.
         """
         if updateExpressions is None:
-            updateExpressions = {col: ExcludedValue() for col in values.keys() if col not in conflictColumns}
+            updateExpressions = {col: ExcludedValue() for col in columns if col not in conflictColumns}
 
-        colsStr = ", ".join(values.keys())
-        placeholders = ", ".join([f":{col}" for col in values.keys()])
+        colsStr = ", ".join(columns)
+        placeholders = ", ".join([f":{col}" for col in columns])
         conflictStr = ", ".join(conflictColumns)
 
         # Handle empty updateExpressions - do nothing on conflict
@@ -456,9 +595,68 @@ class SQLite3Provider(BaseSQLProvider):
                     {updateStr}
             """
 
+        return query
+
+    async def upsert(
+        self,
+        table: str,
+        values: Dict[str, Any],
+        conflictColumns: List[str],
+        updateExpressions: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Execute SQLite-specific upsert operation, dood!
+
+        Args:
+            table: Table name.
+            values: Dictionary of column names and values to insert.
+            conflictColumns: List of columns that define the conflict target.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause.
+                If None, all non-conflict columns are updated with their values.
+                If empty dict {}, do nothing on conflict (ON CONFLICT DO NOTHING).
+                Supports complex expressions like "messages_count = messages_count + 1"
+                or ExcludedValue() to set to excluded value.
+
+        Returns:
+            True if successful.
+        """
+        query = self.getUpsertQuery(table, list(values.keys()), conflictColumns, updateExpressions)
         await self.execute(query, values)
         return True
 
+    async def upsertMany(
+        self,
+        table: str,
+        rows: Sequence[Dict[str, Any]],
+        conflictColumns: List[str],
+        updateExpressions: Optional[Dict[str, Any]] = None,
+        *,
+        extraQueries: Sequence[ParametrizedQuery] = (),
+    ) -> bool:
+        """Upsert many rows via ``executemany`` in a single transaction, dood!
+
+        Args:
+            table: Table name.
+            rows: Rows to upsert. Every row must have the same set of columns.
+            conflictColumns: List of columns that define the conflict target.
+            updateExpressions: Optional dict of column -> expression for UPDATE clause,
+                same semantics as in :meth:`upsert`.
+            extraQueries: Queries executed after the upsert in the same transaction.
+
+        Returns:
+            True if successful.
+
+        Raises:
+            ValueError: If rows have different sets of columns.
+        """
+        columns = utils.getRowsColumns(rows)
+        async with self.cursor(keepConnection=self.keepConnection) as cursor:
+            if columns:
+                query = self.getUpsertQuery(table, columns, conflictColumns, updateExpressions)
+                await cursor.executemany(query, [utils.convertContainerElementsToSQLite(row) for row in rows])
+            for extraQuery in extraQueries:
+                await cursor.execute(extraQuery.query, utils.convertContainerElementsToSQLite(extraQuery.params))
+        return True
+
     async def isVectorSearchSupported(self) -> bool:
         """Check if sqlite-vec extension is loaded and operational.
 
@@ -467,6 +665,10 @@ class SQLite3Provider(BaseSQLProvider):
             :meth:`connect`, ``False`` otherwise.
         """
         # We need to connect to try to load sqlite-vec lib
+        if self._pool is not None:
+            await self.connect()
+            return self._isVectorSearchLoaded()
+
         if self._connection is None:
             await self.connect()
             if not self.keepConnection:
@@ -519,10 +721,10 @@ class SQLite3Provider(BaseSQLProvider):
         """
         # Auto-connect if needed — capability detection requires a live
         # connection because the sqlite-vec extension is loaded in connect().
-        if not self._vectorSearchAvailable and _SQLITE_VEC_AVAILABLE:
+        if not self._isVectorSearchLoaded() and _SQLITE_VEC_AVAILABLE:
             await self.connect()
 
-        if not self._vectorSearchAvailable:
+        if not self._isVectorSearchLoaded():
             raise NotImplementedError(f"{type(self).__name__} does not support native vector search")
 
         if distanceMetric != VectorDistanceMetric.COSINE:
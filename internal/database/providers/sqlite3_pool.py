@@ -0,0 +1,275 @@
+"""Connection pool for the SQLite3 provider.
+
+Provides :class:`SQLite3ConnectionPool`, used by :class:`SQLite3Provider` in
+pooled mode: one long-lived writer connection plus up to N reader connections
+for a WAL database. Every :mod:`aiosqlite` connection runs on its own worker
+thread, so a slow read no longer blocks writes (or other reads).
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import List, Optional, TypedDict
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+SQLite3ConnectionFactory = Callable[[bool], Awaitable[aiosqlite.Connection]]
+"""Async factory opening a configured connection.
+
+Args:
+    readOnly: Whether the connection is a reader (opened with ``PRAGMA query_only``)
+
+Returns:
+    Open :class:`aiosqlite.Connection`
+"""
+
+
+class SQLite3PoolStats(TypedDict):
+    """Utilisation and wait-time metrics of a :class:`SQLite3ConnectionPool`."""
+
+    readerPoolSize: int
+    """Maximum number of reader connections."""
+    readersOpen: int
+    """Reader connections currently open."""
+    readersInUse: int
+    """Reader connections currently handed out."""
+    writerInUse: bool
+    """Whether the writer connection is currently handed out."""
+    readAcquisitions: int
+    """Total number of reader acquisitions."""
+    writeAcquisitions: int
+    """Total number of writer acquisitions."""
+    readWaits: int
+    """Reader acquisitions that had to wait for a free connection."""
+    writeWaits: int
+    """Writer acquisitions that had to wait for the writer."""
+    readWaitTimeTotal: float
+    """Total seconds spent waiting for reader connections."""
+    readWaitTimeMax: float
+    """Longest wait for a reader connection, in seconds."""
+    writeWaitTimeTotal: float
+    """Total seconds spent waiting for the writer connection."""
+    writeWaitTimeMax: float
+    """Longest wait for the writer connection, in seconds."""
+    healthCheckFailures: int
+    """Connections found broken by a health check and reopened."""
+
+
+class _PooledConnection:
+    """Connection owned by the pool with its last-use time."""
+
+    __slots__ = ("connection", "lastUsed")
+
+    def __init__(self, connection: aiosqlite.Connection) -> None:
+        self.connection: aiosqlite.Connection = connection
+        """Underlying aiosqlite connection."""
+        self.lastUsed: float = time.monotonic()
+        """Monotonic time the connection was last released."""
+
+
+class SQLite3ConnectionPool:
+    """Pool of one writer and several reader SQLite3 connections.
+
+    The writer is exclusive: a transaction holds it until commit or rollback,
+    so concurrent writes are serialised instead of interleaving on a shared
+    connection. Readers are opened lazily up to ``readerPoolSize`` and reused.
+    Connections idle for longer than ``healthCheckInterval`` are checked with
+    ``SELECT 1`` before being handed out and reopened if the check fails.
+    """
+
+    __slots__ = (
+        "readerPoolSize",
+        "healthCheckInterval",
+        "_connectionFactory",
+        "_writer",
+        "_writerLock",
+        "_idleReaders",
+        "_readerSlots",
+        "_readersOpen",
+        "_readersInUse",
+        "_closed",
+        "_readStats",
+        "_writeStats",
+        "_healthCheckFailures",
+    )
+
+    def __init__(
+        self,
+        connectionFactory: SQLite3ConnectionFactory,
+        *,
+        readerPoolSize: int,
+        healthCheckInterval: float = 30.0,
+    ) -> None:
+        """Initialise the pool without opening any connection.
+
+        Args:
+            connectionFactory: Async factory opening a configured connection.
+            readerPoolSize: Maximum number of reader connections, at least 1.
+            healthCheckInterval: Seconds a connection may stay idle before it
+                is health-checked on its next use.
+
+        Raises:
+            ValueError: If ``readerPoolSize`` is less than 1.
+        """
+        if readerPoolSize < 1:
+            raise ValueError(f"readerPoolSize must be at least 1, got {readerPoolSize}")
+
+        self.readerPoolSize: int = readerPoolSize
+        """Maximum number of reader connections."""
+        self.healthCheckInterval: float = healthCheckInterval
+        """Idle seconds after which a connection is health-checked before use."""
+        self._connectionFactory: SQLite3ConnectionFactory = connectionFactory
+        self._writer: Optional[_PooledConnection] = None
+        self._writerLock: asyncio.Lock = asyncio.Lock()
+        self._idleReaders: List[_PooledConnection] = []
+        self._readerSlots: asyncio.Semaphore = asyncio.Semaphore(readerPoolSize)
+        self._readersOpen: int = 0
+        self._readersInUse: int = 0
+        self._closed: bool = False
+        # acquisitions, waits, total wait time, max wait time
+        self._readStats: List[float] = [0, 0, 0.0, 0.0]
+        self._writeStats: List[float] = [0, 0, 0.0, 0.0]
+        self._healthCheckFailures: int = 0
+
+    async def connect(self) -> None:
+        """Open the writer connection if it is not open yet."""
+        async with self._writerLock:
+            self._closed = False
+            if self._writer is None:
+                self._writer = _PooledConnection(await self._connectionFactory(False))
+
+    async def close(self) -> None:
+        """Close all connections.
+
+        Waits for the writer to be released. Readers in use are closed when
+        they are released.
+        """
+        async with self._writerLock:
+            self._closed = True
+            if self._writer is not None:
+                await self._closeQuietly(self._writer)
+                self._writer = None
+        idleReaders, self._idleReaders = self._idleReaders, []
+        for pooled in idleReaders:
+            await self._closeQuietly(pooled)
+            self._readersOpen -= 1
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Acquire the writer connection exclusively.
+
+        Yields:
+            The writer connection, held until the context exits.
+        """
+        startTime = time.monotonic()
+        waited = self._writerLock.locked()
+        async with self._writerLock:
+            self._recordAcquisition(self._writeStats, waited, time.monotonic() - startTime)
+            self._closed = False
+            if self._writer is None:
+                self._writer = _PooledConnection(await self._connectionFactory(False))
+            pooled = await self._ensureHealthy(self._writer, readOnly=False)
+            self._writer = pooled
+            try:
+                yield pooled.connection
+            finally:
+                pooled.lastUsed = time.monotonic()
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Acquire a reader connection, opening one if none is idle.
+
+        Yields:
+            A reader connection, returned to the pool when the context exits.
+        """
+        startTime = time.monotonic()
+        waited = self._readerSlots.locked()
+        async with self._readerSlots:
+            self._recordAcquisition(self._readStats, waited, time.monotonic() - startTime)
+            self._closed = False
+            if self._idleReaders:
+                try:
+                    pooled = await self._ensureHealthy(self._idleReaders.pop(), readOnly=True)
+                except Exception:
+                    # Broken reader was closed and could not be reopened
+                    self._readersOpen -= 1
+                    raise
+            else:
+                pooled = _PooledConnection(await self._connectionFactory(True))
+                self._readersOpen += 1
+
+            self._readersInUse += 1
+            try:
+                yield pooled.connection
+            finally:
+                self._readersInUse -= 1
+                pooled.lastUsed = time.monotonic()
+                if self._closed:
+                    await self._closeQuietly(pooled)
+                    self._readersOpen -= 1
+                else:
+                    self._idleReaders.append(pooled)
+
+    def getStats(self) -> SQLite3PoolStats:
+        """Return current utilisation and wait-time metrics.
+
+        Returns:
+            Snapshot of the pool metrics.
+        """
+        return {
+            "readerPoolSize": self.readerPoolSize,
+            "readersOpen": self._readersOpen,
+            "readersInUse": self._readersInUse,
+            "writerInUse": self._writerLock.locked(),
+            "readAcquisitions": int(self._readStats[0]),
+            "writeAcquisitions": int(self._writeStats[0]),
+            "readWaits": int(self._readStats[1]),
+            "writeWaits": int(self._writeStats[1]),
+            "readWaitTimeTotal": self._readStats[2],
+            "readWaitTimeMax": self._readStats[3],
+            "writeWaitTimeTotal": self._writeStats[2],
+            "writeWaitTimeMax": self._writeStats[3],
+            "healthCheckFailures": self._healthCheckFailures,
+        }
+
+    def _recordAcquisition(self, stats: List[float], waited: bool, waitTime: float) -> None:
+        """Account one acquisition in the given stats counters."""
+        stats[0] += 1
+        if waited:
+            stats[1] += 1
+        stats[2] += waitTime
+        stats[3] = max(stats[3], waitTime)
+
+    async def _ensureHealthy(self, pooled: _PooledConnection, *, readOnly: bool) -> _PooledConnection:
+        """Health-check a connection idle for too long, reopening it if broken.
+
+        Args:
+            pooled: Connection about to be handed out.
+            readOnly: Whether the connection is a reader.
+
+        Returns:
+            The same connection if healthy (or recently used), otherwise a new one.
+        """
+        if time.monotonic() - pooled.lastUsed < self.healthCheckInterval:
+            return pooled
+
+        try:
+            async with pooled.connection.execute("SELECT 1") as cursor:
+                await cursor.fetchone()
+            return pooled
+        except Exception as e:
+            self._healthCheckFailures += 1
+            logger.warning(f"SQLite3 {'reader' if readOnly else 'writer'} connection failed health check: {e}")
+            await self._closeQuietly(pooled)
+            return _PooledConnection(await self._connectionFactory(readOnly))
+
+    async def _closeQuietly(self, pooled: _PooledConnection) -> None:
+        """Close a connection, logging instead of raising on failure."""
+        try:
+            await pooled.connection.close()
+        except Exception as e:
+            logger.warning(f"Error while closing SQLite3 connection: {e}")
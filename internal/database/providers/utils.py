@@ -84,3 +84,44 @@ def convertContainerElementsToSQLite(data: Union[Mapping, Sequence, None]) -> Un
         return [convertToSQLite(value) for value in data]
     else:
         raise TypeError(f"Unsupported type {type(data)} for SQL converting")
+
+
+def getRowsColumns(rows: Sequence[Mapping[str, Any]]) -> list[str]:
+    """Get the shared column list of rows for a multi-row statement.
+
+    Args:
+        rows: Rows to be written by one statement.
+
+    Returns:
+        Column names of the first row (empty list for no rows).
+
+    Raises:
+        ValueError: If any row has a different set of columns.
+    """
+    if not rows:
+        return []
+    columns = list(rows[0].keys())
+    columnsSet = set(columns)
+    for row in rows:
+        if len(row) != len(columns) or not columnsSet.issuperset(row.keys()):
+            raise ValueError(f"All rows must have the same columns: {columns} != {list(row.keys())}")
+    return columns
+
+
+def convertNamedToPositional(query: str, params: Mapping[str, Any]) -> tuple[str, list[Any]]:
+    """Convert ``:name`` placeholders to PostgreSQL ``$N`` positional ones.
+
+    Longer names are replaced first, so ``:date1`` does not clobber
+    ``:date10`` (or ``:labels`` ``:labels_hash``).
+
+    Args:
+        query: SQL query with ``:name`` placeholders.
+        params: Named parameters; ``$N`` follows their order.
+
+    Returns:
+        Tuple of the converted query and the parameter values in ``$N`` order.
+    """
+    names = list(params.keys())
+    for idx in sorted(range(len(names)), key=lambda i: len(names[i]), reverse=True):
+        query = query.replace(f":{names[idx]}", f"${idx + 1}")
+    return query, list(params.values())
@@ -89,7 +89,7 @@ class CacheRepository(BaseRepository):
                 FROM cache_storage
                 ORDER BY updated_at DESC
                 """)
-            return [dbUtils.sqlToTypedDict(row, CacheStorageDict) for row in rows]
+            return dbUtils.getRowDecoder(CacheStorageDict).decodeRows(rows)
         except Exception as e:
             logger.error(f"Failed to get cache storage: {e}")
             return []
@@ -14,14 +14,14 @@ embedding repository now owns the embedding storage lifecycle; the
 search repository owns the ranking path that consumes the stored
 vectors.
 
-The repository no longer maintains an in-memory embedding cache —
-semantic search re-loads embeddings from ``message_embeddings`` on
-every call. Caching belongs in the handler layer (via
-``CacheService``) and intentionally does not live in the database
-layer.
+When a shared :class:`EmbeddingsIndex` is injected (``Database`` does
+this), every write through this repository is mirrored into the
+resident index so the search repository never serves a stale vector
+for a message it knows about.
 """
 
 import array
+import datetime
 import logging
 import re
 from typing import Any, Dict, List, Optional
@@ -30,7 +30,9 @@ import lib.utils as libUtils
 from internal.models import MessageId
 
 from .. import utils as dbUtils
+from ..embeddings_index import EmbeddingsIndex
 from ..manager import DatabaseManager
+from ..message_ingestion import ChatMessageIngestion
 from ..models import ChatMessageDict, MessageEmbeddingDict
 from ..providers.base import (
     BaseSQLProvider,
@@ -54,17 +56,35 @@ class ChatEmbeddingsRepository(BaseRepository):
     The semantic-search path that consumes these embeddings lives in
     :class:`ChatSearchRepository` (``chat_search.py``). Callers that
     need a search hit set go through ``Database.chatSearch.searchChatMessages``.
+
+    Attributes:
+        embeddingsIndex: Optional resident index shared with
+            :class:`ChatSearchRepository`, kept current on every write.
+        ingestion: Optional group-commit queue of saved messages, committed
+            before the backfill helpers read ``chat_messages``.
     """
 
-    __slots__ = ()
+    __slots__ = ("embeddingsIndex", "ingestion")
 
-    def __init__(self, manager: DatabaseManager) -> None:
+    def __init__(
+        self,
+        manager: DatabaseManager,
+        *,
+        embeddingsIndex: Optional[EmbeddingsIndex] = None,
+        ingestion: Optional[ChatMessageIngestion] = None,
+    ) -> None:
         """Initialize the chat embeddings repository.
 
         Args:
             manager: Database manager instance for provider access.
+            embeddingsIndex: Optional resident embeddings index to keep
+                current on writes.
+            ingestion: Optional group-commit queue of saved messages;
+                the backfill helpers commit the chat's queued messages first.
         """
         super().__init__(manager)
+        self.embeddingsIndex: Optional[EmbeddingsIndex] = embeddingsIndex
+        self.ingestion: Optional[ChatMessageIngestion] = ingestion
 
     ###
     # Embedding CRUD
@@ -92,6 +112,9 @@ class ChatEmbeddingsRepository(BaseRepository):
         are logged and swallowed — ``message_embeddings`` remains the
         authoritative source.
 
+        When an :class:`EmbeddingsIndex` is attached, the vector is also
+        applied to the resident ``(chatId, model)`` entry (if loaded).
+
         Args:
             chatId: Chat identifier.
             messageId: Message identifier.
@@ -134,6 +157,8 @@ class ChatEmbeddingsRepository(BaseRepository):
                     "updated_at": ExcludedValue(),
                 },
             )
+            if self.embeddingsIndex is not None:
+                self.embeddingsIndex.upsert(chatId, model, messageId.asStr(), embedding, date=date or now)
 
             # Dual-write to vec0 virtual table for native vector search.
             # Failures are logged and swallowed inside the helper — the
@@ -331,6 +356,8 @@ class ChatEmbeddingsRepository(BaseRepository):
                 "DELETE FROM message_embeddings WHERE chat_id = :chatId",
                 {"chatId": chatId},
             )
+            if self.embeddingsIndex is not None:
+                self.embeddingsIndex.dropChat(chatId)
         except Exception as e:
             logger.error(f"Failed to delete embeddings for chat {chatId}: {e}")
 
@@ -354,6 +381,9 @@ class ChatEmbeddingsRepository(BaseRepository):
            native vector search is available) — so the vec0 mirror stays
            consistent with ``message_embeddings``.
 
+        The matching entries of the attached :class:`EmbeddingsIndex` (if
+        any) are dropped right after step 1.
+
         Stateless and idempotent: on the common path (model unchanged)
         the DELETE matches zero rows. Callers should gate this with their
         own change-detection logic to avoid unnecessary work.
@@ -413,6 +443,8 @@ class ChatEmbeddingsRepository(BaseRepository):
                     "DELETE FROM message_embeddings WHERE chat_id = :chatId AND model != :currentModel",
                     {"chatId": chatId, "currentModel": currentModel},
                 )
+            if self.embeddingsIndex is not None:
+                self.embeddingsIndex.dropObsolete(chatId, currentModel, currentDimensions)
 
             # 2. Delete from vec0 virtual tables (best-effort).
             if await sqlProvider.isVectorSearchSupported():
@@ -469,6 +501,8 @@ class ChatEmbeddingsRepository(BaseRepository):
         *,
         limit: int = 100,
         modelName: Optional[str] = None,
+        beforeDate: Optional[datetime.datetime] = None,
+        beforeMessageId: Optional[MessageId] = None,
         dataSource: Optional[str] = None,
     ) -> List[ChatMessageDict]:
         """Return pending messages (without embeddings) as full dicts.
@@ -498,6 +532,12 @@ class ChatEmbeddingsRepository(BaseRepository):
                 setting should re-embed rows produced by the previous model.
                 When ``None``, only rows with no ``message_embeddings`` row at
                 all are returned.
+            beforeDate: Keyset cursor — when set together with
+                ``beforeMessageId``, only rows strictly older than
+                ``(beforeDate, beforeMessageId)`` in the result ordering are
+                returned, so a backfill pass can resume after the last row
+                it processed instead of rescanning from the newest message.
+            beforeMessageId: Message id half of the keyset cursor.
             dataSource: Optional explicit data source.
 
         Returns:
@@ -511,6 +551,8 @@ class ChatEmbeddingsRepository(BaseRepository):
         #     f"limit={limit}, modelName={modelName}, dataSource={dataSource}"
         # )
         try:
+            if self.ingestion is not None:
+                await self.ingestion.flush(chatId)
             sqlProvider = await self.manager.getProvider(chatId=chatId, dataSource=dataSource, readonly=True)
 
             query = """
@@ -528,6 +570,11 @@ class ChatEmbeddingsRepository(BaseRepository):
                         AND me.message_id = c.message_id
                         AND (:modelName IS NULL OR me.model = :modelName)
                     )
+                    AND (
+                        :beforeDate IS NULL
+                        OR c.date < :beforeDate
+                        OR (c.date = :beforeDate AND c.message_id < :beforeMessageId)
+                    )
                 ORDER BY c.date DESC, c.message_id DESC
             """
             # ``modelName`` is always present in the binding params so
@@ -537,14 +584,66 @@ class ChatEmbeddingsRepository(BaseRepository):
             # placeholder is referenced in the query string but not
             # bound, so we cannot omit the key when ``modelName`` is
             # ``None``.
+            hasCursor = beforeDate is not None and beforeMessageId is not None
             params: Dict[str, Any] = {
                 "chatId": chatId,
                 "modelName": modelName,
+                "beforeDate": beforeDate if hasCursor else None,
+                "beforeMessageId": beforeMessageId if hasCursor else None,
             }
 
             query = sqlProvider.applyPagination(query=query, limit=int(limit))
             rows = await sqlProvider.executeFetchAll(query, params)
-            return [dbUtils.sqlToTypedDict(row, ChatMessageDict) for row in rows]
+            return dbUtils.getRowDecoder(ChatMessageDict).decodeRows(rows)
         except Exception as e:
             logger.error(f"Failed to list messages without embeddings for chat {chatId}: {e}")
             return []
+
+    async def countMessagesWithoutEmbeddings(
+        self,
+        chatId: int,
+        *,
+        modelName: Optional[str] = None,
+        dataSource: Optional[str] = None,
+    ) -> Optional[int]:
+        """Count pending messages (without embeddings) in a chat.
+
+        Same filter as :meth:`getMessagesWithoutEmbeddings` (without the
+        keyset cursor and without joining ``chat_users``). Used by the
+        backfill engine to size a chat's backlog for prioritisation and
+        ETA reporting.
+
+        Args:
+            chatId: Chat identifier to scan.
+            modelName: When provided, rows embedded by a different model
+                count as pending too (see :meth:`getMessagesWithoutEmbeddings`).
+            dataSource: Optional explicit data source.
+
+        Returns:
+            Number of pending messages, or ``None`` on error.
+        """
+        try:
+            if self.ingestion is not None:
+                await self.ingestion.flush(chatId)
+            sqlProvider = await self.manager.getProvider(chatId=chatId, dataSource=dataSource, readonly=True)
+            row = await sqlProvider.executeFetchOne(
+                """
+                SELECT COUNT(*) AS cnt
+                FROM chat_messages c
+                WHERE
+                    c.chat_id = :chatId
+                    AND c.message_text IS NOT NULL
+                    AND c.message_text != ''
+                    AND NOT EXISTS (
+                        SELECT 1 FROM message_embeddings me
+                        WHERE me.chat_id = c.chat_id
+                        AND me.message_id = c.message_id
+                        AND (:modelName IS NULL OR me.model = :modelName)
+                    )
+                """,
+                {"chatId": chatId, "modelName": modelName},
+            )
+            return int(row["cnt"]) if row is not None else 0
+        except Exception as e:
+            logger.error(f"Failed to count messages without embeddings for chat {chatId}: {e}")
+            return None
@@ -199,7 +199,7 @@ class ChatInfoRepository(BaseRepository):
                     "chatId": chatId,
                 },
             )
-            return [dbUtils.sqlToTypedDict(row, ChatTopicInfoDict) for row in rows]
+            return dbUtils.getRowDecoder(ChatTopicInfoDict).decodeRows(rows)
         except Exception as e:
             logger.error(f"Failed to get chat topics: {e}")
             return []
@@ -15,19 +15,70 @@ both of its modes (filter-only SQL and semantic embedding) live in
 
 import datetime
 import logging
+from collections import Counter
 from collections.abc import Mapping, Sequence
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from internal.models import MessageId, MessageType
 
 from .. import utils as dbUtils
 from ..manager import DatabaseManager
+from ..message_ingestion import ChatMessageIngestion, ChatMessageIngestionConfig, PendingChatMessage
 from ..models import ChatMessageDict, MessageCategory, ThreadResultDict
-from ..providers.base import ExcludedValue
+from ..providers.base import BaseSQLProvider, ExcludedValue, ParametrizedQuery
 from .base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+_INSERT_COLUMNS = (
+    "date",
+    "chat_id",
+    "user_id",
+    "message_id",
+    "reply_id",
+    "thread_id",
+    "message_text",
+    "message_type",
+    "message_category",
+    "root_message_id",
+    "quote_text",
+    "media_id",
+    "markup",
+    "metadata",
+    "media_group_id",
+    "created_at",
+)
+"""``chat_messages`` columns written by :meth:`ChatMessagesRepository.saveChatMessage`."""
+
+_INSERT_PARAMS = (
+    "date",
+    "chatId",
+    "userId",
+    "messageId",
+    "replyId",
+    "threadId",
+    "messageText",
+    "messageType",
+    "messageCategory",
+    "rootMessageId",
+    "quoteText",
+    "mediaId",
+    "markup",
+    "metadata",
+    "mediaGroupId",
+    "createdAt",
+)
+"""Parameter names matching :data:`_INSERT_COLUMNS`."""
+
+_INSERT_CHUNK_ROWS = 50
+"""Maximum rows per multi-row INSERT (keeps the bound parameter count well below driver limits)."""
+
+_STATS_UPDATE_EXPRESSIONS: Dict[str, Any] = {
+    "messages_count": "messages_count + :messages_count",
+    "updated_at": ExcludedValue(),
+}
+"""Upsert update clause adding a pre-aggregated count to the daily stats row."""
+
 
 class ChatMessagesRepository(BaseRepository):
     """Repository for managing chat messages in the database.
@@ -38,17 +89,27 @@ class ChatMessagesRepository(BaseRepository):
     (filter-only and semantic) lives in :class:`ChatSearchRepository` and
     is exposed via ``Database.chatSearch.searchChatMessages``. Embedding
     CRUD lives in :class:`ChatEmbeddingsRepository`.
+
+    With group-commit ingestion enabled, :meth:`saveChatMessage` queues the
+    message and waits for the group commit it shares with other chats; reads
+    and updates of a chat commit that chat's queued messages first.
     """
 
-    __slots__ = ()
+    __slots__ = ("ingestion",)
 
-    def __init__(self, manager: DatabaseManager) -> None:
+    def __init__(
+        self, manager: DatabaseManager, *, ingestionConfig: Optional[ChatMessageIngestionConfig] = None
+    ) -> None:
         """Initialize the chat messages repository.
 
         Args:
             manager: Database manager instance for provider access.
+            ingestionConfig: Optional group-commit ingestion configuration,
+                see :class:`ChatMessageIngestionConfig`.
         """
         super().__init__(manager)
+        self.ingestion = ChatMessageIngestion(self._writeMessages, ingestionConfig)
+        """Group-commit queue of saved messages (writes through when disabled)."""
 
     ###
     # Chat messages manipulation functions
@@ -75,7 +136,8 @@ class ChatMessagesRepository(BaseRepository):
 
         This method stores a chat message in the database along with its metadata,
         updates related statistics (chat_users, chat_stats, chat_user_stats), and
-        handles threaded conversations and media groups.
+        handles threaded conversations and media groups. The message and its
+        statistics are written in one transaction.
 
         Args:
             date (datetime.datetime): Message timestamp
@@ -102,34 +164,17 @@ class ChatMessagesRepository(BaseRepository):
 
         Note:
             Writes are routed based on chatId mapping. Cannot write to readonly sources.
+            With group-commit ingestion enabled the message is queued and committed
+            within ``flushInterval`` seconds together with messages from other chats;
+            the call returns once that commit is done.
         """
-        if markup is None:
-            markup = []
-        if metadata is None:
-            metadata = {}
         if threadId is None:
             threadId = dbUtils.DEFAULT_THREAD_ID
         try:
             sqlProvider = await self.manager.getProvider(chatId=chatId, readonly=False)
-            today = date.replace(hour=0, minute=0, second=0, microsecond=0)
-            currentTimestamp = dbUtils.getCurrentTimestamp()
-
-            # Insert chat message
-            await sqlProvider.execute(
-                """
-                INSERT INTO chat_messages
-                (date, chat_id, user_id, message_id,
-                    reply_id, thread_id, message_text, message_type,
-                    message_category, root_message_id, quote_text,
-                    media_id, markup, metadata, media_group_id, created_at
-                    )
-                VALUES
-                (:date, :chatId, :userId, :messageId,
-                    :replyId, :threadId, :messageText, :messageType,
-                    :messageCategory, :rootMessageId, :quoteText,
-                    :mediaId, :markup, :metadata, :mediaGroupId, :createdAt
-                    )
-            """,
+            message = PendingChatMessage(
+                sqlProvider,
+                chatId,
                 {
                     "date": date,
                     "chatId": chatId,
@@ -143,67 +188,186 @@ class ChatMessagesRepository(BaseRepository):
                     "rootMessageId": rootMessageId,
                     "quoteText": quoteText,
                     "mediaId": mediaId,
-                    "markup": markup,
-                    "metadata": metadata,
+                    # Copies, the message may be written after the caller changed them
+                    "markup": [] if markup is None else list(markup),
+                    "metadata": {} if metadata is None else dict(metadata),
                     "mediaGroupId": mediaGroupId,
-                    "createdAt": currentTimestamp,
+                    "createdAt": dbUtils.getCurrentTimestamp(),
                 },
             )
+        except Exception as e:
+            logger.error(f"Failed to save chat message from user {userId} in chat {chatId}: {e}")
+            return False
 
-            # Update chat users message count
-            await sqlProvider.execute(
-                """
-                UPDATE chat_users
-                SET messages_count = messages_count + 1,
-                    updated_at = :updatedAt
-                WHERE chat_id = :chatId AND user_id = :userId
-            """,
-                {
-                    "chatId": chatId,
-                    "userId": userId,
-                    "updatedAt": currentTimestamp,
-                },
+        return await self.ingestion.submit(message)
+
+    async def flushPendingMessages(self, chatId: Optional[int] = None) -> int:
+        """Commit messages queued by the group-commit ingestion.
+
+        Args:
+            chatId (Optional[int]): If given, only commit when this chat has queued messages
+
+        Returns:
+            int: Number of messages written
+        """
+        return await self.ingestion.flush(chatId)
+
+    async def _writeMessages(self, messages: Sequence[PendingChatMessage]) -> int:
+        """Store a group of messages, one transaction per provider.
+
+        If a group transaction fails (e.g. one duplicate message), its
+        messages are retried one transaction each so a single bad message
+        does not drop the whole group.
+
+        Args:
+            messages (Sequence[PendingChatMessage]): Messages to store, in submission order
+
+        Returns:
+            int: Number of messages stored
+        """
+        byProvider: Dict[int, List[PendingChatMessage]] = {}
+        for message in messages:
+            byProvider.setdefault(id(message.provider), []).append(message)
+
+        written = 0
+        for group in byProvider.values():
+            sqlProvider = group[0].provider
+            try:
+                await sqlProvider.batchExecute(self._buildSaveQueries(sqlProvider, group))
+                for message in group:
+                    message.stored = True
+                written += len(group)
+                continue
+            except Exception as e:
+                if len(group) == 1:
+                    values = group[0].values
+                    logger.error(
+                        f"Failed to save chat message from user {values['userId']} in chat {values['chatId']}: {e}"
+                    )
+                    continue
+                logger.warning(f"Group commit of {len(group)} chat messages failed, retrying one by one: {e}")
+
+            for message in group:
+                try:
+                    await sqlProvider.batchExecute(self._buildSaveQueries(sqlProvider, [message]))
+                    message.stored = True
+                    written += 1
+                except Exception as e:
+                    values = message.values
+                    logger.error(
+                        f"Failed to save chat message from user {values['userId']} in chat {values['chatId']}: {e}"
+                    )
+        return written
+
+    def _buildSaveQueries(
+        self, sqlProvider: BaseSQLProvider, messages: Sequence[PendingChatMessage]
+    ) -> List[ParametrizedQuery]:
+        """Build the queries storing messages and updating their statistics.
+
+        Messages are inserted with multi-row INSERTs. ``chat_users``,
+        ``chat_stats`` and ``chat_user_stats`` get one statement per key
+        with the increments pre-aggregated over the group.
+
+        Args:
+            sqlProvider (BaseSQLProvider): Provider the queries are built for
+            messages (Sequence[PendingChatMessage]): Messages to store
+
+        Returns:
+            List[ParametrizedQuery]: Queries to run in one transaction
+        """
+        currentTimestamp = dbUtils.getCurrentTimestamp()
+        queries: List[ParametrizedQuery] = []
+
+        for chunkStart in range(0, len(messages), _INSERT_CHUNK_ROWS):
+            chunk = messages[chunkStart : chunkStart + _INSERT_CHUNK_ROWS]
+            params: Dict[str, Any] = {}
+            rowsPlaceholders: List[str] = []
+            for i, message in enumerate(chunk):
+                # Fixed-width row suffixes, so no parameter name is a prefix of another
+                params.update({f"{key}_{i:03d}": value for key, value in message.values.items()})
+                rowsPlaceholders.append("(" + ", ".join(f":{key}_{i:03d}" for key in _INSERT_PARAMS) + ")")
+            queries.append(
+                ParametrizedQuery(
+                    f"""
+                    INSERT INTO chat_messages
+                    ({", ".join(_INSERT_COLUMNS)})
+                    VALUES
+                    {", ".join(rowsPlaceholders)}
+                """,
+                    params,
+                )
             )
 
-            # Upsert chat stats
-            await sqlProvider.upsert(
-                table="chat_stats",
-                values={
-                    "chat_id": chatId,
-                    "date": today,
-                    "messages_count": 1,
-                    "updated_at": currentTimestamp,
-                    "created_at": currentTimestamp,
-                },
-                conflictColumns=["chat_id", "date"],
-                updateExpressions={
-                    "messages_count": "messages_count + 1",
-                    "updated_at": ExcludedValue(),
-                },
+        usersCount: Counter[Tuple[int, int]] = Counter()
+        chatStatsCount: Counter[Tuple[int, datetime.datetime]] = Counter()
+        userStatsCount: Counter[Tuple[int, int, datetime.datetime]] = Counter()
+        for message in messages:
+            chatId = message.values["chatId"]
+            userId = message.values["userId"]
+            today = message.values["date"].replace(hour=0, minute=0, second=0, microsecond=0)
+            usersCount[(chatId, userId)] += 1
+            chatStatsCount[(chatId, today)] += 1
+            userStatsCount[(chatId, userId, today)] += 1
+
+        # Update chat users message count
+        for (chatId, userId), count in usersCount.items():
+            queries.append(
+                ParametrizedQuery(
+                    """
+                    UPDATE chat_users
+                    SET messages_count = messages_count + :count,
+                        updated_at = :updatedAt
+                    WHERE chat_id = :chatId AND user_id = :userId
+                """,
+                    {"chatId": chatId, "userId": userId, "count": count, "updatedAt": currentTimestamp},
+                )
             )
 
-            # Upsert chat user stats
-            await sqlProvider.upsert(
-                table="chat_user_stats",
-                values={
-                    "chat_id": chatId,
-                    "user_id": userId,
-                    "date": today,
-                    "messages_count": 1,
-                    "updated_at": currentTimestamp,
-                    "created_at": currentTimestamp,
-                },
-                conflictColumns=["chat_id", "user_id", "date"],
-                updateExpressions={
-                    "messages_count": "messages_count + 1",
-                    "updated_at": ExcludedValue(),
-                },
+        # Upsert chat stats
+        statsColumns = ["chat_id", "date", "messages_count", "updated_at", "created_at"]
+        query = sqlProvider.getUpsertQuery(
+            table="chat_stats",
+            columns=statsColumns,
+            conflictColumns=["chat_id", "date"],
+            updateExpressions=_STATS_UPDATE_EXPRESSIONS,
+        )
+        for (chatId, today), count in chatStatsCount.items():
+            queries.append(
+                ParametrizedQuery(
+                    query,
+                    {
+                        "chat_id": chatId,
+                        "date": today,
+                        "messages_count": count,
+                        "updated_at": currentTimestamp,
+                        "created_at": currentTimestamp,
+                    },
+                )
             )
 
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save chat message from user {userId} in chat {chatId}: {e}")
-            return False
+        # Upsert chat user stats
+        query = sqlProvider.getUpsertQuery(
+            table="chat_user_stats",
+            columns=["user_id", *statsColumns],
+            conflictColumns=["chat_id", "user_id", "date"],
+            updateExpressions=_STATS_UPDATE_EXPRESSIONS,
+        )
+        for (chatId, userId, today), count in userStatsCount.items():
+            queries.append(
+                ParametrizedQuery(
+                    query,
+                    {
+                        "user_id": userId,
+                        "chat_id": chatId,
+                        "date": today,
+                        "messages_count": count,
+                        "updated_at": currentTimestamp,
+                        "created_at": currentTimestamp,
+                    },
+                )
+            )
+
+        return queries
 
     async def getChatMessagesSince(
         self,
@@ -256,6 +420,7 @@ class ChatMessagesRepository(BaseRepository):
                     placeholders.append(f":messageCategory{i}")
                     params[f"messageCategory{i}"] = category
 
+            await self.ingestion.flush(chatId)
             sqlProvider = await self.manager.getProvider(chatId=chatId, dataSource=dataSource, readonly=True)
             query = f"""
                 SELECT c.*, u.username, u.full_name  FROM chat_messages c
@@ -275,7 +440,7 @@ class ChatMessagesRepository(BaseRepository):
                 query,
                 params,
             )
-            return [dbUtils.sqlToTypedDict(row, ChatMessageDict) for row in rows]
+            return dbUtils.getRowDecoder(ChatMessageDict).decodeRows(rows)
         except Exception as e:
             logger.error(
                 f"Failed to get chat messages for chat {chatId} since {sinceDateTime} (threadId={threadId}): {e}"
@@ -302,6 +467,7 @@ class ChatMessagesRepository(BaseRepository):
         """
         logger.debug(f"Getting chat message for chat {chatId}, message_id {messageId}")
         try:
+            await self.ingestion.flush(chatId)
             sqlProvider = await self.manager.getProvider(chatId=chatId, dataSource=dataSource, readonly=True)
 
             row = await sqlProvider.executeFetchOne(
@@ -347,6 +513,7 @@ class ChatMessagesRepository(BaseRepository):
         """
         logger.debug(f"Getting chat messages for chat {chatId}, thread {threadId}, root_message_id {rootMessageId}")
         try:
+            await self.ingestion.flush(chatId)
             sqlProvider = await self.manager.getProvider(chatId=chatId, dataSource=dataSource, readonly=True)
             rows = await sqlProvider.executeFetchAll(
                 """
@@ -364,7 +531,7 @@ class ChatMessagesRepository(BaseRepository):
                     "threadId": threadId,
                 },
             )
-            return [dbUtils.sqlToTypedDict(row, ChatMessageDict) for row in rows]
+            return dbUtils.getRowDecoder(ChatMessageDict).decodeRows(rows)
         except Exception as e:
             logger.error(
                 f"Failed to get chat messages for chat {chatId}, thread {threadId}, "
@@ -394,6 +561,7 @@ class ChatMessagesRepository(BaseRepository):
         """
         logger.debug(f"Getting chat messages for chat {chatId}, user {userId}")
         try:
+            await self.ingestion.flush(chatId)
             sqlProvider = await self.manager.getProvider(chatId=chatId, dataSource=dataSource, readonly=True)
             rows = await sqlProvider.executeFetchAll(
                 """
@@ -411,7 +579,7 @@ class ChatMessagesRepository(BaseRepository):
                     "limit": limit,
                 },
             )
-            return [dbUtils.sqlToTypedDict(row, ChatMessageDict) for row in rows]
+            return dbUtils.getRowDecoder(ChatMessageDict).decodeRows(rows)
         except Exception as e:
             logger.error(f"Failed to get chat messages for chat {chatId}, user {userId}: {e}")
             return []
@@ -445,6 +613,7 @@ class ChatMessagesRepository(BaseRepository):
         #     f"Getting first chat message for chat {chatId}, thread {threadId}, media_group_id {mediaGroupId}"
         # )
         try:
+            await self.ingestion.flush(chatId)
             sqlProvider = await self.manager.getProvider(chatId=chatId, dataSource=dataSource, readonly=True)
             row = await sqlProvider.executeFetchOne(
                 """
@@ -494,6 +663,7 @@ class ChatMessagesRepository(BaseRepository):
             Exception: If database operation fails (caught and logged, returns False)
         """
         try:
+            await self.ingestion.flush(chatId)
             sqlProvider = await self.manager.getProvider(chatId=chatId, readonly=False)
             await sqlProvider.execute(
                 """
@@ -537,6 +707,7 @@ class ChatMessagesRepository(BaseRepository):
             Exception: If database operation fails (caught and logged, returns False)
         """
         try:
+            await self.ingestion.flush(chatId)
             sqlProvider = await self.manager.getProvider(chatId=chatId, readonly=False)
             await sqlProvider.execute(
                 """
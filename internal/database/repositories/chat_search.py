@@ -12,7 +12,9 @@ unifies the two chat-message search modes that previously lived across
   ``message_embeddings`` rows for the chat, applies the same SQL
   pre-filters to the candidate set, computes cosine similarity against
   ``queryEmbedding`` via ``numpy``, and returns the top-K messages
-  ranked by similarity descending.
+  ranked by similarity descending. When a shared
+  :class:`EmbeddingsIndex` is attached, the vectors come from the
+  resident pre-normalised matrix instead of being re-read per query.
 
 The public :meth:`ChatSearchRepository.searchChatMessages` dispatcher
 selects the mode at runtime. This replaces the prior
@@ -34,7 +36,9 @@ import numpy as np
 from internal.models import MessageId
 
 from .. import utils as dbUtils
+from ..embeddings_index import EmbeddingsIndex, IndexRow, toTimestamp
 from ..manager import DatabaseManager
+from ..message_ingestion import ChatMessageIngestion
 from ..models import ChatMessageDict, MessageCategory
 from ..providers.base import BaseSQLProvider, VectorDistanceMetric
 from .base import BaseRepository
@@ -47,6 +51,10 @@ logger = logging.getLogger(__name__)
 #: 1024 is a safe default batch size that keeps queries under the limit.
 _MESSAGE_ID_FILTER_BATCH_SIZE: int = 1024
 
+#: Minimum number of ranked index candidates checked against the SQL
+#: post-filters per round in :meth:`ChatSearchRepository._indexedSearch`.
+_INDEX_FILTER_WINDOW: int = 1024
+
 
 class ChatSearchRepository(BaseRepository):
     """Unified chat-message search across ``chat_messages`` and ``message_embeddings``.
@@ -61,22 +69,40 @@ class ChatSearchRepository(BaseRepository):
     :class:`ChatEmbeddingsRepository` — this repository only consumes
     embeddings, it does not own their lifecycle.
 
-    Caching of decoded embeddings belongs in the handler layer
-    (via :class:`CacheService`). The repository always re-reads
+    Without native vector search, decoded embeddings are served from
+    the optional shared :class:`EmbeddingsIndex` (kept current by
+    :class:`ChatEmbeddingsRepository`). Without an index, or when the
+    chat does not fit its memory budget, the repository re-reads
     ``message_embeddings`` BLOB rows on every semantic-mode call,
     pre-filtered by ``modelName`` to keep the result set bounded by the
     active model.
+
+    Attributes:
+        embeddingsIndex: Optional resident embeddings index.
     """
 
-    __slots__ = ()
+    __slots__ = ("embeddingsIndex", "ingestion")
 
-    def __init__(self, manager: DatabaseManager) -> None:
+    def __init__(
+        self,
+        manager: DatabaseManager,
+        *,
+        embeddingsIndex: Optional[EmbeddingsIndex] = None,
+        ingestion: Optional[ChatMessageIngestion] = None,
+    ) -> None:
         """Initialize the chat search repository.
 
         Args:
             manager: Database manager instance for provider access.
+            embeddingsIndex: Optional resident embeddings index used by
+                the semantic path when native vector search is not
+                available.
+            ingestion: Optional group-commit queue of saved messages;
+                a search commits the chat's queued messages first.
         """
         super().__init__(manager)
+        self.embeddingsIndex: Optional[EmbeddingsIndex] = embeddingsIndex
+        self.ingestion: Optional[ChatMessageIngestion] = ingestion
 
     ###
     # Public dispatcher
@@ -164,6 +190,8 @@ class ChatSearchRepository(BaseRepository):
             f"modelName={modelName}, maxMessages={maxMessages}, "
             f"dataSource={dataSource}, hasQueryEmbedding={queryEmbedding is not None}"
         )
+        if self.ingestion is not None:
+            await self.ingestion.flush(chatId)
         if queryEmbedding is None:
             return await self._filterOnlySearch(
                 chatId=chatId,
@@ -250,8 +278,7 @@ class ChatSearchRepository(BaseRepository):
             query = sqlProvider.applyPagination(query=query, limit=limit)
             rows = await sqlProvider.executeFetchAll(query, params)
             results: list = []
-            for row in rows:
-                rowDict = dbUtils.sqlToTypedDict(row, ChatMessageDict)
+            for rowDict in dbUtils.getRowDecoder(ChatMessageDict).decodeRows(rows):
                 # Filter-only mode never ranks, so score is fixed at 0.0.
                 rowDict["score"] = 0.0
                 results.append(rowDict)
@@ -281,7 +308,10 @@ class ChatSearchRepository(BaseRepository):
         """Semantic search path used by :meth:`searchChatMessages`.
 
         1. Load all embeddings for the chat from ``message_embeddings``
-           (filtered by the active model).
+           (filtered by the active model). When an
+           :class:`EmbeddingsIndex` is attached and no explicit
+           ``dataSource`` is requested, :meth:`_indexedSearch` ranks
+           over the resident matrix instead and steps 1-3 are skipped.
         2. Apply pre-filters (``userFilter``, ``categoryFilter``,
            ``maxAgeDays``, ``rootMessageId``) over the loaded
            ``messageIds`` to produce a small candidate set.
@@ -362,9 +392,28 @@ class ChatSearchRepository(BaseRepository):
                     )
                     # Fall through to numpy path below.
 
-            # 1. Always load embeddings fresh from the DB. The repository
-            #    no longer maintains an in-memory cache — callers (e.g.
-            #    ChatSearchHandler) own the caching layer via CacheService.
+            # --- Resident index path ---
+            # ``None`` means the index could not serve this chat (disabled,
+            # over budget, load raced with a write); fall through to the
+            # DB load below.
+            if self.embeddingsIndex is not None and modelName is not None and dataSource is None:
+                indexResults = await self._indexedSearch(
+                    sqlProvider=sqlProvider,
+                    chatId=chatId,
+                    queryEmbedding=queryEmbedding,
+                    limit=limit,
+                    topK=topK,
+                    userFilter=userFilter,
+                    categoryFilter=categoryFilter,
+                    maxAgeDays=maxAgeDays,
+                    rootMessageId=rootMessageId,
+                    modelName=modelName,
+                    maxMessages=maxMessages,
+                )
+                if indexResults is not None:
+                    return indexResults
+
+            # 1. Load embeddings fresh from the DB.
             embeddingList, messageIds = await self._loadEmbeddingsFromDb(
                 sqlProvider=sqlProvider,
                 chatId=chatId,
@@ -505,6 +554,154 @@ class ChatSearchRepository(BaseRepository):
             messageIds.append(MessageId(row["message_id"]))
         return embeddingList, messageIds
 
+    async def _loadIndexRows(
+        self,
+        sqlProvider: BaseSQLProvider,
+        chatId: int,
+        modelName: str,
+    ) -> List[IndexRow]:
+        """Load every ``(messageId, BLOB, timestamp)`` row of a chat/model pair.
+
+        Loader used by :meth:`EmbeddingsIndex.getOrLoad`. Unlike
+        :meth:`_loadEmbeddingsFromDb` the BLOBs are not decoded here and
+        no ``maxMessages`` cap is applied: the index keeps the whole
+        chat resident and applies the cap per query using the
+        timestamps.
+        """
+        rows = await sqlProvider.executeFetchAll(
+            """
+            SELECT me.message_id, me.embedding, c.date
+            FROM message_embeddings me
+            JOIN chat_messages c
+                ON c.chat_id = me.chat_id AND c.message_id = me.message_id
+            WHERE me.chat_id = :chatId AND me.model = :modelName
+            """,
+            {"chatId": chatId, "modelName": modelName},
+        )
+        result: List[IndexRow] = []
+        for row in rows:
+            _, date = dbUtils.sqlToCustomType(row["date"], datetime.datetime)
+            result.append((MessageId(row["message_id"]).asStr(), bytes(row["embedding"]), toTimestamp(date)))
+        return result
+
+    async def _indexedSearch(
+        self,
+        sqlProvider: BaseSQLProvider,
+        chatId: int,
+        queryEmbedding: List[float],
+        *,
+        limit: Optional[int],
+        topK: int,
+        userFilter: Optional[int],
+        categoryFilter: Optional[Sequence[MessageCategory]],
+        maxAgeDays: Optional[int],
+        rootMessageId: Optional[MessageId],
+        modelName: str,
+        maxMessages: Optional[int],
+    ) -> Optional[List[ChatMessageDict]]:
+        """Semantic search over the resident :class:`EmbeddingsIndex` entry.
+
+        Ranks every candidate row of the pre-normalised matrix with a
+        single matmul. Without SQL filters the top-K is taken directly;
+        with filters the candidates are walked in similarity order in
+        windows of at least :data:`_INDEX_FILTER_WINDOW` rows through
+        :meth:`_filterMessageIds` until ``topK`` matches are collected,
+        so only the best-ranked IDs ever reach the database.
+
+        Args:
+            sqlProvider: SQL provider to use.
+            chatId: Chat to search in.
+            queryEmbedding: Query vector from the embedding model.
+            limit: Max results after ranking. ``None`` means no cap.
+            topK: How many candidates to consider before the final trim.
+            userFilter: Optional user ID to narrow search.
+            categoryFilter: Optional message category filter.
+            maxAgeDays: Only consider messages newer than N days.
+            rootMessageId: Optional thread root to filter by.
+            modelName: Embedding model name (index key).
+            maxMessages: Only rank the N most recent embedded messages.
+
+        Returns:
+            Ranked :class:`ChatMessageDict` list, or ``None`` when the
+            index cannot serve this chat and the caller should fall back
+            to :meth:`_loadEmbeddingsFromDb`.
+        """
+        index = self.embeddingsIndex
+        if index is None:
+            return None
+        entry = await index.getOrLoad(
+            chatId,
+            modelName,
+            loader=lambda: self._loadIndexRows(sqlProvider=sqlProvider, chatId=chatId, modelName=modelName),
+        )
+        if entry is None:
+            return None
+        if len(queryEmbedding) != entry.dimensions:
+            logger.warning(
+                f"Query embedding has {len(queryEmbedding)} dimensions, index for chat {chatId} "
+                f"has {entry.dimensions}; falling back to DB load"
+            )
+            return None
+
+        rows, similarities = entry.score(
+            queryEmbedding,
+            maxMessages=maxMessages,
+            approximate=index.approximate,
+            ivfMinRows=index.ivfMinRows,
+            ivfProbes=index.ivfProbes,
+        )
+        k = min(int(topK), int(similarities.shape[0]))
+        if k <= 0:
+            return []
+
+        # Snapshot the row -> message ID mapping: writes may move rows
+        # while we await the post-filter queries below.
+        messageIds = list(entry.messageIds)
+        needsPostFilter: bool = (
+            userFilter is not None or categoryFilter is not None or maxAgeDays is not None or rootMessageId is not None
+        )
+        topIds: List[MessageId] = []
+        topScores: List[float] = []
+        if not needsPostFilter:
+            topPartition = np.argpartition(-similarities, k - 1)[:k]
+            topPartition = topPartition[np.argsort(-similarities[topPartition])]
+            topIds = [MessageId(messageIds[int(rows[i])]) for i in topPartition]
+            topScores = [float(similarities[int(i)]) for i in topPartition]
+        else:
+            order = np.argsort(-similarities)
+            window = max(k * 4, _INDEX_FILTER_WINDOW)
+            for start in range(0, int(order.shape[0]), window):
+                chunk = order[start : start + window]
+                chunkIds = [MessageId(messageIds[int(rows[i])]) for i in chunk]
+                allowed = {
+                    mid.asStr()
+                    for mid in await self._filterMessageIds(
+                        sqlProvider=sqlProvider,
+                        chatId=chatId,
+                        candidateMessageIds=chunkIds,
+                        userFilter=userFilter,
+                        categoryFilter=categoryFilter,
+                        maxAgeDays=maxAgeDays,
+                        rootMessageId=rootMessageId,
+                    )
+                }
+                for i, mid in zip(chunk, chunkIds):
+                    if mid.asStr() in allowed:
+                        topIds.append(mid)
+                        topScores.append(float(similarities[int(i)]))
+                        if len(topIds) >= k:
+                            break
+                if len(topIds) >= k:
+                    break
+
+        return await self._fetchSearchResultRows(
+            sqlProvider=sqlProvider,
+            chatId=chatId,
+            topIds=topIds,
+            topScores=topScores,
+            limit=limit,
+        )
+
     async def _filterMessageIds(
         self,
         sqlProvider: BaseSQLProvider,
@@ -620,8 +817,7 @@ class ChatSearchRepository(BaseRepository):
 
         scoreByMessageId: dict = {mid.asStr(): float(score) for mid, score in zip(topIds, topScores)}
         results: list = []
-        for row in rows:
-            rowDict = dbUtils.sqlToTypedDict(row, ChatMessageDict)
+        for rowDict in dbUtils.getRowDecoder(ChatMessageDict).decodeRows(rows):
             mid = rowDict["message_id"]
             rowDict["score"] = scoreByMessageId.get(mid.asStr(), 0.0)
             results.append(rowDict)
@@ -17,6 +17,7 @@ import lib.utils as libUtils
 
 from .. import utils as dbUtils
 from ..manager import DatabaseManager
+from ..message_ingestion import ChatMessageIngestion
 from ..models import ChatInfoDict, ChatUserDict
 from ..providers.base import ExcludedValue
 from .base import BaseRepository
@@ -31,15 +32,18 @@ class ChatUsersRepository(BaseRepository):
     Supports multi-source database routing with automatic aggregation and deduplication.
     """
 
-    __slots__ = ()  # No additional instance variables beyond base class
+    __slots__ = ("ingestion",)
 
-    def __init__(self, manager: DatabaseManager):
+    def __init__(self, manager: DatabaseManager, *, ingestion: Optional[ChatMessageIngestion] = None):
         """Initialize the chat users repository.
 
         Args:
             manager: DatabaseManager instance for database operations and routing
+            ingestion: Optional group-commit queue of saved messages; reads commit
+                the queued messages first, as they update ``messages_count``
         """
         super().__init__(manager)
+        self.ingestion: Optional[ChatMessageIngestion] = ingestion
 
     ###
     # Chat Users manipulation functions
@@ -104,6 +108,8 @@ class ChatUsersRepository(BaseRepository):
             ChatUserDict containing user information or None if not found
         """
         try:
+            if self.ingestion is not None:
+                await self.ingestion.flush(chatId)
             sqlProvider = await self.manager.getProvider(chatId=chatId, dataSource=dataSource, readonly=True)
             row = await sqlProvider.executeFetchOne(
                 """
@@ -179,6 +185,8 @@ class ChatUsersRepository(BaseRepository):
             ChatUserDict containing user information or None if not found
         """
         try:
+            if self.ingestion is not None:
+                await self.ingestion.flush(chatId)
             sqlProvider = await self.manager.getProvider(chatId=chatId, dataSource=dataSource, readonly=True)
             caseInsensitiveComparison = sqlProvider.getCaseInsensitiveComparison("username", "username")
             row = await sqlProvider.executeFetchOne(
@@ -237,6 +245,8 @@ class ChatUsersRepository(BaseRepository):
             f"lastActiveDays={lastActiveDays}, seenSince={seenSince}, dataSource={dataSource}"
         )
         try:
+            if self.ingestion is not None:
+                await self.ingestion.flush(chatId)
             sqlProvider = await self.manager.getProvider(chatId=chatId, dataSource=dataSource, readonly=True)
             # Compute a single `cutoffTs` from whichever time filter was supplied.
             # `lastActiveDays` takes precedence when both are passed.
@@ -263,7 +273,7 @@ class ChatUsersRepository(BaseRepository):
                 },
             )
 
-            return [dbUtils.sqlToTypedDict(row, ChatUserDict) for row in rows]
+            return dbUtils.getRowDecoder(ChatUserDict).decodeRows(rows)
         except Exception as e:
             logger.error(f"Failed to get users for chat {chatId}: {e}")
             return []
@@ -288,6 +298,8 @@ class ChatUsersRepository(BaseRepository):
 
         sourcesList = [dataSource] if dataSource else list(self.manager._providers.keys())
 
+        if self.ingestion is not None:
+            await self.ingestion.flush()
         for sourceName in sourcesList:
             try:
                 sqlProvider = await self.manager.getProvider(dataSource=sourceName, readonly=True)
@@ -302,8 +314,7 @@ class ChatUsersRepository(BaseRepository):
                         "userId": userId,
                     },
                 )
-                for row in rows:
-                    chatInfo = dbUtils.sqlToTypedDict(row, ChatInfoDict)
+                for chatInfo in dbUtils.getRowDecoder(ChatInfoDict).decodeRows(rows):
                     key = chatInfo["chat_id"]
                     if key not in seen:
                         seen.add(key)
@@ -346,8 +357,7 @@ class ChatUsersRepository(BaseRepository):
                         "supergroupChat": Chat.SUPERGROUP,
                     },
                 )
-                for row in rows:
-                    chatInfo = dbUtils.sqlToTypedDict(row, ChatInfoDict)
+                for chatInfo in dbUtils.getRowDecoder(ChatInfoDict).decodeRows(rows):
                     chatId = chatInfo["chat_id"]
                     if chatId not in seen:
                         seen.add(chatId)
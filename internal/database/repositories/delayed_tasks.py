@@ -263,7 +263,7 @@ class DelayedTasksRepository(BaseRepository):
                     "isDone": False,
                 },
             )
-            return [dbUtils.sqlToTypedDict(row, DelayedTaskDict) for row in rows]
+            return dbUtils.getRowDecoder(DelayedTaskDict).decodeRows(rows)
         except Exception as e:
             logger.error(f"Failed to get pending delayed tasks: {e}")
             return []
@@ -19,7 +19,7 @@ Example:
 
 import datetime
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from internal.models import MessageType
 
@@ -30,6 +30,10 @@ from .base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+#: Number of IDs per ``IN (...)`` filter in the batch lookups, keeps queries
+#: well under ``SQLITE_MAX_VARIABLE_NUMBER``.
+_ID_FILTER_BATCH_SIZE: int = 500
+
 
 class MediaAttachmentsRepository(BaseRepository):
     """Repository for managing media attachments and media groups.
@@ -323,11 +327,100 @@ class MediaAttachmentsRepository(BaseRepository):
                 {"mediaGroupId": mediaGroupId},
             )
 
-            return [dbUtils.sqlToTypedDict(row, MediaAttachmentDict) for row in rows]
+            return dbUtils.getRowDecoder(MediaAttachmentDict).decodeRows(rows)
         except Exception as e:
             logger.error(f"Failed to get media attachments by group ID: {e}")
             return []
 
+    async def getMediaAttachmentsByIds(
+        self, mediaIds: Sequence[str], *, dataSource: Optional[str] = None
+    ) -> Dict[str, MediaAttachmentDict]:
+        """Get several media attachments at once.
+
+        Batch version of getMediaAttachment() for converting many messages:
+        one ``IN`` query per batch of IDs instead of one query per attachment.
+
+        Args:
+            mediaIds: Media attachment unique identifiers (file_unique_id).
+            dataSource: Optional data source name for multi-source routing.
+
+        Returns:
+            Dict of found attachments keyed by file_unique_id. Missing IDs are
+            absent, the dict is empty if the database operation fails.
+        """
+        uniqueIds = list(dict.fromkeys(mediaIds))
+        if not uniqueIds:
+            return {}
+
+        try:
+            sqlProvider = await self.manager.getProvider(dataSource=dataSource, readonly=True)
+            decoder = dbUtils.getRowDecoder(MediaAttachmentDict)
+            ret: Dict[str, MediaAttachmentDict] = {}
+            for batchStart in range(0, len(uniqueIds), _ID_FILTER_BATCH_SIZE):
+                batchIds = uniqueIds[batchStart : batchStart + _ID_FILTER_BATCH_SIZE]
+                # Fixed-width suffixes: no name is a prefix of another (PostgreSQL $N conversion)
+                params = {f"mediaId_{i:03d}": mediaId for i, mediaId in enumerate(batchIds)}
+                rows = await sqlProvider.executeFetchAll(
+                    f"""
+                    SELECT * FROM media_attachments
+                    WHERE file_unique_id IN ({", ".join(f":{key}" for key in params)})
+                """,
+                    params,
+                )
+                for attachment in decoder.decodeRows(rows):
+                    ret[attachment["file_unique_id"]] = attachment
+
+            return ret
+        except Exception as e:
+            logger.error(f"Failed to get media attachments by IDs: {e}")
+            return {}
+
+    async def getMediaAttachmentsByGroupIds(
+        self, mediaGroupIds: Sequence[str], *, dataSource: Optional[str] = None
+    ) -> Dict[str, List[MediaAttachmentDict]]:
+        """Get the media attachments of several media groups at once.
+
+        Batch version of getMediaAttachmentsByGroupId(): one ``IN`` query per
+        batch of group IDs instead of one query per group.
+
+        Args:
+            mediaGroupIds: Media group identifiers.
+            dataSource: Optional data source name for multi-source routing.
+
+        Returns:
+            Dict of attachment lists keyed by media group ID. Every requested
+            group is present (with an empty list if it has no attachments), the
+            dict is empty if the database operation fails.
+        """
+        uniqueIds = list(dict.fromkeys(mediaGroupIds))
+        if not uniqueIds:
+            return {}
+
+        try:
+            sqlProvider = await self.manager.getProvider(dataSource=dataSource, readonly=True)
+            decoder = dbUtils.getRowDecoder(MediaAttachmentDict)
+            ret: Dict[str, List[MediaAttachmentDict]] = {mediaGroupId: [] for mediaGroupId in uniqueIds}
+            for batchStart in range(0, len(uniqueIds), _ID_FILTER_BATCH_SIZE):
+                batchIds = uniqueIds[batchStart : batchStart + _ID_FILTER_BATCH_SIZE]
+                params = {f"mediaGroupId_{i:03d}": mediaGroupId for i, mediaGroupId in enumerate(batchIds)}
+                rows = await sqlProvider.executeFetchAll(
+                    f"""
+                    SELECT mg.media_group_id AS mg_media_group_id, ma.* FROM media_groups mg
+                    JOIN media_attachments ma ON mg.media_id = ma.file_unique_id
+                    WHERE mg.media_group_id IN ({", ".join(f":{key}" for key in params)})
+                """,
+                    params,
+                )
+                for row in rows:
+                    row = dict(row)
+                    mediaGroupId = row.pop("mg_media_group_id")
+                    ret[mediaGroupId].append(decoder.decode(row))
+
+            return ret
+        except Exception as e:
+            logger.error(f"Failed to get media attachments by group IDs: {e}")
+            return {}
+
     async def getMediaGroupLastUpdatedAt(
         self, mediaGroupId: str, *, dataSource: Optional[str] = None
     ) -> Optional[datetime.datetime]:
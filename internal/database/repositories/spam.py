@@ -217,7 +217,7 @@ class SpamRepository(BaseRepository):
                     "text": text,
                 },
             )
-            return [dbUtils.sqlToTypedDict(row, SpamMessageDict) for row in rows]
+            return dbUtils.getRowDecoder(SpamMessageDict).decodeRows(rows)
         except Exception as e:
             logger.error(f"Failed to get spam messages: {e}")
             return []
@@ -247,7 +247,7 @@ class SpamRepository(BaseRepository):
                     "limit": limit,
                 },
             )
-            return [dbUtils.sqlToTypedDict(row, SpamMessageDict) for row in rows]
+            return dbUtils.getRowDecoder(SpamMessageDict).decodeRows(rows)
         except Exception as e:
             logger.error(f"Failed to get spam messages: {e}")
             return []
@@ -319,7 +319,7 @@ class SpamRepository(BaseRepository):
                     "userId": userId,
                 },
             )
-            return [dbUtils.sqlToTypedDict(row, SpamMessageDict) for row in rows]
+            return dbUtils.getRowDecoder(SpamMessageDict).decodeRows(rows)
         except Exception as e:
             logger.error(f"Failed to get spam messages: {e}")
             return []
@@ -2,8 +2,8 @@
 
 Provides a database-backed implementation of StatsStorage that uses the
 Database manager to store raw stat events and materialized aggregates.
-Both tables live in a single data source, enabling future transactional
-upsert + mark-processed operations.
+Both tables live in a single data source, so the aggregate upsert and the
+mark-processed step share one transaction.
 """
 
 import datetime
@@ -11,15 +11,16 @@ import hashlib
 import logging
 import math
 import uuid
+from collections.abc import Sequence
 from typing import Optional, TypedDict
 
 from lib import utils as libUtils
-from lib.stats.stats_storage import GLOBAL_CONSUMER_ID
+from lib.stats.stats_storage import GLOBAL_CONSUMER_ID, StatsEvent
 from lib.stats.stats_storage import StatsStorage as BaseStatsStorage
 
 from . import utils as dbUtils
 from .database import Database
-from .providers.base import ExcludedValue
+from .providers.base import ExcludedValue, ParametrizedQuery
 
 logger = logging.getLogger(__name__)
 
@@ -44,9 +45,9 @@ class DatabaseStatsStorage(BaseStatsStorage):
     crashed prior runs) via a single UPDATE, then computes hourly/daily/monthly/total
     buckets and upserts into ``stat_aggregates``.
 
-    Both tables share the same data source, so when the provider gains
-    transactional batch primitives, the upsert + mark-processed steps can be
-    wrapped in a single transaction for exactly-once semantics.
+    Both tables share the same data source, so the upsert + mark-processed
+    steps run in a single transaction via ``upsertMany(..., extraQueries=...)``
+    for exactly-once semantics.
 
     Attributes:
         db: Database instance for provider access.
@@ -96,35 +97,57 @@ class DatabaseStatsStorage(BaseStatsStorage):
             None
         """
         try:
-            eventId = str(uuid.uuid4())
-            now = dbUtils.getCurrentTimestamp()
+            await self.recordMany(
+                [{"stats": stats, "consumerId": consumerId, "labels": labels, "eventTime": eventTime}]
+            )
+        except Exception:
+            logger.exception("Failed to record stat event")
+
+    async def recordMany(self, events: Sequence[StatsEvent]) -> None:
+        """Append several raw stat events with one multi-row insert.
 
-            if eventTime is None:
-                eventTime = now
+        Each event gets a UUID event_id and its consumerId merged into labels,
+        exactly as in :meth:`record`. Raises on database errors so that
+        batching callers (see :class:`lib.stats.BufferedStatsStorage`) can
+        count failed writes.
 
+        Args:
+            events: Events to append.
+
+        Returns:
+            None
+        """
+        if not events:
+            return
+
+        now = dbUtils.getCurrentTimestamp()
+        rows = []
+        for event in events:
             # Merge consumerId into labels
-            mergedLabels = dict(labels or {})
-            mergedLabels["consumer"] = consumerId or GLOBAL_CONSUMER_ID
-
-            sqlProvider = await self.db.manager.getProvider(dataSource=self.dataSource, readonly=False)
-            await sqlProvider.execute(
-                """INSERT INTO stat_events
-                   (event_id, event_type, event_time, data, labels,
-                    processed, processed_id, claimed_at, created_at)
-                   VALUES
-                   (:eventId, :eventType, :eventTime, :data, :labels,
-                    0, NULL, NULL, :createdAt)""",
+            mergedLabels = dict(event.get("labels") or {})
+            mergedLabels["consumer"] = event.get("consumerId") or GLOBAL_CONSUMER_ID
+            rows.append(
                 {
-                    "eventId": eventId,
-                    "eventType": self.eventType,
-                    "eventTime": eventTime,
-                    "data": stats,
+                    "event_id": str(uuid.uuid4()),
+                    "event_type": self.eventType,
+                    "event_time": event.get("eventTime") or now,
+                    "data": event["stats"],
                     "labels": mergedLabels,
-                    "createdAt": now,
-                },
+                    "processed": 0,
+                    "processed_id": None,
+                    "claimed_at": None,
+                    "created_at": now,
+                }
             )
-        except Exception:
-            logger.exception("Failed to record stat event")
+
+        sqlProvider = await self.db.manager.getProvider(dataSource=self.dataSource, readonly=False)
+        # Insert-only: event_id is a fresh UUID, so the conflict clause never fires
+        await sqlProvider.upsertMany(
+            table="stat_events",
+            rows=rows,
+            conflictColumns=["event_id"],
+            updateExpressions={},
+        )
 
     async def aggregate(self, *, limit: int = 1000, orphanTimeoutSeconds: int = 3600) -> int:
         """Claim and aggregate a batch of unprocessed events.
@@ -140,8 +163,11 @@ class DatabaseStatsStorage(BaseStatsStorage):
             3. Compute hourly/daily/monthly/total aggregates in Python.
                Each event produces rows for its own labels AND a global
                rollup (consumer replaced with ``GLOBAL_CONSUMER_ID``).
-            4. Upsert into ``stat_aggregates`` (same data source).
-            5. Mark claimed rows as ``processed = 1``.
+            4. Upsert into ``stat_aggregates`` (same data source) with one
+               multi-row :meth:`upsertMany` call.
+            5. Mark claimed rows as ``processed = 1`` in the same transaction
+               as step 4, so a batch is either fully applied or left claimed
+               for orphan reclaim.
 
         No separate orphan-reclaim pass — stale rows are reclaimed as part
         of the claim UPDATE itself.
@@ -203,8 +229,7 @@ class DatabaseStatsStorage(BaseStatsStorage):
 
         # --- Step 3: aggregate in Python ---
         aggregates: dict[tuple[str, str, str, str], float] = {}
-        for _event in events:
-            event = dbUtils.sqlToTypedDict(_event, StatsEventDict)
+        for event in dbUtils.getRowDecoder(StatsEventDict).decodeRows(events):
 
             # Build global labels: same labels but consumer = __global__
             labelsDict = event["labels"]
@@ -228,40 +253,42 @@ class DatabaseStatsStorage(BaseStatsStorage):
                     globalKey = (globalLabelsJson, truncated, periodType, metricKey)
                     aggregates[globalKey] = aggregates.get(globalKey, 0.0) + float(metricValue)
 
-        # --- Step 4: upsert into aggregate table ---
-        # TODO: Add sqlProvider.getUpsertQuery + put all queries into batchExecute for transaction
-        for (labelsJson, periodStart, periodType, metricKey), total in aggregates.items():
-            await sqlProvider.upsert(
-                table="stat_aggregates",
-                values={
-                    "event_type": self.eventType,
-                    "period_start": periodStart,
-                    "period_type": periodType,
-                    "labels_hash": _hashLabels(labelsJson),
-                    "labels": labelsJson,
-                    "metric_key": metricKey,
-                    "metric_value": total,
-                    "updated_at": now,
-                },
-                conflictColumns=[
-                    "event_type",
-                    "period_start",
-                    "period_type",
-                    "labels_hash",
-                    "metric_key",
-                ],
-                updateExpressions={
-                    "metric_value": "metric_value + :metric_value",
-                    "updated_at": ExcludedValue(),
-                },
-            )
-
-        # --- Step 5: mark processed ---
-        await sqlProvider.execute(
-            """UPDATE stat_events
-               SET processed = 1
-               WHERE processed_id = :batchId""",
-            {"batchId": batchId},
+        # --- Step 4 + 5: upsert into aggregate table and mark processed in one transaction ---
+        rows = [
+            {
+                "event_type": self.eventType,
+                "period_start": periodStart,
+                "period_type": periodType,
+                "labels_hash": _hashLabels(labelsJson),
+                "labels": labelsJson,
+                "metric_key": metricKey,
+                "metric_value": total,
+                "updated_at": now,
+            }
+            for (labelsJson, periodStart, periodType, metricKey), total in aggregates.items()
+        ]
+        await sqlProvider.upsertMany(
+            table="stat_aggregates",
+            rows=rows,
+            conflictColumns=[
+                "event_type",
+                "period_start",
+                "period_type",
+                "labels_hash",
+                "metric_key",
+            ],
+            updateExpressions={
+                "metric_value": "metric_value + :metric_value",
+                "updated_at": ExcludedValue(),
+            },
+            extraQueries=[
+                ParametrizedQuery(
+                    """UPDATE stat_events
+                       SET processed = 1
+                       WHERE processed_id = :batchId""",
+                    {"batchId": batchId},
+                ),
+            ],
         )
 
         return nClaimed
@@ -4,6 +4,13 @@ Database utility functions for type conversion and validation.
 This module provides utility functions for converting between SQL data types
 and Python types, including datetime, boolean, and custom type conversions.
 It also includes type checking and TypedDict validation utilities.
+
+Rows are decoded by :class:`RowDecoder` objects compiled once per TypedDict
+(see :func:`getRowDecoder`): the annotations are resolved when the decoder is
+built, so decoding a row is a loop over precomputed per-field converters.
+Every converter has fast paths for the values drivers usually return and
+falls back to :func:`sqlToCustomType` for anything else, so results match
+the generic conversion.
 """
 
 import datetime
@@ -11,8 +18,22 @@ import json
 import logging
 import math
 import types
-from collections.abc import Mapping, MutableMapping, MutableSequence, MutableSet, Sequence, Set
-from typing import Any, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin, get_type_hints, is_typeddict
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, MutableSequence, MutableSet, Sequence, Set
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
 
 import dateutil
 
@@ -322,6 +343,8 @@ def sqlToTypedDict(data: dict | Mapping, typedDictClass: Type[_T], *, keepOrigin
     Checks that every required key is present and that all provided values
     match the declared type annotations. Optional keys are allowed to be
     absent, but when present their values are still type-checked.
+    Uses the cached :class:`RowDecoder` of ``typedDictClass``; prefer
+    :meth:`RowDecoder.decodeRows` for lists of rows.
 
     Args:
         data: The plain dict to validate and cast.
@@ -337,41 +360,303 @@ def sqlToTypedDict(data: dict | Mapping, typedDictClass: Type[_T], *, keepOrigin
         KeyError: If a required key declared in typedDictClass is absent
             from data.
     """
-    if keepOriginal:
-        # Create a copy of data to avoid modifying the original
-        data = dict(data)
-    elif isinstance(data, Mapping) and not isinstance(data, MutableMapping):
-        # We'll need to mutate result dict, so in case of unmutable Mapping, wrap it into dict
-        data = dict(data)
-
-    if not is_typeddict(typedDictClass):
-        raise TypeError(f"{typedDictClass!r} is not a TypedDict class")
-
-    hints: dict[str, type] = get_type_hints(typedDictClass)
-    requiredKeys: frozenset[str] = typedDictClass.__required_keys__  # type: ignore[attr-defined]
-
-    # Ensure every required key is present
-    for key in requiredKeys:
-        if key not in data:
-            raise KeyError(f"Missing required key '{key}' for TypedDict '{typedDictClass.__name__}'")
-
-    # Type-check every key that is present in data
-    for key, expectedType in hints.items():
-        if key not in data:
-            continue
-
-        # Not just check if type is valid, but try to convert it if possible
-        #  as SQLite does not really support types like datetime, bool, dicts, lists, etc...
-        ok, value = sqlToCustomType(data[key], expectedType)
+    return getRowDecoder(typedDictClass).decode(data, keepOriginal=keepOriginal)
+
+
+class _ConversionError(Exception):
+    """Raised by compiled converters when a value cannot be converted."""
+
+
+_Converter = Callable[[Any], Any]
+"""Compiled single-field converter: returns the converted value or raises :class:`_ConversionError`."""
+
+
+def _identity(value: Any) -> Any:
+    """Converter for ``Any`` fields."""
+    return value
+
+
+def _compileGenericConverter(expectedType: Any) -> _Converter:
+    """Build a converter delegating to :func:`sqlToCustomType`.
+
+    Args:
+        expectedType: Field annotation.
+
+    Returns:
+        Converter for ``expectedType``.
+    """
+
+    def convertGeneric(value: Any) -> Any:
+        ok, ret = sqlToCustomType(value, expectedType)
         if not ok:
-            raise TypeError(
-                f"Field '{key}' of '{typedDictClass.__name__}' expected "
-                f"{expectedType}, got {type(data[key]).__name__}"
-            )
-        else:
-            data[key] = value
+            raise _ConversionError
+        return ret
+
+    return convertGeneric
+
+
+def _compileConverter(expectedType: Any) -> _Converter:
+    """Build a specialised converter for one field annotation.
+
+    Fast paths cover exact driver types (``str``, ``int``, ``float``,
+    ``bool``, ISO datetime strings, JSON strings of container fields,
+    constructor calls of classes like :class:`MessageId` or enums) and
+    ``Optional[X]``. Every other value goes through :func:`sqlToCustomType`.
+
+    Args:
+        expectedType: Field annotation.
+
+    Returns:
+        Converter for ``expectedType``.
+    """
+    if expectedType is Any:
+        return _identity
+
+    generic = _compileGenericConverter(expectedType)
+    origin = get_origin(expectedType)
+    args = get_args(expectedType)
+
+    if origin is Union or isinstance(expectedType, types.UnionType):
+        if len(args) == 2 and type(None) in args:
+            inner = _compileConverter(args[0] if args[1] is type(None) else args[1])
+
+            def convertOptional(value: Any) -> Any:
+                return None if value is None else inner(value)
+
+            return convertOptional
+        return generic
+
+    if is_typeddict(expectedType):
+        nestedDecoder = getRowDecoder(expectedType)
+
+        def convertTypedDict(value: Any) -> Any:
+            data = value
+            if data.__class__ is str:
+                try:
+                    data = json.loads(data)
+                except ValueError:
+                    return generic(value)
+            if isinstance(data, MutableMapping):
+                try:
+                    return nestedDecoder.decode(data)
+                except (KeyError, ValueError, TypeError):
+                    return generic(value)
+            return generic(value)
+
+        return convertTypedDict
+
+    if origin is not None or args:
+        if origin not in CONTAINER_TYPES:
+            return generic
+
+        def convertJsonContainer(value: Any) -> Any:
+            if value.__class__ is str:
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    return generic(value)
+            return generic(value)
+
+        return convertJsonContainer
+
+    if expectedType is str:
+
+        def convertStr(value: Any) -> Any:
+            return value if value.__class__ is str else generic(value)
+
+        return convertStr
+
+    if expectedType is int:
+
+        def convertInt(value: Any) -> Any:
+            return value if value.__class__ is int else generic(value)
+
+        return convertInt
+
+    if expectedType is float:
 
-    return data  # type: ignore[return-value]
+        def convertFloat(value: Any) -> Any:
+            cls = value.__class__
+            if cls is float:
+                return value
+            if cls is int:
+                return float(value)
+            return generic(value)
+
+        return convertFloat
+
+    if expectedType is bool:
+
+        def convertBool(value: Any) -> Any:
+            cls = value.__class__
+            if cls is bool:
+                return value
+            if cls is int:
+                return bool(value)
+            return generic(value)
+
+        return convertBool
+
+    if expectedType is datetime.datetime:
+
+        def convertDatetime(value: Any) -> Any:
+            cls = value.__class__
+            if cls is str:
+                try:
+                    ret = datetime.datetime.fromisoformat(value)
+                except ValueError:
+                    return generic(value)
+            elif cls is datetime.datetime:
+                ret = value
+            else:
+                return generic(value)
+            if ret.tzinfo is None and FORCE_SQL_TIMEZONE is not None:
+                ret = ret.replace(tzinfo=FORCE_SQL_TIMEZONE)
+            return ret
+
+        return convertDatetime
+
+    if expectedType in CONTAINER_TYPES:
+
+        def convertJson(value: Any) -> Any:
+            if isinstance(value, expectedType):
+                return value
+            if value.__class__ is str:
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    return generic(value)
+            return generic(value)
+
+        return convertJson
+
+    if isinstance(expectedType, type) and expectedType not in (bytes, type(None)):
+        # Classes built from the raw value, like MessageId or enums
+
+        def convertByConstructor(value: Any) -> Any:
+            if isinstance(value, expectedType):
+                return value
+            cls = value.__class__
+            if cls is str or cls is int:
+                try:
+                    return expectedType(value)
+                except (ValueError, TypeError):
+                    return generic(value)
+            return generic(value)
+
+        return convertByConstructor
+
+    return generic
+
+
+class RowDecoder(Generic[_T]):
+    """Precompiled converter of SQL rows into a TypedDict.
+
+    Built once per TypedDict by :func:`getRowDecoder`. Decoding validates the
+    required keys and converts every present field with a converter compiled
+    for its annotation, with the same results and errors as the generic
+    :func:`sqlToCustomType` conversion.
+
+    Attributes:
+        typedDictClass: TypedDict the rows are decoded into.
+    """
+
+    __slots__ = ("typedDictClass", "_requiredKeys", "_fields")
+
+    def __init__(self, typedDictClass: Type[_T]) -> None:
+        """Compile the decoder.
+
+        Args:
+            typedDictClass: TypedDict the rows are decoded into.
+
+        Raises:
+            TypeError: If typedDictClass is not a TypedDict class.
+        """
+        if not is_typeddict(typedDictClass):
+            raise TypeError(f"{typedDictClass!r} is not a TypedDict class")
+
+        self.typedDictClass: Type[_T] = typedDictClass
+        self._requiredKeys: Tuple[str, ...] = tuple(typedDictClass.__required_keys__)  # type: ignore[attr-defined]
+        # Placeholders first, so self-referencing TypedDicts find this decoder while it compiles
+        self._fields: Tuple[Tuple[str, Any, _Converter], ...] = ()
+        _rowDecoders[typedDictClass] = self
+        try:
+            hints: Dict[str, Any] = get_type_hints(typedDictClass)
+            self._fields = tuple((key, hint, _compileConverter(hint)) for key, hint in hints.items())
+        except Exception:
+            del _rowDecoders[typedDictClass]
+            raise
+
+    def decode(self, data: dict | Mapping, *, keepOriginal: bool = False) -> _T:
+        """Validate and convert one row.
+
+        Args:
+            data: Row to decode.
+            keepOriginal: If True, decode a copy instead of converting ``data`` in place.
+
+        Returns:
+            The decoded row (``data`` itself unless a copy was needed).
+
+        Raises:
+            KeyError: If a required key is missing.
+            TypeError: If a value cannot be converted to its annotation.
+        """
+        if keepOriginal or not isinstance(data, MutableMapping):
+            data = dict(data)
+
+        for key in self._requiredKeys:
+            if key not in data:
+                raise KeyError(f"Missing required key '{key}' for TypedDict '{self.typedDictClass.__name__}'")
+
+        for key, expectedType, converter in self._fields:
+            if key in data:
+                try:
+                    data[key] = converter(data[key])
+                except _ConversionError:
+                    raise TypeError(
+                        f"Field '{key}' of '{self.typedDictClass.__name__}' expected "
+                        f"{expectedType}, got {type(data[key]).__name__}"
+                    ) from None
+
+        return data  # type: ignore[return-value]
+
+    def decodeRows(self, rows: Iterable[dict | Mapping]) -> List[_T]:
+        """Validate and convert rows in place.
+
+        Args:
+            rows: Rows to decode.
+
+        Returns:
+            List of decoded rows, in input order.
+
+        Raises:
+            KeyError: If a required key is missing in any row.
+            TypeError: If a value cannot be converted to its annotation.
+        """
+        decode = self.decode
+        return [decode(row) for row in rows]
+
+
+_rowDecoders: Dict[Any, RowDecoder] = {}
+"""Compiled decoders keyed by TypedDict class."""
+
+
+def getRowDecoder(typedDictClass: Type[_T]) -> RowDecoder[_T]:
+    """Get the cached decoder of a TypedDict, compiling it on first use.
+
+    Args:
+        typedDictClass: TypedDict the rows are decoded into.
+
+    Returns:
+        The decoder of ``typedDictClass``.
+
+    Raises:
+        TypeError: If typedDictClass is not a TypedDict class.
+    """
+    decoder = _rowDecoders.get(typedDictClass)
+    if decoder is None:
+        decoder = RowDecoder(typedDictClass)
+    return decoder
 
 
 def getCurrentTimestamp() -> datetime.datetime:
@@ -36,6 +36,7 @@ from internal.models import MessageId
 from internal.services.queue_service.service import QueueService
 from internal.services.queue_service.types import DelayedTask, DelayedTaskFunction
 from lib import utils
+from lib.cache import singleFlight
 
 from .models import CacheNamespace, CachePersistenceLevel
 from .types import (
@@ -871,22 +872,51 @@ class CacheService:
         userCache = self.chatUsers.get(userKey, {})
 
         if "data" not in userCache:
-            if self.database:
-                # Load from DB
-                userData = {
-                    k: json.loads(v)
-                    for k, v in (await self.database.userData.getUserData(userId=userId, chatId=chatId)).items()
-                }
-                userCache["data"] = userData
-                self.chatUsers.set(userKey, userCache)
-                logger.debug(f"Loaded user data for {userKey} from DB, dood!")
-            else:
-                logger.error(f"No dbWrapper found, can't load user data for {userKey}")
-                userCache["data"] = {}
-                self.chatUsers.set(userKey, userCache)
+            return await self._loadChatUserData(chatId, userId)
 
         return userCache.get("data", {})
 
+    @singleFlight()
+    async def _loadChatUserData(self, chatId: int, userId: int) -> UserDataType:
+        """Load user data for a specific chat from the database into the cache.
+
+        Concurrent cache misses for the same chat user share one database
+        load, dood!
+
+        Args:
+            chatId: The unique identifier of the chat
+            userId: The unique identifier of the user
+
+        Returns:
+            The cached UserDataType dictionary for the chat user
+        """
+        userKey = self._getChatUserKey(chatId, userId)
+        userCache = self.chatUsers.get(userKey, {})
+        if "data" in userCache:
+            return userCache["data"]
+
+        if self.database:
+            # Load from DB
+            userData = {
+                k: json.loads(v)
+                for k, v in (await self.database.userData.getUserData(userId=userId, chatId=chatId)).items()
+            }
+            # Re-read the entry: it may have been replaced while the load was in flight
+            userCache = self.chatUsers.get(userKey, {})
+            userCache.setdefault("data", userData)
+            self.chatUsers.set(userKey, userCache)
+            logger.debug(f"Loaded user data for {userKey} from DB, dood!")
+        else:
+            logger.error(f"No dbWrapper found, can't load user data for {userKey}")
+            userCache["data"] = {}
+            self.chatUsers.set(userKey, userCache)
+
+        data = userCache.get("data")
+        if data is None:
+            # Unreachable: both branches above store the data
+            return {}
+        return data
+
     async def setChatUserData(self, chatId: int, userId: int, key: str, value: UserDataValueType) -> None:
         """Set user data for a specific chat.
 
@@ -911,9 +941,9 @@ class CacheService:
             - Logs debug information about the update
         """
         userKey = self._getChatUserKey(chatId, userId)
-        userCache = self.chatUsers.get(userKey, {})
         # load userData from DB or initialise as empty dict
         await self.getChatUserData(chatId, userId)
+        userCache = self.chatUsers.get(userKey, {})
 
         if "data" not in userCache:
             userCache["data"] = {}
@@ -0,0 +1,9 @@
+"""
+Constants for LLM Service.
+"""
+
+# Tool calls executor settings
+MAX_PARALLEL_TOOL_CALLS = 4
+"""Max number of parallel-safe tool calls of one LLM turn running at the same time"""
+DEFAULT_PARALLEL_TOOL_TIMEOUT = 60  # 1 minute
+"""Max seconds a parallel-safe tool call may run unless the tool sets its own timeout"""
@@ -5,11 +5,14 @@ managing tool registration and execution, and handling multi-turn conversations
 The service supports fallback models and provides a unified interface for LLM operations.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import re
+import time
 import uuid
-from collections.abc import Awaitable, Callable, MutableSequence, Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, MutableSequence, Sequence
 from threading import RLock
 from typing import Any, Dict, List, Optional, Tuple, TypeAlias, Union
 
@@ -22,13 +25,18 @@ from lib.ai.models import (
     LLMFunctionParameter,
     LLMToolCall,
     LLMToolFunction,
+    ModelImageMessage,
     ModelMessage,
+    ModelResultChunk,
     ModelResultStatus,
     ModelRunResult,
     ModelStructuredResult,
 )
+from lib.ai.tokens import MessageTokensCounter
+from lib.cache import CacheInterface, NullCache
 from lib.rate_limiter.manager import RateLimiterManager
 
+from . import constants
 from .models import ExtraDataDict
 
 logger = logging.getLogger(__name__)
@@ -47,6 +55,42 @@ Example:
         return f"processed {param1} with {param2}"
 """
 
+CondensedContextDict: TypeAlias = Dict[str, Any]
+"""Rolling summary stored by condenseContext() for a conversation.
+
+Keys: ``count`` - number of body messages covered by the summary, ``digest`` -
+digest chain value after the last covered message (see _digestChain()),
+``summaries`` - list of summary texts.
+"""
+
+
+def _digestChain(seed: str, messages: Sequence[ModelMessage]) -> List[str]:
+    """Build a digest chain over messages.
+
+    ``result[i]`` identifies the first i messages (and the seed), so a stored
+    summary can be checked against the current history with one comparison.
+
+    Args:
+        seed: Value the chain starts from (condensing model and prompts).
+        messages: Messages to hash.
+
+    Returns:
+        List of ``len(messages) + 1`` hex digests.
+    """
+    digest = hashlib.sha256(seed.encode()).hexdigest()
+    ret = [digest]
+    for message in messages:
+        hasher = hashlib.sha256(digest.encode())
+        if isinstance(message, ModelImageMessage):
+            # Do not base64-encode the image just to hash it
+            hasher.update(f"{message.role}\0{message.content}\0".encode())
+            hasher.update(message.image)
+        else:
+            hasher.update(json.dumps(message.toDict(), ensure_ascii=False, default=str, sort_keys=True).encode())
+        digest = hasher.hexdigest()
+        ret.append(digest)
+    return ret
+
 
 class LLMService:
     """Singleton service for managing LLM interactions and tool execution.
@@ -97,6 +141,8 @@ class LLMService:
             self.toolsHandlers: Dict[str, LLMToolFunction] = {}
             self.rateLimiterManager = RateLimiterManager()
             self.llmManager: Optional[LLMManager] = None
+            self.condensedContextCache: CacheInterface[str, CondensedContextDict] = NullCache()
+            self._toolsStats: Dict[str, Dict[str, float]] = {}
 
             self.initialized = True
             logger.info("LLMService initialized")
@@ -121,8 +167,26 @@ class LLMService:
         """
         self.llmManager = llmManager
 
+    def injectCondensedContextCache(self, cache: CacheInterface[str, CondensedContextDict]) -> None:
+        """Inject a persistent cache for rolling summaries of condensed contexts.
+
+        Args:
+            cache: Cache storing CondensedContextDict values by conversation key
+
+        Returns:
+            None
+        """
+        self.condensedContextCache = cache
+
     def registerTool(
-        self, name: str, description: str, parameters: Sequence[LLMFunctionParameter], handler: LLMToolHandler
+        self,
+        name: str,
+        description: str,
+        parameters: Sequence[LLMFunctionParameter],
+        handler: LLMToolHandler,
+        *,
+        parallelSafe: bool = False,
+        timeout: Optional[float] = None,
     ) -> None:
         """Register a new tool for the LLM service.
 
@@ -136,6 +200,10 @@ class LLMService:
             description: The description of what the tool does
             parameters: The parameter schema for the tool function
             handler: The async handler function that executes the tool logic
+            parallelSafe: Whether calls of the tool have no side effects other calls
+                of the same turn depend on, so they may run concurrently
+            timeout: Optional max seconds a call may run; parallel-safe tools
+                default to constants.DEFAULT_PARALLEL_TOOL_TIMEOUT
 
         Returns:
             None
@@ -145,9 +213,171 @@ class LLMService:
             description=description,
             parameters=parameters,
             function=handler,
+            parallelSafe=parallelSafe,
+            timeout=timeout,
         )
         logger.info(f"Tool {name} registered")
 
+    def _getToolStats(self, name: str) -> Dict[str, float]:
+        """Get (creating if needed) the latency metrics of a tool.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Mutable metrics dict of the tool
+        """
+        stats = self._toolsStats.get(name)
+        if stats is None:
+            stats = {
+                "calls": 0,
+                "running": 0,
+                "errors": 0,
+                "timeouts": 0,
+                "durationTotal": 0.0,
+                "durationMax": 0.0,
+            }
+            self._toolsStats[name] = stats
+        return stats
+
+    async def _runToolCall(self, toolCall: LLMToolCall, extraData: ExtraDataDict) -> str:
+        """Run a single tool call and convert its result to message content.
+
+        Unknown tools and timed out calls produce an error JSON for the LLM,
+        exceptions of the handler are propagated. Duration, errors and timeouts
+        are recorded in the per-tool metrics.
+
+        Args:
+            toolCall: Tool call requested by the LLM
+            extraData: Extra data passed to the tool handler
+
+        Returns:
+            Tool result as string
+        """
+        tool = self.toolsHandlers.get(toolCall.name)
+        if tool is None:
+            # If wrong tool called, return error about it
+            return utils.jsonDumps(
+                {
+                    "done": False,
+                    "error": f"Tool {toolCall.name} not found, available tools are "
+                    + str(list(self.toolsHandlers.keys())),
+                }
+            )
+
+        timeout = tool.timeout
+        if timeout is None and tool.parallelSafe:
+            timeout = constants.DEFAULT_PARALLEL_TOOL_TIMEOUT
+
+        stats = self._getToolStats(toolCall.name)
+        stats["running"] += 1
+        startTime = time.monotonic()
+        try:
+            toolRet = await asyncio.wait_for(tool.call(extraData, **toolCall.parameters), timeout=timeout)
+        except asyncio.TimeoutError:
+            stats["timeouts"] += 1
+            logger.warning(f"Tool {toolCall.name} timed out after {timeout} seconds")
+            toolRet = {"done": False, "error": f"Tool {toolCall.name} timed out after {timeout} seconds"}
+        except Exception:
+            stats["errors"] += 1
+            raise
+        finally:
+            duration = time.monotonic() - startTime
+            stats["running"] -= 1
+            stats["calls"] += 1
+            stats["durationTotal"] += duration
+            stats["durationMax"] = max(stats["durationMax"], duration)
+
+        # Content of ModelMessage should be string, so if tool result is not string,
+        # convert it to string via utils.jsonDumps()
+        if not isinstance(toolRet, str):
+            toolRet = utils.jsonDumps(toolRet)
+        return toolRet
+
+    async def _runParallelToolCall(
+        self, toolCall: LLMToolCall, extraData: ExtraDataDict, semaphore: asyncio.Semaphore
+    ) -> str:
+        """Run a parallel-safe tool call within the fan-out limit.
+
+        Args:
+            toolCall: Tool call requested by the LLM
+            extraData: Extra data passed to the tool handler
+            semaphore: Fan-out limit of the current LLM turn
+
+        Returns:
+            Tool result as string
+        """
+        async with semaphore:
+            return await self._runToolCall(toolCall, extraData)
+
+    async def _runToolCalls(self, toolCalls: Sequence[LLMToolCall], extraData: ExtraDataDict) -> List[str]:
+        """Run the tool calls of one LLM turn.
+
+        Consecutive calls of parallel-safe tools run concurrently (at most
+        constants.MAX_PARALLEL_TOOL_CALLS at once), any other call runs alone
+        after everything requested before it is done. Results keep the order
+        of the calls. If a call raises, the rest of its parallel group still
+        completes and the first exception (in call order) is propagated.
+
+        Args:
+            toolCalls: Tool calls requested by the LLM
+            extraData: Extra data passed to the tool handlers
+
+        Returns:
+            Tool results as strings, in the order of toolCalls
+        """
+        results: List[str] = []
+        # The limit is per LLM turn, so concurrent chats don't throttle each other
+        semaphore = asyncio.Semaphore(constants.MAX_PARALLEL_TOOL_CALLS)
+        pos = 0
+        while pos < len(toolCalls):
+            groupEnd = pos
+            while groupEnd < len(toolCalls):
+                tool = self.toolsHandlers.get(toolCalls[groupEnd].name)
+                if tool is None or not tool.parallelSafe:
+                    break
+                groupEnd += 1
+
+            if groupEnd - pos < 2:
+                results.append(await self._runToolCall(toolCalls[pos], extraData))
+                pos += 1
+                continue
+
+            groupResults = await asyncio.gather(
+                *(self._runParallelToolCall(toolCall, extraData, semaphore) for toolCall in toolCalls[pos:groupEnd]),
+                return_exceptions=True,
+            )
+            for groupResult in groupResults:
+                if isinstance(groupResult, BaseException):
+                    raise groupResult
+                results.append(groupResult)
+            pos = groupEnd
+
+        return results
+
+    def getStats(self) -> Dict[str, Any]:
+        """Get tool calls metrics.
+
+        Returns:
+            A dictionary with:
+            - tools: Per tool metrics: calls, running, errors, timeouts,
+              totalDuration, avgDuration and maxDuration (seconds per call)
+        """
+        tools: Dict[str, Any] = {}
+        for name, stats in self._toolsStats.items():
+            calls = stats["calls"]
+            tools[name] = {
+                "calls": int(calls),
+                "running": int(stats["running"]),
+                "errors": int(stats["errors"]),
+                "timeouts": int(stats["timeouts"]),
+                "totalDuration": stats["durationTotal"],
+                "avgDuration": stats["durationTotal"] / calls if calls else 0.0,
+                "maxDuration": stats["durationMax"],
+            }
+
+        return {"tools": tools}
+
     def _tryApplyToolCallMatch(
         self,
         mlRunResult: ModelRunResult,
@@ -371,6 +601,7 @@ class LLMService:
         useTools: bool = False,
         callId: Optional[str] = None,
         callback: Optional[Callable[[ModelRunResult, ExtraDataDict], Awaitable[None]]] = None,
+        streamCallback: Optional[Callable[[ModelResultChunk], Awaitable[None]]] = None,
         extraData: ExtraDataDict,
         keepFirstN: int = 0,
         keepLastN: int = 1,
@@ -378,6 +609,7 @@ class LLMService:
         condensingPromptKey: Optional[Union[str, ChatSettingsKey]] = None,
         condensingSystemPromptKey: Optional[Union[str, ChatSettingsKey]] = None,
         condensingModelKey: Optional[Union[AbstractModel, ChatSettingsKey]] = None,
+        condensedContextKey: Optional[str] = None,
     ) -> ModelRunResult:
         """Generate text using an LLM with automatic tool execution support.
 
@@ -403,6 +635,9 @@ class LLMService:
             callId: Optional unique identifier for this LLM call (auto-generated if None)
             callback: Optional async callback invoked when tool calls are made,
                 receives the ModelRunResult and extraData
+            streamCallback: Optional async callback receiving the streamed chunks of every
+                LLM turn (see generateText()). It is called before callback for turns
+                ending with tool calls
             extraData: Optional dictionary of extra data passed to tool handlers and callbacks
             keepFirstN: Number of messages to keep from the beginning when condensing context
             keepLastN: Number of messages to keep from the end when condensing context
@@ -410,6 +645,8 @@ class LLMService:
             condensingPromptKey: Optional key for the condensing prompt text
             condensingSystemPromptKey: Optional key for the condensing system prompt
             condensingModelKey: Optional model to use for summarizing messages
+            condensedContextKey: Optional conversation key (e.g. chat and thread) to keep
+                a rolling summary of the condensed context under, see condenseContext()
 
         Returns:
             ModelRunResult containing the final LLM response, with toolsUsed flag set
@@ -469,6 +706,7 @@ class LLMService:
                 condensingModel=condensingModel,
                 condensingPrompt=condensingPrompt,
                 condensingSystemPrompt=condensingSystemPrompt,
+                condensedContextKey=condensedContextKey,
             )
 
             ret = await self.generateText(
@@ -479,6 +717,7 @@ class LLMService:
                 fallbackKey=fallbackModel,
                 tools=tools,
                 doDebugLogging=False,
+                streamCallback=streamCallback,
             )
             logger.debug(f"LLM returned: {ret} for callId #{callId}")
             if ret.status == ModelResultStatus.FINAL and ret.resultText:
@@ -503,24 +742,11 @@ class LLMService:
                 toolsUsed = True
                 newMessages = [ret.toModelMessage()]
 
-                for toolCall in ret.toolCalls:
-                    toolRet = ""
-                    # Check if tool is available
-                    if toolCall.name in self.toolsHandlers:
-                        toolRet = await self.toolsHandlers[toolCall.name].call(extraData, **toolCall.parameters)
-                    else:
-                        # If wrong tool called, return error about it
-                        toolRet = {
-                            "done": False,
-                            "error": f"Tool {toolCall.name} not found, available tools are "
-                            + str(list(self.toolsHandlers.keys())),
-                        }
-
-                    # Content of ModelMessage should be string, so if tool result is not string,
-                    # convert it to string via utils.jsonDumps()
-                    if not isinstance(toolRet, str):
-                        toolRet = utils.jsonDumps(toolRet)
-
+                toolsStartTime = time.monotonic()
+                toolsResults = await self._runToolCalls(ret.toolCalls, extraData)
+                toolsDuration = time.monotonic() - toolsStartTime
+                logger.debug(f"{len(ret.toolCalls)} tool calls took {toolsDuration:.3f}s for callId #{callId}")
+                for toolCall, toolRet in zip(ret.toolCalls, toolsResults):
                     newMessages.append(
                         ModelMessage(
                             role="tool",
@@ -557,6 +783,7 @@ class LLMService:
         condensingSystemPrompt: Optional[str] = None,
         maxTokens: Optional[int] = None,
         force: bool = False,
+        condensedContextKey: Optional[str] = None,
     ) -> Sequence[ModelMessage]:
         """Condense a sequence of messages to fit within a token limit.
 
@@ -567,6 +794,13 @@ class LLMService:
         The method preserves the first N messages and the last N messages,
         condensing or removing only the middle portion of the conversation.
 
+        With condensedContextKey the summary is kept in condensedContextCache as a
+        rolling summary: the next call for the same conversation reuses it for the
+        already summarized messages (checked via a digest chain, so any change in
+        them or in the condensing model/prompts invalidates it) and summarizes only
+        the messages added since. Tool-call iterations and follow-up replies thus
+        do not re-summarize the whole history again.
+
         Args:
             messages: The sequence of messages to condense
             model: The model used for token counting and as fallback if no condensingModel provided
@@ -578,6 +812,8 @@ class LLMService:
                 When provided, replaces the chat personality system prompt during condensing.
             maxTokens: Maximum number of tokens allowed in the condensed result
             force: Whether to force condensing even if the result would fit within the token limit
+            condensedContextKey: Optional conversation key to keep a rolling summary under
+                (used only together with condensingModel)
 
         Returns:
             A new sequence of messages condensed to fit within the token limit
@@ -603,9 +839,11 @@ class LLMService:
         retTail = [messages[i] for i in range(messagesCount - keepLastN, messagesCount)]
         body = [messages[i] for i in range(keepFirstN, messagesCount - keepLastN)]
 
-        retHTokens = model.getEstimateTokensCount([v.toDict() for v in retHead])
-        retTTokens = model.getEstimateTokensCount([v.toDict() for v in retTail])
-        bodyTokens = model.getEstimateTokensCount([v.toDict() for v in body])
+        # Count each message once, slices are summed from prefix sums
+        counter = await MessageTokensCounter.create(model, messages)
+        retHTokens = counter.total(0, keepFirstN)
+        retTTokens = counter.total(messagesCount - keepLastN, messagesCount)
+        bodyTokens = counter.total(keepFirstN, messagesCount - keepLastN)
 
         if not force and (retHTokens + retTTokens + bodyTokens < maxTokens):
             return messages
@@ -619,9 +857,8 @@ class LLMService:
         if condensingModel is None:
             # No condensing model provided, just truncate beginning of body
             # TODO: should we truncate from middle instead?
-            while body and retHTokens + retTTokens + bodyTokens > maxTokens:
-                body = body[1:]
-                bodyTokens = model.getEstimateTokensCount([v.toDict() for v in body])
+            bodyStart = counter.trimStart(maxTokens - retHTokens - retTTokens, keepFirstN, messagesCount - keepLastN)
+            body = body[bodyStart - keepFirstN :]
 
             ret = []
             ret.extend(retHead)
@@ -638,8 +875,6 @@ class LLMService:
                 " additional commentary or explanation."
                 " Answer using language of conversation, not language of this message."
             )
-        newBody: List[ModelMessage] = []
-        summaryMaxTokens = condensingModel.contextSize
         logger.debug(f"Condensing model: {condensingModel}, prompt: {condensingPrompt}")
 
         # Prefer the dedicated condensing system prompt over the chat persona.
@@ -659,30 +894,116 @@ class LLMService:
             )
         condensingMessage = ModelMessage(role="user", content=condensingPrompt)
 
+        # Reuse the stored rolling summary if it still matches the beginning of the body
+        summaries: List[str] = []
+        condensedCount = 0
+        cacheKey: Optional[str] = None
+        digests: List[str] = []
+        if condensedContextKey is not None and body:
+            digests = _digestChain(
+                "\0".join((condensingModel.modelId, systemMessage.content, condensingMessage.content)), body
+            )
+            # The first condensed message tells conversations of the same chat/thread apart
+            cacheKey = f"{condensedContextKey}:{digests[1]}"
+            stored: Optional[CondensedContextDict] = None
+            try:
+                stored = await self.condensedContextCache.get(cacheKey)
+            except Exception as e:
+                logger.error(f"Error while reading condensed context {cacheKey}: {type(e).__name__}#{e}")
+            if stored is not None:
+                count = int(stored.get("count", 0))
+                if 0 < count <= len(body) and digests[count] == stored.get("digest"):
+                    summaries = list(stored.get("summaries", []))
+                    condensedCount = count
+                    logger.debug(f"Reusing condensed context {cacheKey} for {count}/{len(body)} messages")
+
+        newSummaries, isComplete = await self._summarizeMessages(
+            body[condensedCount:],
+            condensingModel=condensingModel,
+            systemMessage=systemMessage,
+            condensingMessage=condensingMessage,
+        )
+        summaries.extend(newSummaries)
+
+        # Rolling summary grew too big - summarize the summaries
+        summaryMessages = [ModelMessage(role="user", content=summary) for summary in summaries]
+        summariesTokens = model.getEstimateMessagesTokensCount(summaryMessages)
+        if condensedCount > 0 and len(summaries) > 1 and retHTokens + summariesTokens + retTTokens >= maxTokens:
+            compacted, compactedComplete = await self._summarizeMessages(
+                summaryMessages,
+                condensingModel=condensingModel,
+                systemMessage=systemMessage,
+                condensingMessage=condensingMessage,
+            )
+            if compactedComplete and compacted:
+                summaries = compacted
+
+        if cacheKey is not None and isComplete:
+            try:
+                await self.condensedContextCache.set(
+                    cacheKey,
+                    {"count": len(body), "digest": digests[len(body)], "summaries": summaries},
+                )
+            except Exception as e:
+                logger.error(f"Error while storing condensed context {cacheKey}: {type(e).__name__}#{e}")
+
+        ret = []
+        ret.extend(retHead)
+        ret.extend(ModelMessage(role="user", content=summary) for summary in summaries)
+        ret.extend(retTail)
+        logger.debug(f"Condensed context: {ret}")
+        return ret
+
+    async def _summarizeMessages(
+        self,
+        messages: Sequence[ModelMessage],
+        *,
+        condensingModel: AbstractModel,
+        systemMessage: ModelMessage,
+        condensingMessage: ModelMessage,
+    ) -> Tuple[List[str], bool]:
+        """Summarize messages in batches fitting into the condensing model context.
+
+        Args:
+            messages: Messages to summarize
+            condensingModel: Model used for summarizing
+            systemMessage: System message of each summarizing request
+            condensingMessage: Instruction appended to each summarizing request
+
+        Returns:
+            Tuple of the summary texts (one per batch) and whether every batch was summarized
+        """
+        summaries: List[str] = []
+        isComplete = True
+        if not messages:
+            return summaries, isComplete
+
+        summaryMaxTokens = condensingModel.contextSize
+        bodyCounter = await MessageTokensCounter.create(condensingModel, messages)
+        requestTokens = (await MessageTokensCounter.create(condensingModel, [systemMessage, condensingMessage])).total()
+
         # -256 or *0.85 to ensure everything will be ok
-        tokensCount = condensingModel.getEstimateTokensCount([v.toDict() for v in body])
+        tokensCount = bodyCounter.total()
         batchesCount = tokensCount // max(summaryMaxTokens - 256, summaryMaxTokens * 0.85) + 1
-        batchLength = len(body) // batchesCount
+        batchLength = len(messages) // batchesCount
 
         startPos = 0
-        while startPos < len(body):
-            currentBatchLen = int(min(batchLength, len(body) - startPos))
+        while startPos < len(messages):
+            currentBatchLen = max(1, int(min(batchLength, len(messages) - startPos)))
+            # Shrink the batch to what fits into the condensing model context
+            currentBatchLen = (
+                bodyCounter.fitEnd(summaryMaxTokens - requestTokens, startPos, startPos + currentBatchLen) - startPos
+            )
+            if currentBatchLen < 1:
+                logger.error(f"Error while running LLM for message {messages[startPos]}")
+                isComplete = False
+                startPos += 1
+                continue
 
-            tryMessages = body[startPos : startPos + currentBatchLen]
+            tryMessages = messages[startPos : startPos + currentBatchLen]
             reqMessages = [systemMessage]
             reqMessages.extend(tryMessages)
             reqMessages.append(condensingMessage)
-            tokensCount = condensingModel.getEstimateTokensCount([v.toDict() for v in reqMessages])
-            if tokensCount > summaryMaxTokens:
-                if currentBatchLen == 1:
-                    logger.error(f"Error while running LLM for message {body[startPos]}")
-                    startPos += 1
-                    continue
-                currentBatchLen = int(currentBatchLen // (tokensCount / summaryMaxTokens))
-                currentBatchLen -= 2
-                if currentBatchLen < 1:
-                    currentBatchLen = 1
-                continue
 
             mlRet: Optional[ModelRunResult] = None
             try:
@@ -694,19 +1015,14 @@ class LLMService:
                     f"Error while running LLM for batch {startPos}:{startPos + currentBatchLen}: "
                     f"{type(e).__name__}#{e}"
                 )
+                isComplete = False
                 startPos += currentBatchLen
                 continue
 
-            respText = mlRet.resultText
-            newBody.append(ModelMessage(role="user", content=respText))
+            summaries.append(mlRet.resultText)
             startPos += currentBatchLen
 
-        ret = []
-        ret.extend(retHead)
-        ret.extend(newBody)
-        ret.extend(retTail)
-        logger.debug(f"Condensed context: {ret}")
-        return ret
+        return summaries, isComplete
 
     async def generateText(
         self,
@@ -718,12 +1034,14 @@ class LLMService:
         fallbackKey: Union[ChatSettingsKey, AbstractModel, None],
         tools: Optional[Sequence[LLMAbstractTool]] = None,
         doDebugLogging: bool = True,
+        streamCallback: Optional[Callable[[ModelResultChunk], Awaitable[None]]] = None,
     ) -> ModelRunResult:
         """Generate text via the configured chat model with fallback support.
 
         Resolves the primary and fallback models from chatSettings, applies rate limiting,
         then delegates to AbstractModel.generateText with fallbackModels parameter and
-        optional tool support.
+        optional tool support. When streamCallback is given, AbstractModel.generateTextStream
+        is used instead and every chunk is passed to the callback as it arrives.
 
         Args:
             prompt: Sequence of ModelMessage objects representing the conversation history
@@ -739,6 +1057,9 @@ class LLMService:
             tools: Optional sequence of tools that the LLM can call during generation
             doDebugLogging: When True, emit DEBUG log entries before and after the
                 model call. Set to False for tight loops to reduce log noise
+            streamCallback: Optional async callback receiving ModelResultChunk objects
+                while the response is streamed (the last one carries the result).
+                Errors raised by the callback are logged and do not stop generation
 
         Returns:
             ModelRunResult containing the generated text response, status, and any tool
@@ -761,17 +1082,67 @@ class LLMService:
                 messageHistoryStr += f"\t{msg.toLogMessage()}\n"
             logger.debug(f"LLM Request messages: List[\n{messageHistoryStr}]")
 
-        ret = await llmModel.generateText(
-            prompt,
-            tools=tools,
-            fallbackModels=[fallbackModel],
-            consumerId=str(chatId) if chatId is not None else None,
-        )
+        consumerId = str(chatId) if chatId is not None else None
+        if streamCallback is None:
+            ret = await llmModel.generateText(
+                prompt,
+                tools=tools,
+                fallbackModels=[fallbackModel],
+                consumerId=consumerId,
+            )
+        else:
+            ret = await self._consumeTextStream(
+                llmModel.generateTextStream(
+                    prompt,
+                    tools=tools,
+                    fallbackModels=[fallbackModel],
+                    consumerId=consumerId,
+                ),
+                streamCallback,
+            )
 
         if doDebugLogging:
             logger.debug(f"LLM returned: {ret}")
         return ret
 
+    async def _consumeTextStream(
+        self,
+        stream: AsyncIterator[ModelResultChunk],
+        streamCallback: Callable[[ModelResultChunk], Awaitable[None]],
+    ) -> ModelRunResult:
+        """Pass every chunk of a text stream to the callback and return the final result.
+
+        A failing callback is logged and not called again, so a broken chat-side
+        sink never breaks the generation itself, dood!
+
+        Args:
+            stream: Stream from AbstractModel.generateTextStream().
+            streamCallback: Async callback receiving the chunks.
+
+        Returns:
+            The ModelRunResult carried by the last chunk.
+
+        Raises:
+            RuntimeError: If the stream ended without a result.
+        """
+        ret: Optional[ModelRunResult] = None
+        callbackFailed = False
+        async for chunk in stream:
+            if chunk.result is not None:
+                ret = chunk.result
+            if callbackFailed:
+                continue
+            try:
+                await streamCallback(chunk)
+            except Exception as e:
+                logger.error(f"Stream callback failed: {e}")
+                logger.exception(e)
+                callbackFailed = True
+
+        if ret is None:
+            raise RuntimeError("LLM stream ended without result")
+        return ret
+
     async def generateStructured(
         self,
         prompt: Sequence[ModelMessage],
@@ -20,12 +20,13 @@ Example:
 """
 
 from .constants import MAX_QUEUE_AGE, MAX_QUEUE_LENGTH
-from .service import QueueService, makeEmptyAsyncTask
+from .service import DelayedTaskQueue, QueueService, makeEmptyAsyncTask
 from .types import DelayedTask, DelayedTaskFunction, DelayedTaskHandler
 
 __all__ = [
     # Service
     "QueueService",
+    "DelayedTaskQueue",
     "makeEmptyAsyncTask",
     # Types
     "DelayedTask",
@@ -5,3 +5,22 @@ Constants for Queue Service.
 # Queue settings
 MAX_QUEUE_LENGTH = 32
 MAX_QUEUE_AGE = 30 * 60  # 30 minutes
+
+# Delayed tasks executor settings
+MAX_CONCURRENT_DELAYED_TASKS = 16
+"""Max number of delayed tasks whose handlers run at the same time"""
+DEFAULT_DELAYED_TASK_CONCURRENCY = 8
+"""Max concurrently running tasks of one ``DelayedTaskFunction`` unless overridden below"""
+DELAYED_TASK_CONCURRENCY = {
+    # Overlapping cron ticks would only pile up behind each other
+    "cronJob": 1,
+}
+"""Per-``DelayedTaskFunction`` concurrency overrides"""
+DEFAULT_DELAYED_TASK_HANDLER_TIMEOUT = 120  # 2 minutes
+"""Max seconds a single handler may run before it is cancelled"""
+DELAYED_TASK_HANDLER_TIMEOUT = {
+    "cronJob": 300,  # 5 minutes
+}
+"""Per-``DelayedTaskFunction`` handler timeout overrides"""
+DELAYED_TASK_RETRY_DELAY = 60
+"""Seconds to postpone a task which has no registered handlers"""
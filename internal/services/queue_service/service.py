@@ -11,6 +11,7 @@ for different types of delayed tasks.
 
 Classes:
     QueueService: Singleton service managing async and delayed task queues
+    DelayedTaskQueue: Heap-backed queue of delayed tasks with a due-time aware wait
 
 Example:
     >>> queueService = QueueService.getInstance()
@@ -23,6 +24,7 @@ Example:
 """
 
 import asyncio
+import heapq
 import json
 import logging
 import math
@@ -30,7 +32,7 @@ import time
 import uuid
 from collections.abc import MutableSet
 from threading import RLock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import lib.utils as utils
 from internal.database import Database
@@ -53,6 +55,122 @@ def makeEmptyAsyncTask() -> asyncio.Task:
     return asyncio.create_task(asyncio.sleep(0))
 
 
+class DelayedTaskQueue:
+    """Priority queue of delayed tasks ordered by ``delayedUntil``.
+
+    Offers the subset of the ``asyncio.PriorityQueue`` interface used by
+    :class:`QueueService` (``put``, ``get``, ``get_nowait``, ``task_done``,
+    ``qsize``, ``empty``) on top of a heap owned by this class, plus
+    :meth:`peek` and :meth:`getDue`, which sleeps exactly until the head task
+    is due and wakes up early when a task with an earlier due time is put
+    into the queue. This replaces popping the head and putting it back
+    every second while waiting.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self._heap: List[Any] = []
+        self._unfinishedTasks: int = 0
+        self._headChanged = asyncio.Event()
+
+    def __str__(self) -> str:
+        return f"<{type(self).__name__} items={self._heap!r} unfinished={self._unfinishedTasks}>"
+
+    def qsize(self) -> int:
+        """Return the number of queued items."""
+        return len(self._heap)
+
+    def empty(self) -> bool:
+        """Return True if the queue is empty."""
+        return not self._heap
+
+    async def put(self, item: Any) -> None:
+        """Put an item into the queue (the queue is unbounded, so this never waits).
+
+        Args:
+            item: Item to queue, ordered by its ``<`` comparison
+        """
+        self.put_nowait(item)
+
+    def put_nowait(self, item: Any) -> None:
+        """Put an item into the queue.
+
+        Args:
+            item: Item to queue, ordered by its ``<`` comparison
+        """
+        heapq.heappush(self._heap, item)
+        self._unfinishedTasks += 1
+        # heapq keeps the smallest item at index 0: wake up getDue() only
+        # when the new item became the head, i.e. is due earlier.
+        if self._heap[0] is item:
+            self._headChanged.set()
+
+    async def get(self) -> Any:
+        """Remove and return the head item, waiting until one is queued.
+
+        Returns:
+            The item with the smallest ``delayedUntil``
+        """
+        while not self._heap:
+            self._headChanged.clear()
+            await self._headChanged.wait()
+        return self.get_nowait()
+
+    def get_nowait(self) -> Any:
+        """Remove and return the head item.
+
+        Returns:
+            The item with the smallest ``delayedUntil``
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty
+        """
+        if not self._heap:
+            raise asyncio.QueueEmpty
+        return heapq.heappop(self._heap)
+
+    def task_done(self) -> None:
+        """Mark a previously taken item as processed.
+
+        Raises:
+            ValueError: If called more times than there were items put
+        """
+        if self._unfinishedTasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinishedTasks -= 1
+
+    def peek(self) -> Optional[Any]:
+        """Return the head item without removing it.
+
+        Returns:
+            The item with the smallest ``delayedUntil``, or None if empty
+        """
+        return self._heap[0] if self._heap else None
+
+    async def getDue(self) -> Any:
+        """Remove and return the head item once it is due.
+
+        Returns:
+            The earliest item; items without ``delayedUntil`` (which should
+            never be put here) are returned immediately
+        """
+        while True:
+            self._headChanged.clear()
+            head = self.peek()
+            if head is None:
+                await self._headChanged.wait()
+                continue
+
+            delay = getattr(head, "delayedUntil", 0) - time.time()
+            if delay <= 0:
+                return self.get_nowait()
+
+            try:
+                await asyncio.wait_for(self._headChanged.wait(), timeout=delay)
+            except TimeoutError:
+                pass
+
+
 class QueueService:
     """Singleton service for managing asynchronous and delayed task execution.
 
@@ -67,11 +185,17 @@ class QueueService:
         db (Optional[Database]): Database connection for task persistence
         backgroundTasks (MutableSet[asyncio.Task]): Set of background async tasks
         queueLastUpdated (float): Timestamp of last queue update
-        delayedActionsQueue (asyncio.PriorityQueue): Priority queue for delayed tasks
+        delayedActionsQueue (DelayedTaskQueue): Priority queue for delayed tasks
         tasksHandlers (Dict[DelayedTaskFunction, List[DelayedTaskHandler]]):
             Registered handlers for each task function type
         initialized (bool): Flag indicating if instance is initialized
 
+    Due delayed tasks are dispatched onto a bounded concurrent executor:
+    at most ``MAX_CONCURRENT_DELAYED_TASKS`` tasks run at once, each
+    ``DelayedTaskFunction`` has its own concurrency limit, and every
+    handler call is bounded by a timeout (see ``constants``). Handlers
+    of one task still run sequentially in registration order.
+
     Thread Safety:
         Uses RLock for thread-safe singleton instantiation
 
@@ -103,7 +227,7 @@ class QueueService:
 
         This method is called only once per singleton instance. It sets up:
         - Background tasks queue (asyncio.Queue)
-        - Delayed actions priority queue (asyncio.PriorityQueue)
+        - Delayed actions priority queue (DelayedTaskQueue)
         - Task handlers registry
         - Internal state flags
 
@@ -118,9 +242,14 @@ class QueueService:
             self.backgroundTasks: MutableSet[asyncio.Task] = set[asyncio.Task]()
             self.queueLastUpdated = time.time()
 
-            self.delayedActionsQueue = asyncio.PriorityQueue()
+            self.delayedActionsQueue = DelayedTaskQueue()
             self.tasksHandlers: Dict[DelayedTaskFunction, List[DelayedTaskHandler]] = {}
 
+            self._delayedTasksSemaphore = asyncio.Semaphore(constants.MAX_CONCURRENT_DELAYED_TASKS)
+            self._functionSemaphores: Dict[DelayedTaskFunction, asyncio.Semaphore] = {}
+            self._runningDelayedTasks: Set[asyncio.Task] = set()
+            self._delayedTasksStats: Dict[DelayedTaskFunction, Dict[str, float]] = {}
+
             self.initialized = True
             logger.info("QueueService initialized")
 
@@ -314,22 +443,23 @@ class QueueService:
         """Main processing loop for the delayed tasks priority queue.
 
         This infinite loop:
-        1. Retrieves tasks from priority queue (ordered by delayedUntil)
-        2. Checks if task is due (delayedUntil <= current time)
-        3. If not due, re-queues task and sleeps until it's ready
-        4. If due, executes all registered handlers for the task function
-        5. Updates task status in database as completed
-        6. Handles DO_EXIT task to terminate loop gracefully
+        1. Waits until the earliest task is due (woken up early when an
+           earlier task is added, see :meth:`DelayedTaskQueue.getDue`)
+        2. Dispatches the task to the concurrent executor
+           (:meth:`_runDelayedTask`), which runs all registered handlers
+           for the task function and marks the task as completed in DB
+        3. Handles DO_EXIT task inline: waits for running tasks, runs the
+           DO_EXIT handlers and terminates the loop gracefully
 
         The loop continues until:
         - DO_EXIT task is processed (graceful shutdown)
         - RuntimeError with "Event loop is closed" (forced shutdown)
 
         Note:
-            - Tasks are processed in order of delayedUntil
+            - Tasks are dispatched in order of delayedUntil, but may run
+              concurrently (bounded by global and per-function limits)
             - Tasks without handlers are delayed by 60 seconds
-            - Handler errors are logged but don't stop processing
-            - Database updates are skipped if db is None (shouldn't happen)
+            - Handler errors and timeouts are logged but don't stop processing
             - This is a blocking operation that runs until shutdown
 
         Returns:
@@ -337,61 +467,40 @@ class QueueService:
         """
         while True:
             try:
-                # logger.debug("_pDQ(): Iteration...")
-                delayedTask = await self.delayedActionsQueue.get()
-                tasksCount = self.delayedActionsQueue.qsize()
+                delayedTask = await self.delayedActionsQueue.getDue()
+                self.delayedActionsQueue.task_done()
 
                 if not isinstance(delayedTask, DelayedTask):
-                    self.delayedActionsQueue.task_done()
                     logger.error(
                         f"Got wrong element from delayedActionsQueue: {type(delayedTask).__name__}#{repr(delayedTask)}"
                     )
                     continue
 
-                if delayedTask.delayedUntil > time.time():
-                    self.delayedActionsQueue.task_done()
-                    await self.delayedActionsQueue.put(delayedTask)
-                    tasksCount += 1  # As we've added task back
-                    maxSleepIterations = min(60, int(delayedTask.delayedUntil - time.time()))
-                    iteration = 0
-                    # In case of queueLen change - stop sleeping
-                    while iteration < maxSleepIterations and tasksCount == self.delayedActionsQueue.qsize():
-                        await asyncio.sleep(1)
-                        iteration = iteration + 1
-                        # logger.debug(
-                        #     f"Iteration: {iteration}, taskCount={tasksCount}:{self.delayedActionsQueue.qsize()}...",
-                        # )
-                    continue
-
                 if delayedTask.function != DelayedTaskFunction.CRON_JOB:
                     # Do not log cronjobs
                     logger.debug(f"Got {delayedTask}...")
 
-                if delayedTask.function == DelayedTaskFunction.DO_EXIT:
-                    logger.info("got doExit, starting shutdown process...")
-
                 if delayedTask.function not in self.tasksHandlers:
-                    logger.error(f"No handlers for {delayedTask.function} registered, delaying task for 60 seconds...")
-                    delayedTask.delayedUntil = time.time() + 60
+                    logger.error(
+                        f"No handlers for {delayedTask.function} registered, "
+                        f"delaying task for {constants.DELAYED_TASK_RETRY_DELAY} seconds..."
+                    )
+                    delayedTask.delayedUntil = time.time() + constants.DELAYED_TASK_RETRY_DELAY
                     await self.delayedActionsQueue.put(delayedTask)
-                else:
-                    for handler in self.tasksHandlers[delayedTask.function]:
-                        try:
-                            await handler(delayedTask)
-                        except Exception as e:
-                            logger.error(f"Error in handler {handler.__name__}: {e}")
-                            logger.exception(e)
-
-                if self.db is not None:
-                    await self.db.delayedTasks.updateDelayedTask(delayedTask.taskId, True)
-                else:
-                    logger.error("No database connection, this shouldn't happen")
+                    continue
 
-                self.delayedActionsQueue.task_done()
                 if delayedTask.function == DelayedTaskFunction.DO_EXIT:
+                    logger.info("got doExit, starting shutdown process...")
+                    if self._runningDelayedTasks:
+                        await asyncio.gather(*self._runningDelayedTasks, return_exceptions=True)
+                    await self._runDelayedTask(delayedTask)
                     logger.debug("doExit(), exiting...")
                     return
 
+                runner = asyncio.create_task(self._runDelayedTask(delayedTask))
+                self._runningDelayedTasks.add(runner)
+                runner.add_done_callback(self._runningDelayedTasks.discard)
+
             except RuntimeError as e:
                 logger.error(f"Error in delayed task processor: {e}")
                 if str(e) == "Event loop is closed":
@@ -401,6 +510,139 @@ class QueueService:
                 logger.error(f"Error in delayed task processor: {e}")
                 logger.exception(e)
 
+    def _getFunctionSemaphore(self, function: DelayedTaskFunction) -> asyncio.Semaphore:
+        """Get (creating on first use) the concurrency limiter of a task function.
+
+        Args:
+            function (DelayedTaskFunction): Task function type
+
+        Returns:
+            asyncio.Semaphore: Semaphore bounding concurrent tasks of this function
+        """
+        semaphore = self._functionSemaphores.get(function)
+        if semaphore is None:
+            limit = constants.DELAYED_TASK_CONCURRENCY.get(function, constants.DEFAULT_DELAYED_TASK_CONCURRENCY)
+            semaphore = asyncio.Semaphore(limit)
+            self._functionSemaphores[function] = semaphore
+        return semaphore
+
+    def _getFunctionStats(self, function: DelayedTaskFunction) -> Dict[str, float]:
+        """Get (creating on first use) the metrics bucket of a task function.
+
+        Args:
+            function (DelayedTaskFunction): Task function type
+
+        Returns:
+            Dict[str, float]: Mutable metrics dict of this function
+        """
+        stats = self._delayedTasksStats.get(function)
+        if stats is None:
+            stats = {
+                "processed": 0,
+                "calls": 0,
+                "running": 0,
+                "errors": 0,
+                "timeouts": 0,
+                "latenessTotal": 0.0,
+                "latenessMax": 0.0,
+                "durationTotal": 0.0,
+                "durationMax": 0.0,
+            }
+            self._delayedTasksStats[function] = stats
+        return stats
+
+    async def _runDelayedTask(self, delayedTask: DelayedTask) -> None:
+        """Run all handlers of a due delayed task and mark it as completed.
+
+        Waits for a free slot in the global and per-function limits first.
+        Handlers run sequentially in registration order, each bounded by
+        the function's handler timeout (DO_EXIT handlers are not bounded).
+        Lateness (time between due time and start) and handler duration
+        are recorded in the per-function metrics.
+
+        Args:
+            delayedTask (DelayedTask): The due task
+
+        Returns:
+            None
+        """
+        function = delayedTask.function
+        isExit = function == DelayedTaskFunction.DO_EXIT
+        timeout = constants.DELAYED_TASK_HANDLER_TIMEOUT.get(function, constants.DEFAULT_DELAYED_TASK_HANDLER_TIMEOUT)
+        stats = self._getFunctionStats(function)
+
+        async with self._getFunctionSemaphore(function), self._delayedTasksSemaphore:
+            lateness = max(0.0, time.time() - delayedTask.delayedUntil)
+            stats["latenessTotal"] += lateness
+            stats["latenessMax"] = max(stats["latenessMax"], lateness)
+            stats["running"] += 1
+            try:
+                for handler in self.tasksHandlers.get(function, []):
+                    startTime = time.perf_counter()
+                    try:
+                        if isExit:
+                            await handler(delayedTask)
+                        else:
+                            await asyncio.wait_for(handler(delayedTask), timeout=timeout)
+                    except TimeoutError:
+                        stats["timeouts"] += 1
+                        logger.error(f"Handler {handler.__name__} for {function} timed out after {timeout} seconds")
+                    except Exception as e:
+                        stats["errors"] += 1
+                        logger.error(f"Error in handler {handler.__name__}: {e}")
+                        logger.exception(e)
+                    finally:
+                        duration = time.perf_counter() - startTime
+                        stats["calls"] += 1
+                        stats["durationTotal"] += duration
+                        stats["durationMax"] = max(stats["durationMax"], duration)
+            finally:
+                stats["running"] -= 1
+                stats["processed"] += 1
+
+        try:
+            if self.db is not None:
+                await self.db.delayedTasks.updateDelayedTask(delayedTask.taskId, True)
+            else:
+                logger.error("No database connection, this shouldn't happen")
+        except Exception as e:
+            logger.error(f"Failed to mark delayed task {delayedTask.taskId} as done: {e}")
+
+    def getStats(self) -> Dict[str, Any]:
+        """Get delayed tasks scheduler metrics.
+
+        Returns:
+            A dictionary with:
+            - queueDepth: Number of tasks waiting in the delayed queue
+            - running: Number of dispatched tasks not finished yet
+            - backgroundTasks: Number of tracked background tasks
+            - functions: Per task function metrics: processed, running,
+              errors, timeouts, avgLateness/maxLateness (seconds between
+              due time and start) and avgDuration/maxDuration (seconds
+              per handler call)
+        """
+        functions: Dict[str, Any] = {}
+        for function, stats in self._delayedTasksStats.items():
+            processed = stats["processed"]
+            calls = stats["calls"]
+            functions[function.value] = {
+                "processed": int(processed),
+                "running": int(stats["running"]),
+                "errors": int(stats["errors"]),
+                "timeouts": int(stats["timeouts"]),
+                "avgLateness": stats["latenessTotal"] / processed if processed else 0.0,
+                "maxLateness": stats["latenessMax"],
+                "avgDuration": stats["durationTotal"] / calls if calls else 0.0,
+                "maxDuration": stats["durationMax"],
+            }
+
+        return {
+            "queueDepth": self.delayedActionsQueue.qsize(),
+            "running": len(self._runningDelayedTasks),
+            "backgroundTasks": len(self.backgroundTasks),
+            "functions": functions,
+        }
+
     async def addDelayedTask(
         self,
         delayedUntil: float,
@@ -6,5 +6,6 @@ across multiple backend implementations (Null, Filesystem, S3).
 """
 
 from .service import StorageService
+from .streams import StorageReader, StorageWriter
 
-__all__ = ["StorageService"]
+__all__ = ["StorageService", "StorageReader", "StorageWriter"]
@@ -2,10 +2,100 @@
 Abstract storage backend interface
 
 This module defines the abstract base class that all storage backends must implement.
-It provides a consistent interface for storage operations across different backend types.
+It provides a consistent interface for storage operations across different backend types,
+plus the streaming primitives (readable file objects and :class:`ObjectWriter`) used by
+:meth:`StorageService.openRead` and :meth:`StorageService.openWrite`.
 """
 
+import io
 from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+
+class ObjectWriter(ABC):
+    """
+    Synchronous writer of a single object, returned by AbstractStorageBackend.openWrite().
+
+    Data is written in chunks with write(). The object becomes visible only after
+    commit(); abort() discards everything written so far. Exactly one of commit()
+    or abort() must be called.
+    """
+
+    @abstractmethod
+    def write(self, data: bytes) -> None:
+        """
+        Append a chunk to the object.
+
+        Args:
+            data: The binary chunk to append
+
+        Raises:
+            StorageBackendError: If the write operation fails
+        """
+        pass
+
+    @abstractmethod
+    def commit(self) -> None:
+        """
+        Finish the object and make it visible under its key.
+
+        Raises:
+            StorageBackendError: If the object cannot be stored
+        """
+        pass
+
+    @abstractmethod
+    def abort(self) -> None:
+        """
+        Discard the object. Must not raise.
+        """
+        pass
+
+
+class BufferedObjectWriter(ObjectWriter):
+    """
+    Fallback ObjectWriter collecting the chunks in memory and storing them with store() on commit.
+
+    Used by backends without native streaming writes.
+    """
+
+    def __init__(self, backend: "AbstractStorageBackend", key: str):
+        """
+        Initialize buffered writer.
+
+        Args:
+            backend: Backend the object is stored to on commit
+            key: The storage key of the object
+        """
+        self.backend = backend
+        self.key = key
+        self.buffer = io.BytesIO()
+
+    def write(self, data: bytes) -> None:
+        """
+        Append a chunk to the in-memory buffer.
+
+        Args:
+            data: The binary chunk to append
+        """
+        self.buffer.write(data)
+
+    def commit(self) -> None:
+        """
+        Store the buffered data with the backend's store().
+
+        Raises:
+            StorageKeyError: If the key is invalid
+            StorageBackendError: If the storage operation fails
+        """
+        self.backend.store(self.key, self.buffer.getvalue())
+        self.buffer = io.BytesIO()
+
+    def abort(self) -> None:
+        """
+        Drop the buffered data.
+        """
+        self.buffer = io.BytesIO()
 
 
 class AbstractStorageBackend(ABC):
@@ -102,3 +192,44 @@ class AbstractStorageBackend(ABC):
             StorageBackendError: If the list operation fails
         """
         pass
+
+    def openRead(self, key: str) -> BinaryIO | None:
+        """
+        Open the object for the specified key for streaming reads.
+
+        The default implementation loads the whole object with get(). Backends
+        able to stream should override it.
+
+        Args:
+            key: The sanitized storage key to read
+
+        Returns:
+            A readable binary file object (the caller must close it),
+            None if the key does not exist
+
+        Raises:
+            StorageBackendError: If the object cannot be opened (not for missing keys)
+        """
+        data = self.get(key)
+        if data is None:
+            return None
+        return io.BytesIO(data)
+
+    def openWrite(self, key: str) -> ObjectWriter:
+        """
+        Open a writer storing an object under the specified key chunk by chunk.
+
+        The default implementation buffers the chunks in memory and calls store()
+        on commit. Backends able to stream should override it.
+
+        Args:
+            key: The sanitized storage key to write
+
+        Returns:
+            ObjectWriter for the object
+
+        Raises:
+            StorageKeyError: If the key is invalid
+            StorageBackendError: If the writer cannot be opened
+        """
+        return BufferedObjectWriter(self, key)
@@ -6,11 +6,87 @@ in a local directory with atomic operations and proper error handling.
 """
 
 import os
+import tempfile
 from pathlib import Path
+from typing import BinaryIO
 
 from ..exceptions import StorageBackendError, StorageKeyError
 from ..utils import sanitizeKey
-from .abstract import AbstractStorageBackend
+from .abstract import AbstractStorageBackend, ObjectWriter
+
+
+class FSObjectWriter(ObjectWriter):
+    """
+    Streaming writer of a single file.
+
+    Chunks are written to a uniquely named temporary file in the base directory,
+    which is atomically renamed to the target filename on commit. Concurrent
+    writers of the same key never share a temporary file; the last commit wins.
+    """
+
+    def __init__(self, filePath: Path, key: str):
+        """
+        Open the temporary file.
+
+        Args:
+            filePath: Target file path
+            key: The storage key (used in error messages)
+
+        Raises:
+            StorageBackendError: If the temporary file cannot be created
+        """
+        self.filePath = filePath
+        self.key = key
+        try:
+            fd, tempName = tempfile.mkstemp(dir=filePath.parent, prefix=".", suffix=".tmp")
+        except Exception as e:
+            raise StorageBackendError(f"Failed to open object with key '{key}' for writing: {e}", originalError=e)
+        self.tempPath = Path(tempName)
+        self.file: BinaryIO = os.fdopen(fd, "wb")
+
+    def write(self, data: bytes) -> None:
+        """
+        Append a chunk to the temporary file.
+
+        Args:
+            data: The binary chunk to append
+
+        Raises:
+            StorageBackendError: If the write operation fails
+        """
+        try:
+            self.file.write(data)
+        except Exception as e:
+            self.abort()
+            raise StorageBackendError(f"Failed to write object with key '{self.key}': {e}", originalError=e)
+
+    def commit(self) -> None:
+        """
+        Close the temporary file, set permissions to 0o644 and rename it to the target.
+
+        Raises:
+            StorageBackendError: If the file cannot be finalized
+        """
+        try:
+            self.file.close()
+            os.chmod(self.tempPath, 0o644)
+            self.tempPath.replace(self.filePath)
+        except Exception as e:
+            self.abort()
+            raise StorageBackendError(f"Failed to store object with key '{self.key}': {e}", originalError=e)
+
+    def abort(self) -> None:
+        """
+        Close and remove the temporary file, ignoring errors.
+        """
+        try:
+            self.file.close()
+        except Exception:
+            pass  # Ignore cleanup errors
+        try:
+            self.tempPath.unlink(missing_ok=True)
+        except Exception:
+            pass  # Ignore cleanup errors
 
 
 class FSStorageBackend(AbstractStorageBackend):
@@ -23,6 +99,7 @@ class FSStorageBackend(AbstractStorageBackend):
     Features:
     - Automatic directory creation if baseDir doesn't exist
     - Atomic file operations where possible
+    - Streaming reads and writes via openRead() / openWrite()
     - File permissions set to 0o644 (readable by all, writable by owner)
     - Proper error handling with StorageBackendError wrapping
 
@@ -83,8 +160,8 @@ class FSStorageBackend(AbstractStorageBackend):
         """
         Store binary data to a file.
 
-        Uses atomic write operation by writing to a temporary file first,
-        then renaming it to the target filename.
+        Uses atomic write operation by writing to a uniquely named temporary
+        file first, then renaming it to the target filename.
 
         Args:
             key: The storage key (will be sanitized)
@@ -94,29 +171,9 @@ class FSStorageBackend(AbstractStorageBackend):
             StorageKeyError: If the key is invalid
             StorageBackendError: If the write operation fails
         """
-        filePath = self._getFilePath(key)
-        tempPath = filePath.with_suffix(filePath.suffix + ".tmp")
-
-        try:
-            # Write to temporary file first
-            with open(tempPath, "wb") as f:
-                f.write(data)
-
-            # Set file permissions to 0o644
-            os.chmod(tempPath, 0o644)
-
-            # Atomic rename to target file
-            tempPath.replace(filePath)
-
-        except Exception as e:
-            # Clean up temporary file if it exists
-            if tempPath.exists():
-                try:
-                    tempPath.unlink()
-                except Exception:
-                    pass  # Ignore cleanup errors
-
-            raise StorageBackendError(f"Failed to store object with key '{key}': {e}", originalError=e)
+        writer = self.openWrite(key)
+        writer.write(data)
+        writer.commit()
 
     def get(self, key: str) -> bytes | None:
         """
@@ -147,6 +204,45 @@ class FSStorageBackend(AbstractStorageBackend):
         except Exception as e:
             raise StorageBackendError(f"Failed to read object with key '{key}': {e}", originalError=e)
 
+    def openRead(self, key: str) -> BinaryIO | None:
+        """
+        Open the file for the specified key for streaming reads.
+
+        Args:
+            key: The storage key (will be sanitized)
+
+        Returns:
+            The open file (the caller must close it), None if not found
+
+        Raises:
+            StorageKeyError: If the key is invalid
+            StorageBackendError: If the file cannot be opened (not for missing files)
+        """
+        filePath = self._getFilePath(key)
+
+        try:
+            return open(filePath, "rb")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            raise StorageBackendError(f"Failed to read object with key '{key}': {e}", originalError=e)
+
+    def openWrite(self, key: str) -> ObjectWriter:
+        """
+        Open a streaming writer for the file of the specified key.
+
+        Args:
+            key: The storage key (will be sanitized)
+
+        Returns:
+            FSObjectWriter writing to a temporary file until commit
+
+        Raises:
+            StorageKeyError: If the key is invalid
+            StorageBackendError: If the temporary file cannot be created
+        """
+        return FSObjectWriter(self._getFilePath(key), key)
+
     def exists(self, key: str) -> bool:
         """
         Check if a file exists for the specified key.
@@ -214,8 +310,8 @@ class FSStorageBackend(AbstractStorageBackend):
             StorageBackendError: If the list operation fails
         """
         try:
-            # Get all files in base directory (not subdirectories)
-            allFiles = [f.name for f in self.baseDir.iterdir() if f.is_file()]
+            # Get all files in base directory (not subdirectories), skipping in-progress temporary files
+            allFiles = [f.name for f in self.baseDir.iterdir() if f.is_file() and not f.name.startswith(".")]
 
             # Filter by prefix if provided
             if prefix:
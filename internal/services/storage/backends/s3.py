@@ -3,16 +3,169 @@ S3 storage backend implementation
 
 This module provides a storage backend for AWS S3 and S3-compatible storage services.
 Uses boto3 library for S3 operations with proper error handling.
+Large objects are uploaded with parallel multipart uploads.
 """
 
-from typing import Any
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, BinaryIO
 
 import boto3
 from botocore.exceptions import ClientError
 
 from ..exceptions import StorageBackendError
 from ..utils import sanitizeKey
-from .abstract import AbstractStorageBackend
+from .abstract import AbstractStorageBackend, ObjectWriter
+
+S3_MIN_PART_SIZE = 5 * 1024 * 1024
+"""Minimum size of every multipart upload part except the last one (S3 limit)."""
+
+
+class S3ObjectWriter(ObjectWriter):
+    """
+    Streaming writer of a single S3 object.
+
+    Chunks are buffered until ``multipartChunkSize`` bytes are collected. Objects
+    smaller than that are stored with a single put_object on commit; larger ones
+    become a multipart upload whose parts are uploaded in parallel on the
+    backend's thread pool. At most ``multipartConcurrency`` parts are in flight,
+    so memory use stays bounded regardless of the object size.
+    """
+
+    def __init__(self, backend: "S3StorageBackend", key: str):
+        """
+        Initialize writer; nothing is sent to S3 until enough data is written.
+
+        Args:
+            backend: Backend owning the client and the upload thread pool
+            key: The storage key (will be sanitized and prefixed)
+
+        Raises:
+            StorageKeyError: If the key is invalid
+        """
+        self.backend = backend
+        self.key = key
+        self.s3Key = backend._getS3Key(key)
+        self.buffer = bytearray()
+        self.uploadId: str | None = None
+        self.parts: list[Future[dict[str, Any]]] = []
+
+    def write(self, data: bytes) -> None:
+        """
+        Append a chunk, uploading full parts as they are collected.
+
+        Args:
+            data: The binary chunk to append
+
+        Raises:
+            StorageBackendError: If starting the upload or a part upload fails
+        """
+        self.buffer += data
+        chunkSize = self.backend.multipartChunkSize
+        while len(self.buffer) >= chunkSize:
+            part = bytes(self.buffer[:chunkSize])
+            del self.buffer[:chunkSize]
+            self._uploadPart(part)
+
+    def commit(self) -> None:
+        """
+        Complete the upload (or store the object with put_object if it is small).
+
+        Raises:
+            StorageBackendError: If the object cannot be stored
+        """
+        if self.uploadId is None:
+            self.backend.store(self.key, bytes(self.buffer))
+            self.buffer = bytearray()
+            return
+
+        try:
+            if self.buffer:
+                self._uploadPart(bytes(self.buffer))
+                self.buffer = bytearray()
+            parts = [future.result() for future in self.parts]
+            self.backend.client.complete_multipart_upload(
+                Bucket=self.backend.bucket,
+                Key=self.s3Key,
+                UploadId=self.uploadId,
+                MultipartUpload={"Parts": parts},
+            )
+        except StorageBackendError:
+            self.abort()
+            raise
+        except Exception as e:
+            self.abort()
+            raise StorageBackendError(f"Failed to store object with key '{self.key}' to S3: {e}", originalError=e)
+
+    def abort(self) -> None:
+        """
+        Abort the multipart upload (if started), ignoring errors.
+        """
+        self.buffer = bytearray()
+        for future in self.parts:
+            future.cancel()
+        if self.uploadId is not None:
+            wait(self.parts)
+            try:
+                self.backend.client.abort_multipart_upload(
+                    Bucket=self.backend.bucket, Key=self.s3Key, UploadId=self.uploadId
+                )
+            except Exception:
+                pass  # Ignore cleanup errors
+            self.uploadId = None
+        self.parts = []
+
+    def _uploadPart(self, data: bytes) -> None:
+        """
+        Submit one part to the thread pool, starting the multipart upload if needed.
+
+        Blocks while ``multipartConcurrency`` parts are already in flight.
+
+        Args:
+            data: Part content
+
+        Raises:
+            StorageBackendError: If the upload cannot be started or a finished part failed
+        """
+        client = self.backend.client
+        if self.uploadId is None:
+            try:
+                response = client.create_multipart_upload(
+                    Bucket=self.backend.bucket,
+                    Key=self.s3Key,
+                    ContentType="application/octet-stream",
+                )
+            except Exception as e:
+                raise StorageBackendError(
+                    f"Failed to start multipart upload for key '{self.key}' to S3: {e}", originalError=e
+                )
+            self.uploadId = response["UploadId"]
+
+        inFlight = [future for future in self.parts if not future.done()]
+        while len(inFlight) >= self.backend.multipartConcurrency:
+            wait(inFlight, return_when=FIRST_COMPLETED)
+            inFlight = [future for future in inFlight if not future.done()]
+        for future in self.parts:
+            error = future.exception() if future.done() else None
+            if isinstance(error, Exception):
+                self.abort()
+                raise StorageBackendError(
+                    f"Failed to store object with key '{self.key}' to S3: {error}", originalError=error
+                )
+
+        partNumber = len(self.parts) + 1
+        uploadId = self.uploadId
+
+        def upload() -> dict[str, Any]:
+            response = client.upload_part(
+                Bucket=self.backend.bucket,
+                Key=self.s3Key,
+                UploadId=uploadId,
+                PartNumber=partNumber,
+                Body=data,
+            )
+            return {"ETag": response["ETag"], "PartNumber": partNumber}
+
+        self.parts.append(self.backend.executor.submit(upload))
 
 
 class S3StorageBackend(AbstractStorageBackend):
@@ -26,6 +179,7 @@ class S3StorageBackend(AbstractStorageBackend):
     - Support for custom S3 endpoints (for S3-compatible services)
     - Optional key prefix for namespace isolation
     - Content-Type set to application/octet-stream
+    - Streaming reads and parallel multipart uploads for large objects
     - Proper error handling with StorageBackendError wrapping
     - 404 errors return None/False instead of raising exceptions
 
@@ -36,6 +190,9 @@ class S3StorageBackend(AbstractStorageBackend):
         keySecret: AWS secret access key
         bucket: S3 bucket name
         prefix: Optional prefix for all keys (default: "")
+        multipartThreshold: Objects of at least this size are uploaded in parts (default: 16 MiB)
+        multipartChunkSize: Size of every multipart part except the last (default: 8 MiB, at least 5 MiB)
+        multipartConcurrency: Maximum number of parts uploaded in parallel (default: 4)
 
     Raises:
         StorageBackendError: If S3 client initialization fails
@@ -62,6 +219,9 @@ class S3StorageBackend(AbstractStorageBackend):
         keySecret: str,
         bucket: str,
         prefix: str = "",
+        multipartThreshold: int = 16 * 1024 * 1024,
+        multipartChunkSize: int = 8 * 1024 * 1024,
+        multipartConcurrency: int = 4,
     ):
         """
         Initialize S3 storage backend.
@@ -73,12 +233,19 @@ class S3StorageBackend(AbstractStorageBackend):
             keySecret: AWS secret access key
             bucket: S3 bucket name
             prefix: Optional prefix for all keys
+            multipartThreshold: Objects of at least this size are uploaded in parts
+            multipartChunkSize: Size of every multipart part except the last
+            multipartConcurrency: Maximum number of parts uploaded in parallel
 
         Raises:
             StorageBackendError: If S3 client initialization fails
         """
         self.bucket = bucket
         self.prefix = prefix
+        self.multipartChunkSize = max(S3_MIN_PART_SIZE, multipartChunkSize)
+        self.multipartThreshold = max(self.multipartChunkSize, multipartThreshold)
+        self.multipartConcurrency = max(1, multipartConcurrency)
+        self.executor = ThreadPoolExecutor(max_workers=self.multipartConcurrency, thread_name_prefix="s3-upload")
 
         try:
             # Initialize boto3 S3 client
@@ -124,6 +291,13 @@ class S3StorageBackend(AbstractStorageBackend):
         """
         s3Key = self._getS3Key(key)
 
+        if len(data) >= self.multipartThreshold:
+            writer = S3ObjectWriter(self, key)
+            for offset in range(0, len(data), self.multipartChunkSize):
+                writer.write(data[offset : offset + self.multipartChunkSize])
+            writer.commit()
+            return
+
         try:
             self.client.put_object(
                 Bucket=self.bucket,
@@ -161,6 +335,47 @@ class S3StorageBackend(AbstractStorageBackend):
         except Exception as e:
             raise StorageBackendError(f"Failed to get object with key '{key}' from S3: {e}", originalError=e)
 
+    def openRead(self, key: str) -> BinaryIO | None:
+        """
+        Open an S3 object for streaming reads.
+
+        Args:
+            key: The storage key (will be sanitized and prefixed)
+
+        Returns:
+            The response body stream (the caller must close it), None if not found (404)
+
+        Raises:
+            StorageKeyError: If the key is invalid
+            StorageBackendError: If the object cannot be opened (not for 404)
+        """
+        s3Key = self._getS3Key(key)
+
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=s3Key)
+            return response["Body"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchKey":
+                return None
+            raise StorageBackendError(f"Failed to get object with key '{key}' from S3: {e}", originalError=e)
+        except Exception as e:
+            raise StorageBackendError(f"Failed to get object with key '{key}' from S3: {e}", originalError=e)
+
+    def openWrite(self, key: str) -> ObjectWriter:
+        """
+        Open a streaming writer for an S3 object.
+
+        Args:
+            key: The storage key (will be sanitized and prefixed)
+
+        Returns:
+            S3ObjectWriter using a parallel multipart upload for large objects
+
+        Raises:
+            StorageKeyError: If the key is invalid
+        """
+        return S3ObjectWriter(self, key)
+
     def exists(self, key: str) -> bool:
         """
         Check if an object exists in S3.
@@ -0,0 +1,110 @@
+"""
+Object cache: bounded in-memory LRU cache for small stored objects
+
+Keeps hot small objects (stickers, avatars, ...) in memory so repeated
+StorageService.get() calls do not hit the backend. Both the number of entries
+and their total size are bounded; objects larger than maxObjectSize are never
+cached.
+"""
+
+from collections import OrderedDict
+
+
+class ObjectLRUCache:
+    """
+    LRU cache of object data bounded by entry count and total size.
+
+    Not thread-safe: it is used from the event loop thread only.
+
+    Attributes:
+        maxItems: Maximum number of cached objects (0 disables the cache)
+        maxBytes: Maximum total size of cached objects in bytes
+        maxObjectSize: Objects larger than this are never cached
+    """
+
+    __slots__ = ("maxItems", "maxBytes", "maxObjectSize", "_entries", "_size", "hits", "misses")
+
+    def __init__(self, maxItems: int = 0, maxBytes: int = 0, maxObjectSize: int = 0):
+        """
+        Initialize cache.
+
+        Args:
+            maxItems: Maximum number of cached objects (0 disables the cache)
+            maxBytes: Maximum total size of cached objects in bytes
+            maxObjectSize: Objects larger than this are never cached
+        """
+        self.maxItems: int = maxItems
+        self.maxBytes: int = maxBytes
+        self.maxObjectSize: int = min(maxObjectSize, maxBytes)
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size: int = 0
+        self.hits: int = 0
+        """Number of lookups served from the cache."""
+        self.misses: int = 0
+        """Number of lookups not found in the cache."""
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache may hold any object."""
+        return self.maxItems > 0 and self.maxObjectSize > 0
+
+    @property
+    def size(self) -> int:
+        """Total size of cached objects in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Get cached data, marking it as most recently used.
+
+        Args:
+            key: Sanitized storage key
+
+        Returns:
+            Cached data or None if the key is not cached
+        """
+        data = self._entries.get(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Cache data if it is small enough, evicting least recently used objects.
+
+        Args:
+            key: Sanitized storage key
+            data: Object data
+        """
+        if not self.enabled or len(data) > self.maxObjectSize:
+            return
+        self.invalidate(key)
+        self._entries[key] = data
+        self._size += len(data)
+        while len(self._entries) > self.maxItems or self._size > self.maxBytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop a cached object.
+
+        Args:
+            key: Sanitized storage key
+        """
+        data = self._entries.pop(key, None)
+        if data is not None:
+            self._size -= len(data)
+
+    def clear(self) -> None:
+        """
+        Drop all cached objects.
+        """
+        self._entries.clear()
+        self._size = 0
@@ -3,8 +3,13 @@ Storage service: Singleton service for object storage operations
 
 This module provides a singleton service that manages object storage operations
 through pluggable backend implementations (filesystem, S3, null).
+
+The service API is async: backends stay synchronous and every blocking backend
+call runs in a worker thread via asyncio.to_thread, so storage I/O never blocks
+the event loop.
 """
 
+import asyncio
 import logging
 import threading
 from typing import TYPE_CHECKING, Union
@@ -13,7 +18,10 @@ from .backends.abstract import AbstractStorageBackend
 from .backends.filesystem import FSStorageBackend
 from .backends.null import NullStorageBackend
 from .backends.s3 import S3StorageBackend
-from .exceptions import StorageConfigError
+from .exceptions import StorageConfigError, StorageKeyError
+from .object_cache import ObjectLRUCache
+from .streams import DEFAULT_CHUNK_SIZE, StorageReader, StorageWriter
+from .utils import sanitizeKey
 
 if TYPE_CHECKING:
     from internal.config.manager import ConfigManager
@@ -39,17 +47,26 @@ class StorageService:
         storage.injectConfig(configManager)
 
         # Store and retrieve objects
-        storage.store("my-key", b"data")
-        data = storage.get("my-key")
-        exists = storage.exists("my-key")
-        storage.delete("my-key")
+        await storage.store("my-key", b"data")
+        data = await storage.get("my-key")
+        exists = await storage.exists("my-key")
+        await storage.delete("my-key")
 
         # List objects
-        keys = storage.list(prefix="prefix-", limit=10)
+        keys = await storage.list(prefix="prefix-", limit=10)
+
+        # Stream large objects
+        async with storage.openWrite("video.mp4") as writer:
+            await writer.write(chunk)
+        reader = await storage.openRead("video.mp4")
+
+    Small objects returned by get() are kept in a bounded in-memory LRU cache
+    (``[storage.cache]``), invalidated by store(), delete() and openWrite().
 
     Thread Safety:
         The singleton instance creation is thread-safe using RLock.
-        Individual backend operations depend on backend implementation.
+        Backend calls run in worker threads; the object cache is only
+        touched from the event loop.
     """
 
     _instance: Union["StorageService", None] = None
@@ -78,6 +95,9 @@ class StorageService:
         if not hasattr(self, "initialized"):
             self.backend: AbstractStorageBackend | None = None
             self.initialized = False
+            self.objectCache = ObjectLRUCache()
+            # Bumped on every cache invalidation, so a get() racing with a write never caches stale data
+            self._cacheGeneration = 0
             logger.info("StorageService created, awaiting configuration, dood!")
 
     @classmethod
@@ -114,7 +134,15 @@ class StorageService:
                     "key-id": "...",
                     "key-secret": "...",
                     "bucket": "my-bucket",
-                    "prefix": ""
+                    "prefix": "",
+                    "multipart-threshold": 16777216,
+                    "multipart-chunk-size": 8388608,
+                    "multipart-concurrency": 4
+                },
+                "cache": {
+                    "max-items": 1024,
+                    "max-bytes": 33554432,
+                    "max-object-size": 524288
                 }
             }
         """
@@ -166,6 +194,9 @@ class StorageService:
                     keySecret=s3Config["key-secret"],
                     bucket=s3Config["bucket"],
                     prefix=s3Config.get("prefix", ""),
+                    multipartThreshold=int(s3Config.get("multipart-threshold", 16 * 1024 * 1024)),
+                    multipartChunkSize=int(s3Config.get("multipart-chunk-size", 8 * 1024 * 1024)),
+                    multipartConcurrency=int(s3Config.get("multipart-concurrency", 4)),
                 )
                 logger.info(
                     f"Initialized S3StorageBackend with bucket: {self.backend.bucket}, "
@@ -175,6 +206,14 @@ class StorageService:
             else:
                 raise StorageConfigError(f"Unknown storage type: {storageType}")
 
+            cacheConfig = config.get("cache") or {}
+            self.objectCache = ObjectLRUCache(
+                maxItems=int(cacheConfig.get("max-items", 0)),
+                maxBytes=int(cacheConfig.get("max-bytes", 0)),
+                maxObjectSize=int(cacheConfig.get("max-object-size", 0)),
+            )
+            self._cacheGeneration += 1
+
             self.initialized = True
             logger.info(f"StorageService initialized with {storageType} backend, dood!")
 
@@ -183,17 +222,35 @@ class StorageService:
         except Exception as e:
             raise StorageConfigError(f"Failed to initialize storage service: {e}") from e
 
-    def _ensureInitialized(self) -> None:
+    def _ensureInitialized(self) -> AbstractStorageBackend:
         """
         Ensure the service is initialized before operations.
 
+        Returns:
+            The configured backend
+
         Raises:
             StorageConfigError: If service is not initialized
         """
         if not self.initialized or self.backend is None:
             raise StorageConfigError("StorageService is not initialized. Call injectConfig() first, dood!")
+        return self.backend
+
+    def _invalidateCached(self, key: str) -> None:
+        """
+        Drop an object from the object cache after it was written or deleted.
 
-    def store(self, key: str, data: bytes) -> None:
+        Args:
+            key: The storage key (will be sanitized)
+        """
+        self._cacheGeneration += 1
+        if self.objectCache.enabled:
+            try:
+                self.objectCache.invalidate(sanitizeKey(key))
+            except StorageKeyError:
+                pass  # Invalid keys are never cached
+
+    async def store(self, key: str, data: bytes) -> None:
         """
         Store binary data under the specified key.
 
@@ -206,15 +263,19 @@ class StorageService:
             StorageKeyError: If the key is invalid
             StorageBackendError: If the storage operation fails
         """
-        self._ensureInitialized()
-        assert self.backend is not None  # For type checker
-        self.backend.store(key, data)
+        backend = self._ensureInitialized()
+        try:
+            await asyncio.to_thread(backend.store, key, data)
+        finally:
+            self._invalidateCached(key)
         logger.debug(f"Stored object with key: {key}, dood!")
 
-    def get(self, key: str) -> bytes | None:
+    async def get(self, key: str) -> bytes | None:
         """
         Retrieve binary data for the specified key.
 
+        Small objects are served from the object cache when possible.
+
         Args:
             key: The storage key to retrieve
 
@@ -226,16 +287,26 @@ class StorageService:
             StorageKeyError: If the key is invalid
             StorageBackendError: If the retrieval operation fails
         """
-        self._ensureInitialized()
-        assert self.backend is not None  # For type checker
-        data = self.backend.get(key)
+        backend = self._ensureInitialized()
+        cacheKey: str | None = None
+        if self.objectCache.enabled:
+            cacheKey = sanitizeKey(key)
+            cached = self.objectCache.get(cacheKey)
+            if cached is not None:
+                logger.debug(f"Retrieved object with key: {key} from cache, dood!")
+                return cached
+
+        generation = self._cacheGeneration
+        data = await asyncio.to_thread(backend.get, key)
         if data is not None:
             logger.debug(f"Retrieved object with key: {key}, dood!")
+            if cacheKey is not None and generation == self._cacheGeneration:
+                self.objectCache.put(cacheKey, data)
         else:
             logger.warning(f"Object not found with key: {key}, dood!")
         return data
 
-    def exists(self, key: str) -> bool:
+    async def exists(self, key: str) -> bool:
         """
         Check if an object exists for the specified key.
 
@@ -250,13 +321,12 @@ class StorageService:
             StorageKeyError: If the key is invalid
             StorageBackendError: If the existence check fails
         """
-        self._ensureInitialized()
-        assert self.backend is not None  # For type checker
-        exists = self.backend.exists(key)
+        backend = self._ensureInitialized()
+        exists = await asyncio.to_thread(backend.exists, key)
         logger.debug(f"Existence check for key {key}: {exists}, dood!")
         return exists
 
-    def delete(self, key: str) -> bool:
+    async def delete(self, key: str) -> bool:
         """
         Delete the object for the specified key.
 
@@ -271,16 +341,18 @@ class StorageService:
             StorageKeyError: If the key is invalid
             StorageBackendError: If the deletion operation fails
         """
-        self._ensureInitialized()
-        assert self.backend is not None  # For type checker
-        deleted = self.backend.delete(key)
+        backend = self._ensureInitialized()
+        try:
+            deleted = await asyncio.to_thread(backend.delete, key)
+        finally:
+            self._invalidateCached(key)
         if deleted:
             logger.debug(f"Deleted object with key: {key}, dood!")
         else:
             logger.warning(f"Object not found for deletion with key: {key}, dood!")
         return deleted
 
-    def list(self, prefix: str = "", limit: int | None = None) -> list[str]:
+    async def list(self, prefix: str = "", limit: int | None = None) -> list[str]:
         """
         List all keys with an optional prefix filter and limit.
 
@@ -296,8 +368,50 @@ class StorageService:
             StorageConfigError: If service is not initialized
             StorageBackendError: If the list operation fails
         """
-        self._ensureInitialized()
-        assert self.backend is not None  # For type checker
-        keys = self.backend.list(prefix=prefix, limit=limit)
+        backend = self._ensureInitialized()
+        keys = await asyncio.to_thread(backend.list, prefix=prefix, limit=limit)
         logger.debug(f"Listed {len(keys)} objects with prefix: '{prefix}', dood!")
         return keys
+
+    async def openRead(self, key: str, chunkSize: int = DEFAULT_CHUNK_SIZE) -> StorageReader | None:
+        """
+        Open an object for streaming reads without loading it into memory.
+
+        Args:
+            key: The storage key to read
+            chunkSize: Chunk size used when iterating over the reader
+
+        Returns:
+            StorageReader (close it or use it as ``async with``), None if not found
+
+        Raises:
+            StorageConfigError: If service is not initialized
+            StorageKeyError: If the key is invalid
+            StorageBackendError: If the object cannot be opened
+        """
+        backend = self._ensureInitialized()
+        file = await asyncio.to_thread(backend.openRead, key)
+        if file is None:
+            logger.warning(f"Object not found with key: {key}, dood!")
+            return None
+        return StorageReader(key, file, chunkSize)
+
+    def openWrite(self, key: str) -> StorageWriter:
+        """
+        Open a streaming writer for an object.
+
+        The object is committed when the ``async with`` block exits normally
+        and discarded if it raises. S3 backends upload large objects as
+        parallel multipart uploads.
+
+        Args:
+            key: The storage key to write
+
+        Returns:
+            StorageWriter to use as ``async with``
+
+        Raises:
+            StorageConfigError: If service is not initialized
+        """
+        backend = self._ensureInitialized()
+        return StorageWriter(key, lambda: backend.openWrite(key), lambda: self._invalidateCached(key))
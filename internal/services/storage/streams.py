@@ -0,0 +1,181 @@
+"""
+Storage streams: async wrappers around backend file objects and writers
+
+This module provides the objects returned by StorageService.openRead() and
+StorageService.openWrite(). Every blocking backend call runs in a worker
+thread via asyncio.to_thread, so large media can be streamed without
+blocking the event loop or holding the whole object in memory.
+"""
+
+import asyncio
+from types import TracebackType
+from typing import AsyncIterator, BinaryIO, Callable, Optional, Type
+
+from .backends.abstract import ObjectWriter
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+"""Default chunk size (in bytes) for iterating over a StorageReader."""
+
+
+class StorageReader:
+    """
+    Async reader of a stored object.
+
+    Usage:
+        reader = await storage.openRead("video.mp4")
+        if reader is not None:
+            async with reader:
+                async for chunk in reader:
+                    await sendChunk(chunk)
+    """
+
+    __slots__ = ("key", "chunkSize", "_file")
+
+    def __init__(self, key: str, file: BinaryIO, chunkSize: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize reader.
+
+        Args:
+            key: The storage key of the object
+            file: Readable binary file object returned by the backend
+            chunkSize: Chunk size used when iterating over the reader
+        """
+        self.key: str = key
+        """The storage key of the object."""
+        self.chunkSize: int = chunkSize
+        """Chunk size used when iterating over the reader."""
+        self._file: BinaryIO = file
+
+    async def read(self, size: int = -1) -> bytes:
+        """
+        Read up to size bytes (everything left if size is negative).
+
+        Args:
+            size: Maximum number of bytes to read
+
+        Returns:
+            The data read, empty bytes at the end of the object
+        """
+        return await asyncio.to_thread(self._file.read, size)
+
+    async def close(self) -> None:
+        """
+        Close the underlying file object.
+        """
+        await asyncio.to_thread(self._file.close)
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._iterChunks()
+
+    async def _iterChunks(self) -> AsyncIterator[bytes]:
+        """Yield chunks of chunkSize bytes until the end of the object."""
+        while True:
+            chunk = await self.read(self.chunkSize)
+            if not chunk:
+                return
+            yield chunk
+
+    async def __aenter__(self) -> "StorageReader":
+        return self
+
+    async def __aexit__(
+        self,
+        excType: Optional[Type[BaseException]],
+        excValue: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+
+class StorageWriter:
+    """
+    Async writer of an object, committed when the ``async with`` block exits normally.
+
+    If the block raises, everything written so far is discarded.
+
+    Usage:
+        async with storage.openWrite("video.mp4") as writer:
+            async for chunk in download():
+                await writer.write(chunk)
+    """
+
+    __slots__ = ("key", "size", "_openWriter", "_onCommit", "_writer", "_finished")
+
+    def __init__(self, key: str, openWriter: Callable[[], ObjectWriter], onCommit: Callable[[], None]):
+        """
+        Initialize writer; the backend writer is opened on first use.
+
+        Args:
+            key: The storage key of the object
+            openWriter: Blocking callable opening the backend ObjectWriter
+            onCommit: Callback invoked after a successful commit
+        """
+        self.key: str = key
+        """The storage key of the object."""
+        self.size: int = 0
+        """Number of bytes written so far."""
+        self._openWriter = openWriter
+        self._onCommit = onCommit
+        self._writer: Optional[ObjectWriter] = None
+        self._finished: bool = False
+
+    async def _ensureWriter(self) -> ObjectWriter:
+        """Open the backend writer if it is not open yet."""
+        if self._finished:
+            raise ValueError(f"Writer for key '{self.key}' is already closed")
+        if self._writer is None:
+            self._writer = await asyncio.to_thread(self._openWriter)
+        return self._writer
+
+    async def write(self, data: bytes) -> None:
+        """
+        Append a chunk to the object.
+
+        Args:
+            data: The binary chunk to append
+
+        Raises:
+            StorageBackendError: If the write operation fails
+        """
+        writer = await self._ensureWriter()
+        await asyncio.to_thread(writer.write, data)
+        self.size += len(data)
+
+    async def commit(self) -> None:
+        """
+        Finish the object and make it visible under its key.
+
+        Raises:
+            StorageKeyError: If the key is invalid
+            StorageBackendError: If the object cannot be stored
+        """
+        writer = await self._ensureWriter()
+        self._finished = True
+        await asyncio.to_thread(writer.commit)
+        self._onCommit()
+
+    async def abort(self) -> None:
+        """
+        Discard everything written so far.
+        """
+        if self._finished:
+            return
+        self._finished = True
+        if self._writer is not None:
+            await asyncio.to_thread(self._writer.abort)
+
+    async def __aenter__(self) -> "StorageWriter":
+        await self._ensureWriter()
+        return self
+
+    async def __aexit__(
+        self,
+        excType: Optional[Type[BaseException]],
+        excValue: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if excType is None:
+            if not self._finished:
+                await self.commit()
+        else:
+            await self.abort()
@@ -44,10 +44,13 @@ Exports:
     LLMFunctionParameter: Model for function parameter definitions
     LLMToolFunction: Model for tool/function definitions
     LLMToolCall: Model for tool/function call results
+    LLMToolCallDelta: Piece of a tool call received while streaming
     ModelMessage: Model for text messages
     ModelImageMessage: Model for image messages
     ModelResultStatus: Enum for result status (success, error, timeout)
     ModelRunResult: Model for model run results
+    ModelResultChunk: Piece of a streamed model run result
+    MessageTokensCounter: Memoized per-message token counts with prefix sums
 """
 
 from .abstract import AbstractLLMProvider, AbstractModel
@@ -57,13 +60,16 @@ from .models import (
     LLMFunctionParameter,
     LLMParameterType,
     LLMToolCall,
+    LLMToolCallDelta,
     LLMToolFunction,
     ModelImageMessage,
     ModelMessage,
+    ModelResultChunk,
     ModelResultStatus,
     ModelRunResult,
     ModelStructuredResult,
 )
+from .tokens import MessageTokensCounter
 
 __all__ = [
     # Abstract classes
@@ -77,9 +83,13 @@ __all__ = [
     "LLMFunctionParameter",
     "LLMToolFunction",
     "LLMToolCall",
+    "LLMToolCallDelta",
     "ModelMessage",
     "ModelImageMessage",
     "ModelResultStatus",
     "ModelRunResult",
+    "ModelResultChunk",
     "ModelStructuredResult",
+    # Token accounting
+    "MessageTokensCounter",
 ]
@@ -21,11 +21,12 @@ import asyncio
 import datetime
 import json
 import logging
+import math
 import time
 import uuid
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, TypeVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Type, TypeVar, cast
 
 from lib import utils
 from lib.stats import StatsStorage
@@ -34,6 +35,7 @@ from .models import (
     ERROR_STATUSES,
     LLMAbstractTool,
     ModelMessage,
+    ModelResultChunk,
     ModelResultStatus,
     ModelRunResult,
     ModelStructuredResult,
@@ -42,6 +44,13 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 _R = TypeVar("_R", ModelRunResult, ModelStructuredResult)
+_E = TypeVar("_E")
+
+DEFAULT_EMBEDDING_BATCH_SIZE: int = 64
+"""Default max number of texts per embedding backend call (``embedding_batch_size``)."""
+
+DEFAULT_EMBEDDING_BATCH_TOKENS: int = 8000
+"""Default max estimated tokens per embedding backend call (``embedding_batch_tokens``)."""
 
 
 class AbstractModel(ABC):
@@ -60,6 +69,8 @@ class AbstractModel(ABC):
         contextSize: Maximum context size in tokens.
         tiktokenEncoding: The tiktoken encoding name used for tokenization.
         tokensCountCoeff: Coefficient for token count estimation (default: 1.1).
+        embeddingBatchSize: Max texts per embedding backend call.
+        embeddingBatchTokens: Max estimated tokens per embedding backend call.
         enableJSONLog: Whether JSON logging is enabled.
         jsonLogFile: Path to the JSON log file.
         jsonLogAddDateSuffix: Whether to append date suffix to log filename.
@@ -124,6 +135,12 @@ class AbstractModel(ABC):
         if extraConfig:
             configDimensions = extraConfig.get("embedding_dimensions")
             self._dimensions = int(configDimensions) if configDimensions else None
+        self.embeddingBatchSize: int = max(
+            1, int(self._config.get("embedding_batch_size", DEFAULT_EMBEDDING_BATCH_SIZE))
+        )
+        self.embeddingBatchTokens: int = max(
+            1, int(self._config.get("embedding_batch_tokens", DEFAULT_EMBEDDING_BATCH_TOKENS))
+        )
 
     @abstractmethod
     async def _generateText(
@@ -197,9 +214,45 @@ class AbstractModel(ABC):
             )
 
         # Original logic when no fallbacks
+        contextError = self._checkContextSize("generateText", messages, tools)
+        if contextError is not None:
+            return contextError
+
+        startTime = time.time()
+        try:
+            ret = await self._generateText(messages=messages, tools=tools)
+            ret.elapsedTime = time.time() - startTime
+        except Exception as e:
+            await self._recordAttemptStats(
+                consumerId,
+                ModelRunResult(
+                    rawResult=None, status=ModelResultStatus.ERROR, error=e, elapsedTime=time.time() - startTime
+                ),
+                "text",
+            )
+            raise
+
+        await self._recordAttemptStats(consumerId, ret, "text")
+        self.printJSONLog(messages, ret, consumerId=consumerId)
+        return ret
+
+    def _checkContextSize(
+        self, methodName: str, messages: Sequence[ModelMessage], tools: Optional[Sequence[LLMAbstractTool]]
+    ) -> Optional[ModelRunResult]:
+        """Check that the messages can fit into the model context.
+
+        Args:
+            methodName: Name of the calling method (for logging).
+            messages: Messages to be sent to the model.
+            tools: Tools to be sent to the model.
+
+        Returns:
+            An error result if estimated tokens exceed twice the context size,
+            None otherwise.
+        """
         tokensCount = self.getEstimateTokensCount(messages)
         logger.debug(
-            f"generateText(messages={len(messages)}, tools={len(tools) if tools else None}), "
+            f"{methodName}(messages={len(messages)}, tools={len(tools) if tools else None}), "
             f"estimateTokens={tokensCount}, model: {self.provider}/{self.modelId}"
         )
 
@@ -212,11 +265,73 @@ class AbstractModel(ABC):
                     f"Context too large: Estimated tokens: {tokensCount} model context: {self.contextSize}"
                 ),
             )
+        return None
+
+    async def _generateTextStream(
+        self, messages: Sequence[ModelMessage], tools: Optional[Sequence[LLMAbstractTool]] = None
+    ) -> AsyncIterator[ModelResultChunk]:
+        """Generate text as a stream of chunks using the model implementation.
+
+        Providers with streaming APIs override this method. The default
+        implementation awaits _generateText() and yields its result as a
+        single chunk, so every model can be used via generateTextStream().
+
+        Args:
+            messages: Sequence of message objects containing role and content.
+            tools: Optional sequence of tools available to the model for function
+                calling.
+
+        Yields:
+            ModelResultChunk objects. The last one carries the complete
+            ModelRunResult in ``result``.
+
+        Raises:
+            Exception: Provider-specific exceptions during generation.
+        """
+        ret = await self._generateText(messages=messages, tools=tools)
+        yield ModelResultChunk(textDelta=ret.resultText, result=ret)
+
+    async def _runTextStream(
+        self,
+        messages: Sequence[ModelMessage],
+        tools: Optional[Sequence[LLMAbstractTool]],
+        consumerId: Optional[str],
+    ) -> AsyncIterator[ModelResultChunk]:
+        """Run a single streamed generation attempt on this model.
+
+        Streaming counterpart of the no-fallback path of generateText(): checks
+        the context size, times the call, records stats and writes the JSON log
+        once the final chunk arrives.
+
+        Args:
+            messages: Sequence of message objects containing role and content.
+            tools: Optional sequence of tools available to the model.
+            consumerId: Optional consumer identifier for stats recording.
+
+        Yields:
+            ModelResultChunk objects, the last one carries the result.
+
+        Raises:
+            RuntimeError: If the provider stream ended without a result.
+            Exception: Provider-specific exceptions during generation.
+        """
+        contextError = self._checkContextSize("generateTextStream", messages, tools)
+        if contextError is not None:
+            yield ModelResultChunk(result=contextError)
+            return
 
         startTime = time.time()
         try:
-            ret = await self._generateText(messages=messages, tools=tools)
-            ret.elapsedTime = time.time() - startTime
+            async for chunk in self._generateTextStream(messages=messages, tools=tools):
+                if chunk.result is not None:
+                    ret = chunk.result
+                    ret.elapsedTime = time.time() - startTime
+                    await self._recordAttemptStats(consumerId, ret, "text")
+                    self.printJSONLog(messages, ret, consumerId=consumerId)
+                    yield chunk
+                    return
+                yield chunk
+            raise RuntimeError(f"Stream of {self.modelId} ended without result")
         except Exception as e:
             await self._recordAttemptStats(
                 consumerId,
@@ -227,9 +342,73 @@ class AbstractModel(ABC):
             )
             raise
 
-        await self._recordAttemptStats(consumerId, ret, "text")
-        self.printJSONLog(messages, ret, consumerId=consumerId)
-        return ret
+    async def generateTextStream(
+        self,
+        messages: Sequence[ModelMessage],
+        tools: Optional[Sequence[LLMAbstractTool]] = None,
+        *,
+        fallbackModels: Optional[Sequence["AbstractModel"]] = None,
+        consumerId: Optional[str] = None,
+    ) -> AsyncIterator[ModelResultChunk]:
+        """Generate text as a stream of chunks with optional fallback models.
+
+        Streaming counterpart of generateText(). Text and tool call fragments
+        are yielded as soon as the provider sends them; the last chunk carries
+        the complete ModelRunResult in ``result`` (with the full text and parsed
+        tool calls), so callers that only need the final result can wait for it.
+
+        Fallback happens only while nothing has been yielded yet: if a model
+        fails before sending any fragment, the next one is tried. Once fragments
+        were passed to the caller, a failure is reported in the final result
+        instead, so the caller never gets text from two models mixed together.
+
+        Args:
+            messages: Sequence of message objects containing role and content.
+            tools: Optional sequence of tools available to the model for function
+                calling.
+            fallbackModels: Optional list of alternative models to try if this
+                model fails before streaming anything.
+            consumerId: Optional consumer identifier for stats recording (e.g., chat ID).
+
+        Yields:
+            ModelResultChunk objects. The last one always has ``result`` set,
+            with isFallback set if it came from a fallback model.
+
+        Raises:
+            Exception: If the model raises and no fallback models are provided.
+        """
+        models: List[AbstractModel] = [self, *(fallbackModels or [])]
+
+        for i, model in enumerate(models):
+            streamed = False
+            finalChunk = ModelResultChunk(result=ModelRunResult(rawResult=None, status=ModelResultStatus.UNSPECIFIED))
+            try:
+                async for chunk in model._runTextStream(messages, tools, consumerId):
+                    if chunk.result is not None:
+                        # Hold the final chunk back until we know there will be no fallback
+                        finalChunk = chunk
+                        continue
+                    streamed = True
+                    yield chunk
+            except Exception as e:
+                if not fallbackModels:
+                    raise
+                # Exception from model is treated as failure - create error result
+                logger.error(f"Exception from model {model.modelId}: {e}")
+                finalChunk = ModelResultChunk(
+                    result=ModelRunResult(rawResult=None, status=ModelResultStatus.ERROR, error=e)
+                )
+
+            result = cast(ModelRunResult, finalChunk.result)
+            if i > 0:
+                result.setFallback(True)
+
+            if result.status not in ERROR_STATUSES or streamed or i == len(models) - 1:
+                yield finalChunk
+                return
+
+            # Model failed before streaming anything - log and continue to next
+            logger.debug(f"Model {model.modelId} returned error status {result.status.name}")
 
     @abstractmethod
     async def _generateImage(self, messages: Sequence[ModelMessage]) -> ModelRunResult:
@@ -536,12 +715,158 @@ class AbstractModel(ABC):
         if not isinstance(attempts, int) or attempts < 1:
             raise ValueError("attempts must be a positive integer, dood!")
 
+        return await self._runEmbeddingAttempts(
+            lambda: self._generateEmbeddings(text),
+            attempts=attempts,
+            consumerId=consumerId,
+            textsCount=1,
+        )
+
+    async def _generateEmbeddingsBatch(self, texts: Sequence[str]) -> list[list[float]]:
+        """Generate embedding vectors for several texts in one backend call.
+
+        The default implementation embeds the texts one by one through
+        :meth:`_generateEmbeddings`, so every model gets a working batch
+        path for free. Providers whose backend accepts many inputs per
+        request (fastembed, OpenAI-compatible ``/embeddings``) override it.
+
+        Args:
+            texts: Non-empty, already validated input texts.
+
+        Returns:
+            One embedding vector per input text, in input order.
+
+        Raises:
+            NotImplementedError: If the model does not support embeddings.
+            Exception: Provider-specific exceptions during generation.
+        """
+        return [await self._generateEmbeddings(text) for text in texts]
+
+    async def generateEmbeddingsBatch(
+        self,
+        texts: Sequence[str],
+        *,
+        attempts: int = 3,
+        consumerId: Optional[str] = None,
+    ) -> list[list[float]]:
+        """Generate embedding vectors for many texts, with chunking and retries.
+
+        Splits ``texts`` into chunks bounded both by item count
+        (``embedding_batch_size`` in the model config) and by estimated
+        token count (``embedding_batch_tokens``, see
+        :meth:`getEstimateTokensCount`), then sends every chunk through
+        :meth:`_generateEmbeddingsBatch` with the same retry / backoff /
+        stats policy as :meth:`generateEmbeddings`. A chunk that exhausts
+        its attempts fails the whole call; already embedded chunks are
+        discarded, so callers can fall back to per-text embedding.
+
+        Args:
+            texts: Input texts to embed. An empty sequence yields ``[]``.
+            attempts: Max retry attempts per chunk on transient failures
+                (default: 3).
+            consumerId: Optional consumer identifier for stats recording
+                (e.g. chat ID).
+
+        Returns:
+            One embedding vector per input text, in input order.
+
+        Raises:
+            NotImplementedError: If the model does not support embeddings.
+            ValueError: If any text is empty or not a string, ``attempts``
+                is not a positive integer, or the backend returned a
+                different number of vectors than it was given texts.
+            RuntimeError: If all retry attempts fail for a chunk.
+        """
+        if not self.supportsEmbedding:
+            raise NotImplementedError(f"Embeddings aren't supported by {self.modelId}, dood!")
+
+        for text in texts:
+            if not isinstance(text, str) or not text.strip():
+                raise ValueError("texts must contain only non-empty strings, dood!")
+        if not isinstance(attempts, int) or attempts < 1:
+            raise ValueError("attempts must be a positive integer, dood!")
+
+        ret: list[list[float]] = []
+        for chunk in self._chunkEmbeddingTexts(texts):
+
+            async def embedChunk(chunk: Sequence[str] = chunk) -> list[list[float]]:
+                embeddings = await self._generateEmbeddingsBatch(chunk)
+                if len(embeddings) != len(chunk):
+                    raise ValueError(
+                        f"{self.modelId} returned {len(embeddings)} embeddings for {len(chunk)} texts, dood!"
+                    )
+                return embeddings
+
+            ret.extend(
+                await self._runEmbeddingAttempts(
+                    embedChunk,
+                    attempts=attempts,
+                    consumerId=consumerId,
+                    textsCount=len(chunk),
+                )
+            )
+        return ret
+
+    def _chunkEmbeddingTexts(self, texts: Sequence[str]) -> List[Sequence[str]]:
+        """Split texts into request-sized chunks for :meth:`generateEmbeddingsBatch`.
+
+        A chunk is closed once adding the next text would exceed either
+        the item limit or the estimated token limit. A single text larger
+        than the token limit still gets a chunk of its own — truncation is
+        the backend's business.
+
+        Args:
+            texts: Validated input texts.
+
+        Returns:
+            Consecutive, order-preserving slices of ``texts``.
+        """
+        chunks: List[Sequence[str]] = []
+        start = 0
+        tokens = 0
+        for i, text in enumerate(texts):
+            textTokens = self.getEstimateTokensCount(text)
+            if i > start and (i - start >= self.embeddingBatchSize or tokens + textTokens > self.embeddingBatchTokens):
+                chunks.append(texts[start:i])
+                start = i
+                tokens = 0
+            tokens += textTokens
+        if start < len(texts):
+            chunks.append(texts[start:])
+        return chunks
+
+    async def _runEmbeddingAttempts(
+        self,
+        call: Callable[[], Awaitable[_E]],
+        *,
+        attempts: int,
+        consumerId: Optional[str],
+        textsCount: int,
+    ) -> _E:
+        """Run one embedding backend call with retries, backoff and stats.
+
+        Deterministic failures (``NotImplementedError``, ``ValueError``,
+        ``TypeError``) are re-raised immediately; everything else is
+        retried with exponential backoff (0.5s, 1s, 2s, ...).
+
+        Args:
+            call: Zero-argument coroutine factory performing the backend call.
+            attempts: Max attempts (already validated).
+            consumerId: Consumer identifier for stats recording.
+            textsCount: Number of texts embedded by ``call``.
+
+        Returns:
+            Whatever ``call`` returned on the first successful attempt.
+
+        Raises:
+            RuntimeError: If all attempts fail.
+        """
         lastError: Optional[Exception] = None
         lastElapsed: float = 0.0
         for attempt in range(1, attempts + 1):
             startTime = time.time()
             try:
-                embedding = await self._generateEmbeddings(text)
+                ret = await call()
                 elapsed = time.time() - startTime
                 await self._recordEmbeddingStats(
                     consumerId,
@@ -549,15 +874,18 @@ class AbstractModel(ABC):
                     error=None,
                     elapsed=elapsed,
                     attempts=attempt,
+                    textsCount=textsCount,
                 )
-                return embedding
+                return ret
             except (NotImplementedError, ValueError, TypeError):
                 # Deterministic failures: never retry.
                 raise
             except Exception as e:
                 lastError = e
                 lastElapsed = time.time() - startTime
-                logger.warning(f"generateEmbeddings attempt {attempt}/{attempts} failed for " f"{self.modelId}: {e}")
+                logger.warning(
+                    f"Embedding attempt {attempt}/{attempts} ({textsCount} texts) failed for {self.modelId}: {e}"
+                )
                 if attempt < attempts:
                     # Exponential backoff: 0.5s, 1s, 2s, ...
                     backoff = 0.5 * (2 ** (attempt - 1))
@@ -570,6 +898,7 @@ class AbstractModel(ABC):
             error=lastError,
             elapsed=lastElapsed,
             attempts=attempts,
+            textsCount=textsCount,
         )
         raise RuntimeError(
             f"Embedding generation failed for {self.modelId} after {attempts} attempts: {lastError}"
@@ -692,12 +1021,77 @@ class AbstractModel(ABC):
             text = data
         else:
             text = json.dumps(data, ensure_ascii=False, default=str)
+        return int(self._estimateTokensForLength(len(text)))
+
+    def _estimateTokensForLength(self, length: int) -> float:
+        """Estimate tokens in a text of the given length (not rounded).
+
+        Args:
+            length: Text length in characters.
+
+        Returns:
+            Estimated number of tokens.
+        """
         # According my experience, average, each token is 3-4 characters long, so use 3.5
         # For being conservative
-        tokensCount = len(text) / 3.5
+        tokensCount = length / 3.5
         # As we use estimated token count, it won't count tokens properly,
         # so we need to multiply by some coefficient to be sure
-        return int(tokensCount * self.tokensCountCoeff)
+        return tokensCount * self.tokensCountCoeff
+
+    def getEstimateMessageTokensCount(self, message: ModelMessage) -> int:
+        """Get estimated number of tokens of a message as an element of a message list.
+
+        Uses the memoized serialized length of the message (plus the list
+        separator), so it is cheap to call repeatedly for the same messages.
+        Rounded up, so the sum over a list never underestimates
+        ``getEstimateTokensCount([m.toDict() for m in messages])``.
+
+        Args:
+            message: Message to estimate token count for.
+
+        Returns:
+            Estimated number of tokens in the message.
+        """
+        return math.ceil(self._estimateTokensForLength(message.getSerializedLength() + 2))
+
+    def getEstimateMessagesTokensCount(self, messages: Sequence[ModelMessage]) -> int:
+        """Get estimated number of tokens in a list of messages.
+
+        Sums the per-message estimates of getEstimateMessageTokensCount(), so
+        the messages are not re-serialized on every call.
+
+        Args:
+            messages: Messages to estimate token count for.
+
+        Returns:
+            Estimated number of tokens in the messages.
+        """
+        return sum(self.getEstimateMessageTokensCount(message) for message in messages)
+
+    def hasExactTokensCount(self) -> bool:
+        """Check whether getExactTokensCount() uses a real tokenizer.
+
+        Returns:
+            True if the model counts tokens exactly, False if it only estimates
+            (the default).
+        """
+        return False
+
+    async def getExactTokensCount(self, data: Any) -> int:
+        """Get exact number of tokens in given data.
+
+        Models with access to a tokenizer override this (and
+        hasExactTokensCount()); the default falls back to
+        getEstimateTokensCount().
+
+        Args:
+            data: Messages or text to count tokens for.
+
+        Returns:
+            Number of tokens in the data.
+        """
+        return self.getEstimateTokensCount(data)
 
     def getInfo(self) -> Dict[str, Any]:
         """Get model information and configuration.
@@ -882,6 +1276,7 @@ class AbstractModel(ABC):
         error: Optional[Exception],
         elapsed: float,
         attempts: int,
+        textsCount: int = 1,
     ) -> None:
         """Record stats for a single embedding attempt. Best-effort — never raises.
 
@@ -895,6 +1290,8 @@ class AbstractModel(ABC):
             elapsed: Wall-clock seconds spent on the successful (or final)
                 attempt, used for the ``elapsed_time`` metric.
             attempts: Number of attempts it took (1 on first-try success).
+            textsCount: Number of texts embedded by the call (more than 1
+                for :meth:`generateEmbeddingsBatch` chunks).
         """
         try:
             info = self.getInfo()
@@ -912,6 +1309,7 @@ class AbstractModel(ABC):
                     "generation_embeddings": 1,
                     "request_count": 1,
                     "embedding_attempts": attempts,
+                    "embedding_texts": textsCount,
                     "is_error": 0 if success else 1,
                     "elapsed_time": elapsed or 0,
                 },
@@ -9,10 +9,12 @@ Key components:
 - LLMAbstractTool: Base class for LLM tool definitions
 - LLMToolFunction: Function tool with parameters and callable implementation
 - LLMToolCall: Represents a tool call request from an LLM
+- LLMToolCallDelta: Piece of a tool call received while streaming
 - ModelMessage: Standard message format for LLM conversations
 - ModelImageMessage: Message with image content support
 - ModelRunResult: Unified result structure for LLM responses
 - ModelResultStatus: Enumeration of possible result statuses
+- ModelResultChunk: Piece of a streamed result (see AbstractModel.generateTextStream)
 
 Example:
     >>> from lib.ai.models import LLMToolFunction, LLMFunctionParameter, LLMParameterType
@@ -41,7 +43,7 @@ import logging
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from enum import Enum, StrEnum
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import magic
 
@@ -275,6 +277,9 @@ class LLMToolFunction(LLMAbstractTool):
         description: str,
         parameters: Sequence[LLMFunctionParameter],
         function: Optional[Callable] = None,
+        *,
+        parallelSafe: bool = False,
+        timeout: Optional[float] = None,
     ):
         """Initialize a function tool.
 
@@ -283,6 +288,9 @@ class LLMToolFunction(LLMAbstractTool):
             description: Human-readable description of what the function does.
             parameters: Sequence of LLMFunctionParameter objects defining the function's parameters.
             function: Optional callable that implements the function logic.
+            parallelSafe: Whether calls of the tool may run concurrently with other
+                parallel-safe calls requested in the same turn (no shared side effects).
+            timeout: Optional max seconds a call of the tool may run.
 
         Returns:
             None
@@ -291,6 +299,8 @@ class LLMToolFunction(LLMAbstractTool):
         self.description = description
         self.parameters = parameters
         self.function = function
+        self.parallelSafe = parallelSafe
+        self.timeout = timeout
 
     def call(self, *args, **kwargs) -> Any:
         """Execute the function with the provided arguments.
@@ -439,6 +449,47 @@ class LLMToolCall:
         return f"{self.__class__.__name__}({str(self)})"
 
 
+class LLMToolCallDelta:
+    """A piece of a tool call received while streaming.
+
+    Providers stream tool calls as fragments: the first fragment of a call
+    usually carries its id and name, the following ones only append to the
+    JSON-encoded arguments. Fragments of the same call share the same index.
+
+    Example:
+        >>> delta = LLMToolCallDelta(index=0, id="call_123", name="get_weather", argumentsDelta='{"loc')
+    """
+
+    __slots__ = ("index", "id", "name", "argumentsDelta")
+
+    def __init__(
+        self,
+        index: int,
+        *,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+        argumentsDelta: str = "",
+    ):
+        """Initialize a tool call delta.
+
+        Args:
+            index: Position of the tool call in the response.
+            id: Tool call identifier, if present in this fragment.
+            name: Function name, if present in this fragment.
+            argumentsDelta: Next piece of the JSON-encoded arguments.
+        """
+        self.index = index
+        self.id = id
+        self.name = name
+        self.argumentsDelta = argumentsDelta
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(index={self.index}, id={self.id!r}, name={self.name!r}, "
+            f"argumentsDelta={self.argumentsDelta!r})"
+        )
+
+
 class ModelMessage:
     """Represents a message in an LLM conversation.
 
@@ -483,6 +534,8 @@ class ModelMessage:
         self.toolCalls = toolCalls
         self.toolCallId = toolCallId
         self.weight = weight
+        self._sizeCache: Dict[str, Tuple[Tuple[Any, ...], int]] = {}
+        """Memoized sizes (serialized length, exact token counts) with the fingerprint they were computed for."""
 
     @classmethod
     def fromDict(cls, d: Dict[str, Any]) -> "ModelMessage":
@@ -637,6 +690,61 @@ class ModelMessage:
 
         return ret
 
+    def _fingerprint(self) -> Tuple[Any, ...]:
+        """Cheap snapshot of the fields toDict() depends on, used to invalidate memoized sizes.
+
+        Returns:
+            Tuple[Any, ...]: Field values (containers by identity and length).
+        """
+        return (
+            self.role,
+            self.content,
+            self.contentKey,
+            self.toolCallId,
+            self.weight,
+            id(self.toolCalls),
+            len(self.toolCalls),
+        )
+
+    def getCachedSize(self, key: str) -> Optional[int]:
+        """Get a size memoized by setCachedSize() if the message did not change since.
+
+        Args:
+            key: Size name (e.g. "exact:<modelId>").
+
+        Returns:
+            Optional[int]: The memoized size, None if missing or stale.
+        """
+        cached = self._sizeCache.get(key)
+        if cached is not None and cached[0] == self._fingerprint():
+            return cached[1]
+        return None
+
+    def setCachedSize(self, key: str, value: int) -> None:
+        """Memoize a size of the message until any of its fields change.
+
+        Args:
+            key: Size name (e.g. "exact:<modelId>").
+            value: The size to remember.
+        """
+        self._sizeCache[key] = (self._fingerprint(), value)
+
+    def getSerializedLength(self) -> int:
+        """Return the length of the JSON-serialized toDict(), memoized until the message changes.
+
+        Token estimates are derived from this length, so accounting for a long
+        history does not re-serialize (or re-encode images of) every message
+        on each pass.
+
+        Returns:
+            int: Number of characters in ``json.dumps(self.toDict(), ensure_ascii=False)``.
+        """
+        length = self.getCachedSize("length")
+        if length is None:
+            length = len(json.dumps(self.toDict(), ensure_ascii=False, default=str))
+            self.setCachedSize("length", length)
+        return length
+
     def __str__(self) -> str:
         """Return a JSON string representation of the message.
 
@@ -711,6 +819,14 @@ class ModelImageMessage(ModelMessage):
         super().__init__(role, content)
         self.image = image
 
+    def _fingerprint(self) -> Tuple[Any, ...]:
+        """Cheap snapshot of the fields toDict() depends on, including the image.
+
+        Returns:
+            Tuple[Any, ...]: Field values (containers by identity and length).
+        """
+        return super()._fingerprint() + (id(self.image), len(self.image))
+
     def toDict(
         self,
         contentKey: Optional[str] = None,
@@ -1174,3 +1290,44 @@ class ModelStructuredResult(ModelRunResult):
             totalTokens=totalTokens,
         )
         self.data: Optional[Dict[str, Any]] = data
+
+
+class ModelResultChunk:
+    """A piece of a streamed text generation result.
+
+    AbstractModel.generateTextStream() yields chunks with the text and tool
+    call fragments as they arrive. The last chunk of a stream carries the
+    complete ModelRunResult (with the full text, parsed tool calls, status and
+    token usage) in ``result``; all earlier chunks have ``result`` set to None.
+
+    Example:
+        >>> async for chunk in model.generateTextStream(messages):
+        ...     print(chunk.textDelta, end="")
+        ...     if chunk.result is not None:
+        ...         finalResult = chunk.result
+    """
+
+    __slots__ = ("textDelta", "toolCallDeltas", "result")
+
+    def __init__(
+        self,
+        textDelta: str = "",
+        toolCallDeltas: Optional[Sequence[LLMToolCallDelta]] = None,
+        result: Optional[ModelRunResult] = None,
+    ):
+        """Initialize a result chunk.
+
+        Args:
+            textDelta: Text generated since the previous chunk (default: "").
+            toolCallDeltas: Tool call fragments received since the previous chunk (default: None).
+            result: Complete result, set on the last chunk only (default: None).
+        """
+        self.textDelta = textDelta
+        self.toolCallDeltas: List[LLMToolCallDelta] = list(toolCallDeltas) if toolCallDeltas else []
+        self.result = result
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(textDelta={self.textDelta!r}, "
+            f"toolCallDeltas={self.toolCallDeltas!r}, result={self.result!r})"
+        )
@@ -24,14 +24,17 @@ import logging
 import uuid
 from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Union, cast
 
 import httpx
 import openai
-from openai.types import ImagesResponse
+from openai import AsyncStream
+from openai.types import CompletionUsage, ImagesResponse
 from openai.types.chat.chat_completion import ChatCompletion
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 
+from lib.http_client import HttpClientRegistry
 from lib.proxy import ProxyConfig
 from lib.stats import StatsStorage
 
@@ -39,7 +42,9 @@ from ..abstract import AbstractLLMProvider, AbstractModel
 from ..models import (
     LLMAbstractTool,
     LLMToolCall,
+    LLMToolCallDelta,
     ModelMessage,
+    ModelResultChunk,
     ModelResultStatus,
     ModelRunResult,
     ModelStructuredResult,
@@ -273,6 +278,71 @@ class BasicOpenAIModel(AbstractModel):
         """
         return {}
 
+    def _finishReasonToStatus(self, finishReason: Optional[str]) -> ModelResultStatus:
+        """Map an OpenAI ``finish_reason`` to ModelResultStatus.
+
+        Args:
+            finishReason: The ``finish_reason`` of the first choice.
+
+        Returns:
+            The corresponding status, UNKNOWN for unrecognized reasons.
+        """
+        match finishReason:
+            case "stop":
+                return ModelResultStatus.FINAL
+            case "length":
+                return ModelResultStatus.TRUNCATED_FINAL
+            case "tool_calls":
+                return ModelResultStatus.TOOL_CALLS
+            case "content_filter":
+                return ModelResultStatus.CONTENT_FILTER
+            case _:
+                logger.warning(f"Unknown LLM finish reason: {finishReason}")
+                return ModelResultStatus.UNKNOWN
+
+    def _getStreamParams(self) -> Dict[str, Any]:
+        """Get extra parameters for streaming API calls.
+
+        Asks for token usage in the last chunk of the stream. Subclasses for
+        providers which reject ``stream_options`` can override this method.
+
+        Returns:
+            A dictionary of parameters to add to streaming requests.
+        """
+        return {"stream_options": {"include_usage": True}}
+
+    def _buildTextParams(
+        self, messages: Sequence[ModelMessage], tools: Optional[Sequence[LLMAbstractTool]]
+    ) -> Dict[str, Any]:
+        """Build ``chat.completions.create`` kwargs for text generation.
+
+        Args:
+            messages: The conversation history.
+            tools: Tools to offer to the model (ignored if the model doesn't support tools).
+
+        Returns:
+            Request parameters including ``_getExtraParams()``.
+
+        Raises:
+            NotImplementedError: If text generation is not supported by the model.
+        """
+        if not self._config.get("support_text", True):
+            raise NotImplementedError(f"Text generation isn't supported by {self.modelId}, dood!")
+
+        kwargs: Dict[str, Any] = {}
+        if tools and self._supportTools:
+            kwargs["tools"] = [tool.toJson() for tool in tools]
+            kwargs["tool_choice"] = "auto"
+
+        params: Dict[str, Any] = {
+            "model": self._getModelId(),
+            "messages": [message.toDict("content") for message in messages],
+            "temperature": self.temperature,
+            **kwargs,
+        }
+        params.update(self._getExtraParams())
+        return params
+
     async def _executeChatCompletion(self, params: Dict[str, Any]) -> _OpenAICallOutcome:
         """Call the OpenAI-compatible API and decode the response envelope.
 
@@ -343,20 +413,7 @@ class BasicOpenAIModel(AbstractModel):
         outputTokens: Optional[int] = response.usage.completion_tokens if response.usage else None
         totalTokens: Optional[int] = response.usage.total_tokens if response.usage else None
 
-        finishReason = response.choices[0].finish_reason
-        status = ModelResultStatus.UNSPECIFIED
-        match finishReason:
-            case "stop":
-                status = ModelResultStatus.FINAL
-            case "length":
-                status = ModelResultStatus.TRUNCATED_FINAL
-            case "tool_calls":
-                status = ModelResultStatus.TOOL_CALLS
-            case "content_filter":
-                status = ModelResultStatus.CONTENT_FILTER
-            case _:
-                logger.warning(f"Unknown LLM finish reason: {finishReason}")
-                status = ModelResultStatus.UNKNOWN
+        status = self._finishReasonToStatus(response.choices[0].finish_reason)
 
         retMessage = response.choices[0].message
         resText = retMessage.content if retMessage.content else ""
@@ -403,22 +460,8 @@ class BasicOpenAIModel(AbstractModel):
             NotImplementedError: If text generation is not supported by the model.
             Exception: For other API-related errors.
         """
-        if not self._config.get("support_text", True):
-            raise NotImplementedError(f"Text generation isn't supported by {self.modelId}, dood!")
-
         # --- build params (text-specific) ---
-        kwargs: Dict[str, Any] = {}
-        if tools and self._supportTools:
-            kwargs["tools"] = [tool.toJson() for tool in tools]
-            kwargs["tool_choice"] = "auto"
-
-        params: Dict[str, Any] = {
-            "model": self._getModelId(),
-            "messages": [message.toDict("content") for message in messages],
-            "temperature": self.temperature,
-            **kwargs,
-        }
-        params.update(self._getExtraParams())
+        params = self._buildTextParams(messages, tools)
 
         # --- call + decode envelope (shared) ---
         outcome = await self._executeChatCompletion(params)
@@ -460,6 +503,114 @@ class BasicOpenAIModel(AbstractModel):
             totalTokens=outcome.totalTokens,
         )
 
+    async def _generateTextStream(
+        self,
+        messages: Sequence[ModelMessage],
+        tools: Optional[Sequence[LLMAbstractTool]] = None,
+    ) -> AsyncIterator[ModelResultChunk]:
+        """Generate text using the OpenAI-compatible model with a streamed response.
+
+        Sends the same request as _generateText() with ``stream=True`` and
+        yields text and tool call fragments as they arrive. Tool call fragments
+        are accumulated by their index and parsed once the stream is over.
+
+        Args:
+            messages: A sequence of ModelMessage objects representing the
+                conversation history.
+            tools: An optional sequence of LLMAbstractTool objects that the model
+                can call during generation.
+
+        Yields:
+            ModelResultChunk objects; the last one carries the ModelRunResult.
+
+        Raises:
+            RuntimeError: If the OpenAI client is not initialized.
+            NotImplementedError: If text generation is not supported by the model.
+            Exception: For other API-related errors.
+        """
+        if not self._client:
+            raise RuntimeError("OpenAI client not initialized, dood!")
+
+        params = self._buildTextParams(messages, tools)
+        params.update(self._getStreamParams())
+        params["stream"] = True
+
+        try:
+            stream: AsyncStream[ChatCompletionChunk] = await self._client.chat.completions.create(**params)
+        except openai.BadRequestError as e:
+            logger.exception(e)
+            logger.error(f"Error from OpenAI-compatible model: {e}")
+            yield ModelResultChunk(result=ModelRunResult(rawResult=None, status=ModelResultStatus.ERROR, error=e))
+            return
+        except Exception as e:
+            logger.error(f"Error from OpenAI-compatible model: {e}")
+            raise
+
+        textParts: List[str] = []
+        # index -> [id, name, arguments]
+        toolCallParts: Dict[int, List[str]] = {}
+        finishReason: Optional[str] = None
+        usage: Optional[CompletionUsage] = None
+        lastChunk: Optional[ChatCompletionChunk] = None
+
+        try:
+            async for chunk in stream:
+                lastChunk = chunk
+                if chunk.usage is not None:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+
+                choice = chunk.choices[0]
+                if choice.finish_reason is not None:
+                    finishReason = choice.finish_reason
+
+                textDelta = choice.delta.content or ""
+                toolCallDeltas: List[LLMToolCallDelta] = []
+                for toolCall in choice.delta.tool_calls or []:
+                    parts = toolCallParts.setdefault(toolCall.index, ["", "", ""])
+                    name = toolCall.function.name if toolCall.function else None
+                    argumentsDelta = (toolCall.function.arguments if toolCall.function else None) or ""
+                    if toolCall.id:
+                        parts[0] = toolCall.id
+                    if name:
+                        parts[1] += name
+                    parts[2] += argumentsDelta
+                    toolCallDeltas.append(
+                        LLMToolCallDelta(toolCall.index, id=toolCall.id, name=name, argumentsDelta=argumentsDelta)
+                    )
+
+                if textDelta or toolCallDeltas:
+                    textParts.append(textDelta)
+                    yield ModelResultChunk(textDelta=textDelta, toolCallDeltas=toolCallDeltas)
+        finally:
+            await stream.close()
+
+        status = self._finishReasonToStatus(finishReason)
+        toolCalls: List[LLMToolCall] = []
+        if status == ModelResultStatus.TOOL_CALLS:
+            toolCalls = [
+                LLMToolCall(
+                    id=callId or str(uuid.uuid4()),
+                    name=name,
+                    parameters=json.loads(arguments) if arguments else {},
+                )
+                for _, (callId, name, arguments) in sorted(toolCallParts.items())
+            ]
+            logger.debug(f"ToolCalls: {toolCalls}")
+
+        yield ModelResultChunk(
+            result=ModelRunResult(
+                rawResult=lastChunk,
+                status=status,
+                resultText="".join(textParts),
+                toolCalls=toolCalls,
+                inputTokens=usage.prompt_tokens if usage else None,
+                outputTokens=usage.completion_tokens if usage else None,
+                totalTokens=usage.total_tokens if usage else None,
+            )
+        )
+
     async def _generateStructured(
         self,
         messages: Sequence[ModelMessage],
@@ -825,15 +976,15 @@ class BasicOpenAIModel(AbstractModel):
                 )
 
             try:
-                # Resolve proxy for image download
-                proxyKwargs = ProxyConfig.fromServiceConfig(self.provider.config).toKwargs()
-                async with httpx.AsyncClient(**proxyKwargs, timeout=30.0) as client:
-                    fetchResponse = await client.get(imageUrl)
-                    fetchResponse.raise_for_status()
-                    mediaData = fetchResponse.content
-                    contentType = str(fetchResponse.headers.get("content-type", ""))
-                    if contentType.startswith("image/"):
-                        mediaMimeType = contentType.split(";")[0].strip()
+                # Download through the shared pooled client of the provider's proxy route
+                proxyConfig = ProxyConfig.fromServiceConfig(self.provider.config)
+                client = HttpClientRegistry.getInstance().getClient(proxyConfig)
+                fetchResponse = await client.get(imageUrl, timeout=30.0)
+                fetchResponse.raise_for_status()
+                mediaData = fetchResponse.content
+                contentType = str(fetchResponse.headers.get("content-type", ""))
+                if contentType.startswith("image/"):
+                    mediaMimeType = contentType.split(";")[0].strip()
             except httpx.HTTPError as e:
                 logger.error(f"Failed to download image from URL: {e}")
                 return ModelRunResult(
@@ -901,21 +1052,67 @@ class BasicOpenAIModel(AbstractModel):
         if not self._client:
             raise RuntimeError("OpenAI client not initialized, dood!")
 
+        response = await self._client.embeddings.create(**self._getEmbeddingsParams(text))
+
+        if not response.data:
+            raise ValueError(f"OpenAI embeddings response has no data for model {self.modelId}")
+
+        return list(response.data[0].embedding)
+
+    async def _generateEmbeddingsBatch(self, texts: Sequence[str]) -> list[list[float]]:
+        """Generate embeddings for several texts in one OpenAI embeddings request.
+
+        Sends the texts as the ``input=[...]`` array form of the embeddings
+        endpoint. Response items are placed by their ``index`` field rather
+        than by position, since the API does not promise ordering.
+
+        Args:
+            texts: Input texts to embed.
+
+        Returns:
+            One embedding vector per input text, in input order.
+
+        Raises:
+            RuntimeError: If the OpenAI client is not initialised.
+            ValueError: If the response does not hold exactly one vector
+                per input text.
+            Exception: For API-level errors (rate limits, server errors, etc.).
+        """
+        if not self._client:
+            raise RuntimeError("OpenAI client not initialized, dood!")
+
+        response = await self._client.embeddings.create(**self._getEmbeddingsParams(list(texts)))
+
+        ret: List[Optional[list[float]]] = [None] * len(texts)
+        for item in response.data or []:
+            if 0 <= item.index < len(ret):
+                ret[item.index] = list(item.embedding)
+
+        if any(embedding is None for embedding in ret):
+            raise ValueError(
+                f"OpenAI embeddings response for model {self.modelId} "
+                f"has {len(response.data or [])} items for {len(texts)} texts"
+            )
+        return cast(list[list[float]], ret)
+
+    def _getEmbeddingsParams(self, inputData: Union[str, List[str]]) -> Dict[str, Any]:
+        """Build ``embeddings.create`` kwargs for a single text or an array of texts.
+
+        Args:
+            inputData: Text or list of texts for the ``input`` parameter.
+
+        Returns:
+            Keyword arguments for ``self._client.embeddings.create``.
+        """
         params: Dict[str, Any] = {
             "model": self._getModelId(),
-            "input": text,
+            "input": inputData,
         }
         # ``dimensions`` is optional; the OpenAI SDK accepts it as a kwarg.
         configuredDimensions = self._config.get("embedding_dimensions")
         if configuredDimensions is not None:
             params["dimensions"] = int(configuredDimensions)
-
-        response = await self._client.embeddings.create(**params)
-
-        if not response.data:
-            raise ValueError(f"OpenAI embeddings response has no data for model {self.modelId}")
-
-        return list(response.data[0].embedding)
+        return params
 
 
 class BasicOpenAIProvider(AbstractLLMProvider):
@@ -58,18 +58,19 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-def _embedSync(embedding: TextEmbedding, text: str) -> list:
+def _embedSync(embedding: TextEmbedding, texts: Sequence[str]) -> list:
     """Run ``embedding.embed`` synchronously for use with :func:`asyncio.to_thread`.
 
     Args:
         embedding: A fastembed ``TextEmbedding`` instance whose
             ``embed`` method returns a generator of numpy arrays.
-        text: Single text to embed.
+        texts: Texts to embed in one fastembed call (fastembed batches
+            them through the ONNX session internally).
 
     Returns:
         Materialised list of numpy arrays, one per input text.
     """
-    return list(embedding.embed([text]))
+    return list(embedding.embed(list(texts), batch_size=max(1, len(texts))))
 
 
 class FastembedProvider(AbstractLLMProvider):
@@ -82,7 +83,7 @@ class FastembedProvider(AbstractLLMProvider):
 
     Model construction and dimension probing are always lazy — the
     underlying ``TextEmbedding`` is built on the first call to
-    :meth:`embedOne` (or the first lazy probe in
+    :meth:`embedMany` (or the first lazy probe in
     :meth:`FastembedModel._generateEmbeddings`), offloaded to a thread
     pool via :func:`asyncio.to_thread`. Providing
     ``embedding_dimensions`` explicitly in ``extraConfig`` avoids the
@@ -126,7 +127,7 @@ class FastembedProvider(AbstractLLMProvider):
         Validates that ``fastembed`` is importable and that the provider
         config is a dict. The provider has no remote client to construct —
         ``TextEmbedding`` instances are created lazily inside
-        :meth:`embedOne` on the first call for a given model id.
+        :meth:`embedMany` on the first call for a given model id.
 
         Args:
             config: Provider-level configuration. The provider is purely
@@ -253,18 +254,61 @@ class FastembedProvider(AbstractLLMProvider):
             self._embeddingModels[modelId] = embedding
             return embedding
 
+    def _embedManySync(self, modelId: str, texts: Sequence[str], fastembedKwargs: Dict[str, Any]) -> list:
+        """Resolve the model and embed ``texts`` in one worker-thread hop.
+
+        Args:
+            modelId: Fastembed model identifier.
+            texts: Texts to embed.
+            fastembedKwargs: Extra kwargs forwarded to ``TextEmbedding(...)``.
+
+        Returns:
+            Materialised list of numpy arrays, one per input text.
+        """
+        return _embedSync(self._getOrCreateEmbedding(modelId, fastembedKwargs), texts)
+
+    async def embedMany(self, modelId: str, texts: Sequence[str], **kwargs: Any) -> List["np.ndarray"]:
+        """Embed several texts using the named FastEmbed model.
+
+        Model lookup (or lazy construction) and the embedding itself run
+        in a single :func:`asyncio.to_thread` hop, and all ``texts`` go
+        through one ``TextEmbedding.embed`` call so fastembed can batch
+        them through the ONNX session.
+
+        Args:
+            modelId: Fastembed model identifier.
+            texts: Texts to embed.
+            **kwargs: Extra kwargs forwarded to ``TextEmbedding(...)`` on
+                first use (e.g. ``cache_dir``, ``threads``).
+
+        Returns:
+            One numpy.ndarray of shape ``(embedding_dimensions,)`` and
+            dtype ``float32`` per input text, in input order.
+
+        Raises:
+            ValueError: If fastembed returned a different number of
+                vectors than it was given texts.
+            Exception: Any exception raised by fastembed (model load
+                failure, OOM, etc.) is re-raised unchanged.
+        """
+        if not texts:
+            return []
+        vectors: List[Any] = await asyncio.to_thread(self._embedManySync, modelId, texts, kwargs)
+        if len(vectors) != len(texts):
+            raise ValueError(f"fastembed returned {len(vectors)} vectors for {len(texts)} texts, model {modelId}")
+        return vectors
+
     async def embedOne(self, modelId: str, text: str, **kwargs: Any) -> "np.ndarray":
         """Embed a single text using the named FastEmbed model.
 
-        Runs the (sync) fastembed call in a thread pool so the event loop
-        stays responsive. Returns the raw numpy array — the caller
+        Thin wrapper over :meth:`embedMany` with a one-element batch.
+        Returns the raw numpy array — the caller
         (``FastembedModel._generateEmbeddings``) is responsible for
         the ``tolist()`` conversion to plain ``list[float]``.
 
         Args:
             modelId: Fastembed model identifier.
-            text: Text to embed. fastembed accepts a list internally; we
-                wrap the single string in a one-element list.
+            text: Text to embed.
             **kwargs: Extra kwargs forwarded to ``TextEmbedding(...)`` on
                 first use (e.g. ``cache_dir``, ``threads``).
 
@@ -276,13 +320,7 @@ class FastembedProvider(AbstractLLMProvider):
             Exception: Any exception raised by fastembed (model load
                 failure, OOM, etc.) is re-raised unchanged.
         """
-        embedding = await asyncio.to_thread(self._getOrCreateEmbedding, modelId, kwargs)
-        # ``embed`` returns a generator of numpy arrays. Materialise it
-        # inside the thread to keep the asyncio side purely async.
-        vectors: List[Any] = await asyncio.to_thread(_embedSync, embedding, text)
-        if not vectors:
-            raise ValueError(f"fastembed returned no vectors for model {modelId}")
-        return vectors[0]
+        return (await self.embedMany(modelId, [text], **kwargs))[0]
 
 
 class FastembedModel(AbstractModel):
@@ -338,6 +376,8 @@ class FastembedModel(AbstractModel):
             "support_embeddings",
             # FastembedModel-consumed
             "embedding_dimensions",
+            "embedding_batch_size",
+            "embedding_batch_tokens",
             "tier",
             # Standard model-config keys passed through by LLMManager._initModels
             # (these are NOT fastembed constructor args and must be stripped)
@@ -435,6 +475,26 @@ class FastembedModel(AbstractModel):
         # ``float`` defensively in case fastembed ever switches dtype.
         return [float(x) for x in vector.tolist()]
 
+    async def _generateEmbeddingsBatch(self, texts: Sequence[str]) -> list[list[float]]:
+        """Generate embeddings for ``texts`` with one native fastembed batch call.
+
+        Args:
+            texts: Input texts to embed.
+
+        Returns:
+            One float vector per input text, in input order.
+
+        Raises:
+            Exception: Any exception raised by fastembed (load failure,
+                OOM, etc.) is re-raised unchanged.
+        """
+        vectors = await self._provider.embedMany(
+            modelId=self.modelId,
+            texts=texts,
+            **self._fastembedKwargs,
+        )
+        return [[float(x) for x in vector.tolist()] for vector in vectors]
+
     async def _generateText(
         self,
         messages: Sequence[ModelMessage],
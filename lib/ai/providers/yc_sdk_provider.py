@@ -44,7 +44,7 @@ import logging
 import os
 import uuid
 from collections.abc import Sequence
-from typing import Any, Dict, List, Optional, Type, Union, overload
+from typing import Any, AsyncIterator, Dict, List, Optional, Type, Union, overload
 
 from google.protobuf.struct_pb2 import Struct
 from yandex.cloud.ai.foundation_models.v1.text_common_pb2 import FunctionCall as ProtoCompletionsFunctionCall
@@ -73,7 +73,9 @@ from ..abstract import AbstractLLMProvider, AbstractModel
 from ..models import (
     LLMAbstractTool,
     LLMToolCall,
+    LLMToolCallDelta,
     ModelMessage,
+    ModelResultChunk,
     ModelResultStatus,
     ModelRunResult,
     ModelStructuredResult,
@@ -442,6 +444,33 @@ class YcAIModel(AbstractModel):
         Raises:
             NotImplementedError: If the model doesn't support text generation.
         """
+        model = self._getTextModel(tools)
+
+        try:
+            operation = await model.run_deferred(self._convertMessages(messages))
+            result = await operation.wait()
+
+            if not isinstance(result, GPTModelResult):
+                raise TypeError(f"Expected GPTModelResult, got {type(result).__name__}")
+
+            return self._convertTextResult(result)
+
+        except Exception as e:
+            return self._handleSDKError(e)
+
+    def _getTextModel(self, tools: Optional[Sequence[LLMAbstractTool]]) -> AsyncGPTModel:
+        """Create a fresh text model configured for the given tools.
+
+        Args:
+            tools: Optional sequence of tools for function calling.
+
+        Returns:
+            A configured AsyncGPTModel.
+
+        Raises:
+            NotImplementedError: If the model doesn't support text generation.
+            TypeError: If the SDK returned an unexpected model type.
+        """
         if not self.supportText:
             raise NotImplementedError(f"Text generation isn't supported by {self.modelId}")
 
@@ -455,44 +484,97 @@ class YcAIModel(AbstractModel):
         model = self._getModel(**configKwargs)
         if not isinstance(model, AsyncGPTModel):
             raise TypeError(f"Expected AsyncGPTModel from _getModel(), got {type(model).__name__}")
+        return model
 
-        try:
-            operation = await model.run_deferred(self._convertMessages(messages))
-            result = await operation.wait()
+    def _convertTextResult(self, result: GPTModelResult) -> ModelRunResult:
+        """Convert a YC SDK completion result to ModelRunResult.
 
-            if not isinstance(result, GPTModelResult):
-                raise TypeError(f"Expected GPTModelResult, got {type(result).__name__}")
+        Args:
+            result: The completion result from the SDK.
 
-            # Extract tool calls if present
-            toolCalls: List[LLMToolCall] = []
-            resultStatus = self._statusToModelRunResultStatus(result.status)
-
-            if result.tool_calls:
-                resultStatus = ModelResultStatus.TOOL_CALLS
-                for call in result.tool_calls:
-                    if not isinstance(call.function, AsyncFunctionCall):
-                        logger.error(f"Tool call function is not AsyncFunctionCall: {type(call.function).__name__}")
-                        continue
-                    toolCalls.append(
-                        LLMToolCall(
-                            id=str(call.id) if call.id else str(uuid.uuid4()),
-                            name=call.function.name,
-                            parameters=call.function.arguments,
-                        )
+        Returns:
+            A ModelRunResult with the text, tool calls and token usage.
+        """
+        # Extract tool calls if present
+        toolCalls: List[LLMToolCall] = []
+        resultStatus = self._statusToModelRunResultStatus(result.status)
+
+        if result.tool_calls:
+            resultStatus = ModelResultStatus.TOOL_CALLS
+            for call in result.tool_calls:
+                if not isinstance(call.function, AsyncFunctionCall):
+                    logger.error(f"Tool call function is not AsyncFunctionCall: {type(call.function).__name__}")
+                    continue
+                toolCalls.append(
+                    LLMToolCall(
+                        id=str(call.id) if call.id else str(uuid.uuid4()),
+                        name=call.function.name,
+                        parameters=call.function.arguments,
                     )
+                )
 
-            return ModelRunResult(
-                result,
-                resultStatus,
-                result.alternatives[0].text,
-                toolCalls=toolCalls,
-                inputTokens=result.usage.input_text_tokens,
-                outputTokens=result.usage.completion_tokens,
-                totalTokens=result.usage.total_tokens,
-            )
+        return ModelRunResult(
+            result,
+            resultStatus,
+            result.alternatives[0].text,
+            toolCalls=toolCalls,
+            inputTokens=result.usage.input_text_tokens,
+            outputTokens=result.usage.completion_tokens,
+            totalTokens=result.usage.total_tokens,
+        )
+
+    async def _generateTextStream(
+        self, messages: Sequence[ModelMessage], tools: Optional[Sequence[LLMAbstractTool]] = None
+    ) -> AsyncIterator[ModelResultChunk]:
+        """Generate text using the YC SDK model with a streamed response.
+
+        Uses run_stream(). Every partial result of the SDK holds the whole text
+        generated so far, so text deltas are computed against the previous
+        partial result. Tool calls arrive complete in the final result and are
+        yielded as one delta each.
+
+        Args:
+            messages: A sequence of ModelMessage objects containing the conversation history.
+            tools: Optional sequence of tools for function calling.
+
+        Yields:
+            ModelResultChunk objects; the last one carries the ModelRunResult.
+
+        Raises:
+            NotImplementedError: If the model doesn't support text generation.
+        """
+        model = self._getTextModel(tools)
 
+        lastResult: Optional[GPTModelResult] = None
+        sentText = ""
+        try:
+            async for result in model.run_stream(self._convertMessages(messages)):
+                lastResult = result
+                text = result.alternatives[0].text if result.alternatives else ""
+                if text.startswith(sentText):
+                    textDelta = text[len(sentText) :]
+                    sentText = text
+                else:
+                    # Not a continuation of the previous result - treat it as a delta
+                    textDelta = text
+                    sentText += text
+                if textDelta:
+                    yield ModelResultChunk(textDelta=textDelta)
+
+            if lastResult is None:
+                raise RuntimeError(f"Empty stream from {self.modelId}")
+
+            ret = self._convertTextResult(lastResult)
+            ret.resultText = sentText
         except Exception as e:
-            return self._handleSDKError(e)
+            yield ModelResultChunk(result=self._handleSDKError(e))
+            return
+
+        toolCallDeltas = [
+            LLMToolCallDelta(i, id=toolCall.id, name=toolCall.name, argumentsDelta=json.dumps(toolCall.parameters))
+            for i, toolCall in enumerate(ret.toolCalls)
+        ]
+        yield ModelResultChunk(toolCallDeltas=toolCallDeltas, result=ret)
 
     async def _generateImage(self, messages: Sequence[ModelMessage]) -> ModelRunResult:
         """Generate an image using the YC SDK model.
@@ -635,6 +717,14 @@ class YcAIModel(AbstractModel):
         """
         raise NotImplementedError(f"Embeddings aren't supported by YC SDK model {self.modelId} yet")
 
+    def hasExactTokensCount(self) -> bool:
+        """Check whether getExactTokensCount() uses the YC SDK tokenizer.
+
+        Returns:
+            True if precise token counting is enabled, False otherwise.
+        """
+        return USE_PRECISE_TOKEN_COUNT
+
     async def getExactTokensCount(self, data: Any) -> int:
         """Get exact token count using the YC SDK tokenizer if enabled.
 
@@ -0,0 +1,144 @@
+"""Token accounting for message sequences.
+
+Condensing and summarizing long histories needs token counts of many slices of
+the same message list. MessageTokensCounter counts every message once (the
+per-message counts are memoized on the messages themselves) and answers slice
+totals and "how much fits into N tokens" questions from prefix sums with a
+binary search, so working with a 500-message context stays linear.
+
+Example:
+    >>> counter = await MessageTokensCounter.create(model, messages)
+    >>> counter.total()  # tokens in all messages
+    >>> start = counter.trimStart(budget=4000, start=1)  # drop the oldest messages after the first
+    >>> end = counter.fitEnd(budget=8000, start=start)  # longest batch starting at start
+"""
+
+import bisect
+import itertools
+from collections.abc import Sequence
+from typing import List, Optional
+
+from .abstract import AbstractModel
+from .models import ModelMessage
+
+
+class MessageTokensCounter:
+    """Prefix sums of per-message token counts.
+
+    Indices follow slice semantics: ``total(start, end)`` counts messages
+    ``start .. end - 1``, and an empty (or reversed) range counts as 0 tokens.
+    """
+
+    __slots__ = ("_prefix",)
+
+    def __init__(self, counts: Sequence[int]) -> None:
+        """Initialize the counter from per-message token counts.
+
+        Args:
+            counts: Token count of each message, in order.
+        """
+        self._prefix: List[int] = list(itertools.accumulate(counts, initial=0))
+        """Prefix sums: ``_prefix[i]`` is the number of tokens in the first i messages."""
+
+    @classmethod
+    def estimate(cls, model: AbstractModel, messages: Sequence[ModelMessage]) -> "MessageTokensCounter":
+        """Create a counter from the model's (memoized) token estimates.
+
+        Args:
+            model: Model whose estimate is used.
+            messages: Messages to count.
+
+        Returns:
+            Counter for the messages.
+        """
+        return cls([model.getEstimateMessageTokensCount(message) for message in messages])
+
+    @classmethod
+    async def create(
+        cls, model: AbstractModel, messages: Sequence[ModelMessage], *, exact: bool = True
+    ) -> "MessageTokensCounter":
+        """Create a counter, using the model's tokenizer when it has one.
+
+        Exact counts are memoized on each message per model, so a message is
+        tokenized only once. Models without a tokenizer fall back to estimate().
+
+        Args:
+            model: Model to count tokens for.
+            messages: Messages to count.
+            exact: Whether to use the model's tokenizer if available.
+
+        Returns:
+            Counter for the messages.
+        """
+        if not exact or not model.hasExactTokensCount():
+            return cls.estimate(model, messages)
+
+        cacheKey = f"exact:{model.modelId}"
+        counts: List[int] = []
+        for message in messages:
+            count = message.getCachedSize(cacheKey)
+            if count is None:
+                count = await model.getExactTokensCount([message.toDict()])
+                message.setCachedSize(cacheKey, count)
+            counts.append(count)
+        return cls(counts)
+
+    def __len__(self) -> int:
+        """Return the number of counted messages."""
+        return len(self._prefix) - 1
+
+    def _clampEnd(self, end: Optional[int]) -> int:
+        """Clamp an end index to the counted messages (None means all)."""
+        return len(self) if end is None else max(0, min(end, len(self)))
+
+    def total(self, start: int = 0, end: Optional[int] = None) -> int:
+        """Get the number of tokens in messages ``start .. end - 1``.
+
+        Args:
+            start: First message index.
+            end: Index past the last message (None - up to the end).
+
+        Returns:
+            Token count of the slice (0 for an empty range).
+        """
+        end = self._clampEnd(end)
+        start = max(0, start)
+        if end <= start:
+            return 0
+        return self._prefix[end] - self._prefix[start]
+
+    def trimStart(self, budget: int, start: int = 0, end: Optional[int] = None) -> int:
+        """Find how many leading messages to drop so the rest fits into the budget.
+
+        Args:
+            budget: Maximum number of tokens for messages ``result .. end - 1``.
+            start: First message that may be kept.
+            end: Index past the last message (None - up to the end).
+
+        Returns:
+            The smallest index in ``start .. end`` from which the remaining
+            messages fit (``end`` if not even a single message fits).
+        """
+        end = self._clampEnd(end)
+        start = max(0, start)
+        if end <= start:
+            return start
+        return bisect.bisect_left(self._prefix, self._prefix[end] - budget, start, end)
+
+    def fitEnd(self, budget: int, start: int = 0, end: Optional[int] = None) -> int:
+        """Find how many messages starting at start fit into the budget.
+
+        Args:
+            budget: Maximum number of tokens for messages ``start .. result - 1``.
+            start: First message index.
+            end: Index past the last message that may be taken (None - up to the end).
+
+        Returns:
+            The largest index in ``start .. end`` such that the messages before
+            it fit (``start`` if not even a single message fits).
+        """
+        end = self._clampEnd(end)
+        start = max(0, start)
+        if end <= start:
+            return start
+        return max(start, bisect.bisect_right(self._prefix, self._prefix[start] + budget, start, end + 1) - 1)
@@ -14,6 +14,8 @@ from typing import Awaitable, Dict, List, Optional, TypeAlias
 
 import httpx
 
+from lib.http_client import HttpClientRegistry
+
 from .masker import SecretMasker
 from .transports import RecordingTransport
 from .types import GoldenDataFileFormat, GoldenDataScenarioDict, HttpCallDict, MetadataDict
@@ -87,6 +89,8 @@ class GoldenDataRecorder:
 
         self.asyncClientClass = PatchedAsyncClient
         httpx.AsyncClient = PatchedAsyncClient
+        # Shared pooled clients were built with the original class, recreate them
+        await HttpClientRegistry.getInstance().aclose()
 
         if self.aenterCallback:
             if inspect.iscoroutinefunction(self.aenterCallback):
@@ -121,6 +125,7 @@ class GoldenDataRecorder:
         if self.originalClientClass:
             httpx.AsyncClient = self.originalClientClass
             print("HttpxRecorder: Restored original httpx.AsyncClient")
+            await HttpClientRegistry.getInstance().aclose()
 
     def getRecordedRecordings(self) -> List[HttpCallDict]:
         """Get all recorded recordings, with secrets masked.
@@ -10,6 +10,8 @@ from typing import Awaitable, List, Optional, TypeAlias
 
 import httpx
 
+from lib.http_client import HttpClientRegistry
+
 from .transports import ReplayTransport
 from .types import GoldenDataScenarioDict
 
@@ -85,6 +87,8 @@ class GoldenDataReplayer:
                 super().__init__(*args, **kwargs)
 
         httpx.AsyncClient = PatchedAsyncClient
+        # Shared pooled clients were built with the original class, recreate them
+        await HttpClientRegistry.getInstance().aclose()
 
         # Call aenterCallback if provided
         if self.aenterCallback:
@@ -121,6 +125,7 @@ class GoldenDataReplayer:
         # Restore original httpx.AsyncClient
         if self.originalClientClass:
             httpx.AsyncClient = self.originalClientClass
+            await HttpClientRegistry.getInstance().aclose()
 
     def createClient(self) -> httpx.AsyncClient:
         """Create an httpx client with ReplayTransport.
@@ -16,6 +16,7 @@ Main Components:
     - MessageTokenizer: Text preprocessing and tokenization with multiple options
     - TokenizerConfig: Configuration for tokenization behavior
     - BayesStorageInterface: Abstract storage interface for backend implementations
+    - CachedBayesStorage: In-memory model cache wrapping another storage
     - TokenStats: Statistics for individual tokens (spam/ham counts)
     - ClassStats: Statistics for message classes (spam/ham)
 
@@ -53,6 +54,7 @@ Module Attributes:
 """
 
 from .bayes_filter import BayesConfig, NaiveBayesFilter, SpamScore
+from .cached_storage import CachedBayesStorage
 from .models import ClassStats, TokenStats
 from .storage_interface import BayesStorageInterface
 from .tokenizer import MessageTokenizer, TokenizerConfig
@@ -73,6 +75,7 @@ __all__ = [
     "TokenizerConfig",
     # Storage interface
     "BayesStorageInterface",
+    "CachedBayesStorage",
     # Data models
     "TokenStats",
     "ClassStats",
@@ -502,8 +502,11 @@ class NaiveBayesFilter:
     ) -> Dict[str, int]:
         """Learn from multiple messages in batch.
 
-        Processes a sequence of messages for training, updating statistics for each.
-        Useful for bulk training operations or importing training data.
+        Tokenizes every message first and aggregates token and class counts in
+        memory per chat. Each chat is then written with one
+        :meth:`BayesStorageInterface.batchUpdateTokens` call plus at most one
+        :meth:`BayesStorageInterface.updateClassStats` call per class, instead of
+        one round of storage updates per message.
 
         Args:
             messages: Sequence of tuples containing (text, is_spam, chat_id) where:
@@ -511,13 +514,15 @@ class NaiveBayesFilter:
                 - is_spam: True if spam, False if ham
                 - chat_id: Optional chat ID for per-chat learning
             progress_callback: Optional callback function called after each message
-                with (current, total) progress. Signature: callback(current: int, total: int) -> None
+                is tokenized with (current, total) progress. Signature:
+                callback(current: int, total: int) -> None
 
         Returns:
             Dictionary containing learning statistics:
                 - total: Total number of messages processed
                 - success: Number of successfully learned messages
-                - failed: Number of failed learning operations
+                - failed: Number of failed learning operations (messages without
+                  tokens and messages of chats whose storage update failed)
                 - spam_learned: Number of spam messages learned
                 - ham_learned: Number of ham messages learned
 
@@ -536,22 +541,62 @@ class NaiveBayesFilter:
         """
         stats = {"total": len(messages), "success": 0, "failed": 0, "spam_learned": 0, "ham_learned": 0}
 
-        for i, (text, is_spam, chat_id) in enumerate(messages):
-            success = await self._learn(text, is_spam, chat_id)
+        # chat_id -> token -> (spam increment, ham increment)
+        tokenCounts: Dict[Optional[int], Dict[str, List[int]]] = {}
+        # chat_id -> is_spam -> (messages, tokens)
+        classCounts: Dict[Optional[int], Dict[bool, List[int]]] = {}
 
-            if success:
-                stats["success"] += 1
-                if is_spam:
-                    stats["spam_learned"] += 1
-                else:
-                    stats["ham_learned"] += 1
-            else:
+        tokenLists = self.tokenizer.tokenizeMany(text for text, _, _ in messages)
+        for i, ((_, is_spam, chat_id), tokens) in enumerate(zip(messages, tokenLists)):
+            if not tokens:
+                logger.warning("No tokens found in training message, skipping.")
                 stats["failed"] += 1
+            else:
+                chat_id_param = chat_id if self.config.perChatStats else None
+                chatTokens = tokenCounts.setdefault(chat_id_param, {})
+                countIdx = 0 if is_spam else 1
+                for token in tokens:
+                    chatTokens.setdefault(token, [0, 0])[countIdx] += 1
+                classCount = classCounts.setdefault(chat_id_param, {}).setdefault(is_spam, [0, 0])
+                classCount[0] += 1
+                classCount[1] += len(tokens)
 
             # Call progress callback if provided
             if progress_callback:
                 progress_callback(i + 1, len(messages))
 
+        for chat_id_param, chatTokens in tokenCounts.items():
+            chatClasses = classCounts[chat_id_param]
+            token_updates = []
+            for token, (spamCount, hamCount) in chatTokens.items():
+                if spamCount:
+                    token_updates.append({"token": token, "is_spam": True, "increment": spamCount})
+                if hamCount:
+                    token_updates.append({"token": token, "is_spam": False, "increment": hamCount})
+
+            try:
+                success = await self.storage.batchUpdateTokens(token_updates, chat_id_param)
+                for is_spam, (messageCount, tokenCount) in chatClasses.items():
+                    success = (
+                        await self.storage.updateClassStats(
+                            isSpam=is_spam,
+                            messageIncrement=messageCount,
+                            tokenIncrement=tokenCount,
+                            chatId=chat_id_param,
+                        )
+                        and success
+                    )
+            except Exception as e:
+                logger.error(f"Failed to learn batch for chat {chat_id_param}: {e}.")
+                success = False
+
+            for is_spam, (messageCount, _) in chatClasses.items():
+                if success:
+                    stats["success"] += messageCount
+                    stats["spam_learned" if is_spam else "ham_learned"] += messageCount
+                else:
+                    stats["failed"] += messageCount
+
         logger.info(f"Batch learning completed: {stats}.")
         return stats
 
@@ -0,0 +1,590 @@
+"""In-memory model cache in front of another Bayes storage.
+
+Classifying a message needs the class statistics, the vocabulary size and the
+statistics of every token of the message. Against a database that is several
+round-trips per message. :class:`CachedBayesStorage` keeps a compact snapshot
+of each model (per chat and global) in memory, so the read methods used by
+:meth:`NaiveBayesFilter.classify` never leave the process once the model is
+loaded.
+
+Snapshots are loaded lazily on first use, updated in place by successful
+writes, evicted least-recently-used when the cache grows past its token
+budget, and reloaded from the wrapped storage in the background once they are
+older than ``reconcileInterval`` (to pick up writes made by other processes).
+
+Example:
+    >>> from lib.bayes_filter import CachedBayesStorage, NaiveBayesFilter
+    >>>
+    >>> storage = CachedBayesStorage(DatabaseBayesStorage(db), maxCachedTokens=200000)
+    >>> bayesFilter = NaiveBayesFilter(storage)
+    >>> result = await bayesFilter.classify("Buy cheap watches!", chatId=12345)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, TypedDict
+
+from .models import BayesModelStats, ClassStats, TokenStats
+from .storage_interface import BayesStorageInterface
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CACHED_TOKENS = 500000
+"""Default token budget across all cached models."""
+DEFAULT_MAX_CACHED_CHATS = 1000
+"""Default maximum number of cached models."""
+DEFAULT_RECONCILE_INTERVAL = 600.0
+"""Default age in seconds after which a model is reloaded from storage."""
+
+
+class CachedBayesStorageStats(TypedDict):
+    """Counters reported by :meth:`CachedBayesStorage.getStats`."""
+
+    models: int
+    tokens: int
+    hits: int
+    loads: int
+    evictions: int
+
+
+class _ChatModel:
+    """Snapshot of one model (one chat or the global one).
+
+    Attributes:
+        tokens: Token -> [spam count, ham count].
+        classCounts: [spam messages, spam tokens, ham messages, ham tokens].
+        loadedAt: ``time.monotonic()`` of the load.
+    """
+
+    __slots__ = ("tokens", "classCounts", "loadedAt")
+
+    def __init__(self, tokens: Dict[str, List[int]], classCounts: List[int]) -> None:
+        self.tokens = tokens
+        self.classCounts = classCounts
+        self.loadedAt = time.monotonic()
+
+
+class _PendingLoad:
+    """Load of one model in flight.
+
+    Attributes:
+        task: Task running the load.
+        dirty: Set when a write to the model overlaps the load; the loaded
+            snapshot may or may not include that write and is not cached.
+    """
+
+    __slots__ = ("task", "dirty")
+
+    def __init__(self) -> None:
+        self.task: Optional[asyncio.Task] = None
+        self.dirty = False
+
+
+class CachedBayesStorage(BayesStorageInterface):
+    """Read-through, write-through in-memory cache of Bayes models.
+
+    Reads used for classification (token, class and model statistics,
+    vocabulary) are served from the cached snapshot. Writes go to the wrapped
+    storage first and are applied to the snapshot only if they succeed.
+    Concurrent first reads of the same model share one load.
+
+    Attributes:
+        storage: Wrapped storage holding the authoritative statistics.
+        maxCachedTokens: Token budget across all cached models; least recently
+            used models are evicted beyond it (the model in use is always kept).
+        maxCachedChats: Maximum number of cached models.
+        reconcileInterval: Age in seconds after which a model is reloaded in the
+            background on its next use. ``0`` disables reconciliation.
+    """
+
+    __slots__ = (
+        "storage",
+        "maxCachedTokens",
+        "maxCachedChats",
+        "reconcileInterval",
+        "_models",
+        "_loading",
+        "_writes",
+        "_cachedTokens",
+        "_hits",
+        "_loads",
+        "_evictions",
+    )
+
+    def __init__(
+        self,
+        storage: BayesStorageInterface,
+        *,
+        maxCachedTokens: int = DEFAULT_MAX_CACHED_TOKENS,
+        maxCachedChats: int = DEFAULT_MAX_CACHED_CHATS,
+        reconcileInterval: float = DEFAULT_RECONCILE_INTERVAL,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            storage: Storage to load models from and write updates to.
+            maxCachedTokens: Token budget across all cached models.
+            maxCachedChats: Maximum number of cached models (at least 1).
+            reconcileInterval: Seconds after which a model is reloaded, 0 to disable.
+        """
+        self.storage = storage
+        self.maxCachedTokens = maxCachedTokens
+        self.maxCachedChats = max(1, maxCachedChats)
+        self.reconcileInterval = reconcileInterval
+
+        self._models: OrderedDict[Optional[int], _ChatModel] = OrderedDict()
+        self._loading: Dict[Optional[int], _PendingLoad] = {}
+        self._writes: Dict[Optional[int], int] = {}
+        self._cachedTokens = 0
+
+        self._hits = 0
+        self._loads = 0
+        self._evictions = 0
+
+    # ------------------------------------------------------------------
+    # Cached reads
+    # ------------------------------------------------------------------
+
+    async def getTokenStats(self, tokens: Iterable[str], chatId: Optional[int] = None) -> Dict[str, TokenStats]:
+        """Get statistics for specific tokens from the cached model.
+
+        Args:
+            tokens: Tokens to look up.
+            chatId: Optional chat ID, None for global statistics.
+
+        Returns:
+            Token -> TokenStats for the known tokens.
+        """
+        modelTokens = (await self._getModel(chatId)).tokens
+        ret: Dict[str, TokenStats] = {}
+        for token in tokens:
+            counts = modelTokens.get(token)
+            if counts is not None:
+                ret[token] = TokenStats(
+                    token=token, spamCount=counts[0], hamCount=counts[1], totalCount=counts[0] + counts[1]
+                )
+        return ret
+
+    async def getAllTokenStats(self, chatId: Optional[int] = None) -> Dict[str, TokenStats]:
+        """Get statistics for every token of the cached model.
+
+        Args:
+            chatId: Optional chat ID, None for global statistics.
+
+        Returns:
+            Token -> TokenStats for the whole vocabulary.
+        """
+        model = await self._getModel(chatId)
+        return await self.getTokenStats(list(model.tokens), chatId)
+
+    async def getClassStats(self, is_spam: bool, chat_id: Optional[int] = None) -> ClassStats:
+        """Get spam or ham class statistics from the cached model.
+
+        Args:
+            is_spam: True for the spam class, False for ham.
+            chat_id: Optional chat ID, None for global statistics.
+
+        Returns:
+            ClassStats of the requested class.
+        """
+        counts = (await self._getModel(chat_id)).classCounts
+        offset = 0 if is_spam else 2
+        return ClassStats(message_count=counts[offset], token_count=counts[offset + 1])
+
+    async def getAllTokens(self, chat_id: Optional[int] = None) -> List[str]:
+        """Get all known tokens of the cached model, sorted.
+
+        Args:
+            chat_id: Optional chat ID, None for global statistics.
+
+        Returns:
+            Sorted list of tokens.
+        """
+        return sorted((await self._getModel(chat_id)).tokens)
+
+    async def getVocabularySize(self, chatId: Optional[int] = None) -> int:
+        """Get the vocabulary size of the cached model.
+
+        Args:
+            chatId: Optional chat ID, None for global statistics.
+
+        Returns:
+            Number of known tokens.
+        """
+        return len((await self._getModel(chatId)).tokens)
+
+    async def getModelStats(self, chat_id: Optional[int] = None) -> BayesModelStats:
+        """Get overall statistics of the cached model.
+
+        Args:
+            chat_id: Optional chat ID, None for global statistics.
+
+        Returns:
+            BayesModelStats built from the snapshot.
+        """
+        model = await self._getModel(chat_id)
+        spamMessages, spamTokens, hamMessages, hamTokens = model.classCounts
+        return BayesModelStats(
+            total_spam_messages=spamMessages,
+            total_ham_messages=hamMessages,
+            total_tokens=spamTokens + hamTokens,
+            vocabulary_size=len(model.tokens),
+            chat_id=chat_id,
+        )
+
+    # ------------------------------------------------------------------
+    # Write-through updates
+    # ------------------------------------------------------------------
+
+    async def updateTokenStats(
+        self, token: str, is_spam: bool, increment: int = 1, chat_id: Optional[int] = None
+    ) -> bool:
+        """Update one token in the wrapped storage and in the cached model.
+
+        Args:
+            token: Token to update.
+            is_spam: True if the token appeared in spam.
+            increment: Amount to add.
+            chat_id: Optional chat ID, None for global statistics.
+
+        Returns:
+            Result of the wrapped storage.
+        """
+        model = self._beginWrite(chat_id)
+        try:
+            success = await self.storage.updateTokenStats(token, is_spam, increment, chat_id)
+        finally:
+            self._endWrite(chat_id)
+        if success:
+            self._applyTokenUpdates(chat_id, model, [{"token": token, "is_spam": is_spam, "increment": increment}])
+        return success
+
+    async def batchUpdateTokens(self, token_updates: List[Dict[str, Any]], chat_id: Optional[int] = None) -> bool:
+        """Update many tokens in the wrapped storage and in the cached model.
+
+        Args:
+            token_updates: Dicts with 'token', 'is_spam' and 'increment' keys.
+            chat_id: Optional chat ID, None for global statistics.
+
+        Returns:
+            Result of the wrapped storage.
+        """
+        model = self._beginWrite(chat_id)
+        try:
+            success = await self.storage.batchUpdateTokens(token_updates, chat_id)
+        finally:
+            self._endWrite(chat_id)
+        if success:
+            self._applyTokenUpdates(chat_id, model, token_updates)
+        return success
+
+    async def updateClassStats(
+        self, isSpam: bool, messageIncrement: int = 1, tokenIncrement: int = 0, chatId: Optional[int] = None
+    ) -> bool:
+        """Update class statistics in the wrapped storage and in the cached model.
+
+        Args:
+            isSpam: True for the spam class, False for ham.
+            messageIncrement: Messages to add.
+            tokenIncrement: Tokens to add.
+            chatId: Optional chat ID, None for global statistics.
+
+        Returns:
+            Result of the wrapped storage.
+        """
+        model = self._beginWrite(chatId)
+        try:
+            success = await self.storage.updateClassStats(isSpam, messageIncrement, tokenIncrement, chatId)
+        finally:
+            self._endWrite(chatId)
+        if success and model is not None and self._models.get(chatId) is model:
+            offset = 0 if isSpam else 2
+            model.classCounts[offset] += messageIncrement
+            model.classCounts[offset + 1] += tokenIncrement
+        return success
+
+    async def clearStats(self, chat_id: Optional[int] = None) -> bool:
+        """Clear statistics in the wrapped storage and drop the cached model.
+
+        Args:
+            chat_id: Optional chat ID, None for global statistics.
+
+        Returns:
+            Result of the wrapped storage.
+        """
+        try:
+            return await self.storage.clearStats(chat_id)
+        finally:
+            self.invalidate(chat_id)
+
+    async def cleanupRareTokens(self, min_count: int = 2, chat_id: Optional[int] = None) -> None:
+        """Remove rare tokens in the wrapped storage and drop the cached model.
+
+        Args:
+            min_count: Minimum total count to keep a token.
+            chat_id: Optional chat ID, None for global statistics.
+
+        Returns:
+            None
+        """
+        try:
+            await self.storage.cleanupRareTokens(min_count, chat_id)
+        finally:
+            self.invalidate(chat_id)
+
+    # ------------------------------------------------------------------
+    # Pass-through reads
+    # ------------------------------------------------------------------
+
+    async def getTopSpamTokens(self, limit: int = 10, chat_id: Optional[int] = None) -> List[TokenStats]:
+        """Get the top spam tokens from the wrapped storage.
+
+        Args:
+            limit: Maximum number of tokens.
+            chat_id: Optional chat ID, None for global statistics.
+
+        Returns:
+            Result of the wrapped storage.
+        """
+        return await self.storage.getTopSpamTokens(limit, chat_id)
+
+    async def getTopHamTokens(self, limit: int = 10, chat_id: Optional[int] = None) -> List[TokenStats]:
+        """Get the top ham tokens from the wrapped storage.
+
+        Args:
+            limit: Maximum number of tokens.
+            chat_id: Optional chat ID, None for global statistics.
+
+        Returns:
+            Result of the wrapped storage.
+        """
+        return await self.storage.getTopHamTokens(limit, chat_id)
+
+    # ------------------------------------------------------------------
+    # Cache management
+    # ------------------------------------------------------------------
+
+    def invalidate(self, chatId: Optional[int] = None) -> None:
+        """Drop the cached model so the next read loads it again.
+
+        Args:
+            chatId: Optional chat ID, None for the global model.
+
+        Returns:
+            None
+        """
+        self._markDirty(chatId)
+        model = self._models.pop(chatId, None)
+        if model is not None:
+            self._cachedTokens -= len(model.tokens)
+
+    def getStats(self) -> CachedBayesStorageStats:
+        """Get cache counters.
+
+        Returns:
+            Number of cached models and tokens, reads served from memory,
+            model loads and evictions.
+        """
+        return {
+            "models": len(self._models),
+            "tokens": self._cachedTokens,
+            "hits": self._hits,
+            "loads": self._loads,
+            "evictions": self._evictions,
+        }
+
+    async def _getModel(self, chatId: Optional[int]) -> _ChatModel:
+        """Get the cached model, loading it on a miss.
+
+        A model older than ``reconcileInterval`` is returned as is while a
+        background reload is started.
+
+        Args:
+            chatId: Optional chat ID, None for the global model.
+
+        Returns:
+            The model snapshot.
+
+        Raises:
+            Exception: If the model is not cached and loading it fails.
+        """
+        model = self._models.get(chatId)
+        if model is not None:
+            self._hits += 1
+            self._models.move_to_end(chatId)
+            if (
+                self.reconcileInterval > 0
+                and chatId not in self._loading
+                and time.monotonic() - model.loadedAt >= self.reconcileInterval
+            ):
+                self._startLoad(chatId)
+            return model
+
+        pending = self._loading.get(chatId)
+        if pending is None:
+            pending = self._startLoad(chatId)
+        assert pending.task is not None
+        # Shield the shared load from the cancellation of one of its waiters
+        return await asyncio.shield(pending.task)
+
+    def _startLoad(self, chatId: Optional[int]) -> _PendingLoad:
+        """Start loading a model in a task shared by all its readers.
+
+        Args:
+            chatId: Optional chat ID, None for the global model.
+
+        Returns:
+            The pending load.
+        """
+        pending = _PendingLoad()
+        # A write in flight may or may not be visible to the load
+        pending.dirty = chatId in self._writes
+        self._loading[chatId] = pending
+        pending.task = asyncio.create_task(self._load(chatId, pending), name=f"bayes-model-load-{chatId}")
+        pending.task.add_done_callback(self._onLoadDone)
+        return pending
+
+    async def _load(self, chatId: Optional[int], pending: _PendingLoad) -> _ChatModel:
+        """Load a model from the wrapped storage and cache it.
+
+        If the model was written to during the load, the snapshot may miss
+        that write: it is returned to the waiting readers but not cached, and
+        an existing (in-place updated) snapshot is kept instead.
+
+        Args:
+            chatId: Optional chat ID, None for the global model.
+            pending: Load state of this model.
+
+        Returns:
+            The loaded model (or the cached one if the load went stale).
+        """
+        try:
+            tokenStats = await self.storage.getAllTokenStats(chatId)
+            spamStats = await self.storage.getClassStats(True, chatId)
+            hamStats = await self.storage.getClassStats(False, chatId)
+        finally:
+            self._loading.pop(chatId, None)
+
+        self._loads += 1
+        model = _ChatModel(
+            {token: [stats.spamCount, stats.hamCount] for token, stats in tokenStats.items()},
+            [spamStats.message_count, spamStats.token_count, hamStats.message_count, hamStats.token_count],
+        )
+
+        current = self._models.get(chatId)
+        if pending.dirty:
+            logger.debug(f"Bayes model {chatId} changed while loading, not caching the snapshot")
+            return current if current is not None else model
+
+        if current is not None:
+            self._cachedTokens -= len(current.tokens)
+        self._models[chatId] = model
+        self._models.move_to_end(chatId)
+        self._cachedTokens += len(model.tokens)
+        self._evict()
+        logger.debug(f"Loaded Bayes model {chatId} with {len(model.tokens)} tokens")
+        return model
+
+    def _onLoadDone(self, task: asyncio.Task) -> None:
+        """Log failed loads, including background reloads nobody awaits.
+
+        Args:
+            task: Finished load task.
+
+        Returns:
+            None
+        """
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Failed to load Bayes model: {task.exception()}")
+
+    def _markDirty(self, chatId: Optional[int]) -> None:
+        """Flag an in-flight load of the model as possibly missing a write.
+
+        Args:
+            chatId: Optional chat ID, None for the global model.
+
+        Returns:
+            None
+        """
+        pending = self._loading.get(chatId)
+        if pending is not None:
+            pending.dirty = True
+
+    def _beginWrite(self, chatId: Optional[int]) -> Optional[_ChatModel]:
+        """Register a write to the model before it is sent to the wrapped storage.
+
+        Loads in flight or started until :meth:`_endWrite` may or may not see
+        the write, so they are flagged as dirty and their snapshots aren't cached.
+
+        Args:
+            chatId: Optional chat ID, None for the global model.
+
+        Returns:
+            The cached model the write should be applied to, if any.
+        """
+        self._markDirty(chatId)
+        self._writes[chatId] = self._writes.get(chatId, 0) + 1
+        return self._models.get(chatId)
+
+    def _endWrite(self, chatId: Optional[int]) -> None:
+        """Unregister a write started by :meth:`_beginWrite`.
+
+        Args:
+            chatId: Optional chat ID, None for the global model.
+
+        Returns:
+            None
+        """
+        writes = self._writes[chatId] - 1
+        if writes:
+            self._writes[chatId] = writes
+        else:
+            del self._writes[chatId]
+
+    def _applyTokenUpdates(
+        self, chatId: Optional[int], model: Optional[_ChatModel], tokenUpdates: List[Dict[str, Any]]
+    ) -> None:
+        """Apply successful token updates to the cached model, if any.
+
+        Nothing is applied if the model cached before the write was replaced
+        or dropped meanwhile.
+
+        Args:
+            chatId: Optional chat ID, None for the global model.
+            model: Model cached when the write started.
+            tokenUpdates: Dicts with 'token', 'is_spam' and 'increment' keys.
+
+        Returns:
+            None
+        """
+        if model is None or self._models.get(chatId) is not model:
+            return
+
+        tokens = model.tokens
+        before = len(tokens)
+        for update in tokenUpdates:
+            counts = tokens.get(update["token"])
+            if counts is None:
+                counts = tokens[update["token"]] = [0, 0]
+            counts[0 if update["is_spam"] else 1] += update.get("increment", 1)
+        self._cachedTokens += len(tokens) - before
+        self._evict()
+
+    def _evict(self) -> None:
+        """Evict least recently used models beyond the token and model budgets.
+
+        The most recently used model is never evicted, even if it alone
+        exceeds the token budget.
+
+        Returns:
+            None
+        """
+        while len(self._models) > 1 and (
+            self._cachedTokens > self.maxCachedTokens or len(self._models) > self.maxCachedChats
+        ):
+            chatId, model = self._models.popitem(last=False)
+            self._cachedTokens -= len(model.tokens)
+            self._evictions += 1
+            logger.debug(f"Evicted Bayes model {chatId} ({len(model.tokens)} tokens)")
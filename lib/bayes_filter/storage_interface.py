@@ -198,6 +198,34 @@ class BayesStorageInterface(ABC):
         """
         pass
 
+    async def getAllTokenStats(self, chatId: Optional[int] = None) -> Dict[str, TokenStats]:
+        """Get statistics for every known token.
+
+        Used to load a whole model into memory at once. The default
+        implementation combines :meth:`getAllTokens` and :meth:`getTokenStats`;
+        backends should override it with a single query where possible.
+
+        Unlike the other read methods, implementations should raise on storage
+        errors instead of returning an empty result, so that callers caching
+        the result do not mistake an outage for an empty model.
+
+        Args:
+            chatId: Optional chat ID for per-chat statistics. If None, returns
+                global statistics.
+
+        Returns:
+            A dictionary mapping every stored token to its TokenStats.
+
+        Example:
+            >>> allStats = await storage.getAllTokenStats(chatId=123)
+            >>> print(len(allStats))
+            2000
+        """
+        tokens = await self.getAllTokens(chatId)
+        if not tokens:
+            return {}
+        return await self.getTokenStats(tokens, chatId)
+
     @abstractmethod
     async def getVocabularySize(self, chatId: Optional[int] = None) -> int:
         """Get the size of the vocabulary.
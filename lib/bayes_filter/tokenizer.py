@@ -9,6 +9,12 @@ Classes:
     TokenizerConfig: Configuration settings for the tokenizer.
     MessageTokenizer: Main tokenizer class for processing messages.
 
+By default the tokenizer runs in single-pass mode: URL, mention and emoji
+stripping and word extraction are fused into one compiled regex scan, and
+tokens are interned. It produces the same tokens as the original multi-pass
+pipeline (preprocess, extract, filter), which is kept for
+``preserve_punctuation`` and for ``single_pass=False``.
+
 Example:
     >>> config = TokenizerConfig(min_token_length=3, use_bigrams=True)
     >>> tokenizer = MessageTokenizer(config)
@@ -18,8 +24,23 @@ Example:
 """
 
 import re
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
+
+_URL_REGEX = r"https?://\S+|www\.\S+|t\.me/\S+"
+"""URLs removed when ``remove_urls`` is set."""
+_URL_START_REGEX = r"https?://\S|www\.\S|t\.me/\S"
+"""Start of a URL; a URL cuts any word it starts in."""
+_EMOJI_RANGES = (
+    r"\U0001F600-\U0001F64F"  # emoticons
+    r"\U0001F300-\U0001F5FF"  # symbols & pictographs
+    r"\U0001F680-\U0001F6FF"  # transport & map symbols
+    r"\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    r"\U00002702-\U000027B0"  # dingbats
+    r"\U000024C2-\U0001F251"  # enclosed characters
+)
+"""Character ranges removed when ``remove_emoji`` is set."""
 
 
 @dataclass
@@ -46,6 +67,9 @@ class TokenizerConfig:
             Defaults to False.
         normalize_whitespace: Whether to normalize multiple spaces to single space.
             Defaults to True.
+        single_pass: Whether to use the fused single-pass tokenizer. It yields the
+            same tokens as the multi-pass pipeline, faster. Ignored (multi-pass is
+            used) when preserve_punctuation is True. Defaults to True.
 
     Example:
         >>> config = TokenizerConfig(min_token_length=3, use_bigrams=True)
@@ -64,6 +88,7 @@ class TokenizerConfig:
     stopwords: Optional[Set[str]] = None
     preserve_punctuation: bool = False
     normalize_whitespace: bool = True
+    single_pass: bool = True
 
     def __post_init__(self) -> None:
         """Initialize default stopwords if not provided.
@@ -217,6 +242,8 @@ class MessageTokenizer:
         _emoji_pattern: Compiled regex pattern for matching emoji characters.
         _word_pattern: Compiled regex pattern for matching word characters.
         _whitespace_pattern: Compiled regex pattern for matching whitespace.
+        _scan_pattern: Compiled single-pass pattern matching either a removed
+            fragment (URL, mention) or a word, or None in multi-pass mode.
 
     Example:
         >>> config = TokenizerConfig(min_token_length=3, use_bigrams=True)
@@ -239,20 +266,17 @@ class MessageTokenizer:
         self.config = config or TokenizerConfig()
 
         # Compile regex patterns for better performance
-        self._url_pattern = re.compile(r"https?://\S+|www\.\S+|t\.me/\S+")
+        self._url_pattern = re.compile(_URL_REGEX)
         self._mention_pattern = re.compile(r"@\w+")
         self._number_pattern = re.compile(r"\d+")
-        self._emoji_pattern = re.compile(
-            r"[\U0001F600-\U0001F64F]|"  # emoticons
-            r"[\U0001F300-\U0001F5FF]|"  # symbols & pictographs
-            r"[\U0001F680-\U0001F6FF]|"  # transport & map symbols
-            r"[\U0001F1E0-\U0001F1FF]|"  # flags (iOS)
-            r"[\U00002702-\U000027B0]|"  # dingbats
-            r"[\U000024C2-\U0001F251]"  # enclosed characters
-        )
+        self._emoji_pattern = re.compile(f"[{_EMOJI_RANGES}]")
         self._word_pattern = re.compile(r"\b\w+\b")
         self._whitespace_pattern = re.compile(r"\s+")
 
+        self._scan_pattern: Optional[re.Pattern[str]] = None
+        if self.config.single_pass and not self.config.preserve_punctuation:
+            self._scan_pattern = self._compile_scan_pattern()
+
     def tokenize(self, text: str, ignoreTrigrams: bool = False) -> List[str]:
         """Convert text into list of tokens.
 
@@ -278,6 +302,9 @@ class MessageTokenizer:
         if not text or not text.strip():
             return []
 
+        if self._scan_pattern is not None:
+            return self._generate_ngrams(self._scan_words(text), ignoreTrigrams=ignoreTrigrams)
+
         # Preprocessing
         processed_text = self._preprocess_text(text)
 
@@ -292,6 +319,121 @@ class MessageTokenizer:
 
         return tokens
 
+    def tokenizeMany(self, texts: Iterable[str], ignoreTrigrams: bool = False) -> List[List[str]]:
+        """Tokenize many texts, e.g. a training batch.
+
+        Equivalent to calling :meth:`tokenize` for each text, but avoids the
+        per-call attribute lookups. Tokens are interned in single-pass mode,
+        so a token repeated across the batch is stored once.
+
+        Args:
+            texts: Texts to tokenize.
+            ignoreTrigrams: If True, skip trigram generation even if enabled in
+                config. Defaults to False.
+
+        Returns:
+            One token list per text, in input order.
+
+        Example:
+            >>> tokenizer = MessageTokenizer()
+            >>> tokenizer.tokenizeMany(["Hello world!", ""])
+            [['hello', 'world', 'hello_world'], []]
+        """
+        if self._scan_pattern is None:
+            return [self.tokenize(text, ignoreTrigrams=ignoreTrigrams) for text in texts]
+
+        scanWords = self._scan_words
+        generateNgrams = self._generate_ngrams
+        return [
+            generateNgrams(scanWords(text), ignoreTrigrams=ignoreTrigrams) if text and not text.isspace() else []
+            for text in texts
+        ]
+
+    def _compile_scan_pattern(self) -> "re.Pattern[str]":
+        """Build the fused pattern used by the single-pass tokenizer.
+
+        The pattern matches, at each position, either a fragment the multi-pass
+        pipeline would remove (URL, then mention) or a word. Words are runs of
+        word characters; with ``remove_emoji`` emoji characters and mentions are
+        part of the run (and stripped from it later), since removing them in the
+        multi-pass pipeline glues the surrounding characters together. With
+        ``remove_urls`` a word or mention ends where a URL starts, matching the
+        URL removal that runs first in the multi-pass pipeline.
+
+        Returns:
+            Compiled pattern with a single group, the word (empty when a
+            removed fragment matched).
+        """
+        cfg = self.config
+        urlGuard = f"(?!{_URL_START_REGEX})" if cfg.remove_urls else ""
+        wordChar = f"[\\w{_EMOJI_RANGES}]" if cfg.remove_emoji else r"\w"
+
+        mention = f"@(?:{urlGuard}\\w)+"
+        if cfg.remove_emoji and cfg.remove_mentions:
+            # A removed mention followed by a removed emoji glues its neighbours too
+            wordChar = f"(?:{wordChar}|{mention})"
+
+        alternatives = []
+        if cfg.remove_urls:
+            alternatives.append(_URL_REGEX)
+        if cfg.remove_mentions:
+            alternatives.append(mention)
+        alternatives.append(f"((?:{urlGuard}{wordChar})+)")
+        return re.compile("|".join(alternatives))
+
+    def _scan_words(self, text: str) -> List[str]:
+        """Extract and filter words in a single scan (single-pass mode).
+
+        Produces the same words as ``_filter_words(_extract_words(_preprocess_text(text)))``.
+        The scan yields the raw words; emoji, number and case normalization
+        then run once over the words joined with a separator instead of once
+        per word.
+
+        Args:
+            text: Raw text to scan.
+
+        Returns:
+            Interned, filtered words in text order.
+        """
+        cfg = self.config
+        # Removed fragments (URLs, mentions) come out as empty strings
+        words = [word for word in self._scan_pattern.findall(text) if word]  # type: ignore[union-attr]
+        if not words:
+            return []
+
+        if cfg.remove_emoji or cfg.remove_numbers or cfg.lowercase:
+            # NUL is neither a word character nor an emoji, so no pattern below crosses it
+            joined = "\0".join(words)
+            if cfg.remove_emoji:
+                if cfg.remove_mentions and "@" in joined:
+                    joined = self._mention_pattern.sub("", joined)
+                if not joined.isascii():
+                    joined = self._emoji_pattern.sub("", joined)
+            if cfg.remove_numbers:
+                joined = self._number_pattern.sub("", joined)
+            if cfg.lowercase:
+                lowered = joined.lower()
+                if len(lowered) != len(joined):
+                    # Rare case of lowercasing producing combining characters,
+                    # which split words the way extraction from lowercased text does
+                    lowered = "\0".join(self._word_pattern.findall(lowered))
+                joined = lowered
+            words = joined.split("\0")
+
+        minLength = cfg.min_token_length
+        maxLength = cfg.max_token_length
+        stopwords = cfg.getStopwords()
+        intern = sys.intern
+        if cfg.lowercase:
+            return [
+                intern(word) for word in words if word and minLength <= len(word) <= maxLength and word not in stopwords
+            ]
+        return [
+            intern(word)
+            for word in words
+            if word and minLength <= len(word) <= maxLength and word.lower() not in stopwords
+        ]
+
     def _preprocess_text(self, text: str) -> str:
         """Apply text preprocessing based on configuration.
 
@@ -395,15 +537,16 @@ class MessageTokenizer:
         """
         tokens = words.copy()  # Start with unigrams
 
+        # In single-pass mode n-grams are interned like the words they are built from
+        intern = sys.intern if self._scan_pattern is not None else str
+
         # Add bigrams if enabled
         if self.config.use_bigrams and len(words) > 1:
-            bigrams = [f"{words[i]}_{words[i + 1]}" for i in range(len(words) - 1)]
-            tokens.extend(bigrams)
+            tokens.extend(map(intern, map("{}_{}".format, words, words[1:])))
 
         # Add trigrams if enabled
         if self.config.use_trigrams and not ignoreTrigrams and len(words) > 2:
-            trigrams = [f"{words[i]}_{words[i + 1]}_{words[i + 2]}" for i in range(len(words) - 2)]
-            tokens.extend(trigrams)
+            tokens.extend(map(intern, map("{}_{}_{}".format, words, words[1:], words[2:])))
 
         return tokens
 
@@ -6,9 +6,12 @@ used across different domains while maintaining type safety and flexibility, doo
 
 Core Components:
 - CacheInterface: Abstract base class for all cache implementations
+- CacheEntry: Cached value with its freshness, for stale-while-revalidate and
+  stale-if-error reads via CacheInterface.getOrFetch()
 - KeyGenerator: Protocol for generating cache keys from objects
 - DictCache: Thread-safe dictionary-based cache implementation
 - NullCache: No-op cache for testing and debugging
+- SingleFlight / singleFlight: Coalescing of concurrent cache misses for the same key
 
 Example Usage:
     >>> from lib.cache import DictCache, StringKeyGenerator
@@ -34,9 +37,10 @@ from .interface import CacheInterface
 # Export key generators
 from .key_generator import HashKeyGenerator, JsonKeyGenerator, StringKeyGenerator
 from .null_cache import NullCache
+from .single_flight import SingleFlight, singleFlight
 
 # Export core types and interfaces
-from .types import K, KeyGenerator, T, V, ValueConverter
+from .types import CacheEntry, K, KeyGenerator, T, V, ValueConverter
 from .value_converter import JsonValueConverter, StringValueConverter
 
 __version__ = "0.1.0"
@@ -44,6 +48,7 @@ __author__ = "SourceCraft Code Assistant (Prinny Mode)"
 
 __all__ = [
     # Core types
+    "CacheEntry",
     "KeyGenerator",
     "ValueConverter",
     "K",
@@ -54,6 +59,9 @@ __all__ = [
     # Implementations
     "DictCache",
     "NullCache",
+    # Request coalescing
+    "SingleFlight",
+    "singleFlight",
     # Key generators
     "StringKeyGenerator",
     "HashKeyGenerator",
@@ -11,6 +11,8 @@ Features:
     - Configurable TTL for entries
     - Maximum size enforcement with eviction
     - Automatic cleanup of expired entries
+    - Stale entries kept past the TTL for getOrFetch() (stale-while-revalidate,
+      stale-if-error)
     - Cache statistics and monitoring
 
 Example:
@@ -33,7 +35,7 @@ from typing import Any, Dict, Optional, Tuple
 
 from .interface import CacheInterface
 from .key_generator import KeyGenerator
-from .types import K, V
+from .types import CacheEntry, K, V
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +64,9 @@ class DictCache(CacheInterface[K, V]):
         keyGenerator: KeyGenerator[K],
         defaultTtl: int = 3600,
         maxSize: Optional[int] = 1000,
+        *,
+        staleWhileRevalidate: int = 0,
+        staleIfError: int = 0,
     ):
         """Initialize cache with configuration, dood!
 
@@ -71,6 +76,11 @@ class DictCache(CacheInterface[K, V]):
                 0 = immediate expiration, negative = never expires
             maxSize: Maximum cache entries (default: 1000)
                 None = unlimited size
+            staleWhileRevalidate: Seconds past the TTL a stale entry is served
+                by getOrFetch() while refreshed in the background (default: 0)
+            staleIfError: Seconds past the TTL a stale entry is served by
+                getOrFetch() when fetching fails (default: 0). Expired entries
+                are kept for the longer of both windows (negative = forever)
 
         Raises:
             ValueError: If maxSize is not None and not positive
@@ -78,6 +88,8 @@ class DictCache(CacheInterface[K, V]):
         if maxSize is not None and maxSize <= 0:
             raise ValueError(f"maxSize must be a positive integer or None, got {maxSize}, dood!")
 
+        super().__init__(staleWhileRevalidate=staleWhileRevalidate, staleIfError=staleIfError)
+
         self._cache: Dict[str, Tuple[V, float]] = {}
         """Internal storage mapping string keys to (value, timestamp) tuples."""
         self._keyGenerator = keyGenerator
@@ -106,6 +118,25 @@ class DictCache(CacheInterface[K, V]):
             return False  # Never expired
         return time.time() - timestamp > ttl
 
+    def _retentionTtl(self, ttl: int) -> int:
+        """
+        Get how long entries are kept for the given TTL, dood!
+
+        Entries stay past their TTL for the longer of the stale windows so
+        that getOrFetch() can still serve them.
+
+        Args:
+            ttl: TTL in seconds (0 = always expired, negative = never expires)
+
+        Returns:
+            int: Retention in seconds, with the same special values as ttl
+        """
+        if ttl <= 0:
+            return ttl
+        if self.staleWhileRevalidate < 0 or self.staleIfError < 0:
+            return -1
+        return ttl + max(self.staleWhileRevalidate, self.staleIfError)
+
     def _cleanupExpired(self) -> None:
         """
         Remove all expired entries from the cache, dood!
@@ -114,9 +145,8 @@ class DictCache(CacheInterface[K, V]):
             - Must be called within lock context
             - Complexity: O(n) where n is cache size
         """
-        expiredKeys = [
-            key for key, (_, timestamp) in self._cache.items() if self._isExpired(timestamp, self._defaultTtl)
-        ]
+        retentionTtl = self._retentionTtl(self._defaultTtl)
+        expiredKeys = [key for key, (_, timestamp) in self._cache.items() if self._isExpired(timestamp, retentionTtl)]
         for key in expiredKeys:
             del self._cache[key]
 
@@ -174,18 +204,53 @@ class DictCache(CacheInterface[K, V]):
                     value, timestamp = self._cache[keyStr]
                     if not self._isExpired(timestamp, effectiveTtl):
                         logger.debug(f"Cache hit for key: {keyStr}, dood!")
+                        self.hits += 1
                         return value
-                    else:
+                    elif self._isExpired(timestamp, self._retentionTtl(effectiveTtl)):
                         # Remove expired entry
                         del self._cache[keyStr]
                         logger.debug(f"Removed expired entry: {keyStr}, dood!")
 
                 logger.debug(f"Cache miss for key: {keyStr}, dood!")
+                self.misses += 1
                 return None
         except Exception as e:
             logger.error(f"Failed to get cache entry: {e}, dood!")
             return None
 
+    async def getEntry(self, key: K, ttl: Optional[int] = None, maxStale: int = 0) -> Optional[CacheEntry[V]]:
+        """
+        Get cached entry with its freshness, dood!
+
+        Args:
+            key: Cache key to retrieve
+            ttl: Optional TTL override in seconds
+                None = use default, 0 = bypass the cache, negative = never expires
+            maxStale: How long past the TTL a stale entry is still returned
+                (0 = never, negative = no limit)
+
+        Returns:
+            Optional[CacheEntry[V]]: Fresh or stale entry, None if not found
+        """
+        effectiveTtl = ttl if ttl is not None else self._defaultTtl
+        if effectiveTtl == 0:
+            return None
+
+        with self._lock:
+            keyStr = self._keyGenerator.generateKey(key)
+            item = self._cache.get(keyStr)
+            if item is None:
+                return None
+
+            value, timestamp = item
+            if not self._isExpired(timestamp, effectiveTtl):
+                return CacheEntry(value)
+
+            staleFor = time.time() - timestamp - effectiveTtl
+            if maxStale < 0 or staleFor <= maxStale:
+                return CacheEntry(value, stale=True, staleFor=staleFor)
+            return None
+
     async def set(self, key: K, value: V) -> bool:
         """
         Store value in cache, dood!
@@ -241,6 +306,9 @@ class DictCache(CacheInterface[K, V]):
                 - maxSize (Optional[int]): Maximum cache size limit
                 - defaultTtl (int): Default TTL in seconds
                 - threadSafe (bool): Whether thread safety is enabled
+                - staleWhileRevalidate, staleIfError (int): Stale windows in seconds
+                - hits, misses, staleHits, staleOnError, refreshes,
+                  refreshErrors, refreshing (int): Lookup counters
         """
 
         with self._lock:
@@ -250,4 +318,7 @@ class DictCache(CacheInterface[K, V]):
                 "maxSize": self._maxSize,
                 "defaultTtl": self._defaultTtl,
                 "threadSafe": self._lock is not None,
+                "staleWhileRevalidate": self.staleWhileRevalidate,
+                "staleIfError": self.staleIfError,
+                **self.getCounters(),
             }
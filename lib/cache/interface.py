@@ -4,12 +4,24 @@ Abstract cache interface for lib.cache, dood!
 This module defines the generic CacheInterface that all cache implementations
 must follow. It provides a consistent API for different cache backends
 while maintaining type safety through Python generics, dood!
+
+Besides the abstract get/set/clear/getStats contract, the interface provides
+getOrFetch(): a read-through helper with soft and hard TTLs. An entry older
+than the TTL (soft) but within ``staleWhileRevalidate`` seconds past it is
+returned immediately while a background refresh is scheduled; an entry within
+``staleIfError`` seconds past the TTL (hard) is returned when the upstream
+fails, dood!
 """
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, Optional
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional
+
+from .single_flight import _freeze
+from .types import CacheEntry, K, V
 
-from .types import K, V
+logger = logging.getLogger(__name__)
 
 
 class CacheInterface(ABC, Generic[K, V]):
@@ -39,6 +51,37 @@ class CacheInterface(ABC, Generic[K, V]):
         >>> stats = cache.getStats()
     """
 
+    def __init__(self, *, staleWhileRevalidate: int = 0, staleIfError: int = 0) -> None:
+        """
+        Initialize stale-serving options and counters, dood!
+
+        Args:
+            staleWhileRevalidate: Default seconds past the TTL during which a
+                stale entry is served while it is refreshed in the background
+                (0 - disabled, negative - no limit)
+            staleIfError: Default seconds past the TTL during which a stale
+                entry is served when fetching a new value fails
+                (0 - disabled, negative - no limit)
+        """
+        self.staleWhileRevalidate: int = staleWhileRevalidate
+        """Default stale-while-revalidate window in seconds."""
+        self.staleIfError: int = staleIfError
+        """Default stale-if-error window in seconds."""
+        self.hits: int = 0
+        """Number of lookups answered with a fresh entry."""
+        self.misses: int = 0
+        """Number of lookups that found no usable entry."""
+        self.staleHits: int = 0
+        """Number of stale entries served while being revalidated."""
+        self.staleOnError: int = 0
+        """Number of stale entries served because the fetch failed."""
+        self.refreshes: int = 0
+        """Number of background refreshes that stored a new value."""
+        self.refreshErrors: int = 0
+        """Number of background refreshes that failed."""
+        self._refreshTasks: Dict[Hashable, "asyncio.Task[None]"] = {}
+        """Background refreshes in flight, by frozen key."""
+
     @abstractmethod
     async def get(self, key: K, ttl: Optional[int] = None) -> Optional[V]:
         """
@@ -131,3 +174,149 @@ class CacheInterface(ABC, Generic[K, V]):
             >>> print(f"Default TTL: {stats['defaultTtl']}s")
         """
         pass
+
+    async def getEntry(self, key: K, ttl: Optional[int] = None, maxStale: int = 0) -> Optional[CacheEntry[V]]:
+        """
+        Get cached entry with its freshness, dood!
+
+        Unlike get(), an entry past the TTL is still returned (marked stale) if
+        it went stale no more than maxStale seconds ago. The default
+        implementation has no access to entry ages and only returns fresh
+        entries via get(); caches keeping timestamps override it.
+
+        Args:
+            key: The cache key to retrieve
+            ttl: Optional soft TTL override in seconds (same meaning as in get())
+            maxStale: How long past the TTL a stale entry is still returned
+                (0 - never, negative - no limit)
+
+        Returns:
+            Optional[CacheEntry[V]]: Fresh or stale entry, None if not found
+        """
+        value = await self.get(key, ttl)
+        return CacheEntry(value) if value is not None else None
+
+    async def getOrFetch(
+        self,
+        key: K,
+        fetch: Callable[[], Awaitable[Optional[V]]],
+        ttl: Optional[int] = None,
+        *,
+        staleWhileRevalidate: Optional[int] = None,
+        staleIfError: Optional[int] = None,
+    ) -> Optional[V]:
+        """
+        Get cached value or fetch and store it, serving stale values when allowed, dood!
+
+        - Fresh entry: returned as is.
+        - Stale entry within staleWhileRevalidate: returned immediately, a
+          background refresh is scheduled (one per key at a time).
+        - Otherwise fetch() is awaited and its result stored. If it returns
+          None or raises, a stale entry within staleIfError is returned
+          instead; without one the None (or the exception) is passed on.
+
+        Cache errors are logged and treated as misses, they never prevent the
+        fetch.
+
+        Args:
+            key: The cache key
+            fetch: Coroutine function fetching a fresh value, returning None on failure
+            ttl: Optional soft TTL override in seconds (same meaning as in get())
+            staleWhileRevalidate: Override of the cache's stale-while-revalidate window
+            staleIfError: Override of the cache's stale-if-error window
+
+        Returns:
+            Optional[V]: Cached, fetched or stale value, None if none is available
+        """
+        if staleWhileRevalidate is None:
+            staleWhileRevalidate = self.staleWhileRevalidate
+        if staleIfError is None:
+            staleIfError = self.staleIfError
+        maxStale = -1 if staleWhileRevalidate < 0 or staleIfError < 0 else max(staleWhileRevalidate, staleIfError)
+
+        entry: Optional[CacheEntry[V]] = None
+        try:
+            entry = await self.getEntry(key, ttl, maxStale)
+        except Exception as e:
+            logger.warning(f"Cache error for {key}: {e}, dood!")
+
+        if entry is not None:
+            if not entry.stale:
+                self.hits += 1
+                return entry.value
+            if _withinWindow(entry, staleWhileRevalidate):
+                self.staleHits += 1
+                self._scheduleRefresh(key, fetch)
+                return entry.value
+
+        self.misses += 1
+        try:
+            value = await fetch()
+        except Exception as e:
+            if entry is not None and _withinWindow(entry, staleIfError):
+                logger.warning(f"Fetch failed for {key}: {e}, serving stale value, dood!")
+                self.staleOnError += 1
+                return entry.value
+            raise
+
+        if value is None:
+            if entry is not None and _withinWindow(entry, staleIfError):
+                logger.warning(f"Fetch returned nothing for {key}, serving stale value, dood!")
+                self.staleOnError += 1
+                return entry.value
+            return None
+
+        await self._store(key, value)
+        return value
+
+    def _scheduleRefresh(self, key: K, fetch: Callable[[], Awaitable[Optional[V]]]) -> None:
+        """Start a background refresh for the key unless one is already running."""
+        refreshKey = _freeze(key)
+        if refreshKey in self._refreshTasks:
+            return
+        task = asyncio.ensure_future(self._refresh(key, fetch))
+        self._refreshTasks[refreshKey] = task
+        task.add_done_callback(lambda _: self._refreshTasks.pop(refreshKey, None))
+
+    async def _refresh(self, key: K, fetch: Callable[[], Awaitable[Optional[V]]]) -> None:
+        """Fetch a new value for the key and store it; failures keep the stale entry."""
+        try:
+            value = await fetch()
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {key}: {e}, dood!")
+            value = None
+        if value is None:
+            self.refreshErrors += 1
+            return
+        await self._store(key, value)
+        self.refreshes += 1
+
+    async def _store(self, key: K, value: V) -> None:
+        """Store a fetched value, logging (not raising) cache errors."""
+        try:
+            await self.set(key, value)
+        except Exception as e:
+            logger.warning(f"Failed to cache value for {key}: {e}, dood!")
+
+    def getCounters(self) -> Dict[str, int]:
+        """
+        Get lookup counters to include in getStats(), dood!
+
+        Returns:
+            Dict[str, int]: ``hits``, ``misses``, ``staleHits``, ``staleOnError``,
+            ``refreshes``, ``refreshErrors`` and ``refreshing`` (refreshes in flight)
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "staleHits": self.staleHits,
+            "staleOnError": self.staleOnError,
+            "refreshes": self.refreshes,
+            "refreshErrors": self.refreshErrors,
+            "refreshing": len(self._refreshTasks),
+        }
+
+
+def _withinWindow(entry: CacheEntry[Any], window: int) -> bool:
+    """Check whether a stale entry may be served within the window (0 - never, negative - no limit)."""
+    return window < 0 or (window > 0 and entry.staleFor <= window)
@@ -0,0 +1,167 @@
+"""
+Single-flight request coalescing for cache misses, dood!
+
+When many callers miss the cache for the same key at once, each of them would
+fire its own identical fetch (through the rate limiter, the network, the
+database...). SingleFlight makes concurrent calls for the same key share one
+in-flight fetch: the first caller starts it, everyone else awaits its result,
+and errors are propagated to all of them, dood!
+
+Example:
+    >>> from lib.cache import singleFlight
+    >>>
+    >>> class WeatherClient:
+    ...     @singleFlight()
+    ...     async def getWeather(self, lat: float, lon: float) -> dict:
+    ...         cached = await self.cache.get(f"{lat},{lon}")
+    ...         if cached:
+    ...             return cached
+    ...         return await self._fetchAndCache(lat, lon)
+"""
+
+import asyncio
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, Optional, ParamSpec, TypeVar
+
+R = TypeVar("R")
+P = ParamSpec("P")
+
+
+class SingleFlight(Generic[R]):
+    """
+    Group of in-flight loads keyed by a hashable key, dood!
+
+    Each load runs as its own task, so a caller being cancelled (or timing out
+    on its own) never cancels the load other callers are waiting for. The load
+    timeout, if any, applies to the load itself: when it expires, the load is
+    cancelled and every waiter gets TimeoutError.
+
+    Not thread-safe: it is used from the event loop thread only.
+
+    Attributes:
+        timeout: Default load timeout in seconds (None - no timeout)
+        loads: Number of loads started
+        coalesced: Number of calls that joined an in-flight load
+    """
+
+    __slots__ = ("timeout", "loads", "coalesced", "_flights")
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        """
+        Initialize the group, dood!
+
+        Args:
+            timeout: Default load timeout in seconds (None - no timeout)
+        """
+        self.timeout: Optional[float] = timeout
+        self.loads: int = 0
+        self.coalesced: int = 0
+        self._flights: Dict[Hashable, asyncio.Future[R]] = {}
+
+    @property
+    def inFlight(self) -> int:
+        """Number of loads currently running."""
+        return len(self._flights)
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[R]], timeout: Optional[float] = None) -> R:
+        """
+        Run loader for the key, or join the load already running for it, dood!
+
+        Args:
+            key: Hashable key identifying the load
+            loader: Coroutine function performing the load, called only if
+                no load is in flight for the key
+            timeout: Load timeout in seconds for this key, overrides the
+                group default (only used when a new load is started)
+
+        Returns:
+            The result of the shared load
+
+        Raises:
+            TimeoutError: If the load did not finish within the timeout
+            Exception: Whatever the loader raised
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            self.loads += 1
+            if timeout is None:
+                timeout = self.timeout
+            coro = loader() if timeout is None else asyncio.wait_for(loader(), timeout)
+            flight = asyncio.ensure_future(coro)
+            self._flights[key] = flight
+            flight.add_done_callback(functools.partial(self._onDone, key))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(flight)
+
+    def _onDone(self, key: Hashable, flight: "asyncio.Future[R]") -> None:
+        """Forget the finished load; later calls start a new one."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            # Mark the exception as retrieved even if every waiter went away
+            flight.exception()
+
+    def getStats(self) -> Dict[str, int]:
+        """
+        Get coalescing statistics, dood!
+
+        Returns:
+            Dict with ``loads``, ``coalesced`` and ``inFlight`` counters
+        """
+        return {"loads": self.loads, "coalesced": self.coalesced, "inFlight": self.inFlight}
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert call arguments into a hashable key (lists and dicts become tuples)."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in sorted(value.items(), key=lambda item: repr(item[0])))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def singleFlight(
+    keyFunc: Optional[Callable[..., Hashable]] = None,
+    *,
+    timeout: Optional[float] = None,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """
+    Decorator coalescing concurrent calls of an async function with equal arguments, dood!
+
+    By default the key is built from all bound arguments (``self`` included,
+    so every instance has its own loads); lists and dicts are converted to
+    tuples. Pass keyFunc, called with the same arguments as the function, to
+    build the key yourself. The SingleFlight group is exposed as the
+    ``singleFlight`` attribute of the wrapper.
+
+    Args:
+        keyFunc: Optional function building a hashable key from the call arguments
+        timeout: Load timeout in seconds (None - no timeout)
+
+    Returns:
+        Decorator for async functions and methods
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        group: SingleFlight[R] = SingleFlight(timeout=timeout)
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if keyFunc is not None:
+                key = keyFunc(*args, **kwargs)
+            else:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = _freeze(bound.arguments)
+            return await group.do(key, lambda: func(*args, **kwargs))
+
+        setattr(wrapper, "singleFlight", group)
+        return wrapper
+
+    return decorator
@@ -6,7 +6,8 @@ used throughout the cache library, providing type safety and
 extensibility for different cache implementations, dood!
 """
 
-from typing import Protocol, TypeVar
+from dataclasses import dataclass
+from typing import Generic, Protocol, TypeVar
 
 # Type variables for generic cache operations, dood!
 K = TypeVar("K")  # Key type - can be any hashable type
@@ -14,6 +15,26 @@ V = TypeVar("V")  # Value type - can be any type
 T = TypeVar("T", contravariant=True)  # Generic object type for key generators
 
 
+@dataclass(slots=True, frozen=True)
+class CacheEntry(Generic[V]):
+    """
+    Cached value together with its freshness, dood!
+
+    Returned by CacheInterface.getEntry(). A fresh entry is younger than the
+    soft TTL; a stale one is past it but still kept by the cache, so it can be
+    served while the value is being refreshed or when the upstream fails.
+
+    Attributes:
+        value: The cached value
+        stale: Whether the entry is past its soft TTL
+        staleFor: Seconds since the entry went stale (0.0 for fresh entries)
+    """
+
+    value: V
+    stale: bool = False
+    staleFor: float = 0.0
+
+
 class KeyGenerator(Protocol[T]):
     """
     Protocol for generating cache keys from objects, dood!
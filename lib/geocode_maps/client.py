@@ -42,7 +42,8 @@ from typing import Any, Dict, List, Optional, cast
 
 import httpx
 
-from lib.cache import CacheInterface, NullCache
+from lib.cache import CacheInterface, NullCache, singleFlight
+from lib.http_client import HttpClientRegistry
 from lib.proxy import ProxyConfig, ProxyType
 from lib.rate_limiter import RateLimiterManager
 
@@ -168,6 +169,7 @@ class GeocodeMapsClient:
         )
         self._rateLimiter = RateLimiterManager.getInstance()
 
+    @singleFlight()
     async def search(
         self,
         query: str,
@@ -222,15 +224,6 @@ class GeocodeMapsClient:
         # logger.debug(cacheKey)
         cacheKey.pop("self", None)
 
-        # Check cache first
-        try:
-            cachedData = await self.searchCache.get(cacheKey, self.searchTTL)
-            if cachedData:
-                logger.debug(f"Cache hit for search: {cacheKey}")
-                return cachedData
-        except Exception as e:
-            logger.warning(f"Cache error for search {cacheKey}: {e}")
-
         # Build params dict
         params = {
             "q": query,
@@ -251,22 +244,13 @@ class GeocodeMapsClient:
         if acceptLanguage:
             params["accept-language"] = acceptLanguage
 
-        # Make API request
-        result = await self._makeRequest("search", params)
-        if result is None:
-            return None
-
-        # Cast to SearchResponse (List[SearchResult])
-        searchResult = cast(SearchResponse, result)
-
-        # Store in cache
-        try:
-            await self.searchCache.set(cacheKey, searchResult)
-        except Exception as e:
-            logger.warning(f"Cache set error for search {cacheKey}: {e}")
+        async def fetch() -> Optional[SearchResponse]:
+            return cast(Optional[SearchResponse], await self._makeRequest("search", params))
 
-        return searchResult
+        # Make API request unless cached (stale results may be served per cache settings)
+        return await self.searchCache.getOrFetch(cacheKey, fetch, self.searchTTL)
 
+    @singleFlight()
     async def reverse(
         self,
         lat: float,
@@ -309,15 +293,6 @@ class GeocodeMapsClient:
         cacheKey = locals().copy()
         cacheKey.pop("self", None)
 
-        # Check cache first
-        try:
-            cachedData = await self.reverseCache.get(cacheKey, self.reverseTTL)
-            if cachedData:
-                logger.debug(f"Cache hit for reverse: {cacheKey}")
-                return cachedData
-        except Exception as e:
-            logger.warning(f"Cache error for reverse {cacheKey}: {e}")
-
         # Build params dict
         params = {
             "lat": lat,  # Use original coordinates for API call
@@ -333,23 +308,13 @@ class GeocodeMapsClient:
         if acceptLanguage:
             params["accept-language"] = acceptLanguage
 
-        # Make API request
-        result = await self._makeRequest("reverse", params)
-        if result is None:
-            return None
-
-        # Cast result to proper type for cache storage
-        reverseResult = cast(ReverseResponse, result)
-
-        # Store in cache
-        try:
-            await self.reverseCache.set(cacheKey, reverseResult)
-        except Exception as e:
-            logger.warning(f"Cache set error for reverse {cacheKey}: {e}")
+        async def fetch() -> Optional[ReverseResponse]:
+            return cast(Optional[ReverseResponse], await self._makeRequest("reverse", params))
 
-        # Return result as ReverseResponse
-        return reverseResult
+        # Make API request unless cached (stale results may be served per cache settings)
+        return await self.reverseCache.getOrFetch(cacheKey, fetch, self.reverseTTL)
 
+    @singleFlight()
     async def lookup(
         self,
         osmIds: List[str],
@@ -399,15 +364,6 @@ class GeocodeMapsClient:
         cacheKey = locals().copy()
         cacheKey.pop("self", None)
 
-        # Check cache first
-        try:
-            cachedData = await self.lookupCache.get(cacheKey, self.lookupTTL)
-            if cachedData:
-                logger.debug(f"Cache hit for lookup: {cacheKey}")
-                return cachedData
-        except Exception as e:
-            logger.warning(f"Cache error for lookup {cacheKey}: {e}")
-
         # Build params dict
         params = {
             "osm_ids": ",".join(osmIds),
@@ -422,22 +378,11 @@ class GeocodeMapsClient:
         if acceptLanguage:
             params["accept-language"] = acceptLanguage
 
-        # Make API request
-        result = await self._makeRequest("lookup", params)
-        if result is None:
-            return None
-
-        # Cast result to proper type for cache storage
-        lookupResult = cast(LookupResponse, result)
-
-        # Store in cache
-        try:
-            await self.lookupCache.set(cacheKey, lookupResult)
-        except Exception as e:
-            logger.warning(f"Cache set error for lookup {cacheKey}: {e}")
+        async def fetch() -> Optional[LookupResponse]:
+            return cast(Optional[LookupResponse], await self._makeRequest("lookup", params))
 
-        # Return result as LookupResponse
-        return lookupResult
+        # Make API request unless cached (stale results may be served per cache settings)
+        return await self.lookupCache.getOrFetch(cacheKey, fetch, self.lookupTTL)
 
     async def _makeRequest(
         self,
@@ -483,36 +428,36 @@ class GeocodeMapsClient:
             # Apply rate limiting
             await self._rateLimiter.applyLimit(self.rateLimiterQueue)
 
-            # Create new session for each request
-            async with httpx.AsyncClient(**self._proxyConfig.toKwargs(), timeout=self.requestTimeout) as session:
-                response = await session.get(url, params=params, headers=headers)
+            # Shared pooled client: keep-alive connections are reused across requests
+            session = HttpClientRegistry.getInstance().getClient(self._proxyConfig)
+            response = await session.get(url, params=params, headers=headers, timeout=self.requestTimeout)
 
-                if response.status_code == 200:
-                    data = response.json()
-                    logger.debug(f"API request successful: {response.status_code}")
-                    logger.debug(f"API response: {data}")
-                    return data
+            if response.status_code == 200:
+                data = response.json()
+                logger.debug(f"API request successful: {response.status_code}")
+                logger.debug(f"API response: {data}")
+                return data
 
-                elif response.status_code == 401:
-                    logger.error("Invalid API key")
-                    return None
+            elif response.status_code == 401:
+                logger.error("Invalid API key")
+                return None
 
-                elif response.status_code == 404:
-                    logger.warning("Location not found")
-                    return None
+            elif response.status_code == 404:
+                logger.warning("Location not found")
+                return None
 
-                elif response.status_code == 429:
-                    logger.error("Rate limit exceeded")
-                    return None
+            elif response.status_code == 429:
+                logger.error("Rate limit exceeded")
+                return None
 
-                elif response.status_code >= 500:
-                    logger.error(f"Server error: {response.status_code}")
-                    return None
+            elif response.status_code >= 500:
+                logger.error(f"Server error: {response.status_code}")
+                return None
 
-                else:
-                    logger.error(f"API request failed: {response.status_code}")
-                    logger.error(f"Response text: {response.text}")
-                    return None
+            else:
+                logger.error(f"API request failed: {response.status_code}")
+                logger.error(f"Response text: {response.text}")
+                return None
 
         except httpx.TimeoutException:
             logger.error("Request timeout")
@@ -0,0 +1,28 @@
+"""
+Shared HTTP clients
+
+This library provides a process-wide registry of pooled ``httpx.AsyncClient``
+instances keyed by proxy route, so external API clients reuse keep-alive
+connections instead of opening a new client for every request.
+
+Example:
+    >>> from lib.http_client import HttpClientRegistry
+    >>>
+    >>> registry = HttpClientRegistry.getInstance()
+    >>> registry.configure(configManager.getHttpClientConfig())
+    >>>
+    >>> client = registry.getClient(proxyConfig)
+    >>> response = await client.get("https://api.example.com/", timeout=10.0)
+    >>>
+    >>> # On shutdown
+    >>> await registry.aclose()
+"""
+
+from .registry import HttpClientRegistry, HttpClientRegistryStats
+from .transport import HostLimitedTransport
+
+__all__ = [
+    "HttpClientRegistry",
+    "HttpClientRegistryStats",
+    "HostLimitedTransport",
+]
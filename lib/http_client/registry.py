@@ -0,0 +1,268 @@
+"""Process-wide registry of shared pooled httpx clients.
+
+External API clients (OpenWeatherMap, Geocode Maps, Yandex Search, ...) used
+to open a new ``httpx.AsyncClient`` for every request, paying for DNS, TCP and
+TLS handshakes each time. The registry keeps one long-lived client per
+resolved proxy route instead, so keep-alive connections (and HTTP/2 streams
+where available) are reused across requests and across API clients.
+
+Clients are created lazily through ``httpx.AsyncClient`` and must not be
+closed by callers; :meth:`HttpClientRegistry.aclose` closes all of them on
+shutdown.
+"""
+
+import logging
+from threading import Lock
+from typing import Any, Dict, Optional, TypedDict
+
+import httpx
+
+from lib.proxy import ProxyConfig
+
+from .transport import HostLimitedTransport
+
+try:
+    import h2  # noqa: F401  # pyright: ignore[reportMissingImports]
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30.0
+"""Default total request timeout in seconds (callers usually pass their own)."""
+DEFAULT_CONNECT_TIMEOUT = 10.0
+"""Default connect timeout in seconds."""
+DEFAULT_MAX_CONNECTIONS = 100
+"""Default maximum number of connections per client."""
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+"""Default maximum number of idle keep-alive connections per client."""
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+"""Default maximum number of concurrent requests per remote host (0 - unlimited)."""
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+"""Default idle time in seconds after which keep-alive connections are closed."""
+
+_CONNECTION_OPENED_EVENT = "connection.connect_tcp.complete"
+"""httpcore trace event emitted when a new TCP connection is established."""
+
+
+class HttpClientRegistryStats(TypedDict):
+    """Counters reported by :meth:`HttpClientRegistry.getStats`.
+
+    Attributes:
+        clients: Number of live pooled clients
+        hits: getClient() calls served by an existing client
+        misses: getClient() calls that had to create a client
+        requests: Requests sent through pooled clients (redirects included)
+        newConnections: Requests that had to open a new connection
+        reusedConnections: Requests served over an already open connection
+    """
+
+    clients: int
+    hits: int
+    misses: int
+    requests: int
+    newConnections: int
+    reusedConnections: int
+
+
+class _PooledClient:
+    """A shared client together with its request and connection counters."""
+
+    __slots__ = ("client", "requests", "newConnections")
+
+    def __init__(self) -> None:
+        self.client: Optional[httpx.AsyncClient] = None
+        self.requests: int = 0
+        self.newConnections: int = 0
+
+    async def onRequest(self, request: httpx.Request) -> None:
+        """httpx request hook: count the request and trace its connection."""
+        self.requests += 1
+        request.extensions["trace"] = self.onTrace
+
+    async def onTrace(self, eventName: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback: count newly opened connections."""
+        if eventName == _CONNECTION_OPENED_EVENT:
+            self.newConnections += 1
+
+
+class HttpClientRegistry:
+    """Singleton holding one shared ``httpx.AsyncClient`` per proxy route.
+
+    Clients are keyed by the resolved proxy URL (after merging with the
+    global proxy config), so every service going through the same proxy, or
+    going direct, shares one connection pool.
+
+    Usage:
+        >>> client = HttpClientRegistry.getInstance().getClient(proxyConfig)
+        >>> response = await client.get(url, params=params, timeout=10.0)
+    """
+
+    _instance: Optional["HttpClientRegistry"] = None
+    """The singleton instance, or None if not yet created."""
+
+    _lock = Lock()
+    """Thread lock protecting singleton initialization."""
+
+    def __new__(cls) -> "HttpClientRegistry":
+        """Create or return the singleton instance.
+
+        Returns:
+            The singleton HttpClientRegistry instance.
+        """
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
+
+    @classmethod
+    def getInstance(cls) -> "HttpClientRegistry":
+        """Get or create the singleton HttpClientRegistry instance.
+
+        Returns:
+            The singleton HttpClientRegistry instance.
+        """
+        if cls._instance is None:
+            return cls()
+        return cls._instance
+
+    def __init__(self) -> None:
+        """Initialize the registry with default pool settings.
+
+        Only the first call executes; subsequent calls are guarded by the
+        hasattr(self, 'initialized') sentinel.
+        """
+        if hasattr(self, "initialized"):
+            return
+        self.initialized = True
+
+        self.http2: bool = _HTTP2_AVAILABLE
+        """Whether to negotiate HTTP/2 on direct and HTTP-proxied connections."""
+        self.timeout: httpx.Timeout = httpx.Timeout(DEFAULT_TIMEOUT, connect=DEFAULT_CONNECT_TIMEOUT)
+        """Default timeout of pooled clients, used when a request passes none."""
+        self.limits: httpx.Limits = httpx.Limits(
+            max_connections=DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+        )
+        """Connection pool limits of every pooled client."""
+        self.maxConnectionsPerHost: int = DEFAULT_MAX_CONNECTIONS_PER_HOST
+        """Maximum number of concurrent requests per remote host (0 - unlimited)."""
+
+        self._clients: Dict[str, _PooledClient] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def configure(self, config: Dict[str, Any]) -> None:
+        """Apply the [http-client] config section.
+
+        Settings only affect clients created afterwards, so this should be
+        called at startup before any client is requested.
+
+        Args:
+            config: Config dict with optional ``http2``, ``timeout``,
+                ``connect-timeout``, ``max-connections``,
+                ``max-keepalive-connections``, ``keepalive-expiry`` and
+                ``max-connections-per-host`` keys.
+        """
+        self.http2 = bool(config.get("http2", True)) and _HTTP2_AVAILABLE
+        self.timeout = httpx.Timeout(
+            float(config.get("timeout", DEFAULT_TIMEOUT)),
+            connect=float(config.get("connect-timeout", DEFAULT_CONNECT_TIMEOUT)),
+        )
+        self.limits = httpx.Limits(
+            max_connections=int(config.get("max-connections", DEFAULT_MAX_CONNECTIONS)),
+            max_keepalive_connections=int(config.get("max-keepalive-connections", DEFAULT_MAX_KEEPALIVE_CONNECTIONS)),
+            keepalive_expiry=float(config.get("keepalive-expiry", DEFAULT_KEEPALIVE_EXPIRY)),
+        )
+        self.maxConnectionsPerHost = int(config.get("max-connections-per-host", DEFAULT_MAX_CONNECTIONS_PER_HOST))
+        logger.info(
+            f"HTTP client pool configured: http2={self.http2}, limits={self.limits}, "
+            f"maxConnectionsPerHost={self.maxConnectionsPerHost}"
+        )
+
+    def getClient(self, proxyConfig: Optional[ProxyConfig] = None) -> httpx.AsyncClient:
+        """Get the shared client for the given proxy route, creating it if needed.
+
+        The returned client must not be closed by the caller. Pass per-request
+        ``timeout=`` to override the pool default timeout.
+
+        Args:
+            proxyConfig: Service proxy config (merged with the global one);
+                None means a direct connection.
+
+        Returns:
+            The shared httpx.AsyncClient for this route.
+
+        Raises:
+            ImportError: If the route is a SOCKS5 proxy and httpx-socks is not installed.
+        """
+        key = (proxyConfig.getProxyURL() if proxyConfig is not None else None) or ""
+        pooled = self._clients.get(key)
+        if pooled is not None and pooled.client is not None and not pooled.client.is_closed:
+            self._hits += 1
+            return pooled.client
+
+        self._misses += 1
+        pooled = _PooledClient()
+        pooled.client = self._createClient(proxyConfig, pooled)
+        self._clients[key] = pooled
+        return pooled.client
+
+    def _createClient(self, proxyConfig: Optional[ProxyConfig], pooled: _PooledClient) -> httpx.AsyncClient:
+        """Create a pooled client for the given proxy route."""
+        if proxyConfig is not None:
+            transport = proxyConfig.toTransport(http2=self.http2, limits=self.limits)
+        else:
+            transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=self.limits)
+        if self.maxConnectionsPerHost > 0:
+            transport = HostLimitedTransport(transport, self.maxConnectionsPerHost)
+
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=self.timeout,
+            event_hooks={"request": [pooled.onRequest]},
+        )
+
+    def getStats(self) -> HttpClientRegistryStats:
+        """Get pool usage counters.
+
+        Connection reuse is measured with httpcore tracing, so requests
+        through transports that do not emit trace events (e.g. SOCKS5) are
+        counted as reused.
+
+        Returns:
+            Current counters, see :class:`HttpClientRegistryStats`.
+        """
+        requests = sum(pooled.requests for pooled in self._clients.values())
+        newConnections = sum(pooled.newConnections for pooled in self._clients.values())
+        return {
+            "clients": sum(
+                1 for pooled in self._clients.values() if pooled.client is not None and not pooled.client.is_closed
+            ),
+            "hits": self._hits,
+            "misses": self._misses,
+            "requests": requests,
+            "newConnections": newConnections,
+            "reusedConnections": max(requests - newConnections, 0),
+        }
+
+    async def aclose(self) -> None:
+        """Close all pooled clients.
+
+        The registry stays usable: later getClient() calls create new clients.
+        """
+        clients = self._clients
+        self._clients = {}
+        for pooled in clients.values():
+            if pooled.client is None:
+                continue
+            try:
+                await pooled.client.aclose()
+            except Exception as e:
+                logger.error(f"Error closing pooled HTTP client: {e}")
+        if clients:
+            logger.info(f"Closed {len(clients)} pooled HTTP client(s)")
@@ -0,0 +1,88 @@
+"""Transport wrappers for shared HTTP clients.
+
+Provides :class:`HostLimitedTransport`, which caps the number of concurrent
+requests (and therefore open connections) per remote host on top of the
+pool-wide limits of the wrapped httpx transport.
+"""
+
+import asyncio
+from typing import AsyncIterator, Callable, Dict, Tuple
+
+import httpx
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that releases a host slot once the body is closed."""
+
+    __slots__ = ("_stream", "_release", "_released")
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport limiting concurrent requests per (scheme, host, port).
+
+    A slot is taken before the request is sent and given back when the
+    response body is closed, so streamed responses keep their slot until
+    they are fully consumed.
+
+    Attributes:
+        maxPerHost: Maximum number of concurrent requests per host
+    """
+
+    __slots__ = ("maxPerHost", "_transport", "_semaphores")
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, maxPerHost: int) -> None:
+        """Initialize the transport.
+
+        Args:
+            transport: The pooled transport doing the actual work
+            maxPerHost: Maximum number of concurrent requests per host
+        """
+        self.maxPerHost: int = maxPerHost
+        self._transport: httpx.AsyncBaseTransport = transport
+        self._semaphores: Dict[Tuple[str, str, int | None], asyncio.Semaphore] = {}
+
+    def _getSemaphore(self, url: httpx.URL) -> asyncio.Semaphore:
+        """Get or create the semaphore guarding the host of the given URL."""
+        key = (url.scheme, url.host, url.port)
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.maxPerHost)
+            self._semaphores[key] = semaphore
+        return semaphore
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._getSemaphore(request.url)
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, semaphore.release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
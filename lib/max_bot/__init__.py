@@ -26,6 +26,7 @@ from .constants import (
     ButtonType,
     TextFormat,
 )
+from .dispatcher import UpdateDispatcher
 from .exceptions import (
     APIError,
     AttachmentNotReadyError,
@@ -45,6 +46,7 @@ from .utils import messageLinkToMessage
 __all__ = [
     # Main client
     "MaxBotClient",
+    "UpdateDispatcher",
     # Constants
     "MAX_RETRIES",
     "MAX_MESSAGE_LENGTH",
@@ -6,7 +6,6 @@ the Max Messenger Bot API using httpx with proper authentication and error handl
 """
 
 import asyncio
-import inspect
 import logging
 import types
 from collections.abc import Awaitable
@@ -23,6 +22,8 @@ from lib.proxy import ProxyConfig, ProxyType
 from .constants import (
     API_BASE_URL,
     CONTENT_TYPE_JSON,
+    DEFAULT_MAX_CONCURRENT_UPDATES,
+    DEFAULT_MAX_PENDING_UPDATES,
     DEFAULT_TIMEOUT,
     HTTP_DELETE,
     HTTP_GET,
@@ -33,6 +34,7 @@ from .constants import (
     RETRY_BACKOFF_FACTOR,
     VERSION,
 )
+from .dispatcher import UpdateDispatcher, callErrorHandler
 from .exceptions import (
     AttachmentNotReadyError,
     AuthenticationError,
@@ -114,6 +116,7 @@ class MaxBotClient:
         "_httpClient",
         "_pollingTask",
         "_isPolling",
+        "_dispatcher",
         "_myInfo",
         "_proxyConfig",
     )
@@ -153,6 +156,7 @@ class MaxBotClient:
         self._httpClient: Optional[httpx.AsyncClient] = None
         self._pollingTask: Optional[asyncio.Task] = None
         self._isPolling = False
+        self._dispatcher: Optional[UpdateDispatcher] = None
         self._myInfo: Optional[BotInfo] = None
         self._proxyConfig: ProxyConfig = (
             proxyConfig if proxyConfig is not None else ProxyConfig(proxyType=ProxyType.NONE)
@@ -1243,17 +1247,25 @@ class MaxBotClient:
         types: Optional[List[str]] = None,
         timeout: int = 30,
         errorHandler: Optional[Callable[[Exception], Union[None, Awaitable[None]]]] = None,
+        *,
+        maxConcurrency: int = DEFAULT_MAX_CONCURRENT_UPDATES,
+        maxPendingUpdates: int = DEFAULT_MAX_PENDING_UPDATES,
     ) -> None:
         """Start continuous polling loop.
 
         Starts a background task that continuously polls for updates and calls the handler
-        for each update received.
+        for each update received. Updates are handed to an UpdateDispatcher: updates of
+        one chat are handled in order, different chats concurrently, and the next batch
+        is requested while the handlers still run.
 
         Args:
             handler: Function to call for each update received
             types: List of update types to receive (optional)
             timeout: Timeout for each polling request (default: 30)
             errorHandler: Function to call when an error occurs (optional)
+            maxConcurrency: Maximum number of updates handled at once across all chats
+            maxPendingUpdates: Maximum number of received but not handled updates,
+                polling pauses when it is reached
 
         Raises:
             MaxBotError: If polling is already started
@@ -1270,13 +1282,20 @@ class MaxBotClient:
             raise MaxBotError("Polling is already started")
 
         self._isPolling = True
-        self._pollingTask = asyncio.create_task(self._pollingLoop(handler, types, timeout, errorHandler))
+        self._dispatcher = UpdateDispatcher(
+            handler,
+            errorHandler,
+            maxConcurrency=maxConcurrency,
+            maxPending=maxPendingUpdates,
+        )
+        self._pollingTask = asyncio.create_task(self._pollingLoop(self._dispatcher, types, timeout, errorHandler))
         logger.info("Started polling for updates")
 
     async def stopPolling(self) -> None:
         """Stop the polling loop.
 
-        Stops the background polling task gracefully.
+        Stops the background polling task gracefully and waits for the already
+        received updates to be handled.
 
         Example:
             >>> async with MaxBotClient("token") as client:
@@ -1296,22 +1315,39 @@ class MaxBotClient:
             except asyncio.CancelledError:
                 pass
 
+        if self._dispatcher is not None:
+            await self._dispatcher.join()
+
         logger.info("Stopped polling for updates")
 
+    def getPollingStats(self) -> Dict[str, Any]:
+        """Get update dispatching metrics of the polling loop.
+
+        Returns:
+            UpdateDispatcher.getStats() of the current (or last) polling loop,
+            including intake lag (seconds from the update timestamp to the
+            handler start); empty dict if polling was never started
+        """
+        if self._dispatcher is None:
+            return {}
+        return self._dispatcher.getStats()
+
     async def _pollingLoop(
         self,
-        handler: Callable[[Update], Union[None, Awaitable[None]]],
+        dispatcher: UpdateDispatcher,
         types: Optional[List[str]],
         timeout: int,
         errorHandler: Optional[Callable[[Exception], Union[None, Awaitable[None]]]],
     ) -> None:
         """Internal polling loop that runs in background.
 
-        Continuously polls for updates and calls the handler for each update received.
-        Handles errors and retries automatically.
+        Continuously polls for updates and passes them to the dispatcher. The
+        dispatcher returns right after queueing, so the next long poll starts
+        while the handlers of the previous batch still run. Handles errors and
+        retries automatically.
 
         Args:
-            handler: Function to call for each update received
+            dispatcher: Dispatcher handing updates to the handler
             types: List of update types to receive (optional)
             timeout: Timeout for each polling request in seconds
             errorHandler: Function to call when an error occurs (optional)
@@ -1326,24 +1362,7 @@ class MaxBotClient:
                     for update in updates.updates:
                         if not self._isPolling:
                             break
-
-                        try:
-                            if inspect.iscoroutinefunction(handler):
-                                await handler(update)
-                            else:
-                                handler(update)
-                        except Exception as e:
-                            logger.error(f"Error in update handler: {e}")
-                            if errorHandler:
-                                try:
-                                    if inspect.iscoroutinefunction(errorHandler):
-                                        result = errorHandler(e)
-                                        if result is not None:
-                                            await result
-                                    else:
-                                        errorHandler(e)
-                                except Exception as handler_error:
-                                    logger.error(f"Error in error handler: {handler_error}")
+                        await dispatcher.dispatch(update)
 
                 # Update marker for next request
                 if hasattr(updates, "marker") and updates.marker:
@@ -1354,16 +1373,7 @@ class MaxBotClient:
                 break
             except Exception as e:
                 logger.error(f"Error in polling loop: {e}")
-                if errorHandler:
-                    try:
-                        if inspect.iscoroutinefunction(errorHandler):
-                            result = errorHandler(e)
-                            if result is not None:
-                                await result
-                        else:
-                            errorHandler(e)
-                    except Exception as handler_error:
-                        logger.error(f"Error in error handler: {handler_error}")
+                await callErrorHandler(errorHandler, e)
 
                 # Wait a bit before retrying
                 if self._isPolling:
@@ -34,6 +34,10 @@ MAX_PHOTOS_PER_MESSAGE: Final[int] = 10
 MAX_BUTTONS_PER_ROW: Final[int] = 5
 MAX_ROWS_PER_KEYBOARD: Final[int] = 10
 
+# Update dispatching (polling)
+DEFAULT_MAX_CONCURRENT_UPDATES: Final[int] = 32  # updates handled at once across all chats
+DEFAULT_MAX_PENDING_UPDATES: Final[int] = 1000  # accepted but not handled updates before polling pauses
+
 # Rate Limiting
 DEFAULT_RATE_LIMIT: Final[int] = 100  # requests per second
 RATE_LIMIT_WINDOW: Final[int] = 1  # second
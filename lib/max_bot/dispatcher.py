@@ -0,0 +1,237 @@
+"""
+Max Bot update dispatcher.
+
+This module provides UpdateDispatcher, the stage between the polling loop and
+the update handler. Updates are fanned out to per-chat lanes: updates of one
+chat are handled strictly in order, while different chats are handled
+concurrently, bounded by a global concurrency limit. dispatch() returns as soon
+as the update is queued, so a slow chat doesn't stall update intake for the
+other chats.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable
+from typing import Any, Callable, Deque, Dict, MutableSet, Optional, Union
+
+from .constants import DEFAULT_MAX_CONCURRENT_UPDATES, DEFAULT_MAX_PENDING_UPDATES
+from .models.update import Update
+
+logger = logging.getLogger(__name__)
+
+UpdateHandler = Callable[[Update], Union[None, Awaitable[None]]]
+ErrorHandler = Callable[[Exception], Union[None, Awaitable[None]]]
+
+
+def getUpdateChatId(update: Update) -> Optional[int]:
+    """Get the ID of the chat an update belongs to.
+
+    Args:
+        update: Update to get the chat ID of
+
+    Returns:
+        Chat ID, or None if the update isn't bound to a chat
+    """
+    chatId = getattr(update, "chat_id", None)
+    if chatId is not None:
+        return chatId
+
+    message = getattr(update, "message", None)
+    if message is not None:
+        return message.recipient.chat_id
+    return None
+
+
+async def callErrorHandler(errorHandler: Optional[ErrorHandler], error: Exception) -> None:
+    """Call an optional (sync or async) error handler, logging its own errors.
+
+    Args:
+        errorHandler: Function to call (None - do nothing)
+        error: Exception to pass to the handler
+    """
+    if errorHandler is None:
+        return
+    try:
+        result = errorHandler(error)
+        if inspect.isawaitable(result):
+            await result
+    except Exception as handlerError:
+        logger.error(f"Error in error handler: {handlerError}")
+
+
+class UpdateDispatcher:
+    """Dispatches updates to per-chat ordered lanes with a global concurrency bound.
+
+    Each chat gets a lane (a queue plus a task working through it) which exists
+    while the chat has updates to handle. At most maxConcurrency handlers run at
+    once across all lanes. At most maxPending updates may be accepted and not
+    handled yet: beyond that dispatch() waits, which pauses polling under
+    overload instead of buffering without limit.
+
+    Example:
+        >>> dispatcher = UpdateDispatcher(handleUpdate, maxConcurrency=16)
+        >>> for update in updates.updates:
+        ...     await dispatcher.dispatch(update)
+        >>> await dispatcher.join()
+
+    Attributes:
+        handler: Function to call for each update
+        errorHandler: Function to call when the handler raises (optional)
+        maxConcurrency: Maximum number of handlers running at once
+        maxPending: Maximum number of accepted but not handled updates
+    """
+
+    __slots__ = (
+        "handler",
+        "errorHandler",
+        "maxConcurrency",
+        "maxPending",
+        "_handlerSlots",
+        "_pendingSlots",
+        "_lanes",
+        "_laneTasks",
+        "_stats",
+    )
+
+    def __init__(
+        self,
+        handler: UpdateHandler,
+        errorHandler: Optional[ErrorHandler] = None,
+        *,
+        maxConcurrency: int = DEFAULT_MAX_CONCURRENT_UPDATES,
+        maxPending: int = DEFAULT_MAX_PENDING_UPDATES,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            handler: Function to call for each update
+            errorHandler: Function to call when the handler raises (optional)
+            maxConcurrency: Maximum number of handlers running at once
+            maxPending: Maximum number of accepted but not handled updates
+        """
+        self.handler = handler
+        self.errorHandler = errorHandler
+        self.maxConcurrency = max(1, maxConcurrency)
+        self.maxPending = max(1, maxPending)
+        self._handlerSlots = asyncio.Semaphore(self.maxConcurrency)
+        self._pendingSlots = asyncio.Semaphore(self.maxPending)
+        self._lanes: Dict[Optional[int], Deque[Update]] = {}
+        self._laneTasks: MutableSet[asyncio.Task] = set[asyncio.Task]()
+        self._stats: Dict[str, float] = {
+            "dispatched": 0,
+            "handled": 0,
+            "errors": 0,
+            "running": 0,
+            "intakeLagCount": 0,
+            "intakeLagTotal": 0.0,
+            "intakeLagMax": 0.0,
+            "intakeLagLast": 0.0,
+        }
+
+    async def dispatch(self, update: Update) -> None:
+        """Queue an update into its chat lane.
+
+        Returns right after queueing unless maxPending updates are already
+        waiting to be handled, in which case it waits for one of them to finish.
+
+        Args:
+            update: Update to handle
+        """
+        await self._pendingSlots.acquire()
+        self._stats["dispatched"] += 1
+
+        chatId = getUpdateChatId(update)
+        lane = self._lanes.get(chatId)
+        if lane is None:
+            lane = deque()
+            self._lanes[chatId] = lane
+            task = asyncio.create_task(self._runLane(chatId, lane))
+            self._laneTasks.add(task)
+            task.add_done_callback(self._laneTasks.discard)
+        lane.append(update)
+
+    async def join(self) -> None:
+        """Wait until all dispatched updates are handled."""
+        while True:
+            # Finished lanes may still be in _laneTasks until their done callbacks run
+            running = [task for task in self._laneTasks if not task.done()]
+            if not running:
+                return
+            await asyncio.gather(*running, return_exceptions=True)
+
+    async def _runLane(self, chatId: Optional[int], lane: Deque[Update]) -> None:
+        """Handle the updates of one chat in order until its lane is empty.
+
+        Args:
+            chatId: Chat ID the lane belongs to
+            lane: Queue of the chat updates
+        """
+        try:
+            while lane:
+                update = lane.popleft()
+                try:
+                    async with self._handlerSlots:
+                        await self._handleUpdate(update)
+                finally:
+                    self._pendingSlots.release()
+        finally:
+            # No await between the emptiness check and here, so no update can be lost
+            if self._lanes.get(chatId) is lane:
+                self._lanes.pop(chatId)
+
+    async def _handleUpdate(self, update: Update) -> None:
+        """Call the handler for an update, recording intake lag and errors.
+
+        Args:
+            update: Update to handle
+        """
+        stats = self._stats
+        if update.timestamp > 0:
+            # Max timestamps are in milliseconds
+            intakeLag = max(0.0, time.time() - update.timestamp / 1000)
+            stats["intakeLagCount"] += 1
+            stats["intakeLagTotal"] += intakeLag
+            stats["intakeLagMax"] = max(stats["intakeLagMax"], intakeLag)
+            stats["intakeLagLast"] = intakeLag
+
+        stats["running"] += 1
+        try:
+            result = self.handler(update)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            stats["errors"] += 1
+            logger.error(f"Error in update handler: {e}")
+            await callErrorHandler(self.errorHandler, e)
+        finally:
+            stats["running"] -= 1
+            stats["handled"] += 1
+
+    def getStats(self) -> Dict[str, Any]:
+        """Get dispatching metrics.
+
+        Returns:
+            A dictionary with:
+            - dispatched / handled / errors: Update counters
+            - pending: Accepted updates not handled yet (including running ones)
+            - running: Handlers running right now
+            - lanes: Chats with updates to handle
+            - avgIntakeLag / maxIntakeLag / lastIntakeLag: Seconds from the
+              update timestamp to the handler start
+        """
+        stats = self._stats
+        lagCount = stats["intakeLagCount"]
+        return {
+            "dispatched": int(stats["dispatched"]),
+            "handled": int(stats["handled"]),
+            "errors": int(stats["errors"]),
+            "pending": int(stats["dispatched"] - stats["handled"]),
+            "running": int(stats["running"]),
+            "lanes": len(self._lanes),
+            "avgIntakeLag": stats["intakeLagTotal"] / lagCount if lagCount else 0.0,
+            "maxIntakeLag": stats["intakeLagMax"],
+            "lastIntakeLag": stats["intakeLagLast"],
+        }
@@ -140,6 +140,7 @@ from .update import (
     UpdateType,
     UserAddedToChatUpdate,
     UserRemovedFromChatUpdate,
+    parseUpdate,
 )
 from .upload import (
     AttachmentRequest,
@@ -233,10 +234,11 @@ __all__ = [
     "ReplyKeyboardAttachment",
     "DataAttachment",
     "attachmentFromDict",
-    # Update models (18)
+    # Update models (19)
     "Update",
     "UpdateType",
     "UpdateList",
+    "parseUpdate",
     "MessageCreatedUpdate",
     "MessageEditedUpdate",
     "MessageRemovedUpdate",
@@ -1219,6 +1219,68 @@ class MessageChatCreatedUpdate(Update):
         )
 
 
+def parseUpdate(data: Dict[str, Any]) -> Update:
+    """Create an Update of the matching subclass from an API update dictionary.
+
+    Used for updates from the polling API (UpdateList) and for updates pushed
+    via webhook.
+
+    Args:
+        data: Dictionary of a single update with its 'update_type' field
+
+    Returns:
+        Update: Instance of the Update subclass matching the update_type
+            (base Update for unknown types)
+    """
+    updateTypeStr = data.get("update_type", "unknown")
+    updateType: UpdateType = UpdateType.UNKNOWN
+    try:
+        updateType = UpdateType(updateTypeStr)
+    except Exception:
+        logger.error(f"Unknown UpdateType: {updateTypeStr}")
+
+    # Create appropriate update type based on the type field
+    # TODO: Make some map UpdateType -> class
+    match updateType:
+        case UpdateType.MESSAGE_CREATED:
+            return MessageCreatedUpdate.from_dict(data)
+        case UpdateType.MESSAGE_CALLBACK:
+            return MessageCallbackUpdate.from_dict(data)
+        case UpdateType.MESSAGE_EDITED:
+            return MessageEditedUpdate.from_dict(data)
+        case UpdateType.MESSAGE_REMOVED:
+            return MessageRemovedUpdate.from_dict(data)
+        case UpdateType.BOT_ADDED:
+            return BotAddedUpdate.from_dict(data)
+        case UpdateType.BOT_REMOVED:
+            return BotRemovedFromChatUpdate.from_dict(data)
+        case UpdateType.DIALOG_MUTED:
+            return DialogMutedUpdate.from_dict(data)
+        case UpdateType.DIALOG_UNMUTED:
+            return DialogUnmutedUpdate.from_dict(data)
+        case UpdateType.DIALOG_CLEARED:
+            return DialogClearedUpdate.from_dict(data)
+        case UpdateType.DIALOG_REMOVED:
+            return DialogRemovedUpdate.from_dict(data)
+        case UpdateType.USER_ADDED:
+            return UserAddedToChatUpdate.from_dict(data)
+        case UpdateType.USER_REMOVED:
+            return UserRemovedFromChatUpdate.from_dict(data)
+        case UpdateType.BOT_STARTED:
+            return BotStartedUpdate.from_dict(data)
+        case UpdateType.BOT_STOPPED:
+            return BotStoppedUpdate.from_dict(data)
+        case UpdateType.CHAT_TITLE_CHANGED:
+            return ChatTitleChangedUpdate.from_dict(data)
+        case UpdateType.MESSAGE_CHAT_CREATED:
+            return MessageChatCreatedUpdate.from_dict(data)
+        case UpdateType.UNKNOWN:
+            return Update.from_dict(data)
+        case _:
+            logger.error("Unreached code reached, it shouldn't happen")
+            return Update.from_dict(data)
+
+
 class UpdateList(BaseMaxBotModel):
     """Container for a list of updates with pagination support.
 
@@ -1266,56 +1328,7 @@ class UpdateList(BaseMaxBotModel):
             ValueError: If an update_type value is not a valid UpdateType enum value
         """
         updates_data = data.get("updates", [])
-        updates = []
-
-        for update_data in updates_data:
-            updateTypeStr = update_data.get("update_type", "unknown")
-            updateType: UpdateType = UpdateType.UNKNOWN
-            try:
-                updateType = UpdateType(updateTypeStr)
-            except Exception:
-                logger.error(f"Unknown UpdateType: {updateTypeStr}")
-
-            # Create appropriate update type based on the type field
-            # TODO: Make some map UpdateType -> class
-            match updateType:
-                case UpdateType.MESSAGE_CREATED:
-                    updates.append(MessageCreatedUpdate.from_dict(update_data))
-                case UpdateType.MESSAGE_CALLBACK:
-                    updates.append(MessageCallbackUpdate.from_dict(update_data))
-                case UpdateType.MESSAGE_EDITED:
-                    updates.append(MessageEditedUpdate.from_dict(update_data))
-                case UpdateType.MESSAGE_REMOVED:
-                    updates.append(MessageRemovedUpdate.from_dict(update_data))
-                case UpdateType.BOT_ADDED:
-                    updates.append(BotAddedUpdate.from_dict(update_data))
-                case UpdateType.BOT_REMOVED:
-                    updates.append(BotRemovedFromChatUpdate.from_dict(update_data))
-                case UpdateType.DIALOG_MUTED:
-                    updates.append(DialogMutedUpdate.from_dict(update_data))
-                case UpdateType.DIALOG_UNMUTED:
-                    updates.append(DialogUnmutedUpdate.from_dict(update_data))
-                case UpdateType.DIALOG_CLEARED:
-                    updates.append(DialogClearedUpdate.from_dict(update_data))
-                case UpdateType.DIALOG_REMOVED:
-                    updates.append(DialogRemovedUpdate.from_dict(update_data))
-                case UpdateType.USER_ADDED:
-                    updates.append(UserAddedToChatUpdate.from_dict(update_data))
-                case UpdateType.USER_REMOVED:
-                    updates.append(UserRemovedFromChatUpdate.from_dict(update_data))
-                case UpdateType.BOT_STARTED:
-                    updates.append(BotStartedUpdate.from_dict(update_data))
-                case UpdateType.BOT_STOPPED:
-                    updates.append(BotStoppedUpdate.from_dict(update_data))
-                case UpdateType.CHAT_TITLE_CHANGED:
-                    updates.append(ChatTitleChangedUpdate.from_dict(update_data))
-                case UpdateType.MESSAGE_CHAT_CREATED:
-                    updates.append(MessageChatCreatedUpdate.from_dict(update_data))
-                case UpdateType.UNKNOWN:
-                    updates.append(Update.from_dict(update_data))
-                case _:
-                    logger.error("Unreached code reached, it shouldn't happen")
-                    updates.append(Update.from_dict(update_data))
+        updates = [parseUpdate(update_data) for update_data in updates_data]
 
         return cls(
             updates=updates,
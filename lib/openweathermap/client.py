@@ -27,7 +27,8 @@ from typing import List, Optional
 
 import httpx
 
-from lib.cache import CacheInterface, NullCache
+from lib.cache import CacheInterface, NullCache, singleFlight
+from lib.http_client import HttpClientRegistry
 from lib.proxy import ProxyConfig, ProxyType
 from lib.rate_limiter import RateLimiterManager
 
@@ -148,6 +149,7 @@ class OpenWeatherMapClient:
         )
         self._rateLimiter = RateLimiterManager.getInstance()
 
+    @singleFlight()
     async def getCoordinates(
         self, city: str, country: Optional[str] = None, state: Optional[str] = None, limit: int = 1
     ) -> Optional[GeocodingResult]:
@@ -191,15 +193,24 @@ class OpenWeatherMapClient:
             cacheKeyParts.append(state.lower().strip())
         cacheKey: str = ",".join(cacheKeyParts)
 
-        # Check cache first
-        try:
-            cachedData: Optional[GeocodingResult] = await self.geocodingCache.get(cacheKey, self.geocodingTTL)
-            if cachedData:
-                logger.debug(f"Cache hit for geocoding: {cacheKey}")
-                return cachedData
-        except Exception as e:
-            logger.warning(f"Cache error for geocoding {cacheKey}: {e}")
+        return await self.geocodingCache.getOrFetch(
+            cacheKey, lambda: self._fetchCoordinates(city, country, state, limit), self.geocodingTTL
+        )
+
+    async def _fetchCoordinates(
+        self, city: str, country: Optional[str], state: Optional[str], limit: int
+    ) -> Optional[GeocodingResult]:
+        """Request coordinates for a city from the Geocoding API (no caching).
+
+        Args:
+            city: City name.
+            country: Optional ISO 3166 country code.
+            state: Optional state or province code.
+            limit: Maximum number of results to request.
 
+        Returns:
+            GeocodingResult for the first match, None if not found or on error.
+        """
         # Build query string
         queryParts: List[str] = [city]
         if state:
@@ -227,15 +238,9 @@ class OpenWeatherMapClient:
             "state": apiResult.get("state", ""),
         }
 
-        # Store in cache
-        try:
-            await self.geocodingCache.set(cacheKey, result)
-            logger.debug(f"Cached geocoding result: {cacheKey}")
-        except Exception as e:
-            logger.warning(f"Failed to cache geocoding result {cacheKey}: {e}")
-
         return result
 
+    @singleFlight()
     async def getWeather(self, lat: float, lon: float, exclude: Optional[List[str]] = None) -> Optional[WeatherData]:
         """Get weather data by geographic coordinates.
 
@@ -274,15 +279,21 @@ class OpenWeatherMapClient:
         lonRounded: float = round(lon, 4)
         cacheKey: str = f"{latRounded},{lonRounded}"
 
-        # Check cache first
-        try:
-            cachedData: Optional[WeatherData] = await self.weatherCache.get(cacheKey, self.weatherTTL)
-            if cachedData:
-                logger.debug(f"Cache hit for weather: {cacheKey}")
-                return cachedData
-        except Exception as e:
-            logger.warning(f"Cache error for weather {cacheKey}: {e}")
+        return await self.weatherCache.getOrFetch(
+            cacheKey, lambda: self._fetchWeather(lat, lon, exclude), self.weatherTTL
+        )
 
+    async def _fetchWeather(self, lat: float, lon: float, exclude: Optional[List[str]]) -> Optional[WeatherData]:
+        """Request weather data from the One Call API (no caching).
+
+        Args:
+            lat: Latitude coordinate in decimal degrees.
+            lon: Longitude coordinate in decimal degrees.
+            exclude: Optional list of data blocks to exclude from the response.
+
+        Returns:
+            WeatherData dictionary, None if the request failed.
+        """
         # Default exclusions
         if exclude is None:
             exclude = ["minutely", "hourly", "alerts"]
@@ -376,13 +387,6 @@ class OpenWeatherMapClient:
             "daily": dailyForecasts,
         }
 
-        # Store in cache
-        try:
-            await self.weatherCache.set(cacheKey, result)
-            logger.debug(f"Cached weather result: {cacheKey}")
-        except Exception as e:
-            logger.warning(f"Failed to cache weather result {cacheKey}: {e}")
-
         return result
 
     async def getWeatherByCity(
@@ -469,26 +473,26 @@ class OpenWeatherMapClient:
             logger.debug(f"Making request to {url} with params: {params}")
             await self._rateLimiter.applyLimit(self.rateLimiterQueue)
 
-            # Create new session for each request
-            async with httpx.AsyncClient(**self._proxyConfig.toKwargs(), timeout=self.requestTimeout) as session:
-                response: httpx.Response = await session.get(url, params=params)
-                if response.status_code == 200:
-                    data: dict = response.json()
-                    logger.debug(f"API request successful: {response.status_code}")
-                    logger.debug(f"API response: {data}")
-                    return data
-                elif response.status_code == 401:
-                    logger.error("Invalid API key")
-                    return None
-                elif response.status_code == 404:
-                    logger.warning("Location not found")
-                    return None
-                elif response.status_code == 429:
-                    logger.error("Rate limit exceeded")
-                    return None
-                else:
-                    logger.error(f"API request failed: {response.status_code}")
-                    return None
+            # Shared pooled client: keep-alive connections are reused across requests
+            session = HttpClientRegistry.getInstance().getClient(self._proxyConfig)
+            response: httpx.Response = await session.get(url, params=params, timeout=self.requestTimeout)
+            if response.status_code == 200:
+                data: dict = response.json()
+                logger.debug(f"API request successful: {response.status_code}")
+                logger.debug(f"API response: {data}")
+                return data
+            elif response.status_code == 401:
+                logger.error("Invalid API key")
+                return None
+            elif response.status_code == 404:
+                logger.warning("Location not found")
+                return None
+            elif response.status_code == 429:
+                logger.error("Rate limit exceeded")
+                return None
+            else:
+                logger.error(f"API request failed: {response.status_code}")
+                return None
 
         except httpx.TimeoutException:
             logger.error("Request timeout")
@@ -13,6 +13,8 @@ from threading import Lock
 from typing import Any, Dict, Optional, TypedDict, cast
 from urllib.parse import quote, urlparse, urlunparse
 
+import httpx
+
 try:
     from httpx_socks import AsyncProxyTransport
 
@@ -465,6 +467,51 @@ class ProxyConfig:
 
         raise ValueError(f"Unsupported proxy type: {config.type!r}. Must be 'none', 'http' or 'socks5'.")
 
+    def toTransport(self, *, http2: bool = False, limits: Optional[httpx.Limits] = None) -> httpx.AsyncBaseTransport:
+        """Build a pooled httpx transport routed through this proxy config.
+
+        Unlike :meth:`toKwargs`, the connection pool settings are applied to
+        the proxied transport as well, so the result can be shared by
+        long-lived clients.
+
+        Args:
+            http2: Whether to negotiate HTTP/2. Ignored for SOCKS5 proxies.
+            limits: Connection pool limits. Defaults to httpx defaults.
+
+        Returns:
+            An ``httpx.AsyncHTTPTransport`` (direct or HTTP proxy) or an
+            ``AsyncProxyTransport`` (SOCKS5).
+
+        Raises:
+            ImportError: If proxy type is SOCKS5 and the httpx-socks package
+                is not installed.
+        """
+        if limits is None:
+            limits = httpx.Limits()
+        config = self.getCombined()
+
+        if config.type == ProxyType.NONE or config.type is None:
+            return httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+
+        proxyUrl = self._buildProxyUrl(
+            address=config.address or "",
+            user=config.user or "",
+            password=config.password or "",
+        )
+
+        if config.type == ProxyType.HTTP:
+            return httpx.AsyncHTTPTransport(proxy=proxyUrl, http2=http2, limits=limits)
+
+        if config.type == ProxyType.SOCKS5:
+            if not _HTTPX_SOCKS_AVAILABLE:
+                raise ImportError(
+                    "SOCKS5 proxy requires httpx-socks[asyncio] package. "
+                    "Install with: pip install httpx-socks[asyncio]"
+                )
+            return AsyncProxyTransport.from_url(proxyUrl, limits=limits)
+
+        raise ValueError(f"Unsupported proxy type: {config.type!r}. Must be 'none', 'http' or 'socks5'.")
+
 
 class ProxyHelper:
     """Singleton that stores the global proxy configuration.
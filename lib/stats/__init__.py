@@ -14,8 +14,19 @@ consumer, model, provider, generation type, and any future dimensions.
         ...     consumerId="chat_123",
         ...     labels={"model": "gpt-4o", "provider": "openrouter"},
         ... )
+
+Wrap a storage in :class:`BufferedStatsStorage` to take the write off the
+caller's path; events are then written in batches by a background task.
 """
 
-from .stats_storage import GLOBAL_CONSUMER_ID, NullStatsStorage, StatsStorage
+from .buffered_storage import BufferedStatsStorage, BufferedStatsStorageStats
+from .stats_storage import GLOBAL_CONSUMER_ID, NullStatsStorage, StatsEvent, StatsStorage
 
-__all__ = ["GLOBAL_CONSUMER_ID", "NullStatsStorage", "StatsStorage"]
+__all__ = [
+    "GLOBAL_CONSUMER_ID",
+    "BufferedStatsStorage",
+    "BufferedStatsStorageStats",
+    "NullStatsStorage",
+    "StatsEvent",
+    "StatsStorage",
+]
@@ -0,0 +1,229 @@
+"""Write-behind buffer in front of another :class:`StatsStorage`.
+
+``record()`` only appends the event to an in-memory queue. A background task
+writes the queue to the wrapped storage with :meth:`StatsStorage.recordMany`
+whenever ``batchSize`` events are pending or ``flushInterval`` seconds have
+passed, whichever comes first. When the queue holds ``maxBufferedEvents``
+events (e.g. the database is down), the oldest events are dropped.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from typing import Optional, TypedDict
+
+from .stats_storage import StatsEvent, StatsStorage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+"""Pending events that trigger an immediate flush."""
+DEFAULT_FLUSH_INTERVAL = 2.0
+"""Maximum seconds an event waits in the buffer."""
+DEFAULT_MAX_BUFFERED_EVENTS = 10000
+"""Buffer capacity; older events are dropped beyond it."""
+
+
+class BufferedStatsStorageStats(TypedDict):
+    """Counters reported by :meth:`BufferedStatsStorage.getStats`."""
+
+    buffered: int
+    written: int
+    dropped: int
+    failed: int
+    flushes: int
+
+
+class BufferedStatsStorage(StatsStorage):
+    """Write-behind :class:`StatsStorage` wrapper with batched flushes.
+
+    Recording never touches the wrapped storage, so it costs an in-memory append
+    on the request path. ``aggregate()`` flushes first, so aggregation always
+    sees every event recorded before the call. ``aclose()`` stops the
+    background task and flushes what is left; events recorded after that are
+    written through to the wrapped storage directly.
+
+    Attributes:
+        storage: Wrapped storage receiving the batches.
+        batchSize: Pending events that trigger a flush, also the maximum size of one write.
+        flushInterval: Maximum seconds between flushes while events are pending.
+        maxBufferedEvents: Buffer capacity before the oldest events are dropped.
+    """
+
+    __slots__ = (
+        "storage",
+        "batchSize",
+        "flushInterval",
+        "maxBufferedEvents",
+        "_buffer",
+        "_wakeup",
+        "_flushLock",
+        "_flusherTask",
+        "_closed",
+        "_written",
+        "_dropped",
+        "_failed",
+        "_flushes",
+    )
+
+    def __init__(
+        self,
+        storage: StatsStorage,
+        *,
+        batchSize: int = DEFAULT_BATCH_SIZE,
+        flushInterval: float = DEFAULT_FLUSH_INTERVAL,
+        maxBufferedEvents: int = DEFAULT_MAX_BUFFERED_EVENTS,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            storage: Storage the buffered events are written to.
+            batchSize: Pending events that trigger a flush (at least 1).
+            flushInterval: Maximum seconds between flushes while events are pending.
+            maxBufferedEvents: Buffer capacity; raised to ``batchSize`` if smaller.
+        """
+        self.storage = storage
+        self.batchSize = max(1, batchSize)
+        self.flushInterval = flushInterval
+        self.maxBufferedEvents = max(self.batchSize, maxBufferedEvents)
+
+        self._buffer: deque[StatsEvent] = deque()
+        self._wakeup = asyncio.Event()
+        self._flushLock = asyncio.Lock()
+        self._flusherTask: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._flushes = 0
+
+    async def record(
+        self,
+        stats: dict[str, float | int],
+        *,
+        consumerId: Optional[str] = None,
+        labels: Optional[dict[str, str]] = None,
+        eventTime: Optional[datetime] = None,
+    ) -> None:
+        """Queue the event for the next flush. Never raises.
+
+        ``eventTime`` defaults to the time of this call, not of the flush.
+
+        Args:
+            stats: Metric key -> numeric value dict.
+            consumerId: Consumer identifier (e.g. str(chatId)). Merged into labels.
+            labels: Additional dimension labels.
+            eventTime: When the event occurred; defaults to now (UTC).
+
+        Returns:
+            None
+        """
+        if eventTime is None:
+            eventTime = datetime.now(timezone.utc)
+
+        if self._closed:
+            await self.storage.record(stats, consumerId=consumerId, labels=labels, eventTime=eventTime)
+            return
+
+        if len(self._buffer) >= self.maxBufferedEvents:
+            self._buffer.popleft()
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 1000 == 0:
+                logger.warning(
+                    f"Stats buffer is full ({self.maxBufferedEvents}), dropped {self._dropped} events so far"
+                )
+
+        self._buffer.append({"stats": stats, "consumerId": consumerId, "labels": labels, "eventTime": eventTime})
+        if len(self._buffer) >= self.batchSize:
+            self._wakeup.set()
+
+        if self._flusherTask is None or self._flusherTask.done():
+            self._flusherTask = asyncio.create_task(self._flushLoop(), name="stats-flusher")
+
+    async def flush(self) -> int:
+        """Write all pending events to the wrapped storage in ``batchSize`` chunks.
+
+        A chunk whose write fails is logged and discarded, matching the
+        best-effort contract of :meth:`record`.
+
+        Returns:
+            Number of events written successfully.
+        """
+        written = 0
+        async with self._flushLock:
+            while self._buffer:
+                batch = [self._buffer.popleft() for _ in range(min(self.batchSize, len(self._buffer)))]
+                self._flushes += 1
+                try:
+                    await self.storage.recordMany(batch)
+                    written += len(batch)
+                except Exception as e:
+                    self._failed += len(batch)
+                    logger.error(f"Failed to write {len(batch)} buffered stat events")
+                    logger.exception(e)
+        self._written += written
+        return written
+
+    async def aggregate(self, *, limit: int = 1000, orphanTimeoutSeconds: int = 3600) -> int:
+        """Flush pending events, then aggregate in the wrapped storage.
+
+        Args:
+            limit: Maximum number of unprocessed events to claim in one batch.
+            orphanTimeoutSeconds: Age in seconds after which a claimed-but-unprocessed
+                row is considered orphaned.
+
+        Returns:
+            Number of events processed by the wrapped storage.
+        """
+        await self.flush()
+        return await self.storage.aggregate(limit=limit, orphanTimeoutSeconds=orphanTimeoutSeconds)
+
+    async def aclose(self) -> None:
+        """Stop the background flusher, flush the buffer and close the wrapped storage.
+
+        Returns:
+            None
+        """
+        self._closed = True
+        self._wakeup.set()
+        if self._flusherTask is not None:
+            await self._flusherTask
+            self._flusherTask = None
+        await self.flush()
+        await self.storage.aclose()
+
+    def getStats(self) -> BufferedStatsStorageStats:
+        """Get buffer counters.
+
+        Returns:
+            Pending, written, dropped (buffer overflow) and failed (write error)
+            event counts plus the number of batch writes.
+        """
+        return {
+            "buffered": len(self._buffer),
+            "written": self._written,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "flushes": self._flushes,
+        }
+
+    async def _flushLoop(self) -> None:
+        """Flush on a full batch or after ``flushInterval`` until the buffer drains.
+
+        The task exits once nothing is pending; the next :meth:`record`
+        starts a new one, so an idle storage has no timer running.
+
+        Returns:
+            None
+        """
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flushInterval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+            if not self._buffer:
+                break
@@ -1,13 +1,23 @@
 """Abstract stats storage interface with null implementation."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import datetime
-from typing import Optional
+from typing import NotRequired, Optional, TypedDict
 
 # Sentinel consumer ID for global (all-consumer) aggregation
 GLOBAL_CONSUMER_ID = "__global__"
 
 
+class StatsEvent(TypedDict):
+    """A single raw stat event, mirroring the arguments of :meth:`StatsStorage.record`."""
+
+    stats: dict[str, float | int]
+    consumerId: NotRequired[Optional[str]]
+    labels: NotRequired[Optional[dict[str, str]]]
+    eventTime: NotRequired[Optional[datetime]]
+
+
 class StatsStorage(ABC):
     """Abstract storage for time-series statistics with batch aggregation.
 
@@ -52,6 +62,37 @@ class StatsStorage(ABC):
         """
         ...
 
+    async def recordMany(self, events: Sequence[StatsEvent]) -> None:
+        """Append several raw stat events at once.
+
+        Default implementation calls :meth:`record` for each event. Storages
+        with a cheaper multi-row write override it. Unlike :meth:`record`,
+        overrides may raise, so batching callers can account for failed writes.
+
+        Args:
+            events: Events to append.
+
+        Returns:
+            None
+        """
+        for event in events:
+            await self.record(
+                event["stats"],
+                consumerId=event.get("consumerId"),
+                labels=event.get("labels"),
+                eventTime=event.get("eventTime"),
+            )
+
+    async def aclose(self) -> None:
+        """Release resources and write out anything still pending.
+
+        The base implementation is a no-op.
+
+        Returns:
+            None
+        """
+        pass
+
     @abstractmethod
     async def aggregate(self, *, limit: int = 1000, orphanTimeoutSeconds: int = 3600) -> int:
         """Claim up to ``limit`` unprocessed (or orphaned) events, aggregate into
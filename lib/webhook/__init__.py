@@ -0,0 +1,26 @@
+"""
+Webhook server
+
+This library provides an async HTTP server for receiving bot platform updates
+via webhooks: secret verification, deduplication of redelivered updates and a
+bounded queue between the HTTP handler and the update handler, so requests are
+acknowledged right away.
+
+Example:
+    >>> from lib.webhook import WebhookServer
+    >>>
+    >>> async def handleUpdate(update: Dict[str, Any]) -> None:
+    ...     print(update)
+    >>>
+    >>> server = WebhookServer(handleUpdate, host="0.0.0.0", port=8080, secret="s3cr3t")
+    >>> await server.start()
+    >>> # On shutdown
+    >>> await server.stop()
+"""
+
+from .server import WebhookHandler, WebhookServer
+
+__all__ = [
+    "WebhookHandler",
+    "WebhookServer",
+]
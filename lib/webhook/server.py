@@ -0,0 +1,309 @@
+"""
+Webhook server
+
+Async HTTP server receiving bot platform updates pushed via webhooks. A POST
+request is verified (secret header), parsed, checked against recently seen
+updates and put on a bounded in-memory queue; the platform gets its response
+right away and a single consumer task hands the queued updates to the handler
+in arrival order. When the queue is full the request is answered with 503, so
+the platform redelivers the update later instead of the server buffering
+without limit.
+
+The server keeps no state besides the deduplication cache, so several
+instances may run behind a load balancer (pass a shared cache, e.g. a
+database-backed one, to deduplicate across instances). GET on the health path
+answers 200 while the server accepts updates and 503 while it is stopping.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import time
+from collections.abc import Awaitable
+from typing import Any, Callable, Dict, Optional
+
+from aiohttp import web
+
+from lib.cache import CacheInterface, DictCache, StringKeyGenerator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE: int = 1000
+"""Default number of updates accepted but not handed to the handler yet."""
+DEFAULT_DEDUP_TTL: int = 3600
+"""Default number of seconds an update ID is remembered for deduplication."""
+DEFAULT_DEDUP_MAX_SIZE: int = 100000
+"""Default number of update IDs kept by the in-memory deduplication cache."""
+DEFAULT_HEALTH_PATH: str = "/healthz"
+"""Default path of the load balancer health check."""
+
+WebhookHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+"""Handler of a parsed update (JSON object of the request body)."""
+UpdateIdGetter = Callable[[Dict[str, Any]], Optional[str]]
+"""Function extracting the ID used for deduplication from an update."""
+
+
+class WebhookServer:
+    """HTTP server putting webhook updates on a bounded queue.
+
+    Example:
+        >>> server = WebhookServer(handleUpdate, port=8080, path="/webhook", secret="s3cr3t",
+        ...                        secretHeader="X-Telegram-Bot-Api-Secret-Token")
+        >>> await server.start()
+        >>> ...
+        >>> await server.stop()
+
+    Attributes:
+        handler: Function called for every accepted update
+        host: Interface to listen on
+        port: Port to listen on (0 - any free port, see boundPort after start())
+        path: Path updates are posted to
+        healthPath: Path of the health check
+        secret: Expected value of the secret header (None - not checked)
+        secretHeader: Name of the header carrying the secret
+        getUpdateId: Function returning the update ID for deduplication
+            (None - a hash of the request body is used)
+        dedupCache: Cache of recently seen update IDs
+        dedupTtl: Seconds an update ID is remembered
+        dedupPrefix: Prefix of the deduplication keys (separates bots sharing a cache)
+        queue: Accepted updates waiting for the handler
+        boundPort: Port the server actually listens on (None before start())
+    """
+
+    __slots__ = (
+        "handler",
+        "host",
+        "port",
+        "path",
+        "healthPath",
+        "secret",
+        "secretHeader",
+        "getUpdateId",
+        "dedupCache",
+        "dedupTtl",
+        "dedupPrefix",
+        "queue",
+        "boundPort",
+        "_runner",
+        "_consumerTask",
+        "_stopping",
+        "_stats",
+    )
+
+    def __init__(
+        self,
+        handler: WebhookHandler,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        path: str = "/webhook",
+        healthPath: str = DEFAULT_HEALTH_PATH,
+        secret: Optional[str] = None,
+        secretHeader: str = "X-Webhook-Secret",
+        getUpdateId: Optional[UpdateIdGetter] = None,
+        queueSize: int = DEFAULT_QUEUE_SIZE,
+        dedupCache: Optional[CacheInterface[str, float]] = None,
+        dedupTtl: int = DEFAULT_DEDUP_TTL,
+        dedupPrefix: str = "",
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            handler: Function called for every accepted update
+            host: Interface to listen on
+            port: Port to listen on (0 - any free port)
+            path: Path updates are posted to
+            healthPath: Path of the health check
+            secret: Expected value of the secret header (None or empty - not checked)
+            secretHeader: Name of the header carrying the secret
+            getUpdateId: Function returning the update ID for deduplication
+                (None - a hash of the request body is used)
+            queueSize: Maximum number of accepted updates waiting for the handler
+            dedupCache: Cache of recently seen update IDs (None - in-memory cache)
+            dedupTtl: Seconds an update ID is remembered
+            dedupPrefix: Prefix of the deduplication keys (separates bots sharing a cache)
+        """
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self.path = path
+        self.healthPath = healthPath
+        self.secret: Optional[str] = secret or None
+        self.secretHeader = secretHeader
+        self.getUpdateId = getUpdateId
+        self.dedupTtl = dedupTtl
+        self.dedupPrefix = dedupPrefix
+        self.dedupCache: CacheInterface[str, float] = (
+            dedupCache
+            if dedupCache is not None
+            else DictCache[str, float](StringKeyGenerator(), defaultTtl=dedupTtl, maxSize=DEFAULT_DEDUP_MAX_SIZE)
+        )
+        self.queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(maxsize=max(1, queueSize))
+        self.boundPort: Optional[int] = None
+
+        self._runner: Optional[web.AppRunner] = None
+        self._consumerTask: Optional[asyncio.Task] = None
+        self._stopping: bool = False
+        self._stats: Dict[str, int] = {
+            "received": 0,
+            "accepted": 0,
+            "duplicates": 0,
+            "unauthorized": 0,
+            "invalid": 0,
+            "overflows": 0,
+            "handled": 0,
+            "errors": 0,
+        }
+
+    async def start(self) -> None:
+        """Start listening and handing updates to the handler.
+
+        Raises:
+            RuntimeError: If the server is already started
+        """
+        if self._runner is not None:
+            raise RuntimeError("Webhook server is already started")
+
+        app = web.Application()
+        app.router.add_post(self.path, self._handlePost)
+        app.router.add_get(self.healthPath, self._handleHealth)
+
+        self._stopping = False
+        self._consumerTask = asyncio.create_task(self._consume())
+        runner = web.AppRunner(app, access_log=None)
+        self._runner = runner
+        await runner.setup()
+        site = web.TCPSite(runner, self.host, self.port)
+        await site.start()
+
+        addresses = runner.addresses
+        self.boundPort = addresses[0][1] if addresses else self.port
+        logger.info(f"Webhook server listening on {self.host}:{self.boundPort}{self.path}")
+
+    async def stop(self) -> None:
+        """Stop accepting updates and wait until the queued ones are handled."""
+        if self._runner is None:
+            return
+
+        self._stopping = True
+        await self._runner.cleanup()
+        self._runner = None
+
+        await self.queue.join()
+        if self._consumerTask is not None:
+            self._consumerTask.cancel()
+            try:
+                await self._consumerTask
+            except asyncio.CancelledError:
+                pass
+            self._consumerTask = None
+        logger.info(f"Webhook server stopped, stats: {self.getStats()}")
+
+    def _getDedupKey(self, update: Dict[str, Any], body: bytes) -> str:
+        """Get the deduplication key of an update.
+
+        Args:
+            update: Parsed update
+            body: Raw request body
+
+        Returns:
+            Prefixed update ID, or a prefixed hash of the body if there is no ID
+        """
+        updateId = self.getUpdateId(update) if self.getUpdateId is not None else None
+        if updateId is None:
+            updateId = hashlib.sha256(body).hexdigest()
+        return self.dedupPrefix + updateId
+
+    async def _handlePost(self, request: web.Request) -> web.Response:
+        """Verify, deduplicate and queue a posted update.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            200 for accepted and duplicate updates, 401 for a wrong secret,
+            400 for a malformed body, 503 if the queue is full or the server
+            is stopping
+        """
+        stats = self._stats
+        stats["received"] += 1
+
+        if self.secret is not None and not hmac.compare_digest(
+            request.headers.get(self.secretHeader, "").encode(), self.secret.encode()
+        ):
+            stats["unauthorized"] += 1
+            return web.Response(status=401)
+
+        if self._stopping:
+            return web.Response(status=503)
+
+        body = await request.read()
+        try:
+            update = json.loads(body)
+        except ValueError:
+            update = None
+        if not isinstance(update, dict):
+            stats["invalid"] += 1
+            return web.Response(status=400)
+
+        dedupKey = self._getDedupKey(update, body)
+        try:
+            if await self.dedupCache.get(dedupKey, ttl=self.dedupTtl) is not None:
+                stats["duplicates"] += 1
+                return web.Response(status=200)
+        except Exception as e:
+            # Better to handle an update twice than to lose it
+            logger.error(f"Failed to check webhook update {dedupKey} for duplicates: {type(e).__name__}#{e}")
+
+        try:
+            self.queue.put_nowait(update)
+        except asyncio.QueueFull:
+            stats["overflows"] += 1
+            logger.warning(f"Webhook queue is full, rejecting update {dedupKey}")
+            return web.Response(status=503, headers={"Retry-After": "1"})
+
+        stats["accepted"] += 1
+        try:
+            await self.dedupCache.set(dedupKey, time.time())
+        except Exception as e:
+            logger.error(f"Failed to remember webhook update {dedupKey}: {type(e).__name__}#{e}")
+        return web.Response(status=200)
+
+    async def _handleHealth(self, request: web.Request) -> web.Response:
+        """Answer the load balancer health check.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            200 while updates are accepted, 503 while stopping
+        """
+        if self._stopping:
+            return web.Response(status=503, text="stopping")
+        return web.Response(status=200, text="ok")
+
+    async def _consume(self) -> None:
+        """Hand queued updates to the handler one by one, in arrival order."""
+        while True:
+            update = await self.queue.get()
+            try:
+                await self.handler(update)
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.error(f"Error in webhook update handler: {type(e).__name__}#{e}")
+                logger.exception(e)
+            finally:
+                self._stats["handled"] += 1
+                self.queue.task_done()
+
+    def getStats(self) -> Dict[str, int]:
+        """Get webhook intake metrics.
+
+        Returns:
+            A dictionary with request counters (received, accepted, duplicates,
+            unauthorized, invalid, overflows), handler counters (handled,
+            errors) and queueDepth (accepted updates waiting for the handler)
+        """
+        return {**self._stats, "queueDepth": self.queue.qsize()}
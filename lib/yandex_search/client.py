@@ -37,7 +37,8 @@ from typing import Optional
 
 import httpx
 
-from lib.cache import CacheInterface, NullCache
+from lib.cache import CacheInterface, NullCache, singleFlight
+from lib.http_client import HttpClientRegistry
 from lib.proxy import ProxyConfig, ProxyType
 from lib.rate_limiter import RateLimiterManager
 
@@ -183,6 +184,7 @@ class YandexSearchClient:
             proxyConfig if proxyConfig is not None else ProxyConfig(proxyType=ProxyType.NONE)
         )
 
+    @singleFlight()
     async def search(
         self,
         queryText: str,
@@ -296,23 +298,10 @@ class YandexSearchClient:
             "responseFormat": ResponseFormat.FORMAT_XML,
         }
 
-        # Check cache first
-        cachedResult = await self.cache.get(request, cacheTTL if cacheTTL is not None else self.cacheTTL)
-        if cachedResult:
-            logger.debug(f"Cache hit for query: {queryText}")
-            return cachedResult
-        else:
-            logger.debug(f"Cache miss for query: {queryText}")
-
-        # Make API request
-        result = await self._makeRequest(request)
-
-        # Cache successful results
-        if result is not None:
-            await self.cache.set(request, result)
-            logger.debug(f"Cached result for query: {queryText}")
-
-        return result
+        # Make API request unless cached (stale results may be served per cache settings)
+        return await self.cache.getOrFetch(
+            request, lambda: self._makeRequest(request), cacheTTL if cacheTTL is not None else self.cacheTTL
+        )
 
     async def _makeRequest(self, request: SearchRequest) -> Optional[SearchResponse]:
         """Make HTTP request to Yandex Search API with error handling.
@@ -359,46 +348,46 @@ class YandexSearchClient:
             elif self.apiKey:
                 headers["Authorization"] = f"Api-Key {self.apiKey}"
 
-            # Create new session for each request
-            async with httpx.AsyncClient(**self._proxyConfig.toKwargs(), timeout=self.requestTimeout) as session:
-                response = await session.post(self.API_ENDPOINT, headers=headers, json=request)
-
-                if response.status_code == 200:
-                    # Parse JSON response
-                    responseData = response.json()
-                    logger.debug(f"API request successful: {response.status_code}")
-                    logger.debug(f"API response: {str(responseData)[:50]}...")
-
-                    # Extract Base64-encoded XML
-                    if "rawData" not in responseData:
-                        logger.error("No 'rawData' field in response")
-                        return None
-
-                    base64Xml = responseData["rawData"]
+            # Shared pooled client: keep-alive connections are reused across requests
+            session = HttpClientRegistry.getInstance().getClient(self._proxyConfig)
+            response = await session.post(self.API_ENDPOINT, headers=headers, json=request, timeout=self.requestTimeout)
 
-                    # Parse XML response
-                    return parseSearchResponse(base64Xml)
+            if response.status_code == 200:
+                # Parse JSON response
+                responseData = response.json()
+                logger.debug(f"API request successful: {response.status_code}")
+                logger.debug(f"API response: {str(responseData)[:50]}...")
 
-                elif response.status_code == 400:
-                    logger.error("Bad request - invalid parameters")
-                    return None
-                elif response.status_code == 401:
-                    logger.error("Unauthorized - invalid credentials")
-                    return None
-                elif response.status_code == 403:
-                    logger.error("Forbidden - insufficient permissions")
-                    return None
-                elif response.status_code == 429:
-                    logger.error("Rate limit exceeded")
-                    return None
-                elif response.status_code >= 500:
-                    logger.error(f"Server error: {response.status_code}")
-                    return None
-                else:
-                    logger.error(f"API request failed: {response.status_code}")
-                    logger.error(f"Response text: {response.text}")
+                # Extract Base64-encoded XML
+                if "rawData" not in responseData:
+                    logger.error("No 'rawData' field in response")
                     return None
 
+                base64Xml = responseData["rawData"]
+
+                # Parse XML response
+                return parseSearchResponse(base64Xml)
+
+            elif response.status_code == 400:
+                logger.error("Bad request - invalid parameters")
+                return None
+            elif response.status_code == 401:
+                logger.error("Unauthorized - invalid credentials")
+                return None
+            elif response.status_code == 403:
+                logger.error("Forbidden - insufficient permissions")
+                return None
+            elif response.status_code == 429:
+                logger.error("Rate limit exceeded")
+                return None
+            elif response.status_code >= 500:
+                logger.error(f"Server error: {response.status_code}")
+                return None
+            else:
+                logger.error(f"API request failed: {response.status_code}")
+                logger.error(f"Response text: {response.text}")
+                return None
+
         except httpx.TimeoutException:
             logger.error("Request timeout")
             return None
@@ -18,14 +18,18 @@ from internal.bot.models.enums import BotProvider
 from internal.bot.telegram.application import TelegramBotApplication
 from internal.config.manager import ConfigManager
 from internal.database import Database
+from internal.database.generic_cache import GenericDatabaseCache
+from internal.database.models import CacheType
 from internal.database.stats_storage import DatabaseStatsStorage
 from internal.services.llm import LLMService
 from internal.services.proxy import ProxyService
 from internal.services.queue_service import QueueService
 from lib.ai.manager import LLMManager
+from lib.cache import StringKeyGenerator
+from lib.http_client import HttpClientRegistry
 from lib.logging_utils import initLogging
 from lib.rate_limiter import RateLimiterManager
-from lib.stats import StatsStorage
+from lib.stats import BufferedStatsStorage, StatsStorage
 
 # Configure basic logging first
 logging.basicConfig(format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO)
@@ -48,6 +52,7 @@ class GromozekBot:
         self._loop = loop
 
         self._schedulerTask: Optional[asyncio.Task] = None
+        self.llmStatsStorage: Optional[StatsStorage] = None
 
         # Initialize logging with config
         initLogging(self.configManager.getLoggingConfig())
@@ -76,23 +81,36 @@ class GromozekBot:
         # before proxy processes are stopped.
         # In the same time it MUST be initialized BEFORE LLMManager as it uses proxy.
         ProxyService.getInstance().initialize(self.configManager.getProxyConfig(), loop=loop)
+        HttpClientRegistry.getInstance().configure(self.configManager.getHttpClientConfig())
 
         # Initialize stats storage for LLM usage tracking
-        llmStatsStorage: Optional[StatsStorage] = None
         statsConfig = self.configManager.getStatsConfig()
         if statsConfig.get("enabled", False):
-            llmStatsStorage = DatabaseStatsStorage(
+            self.llmStatsStorage = DatabaseStatsStorage(
                 db=self.database,
                 eventType="llm_request",
                 dataSource=statsConfig.get("llm-stats-data-source", self.database.manager.default),
             )
+            # Take the INSERT off the model call path, events are written in batches
+            writeBatchSize = int(statsConfig.get("write-batch-size", 200))
+            if writeBatchSize > 0:
+                self.llmStatsStorage = BufferedStatsStorage(
+                    self.llmStatsStorage,
+                    batchSize=writeBatchSize,
+                    flushInterval=float(statsConfig.get("write-flush-interval", 2.0)),
+                    maxBufferedEvents=int(statsConfig.get("write-max-buffered-events", 10000)),
+                )
 
         # Initialize LLM Manager
         self.llmManager = LLMManager(
             self.configManager.getModelsConfig(),
-            statsStorage=llmStatsStorage,
+            statsStorage=self.llmStatsStorage,
         )
         LLMService.getInstance().injectLLMManager(self.llmManager)
+        # Rolling summaries of condensed contexts survive restarts
+        LLMService.getInstance().injectCondensedContextCache(
+            GenericDatabaseCache(self.database, CacheType.CONDENSED_CONTEXT, keyGenerator=StringKeyGenerator())
+        )
 
         # Initialize rate limiter manager
         self.rateLimiterManager = RateLimiterManager.getInstance()
@@ -148,8 +166,23 @@ class GromozekBot:
             logger.exception("Error closing LLM manager during shutdown")
 
         try:
-            logger.info("Step 2.5: Closing database...")
-            await self.database.manager.closeAll()
+            if self.llmStatsStorage is not None:
+                logger.info("Step 2.5: Flushing stats storage...")
+                await self.llmStatsStorage.aclose()
+                logger.info("Stats storage flushed...")
+        except Exception:
+            logger.exception("Error flushing stats storage during shutdown")
+
+        try:
+            logger.info("Step 2.6: Closing shared HTTP clients...")
+            await HttpClientRegistry.getInstance().aclose()
+            logger.info("Shared HTTP clients closed...")
+        except Exception:
+            logger.exception("Error closing shared HTTP clients during shutdown")
+
+        try:
+            logger.info("Step 2.7: Closing database...")
+            await self.database.close()
             logger.info("Database closed...")
         except Exception:
             logger.exception("Error closing database during shutdown")
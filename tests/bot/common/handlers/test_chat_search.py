@@ -144,7 +144,9 @@ def _makeDatabase() -> Mock:
     Wires ``chatSearch`` and ``chatEmbeddings.deleteObsoleteModelEmbeddings``
     (the latter as an ``AsyncMock`` so the CRON-job cleanup path, which
     delegates obsolete-embedding deletion to the repository, does not raise
-    when awaited). Tests that exercise the batch-fetch path reassign
+    when awaited), plus the backlog counter and the ``settings`` accessors
+    the backfill engine uses for its progress (unknown backlog, no stored
+    progress). Tests that exercise the batch-fetch path reassign
     ``chatEmbeddings.getMessagesWithoutEmbeddings`` as needed.
 
     Returns:
@@ -155,6 +157,10 @@ def _makeDatabase() -> Mock:
     db.chatSearch = Mock()
     db.chatEmbeddings = Mock()
     db.chatEmbeddings.deleteObsoleteModelEmbeddings = AsyncMock(return_value=True)
+    db.chatEmbeddings.countMessagesWithoutEmbeddings = AsyncMock(return_value=None)
+    db.common = Mock()
+    db.common.getSetting = AsyncMock(return_value=None)
+    db.common.setSetting = AsyncMock(return_value=True)
     return db
 
 
@@ -976,8 +982,12 @@ class TestDtCronJob:
     """Tests for :meth:`ChatSearchHandler._dtCronJob` (embedding backfill).
 
     Covers the construction-time gate (``[search-history].enabled``),
-    the per-chat round-robin, the embedding model resolution, the
-    per-batch fetch + embed loop, and the per-message error isolation.
+    the multi-chat hand-off to the backfill engine, the embedding model
+    resolution, the per-batch fetch + embed loop, and the per-message
+    error isolation. Every tick is followed by
+    ``EmbeddingBackfillEngine.waitIdle`` so the assertions see the
+    finished workers; batch fetches end with an empty page, which marks
+    the chat as completed and lets the workers exit.
     The handler is constructed with the real ``LLMService`` singleton
     (the autouse ``resetLlmServiceSingleton`` fixture has reset it),
     and the database stubs are added on top.
@@ -1004,6 +1014,7 @@ class TestDtCronJob:
                 kwargs={},
             )
         )
+        await handler._backfill.waitIdle()
 
         # The cron job does attempt chat discovery regardless of the
         # ``enabled`` flag — the flag is a construction-time gate only.
@@ -1031,6 +1042,7 @@ class TestDtCronJob:
                 kwargs={},
             )
         )
+        await handler._backfill.waitIdle()
 
         # The discovery query targets EMBEDDINGS_ENABLED specifically.
         mocks["db"].chatSettings.listChatsBySetting.assert_awaited_once_with(key=ChatSettingsKey.EMBEDDINGS_ENABLED)
@@ -1055,6 +1067,7 @@ class TestDtCronJob:
                 kwargs={},
             )
         )
+        await handler._backfill.waitIdle()
 
         mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings.assert_not_called()
 
@@ -1073,6 +1086,7 @@ class TestDtCronJob:
                 kwargs={},
             )
         )
+        await handler._backfill.waitIdle()
 
         mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings.assert_not_called()
 
@@ -1094,6 +1108,7 @@ class TestDtCronJob:
                 kwargs={},
             )
         )
+        await handler._backfill.waitIdle()
 
         mockModel.generateEmbeddings.assert_not_called()
         mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings.assert_not_called()
@@ -1162,12 +1177,13 @@ class TestDtCronJob:
            ``reindex-batch-size`` is configured, and the chat's
            ``EMBEDDING_MODEL`` is forwarded as ``modelName`` so rows
            embedded under a previous model are re-surfaced.
-        3. Each pending message is embedded via the shared
-           ``embedAndSaveMessage`` helper, which calls
-           ``model.generateEmbeddings`` and then persists the vector
-           via ``chatEmbeddings.saveMessageEmbedding`` with the
-           matching ``model`` name (so a future model swap triggers
-           a re-embed for the old rows).
+        3. The pending messages are embedded via the shared
+           ``embedAndSaveMessages`` helper, which calls
+           ``model.generateEmbeddingsBatch`` once for the whole batch
+           and then persists each vector via
+           ``chatEmbeddings.saveMessageEmbedding`` with the matching
+           ``model`` name (so a future model swap triggers a re-embed
+           for the old rows).
         """
         cs = _makeChatSettings(embeddingModel="text-embedding-3-small")
         handler, mocks = _makeHandler(chatSettings=cs)
@@ -1175,14 +1191,14 @@ class TestDtCronJob:
         mockModel = Mock()
         mockModel.supportsEmbedding = True
         mockModel.getDimensions = AsyncMock(return_value=None)
-        mockModel.generateEmbeddings = AsyncMock(side_effect=lambda text: [0.1, 0.2, 0.3])
+        mockModel.generateEmbeddingsBatch = AsyncMock(side_effect=lambda texts: [[0.1, 0.2, 0.3] for _ in texts])
         mockManager = Mock(getModel=Mock(return_value=mockModel))
         cast(Any, handler).llmService.getLLMManager = Mock(return_value=mockManager)
         pairs = [
             self._makePendingMessage(messageId=MessageId(1), messageText="hello world"),
             self._makePendingMessage(messageId=MessageId(2), messageText="another message"),
         ]
-        mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings = AsyncMock(return_value=pairs)
+        mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings = AsyncMock(side_effect=[pairs, []])
         saveMock = AsyncMock()
         cast(Any, mocks["db"]).chatEmbeddings.saveMessageEmbedding = saveMock
         await handler._dtCronJob(
@@ -1193,6 +1209,7 @@ class TestDtCronJob:
                 kwargs={},
             )
         )
+        await handler._backfill.waitIdle()
 
         # The configured model name was resolved.
         mockManager.getModel.assert_called_with("text-embedding-3-small")
@@ -1202,12 +1219,13 @@ class TestDtCronJob:
         getKwargs = mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings.call_args.kwargs
         assert getKwargs["limit"] == BACKFILL_DEFAULT_BATCH_SIZE
         assert getKwargs["modelName"] == "text-embedding-3-small"
-        # Each message was embedded by the model and the result saved
-        # through ``embedAndSaveMessage`` → ``saveMessageEmbedding``.
-        assert mockModel.generateEmbeddings.await_count == 2
+        # Both messages were embedded by one batch call and the results
+        # saved through ``embedAndSaveMessages`` → ``saveMessageEmbedding``.
+        mockModel.generateEmbeddingsBatch.assert_awaited_once()
+        assert len(mockModel.generateEmbeddingsBatch.await_args.args[0]) == 2
         assert saveMock.await_count == 2
         # ``saveMessageEmbedding`` is invoked with keyword args
-        # (see ``embedAndSaveMessage``), so we assert on ``kwargs``.
+        # (see ``embedAndSaveMessages``), so we assert on ``kwargs``.
         saveKwargs = saveMock.await_args_list[0].kwargs
         assert saveKwargs["chatId"] == 100
         assert saveKwargs["model"] == "text-embedding-3-small"
@@ -1217,10 +1235,10 @@ class TestDtCronJob:
         """A single bad row never aborts the rest of the batch.
 
         Verifies the per-message isolation in the shared
-        ``embedAndSaveMessage`` helper: the helper catches every
-        error and returns ``False`` on failure, so the loop continues
-        with the remaining messages. The other rows in the batch
-        must still be embedded and saved.
+        ``embedAndSaveMessages`` helper: when the batch call fails the
+        helper retries every row on its own, catches every error and
+        continues with the remaining messages. The other rows in the
+        batch must still be embedded and saved.
         """
         cs = _makeChatSettings(embeddingModel="text-embedding-3-small")
         handler, mocks = _makeHandler(chatSettings=cs)
@@ -1228,14 +1246,15 @@ class TestDtCronJob:
         mockModel = Mock()
         mockModel.supportsEmbedding = True
         mockModel.getDimensions = AsyncMock(return_value=None)
-        # First call raises, second call succeeds.
+        # The batch call fails, then the per-row fallback: first row raises, second succeeds.
+        mockModel.generateEmbeddingsBatch = AsyncMock(side_effect=RuntimeError("bad input in batch"))
         mockModel.generateEmbeddings = AsyncMock(side_effect=[RuntimeError("embedder down"), [0.4, 0.5, 0.6]])
         cast(Any, handler).llmService.getLLMManager = Mock(return_value=Mock(getModel=Mock(return_value=mockModel)))
         pairs = [
             self._makePendingMessage(messageId=MessageId(1), messageText="bad message"),
             self._makePendingMessage(messageId=MessageId(2), messageText="good message"),
         ]
-        mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings = AsyncMock(return_value=pairs)
+        mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings = AsyncMock(side_effect=[pairs, []])
         saveMock = AsyncMock()
         cast(Any, mocks["db"]).chatEmbeddings.saveMessageEmbedding = saveMock
         await handler._dtCronJob(
@@ -1246,13 +1265,14 @@ class TestDtCronJob:
                 kwargs={},
             )
         )
+        await handler._backfill.waitIdle()
 
         # Both messages were attempted despite the first one's failure.
         assert mockModel.generateEmbeddings.await_count == 2
         # Only the successful row was saved.
         assert saveMock.await_count == 1
         # ``saveMessageEmbedding`` is invoked with keyword args via
-        # ``embedAndSaveMessage``.
+        # ``embedAndSaveMessages``.
         saveKwargs = saveMock.await_args_list[0].kwargs
         assert saveKwargs["chatId"] == 100
         assert saveKwargs["messageId"] == MessageId(2)
@@ -1290,16 +1310,17 @@ class TestDtCronJob:
                 kwargs={},
             )
         )
+        await handler._backfill.waitIdle()
 
         getKwargs = mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings.call_args.kwargs
         assert getKwargs["limit"] == 7
 
-    async def test_cron_round_robin_across_chats(self) -> None:
-        """Subsequent ticks pick the next chat in stable order.
+    async def test_cron_processes_all_chats_in_one_tick(self) -> None:
+        """A single tick hands every eligible chat to the backfill engine.
 
-        The backfill index is a per-instance counter that advances on
-        every tick; with two enabled chats the second tick must pick
-        the second chat. The first tick always picks index 0.
+        With two enabled chats, both are fetched within the same tick,
+        and both end up marked as completed once their backlog page
+        comes back empty.
         """
         cs = _makeChatSettings(embeddingModel="text-embedding-3-small")
         handler, mocks = _makeHandler(chatSettings=cs)
@@ -1309,21 +1330,9 @@ class TestDtCronJob:
         mockModel.getDimensions = AsyncMock(return_value=None)
         mockModel.generateEmbeddings = AsyncMock(return_value=[0.1])
         cast(Any, handler).llmService.getLLMManager = Mock(return_value=Mock(getModel=Mock(return_value=mockModel)))
-        # Empty batch — we just want to assert which chat was picked.
+        # Empty batch — we just want to assert which chats were fetched.
         mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings = AsyncMock(return_value=[])
 
-        # Tick 1: picks chat 100.
-        await handler._dtCronJob(
-            DelayedTask(
-                taskId=f"cron-{id(self)}",
-                delayedUntil=0.0,
-                function=DelayedTaskFunction.CRON_JOB,
-                kwargs={},
-            )
-        )
-        firstGetArgs = mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings.call_args.args
-        assert firstGetArgs[0] == 100
-        # Tick 2: picks chat 200.
         await handler._dtCronJob(
             DelayedTask(
                 taskId=f"cron-{id(self)}",
@@ -1332,8 +1341,12 @@ class TestDtCronJob:
                 kwargs={},
             )
         )
-        secondGetArgs = mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings.call_args.args
-        assert secondGetArgs[0] == 200
+        await handler._backfill.waitIdle()
+
+        fetchedChats = {c.args[0] for c in mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings.call_args_list}
+        assert fetchedChats == {100, 200}
+        stats = {item["chatId"]: item for item in handler._backfill.getStats()}
+        assert stats[100]["completed"] and stats[200]["completed"]
 
     async def test_cron_early_return_on_empty_backlog(self) -> None:
         """Backfill CRON_JOB returns early when no pending messages exist.
@@ -1363,6 +1376,7 @@ class TestDtCronJob:
                 kwargs={},
             )
         )
+        await handler._backfill.waitIdle()
 
         # The handler returns early on empty backlog — no self-reset.
         mocks["db"].chatSettings.setChatSetting.assert_not_called()
@@ -1384,8 +1398,9 @@ class TestDtCronJob:
         mockModel.generateEmbeddings = AsyncMock(return_value=[0.1])
         cast(Any, handler).llmService.getLLMManager = Mock(return_value=Mock(getModel=Mock(return_value=mockModel)))
         # Exactly _reindexBatchSize messages — backlog not yet drained.
+        mockModel.generateEmbeddingsBatch = AsyncMock(side_effect=lambda texts: [[0.1] for _ in texts])
         fullBatch = [self._makePendingMessage(messageId=MessageId(i)) for i in range(BACKFILL_DEFAULT_BATCH_SIZE)]
-        mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings = AsyncMock(return_value=fullBatch)
+        mocks["db"].chatEmbeddings.getMessagesWithoutEmbeddings = AsyncMock(side_effect=[fullBatch, []])
         # Stub saveMessageEmbedding so the embedding loop runs cleanly.
         saveMock = AsyncMock()
         cast(Any, mocks["db"]).chatEmbeddings.saveMessageEmbedding = saveMock
@@ -1400,6 +1415,7 @@ class TestDtCronJob:
                 kwargs={},
             )
         )
+        await handler._backfill.waitIdle()
 
         # The self-reset must NOT fire when the batch is full.
         mocks["db"].chatSettings.setChatSetting.assert_not_called()
@@ -107,7 +107,7 @@ def _makeHandler(
             Defaults to :func:`_makeChatSettings`.
         enabledChats: Chat-discovery result (``chatId -> raw value``)
             returned by ``listChatsBySetting``. Defaults to a single
-            enabled chat (id 100) so the round-robin pick is deterministic.
+            enabled chat (id 100).
         model: Mock embedding model returned by the LLM manager. Defaults
             to a model without ``embeddingDimensions`` (mirrors a plain
             OpenAI-style embedding model).
@@ -134,6 +134,10 @@ def _makeHandler(
     # tick ends immediately after the cleanup block — tests focus on the
     # cleanup delegation, not the embed loop.
     db.chatEmbeddings.getMessagesWithoutEmbeddings = AsyncMock(return_value=[])
+    db.chatEmbeddings.countMessagesWithoutEmbeddings = AsyncMock(return_value=None)
+    db.common = Mock()
+    db.common.getSetting = AsyncMock(return_value=None)
+    db.common.setSetting = AsyncMock(return_value=True)
 
     handler = ChatSearchHandler(
         configManager=cm,
@@ -153,7 +157,7 @@ def _makeHandler(
 
 
 async def _runCron(handler: ChatSearchHandler) -> None:
-    """Invoke ``_dtCronJob`` once with a minimal CRON_JOB task.
+    """Invoke ``_dtCronJob`` once and wait for the backfill workers it started.
 
     Args:
         handler: Handler under test.
@@ -166,6 +170,7 @@ async def _runCron(handler: ChatSearchHandler) -> None:
             kwargs={},
         )
     )
+    await handler._backfill.waitIdle()
 
 
 # ---------------------------------------------------------------------------
@@ -213,9 +218,9 @@ class TestModelChangeCleanup:
         )
 
     async def test_cleanupScopedToCurrentChat(self) -> None:
-        """The ``chatId`` argument matches the chat picked by round-robin.
+        """The ``chatId`` argument matches the enabled chat.
 
-        The backfill tick picks the only enabled chat (here ``999``).
+        The backfill tick sees only one enabled chat (here ``999``).
         The cleanup call must scope to that same chat so it never touches
         another chat's embeddings.
         """
@@ -0,0 +1,147 @@
+"""Tests for per-chat step synchronisation and admission control in HandlersManager, dood!
+
+Covers waking up messages waiting for a step of the previous message,
+in-order removal from the chat queue, the maxTasks admission limit of
+runAsync() and the exposed queue depth / step wait metrics.
+"""
+
+import asyncio
+from typing import List
+from unittest.mock import Mock
+
+from internal.bot.common.handlers.manager import ChatProcessingState, HandlersManager, MessageQueueRecord
+from internal.models import MessageId
+
+
+def _makeMessage(messageId: int) -> Mock:
+    """Create a message stub in chat 100, dood!"""
+    message = Mock()
+    message.messageId = messageId
+    message.threadId = None
+    message.recipient.id = 100
+    return message
+
+
+def _makeManager(maxTasks: int) -> HandlersManager:
+    """Create a HandlersManager with only the task tracking state, dood!"""
+    manager = HandlersManager.__new__(HandlersManager)
+    manager.maxTasks = maxTasks
+    manager.handlerTasks = set()
+    manager.taskSlots = asyncio.Semaphore(maxTasks)
+    manager._waitingForSlot = 0
+    manager._stepWaitStats = {}
+    manager.chatStates = {}
+    return manager
+
+
+async def testAwaitStepDoneWakesUpOnStep():
+    """A waiter is woken up as soon as the awaited step is done, dood!"""
+    record = MessageQueueRecord(_makeMessage(1), Mock())
+    waiter = asyncio.create_task(record.awaitStepDone(1))
+
+    await record.setStepDone(0)
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await record.setStepDone(1)
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+async def testAwaitStepDoneWakesUpOnHandled():
+    """A message finished early (final handler result) releases all later steps, dood!"""
+    record = MessageQueueRecord(_makeMessage(1), Mock())
+    waiter = asyncio.create_task(record.awaitStepDone(5))
+    await asyncio.sleep(0)
+
+    await record.setHandled()
+
+    await asyncio.wait_for(waiter, timeout=1)
+    await asyncio.wait_for(record.awaitStepDone(10), timeout=1)
+
+
+async def testMessagesLeaveQueueInOrder():
+    """A message processed out of order waits until previous messages leave the queue, dood!"""
+    state = ChatProcessingState(chatId=100)
+    first = await state.addMessage(_makeMessage(1), Mock())
+    second = await state.addMessage(_makeMessage(2), Mock())
+    order: List[MessageId] = []
+
+    async def process(record: MessageQueueRecord) -> None:
+        await state.messageProcessed(record)
+        order.append(record.message.messageId)
+
+    secondTask = asyncio.create_task(process(second))
+    await asyncio.sleep(0)
+    assert not secondTask.done()
+    assert await state.getPreviousMessage(second) is first
+
+    await process(first)
+    await asyncio.wait_for(secondTask, timeout=1)
+
+    assert order == [1, 2]
+    assert len(state.queue) == 0
+
+
+async def testRunAsyncAdmitsAtMostMaxTasks():
+    """Tasks beyond maxTasks wait for a slot and start when a task finishes, dood!"""
+    manager = _makeManager(maxTasks=2)
+    release = asyncio.Event()
+    started: List[int] = []
+
+    async def job(index: int) -> None:
+        started.append(index)
+        await release.wait()
+
+    await manager.runAsync(job(0))
+    await manager.runAsync(job(1))
+    third = asyncio.create_task(manager.runAsync(job(2)))
+    await asyncio.sleep(0.01)
+
+    assert started == [0, 1]
+    assert not third.done()
+    assert manager.getStats()["waitingForSlot"] == 1
+
+    release.set()
+    task = await asyncio.wait_for(third, timeout=1)
+    await asyncio.wait_for(task, timeout=1)
+    # Let the done callbacks run
+    await asyncio.sleep(0)
+
+    assert started == [0, 1, 2]
+    assert manager.getStats()["runningTasks"] == 0
+    assert manager.getStats()["waitingForSlot"] == 0
+
+
+async def testRunAsyncFreesSlotOnTimeout():
+    """A task stopped by its timeout frees its slot, dood!"""
+    manager = _makeManager(maxTasks=1)
+
+    task = await manager.runAsync(asyncio.sleep(10), timeout=0.01)
+    await asyncio.gather(task, return_exceptions=True)
+
+    task = await asyncio.wait_for(manager.runAsync(asyncio.sleep(0)), timeout=1)
+    await task
+
+
+async def testStats():
+    """Queue depth and per handler step wait time are reported, dood!"""
+    manager = _makeManager(maxTasks=4)
+    state = ChatProcessingState(chatId=100, queueKey="100:None")
+    manager.chatStates = {"100:None": state, "200:None": ChatProcessingState(chatId=200)}
+    previous = await state.addMessage(_makeMessage(1), Mock())
+    await state.addMessage(_makeMessage(2), Mock())
+
+    waiter = asyncio.create_task(manager._awaitPreviousStep(previous, 0, "LLMMessageHandler"))
+    await asyncio.sleep(0.01)
+    assert manager.getStats()["handlers"]["LLMMessageHandler"]["waiting"] == 1
+
+    await previous.setStepDone(0)
+    await asyncio.wait_for(waiter, timeout=1)
+
+    stats = manager.getStats()
+    assert stats["queueDepth"] == {"100:None": 2}
+    handlerStats = stats["handlers"]["LLMMessageHandler"]
+    assert handlerStats["waits"] == 1
+    assert handlerStats["waiting"] == 0
+    assert handlerStats["maxWait"] >= 0.01
+    assert handlerStats["avgWait"] == handlerStats["maxWait"]
@@ -3,16 +3,18 @@
 The preprocessor sits in the message pipeline immediately after media processing
 and ``saveChatMessage``. Once a message is durably persisted it can optionally
 dispatch a background task that generates and stores an embedding vector
-(``embedAndSaveMessage``) — but only if:
+(``EmbeddingBatcher`` → ``embedAndSaveMessages``) — but only if:
 
 * ``[search-history].enabled`` is true (server-wide feature flag),
 * the per-chat setting ``EMBEDDINGS_ENABLED`` is true (chat opt-in),
 * the message has non-empty text.
 
 This module covers every gate independently, plus the three failure modes of
-``embedAndSaveMessage`` and the never-crash guarantee of the dispatch block.
+``embedAndSaveMessage``, the micro-batching of ``EmbeddingBatcher`` and the
+never-crash guarantee of the dispatch block.
 """
 
+import asyncio
 import datetime
 from typing import Any, cast
 from unittest.mock import AsyncMock, Mock, patch
@@ -520,3 +522,80 @@ class TestEmbedMessage:
         result = await handler.newMessageHandler(ensured, updateObj=Mock())
 
         assert result is HandlerResultStatus.NEXT
+
+
+# ---------------------------------------------------------------------------
+# Tests: EmbeddingBatcher micro-batching
+# ---------------------------------------------------------------------------
+
+
+class TestEmbeddingBatcher:
+    """Tests for the live-path ``EmbeddingBatcher`` used by the preprocessor."""
+
+    @staticmethod
+    def _makeModel() -> Mock:
+        """Build an embedding model mock answering batch calls with one vector per text."""
+        model = Mock()
+        model.supportsEmbedding = True
+        model.generateEmbeddingsBatch = AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+        return model
+
+    @staticmethod
+    def _makeMessage(messageId: int, text: str) -> Mock:
+        """Build an ``EnsuredMessage`` mock whose LLM formatting yields ``text``."""
+        msg = _makeEnsuredMessage(messageId=messageId, messageText=text)
+        msg.formatForLLM = AsyncMock(return_value=text)
+        return msg
+
+    async def testConcurrentSubmitsShareOneBatch(self, handler: MessagePreprocessorHandler) -> None:
+        """Messages submitted while a batch is open are embedded by one batch call.
+
+        Args:
+            handler: Preprocessor fixture.
+        """
+        model = self._makeModel()
+        handler.llmService.getLLMManager().getModel = Mock(return_value=model)  # type: ignore[attr-defined]
+        batcher = handler._embeddingBatcher
+        batcher.maxDelay = 0.01
+
+        results = await asyncio.gather(
+            *[batcher.submit(self._makeMessage(i, "x" * i), "emb-model") for i in range(1, 4)]
+        )
+
+        assert results == [True, True, True]
+        model.generateEmbeddingsBatch.assert_awaited_once()
+        assert model.generateEmbeddingsBatch.await_args.args[0] == ["x", "xx", "xxx"]
+        assert handler.db.chatEmbeddings.saveMessageEmbedding.await_count == 3  # type: ignore[attr-defined]
+
+    async def testFullBatchFlushesWithoutWaiting(self, handler: MessagePreprocessorHandler) -> None:
+        """Reaching ``maxBatchSize`` flushes immediately, before the linger delay.
+
+        Args:
+            handler: Preprocessor fixture.
+        """
+        model = self._makeModel()
+        handler.llmService.getLLMManager().getModel = Mock(return_value=model)  # type: ignore[attr-defined]
+        batcher = handler._embeddingBatcher
+        batcher.maxBatchSize = 2
+        batcher.maxDelay = 60.0
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.submit(self._makeMessage(1, "a"), "m"), batcher.submit(self._makeMessage(2, "b"), "m")
+            ),
+            timeout=5,
+        )
+
+        assert results == [True, True]
+        model.generateEmbeddingsBatch.assert_awaited_once()
+
+    async def testMissingModelResolvesFalse(self, handler: MessagePreprocessorHandler) -> None:
+        """An unknown model resolves every waiter with False instead of raising.
+
+        Args:
+            handler: Preprocessor fixture.
+        """
+        handler._embeddingBatcher.maxDelay = 0.0
+
+        assert await handler._embeddingBatcher.submit(self._makeMessage(1, "a"), "missing") is False
+        handler.db.chatEmbeddings.saveMessageEmbedding.assert_not_called()  # type: ignore[attr-defined]
@@ -0,0 +1,223 @@
+"""Tests for the map-reduce pipeline of :class:`SummarizationHandler`.
+
+Covers ``_doSummarization``: concurrent batch summarization bounded by
+``SUMMARIZATION_MAX_PARALLEL_BATCHES``, streaming of partial summaries in
+chronological order, the final reduce step, and reuse of per-batch summaries
+cached in ``chat_summarization_cache``. The database, LLM service, model and
+message sending are stubbed at the instance level.
+"""
+
+import asyncio
+import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from internal.bot import constants
+from internal.bot.common.handlers.summarization import SummarizationHandler
+from internal.bot.models import (
+    BotProvider,
+    ChatSettingsDict,
+    ChatSettingsKey,
+    ChatSettingsValue,
+    ChatType,
+    EnsuredMessage,
+    MessageRecipient,
+    MessageSender,
+)
+from internal.models import MessageId
+from lib.ai import ModelMessage
+
+CHAT_ID = 100
+
+
+class FakeModel:
+    """Model stub counting every message as ``tokensPerMessage`` tokens."""
+
+    def __init__(self, contextSize: int, tokensPerMessage: int = 10) -> None:
+        self.contextSize = contextSize
+        self.tokensPerMessage = tokensPerMessage
+
+    def getEstimateMessageTokensCount(self, message: ModelMessage) -> int:
+        return self.tokensPerMessage
+
+
+class FakeLLMService:
+    """``generateText`` stub tracking concurrency of the requests."""
+
+    def __init__(self, delay: float = 0.01) -> None:
+        self.delay = delay
+        self.active = 0
+        self.maxActive = 0
+        self.requests: List[List[ModelMessage]] = []
+
+    async def generateText(self, prompt: Sequence[ModelMessage], **kwargs: Any) -> Mock:
+        self.requests.append(list(prompt))
+        self.active += 1
+        self.maxActive = max(self.maxActive, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if prompt[0].content == "reduce":
+            resultText = "merged(" + "+".join(str(msg.content) for msg in prompt[1:]) + ")"
+        else:
+            resultText = f"summary({prompt[1].content}..{prompt[-1].content})"
+        return Mock(resultText=resultText, isFallback=False)
+
+
+class FakeSummarizationRepository:
+    """In-memory ``chatSummarization`` repository."""
+
+    def __init__(self) -> None:
+        self.entries: Dict[Tuple[Optional[int], int, int, str], str] = {}
+
+    async def getChatSummarization(
+        self, chatId: int, topicId: Optional[int], firstMessageId: int, lastMessageId: int, prompt: str
+    ) -> Optional[Dict[str, Any]]:
+        summary = self.entries.get((topicId, firstMessageId, lastMessageId, prompt))
+        return {"summary": summary} if summary is not None else None
+
+    async def addChatSummarization(
+        self, chatId: int, topicId: Optional[int], firstMessageId: int, lastMessageId: int, prompt: str, summary: str
+    ) -> bool:
+        self.entries[(topicId, firstMessageId, lastMessageId, prompt)] = summary
+        return True
+
+
+def _makeChatSettings(model: FakeModel) -> ChatSettingsDict:
+    """Build chat settings with every key the summarization path reads."""
+    modelValue = Mock()
+    modelValue.toModel = Mock(return_value=model)
+    return {
+        ChatSettingsKey.SUMMARY_MODEL: modelValue,
+        ChatSettingsKey.SUMMARY_PROMPT: ChatSettingsValue("summarize"),
+        ChatSettingsKey.SUMMARY_REDUCE_PROMPT: ChatSettingsValue("reduce"),
+        ChatSettingsKey.FALLBACK_HAPPENED_PREFIX: ChatSettingsValue("[fallback]"),
+        ChatSettingsKey.INTERMEDIATE_MESSAGE_PREFIX: ChatSettingsValue("[part]"),
+    }
+
+
+def _makeEnsuredMessage() -> EnsuredMessage:
+    """Build the message the summary replies to."""
+    return EnsuredMessage(
+        sender=MessageSender(id=7, name="Alice", username="@alice"),
+        recipient=MessageRecipient(id=CHAT_ID, chatType=ChatType.GROUP),
+        messageId=MessageId(1000),
+        date=datetime.datetime(2026, 5, 5, 12, 0, 0, tzinfo=datetime.timezone.utc),
+        messageText="/summary",
+    )
+
+
+def _makeHandler(
+    monkeypatch: pytest.MonkeyPatch, messagesCount: int
+) -> Tuple[SummarizationHandler, FakeLLMService, FakeSummarizationRepository, AsyncMock]:
+    """Construct a handler over ``messagesCount`` stored messages with ids ``1..messagesCount``.
+
+    Returns:
+        Tuple ``(handler, llmService, summarizationRepository, sendMessageMock)``.
+    """
+    db = Mock()
+    # Repository returns newest messages first
+    db.chatMessages.getChatMessagesSince = AsyncMock(
+        return_value=[{"message_id": i} for i in range(messagesCount, 0, -1)]
+    )
+    repository = FakeSummarizationRepository()
+    db.chatSummarization = repository
+
+    configManager = Mock()
+    configManager.getBotConfig = Mock(return_value={"token": "test", "owners": []})
+    handler = SummarizationHandler(configManager=configManager, database=db, botProvider=BotProvider.TELEGRAM)
+
+    llmService = FakeLLMService()
+    cast(Any, handler).llmService = llmService
+    sendMessageMock = AsyncMock(return_value=[])
+    cast(Any, handler).sendMessage = sendMessageMock
+
+    async def fromDBChatMessages(msgs: List[Dict[str, Any]], db: Any, **kwargs: Any) -> List[Mock]:
+        ensuredList: List[Mock] = []
+        for msg in msgs:
+            ensured = Mock()
+            ensured.formatForLLM = AsyncMock(return_value=f"m{msg['message_id']}")
+            ensuredList.append(ensured)
+        return ensuredList
+
+    monkeypatch.setattr(EnsuredMessage, "fromDBChatMessages", staticmethod(fromDBChatMessages))
+    monkeypatch.setattr(asyncio, "sleep", _fastSleep)
+    return handler, llmService, repository, sendMessageMock
+
+
+_realSleep = asyncio.sleep
+
+
+async def _fastSleep(delay: float, *args: Any) -> Any:
+    """Skip the pause between sent messages but keep the LLM stub delay."""
+    return await _realSleep(min(delay, 0.01), *args)
+
+
+def _sentTexts(sendMessageMock: AsyncMock) -> List[str]:
+    return [call.kwargs["messageText"] for call in sendMessageMock.await_args_list]
+
+
+async def _summarize(handler: SummarizationHandler, settings: ChatSettingsDict, useCache: bool = True) -> None:
+    await handler._doSummarization(
+        _makeEnsuredMessage(),
+        chatId=CHAT_ID,
+        threadId=None,
+        chatSettings=settings,
+        maxMessages=1000,
+        useCache=useCache,
+        typingManager=Mock(),
+    )
+
+
+async def testSingleBatchIsSentWithoutReduce(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A history fitting into one batch is summarized with a single request."""
+    handler, llmService, _, sendMessageMock = _makeHandler(monkeypatch, messagesCount=5)
+
+    await _summarize(handler, _makeChatSettings(FakeModel(contextSize=10_000)))
+
+    assert len(llmService.requests) == 1
+    assert _sentTexts(sendMessageMock) == ["summary(m1..m5)"]
+
+
+async def testBatchesRunConcurrentlyAndAreReduced(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Batches are summarized in parallel, streamed in order and merged at the end."""
+    handler, llmService, _, sendMessageMock = _makeHandler(monkeypatch, messagesCount=40)
+    # 40 messages of 10 tokens with a 50 tokens context: batches of 4 messages
+    settings = _makeChatSettings(FakeModel(contextSize=50))
+
+    await _summarize(handler, settings, useCache=False)
+
+    mapRequests = [req for req in llmService.requests if req[0].content == "summarize"]
+    assert len(mapRequests) == 10
+    assert 1 < llmService.maxActive <= constants.SUMMARIZATION_MAX_PARALLEL_BATCHES
+
+    sent = _sentTexts(sendMessageMock)
+    partials = [text for text in sent if text.startswith("[part] ")]
+    assert partials == [f"[part] summary(m{i}..m{i + 3})" for i in range(1, 41, 4)]
+    assert sent[: len(partials)] == partials
+    # Partial summaries did not fit into one reduce request, so they were merged in groups
+    assert sent[-1].startswith("merged(merged(summary(m1..m4)")
+    assert sent[-1].count("summary(") == 10
+
+
+async def testBatchSummariesAreReusedFromCache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Batches cached by a previous run are not sent to the LLM again."""
+    handler, llmService, repository, _ = _makeHandler(monkeypatch, messagesCount=40)
+    settings = _makeChatSettings(FakeModel(contextSize=50))
+    batchPrompt = constants.SUMMARIZATION_BATCH_CACHE_PREFIX + "summarize"
+    repository.entries[(None, 1, 4, batchPrompt)] = "cached(m1..m4)"
+    repository.entries[(None, 5, 8, batchPrompt)] = "cached(m5..m8)"
+
+    await _summarize(handler, settings)
+
+    mapRequests = [req for req in llmService.requests if req[0].content == "summarize"]
+    assert len(mapRequests) == 8
+    assert repository.entries[(None, 37, 40, batchPrompt)] == "summary(m37..m40)"
+    # The whole run is cached as well and replayed on the next request
+    assert (None, 1, 40, "summarize") in repository.entries
+    llmService.requests.clear()
+    await _summarize(handler, settings)
+    assert llmService.requests == []
@@ -0,0 +1,213 @@
+"""Tests for :mod:`internal.bot.common.embedding_backfill`.
+
+Covers the backfill engine driven by ``ChatSearchHandler._dtCronJob``:
+- ``_EmbeddingsBudget``: global embeddings-per-second pacing
+- ``EmbeddingBackfillEngine``: priority order, resumable per-chat cursor
+  persisted in the ``settings`` table, model switches, per-chat stats
+"""
+
+import datetime
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, Mock, patch
+
+from internal.bot.common.embedding_backfill import (
+    BACKFILL_SETTINGS_KEY_PREFIX,
+    EmbeddingBackfillEngine,
+    _EmbeddingsBudget,
+)
+from internal.database.models import MessageCategory
+from internal.models import MessageId
+
+_BASE_DATE = datetime.datetime(2026, 5, 5, 12, 0, 0, tzinfo=datetime.timezone.utc)
+
+
+def _makeRow(chatId: int, messageId: int) -> Dict[str, Any]:
+    """Build a ``ChatMessageDict``-shaped pending row."""
+    return {
+        "chat_id": chatId,
+        "message_id": MessageId(messageId),
+        "date": _BASE_DATE - datetime.timedelta(minutes=messageId),
+        "user_id": 7,
+        "reply_id": None,
+        "thread_id": 0,
+        "root_message_id": None,
+        "message_text": f"message {messageId}",
+        "message_type": "text",
+        "message_category": MessageCategory.USER,
+        "quote_text": None,
+        "media_id": None,
+        "created_at": _BASE_DATE,
+        "metadata": "",
+        "markup": "",
+        "full_name": "Alice",
+        "username": "alice",
+        "media_group_id": None,
+    }
+
+
+def _makeDatabase(pages: Dict[int, List[List[Dict[str, Any]]]], backlogs: Dict[int, int]) -> Mock:
+    """Build a ``Database`` stub serving ``pages[chatId]`` one page per fetch."""
+    db = Mock()
+    db.chatEmbeddings = Mock()
+
+    async def getPending(chatId: int, **kwargs: Any) -> List[Dict[str, Any]]:
+        chatPages = pages.get(chatId, [])
+        return chatPages.pop(0) if chatPages else []
+
+    async def countPending(chatId: int, **kwargs: Any) -> int:
+        return backlogs.get(chatId, 0)
+
+    db.chatEmbeddings.getMessagesWithoutEmbeddings = AsyncMock(side_effect=getPending)
+    db.chatEmbeddings.countMessagesWithoutEmbeddings = AsyncMock(side_effect=countPending)
+    db.common = Mock()
+    db.common.getSetting = AsyncMock(return_value=None)
+    db.common.setSetting = AsyncMock(return_value=True)
+    return db
+
+
+def _embedAll() -> AsyncMock:
+    """Stand-in for ``embedAndSaveMessages`` that succeeds for every message."""
+    return AsyncMock(side_effect=lambda ensuredMessages, modelName, db, **kwargs: [True] * len(ensuredMessages))
+
+
+class TestEmbeddingsBudget:
+    """Test suite for _EmbeddingsBudget."""
+
+    async def testUnlimitedBudgetNeverSleeps(self) -> None:
+        """A non-positive rate disables pacing."""
+        budget = _EmbeddingsBudget(0)
+        with patch("internal.bot.common.embedding_backfill.asyncio.sleep", new=AsyncMock()) as sleepMock:
+            await budget.acquire(1000)
+        sleepMock.assert_not_awaited()
+
+    async def testReservationsAreSerialised(self) -> None:
+        """The second reservation waits for the first one's share of the timeline."""
+        budget = _EmbeddingsBudget(100)
+        with patch("internal.bot.common.embedding_backfill.asyncio.sleep", new=AsyncMock()) as sleepMock:
+            await budget.acquire(50)
+            await budget.acquire(50)
+
+        sleepMock.assert_awaited_once()
+        assert sleepMock.await_args is not None
+        assert 0.4 < sleepMock.await_args.args[0] <= 0.5
+
+
+class TestEmbeddingBackfillEngine:
+    """Test suite for EmbeddingBackfillEngine."""
+
+    async def testBiggerBacklogGoesFirst(self) -> None:
+        """With one worker, the chat with the bigger backlog is fetched first."""
+        db = _makeDatabase(pages={}, backlogs={1: 5, 2: 500})
+        engine = EmbeddingBackfillEngine(db, workers=1)
+
+        await engine.syncChats({1: "m", 2: "m"})
+        engine.start()
+        await engine.waitIdle()
+
+        fetched = [c.args[0] for c in db.chatEmbeddings.getMessagesWithoutEmbeddings.call_args_list]
+        assert fetched == [2, 1]
+
+    async def testRecentActivityBoostsPriority(self) -> None:
+        """A recently active chat overtakes a bigger idle backlog."""
+        db = _makeDatabase(pages={}, backlogs={1: 50, 2: 100})
+        engine = EmbeddingBackfillEngine(db, workers=1, activityBoost=4.0)
+
+        await engine.syncChats({1: "m", 2: "m"})
+        engine.noteActivity(1)
+        engine.start()
+        await engine.waitIdle()
+
+        fetched = [c.args[0] for c in db.chatEmbeddings.getMessagesWithoutEmbeddings.call_args_list]
+        assert fetched == [1, 2]
+
+    async def testCursorAdvancesAndIsPersisted(self) -> None:
+        """Each batch resumes below the previous one and saves its cursor."""
+        pages = {1: [[_makeRow(1, 1), _makeRow(1, 2)], [_makeRow(1, 3)]]}
+        db = _makeDatabase(pages=pages, backlogs={1: 3})
+        engine = EmbeddingBackfillEngine(db, workers=2, batchSize=2)
+
+        with patch("internal.bot.common.embedding_backfill.embedAndSaveMessages", new=_embedAll()):
+            await engine.syncChats({1: "m"})
+            engine.start()
+            await engine.waitIdle()
+
+        calls = db.chatEmbeddings.getMessagesWithoutEmbeddings.call_args_list
+        assert len(calls) == 3
+        assert calls[0].kwargs["beforeMessageId"] is None
+        assert calls[1].kwargs["beforeMessageId"] == MessageId(2)
+        assert calls[1].kwargs["beforeDate"] == _makeRow(1, 2)["date"]
+        assert calls[2].kwargs["beforeMessageId"] == MessageId(3)
+
+        savedKey, savedValue = db.common.setSetting.await_args_list[0].args
+        assert savedKey == f"{BACKFILL_SETTINGS_KEY_PREFIX}1"
+        assert json.loads(savedValue)["cursorMessageId"] == "2"
+
+        stats = engine.getStats()[0]
+        assert stats["embedded"] == 3
+        assert stats["backlog"] == 0
+        assert stats["completed"] is True
+        assert stats["eta"] == 0.0
+
+    async def testRestartResumesFromPersistedCursor(self) -> None:
+        """Stored progress of the same model is resumed, not rescanned."""
+        db = _makeDatabase(pages={}, backlogs={1: 10})
+        db.common.getSetting = AsyncMock(
+            return_value=json.dumps(
+                {
+                    "model": "m",
+                    "cursorDate": _BASE_DATE.isoformat(),
+                    "cursorMessageId": "42",
+                    "completedAt": None,
+                    "embedded": 7,
+                }
+            )
+        )
+        engine = EmbeddingBackfillEngine(db)
+
+        await engine.syncChats({1: "m"})
+        engine.start()
+        await engine.waitIdle()
+
+        firstCall = db.chatEmbeddings.getMessagesWithoutEmbeddings.call_args_list[0]
+        assert firstCall.kwargs["beforeDate"] == _BASE_DATE
+        assert firstCall.kwargs["beforeMessageId"] == MessageId(42)
+        assert engine.getStats()[0]["embedded"] == 7
+
+    async def testStoredProgressOfOtherModelIsIgnored(self) -> None:
+        """A model switch restarts the chat from its newest message."""
+        db = _makeDatabase(pages={}, backlogs={1: 10})
+        db.common.getSetting = AsyncMock(
+            return_value=json.dumps({"model": "old", "cursorDate": _BASE_DATE.isoformat(), "cursorMessageId": "42"})
+        )
+        engine = EmbeddingBackfillEngine(db)
+
+        await engine.syncChats({1: "new"})
+        engine.start()
+        await engine.waitIdle()
+
+        firstCall = db.chatEmbeddings.getMessagesWithoutEmbeddings.call_args_list[0]
+        assert firstCall.kwargs["beforeDate"] is None
+        assert firstCall.kwargs["modelName"] == "new"
+
+    async def testChatWithoutBacklogIsNotFetched(self) -> None:
+        """A chat whose backlog counts as zero is completed without a fetch."""
+        db = _makeDatabase(pages={}, backlogs={1: 0})
+        engine = EmbeddingBackfillEngine(db)
+
+        await engine.syncChats({1: "m"})
+        engine.start()
+        await engine.waitIdle()
+
+        db.chatEmbeddings.getMessagesWithoutEmbeddings.assert_not_called()
+        assert engine.getStats()[0]["completed"] is True
+
+    async def testIneligibleChatsAreDropped(self) -> None:
+        """Chats missing from the next sync disappear from the stats."""
+        db = _makeDatabase(pages={}, backlogs={1: 0, 2: 0})
+        engine = EmbeddingBackfillEngine(db)
+
+        await engine.syncChats({1: "m", 2: "m"})
+        await engine.syncChats({2: "m"})
+
+        assert [item["chatId"] for item in engine.getStats()] == [2]
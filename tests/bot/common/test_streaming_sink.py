@@ -0,0 +1,218 @@
+"""
+Tests for StreamingMessageSink, dood!
+
+Covers the first draft threshold, replies which are never streamed, edit
+throttling, splitting at the message length limit, finalizing drafts into
+the saved reply and discarding them.
+"""
+
+from typing import List
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from internal.bot import constants
+from internal.bot.common.streaming_sink import StreamingMessageSink
+from internal.bot.models import BotProvider, ChatType
+from internal.database.models import MessageCategory
+from lib.ai import ModelMessage, ModelResultChunk, ModelResultStatus, ModelRunResult
+
+
+def _makeMessage(messageId: int) -> Mock:
+    """Create a sent message stub."""
+    message = Mock()
+    message.messageId = messageId
+    message.recipient.id = 100
+    message.metadata = {}
+    return message
+
+
+@pytest.fixture
+def bot() -> Mock:
+    """Create a bot stub numbering sent messages from 1."""
+    bot = Mock()
+    bot.botProvider = BotProvider.TELEGRAM
+    sentIds: List[int] = []
+
+    async def sendMessage(**kwargs) -> List[Mock]:
+        sentIds.append(len(sentIds) + 1)
+        return [_makeMessage(sentIds[-1])]
+
+    bot.sendMessage = AsyncMock(side_effect=sendMessage)
+    bot.editMessage = AsyncMock(return_value=True)
+    bot.deleteMessagesById = AsyncMock(return_value=True)
+    return bot
+
+
+@pytest.fixture
+def handler() -> Mock:
+    """Create a handler stub."""
+    handler = Mock()
+    handler.sendMessage = AsyncMock(side_effect=lambda *args, **kwargs: [_makeMessage(99)])
+    handler.saveChatMessage = AsyncMock(return_value=True)
+    return handler
+
+
+@pytest.fixture
+def replyToMessage() -> Mock:
+    """Create the user message being answered."""
+    message = Mock()
+    message.recipient.id = 100
+    message.recipient.chatType = ChatType.PRIVATE
+    return message
+
+
+def _sink(handler: Mock, bot: Mock, replyToMessage: Mock, **kwargs) -> StreamingMessageSink:
+    kwargs.setdefault("editInterval", 0)
+    kwargs.setdefault("minDraftLength", 5)
+    return StreamingMessageSink(handler, bot, replyToMessage, **kwargs)
+
+
+class TestStreamingMessageSink:
+    """Test suite for StreamingMessageSink."""
+
+    def testLimitsByPlatform(self) -> None:
+        """Edit intervals and message lengths follow the platform and chat type."""
+        assert (
+            StreamingMessageSink.getEditInterval(BotProvider.TELEGRAM, ChatType.PRIVATE)
+            == constants.STREAMING_EDIT_INTERVAL_TELEGRAM_PRIVATE
+        )
+        assert (
+            StreamingMessageSink.getEditInterval(BotProvider.TELEGRAM, ChatType.GROUP)
+            == constants.STREAMING_EDIT_INTERVAL_TELEGRAM_GROUP
+        )
+        assert (
+            StreamingMessageSink.getEditInterval(BotProvider.MAX, ChatType.GROUP)
+            == constants.STREAMING_EDIT_INTERVAL_MAX
+        )
+        assert StreamingMessageSink.getMaxLength(BotProvider.TELEGRAM) == constants.TELEGRAM_MAX_MESSAGE_LENGTH
+
+    async def testFirstDraftAfterMinLength(self, handler: Mock, bot: Mock, replyToMessage: Mock) -> None:
+        """Nothing is sent until enough text arrived, then a plain-text draft is sent."""
+        sink = _sink(handler, bot, replyToMessage)
+
+        await sink.feed(ModelResultChunk(textDelta="Hi"))
+        bot.sendMessage.assert_not_awaited()
+
+        await sink.feed(ModelResultChunk(textDelta=" there"))
+        bot.sendMessage.assert_awaited_once()
+        assert bot.sendMessage.call_args.kwargs["messageText"] == "Hi there"
+        assert bot.sendMessage.call_args.kwargs["tryMarkdownV2"] is False
+        assert sink.hasDrafts()
+
+        await sink.feed(ModelResultChunk(textDelta="!"))
+        bot.editMessage.assert_awaited_once()
+        assert bot.editMessage.call_args.kwargs["text"] == "Hi there!"
+
+    async def testFinalChunkIsIgnored(self, handler: Mock, bot: Mock, replyToMessage: Mock) -> None:
+        """The chunk carrying the result doesn't add text."""
+        sink = _sink(handler, bot, replyToMessage)
+
+        await sink.feed(
+            ModelResultChunk(
+                textDelta="Whole reply at once",
+                result=ModelRunResult(rawResult=None, status=ModelResultStatus.FINAL, resultText="Whole reply at once"),
+            )
+        )
+
+        bot.sendMessage.assert_not_awaited()
+        assert await sink.finalize("Whole reply at once") is None
+
+    @pytest.mark.parametrize("text", ['{"text": "hello"}', "```\n{ }", "<media-description>cat", "[web_search]"])
+    async def testRepliesNeedingPostProcessingAreNotStreamed(
+        self, handler: Mock, bot: Mock, replyToMessage: Mock, text: str
+    ) -> None:
+        """JSON, image and tool call replies are sent only after post-processing."""
+        sink = _sink(handler, bot, replyToMessage)
+
+        await sink.feed(ModelResultChunk(textDelta=text))
+        await sink.feed(ModelResultChunk(textDelta=" and more text"))
+
+        bot.sendMessage.assert_not_awaited()
+        assert await sink.finalize("hello") is None
+        assert not sink.disabled
+
+    async def testEditsAreThrottled(self, handler: Mock, bot: Mock, replyToMessage: Mock) -> None:
+        """Within editInterval the text is collected without editing."""
+        sink = _sink(handler, bot, replyToMessage, editInterval=3600)
+
+        await sink.feed(ModelResultChunk(textDelta="First part"))
+        await sink.feed(ModelResultChunk(textDelta=", second part"))
+        await sink.feed(ModelResultChunk(textDelta=", third part"))
+
+        bot.sendMessage.assert_awaited_once()
+        bot.editMessage.assert_not_awaited()
+        assert sink.text == "First part, second part, third part"
+
+    async def testLongTextIsSplit(self, handler: Mock, bot: Mock, replyToMessage: Mock) -> None:
+        """Text beyond maxLength goes into additional drafts."""
+        sink = _sink(handler, bot, replyToMessage, maxLength=10)
+
+        await sink.feed(ModelResultChunk(textDelta="0123456789abcdefghij"))
+        await sink.feed(ModelResultChunk(textDelta="XYZ"))
+
+        assert [call.kwargs["messageText"] for call in bot.sendMessage.call_args_list] == [
+            "0123456789",
+            "abcdefghij",
+            "XYZ",
+        ]
+        assert sink.shownParts == ["0123456789", "abcdefghij", "XYZ"]
+
+    async def testFinalize(self, handler: Mock, bot: Mock, replyToMessage: Mock) -> None:
+        """Drafts are edited to the final text with Markdown and saved, extra parts are sent."""
+        draftMessage = _makeMessage(1)
+        setMessagePrefix = Mock()
+        draftMessage.setMessagePrefix = setMessagePrefix
+        bot.sendMessage = AsyncMock(return_value=[draftMessage])
+        sink = _sink(handler, bot, replyToMessage, maxLength=12)
+        await sink.feed(ModelResultChunk(textDelta="Draft text"))
+        toolsHistory = [ModelMessage(role="tool", content="42", toolCallId="1")]
+
+        ret = await sink.finalize("0123456789abcdef", prefix="> ", toolsHistory=toolsHistory)
+
+        assert ret is not None and len(ret) == 2
+        assert bot.editMessage.call_args.kwargs == {"text": "> 0123456789", "useMarkdown": True}
+        handler.sendMessage.assert_awaited_once()
+        assert handler.sendMessage.call_args.kwargs["messageText"] == "abcdef"
+        assert handler.sendMessage.call_args.kwargs["addMessagePrefix"] == "> "
+
+        draft = ret[0]
+        assert draft is draftMessage
+        assert draft.messageText == "0123456789"
+        setMessagePrefix.assert_called_once_with("> ")
+        assert draft.metadata.get("usedTools") == [toolsHistory[0].toDict()]
+        handler.saveChatMessage.assert_awaited_once_with(draft, messageCategory=MessageCategory.BOT)
+        assert not sink.hasDrafts()
+
+    async def testFinalizeFallsBackToPlainText(self, handler: Mock, bot: Mock, replyToMessage: Mock) -> None:
+        """A rejected Markdown edit is retried as plain text."""
+        sink = _sink(handler, bot, replyToMessage)
+        await sink.feed(ModelResultChunk(textDelta="Draft text"))
+        bot.editMessage.side_effect = [RuntimeError("can't parse entities"), True]
+
+        await sink.finalize("*Final* text")
+
+        assert [call.kwargs["useMarkdown"] for call in bot.editMessage.call_args_list] == [True, False]
+        handler.saveChatMessage.assert_awaited_once()
+
+    async def testFinalizeDeletesSurplusDrafts(self, handler: Mock, bot: Mock, replyToMessage: Mock) -> None:
+        """Drafts not needed for the (shorter) final text are deleted."""
+        sink = _sink(handler, bot, replyToMessage, maxLength=10)
+        await sink.feed(ModelResultChunk(textDelta="0123456789abcdefghij"))
+
+        ret = await sink.finalize("short")
+
+        assert ret is not None and len(ret) == 1
+        bot.deleteMessagesById.assert_awaited_once_with(100, [2])
+
+    async def testDiscard(self, handler: Mock, bot: Mock, replyToMessage: Mock) -> None:
+        """Discarding deletes the drafts and the sink can stream the next reply."""
+        sink = _sink(handler, bot, replyToMessage)
+        await sink.feed(ModelResultChunk(textDelta="Intermediate text"))
+
+        await sink.discard()
+
+        bot.deleteMessagesById.assert_awaited_once_with(100, [1])
+        assert not sink.hasDrafts()
+        assert sink.text == ""
+        handler.saveChatMessage.assert_not_awaited()
@@ -0,0 +1,148 @@
+"""Tests for the batch conversion of database messages to EnsuredMessage, dood!
+
+Covers EnsuredMessage.fromDBChatMessages() loading media groups and
+attachments with batch queries, formatForLLM() reusing the shared
+MediaAttachmentLookup instead of querying per media item, and pending media
+still being polled from the database.
+"""
+
+import datetime
+import json
+from typing import Any, Dict, List, Optional, Sequence
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import internal.bot.models.ensured_message as ensuredMessageModule
+from internal.bot.models import EnsuredMessage, LLMMessageFormat, MediaAttachmentLookup
+from internal.database.models import MediaStatus
+
+_NOW = datetime.datetime.now(datetime.timezone.utc)
+
+
+def _makeAttachment(mediaId: str, description: str, status: MediaStatus = MediaStatus.DONE) -> Dict[str, Any]:
+    """Create a media attachment row, dood!"""
+    return {
+        "file_unique_id": mediaId,
+        "file_id": f"file-{mediaId}",
+        "file_size": None,
+        "media_type": "image",
+        "metadata": "{}",
+        "status": status,
+        "mime_type": None,
+        "local_url": None,
+        "prompt": None,
+        "description": description,
+        "created_at": _NOW,
+        "updated_at": _NOW,
+    }
+
+
+def _makeRow(
+    messageId: int, *, mediaId: Optional[str] = None, mediaGroupId: Optional[str] = None, text: str = ""
+) -> Dict[str, Any]:
+    """Create a chat message row, dood!"""
+    return {
+        "chat_id": -100,
+        "message_id": messageId,
+        "date": _NOW,
+        "user_id": 42,
+        "username": "@alice",
+        "full_name": "Alice",
+        "reply_id": None,
+        "thread_id": 0,
+        "root_message_id": None,
+        "message_text": text,
+        "message_type": "image" if mediaId or mediaGroupId else "text",
+        "message_category": "user",
+        "quote_text": None,
+        "media_id": mediaId,
+        "created_at": _NOW,
+        "metadata": "",
+        "markup": "",
+        "media_group_id": mediaGroupId,
+    }
+
+
+def _makeDatabase(attachments: Dict[str, Dict[str, Any]], groups: Dict[str, List[str]]) -> Mock:
+    """Create a database stub serving the given attachments and media groups, dood!"""
+
+    async def getByIds(mediaIds: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        return {mediaId: attachments[mediaId] for mediaId in mediaIds if mediaId in attachments}
+
+    async def getByGroupIds(mediaGroupIds: Sequence[str]) -> Dict[str, List[Dict[str, Any]]]:
+        return {groupId: [attachments[mediaId] for mediaId in groups.get(groupId, [])] for groupId in mediaGroupIds}
+
+    db = Mock()
+    db.mediaAttachments.getMediaAttachmentsByIds = AsyncMock(side_effect=getByIds)
+    db.mediaAttachments.getMediaAttachmentsByGroupIds = AsyncMock(side_effect=getByGroupIds)
+    db.mediaAttachments.getMediaAttachment = AsyncMock(side_effect=lambda mediaId: attachments.get(mediaId))
+    db.mediaAttachments.getMediaAttachmentsByGroupId = AsyncMock(
+        side_effect=lambda groupId: [attachments[mediaId] for mediaId in groups.get(groupId, [])]
+    )
+    return db
+
+
+async def testBatchConversionUsesBatchQueries():
+    """Converting and formatting a batch costs two queries whatever its size, dood!"""
+    attachments = {
+        "photo": _makeAttachment("photo", "a cat"),
+        "album-1": _makeAttachment("album-1", "a dog"),
+        "album-2": _makeAttachment("album-2", "a parrot"),
+    }
+    db = _makeDatabase(attachments, {"album": ["album-1", "album-2"]})
+    rows = [
+        _makeRow(1, mediaId="photo"),
+        _makeRow(2, mediaGroupId="album"),
+        _makeRow(3, text="just text"),
+    ] + [_makeRow(100 + i, mediaId="photo") for i in range(50)]
+
+    mediaLookup = MediaAttachmentLookup(db)
+    eMessages = await EnsuredMessage.fromDBChatMessages(rows, db, mediaLookup=mediaLookup)  # type: ignore[arg-type]
+    formatted = [
+        json.loads(
+            await eMessage.formatForLLM(db, LLMMessageFormat.JSON, useSingleMedia=False, mediaLookup=mediaLookup)
+        )
+        for eMessage in eMessages
+    ]
+
+    assert [eMessage.messageId.asMessageId() for eMessage in eMessages[:3]] == [1, 2, 3]
+    assert formatted[0]["mediaDescription"] == ["a cat"]
+    assert formatted[1]["mediaDescription"] == ["a dog", "a parrot"]
+    assert "mediaDescription" not in formatted[2]
+
+    db.mediaAttachments.getMediaAttachmentsByIds.assert_awaited_once()
+    db.mediaAttachments.getMediaAttachmentsByGroupIds.assert_awaited_once_with(["album"])
+    db.mediaAttachments.getMediaAttachment.assert_not_awaited()
+    db.mediaAttachments.getMediaAttachmentsByGroupId.assert_not_awaited()
+
+
+async def testSingleConversionKeepsPerMessageQueries():
+    """Without a lookup fromDBChatMessage() queries the media group as before, dood!"""
+    attachments = {"album-1": _makeAttachment("album-1", "a dog")}
+    db = _makeDatabase(attachments, {"album": ["album-1"]})
+
+    eMessage = await EnsuredMessage.fromDBChatMessage(_makeRow(1, mediaGroupId="album"), db)  # type: ignore[arg-type]
+
+    assert [media.content for media in eMessage.mediaList] == ["a dog"]
+    db.mediaAttachments.getMediaAttachmentsByGroupId.assert_awaited_once_with("album")
+    db.mediaAttachments.getMediaAttachmentsByGroupIds.assert_not_awaited()
+
+
+async def testPendingMediaIsPolledFromDatabase(monkeypatch: pytest.MonkeyPatch):
+    """A prefetched pending attachment doesn't hide the finished description, dood!"""
+    monkeypatch.setattr(ensuredMessageModule, "MEDIA_AWAIT_DELAY", 0)
+    attachments = {"photo": _makeAttachment("photo", "", status=MediaStatus.PENDING)}
+    db = _makeDatabase(attachments, {})
+
+    mediaLookup = MediaAttachmentLookup(db)
+    (eMessage,) = await EnsuredMessage.fromDBChatMessages(
+        [_makeRow(1, mediaId="photo")], db, mediaLookup=mediaLookup  # type: ignore[arg-type]
+    )
+    # Processing finishes after the prefetch
+    attachments["photo"] = _makeAttachment("photo", "a cat")
+
+    formatted = json.loads(await eMessage.formatForLLM(db, LLMMessageFormat.JSON, mediaLookup=mediaLookup))
+
+    assert formatted["mediaDescription"] == "a cat"
+    db.mediaAttachments.getMediaAttachment.assert_awaited_once_with("photo")
@@ -129,7 +129,7 @@ async def testDatabase(inMemoryDbPath) -> AsyncGenerator:
     try:
         yield db
     finally:
-        await db.manager.closeAll()
+        await db.close()
 
 
 # ============================================================================
@@ -398,6 +398,26 @@ def resetProxyHelperSingleton() -> Generator[None, None, None]:
     ProxyHelper._instance = None
 
 
+@pytest.fixture(autouse=True)
+def resetHttpClientRegistrySingleton() -> Generator[None, None, None]:
+    """Reset HttpClientRegistry singleton between tests.
+
+    Pooled clients are bound to the event loop they were created in and keep
+    whatever ``httpx.AsyncClient`` class was active back then, so every test
+    starts with an empty registry.
+
+    Yields:
+        None: Fixture runs before and after each test
+    """
+    from lib.http_client import HttpClientRegistry
+
+    HttpClientRegistry._instance = None
+
+    yield
+
+    HttpClientRegistry._instance = None
+
+
 @pytest.fixture
 def mockCacheService():
     """
@@ -3,10 +3,13 @@ Tests for base provider functionality and helper methods.
 
 This module tests the BaseSQLProvider abstract class and its helper methods:
 - ExcludedValue class
+- Default upsertMany implementation
 """
 
 from typing import Optional
 
+import pytest
+
 from internal.database.providers.base import (
     BaseSQLProvider,
     ExcludedValue,
@@ -21,6 +24,7 @@ class MockProvider(BaseSQLProvider):
     def __init__(self, providerType: str = "sqlite"):
         self._providerType = providerType
         self._connected = False
+        self.batches: list = []
 
     async def connect(self) -> None:
         """Mock connect."""
@@ -36,12 +40,17 @@ class MockProvider(BaseSQLProvider):
 
     async def batchExecute(self, queries):
         """Mock batch execute."""
+        self.batches.append(list(queries))
         return []
 
     async def upsert(self, table, values, conflictColumns, updateExpressions=None):
         """Mock upsert."""
         return True
 
+    def getUpsertQuery(self, table, columns, conflictColumns, updateExpressions=None):
+        """Mock getUpsertQuery."""
+        return f"UPSERT {table} ({', '.join(columns)})"
+
     async def isReadOnly(self) -> bool:
         """Mock isReadOnly."""
         return False
@@ -64,6 +73,10 @@ class MockProvider(BaseSQLProvider):
         """Mock getCaseInsensitiveComparison."""
         return f"LOWER({column}) = LOWER(:{param})"
 
+    def getLikeComparison(self, column: str, param: str) -> str:
+        """Mock getLikeComparison."""
+        return f"LOWER({column}) LIKE LOWER(:{param})"
+
 
 class TestExcludedValue:
     """Tests for ExcludedValue class."""
@@ -116,3 +129,40 @@ class TestParametrizedQuery:
         """Test that None params becomes empty list."""
         query = ParametrizedQuery("SELECT * FROM test", None)
         assert query.params == []
+
+
+class TestUpsertMany:
+    """Tests for the default BaseSQLProvider.upsertMany implementation."""
+
+    async def test_upsert_many_uses_single_batch(self):
+        """All rows and extra queries go to one batchExecute call."""
+        provider = MockProvider()
+        extra = ParametrizedQuery("UPDATE events SET processed = 1")
+
+        result = await provider.upsertMany(
+            "test",
+            [{"id": 1, "value": 1}, {"value": 2, "id": 2}],
+            ["id"],
+            extraQueries=[extra],
+        )
+
+        assert result is True
+        assert len(provider.batches) == 1
+        batch = provider.batches[0]
+        assert [q.query for q in batch[:2]] == ["UPSERT test (id, value)"] * 2
+        assert [q.params for q in batch[:2]] == [{"id": 1, "value": 1}, {"value": 2, "id": 2}]
+        assert batch[2] is extra
+
+    async def test_upsert_many_empty_is_noop(self):
+        """Nothing is executed for an empty batch without extra queries."""
+        provider = MockProvider()
+
+        assert await provider.upsertMany("test", [], ["id"]) is True
+        assert provider.batches == []
+
+    async def test_upsert_many_rejects_mismatched_rows(self):
+        """Rows with different column sets raise ValueError."""
+        provider = MockProvider()
+
+        with pytest.raises(ValueError):
+            await provider.upsertMany("test", [{"id": 1}, {"name": "x"}], ["id"])
@@ -0,0 +1,30 @@
+"""
+Tests for the database provider helper functions.
+
+This module tests helpers from ``internal/database/providers/utils.py``:
+- convertNamedToPositional: ``:name`` to PostgreSQL ``$N`` placeholders
+"""
+
+from typing import Any, Dict
+
+from internal.database.providers.utils import convertNamedToPositional
+
+
+def testConvertNamedToPositional():
+    """Placeholders are numbered in parameter order and values follow it."""
+    query, values = convertNamedToPositional("SELECT * FROM t WHERE a = :a AND b = :b AND a2 = :a", {"b": 2, "a": 1})
+
+    assert query == "SELECT * FROM t WHERE a = $2 AND b = $1 AND a2 = $2"
+    assert values == [2, 1]
+
+
+def testConvertNamedToPositionalPrefixNames():
+    """A name that is a prefix of another one does not clobber it."""
+    params: Dict[str, Any] = {f"id{i}": i for i in range(12)}
+    params["id_hash"] = "hash"
+    query = "IN (" + ", ".join(f":{name}" for name in params) + ")"
+
+    query, values = convertNamedToPositional(query, params)
+
+    assert query == "IN (" + ", ".join(f"${idx}" for idx in range(1, 14)) + ")"
+    assert values == [*range(12), "hash"]
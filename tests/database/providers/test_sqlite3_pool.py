@@ -0,0 +1,175 @@
+"""
+Tests for the pooled mode of the SQLite3 provider, dood!
+
+This module tests SQLite3Provider with ``readerPoolSize > 0`` including:
+- Read provider routing and read-only reader connections
+- Concurrent reads and writes
+- Writer exclusivity for transactions
+- Health checks of idle connections
+- Pool metrics and DatabaseManager routing
+"""
+
+import asyncio
+
+import pytest
+
+from internal.database.manager import DatabaseManager
+from internal.database.providers.base import ParametrizedQuery
+from internal.database.providers.sqlite3 import SQLite3Provider
+
+
+@pytest.fixture
+async def pooledProvider(tmp_path):
+    """Create a pooled SQLite provider over a temporary database file."""
+    provider = SQLite3Provider(str(tmp_path / "pool.db"), readerPoolSize=2)
+    await provider.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT)")
+    yield provider
+    await provider.disconnect()
+
+
+class TestPooledMode:
+    """Tests for the writer/reader connection pool."""
+
+    def test_rejects_in_memory_database(self):
+        """Test that pooled mode requires a database file."""
+        with pytest.raises(ValueError):
+            SQLite3Provider(":memory:", readerPoolSize=2)
+
+    def test_not_pooled_by_default(self):
+        """Test that the default provider has no pool and reads through itself."""
+        provider = SQLite3Provider(":memory:")
+        assert provider.getReadProvider() is provider
+        assert provider.getPoolStats() is None
+
+    @pytest.mark.asyncio
+    async def test_read_provider(self, pooledProvider):
+        """Test that the read provider is a cached, read-only view sharing the data."""
+        readProvider = pooledProvider.getReadProvider()
+        assert readProvider is not pooledProvider
+        assert readProvider is pooledProvider.getReadProvider()
+        assert readProvider.getReadProvider() is readProvider
+        assert await readProvider.isReadOnly() is True
+        assert await pooledProvider.isReadOnly() is False
+        assert pooledProvider.useWal is True
+
+        await pooledProvider.execute("INSERT INTO test (name) VALUES (:name)", {"name": "Alice"})
+        rows = await readProvider.executeFetchAll("SELECT name FROM test")
+        assert rows == [{"name": "Alice"}]
+
+        with pytest.raises(Exception):
+            await readProvider.execute("INSERT INTO test (name) VALUES ('Bob')")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_and_writes(self, pooledProvider):
+        """Test that concurrent writes are all applied and reads use at most the pool size."""
+        readProvider = pooledProvider.getReadProvider()
+
+        async def write(i: int) -> None:
+            await pooledProvider.execute("INSERT INTO test (name) VALUES (:name)", {"name": f"user{i}"})
+
+        async def read() -> None:
+            await readProvider.executeFetchAll("SELECT COUNT(*) AS cnt FROM test")
+
+        await asyncio.gather(*[write(i) for i in range(20)], *[read() for _ in range(20)])
+
+        row = await readProvider.executeFetchOne("SELECT COUNT(*) AS cnt FROM test")
+        assert row == {"cnt": 20}
+
+        stats = pooledProvider.getPoolStats()
+        assert stats is not None
+        assert stats["readersOpen"] <= 2
+        assert stats["readersInUse"] == 0
+        assert stats["writerInUse"] is False
+        assert stats["readAcquisitions"] == 21
+        # One acquisition for CREATE TABLE, one per write
+        assert stats["writeAcquisitions"] == 21
+        assert stats["readWaitTimeMax"] >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_writer_transactions_do_not_interleave(self, pooledProvider):
+        """Test that a failing transaction is rolled back without affecting a concurrent one."""
+
+        async def failingBatch() -> None:
+            await pooledProvider.batchExecute(
+                [
+                    ParametrizedQuery("INSERT INTO test (name) VALUES ('rolled back')"),
+                    ParametrizedQuery("INSERT INTO missing_table VALUES (1)"),
+                ]
+            )
+
+        async def goodBatch() -> None:
+            await pooledProvider.batchExecute([ParametrizedQuery("INSERT INTO test (name) VALUES ('kept')")])
+
+        results = await asyncio.gather(failingBatch(), goodBatch(), return_exceptions=True)
+        assert isinstance(results[0], Exception)
+        assert results[1] is None
+
+        rows = await pooledProvider.getReadProvider().executeFetchAll("SELECT name FROM test")
+        assert rows == [{"name": "kept"}]
+
+    @pytest.mark.asyncio
+    async def test_health_check_reopens_broken_reader(self, tmp_path):
+        """Test that an idle broken reader connection is replaced on next use."""
+        provider = SQLite3Provider(str(tmp_path / "health.db"), readerPoolSize=1, healthCheckInterval=0)
+        try:
+            readProvider = provider.getReadProvider()
+            assert await readProvider.executeFetchOne("SELECT 1 AS one") == {"one": 1}
+
+            assert provider._pool is not None
+            await provider._pool._idleReaders[0].connection.close()
+
+            assert await readProvider.executeFetchOne("SELECT 1 AS one") == {"one": 1}
+            stats = provider.getPoolStats()
+            assert stats is not None
+            assert stats["healthCheckFailures"] == 1
+            assert stats["readersOpen"] == 1
+        finally:
+            await provider.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_closes_pool(self, pooledProvider):
+        """Test that disconnecting the provider closes every pooled connection."""
+        await pooledProvider.getReadProvider().executeFetchAll("SELECT * FROM test")
+        await pooledProvider.getReadProvider().disconnect()
+        stats = pooledProvider.getPoolStats()
+        assert stats is not None
+        assert stats["readersOpen"] == 1
+
+        await pooledProvider.disconnect()
+        stats = pooledProvider.getPoolStats()
+        assert stats is not None
+        assert stats["readersOpen"] == 0
+
+
+class TestManagerRouting:
+    """Tests for readonly routing in DatabaseManager."""
+
+    @pytest.mark.asyncio
+    async def test_readonly_requests_get_read_provider(self, tmp_path):
+        """Test that readonly=True returns the read provider and stats are exposed."""
+        manager = DatabaseManager(
+            {
+                "default": "default",
+                "chatMapping": {},
+                "providers": {
+                    "default": {
+                        "provider": "sqlite3",
+                        "parameters": {"dbPath": str(tmp_path / "manager.db"), "readerPoolSize": 2},
+                    }
+                },
+            }
+        )
+        try:
+            writer = await manager.getProvider()
+            reader = await manager.getProvider(readonly=True)
+            assert reader is writer.getReadProvider()
+            assert reader is not writer
+
+            await writer.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+            await reader.executeFetchAll("SELECT * FROM test")
+
+            stats = manager.getPoolStats()
+            assert list(stats.keys()) == ["default"]
+            assert stats["default"]["readAcquisitions"] == 1
+        finally:
+            await manager.closeAll()
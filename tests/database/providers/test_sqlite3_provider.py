@@ -268,6 +268,74 @@ class TestUpsert:
         assert row["value"] == 200
 
 
+class TestUpsertMany:
+    """Tests for multi-row upsert operations."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_inserts_and_accumulates(self, sqliteProvider):
+        """Rows are inserted, and duplicate keys within one batch accumulate."""
+        await sqliteProvider.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, name TEXT, value INTEGER)")
+        await sqliteProvider.upsert(table="test", values={"id": 1, "name": "old", "value": 100}, conflictColumns=["id"])
+
+        result = await sqliteProvider.upsertMany(
+            table="test",
+            rows=[
+                {"id": 1, "name": "one", "value": 5},
+                {"id": 2, "name": "two", "value": 7},
+                {"id": 2, "name": "two", "value": 3},
+            ],
+            conflictColumns=["id"],
+            updateExpressions={"name": ExcludedValue(), "value": "value + :value"},
+        )
+        assert result is True
+
+        rows = await sqliteProvider.executeFetchAll("SELECT * FROM test ORDER BY id")
+        assert [(r["id"], r["name"], r["value"]) for r in rows] == [(1, "one", 105), (2, "two", 10)]
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_runs_extra_queries_in_same_transaction(self, sqliteProvider):
+        """A failing extra query rolls back the upserted rows as well."""
+        await sqliteProvider.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, value INTEGER)")
+
+        with pytest.raises(Exception):
+            await sqliteProvider.upsertMany(
+                table="test",
+                rows=[{"id": 1, "value": 1}, {"id": 2, "value": 2}],
+                conflictColumns=["id"],
+                extraQueries=[ParametrizedQuery("UPDATE missing_table SET value = 1")],
+            )
+
+        rows = await sqliteProvider.executeFetchAll("SELECT * FROM test")
+        assert rows == []
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_without_rows_runs_extra_queries(self, sqliteProvider):
+        """An empty batch still executes the extra queries."""
+        await sqliteProvider.execute("CREATE TABLE test (id INTEGER PRIMARY KEY, value INTEGER)")
+
+        await sqliteProvider.upsertMany(
+            table="test",
+            rows=[],
+            conflictColumns=["id"],
+            extraQueries=[
+                ParametrizedQuery("INSERT INTO test (id, value) VALUES (:id, :value)", {"id": 9, "value": 1})
+            ],
+        )
+
+        rows = await sqliteProvider.executeFetchAll("SELECT * FROM test")
+        assert len(rows) == 1
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_rejects_mismatched_rows(self, sqliteProvider):
+        """Rows with different column sets cannot share one statement."""
+        with pytest.raises(ValueError):
+            await sqliteProvider.upsertMany(
+                table="test",
+                rows=[{"id": 1, "value": 1}, {"id": 2, "name": "x"}],
+                conflictColumns=["id"],
+            )
+
+
 class TestBatchExecute:
     """Tests for batch operations."""
 
@@ -78,6 +78,26 @@ class _MinimalProvider(BaseSQLProvider):
         """
         return True
 
+    def getUpsertQuery(
+        self,
+        table: str,
+        columns: Sequence[str],
+        conflictColumns: list[str],
+        updateExpressions: Optional[dict[str, Any]] = None,
+    ) -> str:
+        """Return an empty upsert query stub.
+
+        Args:
+            table: Table name (ignored).
+            columns: Column names (ignored).
+            conflictColumns: Conflict target columns (ignored).
+            updateExpressions: Optional update expressions (ignored).
+
+        Returns:
+            An empty string.
+        """
+        return ""
+
     async def isReadOnly(self) -> bool:
         """Return False for the read-only flag.
 
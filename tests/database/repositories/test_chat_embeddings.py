@@ -225,6 +225,42 @@ class TestEmbeddingAndSearch:
         assert differentModel[0]["username"] == "user100"
         assert differentModel[0]["full_name"] == "User 100"
 
+    async def test_getMessagesWithoutEmbeddings_cursor(self, testDatabase: Database) -> None:
+        """The ``(beforeDate, beforeMessageId)`` keyset cursor pages through pending rows exactly once."""
+        for mid in range(1, 6):
+            await self._seedMessage(testDatabase, chatId=1, userId=100, messageId=mid, messageText=f"m{mid}")
+
+        seen: list = []
+        beforeDate = None
+        beforeMessageId = None
+        while True:
+            page = await testDatabase.chatEmbeddings.getMessagesWithoutEmbeddings(
+                chatId=1, limit=2, beforeDate=beforeDate, beforeMessageId=beforeMessageId
+            )
+            if not page:
+                break
+            seen.extend(r["message_id"] for r in page)
+            beforeDate = page[-1]["date"]
+            beforeMessageId = page[-1]["message_id"]
+
+        assert seen == [MessageId(mid) for mid in (5, 4, 3, 2, 1)]
+
+    async def test_countMessagesWithoutEmbeddings(self, testDatabase: Database) -> None:
+        """Counts honour the same model filter as :meth:`getMessagesWithoutEmbeddings`."""
+        for mid in (1, 2, 3):
+            await self._seedMessage(testDatabase, chatId=1, userId=100, messageId=mid, messageText=f"m{mid}")
+        await testDatabase.chatEmbeddings.saveMessageEmbedding(
+            chatId=1,
+            messageId=MessageId(1),
+            embedding=[1.0, 0.0, 0.0],
+            model="A",
+        )
+
+        assert await testDatabase.chatEmbeddings.countMessagesWithoutEmbeddings(chatId=1) == 2
+        assert await testDatabase.chatEmbeddings.countMessagesWithoutEmbeddings(chatId=1, modelName="A") == 2
+        assert await testDatabase.chatEmbeddings.countMessagesWithoutEmbeddings(chatId=1, modelName="B") == 3
+        assert await testDatabase.chatEmbeddings.countMessagesWithoutEmbeddings(chatId=2) == 0
+
     async def test_deleteObsoleteModelEmbeddings_vec0ShadowTables(self, testDatabase: Database) -> None:
         """deleteObsoleteModelEmbeddings does not fail on vec0 shadow tables.
 
@@ -14,14 +14,25 @@ helper each live in their own focused repositories:
   :class:`ChatEmbeddingsRepository`; their tests are in
   ``tests/database/repositories/test_chat_embeddings.py``.
 
+``TestGroupCommitIngestion`` covers ``saveChatMessage`` with the
+group-commit ingestion queue enabled (``[database.messageIngestion]``).
+
 NOTE: ``listChatUsers`` was merged into :class:`ChatUsersRepository.getChatUsers`;
 its tests now live in ``tests/database/repositories/test_chat_users.py``.
 """
 
+import asyncio
 import datetime
+import re
+from typing import AsyncGenerator, List, Tuple
+
+import pytest
 
 from internal.database import Database
+from internal.database.message_ingestion import PendingChatMessage
 from internal.database.models import MessageCategory
+from internal.database.providers.utils import convertNamedToPositional
+from internal.database.repositories.chat_messages import _INSERT_PARAMS
 from internal.models import MessageId
 
 
@@ -200,3 +211,169 @@ class TestMessageThread:
         assert result["target_message"]["message_id"] == MessageId(2)
         assert result["root_message"] is not None
         assert result["root_message"]["message_id"] == MessageId(1)
+
+
+@pytest.fixture
+async def ingestionDatabase() -> AsyncGenerator[Database, None]:
+    """In-memory database with group-commit ingestion of chat messages enabled."""
+    db = Database(
+        {
+            "default": "default",
+            "chatMapping": {},
+            "providers": {"default": {"provider": "sqlite3", "parameters": {"dbPath": ":memory:"}}},
+            "messageIngestion": {"enabled": True, "flushInterval": 10.0},
+        }
+    )
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+class TestGroupCommitIngestion:
+    """Tests for ``saveChatMessage`` with group-commit ingestion enabled."""
+
+    DATE = datetime.datetime(2026, 5, 5, 12, 0, 0, tzinfo=datetime.timezone.utc)
+
+    @staticmethod
+    async def _fetchAll(db: Database, query: str) -> list:
+        sqlProvider = await db.manager.getProvider()
+        return list(await sqlProvider.executeFetchAll(query))
+
+    async def _save(self, db: Database, chatId: int, userId: int, messageId: int) -> bool:
+        return await db.chatMessages.saveChatMessage(
+            date=self.DATE,
+            chatId=chatId,
+            userId=userId,
+            messageId=MessageId(messageId),
+            messageText=f"message {messageId}",
+            metadata={"n": messageId},
+        )
+
+    async def _queueSaves(self, db: Database, saves: List[Tuple[int, int, int]]) -> List[asyncio.Task[bool]]:
+        """Start saves of ``(chatId, userId, messageId)`` and wait until all are queued."""
+        pending = db.chatMessages.ingestion.getStats()["pending"]
+        tasks = [asyncio.create_task(self._save(db, *save)) for save in saves]
+        while db.chatMessages.ingestion.getStats()["pending"] < pending + len(saves):
+            await asyncio.sleep(0.001)
+        return tasks
+
+    async def test_readYourWrites(self, ingestionDatabase: Database) -> None:
+        """Queued messages are committed before a read of the same chat."""
+        db = ingestionDatabase
+        await db.chatUsers.updateChatUser(chatId=1, userId=100, username="user100", fullName="User 100")
+        (save,) = await self._queueSaves(db, [(1, 100, 1)])
+        assert db.chatMessages.ingestion.getStats()["pending"] == 1
+        assert not save.done()
+
+        message = await db.chatMessages.getChatMessageByMessageId(chatId=1, messageId=MessageId(1))
+        assert message is not None
+        assert message["message_text"] == "message 1"
+        assert db.chatMessages.ingestion.getStats()["pending"] == 0
+        assert await save
+
+    async def test_otherReadersFlush(self, ingestionDatabase: Database) -> None:
+        """Reads of chat users and of messages pending embeddings commit the queue first."""
+        db = ingestionDatabase
+        await db.chatUsers.updateChatUser(chatId=1, userId=100, username="user100", fullName="User 100")
+
+        saves = await self._queueSaves(db, [(1, 100, 1)])
+        chatUser = await db.chatUsers.getChatUser(chatId=1, userId=100)
+        assert chatUser is not None and chatUser["messages_count"] == 1
+
+        saves += await self._queueSaves(db, [(1, 100, 2)])
+        assert await db.chatEmbeddings.countMessagesWithoutEmbeddings(1) == 2
+
+        saves += await self._queueSaves(db, [(1, 100, 3)])
+        pendingMessages = await db.chatEmbeddings.getMessagesWithoutEmbeddings(1)
+        assert [message["message_id"] for message in pendingMessages] == [MessageId(3), MessageId(2), MessageId(1)]
+        assert all(await asyncio.gather(*saves))
+
+    async def test_groupCommitAggregatesStats(self, ingestionDatabase: Database) -> None:
+        """Saves from several chats share one commit and stats are incremented by the group counts."""
+        db = ingestionDatabase
+        for chatId in (1, 2):
+            for userId in (100, 200):
+                await db.chatUsers.updateChatUser(chatId=chatId, userId=userId, username="u", fullName="U")
+
+        saves = await self._queueSaves(db, [(1 + i % 2, 100 if i % 3 else 200, i) for i in range(30)])
+        assert await db.chatMessages.flushPendingMessages() == 30
+        assert all(await asyncio.gather(*saves))
+
+        stats = db.chatMessages.ingestion.getStats()
+        assert stats["flushes"] == 1
+        assert stats["maxGroupSize"] == 30
+
+        chatStats = await self._fetchAll(db, "SELECT chat_id, messages_count FROM chat_stats ORDER BY chat_id")
+        assert chatStats == [{"chat_id": 1, "messages_count": 15}, {"chat_id": 2, "messages_count": 15}]
+        userStats = await self._fetchAll(
+            db, "SELECT SUM(messages_count) AS total FROM chat_user_stats WHERE user_id = 200"
+        )
+        assert userStats == [{"total": 10}]
+        users = await self._fetchAll(db, "SELECT SUM(messages_count) AS total FROM chat_users")
+        assert users == [{"total": 30}]
+
+        messages = await db.chatMessages.getChatMessagesSince(chatId=2)
+        assert len(messages) == 15
+        assert '{"n":1}' in {message["metadata"] for message in messages}
+
+    async def test_failedMessageDoesNotDropGroup(self, ingestionDatabase: Database) -> None:
+        """A duplicate message fails alone and its save reports it; the rest of its group is stored."""
+        db = ingestionDatabase
+        await db.chatUsers.updateChatUser(chatId=1, userId=100, username="user100", fullName="User 100")
+        (save,) = await self._queueSaves(db, [(1, 100, 1)])
+        await db.chatMessages.flushPendingMessages()
+        assert await save
+
+        saves = await self._queueSaves(db, [(1, 100, messageId) for messageId in (2, 1, 3)])
+        assert await db.chatMessages.flushPendingMessages() == 2
+        assert await asyncio.gather(*saves) == [True, False, True]
+
+        assert db.chatMessages.ingestion.getStats()["failed"] == 1
+        chatStats = await self._fetchAll(db, "SELECT messages_count FROM chat_stats")
+        assert chatStats == [{"messages_count": 3}]
+
+    async def test_largeGroupPostgreSQLPlaceholders(self, ingestionDatabase: Database) -> None:
+        """A multi-row INSERT of more than 10 rows survives the PostgreSQL ``:name`` to ``$N`` conversion."""
+        db = ingestionDatabase
+        sqlProvider = await db.manager.getProvider()
+        messages = [
+            PendingChatMessage(
+                sqlProvider,
+                1,
+                {**{key: f"{key}-{n}" for key in _INSERT_PARAMS}, "date": self.DATE, "chatId": 1, "userId": 1},
+            )
+            for n in range(12)
+        ]
+
+        insert = db.chatMessages._buildSaveQueries(sqlProvider, messages)[0]
+        assert isinstance(insert.params, dict)
+        query, values = convertNamedToPositional(insert.query, insert.params)
+
+        assert re.search(r":[A-Za-z]", query) is None
+        rows = re.findall(r"\((\$\d+(?:, \$\d+)*)\)", query)
+        assert len(rows) == len(messages)
+        for row, message in zip(rows, messages):
+            rowValues = [values[int(placeholder[1:]) - 1] for placeholder in row.split(", ")]
+            assert rowValues == [message.values[key] for key in _INSERT_PARAMS]
+
+    async def test_closeFlushesQueue(self, tmp_path) -> None:
+        """``Database.close()`` commits queued messages before closing the providers."""
+        config = {
+            "default": "default",
+            "chatMapping": {},
+            "providers": {"default": {"provider": "sqlite3", "parameters": {"dbPath": str(tmp_path / "db.sqlite")}}},
+            "messageIngestion": {"enabled": True, "flushInterval": 10.0},
+        }
+        db = Database(config)  # pyright: ignore[reportArgumentType]
+        await db.chatUsers.updateChatUser(chatId=1, userId=100, username="user100", fullName="User 100")
+        (save,) = await self._queueSaves(db, [(1, 100, 1)])
+        await db.close()
+        assert await save
+
+        db = Database(config)  # pyright: ignore[reportArgumentType]
+        try:
+            message = await db.chatMessages.getChatMessageByMessageId(chatId=1, messageId=MessageId(1))
+            assert message is not None
+        finally:
+            await db.close()
@@ -41,6 +41,7 @@ import pytest
 from internal.database import Database
 from internal.database.models import MessageCategory
 from internal.database.providers.base import BaseSQLProvider
+from internal.database.providers.sqlite3 import SQLite3Provider
 from internal.database.repositories.chat_search import _MESSAGE_ID_FILTER_BATCH_SIZE
 from internal.models import MessageId
 
@@ -191,6 +192,47 @@ class TestSearchChatMessages:
         assert results[1]["message_id"] == MessageId(2)
         assert results[1]["score"] == pytest.approx(0.0, abs=1e-6)
 
+    async def test_semantic_mode_uses_resident_index(self, testDatabase: Database) -> None:
+        """Without native vector search, semantic mode ranks over the resident index.
+
+        The first query loads the ``(chat, model)`` entry; later writes
+        through ``saveMessageEmbedding`` are visible to the next query
+        without reloading, and SQL post-filters still apply.
+        """
+        chatId = 1
+        modelName = "test-model"
+
+        await self._seedMessage(testDatabase, chatId=chatId, userId=100, messageId=1, messageText="apple")
+        await self._seedMessage(testDatabase, chatId=chatId, userId=200, messageId=2, messageText="banana")
+        await self._seedMessage(testDatabase, chatId=chatId, userId=100, messageId=3, messageText="cherry")
+        await testDatabase.chatEmbeddings.saveMessageEmbedding(
+            chatId=chatId, messageId=MessageId(1), embedding=[1.0, 0.0], model=modelName
+        )
+        await testDatabase.chatEmbeddings.saveMessageEmbedding(
+            chatId=chatId, messageId=MessageId(2), embedding=[0.0, 1.0], model=modelName
+        )
+
+        with patch.object(SQLite3Provider, "isVectorSearchSupported", return_value=False):
+            results = await testDatabase.chatSearch.searchChatMessages(
+                chatId=chatId, queryEmbedding=[0.0, 1.0], modelName=modelName, limit=10
+            )
+            assert [r["message_id"] for r in results] == [MessageId(2), MessageId(1)]
+            assert testDatabase.embeddingsIndex.getStats()["misses"] == 1
+
+            # A new embedding lands in the resident entry directly.
+            await testDatabase.chatEmbeddings.saveMessageEmbedding(
+                chatId=chatId, messageId=MessageId(3), embedding=[0.1, 1.0], model=modelName
+            )
+            results = await testDatabase.chatSearch.searchChatMessages(
+                chatId=chatId, queryEmbedding=[0.0, 1.0], modelName=modelName, userFilter=100, limit=10
+            )
+            assert [r["message_id"] for r in results] == [MessageId(3), MessageId(1)]
+            assert testDatabase.embeddingsIndex.getStats()["misses"] == 1
+
+            # Switching the model drops the stale entry.
+            await testDatabase.chatEmbeddings.deleteObsoleteModelEmbeddings(chatId, "other-model")
+            assert testDatabase.embeddingsIndex.get(chatId, modelName) is None
+
 
 class TestFilterMessageIdsBatching:
     """Regression tests for ``_filterMessageIds`` batching boundary.
@@ -0,0 +1,121 @@
+"""Tests for the batch lookups of :class:`MediaAttachmentsRepository`, dood!
+
+Verifies that ``getMediaAttachmentsByIds`` and ``getMediaAttachmentsByGroupIds``
+return the same attachments as their per-ID counterparts, skip missing IDs,
+keep empty groups and split long ID lists into several ``IN`` batches.
+"""
+
+from typing import Any, AsyncGenerator, Dict, List, Tuple
+
+import pytest
+
+import internal.database.repositories.media_attachments as mediaAttachmentsModule
+from internal.database import Database
+from internal.database.manager import DatabaseManagerConfig
+from internal.database.providers.utils import convertNamedToPositional
+from internal.models import MessageType
+
+
+@pytest.fixture
+async def mediaDb() -> AsyncGenerator[Database, None]:
+    """Create an in-memory database with migrations applied, dood.
+
+    Yields:
+        Database: A ready-to-use Database backed by an in-memory SQLite DB.
+    """
+    config: DatabaseManagerConfig = {
+        "default": "default",
+        "chatMapping": {},
+        "providers": {
+            "default": {
+                "provider": "sqlite3",
+                "parameters": {
+                    "dbPath": ":memory:",
+                },
+            }
+        },
+    }
+    db = Database(config)
+    # Trigger migrations.
+    await db.manager.getProvider()
+    try:
+        yield db
+    finally:
+        await db.manager.closeAll()
+
+
+async def _addMedia(db: Database, mediaId: str, mediaGroupId: str | None = None) -> None:
+    """Add an image attachment, optionally putting it into a media group, dood."""
+    await db.mediaAttachments.addMediaAttachment(
+        fileUniqueId=mediaId, fileId=f"file-{mediaId}", mediaType=MessageType.IMAGE
+    )
+    if mediaGroupId is not None:
+        await db.mediaAttachments.ensureMediaInGroup(mediaId=mediaId, mediaGroupId=mediaGroupId)
+
+
+async def testGetMediaAttachmentsByIds(mediaDb: Database) -> None:
+    """Found attachments are keyed by ID, missing and repeated IDs are fine, dood."""
+    await _addMedia(mediaDb, "a")
+    await _addMedia(mediaDb, "b")
+    await mediaDb.mediaAttachments.updateMediaAttachment("a", description="a cat")
+
+    result = await mediaDb.mediaAttachments.getMediaAttachmentsByIds(["a", "b", "a", "missing"])
+
+    assert set(result) == {"a", "b"}
+    assert result["a"] == await mediaDb.mediaAttachments.getMediaAttachment("a")
+    assert result["a"]["description"] == "a cat"
+    assert await mediaDb.mediaAttachments.getMediaAttachmentsByIds([]) == {}
+
+
+async def testGetMediaAttachmentsByGroupIds(mediaDb: Database) -> None:
+    """Attachments are grouped by media group, empty groups are present, dood."""
+    await _addMedia(mediaDb, "g1-a", "group-1")
+    await _addMedia(mediaDb, "g1-b", "group-1")
+    await _addMedia(mediaDb, "g2-a", "group-2")
+
+    result = await mediaDb.mediaAttachments.getMediaAttachmentsByGroupIds(["group-1", "group-2", "group-empty"])
+
+    assert sorted(media["file_unique_id"] for media in result["group-1"]) == ["g1-a", "g1-b"]
+    assert result["group-2"] == await mediaDb.mediaAttachments.getMediaAttachmentsByGroupId("group-2")
+    assert result["group-empty"] == []
+    assert "mg_media_group_id" not in result["group-2"][0]
+
+
+async def testBatchLookupsSplitLongIdLists(mediaDb: Database, monkeypatch: pytest.MonkeyPatch) -> None:
+    """ID lists longer than the batch size are queried in several batches, dood."""
+    monkeypatch.setattr(mediaAttachmentsModule, "_ID_FILTER_BATCH_SIZE", 2)
+    for i in range(5):
+        await _addMedia(mediaDb, f"m{i}", f"group-{i % 3}")
+
+    byIds = await mediaDb.mediaAttachments.getMediaAttachmentsByIds([f"m{i}" for i in range(5)])
+    byGroups = await mediaDb.mediaAttachments.getMediaAttachmentsByGroupIds([f"group-{i}" for i in range(3)])
+
+    assert sorted(byIds) == [f"m{i}" for i in range(5)]
+    assert sum(len(group) for group in byGroups.values()) == 5
+
+
+async def testBatchLookupPlaceholdersConvertForPostgreSQL(mediaDb: Database, monkeypatch: pytest.MonkeyPatch) -> None:
+    """More than 10 IDs give parameter names that survive the ``:name`` to ``$N`` conversion, dood."""
+    sqlProvider = await mediaDb.manager.getProvider(readonly=True)
+    executeFetchAll = type(sqlProvider).executeFetchAll
+    calls: List[Tuple[str, Dict[str, Any]]] = []
+
+    async def recordingFetchAll(self, query: str, params: Dict[str, Any]) -> Any:
+        calls.append((query, params))
+        return await executeFetchAll(self, query, params)
+
+    monkeypatch.setattr(type(sqlProvider), "executeFetchAll", recordingFetchAll)
+    for i in range(12):
+        await _addMedia(mediaDb, f"m{i}", f"group-{i}")
+
+    byIds = await mediaDb.mediaAttachments.getMediaAttachmentsByIds([f"m{i}" for i in range(12)])
+    byGroups = await mediaDb.mediaAttachments.getMediaAttachmentsByGroupIds([f"group-{i}" for i in range(12)])
+
+    assert len(byIds) == 12 and all(len(group) == 1 for group in byGroups.values())
+    assert len(calls) == 2
+    for query, params in calls:
+        names = list(params)
+        assert not any(other != name and other.startswith(name) for name in names for other in names)
+        converted, values = convertNamedToPositional(query, params)
+        assert "IN (" + ", ".join(f"${idx}" for idx in range(1, 13)) + ")" in converted
+        assert values == list(params.values())
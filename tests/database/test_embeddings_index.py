@@ -0,0 +1,273 @@
+"""
+Test suite for internal/database/embeddings_index.py.
+
+Tests the resident embeddings index used by semantic search:
+- EmbeddingsIndexEntry: upsert / remove / bulk load and similarity scoring
+- EmbeddingsIndex: lazy loading, LRU eviction under a memory budget,
+  write-path maintenance (upsert, dropObsolete, dropChat), writes during loads
+  and shared loads
+"""
+
+import array
+import asyncio
+from typing import List
+
+import numpy as np
+
+from internal.database.embeddings_index import EmbeddingsIndex, EmbeddingsIndexEntry, IndexRow
+
+
+def _blob(vector: List[float]) -> bytes:
+    """Serialise a vector the same way ``saveMessageEmbedding`` does."""
+    return array.array("f", vector).tobytes()
+
+
+class TestEmbeddingsIndexEntry:
+    """Test suite for EmbeddingsIndexEntry."""
+
+    def testUpsertNormalizesAndScores(self) -> None:
+        """Rows are stored normalised, so scores are cosine similarities."""
+        entry = EmbeddingsIndexEntry(chatId=1, model="m", dimensions=2)
+        entry.upsert("1", np.array([3.0, 0.0], dtype=np.float32), 1.0)
+        entry.upsert("2", np.array([0.0, 5.0], dtype=np.float32), 2.0)
+
+        rows, scores = entry.score([2.0, 0.0])
+
+        assert entry.count == 2
+        byId = {entry.messageIds[int(r)]: float(s) for r, s in zip(rows, scores)}
+        assert byId["1"] == 1.0
+        assert byId["2"] == 0.0
+
+    def testUpsertReplacesExistingRow(self) -> None:
+        """Upserting a known message ID overwrites its row instead of appending."""
+        entry = EmbeddingsIndexEntry(chatId=1, model="m", dimensions=2)
+        entry.upsert("1", np.array([1.0, 0.0], dtype=np.float32), 1.0)
+        entry.upsert("1", np.array([0.0, 1.0], dtype=np.float32), 1.0)
+
+        rows, scores = entry.score([0.0, 1.0])
+
+        assert entry.count == 1
+        assert float(scores[0]) == 1.0
+
+    def testRemoveKeepsRowsContiguous(self) -> None:
+        """Removing a row moves the last row into the freed slot."""
+        entry = EmbeddingsIndexEntry(chatId=1, model="m", dimensions=2, capacity=1)
+        for i in range(5):
+            entry.upsert(str(i), np.array([1.0, float(i)], dtype=np.float32), float(i))
+
+        assert entry.remove("1") is True
+        assert entry.remove("1") is False
+        assert entry.count == 4
+        assert "1" not in entry
+        assert sorted(entry.messageIds) == ["0", "2", "3", "4"]
+        # The moved row still scores as itself.
+        rows, scores = entry.score([1.0, 4.0])
+        best = entry.messageIds[int(rows[int(np.argmax(scores))])]
+        assert best == "4"
+
+    def testMaxMessagesKeepsMostRecent(self) -> None:
+        """``maxMessages`` restricts candidates to the most recent rows."""
+        entry = EmbeddingsIndexEntry(chatId=1, model="m", dimensions=2)
+        for i in range(10):
+            entry.upsert(str(i), np.array([1.0, 1.0], dtype=np.float32), float(i))
+
+        rows, _ = entry.score([1.0, 1.0], maxMessages=3)
+
+        assert sorted(entry.messageIds[int(r)] for r in rows) == ["7", "8", "9"]
+
+    def testApproximateFindsExactMatch(self) -> None:
+        """IVF mode still returns an exact duplicate of the query as the best hit."""
+        rng = np.random.default_rng(42)
+        data = rng.standard_normal((2000, 16)).astype(np.float32)
+        entry = EmbeddingsIndexEntry(chatId=1, model="m", dimensions=16)
+        entry.bulkLoad([str(i) for i in range(2000)], data, np.arange(2000, dtype=np.float64))
+
+        rows, scores = entry.score(data[123], approximate=True, ivfMinRows=1000, ivfProbes=4)
+
+        assert len(rows) < 2000
+        assert entry.messageIds[int(rows[int(np.argmax(scores))])] == "123"
+
+
+class TestEmbeddingsIndex:
+    """Test suite for EmbeddingsIndex."""
+
+    @staticmethod
+    def _rows(count: int, dimensions: int = 4) -> List[IndexRow]:
+        return [(str(i), _blob([float(i + 1)] * dimensions), float(i)) for i in range(count)]
+
+    @classmethod
+    async def _asyncRows(cls, count: int) -> List[IndexRow]:
+        return cls._rows(count)
+
+    async def testGetOrLoadCachesEntry(self) -> None:
+        """The loader runs once; later calls are hits."""
+        index = EmbeddingsIndex()
+        calls = 0
+
+        async def loader() -> List[IndexRow]:
+            nonlocal calls
+            calls += 1
+            return self._rows(3)
+
+        first = await index.getOrLoad(1, "m", loader)
+        second = await index.getOrLoad(1, "m", loader)
+
+        assert first is not None and first is second
+        assert calls == 1
+        stats = index.getStats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["rows"] == 3
+
+    async def testDisabledIndexNeverLoads(self) -> None:
+        """A disabled index returns ``None`` without calling the loader."""
+        index = EmbeddingsIndex({"enabled": False})
+
+        async def loader() -> List[IndexRow]:
+            raise AssertionError("loader must not be called")
+
+        assert await index.getOrLoad(1, "m", loader) is None
+
+    async def testEmptyChatIsNotCached(self) -> None:
+        """A chat without embeddings yields ``None`` (caller falls back)."""
+        index = EmbeddingsIndex()
+
+        async def loader() -> List[IndexRow]:
+            return []
+
+        assert await index.getOrLoad(1, "m", loader) is None
+        assert index.getStats()["entries"] == 0
+
+    async def testMalformedBlobIsSkipped(self) -> None:
+        """Rows whose BLOB length does not match the dimensionality are dropped."""
+        index = EmbeddingsIndex()
+
+        async def loader() -> List[IndexRow]:
+            return [("1", _blob([1.0, 2.0]), 1.0), ("2", b"\x00\x01\x02", 2.0)]
+
+        entry = await index.getOrLoad(1, "m", loader)
+
+        assert entry is not None
+        assert entry.messageIds == ["1"]
+
+    async def testLruEvictionUnderBudget(self) -> None:
+        """Least recently used chats are evicted once the budget is exceeded."""
+        index = EmbeddingsIndex({"maxMemoryMb": 1})
+
+        async def loader() -> List[IndexRow]:
+            return self._rows(1000, dimensions=128)
+
+        for chatId in range(4):
+            await index.getOrLoad(chatId, "m", loader)
+
+        stats = index.getStats()
+        assert stats["memoryBytes"] <= 1024 * 1024
+        assert stats["evictions"] > 0
+        assert index.get(3, "m") is not None
+        assert index.get(0, "m") is None
+
+    async def testUpsertUpdatesResidentEntryAndOtherModels(self) -> None:
+        """Writes land in the resident entry and evict the message from other models."""
+        index = EmbeddingsIndex()
+
+        async def loader() -> List[IndexRow]:
+            return self._rows(2)
+
+        oldEntry = await index.getOrLoad(1, "old", loader)
+        newEntry = await index.getOrLoad(1, "new", loader)
+        assert oldEntry is not None and newEntry is not None
+
+        index.upsert(1, "new", "5", [0.0, 0.0, 0.0, 1.0], date="2024-01-01T00:00:00")
+        index.upsert(1, "new", "0", [1.0, 0.0, 0.0, 0.0])
+
+        assert "5" in newEntry
+        assert "0" not in oldEntry
+        assert newEntry.count == 3
+
+    async def testUpsertWithOtherDimensionsDropsEntry(self) -> None:
+        """A vector of a different dimensionality invalidates the entry."""
+        index = EmbeddingsIndex()
+
+        async def loader() -> List[IndexRow]:
+            return self._rows(2)
+
+        await index.getOrLoad(1, "m", loader)
+        index.upsert(1, "m", "9", [1.0, 2.0])
+
+        assert index.get(1, "m") is None
+
+    async def testDropObsoleteAndDropChat(self) -> None:
+        """Entries of stale models / dimensions are dropped, other chats are kept."""
+        index = EmbeddingsIndex()
+
+        async def loader() -> List[IndexRow]:
+            return self._rows(2)
+
+        await index.getOrLoad(1, "old", loader)
+        await index.getOrLoad(1, "current", loader)
+        await index.getOrLoad(2, "old", loader)
+
+        index.dropObsolete(1, "current", 4)
+        assert index.get(1, "old") is None
+        assert index.get(1, "current") is not None
+        assert index.get(2, "old") is not None
+
+        index.dropObsolete(1, "current", 8)
+        assert index.get(1, "current") is None
+
+        index.dropChat(2)
+        assert index.getStats()["entries"] == 0
+
+    async def testWritesDuringLoadAreReplayed(self) -> None:
+        """Embeddings saved while loading land in the installed entry."""
+        index = EmbeddingsIndex()
+        oldEntry = await index.getOrLoad(1, "old", lambda: self._asyncRows(2))
+        assert oldEntry is not None
+
+        async def loader() -> List[IndexRow]:
+            index.upsert(1, "m", "99", [1.0, 1.0, 1.0, 1.0])
+            # Already seen by the loader, replaying it changes nothing
+            index.upsert(1, "m", "0", [1.0, 1.0, 1.0, 1.0])
+            index.upsert(1, "old", "1", [1.0, 1.0, 1.0, 1.0])
+            return self._rows(2)
+
+        entry = await index.getOrLoad(1, "m", loader)
+
+        assert entry is not None and index.get(1, "m") is entry
+        assert entry.messageIds == ["0", "99"]
+        assert "1" in oldEntry
+        assert index.getStats()["misses"] == 2
+
+    async def testDropDuringLoadIsDiscarded(self) -> None:
+        """Dropping entries of the chat while loading prevents installing the stale snapshot."""
+        index = EmbeddingsIndex()
+
+        async def droppingLoader() -> List[IndexRow]:
+            index.dropChat(1)
+            return self._rows(2)
+
+        async def obsoleteLoader() -> List[IndexRow]:
+            index.dropObsolete(1, "m", 8)
+            return self._rows(2)
+
+        assert await index.getOrLoad(1, "m", droppingLoader) is None
+        assert await index.getOrLoad(1, "m", obsoleteLoader) is None
+        assert index.get(1, "m") is None
+        assert await index.getOrLoad(1, "m", lambda: self._asyncRows(2)) is not None
+
+    async def testConcurrentReadersShareOneLoad(self) -> None:
+        """Readers of a missing entry wait for one load, no per-chat state is left behind."""
+        index = EmbeddingsIndex()
+        calls = 0
+
+        async def loader() -> List[IndexRow]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return self._rows(2)
+
+        entries = await asyncio.gather(*[index.getOrLoad(chatId % 2, "m", loader) for chatId in range(6)])
+
+        assert calls == 2
+        assert entries[0] is entries[2] is entries[4]
+        assert not index._loading
@@ -0,0 +1,130 @@
+"""
+Tests for internal/database/generic_cache.py.
+
+Tests GenericDatabaseCache on an in-memory SQLite database:
+- get/set round trip with hit and miss counters
+- fresh and stale entries from getEntry() based on ``updated_at``
+- stale-while-revalidate and stale-if-error reads via getOrFetch()
+"""
+
+import asyncio
+import datetime
+from typing import Optional
+
+import pytest
+
+from internal.database import Database
+from internal.database import utils as dbUtils
+from internal.database.generic_cache import GenericDatabaseCache
+from internal.database.manager import DatabaseManagerConfig
+from internal.database.models import CacheType
+from lib.cache import StringKeyGenerator
+
+
+@pytest.fixture
+async def db():
+    """Create a database instance for testing."""
+    config: DatabaseManagerConfig = {
+        "default": "default",
+        "chatMapping": {},
+        "providers": {
+            "default": {
+                "provider": "sqlite3",
+                "parameters": {
+                    "dbPath": ":memory:",
+                },
+            }
+        },
+    }
+    db = Database(config)
+    await db.manager.getProvider()
+    yield db
+    await db.manager.closeAll()
+
+
+async def _age(db: Database, key: str, seconds: int) -> None:
+    """Move the ``updated_at`` of a weather cache entry the given number of seconds back."""
+    sqlProvider = await db.manager.getProvider()
+    await sqlProvider.execute(
+        "UPDATE cache SET updated_at = :updatedAt WHERE namespace = :namespace AND key = :key",
+        {
+            "updatedAt": dbUtils.getCurrentTimestamp() - datetime.timedelta(seconds=seconds),
+            "namespace": CacheType.WEATHER,
+            "key": key,
+        },
+    )
+
+
+def _cache(db: Database, staleWhileRevalidate: int = 0, staleIfError: int = 0) -> GenericDatabaseCache[str, dict]:
+    return GenericDatabaseCache(
+        db,
+        CacheType.WEATHER,
+        keyGenerator=StringKeyGenerator(),
+        staleWhileRevalidate=staleWhileRevalidate,
+        staleIfError=staleIfError,
+    )
+
+
+class TestGenericDatabaseCache:
+    """Test suite for GenericDatabaseCache."""
+
+    async def testGetSetCountsHitsAndMisses(self, db: Database) -> None:
+        """Values round-trip through the database and lookups are counted."""
+        cache = _cache(db)
+
+        assert await cache.get("moscow") is None
+        assert await cache.set("moscow", {"temp": 20}) is True
+        assert await cache.get("moscow", ttl=60) == {"temp": 20}
+
+        stats = cache.getStats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["namespace"] == CacheType.WEATHER.value
+
+    async def testGetEntryUsesUpdatedAt(self, db: Database) -> None:
+        """Entries past the TTL are returned as stale until maxStale runs out."""
+        cache = _cache(db)
+        await cache.set("moscow", {"temp": 20})
+
+        entry = await cache.getEntry("moscow", ttl=60)
+        assert entry is not None and not entry.stale
+
+        await _age(db, "moscow", 100)
+        entry = await cache.getEntry("moscow", ttl=60, maxStale=3600)
+        assert entry is not None
+        assert entry.stale
+        assert 39 <= entry.staleFor <= 45
+        assert await cache.getEntry("moscow", ttl=60, maxStale=10) is None
+        assert await cache.getEntry("moscow", ttl=60, maxStale=-1) is not None
+        assert await cache.getEntry("moscow", ttl=0, maxStale=-1) is None
+
+    async def testStaleWhileRevalidate(self, db: Database) -> None:
+        """A stale entry is served immediately and replaced by the background refresh."""
+        cache = _cache(db, staleWhileRevalidate=600)
+        await cache.set("moscow", {"temp": 20})
+        await _age(db, "moscow", 100)
+
+        async def fetch() -> Optional[dict]:
+            return {"temp": 25}
+
+        assert await cache.getOrFetch("moscow", fetch, 60) == {"temp": 20}
+        while cache.getStats()["refreshing"]:
+            await asyncio.sleep(0.001)
+
+        assert await cache.get("moscow", ttl=60) == {"temp": 25}
+        stats = cache.getStats()
+        assert stats["staleHits"] == 1
+        assert stats["refreshes"] == 1
+
+    async def testStaleIfError(self, db: Database) -> None:
+        """A stale entry is served when the fetch fails, up to the hard TTL."""
+        cache = _cache(db, staleIfError=3600)
+        await cache.set("moscow", {"temp": 20})
+        await _age(db, "moscow", 1000)
+
+        async def failingFetch() -> Optional[dict]:
+            return None
+
+        assert await cache.getOrFetch("moscow", failingFetch, 60) == {"temp": 20}
+        assert await cache.getOrFetch("moscow", failingFetch, 60, staleIfError=100) is None
+        assert cache.getStats()["staleOnError"] == 1
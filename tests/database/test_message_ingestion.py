@@ -0,0 +1,174 @@
+"""
+Test suite for internal/database/message_ingestion.py.
+
+Tests the group-commit queue behind ``ChatMessagesRepository.saveChatMessage``:
+- write-through when disabled or closed
+- coalescing of saves into groups by interval and by size
+- read-your-writes flushes scoped to a chat and to the messages queued before them
+- flush on close, failed writes reported to the submitter
+"""
+
+import asyncio
+from typing import List, Sequence, cast
+
+from internal.database.message_ingestion import ChatMessageIngestion, PendingChatMessage
+from internal.database.providers.base import BaseSQLProvider
+
+
+class RecordingWriter:
+    """Writer callback recording every group it receives."""
+
+    def __init__(self, delay: float = 0.0, failChatId: int | None = None) -> None:
+        self.delay = delay
+        self.failChatId = failChatId
+        self.groups: List[List[int]] = []
+
+    async def __call__(self, messages: Sequence[PendingChatMessage]) -> int:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.groups.append([message.values["messageId"] for message in messages])
+        for message in messages:
+            message.stored = message.chatId != self.failChatId
+        return sum(1 for message in messages if message.stored)
+
+
+def _message(chatId: int, messageId: int) -> PendingChatMessage:
+    return PendingChatMessage(cast(BaseSQLProvider, None), chatId, {"messageId": messageId})
+
+
+async def _submitAll(ingestion: ChatMessageIngestion, messages: List[PendingChatMessage]) -> List[asyncio.Task[bool]]:
+    """Start submits of the messages and let them reach the queue."""
+    tasks = [asyncio.create_task(ingestion.submit(message)) for message in messages]
+    await asyncio.sleep(0)
+    return tasks
+
+
+class TestChatMessageIngestion:
+    """Test suite for ChatMessageIngestion."""
+
+    async def testDisabledWritesThrough(self) -> None:
+        """Without ``enabled`` every submit is written as its own group."""
+        writer = RecordingWriter()
+        ingestion = ChatMessageIngestion(writer)
+
+        assert await ingestion.submit(_message(1, 1))
+        assert await ingestion.submit(_message(1, 2))
+
+        assert writer.groups == [[1], [2]]
+        assert ingestion.getStats()["pending"] == 0
+
+    async def testSavesAreGroupedByInterval(self) -> None:
+        """Saves from several chats within the interval share one group commit."""
+        writer = RecordingWriter()
+        ingestion = ChatMessageIngestion(writer, {"enabled": True, "flushInterval": 0.02})
+
+        submits = await _submitAll(ingestion, [_message(i % 3, i) for i in range(10)])
+        assert writer.groups == []
+        assert ingestion.getStats()["pending"] == 10
+
+        assert all(await asyncio.wait_for(asyncio.gather(*submits), timeout=1))
+        assert writer.groups == [list(range(10))]
+        stats = ingestion.getStats()
+        assert stats["pending"] == 0
+        assert stats["written"] == 10
+        assert stats["flushes"] == 1
+        await ingestion.aclose()
+
+    async def testFullGroupIsWrittenImmediately(self) -> None:
+        """Reaching ``maxBatchSize`` wakes the flusher before the interval elapses."""
+        writer = RecordingWriter()
+        ingestion = ChatMessageIngestion(writer, {"enabled": True, "flushInterval": 10.0, "maxBatchSize": 4})
+
+        submits = await _submitAll(ingestion, [_message(1, i) for i in range(10)])
+        await asyncio.wait_for(asyncio.gather(*submits), timeout=1)
+
+        assert writer.groups == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        assert ingestion.getStats()["maxGroupSize"] == 4
+        await ingestion.aclose()
+
+    async def testFlushIsScopedToPendingChat(self) -> None:
+        """A chat flush commits the queue only if that chat has pending messages."""
+        writer = RecordingWriter()
+        ingestion = ChatMessageIngestion(writer, {"enabled": True, "flushInterval": 10.0})
+        (submit,) = await _submitAll(ingestion, [_message(1, 1)])
+
+        assert await ingestion.flush(chatId=2) == 0
+        assert writer.groups == []
+        assert not submit.done()
+
+        assert await ingestion.flush(chatId=1) == 1
+        assert writer.groups == [[1]]
+        assert await submit
+        await ingestion.aclose()
+
+    async def testFlushWaitsForInFlightGroup(self) -> None:
+        """A chat flush returns only after the group holding the chat's messages is written."""
+        writer = RecordingWriter(delay=0.05)
+        ingestion = ChatMessageIngestion(writer, {"enabled": True, "flushInterval": 0.0})
+        await _submitAll(ingestion, [_message(1, 1)])
+        # Let the flusher pick the group up
+        await asyncio.sleep(0.01)
+        assert writer.groups == []
+
+        await ingestion.flush(chatId=1)
+        assert writer.groups == [[1]]
+        await ingestion.aclose()
+
+    async def testFlushWritesOnlyMessagesQueuedBeforeIt(self) -> None:
+        """Messages queued while a flush waits are left to the next one, so readers don't starve."""
+        writer = RecordingWriter(delay=0.02)
+        ingestion = ChatMessageIngestion(writer, {"enabled": True, "flushInterval": 10.0, "maxBatchSize": 2})
+        # A full group, the flusher starts writing it
+        await _submitAll(ingestion, [_message(1, 1), _message(1, 2)])
+        await asyncio.sleep(0.005)
+
+        flush = asyncio.create_task(ingestion.flush(chatId=1))
+        await asyncio.sleep(0.005)
+        (later,) = await _submitAll(ingestion, [_message(1, 3)])
+
+        assert await flush == 0
+        assert writer.groups == [[1, 2]]
+        assert not later.done()
+        await ingestion.aclose()
+        assert writer.groups == [[1, 2], [3]]
+        assert await later
+
+    async def testCloseFlushesAndWritesThroughAfterwards(self) -> None:
+        """Closing commits the queue; later saves are not buffered."""
+        writer = RecordingWriter()
+        ingestion = ChatMessageIngestion(writer, {"enabled": True, "flushInterval": 10.0})
+        submits = await _submitAll(ingestion, [_message(1, 1), _message(2, 2)])
+
+        await ingestion.aclose()
+        assert writer.groups == [[1, 2]]
+        assert all(await asyncio.gather(*submits))
+
+        assert await ingestion.submit(_message(1, 3))
+        assert writer.groups == [[1, 2], [3]]
+
+    async def testFullQueueFlushesInline(self) -> None:
+        """Submitting into a full queue commits it first instead of growing it."""
+        writer = RecordingWriter()
+        ingestion = ChatMessageIngestion(
+            writer, {"enabled": True, "flushInterval": 10.0, "maxBatchSize": 2, "maxPending": 2}
+        )
+        # The writer never suspends, so the background flusher gets no chance to run
+        submits = await _submitAll(ingestion, [_message(1, i) for i in range(3)])
+
+        assert writer.groups == [[0, 1]]
+        assert len(ingestion._queue) == 1
+        await ingestion.aclose()
+        assert all(await asyncio.gather(*submits))
+
+    async def testFailedWritesAreReported(self) -> None:
+        """Messages the writer could not store are counted and their submits return False."""
+        writer = RecordingWriter(failChatId=2)
+        ingestion = ChatMessageIngestion(writer, {"enabled": True, "flushInterval": 10.0})
+        submits = await _submitAll(ingestion, [_message(chatId, chatId) for chatId in (1, 2, 1)])
+
+        assert await ingestion.flush() == 2
+        assert await asyncio.gather(*submits) == [True, False, True]
+        stats = ingestion.getStats()
+        assert stats["written"] == 2
+        assert stats["failed"] == 1
+        await ingestion.aclose()
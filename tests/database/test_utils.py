@@ -7,19 +7,23 @@ Tests the utility functions for type conversion and SQL response handling:
 - sqlToDatetime: Converts SQL datetime strings to datetime objects
 - sqlToBoolean: Converts SQL boolean bytes to Python bool
 - datetimeToSql: Converts datetime objects to SQL-compatible strings
+- getRowDecoder: Precompiled TypedDict row decoders
 """
 
 # pyright: reportTypedDictNotRequiredAccess=false
 
 import datetime
-from typing import Any, Optional, Union
+from typing import Any, Optional, TypedDict, Union
 
 import pytest
 
 from internal.bot.models.ensured_message import CondensingDict, MetadataDict
 from internal.database.utils import (
+    RowDecoder,
     _checkType,
+    getRowDecoder,
     sqlToCustomType,
+    sqlToTypedDict,
 )
 from internal.models.types import MessageId
 
@@ -1616,3 +1620,96 @@ class TestSqlToCustomTypeAdditionalEdgeCases:
         assert success is True
         assert value is not None
         assert value.tzinfo == datetime.timezone.utc
+
+
+class _DecoderRowDict(TypedDict):
+    """Row shape used by the RowDecoder tests."""
+
+    id: int
+    createdAt: datetime.datetime
+    isActive: bool
+    messageId: MessageId
+    metadata: Optional[MetadataDict]
+    note: Optional[str]
+
+
+class TestRowDecoder:
+    """Test suite for getRowDecoder and RowDecoder."""
+
+    def testDecoderIsCached(self) -> None:
+        """Test getRowDecoder compiles a decoder once per TypedDict."""
+        decoder = getRowDecoder(_DecoderRowDict)
+        assert isinstance(decoder, RowDecoder)
+        assert getRowDecoder(_DecoderRowDict) is decoder
+
+    def testRejectsNonTypedDict(self) -> None:
+        """Test getRowDecoder raises TypeError for non-TypedDict classes."""
+        with pytest.raises(TypeError):
+            getRowDecoder(dict)  # type: ignore[type-var]
+
+    def testDecodeConvertsSqlValues(self) -> None:
+        """Test SQLite-shaped values are converted to their annotated types."""
+        row = {
+            "id": 1,
+            "createdAt": "2024-01-15 10:30:00",
+            "isActive": 1,
+            "messageId": "42",
+            "metadata": '{"randomContext": "ctx"}',
+            "note": None,
+        }
+        value = getRowDecoder(_DecoderRowDict).decode(row)
+        assert value is row
+        assert value["createdAt"] == datetime.datetime(2024, 1, 15, 10, 30, tzinfo=datetime.timezone.utc)
+        assert value["isActive"] is True
+        assert value["messageId"] == MessageId(42)
+        assert value["metadata"] == {"randomContext": "ctx"}
+        assert value["note"] is None
+
+    def testDecodeKeepOriginal(self) -> None:
+        """Test keepOriginal decodes a copy and leaves the row untouched."""
+        row = {
+            "id": 1,
+            "createdAt": "2024-01-15 10:30:00",
+            "isActive": 0,
+            "messageId": "42",
+            "metadata": None,
+            "note": "text",
+        }
+        value = getRowDecoder(_DecoderRowDict).decode(row, keepOriginal=True)
+        assert value is not row
+        assert row["createdAt"] == "2024-01-15 10:30:00"
+        assert value["isActive"] is False
+
+    def testDecodeMissingRequiredKey(self) -> None:
+        """Test a missing required key raises KeyError."""
+        with pytest.raises(KeyError):
+            getRowDecoder(_DecoderRowDict).decode({"id": 1})
+
+    def testDecodeInvalidValue(self) -> None:
+        """Test an unconvertible value raises TypeError."""
+        row = {
+            "id": "not a number",
+            "createdAt": "2024-01-15 10:30:00",
+            "isActive": 1,
+            "messageId": "42",
+            "metadata": None,
+            "note": None,
+        }
+        with pytest.raises(TypeError):
+            getRowDecoder(_DecoderRowDict).decode(row)
+
+    def testDecodeRowsMatchesSqlToTypedDict(self) -> None:
+        """Test decodeRows gives the same result as per-row sqlToTypedDict."""
+        rows = [
+            {
+                "id": i,
+                "createdAt": f"2024-01-{i + 1:02d} 10:30:00",
+                "isActive": i % 2,
+                "messageId": str(i),
+                "metadata": None,
+                "note": f"note {i}",
+            }
+            for i in range(5)
+        ]
+        expected = [sqlToTypedDict(row, _DecoderRowDict, keepOriginal=True) for row in rows]
+        assert getRowDecoder(_DecoderRowDict).decodeRows(rows) == expected
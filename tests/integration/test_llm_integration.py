@@ -44,6 +44,8 @@ def mockModel():
     model.temperature = 0.7
     model.contextSize = 4096
     model.getEstimateTokensCount = Mock(return_value=100)
+    model.getEstimateMessageTokensCount = Mock(return_value=10)
+    model.hasExactTokensCount = Mock(return_value=False)
     return model
 
 
@@ -56,6 +58,8 @@ def mockFallbackModel():
     model.temperature = 0.7
     model.contextSize = 4096
     model.getEstimateTokensCount = Mock(return_value=100)
+    model.getEstimateMessageTokensCount = Mock(return_value=10)
+    model.hasExactTokensCount = Mock(return_value=False)
     return model
 
 
@@ -14,6 +14,7 @@ Test Categories:
     - Error Handling Tests: Tests for error scenarios
     - Image Generation Tests: Tests for image generation capabilities
     - Integration Tests: End-to-end workflow tests
+    - Streaming Tests: Tests for streamed text and tool call generation
 """
 
 import base64
@@ -26,6 +27,9 @@ import openai
 import pytest
 from openai import AsyncOpenAI
 from openai.types.chat.chat_completion import ChatCompletion, Choice
+from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
+from openai.types.chat.chat_completion_chunk import ChoiceDelta, ChoiceDeltaToolCall, ChoiceDeltaToolCallFunction
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 from openai.types.chat.chat_completion_message_tool_call import (
     ChatCompletionMessageToolCall,
@@ -47,6 +51,7 @@ from lib.ai.providers.basic_openai_provider import (
     BasicOpenAIProvider,
     _extractImagePrompt,
 )
+from lib.http_client import HttpClientRegistry
 from lib.stats import NullStatsStorage, StatsStorage
 
 # ============================================================================
@@ -2103,12 +2108,12 @@ async def testGenerateImageViaImagesApiUrlDownload(
 
     mockClient = AsyncMock()
     mockClient.get = AsyncMock(return_value=mockHttpxResponse)
-    mockClient.__aenter__ = AsyncMock(return_value=mockClient)
-    mockClient.__aexit__ = AsyncMock(return_value=None)
 
-    with patch("httpx.AsyncClient", return_value=mockClient):
+    with patch.object(HttpClientRegistry, "getClient", return_value=mockClient):
         result = await testModel._generateImageViaImagesApi(sampleMessages)
 
+    mockClient.get.assert_awaited_once()
+    mockClient.aclose.assert_not_called()
     assert result.status == ModelResultStatus.FINAL
     assert result.mediaData == b"downloaded"
     assert result.mediaMimeType == "image/png"
@@ -2139,10 +2144,8 @@ async def testGenerateImageViaImagesApiUrlDownloadError(
 
     mockClient = AsyncMock()
     mockClient.get = AsyncMock(side_effect=httpx.HTTPError("Connection failed"))
-    mockClient.__aenter__ = AsyncMock(return_value=mockClient)
-    mockClient.__aexit__ = AsyncMock(return_value=None)
 
-    with patch("httpx.AsyncClient", return_value=mockClient):
+    with patch.object(HttpClientRegistry, "getClient", return_value=mockClient):
         result = await testModel._generateImageViaImagesApi(sampleMessages)
 
     assert result.status == ModelResultStatus.ERROR
@@ -2300,3 +2303,229 @@ async def testGenerateImageViaImagesApiResponseDataNone(
     result = await testModel._generateImageViaImagesApi(sampleMessages)
 
     assert result.status == ModelResultStatus.ERROR
+
+
+# ============================================================================
+# Embedding Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def testGenerateEmbeddingsBatchUsesInputArray(testModel: BasicOpenAIModel, mockAsyncOpenAI: Mock) -> None:
+    """Test batch embeddings are sent as one ``input=[...]`` request and reordered by index.
+
+    Args:
+        testModel: The test model instance.
+        mockAsyncOpenAI: The mock AsyncOpenAI client.
+
+    Raises:
+        AssertionError: If the request or the result ordering is wrong.
+    """
+    testModel._config["support_embeddings"] = True
+    testModel._config["embedding_dimensions"] = 2
+
+    mockResponse = Mock()
+    mockResponse.data = [
+        Mock(index=1, embedding=[0.0, 1.0]),
+        Mock(index=0, embedding=[1.0, 0.0]),
+    ]
+    mockAsyncOpenAI.embeddings = Mock()
+    mockAsyncOpenAI.embeddings.create = AsyncMock(return_value=mockResponse)
+
+    result = await testModel.generateEmbeddingsBatch(["first", "second"])
+
+    assert result == [[1.0, 0.0], [0.0, 1.0]]
+    mockAsyncOpenAI.embeddings.create.assert_awaited_once()
+    callKwargs = mockAsyncOpenAI.embeddings.create.call_args.kwargs
+    assert callKwargs["input"] == ["first", "second"]
+    assert callKwargs["model"] == "test-model"
+    assert callKwargs["dimensions"] == 2
+
+
+@pytest.mark.asyncio
+async def testGenerateEmbeddingsBatchMissingItems(testModel: BasicOpenAIModel, mockAsyncOpenAI: Mock) -> None:
+    """Test a response with fewer vectors than texts raises ValueError.
+
+    Args:
+        testModel: The test model instance.
+        mockAsyncOpenAI: The mock AsyncOpenAI client.
+
+    Raises:
+        ValueError: If the response is short.
+    """
+    mockResponse = Mock()
+    mockResponse.data = [Mock(index=0, embedding=[1.0, 0.0])]
+    mockAsyncOpenAI.embeddings = Mock()
+    mockAsyncOpenAI.embeddings.create = AsyncMock(return_value=mockResponse)
+
+    with pytest.raises(ValueError, match="1 items for 2 texts"):
+        await testModel._generateEmbeddingsBatch(["first", "second"])
+
+
+# ============================================================================
+# Streaming Tests
+# ============================================================================
+
+
+class _FakeStream:
+    """Async iterator over prepared ChatCompletionChunk objects, like openai.AsyncStream.
+
+    Attributes:
+        chunks: Chunks to yield.
+        closed: Whether close() was called.
+    """
+
+    def __init__(self, chunks: list[ChatCompletionChunk]) -> None:
+        self.chunks = chunks
+        self.closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _makeChunk(
+    content: Optional[str] = None,
+    *,
+    toolCalls: Optional[list[ChoiceDeltaToolCall]] = None,
+    finishReason: Optional[str] = None,
+    usage: Optional[CompletionUsage] = None,
+    withChoice: bool = True,
+) -> ChatCompletionChunk:
+    """Create a streamed chunk with a single choice (or none, for the usage chunk)."""
+    choices = []
+    if withChoice:
+        choices.append(
+            ChunkChoice(
+                index=0,
+                delta=ChoiceDelta(content=content, tool_calls=toolCalls),
+                finish_reason=finishReason,  # type: ignore[arg-type]
+            )
+        )
+    return ChatCompletionChunk(
+        id="chunk",
+        choices=choices,
+        created=0,
+        model="test-model",
+        object="chat.completion.chunk",
+        usage=usage,
+    )
+
+
+@pytest.mark.asyncio
+async def testGenerateTextStreamText(
+    testModel: BasicOpenAIModel, mockAsyncOpenAI: Mock, sampleMessages: list[ModelMessage]
+) -> None:
+    """Test streamed text deltas, the final result and the request parameters.
+
+    Args:
+        testModel: Test model instance wired to the mock client.
+        mockAsyncOpenAI: Mock AsyncOpenAI client.
+        sampleMessages: Sample conversation messages.
+    """
+    stream = _FakeStream(
+        [
+            _makeChunk("Hel"),
+            _makeChunk("lo!"),
+            _makeChunk(finishReason="stop"),
+            _makeChunk(withChoice=False, usage=CompletionUsage(prompt_tokens=5, completion_tokens=2, total_tokens=7)),
+        ]
+    )
+    mockAsyncOpenAI.chat.completions.create.return_value = stream
+
+    chunks = [chunk async for chunk in testModel.generateTextStream(sampleMessages)]
+
+    assert [chunk.textDelta for chunk in chunks] == ["Hel", "lo!", ""]
+    result = chunks[-1].result
+    assert result is not None
+    assert result.status == ModelResultStatus.FINAL
+    assert result.resultText == "Hello!"
+    assert (result.inputTokens, result.outputTokens, result.totalTokens) == (5, 2, 7)
+    assert stream.closed
+
+    callKwargs = mockAsyncOpenAI.chat.completions.create.call_args.kwargs
+    assert callKwargs["stream"] is True
+    assert callKwargs["stream_options"] == {"include_usage": True}
+    assert callKwargs["model"] == "test-model"
+
+
+@pytest.mark.asyncio
+async def testGenerateTextStreamToolCalls(
+    testModel: BasicOpenAIModel,
+    mockAsyncOpenAI: Mock,
+    sampleMessages: list[ModelMessage],
+    sampleTools: list[LLMToolFunction],
+) -> None:
+    """Test tool call fragments are yielded as deltas and assembled by index.
+
+    Args:
+        testModel: Test model instance wired to the mock client.
+        mockAsyncOpenAI: Mock AsyncOpenAI client.
+        sampleMessages: Sample conversation messages.
+        sampleTools: Sample tools.
+    """
+    mockAsyncOpenAI.chat.completions.create.return_value = _FakeStream(
+        [
+            _makeChunk(
+                toolCalls=[
+                    ChoiceDeltaToolCall(
+                        index=0, id="call_1", function=ChoiceDeltaToolCallFunction(name="getWeather", arguments="")
+                    )
+                ]
+            ),
+            _makeChunk(
+                toolCalls=[ChoiceDeltaToolCall(index=0, function=ChoiceDeltaToolCallFunction(arguments='{"loca'))]
+            ),
+            _makeChunk(
+                toolCalls=[
+                    ChoiceDeltaToolCall(index=0, function=ChoiceDeltaToolCallFunction(arguments='tion": "Paris"}'))
+                ]
+            ),
+            _makeChunk(finishReason="tool_calls"),
+        ]
+    )
+
+    chunks = [chunk async for chunk in testModel.generateTextStream(sampleMessages, tools=sampleTools)]
+
+    deltas = [delta for chunk in chunks for delta in chunk.toolCallDeltas]
+    assert [delta.argumentsDelta for delta in deltas] == ["", '{"loca', 'tion": "Paris"}']
+    assert deltas[0].id == "call_1" and deltas[0].name == "getWeather"
+
+    result = chunks[-1].result
+    assert result is not None
+    assert result.status == ModelResultStatus.TOOL_CALLS
+    assert len(result.toolCalls) == 1
+    assert result.toolCalls[0].id == "call_1"
+    assert result.toolCalls[0].name == "getWeather"
+    assert result.toolCalls[0].parameters == {"location": "Paris"}
+
+
+@pytest.mark.asyncio
+async def testGenerateTextStreamBadRequest(
+    testModel: BasicOpenAIModel, mockAsyncOpenAI: Mock, sampleMessages: list[ModelMessage]
+) -> None:
+    """Test a BadRequestError ends the stream with an error result.
+
+    Args:
+        testModel: Test model instance wired to the mock client.
+        mockAsyncOpenAI: Mock AsyncOpenAI client.
+        sampleMessages: Sample conversation messages.
+    """
+    mockAsyncOpenAI.chat.completions.create.side_effect = openai.BadRequestError(
+        "bad request",
+        response=httpx.Response(400, request=httpx.Request("POST", "https://test.api.example.com/v1")),
+        body=None,
+    )
+
+    chunks = [chunk async for chunk in testModel.generateTextStream(sampleMessages)]
+
+    assert len(chunks) == 1
+    assert chunks[0].result is not None
+    assert chunks[0].result.status == ModelResultStatus.ERROR
+    assert isinstance(chunks[0].result.error, openai.BadRequestError)
@@ -684,3 +684,93 @@ class TestGenerateEmbeddings:
         assert modelTrue.supportsEmbedding is True
         modelFalse = _makeEmbeddingModel(supportEmbeddings=False)
         assert modelFalse.supportsEmbedding is False
+
+
+class TestGenerateEmbeddingsBatch:
+    """Tests for generateEmbeddingsBatch method on AbstractModel."""
+
+    async def test_generateEmbeddingsBatch_default_loops_single(self) -> None:
+        """Without a provider override, each text goes through ``_generateEmbeddings``.
+
+        Returns:
+            None
+        """
+        model = _makeEmbeddingModel()
+        model._generateEmbeddings = AsyncMock(side_effect=[[1.0], [2.0], [3.0]])
+        result = await model.generateEmbeddingsBatch(["a", "b", "c"])
+        assert result == [[1.0], [2.0], [3.0]]
+        assert model._generateEmbeddings.await_count == 3
+
+    async def test_generateEmbeddingsBatch_empty(self) -> None:
+        """An empty input never reaches the backend.
+
+        Returns:
+            None
+        """
+        model = _makeEmbeddingModel()
+        model._generateEmbeddingsBatch = AsyncMock()
+        assert await model.generateEmbeddingsBatch([]) == []
+        model._generateEmbeddingsBatch.assert_not_called()
+
+    async def test_generateEmbeddingsBatch_chunks_by_count_and_tokens(self) -> None:
+        """Chunks are bounded by ``embeddingBatchSize`` and ``embeddingBatchTokens``.
+
+        Returns:
+            None
+        """
+        model = _makeEmbeddingModel()
+        model.embeddingBatchSize = 2
+        model.embeddingBatchTokens = 100
+        model._generateEmbeddingsBatch = AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+        # 350 chars ~ 110 tokens: over the budget alone, so it gets a chunk of its own.
+        texts = ["a", "bb", "ccc", "x" * 350, "dddd"]
+        result = await model.generateEmbeddingsBatch(texts)
+        assert result == [[1.0], [2.0], [3.0], [350.0], [4.0]]
+        chunks = [list(call.args[0]) for call in model._generateEmbeddingsBatch.await_args_list]
+        assert chunks == [["a", "bb"], ["ccc"], ["x" * 350], ["dddd"]]
+
+    async def test_generateEmbeddingsBatch_retries_chunk(self) -> None:
+        """A transient failure retries only the failed chunk.
+
+        Returns:
+            None
+        """
+        model = _makeEmbeddingModel()
+        model._generateEmbeddingsBatch = AsyncMock(side_effect=[asyncio.TimeoutError("transient"), [[1.0], [2.0]]])
+        with patch("lib.ai.abstract.asyncio.sleep", new_callable=AsyncMock) as mockSleep:
+            result = await model.generateEmbeddingsBatch(["a", "b"], attempts=2)
+        assert result == [[1.0], [2.0]]
+        assert model._generateEmbeddingsBatch.await_count == 2
+        mockSleep.assert_awaited_once()
+
+    async def test_generateEmbeddingsBatch_count_mismatch(self) -> None:
+        """A backend returning the wrong number of vectors fails without retrying.
+
+        Returns:
+            None
+        """
+        model = _makeEmbeddingModel()
+        model._generateEmbeddingsBatch = AsyncMock(return_value=[[1.0]])
+        with pytest.raises(ValueError):
+            await model.generateEmbeddingsBatch(["a", "b"])
+        assert model._generateEmbeddingsBatch.await_count == 1
+
+    async def test_generateEmbeddingsBatch_rejects_empty_text(self) -> None:
+        """Any empty text raises ValueError before calling the backend.
+
+        Returns:
+            None
+        """
+        model = _makeEmbeddingModel()
+        with pytest.raises(ValueError):
+            await model.generateEmbeddingsBatch(["a", "  "])
+
+    async def test_generateEmbeddingsBatch_not_supported(self) -> None:
+        """supportsEmbedding=False → raises NotImplementedError.
+
+        Returns:
+            None
+        """
+        model = _makeEmbeddingModel(supportEmbeddings=False)
+        with pytest.raises(NotImplementedError):
+            await model.generateEmbeddingsBatch(["a"])
@@ -0,0 +1,193 @@
+"""Tests for AbstractModel.generateTextStream.
+
+Covers:
+- The default _generateTextStream yields the _generateText result as one chunk.
+- Provider chunks are passed through and the last chunk carries the result.
+- Fallback happens when the primary model fails before streaming anything.
+- No fallback once text was streamed: the error is reported in the final result.
+- Exceptions are raised when no fallback models are given.
+- The context size guard returns an error result without calling the provider.
+"""
+
+from collections.abc import Sequence
+from typing import Any, AsyncIterator, List, Optional
+
+import pytest
+
+from lib.ai.abstract import AbstractModel
+from lib.ai.models import (
+    LLMToolCall,
+    LLMToolCallDelta,
+    ModelMessage,
+    ModelResultChunk,
+    ModelResultStatus,
+    ModelRunResult,
+)
+from lib.stats import NullStatsStorage
+
+from .test_abstract import _makeProvider
+
+
+class _StreamModel(AbstractModel):
+    """Model stub streaming the given text deltas, then a result with the given status.
+
+    Attributes:
+        deltas: Text deltas to stream.
+        status: Status of the final result.
+        error: Exception to raise after streaming the deltas (None - no error).
+        calls: Number of stream calls.
+    """
+
+    def __init__(
+        self,
+        modelId: str,
+        deltas: Sequence[str] = (),
+        status: ModelResultStatus = ModelResultStatus.FINAL,
+        error: Optional[Exception] = None,
+        contextSize: int = 4096,
+    ) -> None:
+        super().__init__(
+            provider=_makeProvider(),
+            modelId=modelId,
+            modelVersion="1.0",
+            temperature=0.5,
+            contextSize=contextSize,
+            statsStorage=NullStatsStorage(),
+            extraConfig={},
+        )
+        self.deltas = list(deltas)
+        self.status = status
+        self.error = error
+        self.calls = 0
+
+    async def _generateText(self, messages: Sequence[ModelMessage], tools: Optional[Any] = None) -> ModelRunResult:
+        return ModelRunResult(rawResult=None, status=self.status, resultText="".join(self.deltas))
+
+    async def _generateTextStream(
+        self, messages: Sequence[ModelMessage], tools: Optional[Any] = None
+    ) -> AsyncIterator[ModelResultChunk]:
+        self.calls += 1
+        for delta in self.deltas:
+            yield ModelResultChunk(textDelta=delta)
+        if self.error is not None:
+            raise self.error
+        yield ModelResultChunk(
+            result=ModelRunResult(rawResult=None, status=self.status, resultText="".join(self.deltas))
+        )
+
+    async def _generateImage(self, messages: Sequence[ModelMessage]) -> ModelRunResult:
+        return ModelRunResult(rawResult=None, status=ModelResultStatus.FINAL)
+
+    async def _generateEmbeddings(self, text: str) -> list[float]:
+        return [0.0] * 4
+
+
+class _PlainModel(_StreamModel):
+    """Model stub without its own streaming, using the default implementation."""
+
+    async def _generateText(self, messages: Sequence[ModelMessage], tools: Optional[Any] = None) -> ModelRunResult:
+        return ModelRunResult(
+            rawResult=None,
+            status=ModelResultStatus.TOOL_CALLS,
+            resultText="thinking",
+            toolCalls=[LLMToolCall(id="1", name="tool", parameters={})],
+        )
+
+    _generateTextStream = AbstractModel._generateTextStream
+
+
+async def _collect(stream: AsyncIterator[ModelResultChunk]) -> List[ModelResultChunk]:
+    return [chunk async for chunk in stream]
+
+
+MESSAGES = [ModelMessage(role="user", content="Hi")]
+
+
+async def testDefaultStreamYieldsSingleChunk() -> None:
+    """Models without streaming yield the whole result as one chunk."""
+    chunks = await _collect(_PlainModel("plain").generateTextStream(MESSAGES))
+
+    assert len(chunks) == 1
+    assert chunks[0].textDelta == "thinking"
+    assert chunks[0].result is not None
+    assert chunks[0].result.status == ModelResultStatus.TOOL_CALLS
+    assert chunks[0].result.toolCalls[0].name == "tool"
+
+
+async def testChunksArePassedThrough() -> None:
+    """Deltas come first, the last chunk carries the result with elapsed time."""
+    chunks = await _collect(_StreamModel("main", ["Hel", "lo"]).generateTextStream(MESSAGES))
+
+    assert [chunk.textDelta for chunk in chunks] == ["Hel", "lo", ""]
+    assert all(chunk.result is None for chunk in chunks[:-1])
+    result = chunks[-1].result
+    assert result is not None
+    assert result.resultText == "Hello"
+    assert result.elapsedTime is not None
+    assert not result.isFallback
+
+
+async def testFallbackBeforeAnythingStreamed() -> None:
+    """A model failing before the first delta is replaced by the fallback model."""
+    primary = _StreamModel("primary", status=ModelResultStatus.ERROR)
+    fallback = _StreamModel("fallback", ["ok"])
+
+    chunks = await _collect(primary.generateTextStream(MESSAGES, fallbackModels=[fallback]))
+
+    assert [chunk.textDelta for chunk in chunks] == ["ok", ""]
+    result = chunks[-1].result
+    assert result is not None
+    assert result.status == ModelResultStatus.FINAL
+    assert result.isFallback
+    assert primary.calls == 1 and fallback.calls == 1
+
+
+async def testExceptionBeforeAnythingStreamedFallsBack() -> None:
+    """Exceptions before the first delta are treated as failures."""
+    primary = _StreamModel("primary", error=RuntimeError("down"))
+    fallback = _StreamModel("fallback", ["ok"])
+
+    chunks = await _collect(primary.generateTextStream(MESSAGES, fallbackModels=[fallback]))
+
+    assert chunks[-1].result is not None
+    assert chunks[-1].result.resultText == "ok"
+
+
+async def testNoFallbackAfterStreaming() -> None:
+    """Once text was streamed, a failure ends the stream with an error result."""
+    primary = _StreamModel("primary", ["partial"], error=RuntimeError("connection lost"))
+    fallback = _StreamModel("fallback", ["ok"])
+
+    chunks = await _collect(primary.generateTextStream(MESSAGES, fallbackModels=[fallback]))
+
+    assert [chunk.textDelta for chunk in chunks] == ["partial", ""]
+    result = chunks[-1].result
+    assert result is not None
+    assert result.status == ModelResultStatus.ERROR
+    assert fallback.calls == 0
+
+
+async def testExceptionWithoutFallbackIsRaised() -> None:
+    """Without fallback models exceptions are propagated, as in generateText."""
+    with pytest.raises(RuntimeError):
+        await _collect(_StreamModel("main", error=RuntimeError("down")).generateTextStream(MESSAGES))
+
+
+async def testContextTooLarge() -> None:
+    """Messages exceeding twice the context return an error without calling the provider."""
+    model = _StreamModel("tiny", ["never"], contextSize=1)
+
+    chunks = await _collect(model.generateTextStream([ModelMessage(role="user", content="x" * 100)]))
+
+    assert len(chunks) == 1
+    assert chunks[0].result is not None
+    assert chunks[0].result.status == ModelResultStatus.ERROR
+    assert model.calls == 0
+
+
+def testToolCallDeltaRepr() -> None:
+    """Tool call deltas keep the fragment fields."""
+    delta = LLMToolCallDelta(0, id="call_1", name="get_weather", argumentsDelta='{"c')
+
+    assert "get_weather" in repr(delta)
+    assert delta.argumentsDelta == '{"c'
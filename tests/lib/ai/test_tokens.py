@@ -0,0 +1,189 @@
+"""Tests for per-message token accounting.
+
+Covers:
+- ModelMessage memoizes its serialized length and invalidates it on changes.
+- getEstimateMessagesTokensCount never underestimates the list estimate.
+- MessageTokensCounter.total/trimStart/fitEnd on regular and edge-case ranges.
+- MessageTokensCounter.create uses exact counts once per message when available.
+"""
+
+from collections.abc import Sequence
+from typing import Any, List, Optional
+from unittest.mock import patch
+
+import pytest
+
+from lib.ai.abstract import AbstractModel
+from lib.ai.models import ModelMessage, ModelResultStatus, ModelRunResult
+from lib.ai.tokens import MessageTokensCounter
+from lib.stats import NullStatsStorage
+
+from .test_abstract import _makeProvider
+
+
+class _CountingModel(AbstractModel):
+    """Model stub with an optional fake tokenizer counting one token per character.
+
+    Attributes:
+        exactCalls: Number of getExactTokensCount() calls.
+    """
+
+    def __init__(self, exact: bool = False) -> None:
+        super().__init__(
+            provider=_makeProvider(),
+            modelId="counting",
+            modelVersion="1.0",
+            temperature=0.5,
+            contextSize=4096,
+            statsStorage=NullStatsStorage(),
+            extraConfig={},
+        )
+        self.exact = exact
+        self.exactCalls = 0
+
+    async def _generateText(self, messages: Sequence[ModelMessage], tools: Optional[Any] = None) -> ModelRunResult:
+        return ModelRunResult(rawResult=None, status=ModelResultStatus.FINAL)
+
+    async def _generateImage(self, messages: Sequence[ModelMessage]) -> ModelRunResult:
+        return ModelRunResult(rawResult=None, status=ModelResultStatus.FINAL)
+
+    async def _generateEmbeddings(self, text: str) -> list[float]:
+        return [0.0] * 4
+
+    def hasExactTokensCount(self) -> bool:
+        return self.exact
+
+    async def getExactTokensCount(self, data: Any) -> int:
+        self.exactCalls += 1
+        return sum(len(item["content"]) for item in data)
+
+
+def _messages(*contents: str) -> List[ModelMessage]:
+    return [ModelMessage(content=content) for content in contents]
+
+
+class TestMessageSizeMemoization:
+    """ModelMessage.getSerializedLength() and the per-message estimates."""
+
+    def testSerializedLengthIsMemoized(self) -> None:
+        """toDict() runs once while the message does not change."""
+        message = ModelMessage(content="hello world")
+        with patch.object(ModelMessage, "toDict", autospec=True, side_effect=ModelMessage.toDict) as toDict:
+            first = message.getSerializedLength()
+            second = message.getSerializedLength()
+
+        assert first == second
+        assert toDict.call_count == 1
+
+    def testChangedContentInvalidatesLength(self) -> None:
+        """Changing a field recomputes the memoized length."""
+        message = ModelMessage(content="short")
+        before = message.getSerializedLength()
+        message.content = "a much longer content than before"
+
+        assert message.getSerializedLength() == before + len("a much longer content than before") - len("short")
+
+    def testPerMessageSumNeverUnderestimates(self) -> None:
+        """The per-message sum is at least the estimate of the serialized list."""
+        model = _CountingModel()
+        messages = _messages("a", "Привет, мир!", "x" * 1000, "")
+
+        assert model.getEstimateMessagesTokensCount(messages) >= model.getEstimateTokensCount(
+            [message.toDict() for message in messages]
+        )
+        assert model.getEstimateMessagesTokensCount([]) == 0
+
+
+class TestMessageTokensCounter:
+    """MessageTokensCounter prefix sums and binary searches."""
+
+    def testTotal(self) -> None:
+        """Slice totals follow slice semantics and clamp out-of-range indices."""
+        counter = MessageTokensCounter([5, 10, 20, 40])
+
+        assert len(counter) == 4
+        assert counter.total() == 75
+        assert counter.total(1, 3) == 30
+        assert counter.total(3, 1) == 0
+        assert counter.total(-5, 100) == 75
+
+    @pytest.mark.parametrize(
+        "budget, start, end, expected",
+        [
+            (60, 0, None, 2),
+            (59, 0, None, 3),
+            (1000, 1, None, 1),
+            (39, 0, None, 4),
+            (0, 0, None, 4),
+            (30, 0, 3, 1),
+            (100, 2, 2, 2),
+        ],
+    )
+    def testTrimStart(self, budget: int, start: int, end: Optional[int], expected: int) -> None:
+        """trimStart() finds the first message from which the rest fits."""
+        counter = MessageTokensCounter([5, 10, 20, 40])
+
+        assert counter.trimStart(budget, start, end) == expected
+        if expected < counter._clampEnd(end):
+            assert counter.total(expected, end) <= budget
+
+    @pytest.mark.parametrize(
+        "budget, start, end, expected",
+        [
+            (35, 0, None, 3),
+            (34, 0, None, 2),
+            (1000, 0, None, 4),
+            (4, 0, None, 0),
+            (30, 1, None, 3),
+            (1000, 1, 2, 2),
+            (9, 1, None, 1),
+            (100, 3, 3, 3),
+        ],
+    )
+    def testFitEnd(self, budget: int, start: int, end: Optional[int], expected: int) -> None:
+        """fitEnd() finds the longest batch starting at start within the budget."""
+        counter = MessageTokensCounter([5, 10, 20, 40])
+
+        assert counter.fitEnd(budget, start, end) == expected
+        assert counter.total(start, expected) <= budget
+
+    def testZeroSizedMessagesAreTaken(self) -> None:
+        """Messages without tokens always fit."""
+        counter = MessageTokensCounter([0, 0, 7, 0])
+
+        assert counter.fitEnd(0) == 2
+        assert counter.trimStart(0) == 3
+
+    def testEstimateMatchesModel(self) -> None:
+        """estimate() uses the model's per-message estimates."""
+        model = _CountingModel()
+        messages = _messages("one", "two", "three")
+        counter = MessageTokensCounter.estimate(model, messages)
+
+        assert counter.total() == model.getEstimateMessagesTokensCount(messages)
+
+    async def testCreateFallsBackToEstimate(self) -> None:
+        """Without a tokenizer create() does not call getExactTokensCount()."""
+        model = _CountingModel(exact=False)
+        messages = _messages("one", "two")
+
+        counter = await MessageTokensCounter.create(model, messages)
+
+        assert model.exactCalls == 0
+        assert counter.total() == model.getEstimateMessagesTokensCount(messages)
+
+    async def testCreateUsesMemoizedExactCounts(self) -> None:
+        """Exact counts are computed once per message and recomputed after a change."""
+        model = _CountingModel(exact=True)
+        messages = _messages("one", "three")
+
+        assert (await MessageTokensCounter.create(model, messages)).total() == 8
+        assert (await MessageTokensCounter.create(model, messages)).total() == 8
+        assert model.exactCalls == 2
+
+        messages[0].content = "eleven"
+        assert (await MessageTokensCounter.create(model, messages)).total() == 11
+        assert model.exactCalls == 3
+
+        await MessageTokensCounter.create(model, messages, exact=False)
+        assert model.exactCalls == 3
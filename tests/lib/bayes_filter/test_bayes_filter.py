@@ -1346,6 +1346,89 @@ class TestBayesFilterChatIsolation:
         assert stats2.total_spam_messages == 1
 
 
+class TestBatchLearnBulkPath:
+    """Test that batch learning aggregates updates before writing them.
+
+    ``batch_learn`` must issue one token write per chat and one class
+    write per chat and class, and the database storage must persist the
+    merged updates with the same result as per-message learning.
+    """
+
+    @pytest.mark.asyncio
+    async def test_batch_learn_writes_once_per_chat(self, bayesFilter: NaiveBayesFilter) -> None:
+        """Token and class updates are aggregated across the whole batch.
+
+        Args:
+            bayesFilter: Bayes filter fixture.
+        """
+        storage = bayesFilter.storage
+        tokenCalls: List[int] = []
+        classCalls: List[tuple] = []
+        originalBatch = storage.batchUpdateTokens
+        originalClass = storage.updateClassStats
+
+        async def countingBatch(updates, chat_id=None):
+            tokenCalls.append(len(updates))
+            return await originalBatch(updates, chat_id)
+
+        async def countingClass(isSpam, messageIncrement=1, tokenIncrement=0, chatId=None):
+            classCalls.append((chatId, isSpam, messageIncrement))
+            return await originalClass(isSpam, messageIncrement, tokenIncrement, chatId)
+
+        storage.batchUpdateTokens = countingBatch  # type: ignore[method-assign]
+        storage.updateClassStats = countingClass  # type: ignore[method-assign]
+
+        stats = await bayesFilter.batch_learn(
+            [
+                ("buy cheap watches now", True, 1),
+                ("buy cheap phones now", True, 1),
+                ("hello friend how are you", False, 1),
+                ("buy cheap cars", True, 2),
+                ("", False, 1),
+            ]
+        )
+
+        assert stats == {"total": 5, "success": 4, "failed": 1, "spam_learned": 3, "ham_learned": 1}
+        assert len(tokenCalls) == 2
+        assert sorted(classCalls) == [(1, False, 1), (1, True, 2), (2, True, 1)]
+        buyStats = (await storage.getTokenStats(["buy"], 1))["buy"]
+        assert buyStats.spamCount == 2
+
+    @pytest.mark.asyncio
+    async def test_database_batch_matches_single_learning(self, testDatabase: Database) -> None:
+        """Bulk learning through DatabaseBayesStorage equals per-message learning.
+
+        Args:
+            testDatabase: Real in-memory database fixture.
+        """
+        config = BayesConfig(perChatStats=True, alpha=1.0, minTokenCount=1)
+        messages = [
+            ("buy cheap watches now", True, 1),
+            ("cheap watches for friends", False, 1),
+            ("buy buy buy", True, 1),
+        ]
+
+        bulkFilter = NaiveBayesFilter(DatabaseBayesStorage(testDatabase), config)
+        await bulkFilter.batch_learn(messages)
+        bulkTokens = await bulkFilter.storage.getTokenStats(await bulkFilter.storage.getAllTokens(1), 1)
+        bulkInfo = await bulkFilter.getModelInfo(chat_id=1)
+
+        await bulkFilter.reset(chat_id=1)
+        for text, isSpam, chatId in messages:
+            if isSpam:
+                await bulkFilter.learnSpam(text, chatId=chatId)
+            else:
+                await bulkFilter.learnHam(text, chatId=chatId)
+        singleTokens = await bulkFilter.storage.getTokenStats(await bulkFilter.storage.getAllTokens(1), 1)
+        singleInfo = await bulkFilter.getModelInfo(chat_id=1)
+
+        assert {t: (s.spamCount, s.hamCount, s.totalCount) for t, s in bulkTokens.items()} == {
+            t: (s.spamCount, s.hamCount, s.totalCount) for t, s in singleTokens.items()
+        }
+        assert bulkTokens["cheap"].spamCount == 1 and bulkTokens["cheap"].hamCount == 1
+        assert bulkInfo == singleInfo
+
+
 # ============================================================================
 # Additional Unit Tests
 # ============================================================================
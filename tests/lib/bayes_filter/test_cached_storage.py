@@ -0,0 +1,255 @@
+"""Tests for CachedBayesStorage, the in-memory Bayes model cache."""
+
+import asyncio
+from collections import Counter
+from typing import Dict, Iterable, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+
+from internal.database import Database
+from internal.database.bayes_storage import DatabaseBayesStorage
+from lib.bayes_filter import BayesConfig, CachedBayesStorage, NaiveBayesFilter
+from lib.bayes_filter.models import ClassStats, TokenStats
+
+
+class CountingStorage(DatabaseBayesStorage):
+    """Database storage counting the read queries issued against it."""
+
+    def __init__(self, db: Database) -> None:
+        super().__init__(db)
+        self.reads: Counter = Counter()
+        self.failLoads = 0
+        self.writeGate: Optional[asyncio.Event] = None
+
+    async def getTokenStats(self, tokens: Iterable[str], chatId: Optional[int] = None) -> Dict[str, TokenStats]:
+        self.reads["getTokenStats"] += 1
+        return await super().getTokenStats(tokens, chatId)
+
+    async def getAllTokenStats(self, chatId: Optional[int] = None) -> Dict[str, TokenStats]:
+        self.reads["getAllTokenStats"] += 1
+        if self.failLoads > 0:
+            self.failLoads -= 1
+            raise RuntimeError("database is down")
+        return await super().getAllTokenStats(chatId)
+
+    async def getClassStats(self, is_spam: bool, chat_id: Optional[int] = None) -> ClassStats:
+        self.reads["getClassStats"] += 1
+        return await super().getClassStats(is_spam, chat_id)
+
+    async def getVocabularySize(self, chatId: Optional[int] = None) -> int:
+        self.reads["getVocabularySize"] += 1
+        return await super().getVocabularySize(chatId)
+
+    async def updateClassStats(
+        self, isSpam: bool, messageIncrement: int = 1, tokenIncrement: int = 0, chatId: Optional[int] = None
+    ) -> bool:
+        ret = await super().updateClassStats(isSpam, messageIncrement, tokenIncrement, chatId)
+        # The write is committed, but its caller doesn't see the result yet
+        if self.writeGate is not None:
+            await self.writeGate.wait()
+        return ret
+
+
+@pytest.fixture
+def backend(testDatabase: Database) -> CountingStorage:
+    """Counting database storage.
+
+    Args:
+        testDatabase: Real in-memory database fixture.
+
+    Returns:
+        CountingStorage instance.
+    """
+    return CountingStorage(testDatabase)
+
+
+def _makeFilter(storage) -> NaiveBayesFilter:
+    return NaiveBayesFilter(storage, BayesConfig(perChatStats=True, minTokenCount=1))
+
+
+async def _train(bayesFilter: NaiveBayesFilter, chatId: Optional[int]) -> None:
+    await bayesFilter.learnSpam("buy cheap watches now", chatId=chatId)
+    await bayesFilter.learnSpam("cheap pills buy now", chatId=chatId)
+    await bayesFilter.learnHam("hello friend see you at lunch", chatId=chatId)
+
+
+async def testClassifyIsServedFromMemory(backend: CountingStorage) -> None:
+    """After the first load, classification issues no storage reads.
+
+    Args:
+        backend: Counting database storage.
+    """
+    await _train(_makeFilter(backend), 1)
+    cached = CachedBayesStorage(backend)
+    cachedFilter = _makeFilter(cached)
+    expected = await _makeFilter(backend).classify("buy cheap watches", chatId=1)
+
+    result = await cachedFilter.classify("buy cheap watches", chatId=1)
+    backend.reads.clear()
+    for _ in range(5):
+        result = await cachedFilter.classify("buy cheap watches", chatId=1)
+
+    assert sum(backend.reads.values()) == 0
+    assert result.score == pytest.approx(expected.score)
+    assert result.tokenScores == pytest.approx(expected.tokenScores)
+    assert cached.getStats()["loads"] == 1
+
+
+async def testLearningUpdatesCachedModelInPlace(backend: CountingStorage) -> None:
+    """Writes go to the database and to the cached snapshot.
+
+    Args:
+        backend: Counting database storage.
+    """
+    cached = CachedBayesStorage(backend)
+    cachedFilter = _makeFilter(cached)
+    await cachedFilter.getModelInfo(chat_id=1)
+
+    await _train(cachedFilter, 1)
+    await cachedFilter.batch_learn([("buy more cheap stuff", True, 1), ("see you friend", False, 1)])
+
+    assert cached.getStats()["loads"] == 1
+    assert await cached.getModelStats(1) == await backend.getModelStats(1)
+    cachedTokens = await cached.getAllTokenStats(1)
+    assert cachedTokens == await backend.getAllTokenStats(1)
+    assert cachedTokens["cheap"].spamCount == 3
+
+
+async def testConcurrentReadsShareOneLoad(backend: CountingStorage) -> None:
+    """Readers of a model that is not cached yet wait for a single load.
+
+    Args:
+        backend: Counting database storage.
+    """
+    await _train(_makeFilter(backend), 1)
+    cached = CachedBayesStorage(backend)
+    backend.reads.clear()
+
+    results = await asyncio.gather(*[cached.getVocabularySize(1) for _ in range(10)])
+
+    assert len(set(results)) == 1
+    assert backend.reads["getAllTokenStats"] == 1
+
+
+async def testColdChatsAreEvicted(backend: CountingStorage) -> None:
+    """Least recently used models are dropped beyond the token budget.
+
+    Args:
+        backend: Counting database storage.
+    """
+    trainer = _makeFilter(backend)
+    for chatId in (1, 2, 3):
+        await _train(trainer, chatId)
+    vocabularySize = await backend.getVocabularySize(1)
+    cached = CachedBayesStorage(backend, maxCachedTokens=vocabularySize * 2)
+
+    for chatId in (1, 2, 1, 3):
+        await cached.getClassStats(True, chatId)
+
+    stats = cached.getStats()
+    assert stats["models"] == 2
+    assert stats["evictions"] == 1
+    assert stats["tokens"] <= vocabularySize * 2
+    # Chat 1 was used recently and stayed cached
+    backend.reads.clear()
+    await cached.getClassStats(True, 1)
+    assert backend.reads["getAllTokenStats"] == 0
+
+
+async def testReconcilePicksUpExternalWrites(backend: CountingStorage) -> None:
+    """A stale model is served once, then replaced by a background reload.
+
+    Args:
+        backend: Counting database storage.
+    """
+    cached = CachedBayesStorage(backend, reconcileInterval=0.05)
+    assert (await cached.getClassStats(True, 1)).message_count == 0
+
+    # Written by "another process", bypassing the cache
+    await _train(_makeFilter(backend), 1)
+    assert (await cached.getClassStats(True, 1)).message_count == 0
+
+    await asyncio.sleep(0.1)
+    assert (await cached.getClassStats(True, 1)).message_count == 0
+    await asyncio.sleep(0.2)
+    assert (await cached.getClassStats(True, 1)).message_count == 2
+
+
+async def testFailedLoadIsNotCached(backend: CountingStorage) -> None:
+    """A failing load raises and the next read tries again.
+
+    Args:
+        backend: Counting database storage.
+    """
+    await _train(_makeFilter(backend), 1)
+    backend.failLoads = 1
+    cached = CachedBayesStorage(backend)
+
+    with pytest.raises(RuntimeError):
+        await cached.getVocabularySize(1)
+    assert cached.getStats()["models"] == 0
+
+    assert await cached.getVocabularySize(1) == await backend.getVocabularySize(1)
+
+
+async def testClearStatsDropsCachedModel(backend: CountingStorage) -> None:
+    """Resetting a chat empties its cached model too.
+
+    Args:
+        backend: Counting database storage.
+    """
+    cached = CachedBayesStorage(backend)
+    cachedFilter = _makeFilter(cached)
+    await _train(cachedFilter, 1)
+    assert (await cachedFilter.getModelInfo(chat_id=1)).total_spam_messages == 2
+
+    assert await cachedFilter.reset(chat_id=1)
+
+    info = await cachedFilter.getModelInfo(chat_id=1)
+    assert info.total_spam_messages == 0
+    assert info.vocabulary_size == 0
+
+
+async def testLoadOverlappingWriteIsNotCountedTwice(backend: CountingStorage) -> None:
+    """A load that already sees a write in flight doesn't get the write applied again.
+
+    Args:
+        backend: Counting database storage.
+    """
+    cached = CachedBayesStorage(backend)
+    assert (await backend.getClassStats(True, 1)).message_count == 0
+    backend.writeGate = asyncio.Event()
+    write = asyncio.create_task(cached.updateClassStats(True, 1, 0, 1))
+    while (await backend.getClassStats(True, 1)).message_count == 0:
+        await asyncio.sleep(0.01)
+
+    assert (await cached.getClassStats(True, 1)).message_count == 1
+    backend.writeGate.set()
+    assert await write
+
+    assert (await cached.getClassStats(True, 1)).message_count == 1
+    assert (await cached.getClassStats(True, 1)).message_count == 1
+
+
+async def testFailedClassStatsReadRaises(backend: CountingStorage, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failed class stats query raises instead of returning zeros to be cached.
+
+    Args:
+        backend: Counting database storage.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    await _train(_makeFilter(backend), 1)
+    cached = CachedBayesStorage(backend)
+    monkeypatch.setattr(
+        type(backend.db.manager), "getProvider", AsyncMock(side_effect=RuntimeError("database is down"))
+    )
+
+    with pytest.raises(RuntimeError):
+        await backend.getClassStats(True, 1)
+    with pytest.raises(RuntimeError):
+        await cached.getClassStats(True, 1)
+    assert cached.getStats()["models"] == 0
+
+    monkeypatch.undo()
+    assert (await cached.getClassStats(True, 1)).message_count == 2
@@ -0,0 +1,168 @@
+"""Tests for the single-pass MessageTokenizer mode.
+
+Checks that the fused single-pass tokenizer yields exactly the tokens of the
+multi-pass pipeline for every combination of stripping options, that tokens
+are interned, and that tokenizeMany matches per-text tokenize. The benchmark
+compares both modes on a mixed Russian/English chat corpus.
+"""
+
+import itertools
+import logging
+import random
+import sys
+import time
+from typing import List
+
+import pytest
+
+from lib.bayes_filter.tokenizer import MessageTokenizer, TokenizerConfig
+
+logger = logging.getLogger(__name__)
+
+CHAT_CORPUS: List[str] = [
+    "Привет всем! Кто идёт сегодня на встречу в 19:30?",
+    "Hello guys, the build is broken again 😅 @devops please check",
+    "Заработок от 5000₽ в день без вложений!!! Пиши в ЛС @money_bot 💰💰💰",
+    "Смотрите https://example.com/article?id=42 — отличная статья про Python",
+    "BUY CHEAP CRYPTO NOW 🚀🚀 t.me/pumpchannel limited offer",
+    "ну такое... я бы не стал обновляться до 3.13 пока",
+    "Does anyone know how to fix ImportError in pytest_asyncio?",
+    "Ребята, @ivan_petrov вчера скинул ссылку www.habr.com/ru/post/123456",
+    "Ok 👍",
+    "Продам iPhone 15 Pro, 128GB, состояние отличное, цена 75000",
+    "Работа на дому, 2-3 часа в день, доход от 100$ 😍 пишите @hr_manager_2024",
+    "lol that's exactly what I said yesterday 😂😂😂",
+    "Кто-нибудь пробовал новый LLM от Яндекса? Как он по сравнению с GPT-4?",
+    "🎁🎁🎁 FREE GIFT 🎁🎁🎁 click https://bit.ly/3xYzAbC to claim",
+    "Встреча переносится на завтра, 10:00, переговорка №3",
+]
+"""Representative group chat messages: spam and ham, Russian and English."""
+
+_FRAGMENTS = [
+    "Привет",
+    "мир",
+    "hello",
+    "WORLD",
+    "123",
+    "abc123",
+    "@user",
+    "@юзер",
+    "https://x.ru/a?b=1",
+    "www.site.com",
+    "t.me/chan",
+    "😀",
+    "🚀",
+    "✂",
+    "Ⓜ",
+    "!",
+    "\n",
+    "-",
+    "_",
+    "İ",
+    "ß",
+    "test@mail.com",
+    "@@a",
+    "a😀b",
+    "😀@bob😀",
+    "http://",
+    "12:30",
+]
+
+
+def _multiPass(**kwargs) -> MessageTokenizer:
+    """Create a tokenizer running the original multi-pass pipeline."""
+    return MessageTokenizer(TokenizerConfig(single_pass=False, **kwargs))
+
+
+def _singlePass(**kwargs) -> MessageTokenizer:
+    """Create a tokenizer running the fused single-pass scan."""
+    return MessageTokenizer(TokenizerConfig(single_pass=True, **kwargs))
+
+
+class TestSinglePassTokenizer:
+    """Single-pass mode must be a drop-in replacement for multi-pass mode."""
+
+    def testDefaultIsSinglePass(self) -> None:
+        """The default config uses single-pass unless punctuation is preserved."""
+        assert MessageTokenizer()._scan_pattern is not None
+        assert MessageTokenizer(TokenizerConfig(preserve_punctuation=True))._scan_pattern is None
+        assert _multiPass()._scan_pattern is None
+
+    def testCorpusMatchesMultiPass(self) -> None:
+        """Every corpus message tokenizes identically in both modes."""
+        fast = _singlePass(use_trigrams=True)
+        slow = _multiPass(use_trigrams=True)
+        for text in CHAT_CORPUS:
+            assert fast.tokenize(text) == slow.tokenize(text), text
+            assert fast.tokenize(text, ignoreTrigrams=True) == slow.tokenize(text, ignoreTrigrams=True), text
+
+    @pytest.mark.parametrize(
+        "removeUrls,removeMentions,removeEmoji,removeNumbers,lowercase",
+        list(itertools.product([True, False], repeat=5)),
+    )
+    def testRandomTextsMatchMultiPass(
+        self, removeUrls: bool, removeMentions: bool, removeEmoji: bool, removeNumbers: bool, lowercase: bool
+    ) -> None:
+        """Randomly glued fragments tokenize identically for every option combination."""
+        kwargs = {
+            "remove_urls": removeUrls,
+            "remove_mentions": removeMentions,
+            "remove_emoji": removeEmoji,
+            "remove_numbers": removeNumbers,
+            "lowercase": lowercase,
+            "use_trigrams": True,
+        }
+        fast = _singlePass(**kwargs)
+        slow = _multiPass(**kwargs)
+        rnd = random.Random(42)
+        for _ in range(300):
+            text = "".join(rnd.choice(_FRAGMENTS) + rnd.choice(["", " "]) for _ in range(rnd.randint(0, 8)))
+            assert fast.tokenize(text) == slow.tokenize(text), repr(text)
+
+    def testTokensAreInterned(self) -> None:
+        """Equal tokens from different messages are the same object."""
+        tokenizer = _singlePass()
+        first = tokenizer.tokenize("Купить дешево сейчас")
+        second = tokenizer.tokenize("КУПИТЬ ДЕШЕВО СЕЙЧАС!!!")
+        assert first == second
+        for a, b in zip(first, second):
+            assert a is b
+        assert first[-1] is sys.intern("дешево_сейчас")
+
+    def testTokenizeMany(self) -> None:
+        """tokenizeMany returns one token list per text, like tokenize."""
+        for tokenizer in (_singlePass(), _multiPass()):
+            texts = CHAT_CORPUS + ["", "   ", "😀"]
+            assert tokenizer.tokenizeMany(texts) == [tokenizer.tokenize(text) for text in texts]
+            assert tokenizer.tokenizeMany(iter(texts), ignoreTrigrams=True) == [
+                tokenizer.tokenize(text, ignoreTrigrams=True) for text in texts
+            ]
+
+
+class TestTokenizerBenchmark:
+    """Throughput of single-pass versus multi-pass tokenization."""
+
+    @pytest.mark.benchmark
+    @pytest.mark.performance
+    def testThroughput(self) -> None:
+        """Compare messages per second of both modes on the chat corpus."""
+        corpus = CHAT_CORPUS * 200  # 3000 messages
+        results = {}
+        for name, tokenizer in (("multi-pass", _multiPass()), ("single-pass", _singlePass())):
+            best = float("inf")
+            for _ in range(3):
+                start = time.perf_counter()
+                for text in corpus:
+                    tokenizer.tokenize(text)
+                best = min(best, time.perf_counter() - start)
+            results[name] = len(corpus) / best
+
+        batchTokenizer = _singlePass()
+        start = time.perf_counter()
+        batchTokenizer.tokenizeMany(corpus)
+        results["single-pass tokenizeMany"] = len(corpus) / (time.perf_counter() - start)
+
+        for name, rate in results.items():
+            logger.info(f"{name}: {rate:,.0f} messages/s")
+        # Generous bound, timings on shared CI runners are noisy
+        assert results["single-pass"] > results["multi-pass"] * 0.8
@@ -0,0 +1,189 @@
+"""
+Tests for SingleFlight request coalescing.
+
+This module verifies that concurrent loads for the same key share one
+in-flight call, that results and errors reach every waiter, that timeouts
+apply per load, and that the singleFlight decorator builds keys from the
+call arguments.
+"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+import pytest
+
+from lib.cache import DictCache, SingleFlight, StringKeyGenerator, singleFlight
+
+
+class CountingLoader:
+    """Slow loader recording how many times it was called."""
+
+    def __init__(self, result: str = "value", delay: float = 0.02, error: Optional[Exception] = None) -> None:
+        self.result = result
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    async def test_concurrent_calls_share_one_load(self) -> None:
+        """Concurrent calls for the same key run the loader once."""
+        group: SingleFlight[str] = SingleFlight()
+        loader = CountingLoader()
+
+        results = await asyncio.gather(*(group.do("key", loader) for _ in range(10)))
+
+        assert results == ["value"] * 10
+        assert loader.calls == 1
+        assert group.getStats() == {"loads": 1, "coalesced": 9, "inFlight": 0}
+
+    async def test_different_keys_load_independently(self) -> None:
+        """Calls for different keys do not share loads."""
+        group: SingleFlight[str] = SingleFlight()
+        loaders = {key: CountingLoader(result=key) for key in ("a", "b")}
+
+        results = await asyncio.gather(group.do("a", loaders["a"]), group.do("b", loaders["b"]))
+
+        assert results == ["a", "b"]
+        assert loaders["a"].calls == 1
+        assert loaders["b"].calls == 1
+
+    async def test_finished_load_is_not_reused(self) -> None:
+        """A call after the load finished starts a new load."""
+        group: SingleFlight[str] = SingleFlight()
+        loader = CountingLoader(delay=0)
+
+        await group.do("key", loader)
+        await group.do("key", loader)
+
+        assert loader.calls == 2
+
+    async def test_error_is_propagated_to_all_waiters(self) -> None:
+        """Every waiter gets the loader's exception and the next call retries."""
+        group: SingleFlight[str] = SingleFlight()
+        loader = CountingLoader(error=ValueError("boom"))
+
+        results = await asyncio.gather(*(group.do("key", loader) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert loader.calls == 1
+
+        loader.error = None
+        assert await group.do("key", loader) == "value"
+
+    async def test_timeout_applies_to_the_load(self) -> None:
+        """A load exceeding its timeout fails every waiter with TimeoutError."""
+        group: SingleFlight[str] = SingleFlight(timeout=0.01)
+        loader = CountingLoader(delay=1.0)
+
+        results = await asyncio.gather(*(group.do("key", loader) for _ in range(2)), return_exceptions=True)
+
+        assert all(isinstance(result, TimeoutError) for result in results)
+        assert group.inFlight == 0
+
+    async def test_per_key_timeout_overrides_default(self) -> None:
+        """The timeout passed to do() overrides the group default for that load."""
+        group: SingleFlight[str] = SingleFlight(timeout=0.01)
+
+        assert await group.do("slow", CountingLoader(delay=0.05), timeout=1.0) == "value"
+        with pytest.raises(TimeoutError):
+            await group.do("fast", CountingLoader(delay=1.0), timeout=0.01)
+
+    async def test_cancelled_waiter_does_not_cancel_load(self) -> None:
+        """Cancelling the caller that started the load leaves it running for the others."""
+        group: SingleFlight[str] = SingleFlight()
+        loader = CountingLoader(delay=0.05)
+
+        first = asyncio.create_task(group.do("key", loader))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(group.do("key", loader))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "value"
+        assert first.cancelled()
+        assert loader.calls == 1
+
+
+class WeatherService:
+    """Cache-backed service used to exercise the decorator."""
+
+    def __init__(self) -> None:
+        self.cache: DictCache[str, str] = DictCache(keyGenerator=StringKeyGenerator())
+        self.fetches: List[str] = []
+
+    @singleFlight()
+    async def getWeather(self, city: str, *, units: str = "metric", exclude: Optional[List[str]] = None) -> str:
+        cached = await self.cache.get(f"{city}:{units}")
+        if cached:
+            return cached
+        self.fetches.append(city)
+        await asyncio.sleep(0.02)
+        result = f"sunny in {city}"
+        await self.cache.set(f"{city}:{units}", result)
+        return result
+
+    @singleFlight(lambda self, options: options["id"])
+    async def getById(self, options: Dict[str, str]) -> str:
+        self.fetches.append(options["id"])
+        await asyncio.sleep(0.02)
+        return options["id"]
+
+
+class TestSingleFlightDecorator:
+    """Test cases for the singleFlight decorator."""
+
+    async def test_concurrent_misses_fetch_once(self) -> None:
+        """Concurrent cache misses for the same arguments fetch once; later calls hit the cache."""
+        service = WeatherService()
+
+        results = await asyncio.gather(*(service.getWeather("Moscow", exclude=["hourly"]) for _ in range(5)))
+        assert results == ["sunny in Moscow"] * 5
+        assert service.fetches == ["Moscow"]
+
+        assert await service.getWeather("Moscow") == "sunny in Moscow"
+        assert service.fetches == ["Moscow"]
+
+    async def test_key_includes_all_bound_arguments(self) -> None:
+        """Calls differing in any argument (defaults applied) are not coalesced."""
+        service = WeatherService()
+
+        await asyncio.gather(
+            service.getWeather("Moscow"),
+            service.getWeather("Moscow", units="metric"),
+            service.getWeather("Moscow", units="imperial"),
+            service.getWeather("London"),
+        )
+
+        assert sorted(service.fetches) == ["London", "Moscow", "Moscow"]
+
+    async def test_instances_do_not_share_loads(self) -> None:
+        """Each instance has its own loads because self is part of the key."""
+        first = WeatherService()
+        second = WeatherService()
+
+        await asyncio.gather(first.getWeather("Moscow"), second.getWeather("Moscow"))
+
+        assert first.fetches == ["Moscow"]
+        assert second.fetches == ["Moscow"]
+
+    async def test_custom_key_function(self) -> None:
+        """keyFunc decides which calls are coalesced."""
+        service = WeatherService()
+
+        await asyncio.gather(
+            service.getById({"id": "1", "trace": "a"}),
+            service.getById({"id": "1", "trace": "b"}),
+        )
+
+        assert service.fetches == ["1"]
+        assert getattr(WeatherService.getById, "singleFlight").getStats()["coalesced"] >= 1
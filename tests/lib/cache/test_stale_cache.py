@@ -0,0 +1,171 @@
+"""
+Tests for stale-while-revalidate and stale-if-error reads, dood!
+
+This module verifies CacheInterface.getOrFetch() on top of DictCache: fresh
+hits, stale entries served while refreshed in the background, stale entries
+served when the fetch fails, the limits of both windows, and the counters
+reported by getStats().
+"""
+
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from lib.cache import CacheEntry, DictCache, NullCache, StringKeyGenerator
+
+
+def _age(cache: DictCache[str, str], key: str, seconds: float) -> None:
+    """Pretend the entry for key was stored the given number of seconds earlier."""
+    value, timestamp = cache._cache[key]
+    cache._cache[key] = (value, timestamp - seconds)
+
+
+class Upstream:
+    """Fetch callable returning queued results and recording calls."""
+
+    def __init__(self, *results: Optional[str], delay: float = 0.0, error: Optional[Exception] = None) -> None:
+        self.results: List[Optional[str]] = list(results)
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self) -> Optional[str]:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.results.pop(0) if self.results else None
+
+
+async def _waitForRefreshes(cache: DictCache[str, str]) -> None:
+    """Wait until background refreshes of the cache are done."""
+    while cache.getStats()["refreshing"]:
+        await asyncio.sleep(0.001)
+
+
+class TestGetEntry:
+    """Test cases for DictCache.getEntry()."""
+
+    async def test_fresh_entry(self) -> None:
+        """An entry within the TTL is returned as fresh."""
+        cache = DictCache[str, str](keyGenerator=StringKeyGenerator(), defaultTtl=60)
+        await cache.set("key", "value")
+
+        assert await cache.getEntry("key") == CacheEntry("value")
+
+    async def test_stale_entry_within_max_stale(self) -> None:
+        """An expired entry is returned as stale while within maxStale."""
+        cache = DictCache[str, str](keyGenerator=StringKeyGenerator(), defaultTtl=60, staleIfError=600)
+        await cache.set("key", "value")
+        _age(cache, "key", 90)
+
+        entry = await cache.getEntry("key", maxStale=600)
+        assert entry is not None
+        assert entry.stale
+        assert 29 < entry.staleFor < 31
+        assert await cache.getEntry("key", maxStale=10) is None
+        assert await cache.getEntry("key", maxStale=-1) is not None
+        assert await cache.get("key") is None
+
+    async def test_stale_entries_are_kept_for_the_longest_window(self) -> None:
+        """Cleanup keeps expired entries within the stale windows and drops older ones."""
+        cache = DictCache[str, str](
+            keyGenerator=StringKeyGenerator(), defaultTtl=60, staleWhileRevalidate=10, staleIfError=100
+        )
+        await cache.set("kept", "value")
+        await cache.set("dropped", "value")
+        _age(cache, "kept", 150)
+        _age(cache, "dropped", 170)
+
+        assert cache.getStats()["entries"] == 1
+        assert await cache.getEntry("kept", maxStale=100) is not None
+
+    async def test_default_implementation_returns_fresh_values_only(self) -> None:
+        """Caches without timestamps fall back to get()."""
+        cache = NullCache[str, str]()
+
+        assert await cache.getEntry("key", maxStale=-1) is None
+        assert await cache.getOrFetch("key", Upstream("value")) == "value"
+
+
+class TestGetOrFetch:
+    """Test cases for CacheInterface.getOrFetch()."""
+
+    async def test_miss_fetches_and_stores(self) -> None:
+        """A miss fetches the value, stores it and the next call hits."""
+        cache = DictCache[str, str](keyGenerator=StringKeyGenerator())
+        upstream = Upstream("value")
+
+        assert await cache.getOrFetch("key", upstream) == "value"
+        assert await cache.getOrFetch("key", upstream) == "value"
+        assert upstream.calls == 1
+
+        stats = cache.getStats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    async def test_stale_while_revalidate(self) -> None:
+        """A stale entry is served at once and refreshed in the background."""
+        cache = DictCache[str, str](keyGenerator=StringKeyGenerator(), defaultTtl=60, staleWhileRevalidate=60)
+        await cache.set("key", "old")
+        _age(cache, "key", 90)
+        upstream = Upstream("new", delay=0.01)
+
+        assert await cache.getOrFetch("key", upstream) == "old"
+        assert await cache.getOrFetch("key", upstream) == "old"
+        await _waitForRefreshes(cache)
+
+        assert upstream.calls == 1
+        assert await cache.getOrFetch("key", upstream) == "new"
+        stats = cache.getStats()
+        assert stats["staleHits"] == 2
+        assert stats["refreshes"] == 1
+        assert stats["hits"] == 1
+
+    async def test_failed_refresh_keeps_stale_entry(self) -> None:
+        """A failing background refresh is counted and the stale entry stays."""
+        cache = DictCache[str, str](keyGenerator=StringKeyGenerator(), defaultTtl=60, staleWhileRevalidate=60)
+        await cache.set("key", "old")
+        _age(cache, "key", 90)
+
+        assert await cache.getOrFetch("key", Upstream(error=RuntimeError("down"))) == "old"
+        await _waitForRefreshes(cache)
+
+        assert cache.getStats()["refreshErrors"] == 1
+        assert await cache.getOrFetch("key", Upstream()) == "old"
+
+    async def test_stale_if_error(self) -> None:
+        """Past the revalidate window the fetch is awaited; on failure the stale entry is served."""
+        cache = DictCache[str, str](
+            keyGenerator=StringKeyGenerator(), defaultTtl=60, staleWhileRevalidate=10, staleIfError=600
+        )
+        await cache.set("key", "old")
+        _age(cache, "key", 120)
+
+        assert await cache.getOrFetch("key", Upstream(None)) == "old"
+        assert await cache.getOrFetch("key", Upstream(error=RuntimeError("down"))) == "old"
+        assert cache.getStats()["staleOnError"] == 2
+
+        assert await cache.getOrFetch("key", Upstream("new")) == "new"
+        assert await cache.get("key") == "new"
+
+    async def test_nothing_served_past_the_hard_ttl(self) -> None:
+        """Entries beyond staleIfError are not served: None and errors are passed on."""
+        cache = DictCache[str, str](keyGenerator=StringKeyGenerator(), defaultTtl=60, staleIfError=30)
+        await cache.set("key", "old")
+        _age(cache, "key", 120)
+
+        assert await cache.getOrFetch("key", Upstream(None)) is None
+        with pytest.raises(RuntimeError):
+            await cache.getOrFetch("key", Upstream(error=RuntimeError("down")))
+
+    async def test_per_call_windows_override_cache_defaults(self) -> None:
+        """Windows passed to getOrFetch() override the ones configured on the cache."""
+        cache = DictCache[str, str](keyGenerator=StringKeyGenerator(), defaultTtl=60, staleIfError=-1)
+        await cache.set("key", "old")
+        _age(cache, "key", 120)
+
+        assert await cache.getOrFetch("key", Upstream(None), staleIfError=0) is None
+        assert await cache.getOrFetch("key", Upstream(None)) == "old"
@@ -30,6 +30,7 @@ import pytest
 from lib.cache import DictCache
 from lib.cache.key_generator import JsonKeyGenerator
 from lib.geocode_maps import GeocodeMapsClient
+from lib.http_client import HttpClientRegistry
 
 
 @pytest.mark.asyncio
@@ -50,10 +51,10 @@ async def test_error_handling_401() -> None:
     """
     client = GeocodeMapsClient(apiKey="invalid_key")
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
         mock_response = MagicMock()
         mock_response.status_code = 401
-        mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         result = await client.search("Test")
 
@@ -79,11 +80,11 @@ async def test_rate_limiting() -> None:
     client = GeocodeMapsClient(apiKey="test_key")
 
     with patch.object(client._rateLimiter, "applyLimit") as mock_limit:
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = []
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
 
             await client.search("Test")
 
@@ -107,8 +108,9 @@ async def test_cache_error_handling() -> None:
     Raises:
         AssertionError: If result doesn't match expected API response
     """
-    cache = MagicMock()
+    cache = DictCache(keyGenerator=JsonKeyGenerator())
     cache.get = AsyncMock(side_effect=Exception("Cache error"))
+    cache.getEntry = AsyncMock(side_effect=Exception("Cache error"))
     cache.set = AsyncMock(side_effect=Exception("Cache error"))
 
     client = GeocodeMapsClient(apiKey="test_key", searchCache=cache)
@@ -116,11 +118,11 @@ async def test_cache_error_handling() -> None:
     mockResponse = [{"place_id": 123, "name": "Test", "lat": "52.5", "lon": "103.8"}]
 
     with patch.object(client._rateLimiter, "applyLimit", new_callable=AsyncMock):
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = mockResponse
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
 
             result = await client.search("Test Query")
 
@@ -146,10 +148,10 @@ async def test_error_handling_404() -> None:
     """
     client = GeocodeMapsClient(apiKey="test_key")
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
         mock_response = MagicMock()
         mock_response.status_code = 404
-        mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         result = await client.search("Nonexistent Location")
 
@@ -174,10 +176,10 @@ async def test_error_handling_429() -> None:
     """
     client = GeocodeMapsClient(apiKey="test_key")
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
         mock_response = MagicMock()
         mock_response.status_code = 429
-        mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         result = await client.search("Test")
 
@@ -202,10 +204,10 @@ async def test_error_handling_500() -> None:
     """
     client = GeocodeMapsClient(apiKey="test_key")
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
         mock_response = MagicMock()
         mock_response.status_code = 500
-        mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         result = await client.search("Test")
 
@@ -230,8 +232,8 @@ async def test_timeout_exception() -> None:
     """
     client = GeocodeMapsClient(apiKey="test_key")
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.get.side_effect = httpx.TimeoutException("Timeout")
+    with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
+        mock_client.return_value.get.side_effect = httpx.TimeoutException("Timeout")
 
         result = await client.search("Test")
 
@@ -256,8 +258,8 @@ async def test_network_error() -> None:
     """
     client = GeocodeMapsClient(apiKey="test_key")
 
-    with patch("httpx.AsyncClient") as mock_client:
-        mock_client.return_value.__aenter__.return_value.get.side_effect = httpx.RequestError("Network error")
+    with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
+        mock_client.return_value.get.side_effect = httpx.RequestError("Network error")
 
         result = await client.search("Test")
 
@@ -282,11 +284,11 @@ async def test_json_decode_error() -> None:
     """
     client = GeocodeMapsClient(apiKey="test_key")
 
-    with patch("httpx.AsyncClient") as mock_client:
+    with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.side_effect = Exception("JSON decode error")
-        mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+        mock_client.return_value.get.return_value = mock_response
 
         result = await client.search("Test")
 
@@ -315,11 +317,11 @@ async def test_search_parameter_validation() -> None:
     mockResponse = [{"place_id": 123, "name": "Test", "lat": "52.5", "lon": "103.8"}]
 
     with patch.object(client._rateLimiter, "applyLimit", new_callable=AsyncMock):
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = mockResponse
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
 
             # Test with all parameters
             await client.search(
@@ -335,8 +337,8 @@ async def test_search_parameter_validation() -> None:
             )
 
             # Verify HTTP client was called with correct params
-            mock_client.return_value.__aenter__.return_value.get.assert_called_once()
-            call_args = mock_client.return_value.__aenter__.return_value.get.call_args[1]["params"]  # Get params dict
+            mock_client.return_value.get.assert_called_once()
+            call_args = mock_client.return_value.get.call_args[1]["params"]  # Get params dict
 
             assert call_args["q"] == "Test Query"
             assert call_args["limit"] == 5
@@ -372,11 +374,11 @@ async def test_reverse_parameter_validation() -> None:
     mockResponse = {"place_id": 123, "name": "Test", "lat": "52.5", "lon": "103.8"}
 
     with patch.object(client._rateLimiter, "applyLimit", new_callable=AsyncMock):
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = mockResponse
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
 
             # Test with all parameters
             await client.reverse(
@@ -384,8 +386,8 @@ async def test_reverse_parameter_validation() -> None:
             )
 
             # Verify HTTP client was called with correct params
-            mock_client.return_value.__aenter__.return_value.get.assert_called_once()
-            call_args = mock_client.return_value.__aenter__.return_value.get.call_args[1]["params"]  # Get params dict
+            mock_client.return_value.get.assert_called_once()
+            call_args = mock_client.return_value.get.call_args[1]["params"]  # Get params dict
 
             assert call_args["lat"] == 52.5443
             assert call_args["lon"] == 103.8882
@@ -418,11 +420,11 @@ async def test_lookup_parameter_validation() -> None:
     mockResponse = [{"place_id": 123, "name": "Test", "lat": "52.5", "lon": "103.8"}]
 
     with patch.object(client._rateLimiter, "applyLimit", new_callable=AsyncMock):
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = mockResponse
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
 
             # Test with all parameters
             await client.lookup(
@@ -437,8 +439,8 @@ async def test_lookup_parameter_validation() -> None:
             )
 
             # Verify HTTP client was called with correct params
-            mock_client.return_value.__aenter__.return_value.get.assert_called_once()
-            call_args = mock_client.return_value.__aenter__.return_value.get.call_args[1]["params"]  # Get params dict
+            mock_client.return_value.get.assert_called_once()
+            call_args = mock_client.return_value.get.call_args[1]["params"]  # Get params dict
 
             assert call_args["osm_ids"] == "N107775,R2623018"  # Sorted
             assert call_args["addressdetails"] == 0
@@ -474,11 +476,11 @@ async def test_lookup_cache_behavior() -> None:
     mockResponse = [{"place_id": 123, "name": "Test", "lat": "52.5", "lon": "103.8"}]
 
     with patch.object(client._rateLimiter, "applyLimit", new_callable=AsyncMock):
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HttpClientRegistry, "getClient", return_value=AsyncMock()) as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = mockResponse
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
 
             # First call - should hit API
             result1 = await client.lookup(["R2623018", "N107775"])
@@ -489,7 +491,7 @@ async def test_lookup_cache_behavior() -> None:
             assert result1 == result2 == mockResponse
 
             # Verify only one API call was made
-            mock_client.return_value.__aenter__.return_value.get.assert_called_once()
+            mock_client.return_value.get.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,187 @@
+"""
+Tests for lib/http_client: shared pooled HTTP client registry and per-host limiting transport.
+"""
+
+import asyncio
+from typing import AsyncGenerator, List, Tuple
+
+import httpx
+import pytest
+
+from lib.http_client import HostLimitedTransport, HttpClientRegistry
+from lib.proxy import ProxyConfig, ProxyHelper, ProxyType
+
+
+@pytest.fixture
+async def registry() -> AsyncGenerator[HttpClientRegistry, None]:
+    """Provide a fresh HttpClientRegistry and close its clients afterwards."""
+    HttpClientRegistry._instance = None
+    ProxyHelper.getInstance().setGlobalProxyConfig({"enabled": True})
+    instance = HttpClientRegistry.getInstance()
+    yield instance
+    await instance.aclose()
+    HttpClientRegistry._instance = None
+
+
+@pytest.fixture
+async def keepAliveServer() -> AsyncGenerator[Tuple[str, List[int]], None]:
+    """Start a local HTTP/1.1 keep-alive server, yield its URL and per-connection request counts."""
+    connections: List[int] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connections.append(0)
+        index = len(connections) - 1
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                connections[index] += 1
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nContent-Type: text/plain\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/", connections
+    server.close()
+
+
+class TestHttpClientRegistry:
+    """Tests for HttpClientRegistry."""
+
+    async def testSameRouteSharesClient(self, registry: HttpClientRegistry) -> None:
+        """Services going through the same route get the same client."""
+        first = registry.getClient(ProxyConfig(ProxyType.NONE))
+        second = registry.getClient(ProxyConfig(ProxyType.NONE))
+        direct = registry.getClient()
+
+        assert first is second
+        assert direct is first
+        stats = registry.getStats()
+        assert stats["clients"] == 1
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+
+    async def testProxyRoutesGetSeparateClients(self, registry: HttpClientRegistry) -> None:
+        """Different resolved proxy routes use separate pools."""
+        direct = registry.getClient(ProxyConfig(ProxyType.NONE))
+        proxied = registry.getClient(ProxyConfig(ProxyType.HTTP, "http://proxy:8080"))
+        otherProxied = registry.getClient(ProxyConfig(ProxyType.HTTP, "http://proxy:8080", user="u", password="p"))
+
+        assert len({id(direct), id(proxied), id(otherProxied)}) == 3
+        assert registry.getClient(ProxyConfig(ProxyType.HTTP, "http://proxy:8080")) is proxied
+
+    async def testClosedClientIsRecreated(self, registry: HttpClientRegistry) -> None:
+        """A client closed behind the registry's back is replaced on the next lookup."""
+        client = registry.getClient()
+        await client.aclose()
+
+        replacement = registry.getClient()
+        assert replacement is not client
+        assert not replacement.is_closed
+        assert registry.getStats()["misses"] == 2
+
+    async def testAcloseClosesAllClients(self, registry: HttpClientRegistry) -> None:
+        """aclose() closes every pooled client and the registry keeps working."""
+        direct = registry.getClient()
+        proxied = registry.getClient(ProxyConfig(ProxyType.HTTP, "http://proxy:8080"))
+
+        await registry.aclose()
+
+        assert direct.is_closed
+        assert proxied.is_closed
+        assert registry.getStats()["clients"] == 0
+        assert registry.getClient() is not direct
+
+    async def testConfigureAppliesToNewClients(self, registry: HttpClientRegistry) -> None:
+        """Pool settings are read from kebab-case config keys."""
+        registry.configure(
+            {
+                "http2": False,
+                "timeout": 5,
+                "connect-timeout": 1.5,
+                "max-connections": 8,
+                "max-keepalive-connections": 4,
+                "keepalive-expiry": 12,
+                "max-connections-per-host": 0,
+            }
+        )
+
+        assert registry.http2 is False
+        assert registry.limits == httpx.Limits(max_connections=8, max_keepalive_connections=4, keepalive_expiry=12.0)
+        client = registry.getClient()
+        assert client.timeout == httpx.Timeout(5.0, connect=1.5)
+        assert isinstance(client._transport, httpx.AsyncHTTPTransport)
+
+        registry.configure({"max-connections-per-host": 3})
+        await registry.aclose()
+        transport = registry.getClient()._transport
+        assert isinstance(transport, HostLimitedTransport)
+        assert transport.maxPerHost == 3
+
+    async def testKeepAliveConnectionsAreReused(
+        self, registry: HttpClientRegistry, keepAliveServer: Tuple[str, List[int]]
+    ) -> None:
+        """Sequential requests reuse one keep-alive connection and the stats show it."""
+        url, connections = keepAliveServer
+        client = registry.getClient()
+
+        for _ in range(3):
+            response = await client.get(url, timeout=5.0)
+            assert response.text == "ok"
+
+        assert connections == [3]
+        stats = registry.getStats()
+        assert stats["requests"] == 3
+        assert stats["newConnections"] == 1
+        assert stats["reusedConnections"] == 2
+
+
+class TestHostLimitedTransport:
+    """Tests for HostLimitedTransport."""
+
+    async def testConcurrencyIsLimitedPerHost(self) -> None:
+        """No more than maxPerHost requests to one host are in flight, other hosts are independent."""
+        inFlight = {"a.example": 0, "b.example": 0}
+        peak = {"a.example": 0, "b.example": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            inFlight[host] += 1
+            peak[host] = max(peak[host], inFlight[host])
+            await asyncio.sleep(0.01)
+            inFlight[host] -= 1
+            return httpx.Response(200, text="ok")
+
+        transport = HostLimitedTransport(httpx.MockTransport(handler), maxPerHost=2)
+        async with httpx.AsyncClient(transport=transport) as client:
+            urls = ["https://a.example/"] * 6 + ["https://b.example/"] * 2
+            responses = await asyncio.gather(*(client.get(url) for url in urls))
+
+        assert all(response.status_code == 200 for response in responses)
+        assert peak == {"a.example": 2, "b.example": 2}
+
+    async def testSlotIsHeldUntilStreamedBodyIsClosed(self) -> None:
+        """A streamed response keeps its host slot until it is closed."""
+        transport = HostLimitedTransport(httpx.MockTransport(lambda request: httpx.Response(200, text="ok")), 1)
+        async with httpx.AsyncClient(transport=transport) as client:
+            async with client.stream("GET", "https://a.example/"):
+                pending = asyncio.ensure_future(client.get("https://a.example/"))
+                await asyncio.sleep(0.01)
+                assert not pending.done()
+            response = await pending
+
+        assert response.text == "ok"
+
+    async def testSlotIsReleasedOnTransportError(self) -> None:
+        """A failed request gives its slot back."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("boom", request=request)
+
+        transport = HostLimitedTransport(httpx.MockTransport(handler), maxPerHost=1)
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(2):
+                with pytest.raises(httpx.ConnectError):
+                    await asyncio.wait_for(client.get("https://a.example/"), 1.0)
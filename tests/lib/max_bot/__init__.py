@@ -0,0 +1 @@
+"""Tests for lib.max_bot package."""
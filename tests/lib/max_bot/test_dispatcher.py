@@ -0,0 +1,142 @@
+"""Unit tests for UpdateDispatcher.
+
+Covers:
+- Updates of one chat are handled in order, other chats are not blocked.
+- The global concurrency limit.
+- dispatch() waits when maxPending updates are not handled yet.
+- Handler errors go to the error handler and don't stop the lane.
+- Intake lag and counters in getStats().
+"""
+
+import asyncio
+import time
+from typing import List, Optional, Tuple
+from unittest.mock import Mock
+
+from lib.max_bot.dispatcher import UpdateDispatcher, getUpdateChatId
+from lib.max_bot.models.update import MessageRemovedUpdate, Update
+
+
+def _makeUpdate(chatId: int, messageId: str, timestamp: int = 0) -> MessageRemovedUpdate:
+    """Create an update of the given chat."""
+    return MessageRemovedUpdate(message_id=messageId, chat_id=chatId, user_id=1, timestamp=timestamp)
+
+
+def testGetUpdateChatId() -> None:
+    """Chat ID comes from chat_id or from the update message."""
+    assert getUpdateChatId(_makeUpdate(5, "m")) == 5
+
+    update = Mock(spec=["message", "timestamp"])
+    update.message.recipient.chat_id = 7
+    assert getUpdateChatId(update) == 7
+
+    assert getUpdateChatId(Mock(spec=["timestamp"])) is None
+
+
+async def testSlowChatDoesNotBlockOthers() -> None:
+    """A chat waiting in its handler doesn't delay other chats, its own updates stay ordered."""
+    release = asyncio.Event()
+    handled: List[Tuple[int, str]] = []
+
+    async def handler(update: Update) -> None:
+        assert isinstance(update, MessageRemovedUpdate)
+        if update.message_id == "slow":
+            await release.wait()
+        handled.append((update.chat_id, update.message_id))
+
+    dispatcher = UpdateDispatcher(handler)
+    for update in [_makeUpdate(1, "slow"), _makeUpdate(1, "next"), _makeUpdate(2, "a"), _makeUpdate(2, "b")]:
+        await dispatcher.dispatch(update)
+
+    await asyncio.sleep(0.01)
+    assert handled == [(2, "a"), (2, "b")]
+    assert dispatcher.getStats()["lanes"] == 1
+
+    release.set()
+    await dispatcher.join()
+    assert handled[2:] == [(1, "slow"), (1, "next")]
+    assert dispatcher.getStats()["lanes"] == 0
+
+
+async def testConcurrencyLimit() -> None:
+    """No more than maxConcurrency handlers run at once."""
+    running = 0
+    maxRunning = 0
+
+    async def handler(update: Update) -> None:
+        nonlocal running, maxRunning
+        running += 1
+        maxRunning = max(maxRunning, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    dispatcher = UpdateDispatcher(handler, maxConcurrency=2)
+    for chatId in range(6):
+        await dispatcher.dispatch(_makeUpdate(chatId, "m"))
+    await dispatcher.join()
+
+    assert maxRunning == 2
+    assert dispatcher.getStats()["handled"] == 6
+
+
+async def testDispatchWaitsWhenTooManyPending() -> None:
+    """Beyond maxPending unhandled updates dispatch() waits for a handler to finish."""
+    release = asyncio.Event()
+
+    async def handler(update: Update) -> None:
+        await release.wait()
+
+    dispatcher = UpdateDispatcher(handler, maxPending=2)
+    await dispatcher.dispatch(_makeUpdate(1, "a"))
+    await dispatcher.dispatch(_makeUpdate(2, "b"))
+    third = asyncio.create_task(dispatcher.dispatch(_makeUpdate(3, "c")))
+    await asyncio.sleep(0.01)
+
+    assert not third.done()
+    assert dispatcher.getStats()["pending"] == 2
+
+    release.set()
+    await asyncio.wait_for(third, timeout=1)
+    await dispatcher.join()
+    assert dispatcher.getStats()["pending"] == 0
+
+
+async def testHandlerErrors() -> None:
+    """A failing update is reported to the error handler and the lane goes on."""
+    errors: List[Exception] = []
+    handled: List[str] = []
+
+    def handler(update: Update) -> None:
+        assert isinstance(update, MessageRemovedUpdate)
+        if update.message_id == "bad":
+            raise ValueError("bad update")
+        handled.append(update.message_id)
+
+    async def errorHandler(error: Exception) -> Optional[None]:
+        errors.append(error)
+
+    dispatcher = UpdateDispatcher(handler, errorHandler)
+    await dispatcher.dispatch(_makeUpdate(1, "bad"))
+    await dispatcher.dispatch(_makeUpdate(1, "good"))
+    await dispatcher.join()
+
+    assert handled == ["good"]
+    assert len(errors) == 1 and isinstance(errors[0], ValueError)
+    assert dispatcher.getStats()["errors"] == 1
+
+
+async def testIntakeLag() -> None:
+    """Intake lag is measured from the update timestamp (milliseconds) to the handler start."""
+
+    async def handler(update: Update) -> None:
+        pass
+
+    dispatcher = UpdateDispatcher(handler)
+    await dispatcher.dispatch(_makeUpdate(1, "old", timestamp=int((time.time() - 5) * 1000)))
+    await dispatcher.dispatch(_makeUpdate(1, "no-timestamp"))
+    await dispatcher.join()
+
+    stats = dispatcher.getStats()
+    assert stats["dispatched"] == 2 and stats["handled"] == 2
+    assert 5 <= stats["maxIntakeLag"] < 10
+    assert stats["avgIntakeLag"] == stats["maxIntakeLag"]
@@ -0,0 +1,151 @@
+"""Unit tests for BufferedStatsStorage."""
+
+import asyncio
+from collections.abc import Sequence
+from typing import Optional
+
+from lib.stats import BufferedStatsStorage, NullStatsStorage, StatsEvent
+
+
+class _RecordingStorage(NullStatsStorage):
+    """Storage stub remembering every ``recordMany`` batch."""
+
+    def __init__(self, failBatches: int = 0) -> None:
+        self.batches: list[list[StatsEvent]] = []
+        self.records: list[dict] = []
+        self.aggregated = 0
+        self.closed = False
+        self.failBatches = failBatches
+
+    async def record(self, stats, *, consumerId=None, labels=None, eventTime=None) -> None:
+        self.records.append(stats)
+
+    async def recordMany(self, events: Sequence[StatsEvent]) -> None:
+        if self.failBatches > 0:
+            self.failBatches -= 1
+            raise RuntimeError("database is down")
+        self.batches.append(list(events))
+
+    async def aggregate(self, *, limit: int = 1000, orphanTimeoutSeconds: int = 3600) -> int:
+        self.aggregated = sum(len(batch) for batch in self.batches)
+        return self.aggregated
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def _eventCount(storage: _RecordingStorage, consumerId: Optional[str] = None) -> int:
+    return sum(1 for batch in storage.batches for e in batch if consumerId is None or e.get("consumerId") == consumerId)
+
+
+async def testRecordIsBufferedUntilInterval() -> None:
+    """A single event is written by the background task after ``flushInterval``.
+
+    Returns:
+        None
+    """
+    inner = _RecordingStorage()
+    storage = BufferedStatsStorage(inner, batchSize=100, flushInterval=0.05)
+
+    await storage.record({"tokens": 1}, consumerId="chat_1", labels={"model": "m"})
+    assert inner.batches == []
+    assert storage.getStats()["buffered"] == 1
+
+    await asyncio.sleep(0.2)
+
+    assert _eventCount(inner, "chat_1") == 1
+    event = inner.batches[0][0]
+    assert event.get("labels") == {"model": "m"}
+    assert event.get("eventTime") is not None
+    await storage.aclose()
+
+
+async def testFullBatchFlushesImmediately() -> None:
+    """Reaching ``batchSize`` wakes the flusher without waiting for the interval.
+
+    Returns:
+        None
+    """
+    inner = _RecordingStorage()
+    storage = BufferedStatsStorage(inner, batchSize=3, flushInterval=60)
+
+    for i in range(7):
+        await storage.record({"tokens": i})
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert [len(batch) for batch in inner.batches][:2] == [3, 3]
+    await storage.aclose()
+    assert _eventCount(inner) == 7
+    assert inner.closed
+
+
+async def testOverflowDropsOldestEvents() -> None:
+    """Past ``maxBufferedEvents`` the oldest events are dropped and counted.
+
+    Returns:
+        None
+    """
+    inner = _RecordingStorage()
+    storage = BufferedStatsStorage(inner, batchSize=2, flushInterval=60, maxBufferedEvents=3)
+    # Keep the flusher from running between records
+    async with storage._flushLock:
+        for i in range(5):
+            await storage.record({"n": i})
+        assert storage.getStats()["dropped"] == 2
+
+    await storage.flush()
+    assert [e["stats"]["n"] for batch in inner.batches for e in batch] == [2, 3, 4]
+    await storage.aclose()
+
+
+async def testFailedBatchIsCountedAndDiscarded() -> None:
+    """A failing write does not break later flushes.
+
+    Returns:
+        None
+    """
+    inner = _RecordingStorage(failBatches=1)
+    storage = BufferedStatsStorage(inner, batchSize=10, flushInterval=60)
+
+    await storage.record({"a": 1})
+    assert await storage.flush() == 0
+    await storage.record({"b": 1})
+    assert await storage.flush() == 1
+
+    stats = storage.getStats()
+    assert stats["failed"] == 1
+    assert stats["written"] == 1
+    await storage.aclose()
+
+
+async def testAggregateFlushesFirst() -> None:
+    """``aggregate()`` sees events recorded just before it.
+
+    Returns:
+        None
+    """
+    inner = _RecordingStorage()
+    storage = BufferedStatsStorage(inner, batchSize=10, flushInterval=60)
+
+    await storage.record({"a": 1})
+    await storage.record({"b": 1})
+
+    assert await storage.aggregate() == 2
+    await storage.aclose()
+
+
+async def testRecordAfterCloseWritesThrough() -> None:
+    """Events recorded after ``aclose()`` go straight to the wrapped storage.
+
+    Returns:
+        None
+    """
+    inner = _RecordingStorage()
+    storage = BufferedStatsStorage(inner, batchSize=10, flushInterval=60)
+    await storage.aclose()
+
+    await storage.record({"late": 1})
+
+    assert inner.records == [{"late": 1}]
+    assert storage.getStats()["buffered"] == 0
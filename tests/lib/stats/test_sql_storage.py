@@ -4,6 +4,8 @@ import datetime
 import uuid
 from typing import Any
 
+import pytest
+
 from internal.database.stats_storage import DatabaseStatsStorage
 from lib.stats.stats_storage import GLOBAL_CONSUMER_ID
 
@@ -335,3 +337,65 @@ async def testRecordHandlesDataError(statsStorage: DatabaseStatsStorage) -> None
 
     # If we reach here without exception, the test passes
     assert True
+
+
+async def testAggregateAccumulatesAcrossBatches(statsStorage: DatabaseStatsStorage) -> None:
+    """A second batch adds to the existing aggregate rows instead of replacing them.
+
+    Returns:
+        None
+    """
+    for tokens in (10, 20, 30):
+        await statsStorage.record({"tokens": tokens}, consumerId="chat_1")
+    assert await statsStorage.aggregate(limit=2) == 2
+    assert await statsStorage.aggregate(limit=2) == 1
+
+    provider = await statsStorage.db.manager.getProvider(dataSource=statsStorage.dataSource, readonly=True)
+    rows = await provider.executeFetchAll(
+        """SELECT labels, metric_value FROM stat_aggregates
+           WHERE event_type = :eventType AND metric_key = 'tokens' AND period_type = 'total'""",
+        {"eventType": "llm_request"},
+    )
+    assert sorted(r["metric_value"] for r in rows) == [60.0, 60.0]
+
+
+async def testAggregateFailureLeavesBatchUnprocessed(statsStorage: DatabaseStatsStorage) -> None:
+    """Upsert and mark-processed share a transaction, so a failed upsert keeps events claimable.
+
+    Returns:
+        None
+    """
+    await statsStorage.record({"tokens": 10}, consumerId="chat_1")
+    provider = await statsStorage.db.manager.getProvider(dataSource=statsStorage.dataSource, readonly=False)
+    await provider.execute("ALTER TABLE stat_aggregates RENAME TO stat_aggregates_moved")
+
+    with pytest.raises(Exception):
+        await statsStorage.aggregate()
+
+    row = await provider.executeFetchOne("SELECT COUNT(*) AS cnt FROM stat_events WHERE processed = 0")
+    assert row is not None and row["cnt"] == 1
+
+    await provider.execute("ALTER TABLE stat_aggregates_moved RENAME TO stat_aggregates")
+    assert await statsStorage.aggregate(orphanTimeoutSeconds=0) == 1
+
+
+async def testRecordManyInsertsAllEvents(statsStorage: DatabaseStatsStorage) -> None:
+    """recordMany writes every event, merging consumerId into labels.
+
+    Returns:
+        None
+    """
+    eventTime = datetime.datetime(2024, 6, 15, 14, 30, 0, tzinfo=datetime.UTC)
+    await statsStorage.recordMany(
+        [
+            {"stats": {"tokens": 1}, "consumerId": "chat_1", "labels": {"model": "m"}, "eventTime": eventTime},
+            {"stats": {"tokens": 2}},
+        ]
+    )
+
+    provider = await statsStorage.db.manager.getProvider(dataSource=statsStorage.dataSource, readonly=True)
+    rows = await provider.executeFetchAll("SELECT labels, event_time FROM stat_events ORDER BY event_time")
+    assert len(rows) == 2
+    assert '"consumer":"chat_1"' in rows[0]["labels"].replace(" ", "")
+    assert GLOBAL_CONSUMER_ID in rows[1]["labels"]
+    assert await statsStorage.aggregate() == 2
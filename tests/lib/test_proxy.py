@@ -3,6 +3,8 @@
 import unittest.mock
 from typing import Generator
 
+import httpcore
+import httpx
 import pytest
 
 from lib.proxy import HealthCheckType, ProxyConfig, ProxyConfigDict, ProxyHelper, ProxyType
@@ -516,6 +518,59 @@ class TestProxyConfigToKwargs:
                 config.toKwargs()
 
 
+class TestProxyConfigToTransport:
+    """Tests for ProxyConfig.toTransport() method."""
+
+    async def test_noneType_returnsDirectTransport(self, resetProxyHelper: ProxyHelper) -> None:
+        """NONE proxy type returns a direct pooled transport with the given limits.
+
+        Args:
+            resetProxyHelper: Fixture setting up ProxyHelper singleton.
+
+        Returns:
+            None
+        """
+        config = ProxyConfig(ProxyType.NONE, "")
+        transport = config.toTransport(limits=httpx.Limits(max_connections=7))
+        assert isinstance(transport, httpx.AsyncHTTPTransport)
+        assert transport._pool._max_connections == 7
+        await transport.aclose()
+
+    async def test_httpProxy_returnsProxiedTransport(self, resetProxyHelper: ProxyHelper) -> None:
+        """HTTP proxy type returns a transport with a proxy connection pool.
+
+        Args:
+            resetProxyHelper: Fixture setting up ProxyHelper singleton.
+
+        Returns:
+            None
+        """
+        config = ProxyConfig(ProxyType.HTTP, "http://p:80")
+        transport = config.toTransport(http2=True)
+        assert isinstance(transport, httpx.AsyncHTTPTransport)
+        assert isinstance(transport._pool, httpcore.AsyncHTTPProxy)
+        await transport.aclose()
+
+    async def test_socks5Proxy_returnsProxyTransport(self, resetProxyHelper: ProxyHelper) -> None:
+        """SOCKS5 proxy type returns an AsyncProxyTransport.
+
+        Args:
+            resetProxyHelper: Fixture setting up ProxyHelper singleton.
+
+        Returns:
+            None
+        """
+        try:
+            from httpx_socks import AsyncProxyTransport  # pyright: ignore[reportMissingImports]
+        except ImportError:
+            pytest.skip("httpx_socks not installed")
+
+        config = ProxyConfig(ProxyType.SOCKS5, "socks5://p:1080")
+        transport = config.toTransport(http2=True)
+        assert isinstance(transport, AsyncProxyTransport)
+        await transport.aclose()
+
+
 class TestProxyHelper:
     """Tests for ProxyHelper singleton and global config storage."""
 
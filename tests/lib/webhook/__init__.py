@@ -0,0 +1 @@
+"""Tests for lib.webhook package."""
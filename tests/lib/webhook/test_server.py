@@ -0,0 +1,212 @@
+"""Unit tests for WebhookServer.
+
+A local stand-in for the platform posts recorded Telegram-like and Max-like
+updates to a server listening on a free port.
+
+Covers:
+- Accepted updates reach the handler in arrival order.
+- Secret header verification and malformed bodies.
+- Deduplication of redelivered updates (by update ID and by body hash).
+- 503 when the queue is full, health check and draining on stop().
+- Parsing a pushed Max update with parseUpdate().
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+import aiohttp
+import pytest
+
+from lib.max_bot.models import MessageRemovedUpdate, parseUpdate
+from lib.webhook import WebhookServer
+
+TELEGRAM_UPDATES: List[Dict[str, Any]] = [
+    {
+        "update_id": 100,
+        "message": {
+            "message_id": 1,
+            "date": 1760000000,
+            "chat": {"id": -1001, "type": "supergroup", "title": "Test"},
+            "from": {"id": 42, "is_bot": False, "first_name": "Alice"},
+            "text": "hello",
+        },
+    },
+    {
+        "update_id": 101,
+        "message": {
+            "message_id": 2,
+            "date": 1760000001,
+            "chat": {"id": -1001, "type": "supergroup", "title": "Test"},
+            "from": {"id": 43, "is_bot": False, "first_name": "Bob"},
+            "text": "world",
+        },
+    },
+]
+"""Telegram updates as posted to a webhook."""
+
+MAX_UPDATE: Dict[str, Any] = {
+    "update_type": "message_removed",
+    "timestamp": 1760000000000,
+    "message_id": "mid.1",
+    "chat_id": 77,
+    "user_id": 42,
+}
+"""Max update as posted to a webhook (Max updates carry no ID)."""
+
+SECRET = "s3cr3t"
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+def _telegramUpdateId(update: Dict[str, Any]) -> Optional[str]:
+    return str(update["update_id"]) if "update_id" in update else None
+
+
+@pytest.fixture
+async def serverFactory() -> AsyncIterator[Callable[..., Any]]:
+    """Create started servers on free ports, stopping them after the test."""
+    servers: List[WebhookServer] = []
+
+    async def create(handler: Callable[[Dict[str, Any]], Any], **kwargs: Any) -> WebhookServer:
+        server = WebhookServer(handler, port=0, **kwargs)
+        await server.start()
+        servers.append(server)
+        return server
+
+    yield create
+    for server in servers:
+        await server.stop()
+
+
+async def _post(
+    server: WebhookServer, payload: Any, *, secret: Optional[str] = SECRET, raw: Optional[bytes] = None
+) -> int:
+    """Post an update to the server like the platform does, returning the status code."""
+    headers = {SECRET_HEADER: secret} if secret is not None else {}
+    url = f"http://127.0.0.1:{server.boundPort}{server.path}"
+    async with aiohttp.ClientSession() as session:
+        if raw is not None:
+            async with session.post(url, data=raw, headers=headers) as response:
+                return response.status
+        async with session.post(url, json=payload, headers=headers) as response:
+            return response.status
+
+
+async def testUpdatesHandledInArrivalOrder(serverFactory) -> None:
+    """Accepted updates reach the handler in the order they were posted."""
+    handled: List[int] = []
+
+    async def handler(update: Dict[str, Any]) -> None:
+        handled.append(update["update_id"])
+
+    server = await serverFactory(handler, secret=SECRET, secretHeader=SECRET_HEADER, getUpdateId=_telegramUpdateId)
+    for update in TELEGRAM_UPDATES:
+        assert await _post(server, update) == 200
+
+    await asyncio.wait_for(server.queue.join(), timeout=1)
+    assert handled == [100, 101]
+    stats = server.getStats()
+    assert stats["accepted"] == 2 and stats["handled"] == 2 and stats["queueDepth"] == 0
+
+
+async def testRejectsWrongSecretAndMalformedBody(serverFactory) -> None:
+    """Requests without the right secret get 401, malformed bodies get 400."""
+    handled: List[Dict[str, Any]] = []
+
+    async def handler(update: Dict[str, Any]) -> None:
+        handled.append(update)
+
+    server = await serverFactory(handler, secret=SECRET, secretHeader=SECRET_HEADER)
+
+    assert await _post(server, TELEGRAM_UPDATES[0], secret="wrong") == 401
+    assert await _post(server, TELEGRAM_UPDATES[0], secret=None) == 401
+    assert await _post(server, None, raw=b"{not json") == 400
+    assert await _post(server, [1, 2, 3]) == 400
+
+    await asyncio.wait_for(server.queue.join(), timeout=1)
+    assert handled == []
+    stats = server.getStats()
+    assert stats["unauthorized"] == 2 and stats["invalid"] == 2 and stats["accepted"] == 0
+
+
+async def testRedeliveredUpdatesAreDropped(serverFactory) -> None:
+    """A redelivered update is acknowledged but handled once, with and without update IDs."""
+    handled: List[Dict[str, Any]] = []
+
+    async def handler(update: Dict[str, Any]) -> None:
+        handled.append(update)
+
+    telegramServer = await serverFactory(handler, getUpdateId=_telegramUpdateId)
+    assert await _post(telegramServer, TELEGRAM_UPDATES[0]) == 200
+    # Same update ID, so it's a redelivery even if the body differs
+    assert await _post(telegramServer, {**TELEGRAM_UPDATES[0], "extra": True}) == 200
+    assert telegramServer.getStats()["duplicates"] == 1
+
+    maxServer = await serverFactory(handler)
+    assert await _post(maxServer, MAX_UPDATE) == 200
+    assert await _post(maxServer, MAX_UPDATE) == 200
+    assert await _post(maxServer, {**MAX_UPDATE, "message_id": "mid.2"}) == 200
+    assert maxServer.getStats()["duplicates"] == 1
+
+    await asyncio.wait_for(telegramServer.queue.join(), timeout=1)
+    await asyncio.wait_for(maxServer.queue.join(), timeout=1)
+    assert len(handled) == 3
+
+
+async def testFullQueueAnswers503(serverFactory) -> None:
+    """Beyond queueSize waiting updates the request gets 503 and isn't remembered as seen."""
+    release = asyncio.Event()
+    handled: List[int] = []
+
+    async def handler(update: Dict[str, Any]) -> None:
+        await release.wait()
+        handled.append(update["update_id"])
+
+    server = await serverFactory(handler, getUpdateId=_telegramUpdateId, queueSize=1)
+    assert await _post(server, {"update_id": 1}) == 200
+    # Let the consumer take the first update, it waits in the handler
+    await asyncio.sleep(0.01)
+    assert await _post(server, {"update_id": 2}) == 200
+    assert await _post(server, {"update_id": 3}) == 503
+    assert server.getStats()["overflows"] == 1
+
+    release.set()
+    await asyncio.wait_for(server.queue.join(), timeout=1)
+    # The platform redelivers the rejected update later
+    assert await _post(server, {"update_id": 3}) == 200
+    await asyncio.wait_for(server.queue.join(), timeout=1)
+    assert handled == [1, 2, 3]
+
+
+async def testHealthCheckAndStopDrainsQueue(serverFactory) -> None:
+    """The health check answers 200 while running, stop() waits for queued updates."""
+    release = asyncio.Event()
+    handled: List[int] = []
+
+    async def handler(update: Dict[str, Any]) -> None:
+        await release.wait()
+        handled.append(update["update_id"])
+
+    server = await serverFactory(handler, getUpdateId=_telegramUpdateId)
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"http://127.0.0.1:{server.boundPort}{server.healthPath}") as response:
+            assert response.status == 200
+
+    for updateId in range(3):
+        assert await _post(server, {"update_id": updateId}) == 200
+
+    stopTask = asyncio.create_task(server.stop())
+    await asyncio.sleep(0.01)
+    assert not stopTask.done()
+
+    release.set()
+    await asyncio.wait_for(stopTask, timeout=1)
+    assert handled == [0, 1, 2]
+
+
+async def testParsePushedMaxUpdate() -> None:
+    """A Max update pushed via webhook parses into its Update subclass."""
+    update = parseUpdate(MAX_UPDATE)
+
+    assert isinstance(update, MessageRemovedUpdate)
+    assert update.chat_id == 77
+    assert update.message_id == "mid.1"
@@ -16,6 +16,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
 from lib.cache import DictCache
+from lib.http_client import HttpClientRegistry
 from lib.yandex_search.cache_utils import SearchRequestKeyGenerator
 from lib.yandex_search.client import YandexSearchClient
 from lib.yandex_search.models import (
@@ -131,9 +132,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
 
         self.assertIn("folderId is required", str(context.exception))
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testSuccessfulSearch(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testSuccessfulSearch(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test successful search request.
 
         Verifies that the client correctly formats and sends search requests,
@@ -148,7 +149,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         # Mock HTTP client
         mockClient = AsyncMock()
         mockClient.post.return_value = mockResponse
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         # Mock rate limiter manager
         mockManager = MagicMock()
@@ -185,9 +186,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(requestBody["query"]["searchType"], "SEARCH_TYPE_RU")
         self.assertEqual(requestBody["folderId"], self.folderId)
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testErrorResponse(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testErrorResponse(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test error response handling.
 
         Verifies that the client correctly handles API error responses,
@@ -202,7 +203,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         # Mock HTTP client
         mockClient = AsyncMock()
         mockClient.post.return_value = mockResponse
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         # Mock rate limiter manager
         mockManager = MagicMock()
@@ -229,9 +230,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         headers = callArgs[1]["headers"]
         self.assertEqual(headers["Authorization"], f"Api-Key {self.apiKey}")
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testHttpErrorHandling(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testHttpErrorHandling(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test HTTP error handling.
 
         Verifies that the client gracefully handles various HTTP error
@@ -249,7 +250,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
 
         mockClient = AsyncMock()
         mockClient.post.return_value = mockResponse
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         client = YandexSearchClient(iamToken=self.iamToken, folderId=self.folderId)
 
@@ -266,9 +267,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         response = await client.search("test query")
         self.assertIsNone(response)
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testNetworkErrorHandling(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testNetworkErrorHandling(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test network error handling.
 
         Verifies that the client handles network-related errors such as
@@ -278,7 +279,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         # Mock network timeout
         mockClient = AsyncMock()
         mockClient.post.side_effect = httpx.TimeoutException("Request timeout")
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         # Mock rate limiter manager
         mockManager = MagicMock()
@@ -295,9 +296,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         response = await client.search("test query")
         self.assertIsNone(response)
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testInvalidJsonResponse(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testInvalidJsonResponse(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test handling of invalid JSON response.
 
         Verifies that the client handles cases where the API returns
@@ -311,7 +312,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
 
         mockClient = AsyncMock()
         mockClient.post.return_value = mockResponse
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         # Mock rate limiter manager
         mockManager = MagicMock()
@@ -323,9 +324,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         response = await client.search("test query")
         self.assertIsNone(response)
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testMissingResultField(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testMissingResultField(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test handling of response without result field.
 
         Verifies that the client handles cases where the API response
@@ -339,7 +340,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
 
         mockClient = AsyncMock()
         mockClient.post.return_value = mockResponse
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         # Mock rate limiter manager
         mockManager = MagicMock()
@@ -351,9 +352,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         response = await client.search("test query")
         self.assertIsNone(response)
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testAdvancedSearchParameters(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testAdvancedSearchParameters(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test search with advanced parameters.
 
         Verifies that the client correctly formats and sends requests
@@ -367,7 +368,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
 
         mockClient = AsyncMock()
         mockClient.post.return_value = mockResponse
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         # Mock rate limiter manager
         mockManager = MagicMock()
@@ -423,9 +424,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(requestBody["folderId"], self.folderId)
         self.assertEqual(requestBody["responseFormat"], "FORMAT_XML")
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testSimpleSearchDefaults(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testSimpleSearchDefaults(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test simple search with default parameters.
 
         Verifies that the client uses appropriate default values when
@@ -439,7 +440,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
 
         mockClient = AsyncMock()
         mockClient.post.return_value = mockResponse
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         # Mock rate limiter manager
         mockManager = MagicMock()
@@ -483,9 +484,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(requestBody["folderId"], self.folderId)
         self.assertEqual(requestBody["responseFormat"], "FORMAT_XML")
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testCachingFunctionality(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testCachingFunctionality(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test caching functionality.
 
         Verifies that the client properly caches search responses and
@@ -499,7 +500,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
 
         mockClient = AsyncMock()
         mockClient.post.return_value = mockResponse
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         # Mock rate limiter manager
         mockManager = MagicMock()
@@ -528,9 +529,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         if response1 and response2:
             self.assertEqual(response1["requestId"], response2["requestId"])
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testCacheBypass(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testCacheBypass(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test cache bypass functionality.
 
         Verifies that the client can completely disable caching when
@@ -544,7 +545,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
 
         mockClient = AsyncMock()
         mockClient.post.return_value = mockResponse
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         # Mock rate limiter manager
         mockManager = MagicMock()
@@ -565,9 +566,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         # Verify API was called twice (cache bypassed)
         self.assertEqual(mockClient.post.call_count, 2)
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testPerRequestCacheBypass(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testPerRequestCacheBypass(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test per-request cache bypass.
 
         Verifies that the client can bypass cache on a per-request basis
@@ -581,7 +582,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
 
         mockClient = AsyncMock()
         mockClient.post.return_value = mockResponse
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         # Mock rate limiter manager
         mockManager = MagicMock()
@@ -607,9 +608,9 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
         # Verify API was called twice (once for first, once for bypass)
         self.assertEqual(mockClient.post.call_count, 2)
 
-    @patch("httpx.AsyncClient")
+    @patch.object(HttpClientRegistry, "getClient")
     @patch("lib.rate_limiter.manager.RateLimiterManager.getInstance")
-    async def testRateLimiting(self, mockManagerGetInstance: MagicMock, mockAsyncClient: MagicMock) -> None:
+    async def testRateLimiting(self, mockManagerGetInstance: MagicMock, mockGetClient: MagicMock) -> None:
         """Test rate limiting functionality.
 
         Verifies that the client uses the global rate limiter manager
@@ -622,7 +623,7 @@ class TestYandexSearchClient(unittest.IsolatedAsyncioTestCase):
 
         mockClient = AsyncMock()
         mockClient.post.return_value = mockResponse
-        mockAsyncClient.return_value.__aenter__.return_value = mockClient
+        mockGetClient.return_value = mockClient
 
         # Mock rate limiter manager
         mockManager = MagicMock()
@@ -29,10 +29,12 @@ Example:
         ./venv/bin/pytest tests/services/cache/test_cache_service.py
 """
 
+import asyncio
 import gc
 import json
 import unittest
 import warnings
+from typing import Dict
 from unittest.mock import Mock
 
 from internal.bot.models.chat_settings import ChatSettingsKey, ChatSettingsValue
@@ -474,6 +476,38 @@ class TestChatUserData(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(userData["key1"], "value1")
         self.assertEqual(userData["key2"], ["item1", "item2"])
 
+    async def testConcurrentGetChatUserDataLoadsOnce(self) -> None:
+        """Test concurrent cache misses share one database load, dood!
+
+        Verifies that parallel getChatUserData calls for the same chat user
+        query the database once and all get the loaded data.
+        """
+
+        async def slowGetUserData(userId: int, chatId: int) -> Dict[str, str]:
+            await asyncio.sleep(0.01)
+            return {"key1": '"value1"'}
+
+        self.mockDb.userData.getUserData.side_effect = slowGetUserData
+
+        results = await asyncio.gather(*(self.cache.getChatUserData(123, 456) for _ in range(5)))
+
+        self.mockDb.userData.getUserData.assert_called_once_with(userId=456, chatId=123)
+        for userData in results:
+            self.assertEqual(userData, {"key1": "value1"})
+
+    async def testSetChatUserDataKeepsLoadedData(self) -> None:
+        """Test setting a key on an uncached user keeps the other keys loaded from DB.
+
+        Verifies that setChatUserData merges into the freshly loaded data
+        instead of replacing it.
+        """
+        self.mockDb.userData.getUserData.return_value = {"key1": '"value1"'}
+
+        await self.cache.setChatUserData(123, 456, "key2", "value2")
+
+        userData = await self.cache.getChatUserData(123, 456)
+        self.assertEqual(userData, {"key1": "value1", "key2": "value2"})
+
     async def testSetChatUserData(self) -> None:
         """Test setting user data.
 
@@ -0,0 +1,182 @@
+"""Tests for rolling summaries in LLMService.condenseContext(), dood!
+
+Covers reusing a stored summary for unchanged history, summarizing only new
+messages, invalidation on changed history, reuse by a fresh service instance
+(restart), compaction of a grown summary and not storing partial summaries.
+"""
+
+from typing import List, Sequence
+from unittest.mock import Mock
+
+import pytest
+
+from internal.services.llm.service import LLMService
+from lib.ai.abstract import AbstractModel
+from lib.ai.models import ModelMessage, ModelResultStatus, ModelRunResult
+from lib.cache import DictCache, StringKeyGenerator
+
+CONTEXT_KEY = "100:0"
+
+
+class SummarizingModel:
+    """Condensing model double recording the summarized messages, dood!"""
+
+    def __init__(self) -> None:
+        self.requests: List[List[str]] = []
+        self.failing = False
+
+    async def __call__(self, messages: Sequence[ModelMessage]) -> ModelRunResult:
+        # Drop system message and condensing instruction
+        contents = [message.content for message in messages[1:-1]]
+        self.requests.append(contents)
+        if self.failing:
+            raise RuntimeError("condensing failed")
+        return ModelRunResult(
+            rawResult=None, status=ModelResultStatus.FINAL, resultText="S(" + ",".join(contents) + ")"
+        )
+
+
+def _makeModel(modelId: str, contextSize: int) -> Mock:
+    """Create a model mock counting 10 tokens per message, dood!"""
+    model = Mock(spec=AbstractModel)
+    model.modelId = modelId
+    model.contextSize = contextSize
+    model.hasExactTokensCount = Mock(return_value=False)
+    model.getEstimateMessageTokensCount = Mock(return_value=10)
+    model.getEstimateMessagesTokensCount = Mock(side_effect=lambda messages: 10 * len(messages))
+    return model
+
+
+@pytest.fixture
+def condensedCache() -> DictCache[str, dict]:
+    """Create an in-memory cache for condensed contexts, dood!"""
+    return DictCache[str, dict](keyGenerator=StringKeyGenerator())
+
+
+@pytest.fixture
+def llmService(condensedCache: DictCache[str, dict]) -> LLMService:
+    """Create a fresh LLMService with the condensed context cache, dood!"""
+    LLMService._instance = None
+    service = LLMService()
+    service.injectCondensedContextCache(condensedCache)
+    return service
+
+
+@pytest.fixture
+def summarizer() -> SummarizingModel:
+    """Create a condensing model double, dood!"""
+    return SummarizingModel()
+
+
+@pytest.fixture
+def condensingModel(summarizer: SummarizingModel) -> Mock:
+    """Create a condensing model whose context fits the whole body, dood!"""
+    model = _makeModel("condenser", contextSize=10000)
+    model.generateText = summarizer
+    return model
+
+
+def _history(count: int) -> List[ModelMessage]:
+    """Create a system prompt followed by count user messages, dood!"""
+    return [ModelMessage(role="system", content="persona")] + [
+        ModelMessage(role="user", content=f"m{i}") for i in range(count)
+    ]
+
+
+async def _condense(
+    service: LLMService, messages: Sequence[ModelMessage], condensingModel: Mock, maxTokens: int = 50
+) -> List[str]:
+    ret = await service.condenseContext(
+        messages,
+        _makeModel("chat", contextSize=1000),
+        keepLastN=1,
+        maxTokens=maxTokens,
+        condensingModel=condensingModel,
+        condensingPrompt="summarize",
+        condensedContextKey=CONTEXT_KEY,
+    )
+    return [message.content for message in ret]
+
+
+async def testSummaryIsReusedForUnchangedHistory(llmService, condensingModel, summarizer):
+    """The second call with the same history does not call the condensing model, dood!"""
+    messages = _history(8)
+
+    first = await _condense(llmService, messages, condensingModel)
+    second = await _condense(llmService, messages, condensingModel)
+
+    assert first == ["persona", "S(m0,m1,m2,m3,m4,m5,m6)", "m7"]
+    assert second == first
+    assert summarizer.requests == [["m0", "m1", "m2", "m3", "m4", "m5", "m6"]]
+
+
+async def testOnlyNewMessagesAreSummarized(llmService, condensingModel, summarizer):
+    """Messages appended after the last condensing are summarized alone, dood!"""
+    await _condense(llmService, _history(8), condensingModel)
+
+    ret = await _condense(llmService, _history(11), condensingModel)
+
+    assert summarizer.requests[-1] == ["m7", "m8", "m9"]
+    assert ret == ["persona", "S(m0,m1,m2,m3,m4,m5,m6)", "S(m7,m8,m9)", "m10"]
+
+
+async def testChangedHistoryIsSummarizedAgain(llmService, condensingModel, summarizer):
+    """A change in already summarized messages invalidates the stored summary, dood!"""
+    messages = _history(8)
+    await _condense(llmService, messages, condensingModel)
+
+    messages[3].content = "edited"
+    ret = await _condense(llmService, messages, condensingModel)
+
+    assert len(summarizer.requests) == 2
+    assert ret[1] == "S(m0,m1,edited,m3,m4,m5,m6)"
+
+
+async def testSummaryIsReusedAfterRestart(llmService, condensedCache, condensingModel, summarizer):
+    """A new service instance with the same storage reuses the summary, dood!"""
+    await _condense(llmService, _history(8), condensingModel)
+
+    LLMService._instance = None
+    restarted = LLMService()
+    restarted.injectCondensedContextCache(condensedCache)
+    ret = await _condense(restarted, _history(8), condensingModel)
+
+    assert ret[1] == "S(m0,m1,m2,m3,m4,m5,m6)"
+    assert len(summarizer.requests) == 1
+
+
+async def testGrownSummaryIsCompacted(llmService, condensingModel, summarizer):
+    """Rolling summaries not fitting into the budget are summarized again, dood!"""
+    await _condense(llmService, _history(8), condensingModel)
+
+    # head + 2 summaries + tail = 40 tokens, does not fit into 35
+    ret = await _condense(llmService, _history(11), condensingModel, maxTokens=35)
+
+    assert summarizer.requests[-1] == ["S(m0,m1,m2,m3,m4,m5,m6)", "S(m7,m8,m9)"]
+    assert ret == ["persona", "S(S(m0,m1,m2,m3,m4,m5,m6),S(m7,m8,m9))", "m10"]
+
+
+async def testFailedBatchIsNotStored(llmService, condensingModel, summarizer):
+    """A summary with failed batches is not reused by the next call, dood!"""
+    summarizer.failing = True
+    assert await _condense(llmService, _history(8), condensingModel) == ["persona", "m7"]
+
+    summarizer.failing = False
+    ret = await _condense(llmService, _history(8), condensingModel)
+
+    assert ret[1] == "S(m0,m1,m2,m3,m4,m5,m6)"
+    assert len(summarizer.requests) == 2
+
+
+async def testWithoutKeyNothingIsStored(llmService, condensedCache, condensingModel, summarizer):
+    """Without condensedContextKey every call summarizes the whole body, dood!"""
+    for _ in range(2):
+        await llmService.condenseContext(
+            _history(8),
+            _makeModel("chat", contextSize=1000),
+            maxTokens=50,
+            condensingModel=condensingModel,
+        )
+
+    assert len(summarizer.requests) == 2
+    assert condensedCache.getStats()["entries"] == 0
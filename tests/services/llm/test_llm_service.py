@@ -52,6 +52,8 @@ def mockModel():
     model.contextSize = 4096
     model.generateText = createAsyncMock()
     model.getEstimateTokensCount = Mock(return_value=100)
+    model.getEstimateMessageTokensCount = Mock(return_value=10)
+    model.hasExactTokensCount = Mock(return_value=False)
     return model
 
 
@@ -65,6 +67,8 @@ def mockFallbackModel():
     model.contextSize = 4096
     model.generateText = createAsyncMock()
     model.getEstimateTokensCount = Mock(return_value=100)
+    model.getEstimateMessageTokensCount = Mock(return_value=10)
+    model.hasExactTokensCount = Mock(return_value=False)
     return model
 
 
@@ -0,0 +1,134 @@
+"""Tests for streamed generation in LLMService, dood!
+
+Covers passing chunks of every LLM turn to the stream callback, including
+turns ending with tool calls, and generation surviving a failing callback.
+"""
+
+from typing import Any, AsyncIterator, List, Sequence
+from unittest.mock import Mock
+
+import pytest
+
+from internal.bot.models.chat_settings import ChatSettingsDict
+from internal.services.llm.service import LLMService
+from lib.ai.abstract import AbstractModel
+from lib.ai.models import LLMToolCall, ModelMessage, ModelResultChunk, ModelResultStatus, ModelRunResult
+
+
+@pytest.fixture
+def llmService() -> LLMService:
+    """Create a fresh LLMService instance, dood!"""
+    LLMService._instance = None
+    return LLMService()
+
+
+def _makeModel(turns: Sequence[Sequence[ModelResultChunk]]) -> Mock:
+    """Create a model stub streaming the given chunks, one list per call, dood!"""
+    model = Mock(spec=AbstractModel)
+    model.modelId = "test-model"
+    model.contextSize = 4096
+    model.hasExactTokensCount = Mock(return_value=False)
+    model.getEstimateMessageTokensCount = Mock(return_value=10)
+    pending = list(turns)
+
+    async def generateTextStream(*args: Any, **kwargs: Any) -> AsyncIterator[ModelResultChunk]:
+        for chunk in pending.pop(0):
+            yield chunk
+
+    model.generateTextStream = Mock(side_effect=generateTextStream)
+    return model
+
+
+def _chatSettings() -> Mock:
+    chatSettings = Mock(spec=ChatSettingsDict)
+    chatSettings.__getitem__ = Mock(return_value=Mock(toModel=Mock(return_value=None)))
+    return chatSettings
+
+
+async def testStreamCallbackGetsChunksOfEveryTurn(llmService):
+    """Chunks of the tool call turn and of the final turn reach the callback, dood!"""
+
+    async def tool(extraData=None, **kwargs):
+        return "42"
+
+    llmService.registerTool("answer", "Answer", [], tool)
+    toolCall = LLMToolCall(id="call_0", name="answer", parameters={})
+    model = _makeModel(
+        [
+            [
+                ModelResultChunk(textDelta="Let me check"),
+                ModelResultChunk(
+                    result=ModelRunResult(
+                        rawResult=None,
+                        status=ModelResultStatus.TOOL_CALLS,
+                        resultText="Let me check",
+                        toolCalls=[toolCall],
+                    )
+                ),
+            ],
+            [
+                ModelResultChunk(textDelta="It is "),
+                ModelResultChunk(textDelta="42"),
+                ModelResultChunk(
+                    result=ModelRunResult(rawResult=None, status=ModelResultStatus.FINAL, resultText="It is 42")
+                ),
+            ],
+        ]
+    )
+    events: List[str] = []
+
+    async def streamCallback(chunk: ModelResultChunk) -> None:
+        events.append(f"result:{chunk.result.status.name}" if chunk.result is not None else chunk.textDelta)
+
+    async def callback(ret: ModelRunResult, extraData) -> None:
+        events.append("callback")
+
+    result = await llmService.generateTextViaLLM(
+        messages=[ModelMessage(role="user", content="hi")],
+        chatId=None,
+        chatSettings=_chatSettings(),
+        modelKey=model,
+        fallbackModelKey=model,
+        useTools=True,
+        callback=callback,
+        streamCallback=streamCallback,
+        extraData={},
+    )
+
+    assert result.resultText == "It is 42"
+    assert result.isToolsUsed
+    assert events == ["Let me check", "result:TOOL_CALLS", "callback", "It is ", "42", "result:FINAL"]
+    model.generateText.assert_not_called()
+    assert model.generateTextStream.call_args.kwargs["fallbackModels"] == [model]
+
+
+async def testFailingStreamCallbackDoesNotBreakGeneration(llmService):
+    """A failing callback is not called again and the result is still returned, dood!"""
+    model = _makeModel(
+        [
+            [
+                ModelResultChunk(textDelta="a"),
+                ModelResultChunk(textDelta="b"),
+                ModelResultChunk(
+                    result=ModelRunResult(rawResult=None, status=ModelResultStatus.FINAL, resultText="ab")
+                ),
+            ]
+        ]
+    )
+    calls: List[ModelResultChunk] = []
+
+    async def streamCallback(chunk: ModelResultChunk) -> None:
+        calls.append(chunk)
+        raise RuntimeError("chat is gone")
+
+    result = await llmService.generateText(
+        [ModelMessage(role="user", content="hi")],
+        chatId=None,
+        chatSettings=_chatSettings(),
+        modelKey=model,
+        fallbackKey=model,
+        streamCallback=streamCallback,
+    )
+
+    assert result.resultText == "ab"
+    assert len(calls) == 1
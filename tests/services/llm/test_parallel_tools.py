@@ -0,0 +1,200 @@
+"""Tests for parallel execution of tool calls in LLMService, dood!
+
+Covers concurrent runs of parallel-safe tools with ordered results, unsafe
+tools acting as barriers, the fan-out limit, per-tool timeouts, exception
+propagation and per-tool latency metrics.
+"""
+
+import asyncio
+import json
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+import internal.services.llm.constants as llmConstants
+from internal.bot.models.chat_settings import ChatSettingsDict
+from internal.services.llm.service import LLMService
+from lib.ai.abstract import AbstractModel
+from lib.ai.models import LLMToolCall, ModelMessage, ModelResultStatus, ModelRunResult
+from tests.utils import createAsyncMock
+
+
+@pytest.fixture
+def llmService() -> LLMService:
+    """Create a fresh LLMService instance, dood!"""
+    LLMService._instance = None
+    return LLMService()
+
+
+class ToolsLog:
+    """Records starts and ends of tool calls and the peak concurrency, dood!"""
+
+    def __init__(self) -> None:
+        self.events: List[str] = []
+        self.running = 0
+        self.maxRunning = 0
+
+    def makeTool(self, name: str, delay: float = 0.01, error: bool = False):
+        async def tool(extraData=None, **kwargs):
+            self.events.append(f"start:{name}")
+            self.running += 1
+            self.maxRunning = max(self.maxRunning, self.running)
+            try:
+                await asyncio.sleep(delay)
+                if error:
+                    raise RuntimeError(f"{name} failed")
+                return {"tool": name, **kwargs}
+            finally:
+                self.running -= 1
+                self.events.append(f"end:{name}")
+
+        return tool
+
+
+def _calls(*names: str) -> List[LLMToolCall]:
+    return [LLMToolCall(id=f"call_{i}", name=name, parameters={"n": i}) for i, name in enumerate(names)]
+
+
+async def testParallelSafeCallsRunConcurrentlyInOrder(llmService):
+    """Parallel-safe calls overlap and results keep the order of calls, dood!"""
+    log = ToolsLog()
+    llmService.registerTool("slow", "Slow", [], log.makeTool("slow", delay=0.05), parallelSafe=True)
+    llmService.registerTool("fast", "Fast", [], log.makeTool("fast", delay=0.0), parallelSafe=True)
+
+    results = await llmService._runToolCalls(_calls("slow", "fast", "slow"), {})
+
+    assert [json.loads(result) for result in results] == [
+        {"tool": "slow", "n": 0},
+        {"tool": "fast", "n": 1},
+        {"tool": "slow", "n": 2},
+    ]
+    assert log.maxRunning == 3
+    assert log.events.index("end:fast") < log.events.index("end:slow")
+
+
+async def testUnsafeCallIsBarrier(llmService):
+    """A call of a tool which is not parallel-safe runs alone, dood!"""
+    log = ToolsLog()
+    llmService.registerTool("read", "Read", [], log.makeTool("read"), parallelSafe=True)
+    llmService.registerTool("write", "Write", [], log.makeTool("write"))
+
+    await llmService._runToolCalls(_calls("read", "read", "write", "read", "read"), {})
+
+    writeStart = log.events.index("start:write")
+    assert log.events[writeStart - 2 : writeStart] == ["end:read", "end:read"]
+    assert log.events[writeStart + 1] == "end:write"
+    assert log.maxRunning == 2
+
+
+async def testFanOutIsBounded(llmService, monkeypatch: pytest.MonkeyPatch):
+    """No more than the configured number of parallel-safe calls run at once, dood!"""
+    log = ToolsLog()
+    monkeypatch.setattr(llmConstants, "MAX_PARALLEL_TOOL_CALLS", 2)
+    llmService.registerTool("read", "Read", [], log.makeTool("read"), parallelSafe=True)
+
+    results = await llmService._runToolCalls(_calls(*["read"] * 5), {})
+
+    assert len(results) == 5
+    assert log.maxRunning == 2
+
+
+async def testFanOutLimitIsPerTurn(llmService, monkeypatch: pytest.MonkeyPatch):
+    """Concurrent LLM turns don't share the fan-out limit, dood!"""
+    log = ToolsLog()
+    monkeypatch.setattr(llmConstants, "MAX_PARALLEL_TOOL_CALLS", 2)
+    llmService.registerTool("read", "Read", [], log.makeTool("read"), parallelSafe=True)
+
+    await asyncio.gather(
+        llmService._runToolCalls(_calls(*["read"] * 2), {}),
+        llmService._runToolCalls(_calls(*["read"] * 2), {}),
+    )
+
+    assert log.maxRunning == 4
+
+
+async def testTimedOutCallReturnsError(llmService):
+    """A call exceeding the tool timeout returns an error for the LLM, dood!"""
+    log = ToolsLog()
+    llmService.registerTool("hang", "Hang", [], log.makeTool("hang", delay=10), parallelSafe=True, timeout=0.01)
+    llmService.registerTool("read", "Read", [], log.makeTool("read"), parallelSafe=True)
+
+    results = await llmService._runToolCalls(_calls("hang", "read"), {})
+
+    assert json.loads(results[0]) == {"done": False, "error": "Tool hang timed out after 0.01 seconds"}
+    assert json.loads(results[1]) == {"tool": "read", "n": 1}
+    assert llmService.getStats()["tools"]["hang"]["timeouts"] == 1
+
+
+async def testExceptionIsPropagatedAfterGroupCompletes(llmService):
+    """A failing parallel call raises once the other calls of its group are done, dood!"""
+    log = ToolsLog()
+    llmService.registerTool("bad", "Bad", [], log.makeTool("bad", error=True), parallelSafe=True)
+    llmService.registerTool("slow", "Slow", [], log.makeTool("slow", delay=0.05), parallelSafe=True)
+
+    with pytest.raises(RuntimeError, match="bad failed"):
+        await llmService._runToolCalls(_calls("bad", "slow"), {})
+
+    assert "end:slow" in log.events
+    assert llmService.getStats()["tools"]["bad"]["errors"] == 1
+
+
+async def testUnknownToolDoesNotBreakGroup(llmService):
+    """Unknown tools get an error result in place, dood!"""
+    log = ToolsLog()
+    llmService.registerTool("read", "Read", [], log.makeTool("read"), parallelSafe=True)
+
+    results = await llmService._runToolCalls(_calls("read", "missing", "read"), {})
+
+    assert json.loads(results[1])["done"] is False
+    assert json.loads(results[2]) == {"tool": "read", "n": 2}
+
+
+async def testToolLatencyMetrics(llmService):
+    """Calls and durations are recorded per tool, dood!"""
+    log = ToolsLog()
+    llmService.registerTool("read", "Read", [], log.makeTool("read", delay=0.02), parallelSafe=True)
+
+    await llmService._runToolCalls(_calls("read", "read"), {})
+
+    stats = llmService.getStats()["tools"]["read"]
+    assert stats["calls"] == 2
+    assert stats["running"] == 0
+    assert stats["maxDuration"] >= 0.02
+    assert stats["totalDuration"] >= 2 * 0.02
+    assert stats["avgDuration"] == pytest.approx(stats["totalDuration"] / 2)
+
+
+async def testGenerateTextViaLLMKeepsToolMessagesOrder(llmService):
+    """Tool result messages follow the order of the tool calls, dood!"""
+    log = ToolsLog()
+    llmService.registerTool("slow", "Slow", [], log.makeTool("slow", delay=0.05), parallelSafe=True)
+    llmService.registerTool("fast", "Fast", [], log.makeTool("fast", delay=0.0), parallelSafe=True)
+
+    model = Mock(spec=AbstractModel)
+    model.modelId = "test-model"
+    model.contextSize = 4096
+    model.hasExactTokensCount = Mock(return_value=False)
+    model.getEstimateMessageTokensCount = Mock(return_value=10)
+    model.generateText = createAsyncMock()
+    model.generateText.side_effect = [
+        ModelRunResult(
+            rawResult={}, status=ModelResultStatus.TOOL_CALLS, resultText="", toolCalls=_calls("slow", "fast")
+        ),
+        ModelRunResult(rawResult={}, status=ModelResultStatus.FINAL, resultText="done"),
+    ]
+    chatSettings = Mock(spec=ChatSettingsDict)
+    chatSettings.__getitem__ = Mock(return_value=Mock(toModel=Mock(return_value=None)))
+
+    result = await llmService.generateTextViaLLM(
+        messages=[ModelMessage(role="user", content="hi")],
+        chatId=None,
+        chatSettings=chatSettings,
+        modelKey=model,
+        fallbackModelKey=model,
+        useTools=True,
+        extraData={},
+    )
+
+    assert [message.toolCallId for message in result.toolUsageHistory[1:]] == ["call_0", "call_1"]
+    assert json.loads(result.toolUsageHistory[1].content)["tool"] == "slow"
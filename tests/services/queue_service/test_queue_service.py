@@ -13,7 +13,8 @@ from unittest.mock import Mock
 
 import pytest
 
-from internal.services.queue_service.service import QueueService, makeEmptyAsyncTask
+from internal.services.queue_service import constants
+from internal.services.queue_service.service import DelayedTaskQueue, QueueService, makeEmptyAsyncTask
 from internal.services.queue_service.types import DelayedTask, DelayedTaskFunction
 from tests.utils import createAsyncMock
 
@@ -85,7 +86,7 @@ class TestQueueServiceInitialization:
         """Test that QueueService initializes with correct default state."""
         assert queueService.initialized is True
         assert queueService.db is None
-        assert isinstance(queueService.delayedActionsQueue, asyncio.PriorityQueue)
+        assert isinstance(queueService.delayedActionsQueue, DelayedTaskQueue)
         assert isinstance(queueService.tasksHandlers, dict)
         assert len(queueService.tasksHandlers) == 0
         assert queueService.queueLastUpdated > 0
@@ -1000,6 +1001,142 @@ class TestEdgeCases:
         assert "resource" in executionLog[0]
 
 
+# ============================================================================
+# Delayed Scheduler Tests
+# ============================================================================
+
+
+class TestDelayedScheduler:
+    """Test the event-driven delayed queue and the concurrent executor."""
+
+    @staticmethod
+    async def _stopLoop(queueService, loopTask):
+        """Send DO_EXIT and wait for the processing loop to return."""
+        if DelayedTaskFunction.DO_EXIT not in queueService.tasksHandlers:
+            queueService.registerDelayedTaskHandler(DelayedTaskFunction.DO_EXIT, createAsyncMock())
+        await queueService.beginShutdown()
+        await asyncio.wait_for(loopTask, timeout=5)
+
+    @pytest.mark.asyncio
+    async def testGetDueWakesUpForEarlierTask(self, queueService):
+        """Test that a task due earlier than the head wakes up the waiter."""
+        queue = queueService.delayedActionsQueue
+        await queue.put(DelayedTask("late", time.time() + 3600, DelayedTaskFunction.SEND_MESSAGE, {}))
+        waiter = asyncio.create_task(queue.getDue())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await queue.put(DelayedTask("now", time.time(), DelayedTaskFunction.SEND_MESSAGE, {}))
+        task = await asyncio.wait_for(waiter, timeout=1)
+
+        assert task.taskId == "now"
+        assert queue.qsize() == 1
+        assert queue.peek().taskId == "late"
+
+    @pytest.mark.asyncio
+    async def testDelayedQueueKeepsDueTimeOrder(self, queueService):
+        """Test that the queue's own heap serves tasks by due time and shows them in str()."""
+        queue = queueService.delayedActionsQueue
+        now = time.time()
+        for taskId, offset in (("second", 20), ("first", 10), ("third", 30)):
+            await queue.put(DelayedTask(taskId, now + offset, DelayedTaskFunction.SEND_MESSAGE, {}))
+
+        assert queue.peek().taskId == "first"
+        assert "second" in str(queue)
+        assert [queue.get_nowait().taskId for _ in range(3)] == ["first", "second", "third"]
+        assert queue.peek() is None
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def testSlowHandlerDoesNotBlockOtherTasks(self, queueService, mockDatabaseWrapper):
+        """Test that a slow CRON_JOB handler does not delay SEND_MESSAGE tasks."""
+        queueService.db = mockDatabaseWrapper
+        release = asyncio.Event()
+        sent = asyncio.Event()
+
+        async def slowCron(task: DelayedTask) -> None:
+            await release.wait()
+
+        async def sendMessage(task: DelayedTask) -> None:
+            sent.set()
+
+        queueService.registerDelayedTaskHandler(DelayedTaskFunction.CRON_JOB, slowCron)
+        queueService.registerDelayedTaskHandler(DelayedTaskFunction.SEND_MESSAGE, sendMessage)
+        loopTask = asyncio.create_task(queueService._startDelayedQueueProcessLoop())
+
+        await queueService.addDelayedTask(time.time(), DelayedTaskFunction.CRON_JOB, kwargs={}, skipDB=True)
+        await queueService.addDelayedTask(time.time(), DelayedTaskFunction.SEND_MESSAGE, kwargs={}, skipDB=True)
+        await asyncio.wait_for(sent.wait(), timeout=1)
+        assert queueService.getStats()["functions"]["cronJob"]["running"] == 1
+
+        release.set()
+        await self._stopLoop(queueService, loopTask)
+        assert mockDatabaseWrapper.delayedTasks.updateDelayedTask.await_count == 3
+
+    @pytest.mark.asyncio
+    async def testPerFunctionConcurrencyLimit(self, queueService, mockDatabaseWrapper):
+        """Test that CRON_JOB tasks never overlap."""
+        queueService.db = mockDatabaseWrapper
+        running = 0
+        maxRunning = 0
+
+        async def cron(task: DelayedTask) -> None:
+            nonlocal running, maxRunning
+            running += 1
+            maxRunning = max(maxRunning, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        queueService.registerDelayedTaskHandler(DelayedTaskFunction.CRON_JOB, cron)
+        loopTask = asyncio.create_task(queueService._startDelayedQueueProcessLoop())
+        for _ in range(3):
+            await queueService.addDelayedTask(time.time(), DelayedTaskFunction.CRON_JOB, kwargs={}, skipDB=True)
+        await asyncio.sleep(0)
+
+        await self._stopLoop(queueService, loopTask)
+        assert maxRunning == 1
+        assert queueService.getStats()["functions"]["cronJob"]["processed"] == 3
+
+    @pytest.mark.asyncio
+    async def testHandlerTimeout(self, queueService, mockDatabaseWrapper, monkeypatch):
+        """Test that a hanging handler is cancelled and the next handler still runs."""
+        monkeypatch.setattr(constants, "DEFAULT_DELAYED_TASK_HANDLER_TIMEOUT", 0.05)
+        queueService.db = mockDatabaseWrapper
+        afterHandler = createAsyncMock()
+
+        async def hangingHandler(task: DelayedTask) -> None:
+            await asyncio.sleep(60)
+
+        queueService.registerDelayedTaskHandler(DelayedTaskFunction.DELETE_MESSAGE, hangingHandler)
+        queueService.registerDelayedTaskHandler(DelayedTaskFunction.DELETE_MESSAGE, afterHandler)
+        loopTask = asyncio.create_task(queueService._startDelayedQueueProcessLoop())
+        await queueService.addDelayedTask(time.time(), DelayedTaskFunction.DELETE_MESSAGE, kwargs={}, skipDB=True)
+        await asyncio.sleep(0)
+
+        await self._stopLoop(queueService, loopTask)
+        afterHandler.assert_awaited_once()
+        stats = queueService.getStats()["functions"]["deleteMessage"]
+        assert stats["timeouts"] == 1
+        assert stats["maxDuration"] >= 0.05
+
+    @pytest.mark.asyncio
+    async def testLatenessAndQueueDepthMetrics(self, queueService, mockDatabaseWrapper):
+        """Test that lateness and queue depth are reported."""
+        queueService.db = mockDatabaseWrapper
+        queueService.registerDelayedTaskHandler(DelayedTaskFunction.SEND_MESSAGE, createAsyncMock())
+        await queueService.addDelayedTask(time.time() - 5, DelayedTaskFunction.SEND_MESSAGE, kwargs={}, skipDB=True)
+        await queueService.addDelayedTask(time.time() + 3600, DelayedTaskFunction.SEND_MESSAGE, kwargs={}, skipDB=True)
+        assert queueService.getStats()["queueDepth"] == 2
+
+        loopTask = asyncio.create_task(queueService._startDelayedQueueProcessLoop())
+        await asyncio.sleep(0.01)
+        await self._stopLoop(queueService, loopTask)
+
+        stats = queueService.getStats()
+        assert stats["queueDepth"] == 1
+        assert stats["functions"]["sendMessage"]["maxLateness"] >= 5
+
+
 # ============================================================================
 # Performance and Stress Tests
 # ============================================================================
@@ -504,3 +504,44 @@ class TestFSBackendRealWorldScenarios:
         for i, key in enumerate(keys):
             result = fsBackend.get(key)
             assert result == f"version {i + 1}".encode()
+
+
+class TestFSBackendStreaming:
+    """Test streaming reads and writes, dood!"""
+
+    def testOpenWriteCommit(self, fsBackend, tempDir):
+        """Test that chunks written to a writer become visible only after commit"""
+        writer = fsBackend.openWrite("stream-key")
+        writer.write(b"chunk1-")
+        writer.write(b"chunk2")
+
+        assert fsBackend.exists("stream-key") is False
+        assert fsBackend.list() == []
+
+        writer.commit()
+
+        assert fsBackend.get("stream-key") == b"chunk1-chunk2"
+        assert list(Path(tempDir).glob("*.tmp")) == []
+
+    def testOpenWriteAbort(self, fsBackend, tempDir):
+        """Test that an aborted writer leaves nothing behind"""
+        writer = fsBackend.openWrite("stream-key")
+        writer.write(b"data")
+        writer.abort()
+
+        assert fsBackend.exists("stream-key") is False
+        assert list(Path(tempDir).iterdir()) == []
+
+    def testOpenRead(self, fsBackend):
+        """Test reading a stored file in chunks"""
+        fsBackend.store("stream-key", b"0123456789")
+
+        file = fsBackend.openRead("stream-key")
+        assert file is not None
+        with file:
+            assert file.read(4) == b"0123"
+            assert file.read() == b"456789"
+
+    def testOpenReadMissing(self, fsBackend):
+        """Test that opening a missing key returns None"""
+        assert fsBackend.openRead("missing-key") is None
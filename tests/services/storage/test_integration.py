@@ -43,7 +43,7 @@ def mockConfigManager(tempDir):
 class TestStorageServiceIntegration:
     """Integration tests for StorageService with real backend, dood!"""
 
-    def testCompleteStoreRetrieveCycle(self, mockConfigManager):
+    async def testCompleteStoreRetrieveCycle(self, mockConfigManager):
         """Test complete store and retrieve cycle"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
@@ -51,16 +51,16 @@ class TestStorageServiceIntegration:
         key = "test-document.txt"
         data = b"This is test data"
 
-        service.store(key, data)
-        assert service.exists(key) is True
+        await service.store(key, data)
+        assert await service.exists(key) is True
 
-        retrieved = service.get(key)
+        retrieved = await service.get(key)
         assert retrieved == data
 
-        assert service.delete(key) is True
-        assert service.exists(key) is False
+        assert await service.delete(key) is True
+        assert await service.exists(key) is False
 
-    def testMultipleFilesIntegration(self, mockConfigManager):
+    async def testMultipleFilesIntegration(self, mockConfigManager):
         """Test storing and managing multiple files"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
@@ -73,78 +73,78 @@ class TestStorageServiceIntegration:
         }
 
         for key, data in files.items():
-            service.store(key, data)
+            await service.store(key, data)
 
         for key in files.keys():
-            assert service.exists(key) is True
+            assert await service.exists(key) is True
 
-        allKeys = service.list()
+        allKeys = await service.list()
         assert len(allKeys) == 4
         for key in files.keys():
             assert key in allKeys
 
         for key, expectedData in files.items():
-            retrieved = service.get(key)
+            retrieved = await service.get(key)
             assert retrieved == expectedData
 
         for key in files.keys():
-            assert service.delete(key) is True
+            assert await service.delete(key) is True
 
-        assert service.list() == []
+        assert await service.list() == []
 
-    def testListWithPrefixIntegration(self, mockConfigManager):
+    async def testListWithPrefixIntegration(self, mockConfigManager):
         """Test list operation with prefix filtering"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
 
-        service.store("docs-file1.txt", b"data1")
-        service.store("docs-file2.txt", b"data2")
-        service.store("images-photo1.jpg", b"data3")
-        service.store("images-photo2.jpg", b"data4")
-        service.store("other.txt", b"data5")
+        await service.store("docs-file1.txt", b"data1")
+        await service.store("docs-file2.txt", b"data2")
+        await service.store("images-photo1.jpg", b"data3")
+        await service.store("images-photo2.jpg", b"data4")
+        await service.store("other.txt", b"data5")
 
-        docsFiles = service.list(prefix="docs-")
+        docsFiles = await service.list(prefix="docs-")
         assert len(docsFiles) == 2
         assert all(key.startswith("docs-") for key in docsFiles)
 
-        imagesFiles = service.list(prefix="images-")
+        imagesFiles = await service.list(prefix="images-")
         assert len(imagesFiles) == 2
         assert all(key.startswith("images-") for key in imagesFiles)
 
-        allFiles = service.list()
+        allFiles = await service.list()
         assert len(allFiles) == 5
 
-    def testListWithLimitIntegration(self, mockConfigManager):
+    async def testListWithLimitIntegration(self, mockConfigManager):
         """Test list operation with limit"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
 
         for i in range(20):
-            service.store(f"file-{i:02d}.txt", f"data{i}".encode())
+            await service.store(f"file-{i:02d}.txt", f"data{i}".encode())
 
-        limitedList = service.list(limit=10)
+        limitedList = await service.list(limit=10)
         assert len(limitedList) == 10
 
-        allList = service.list()
+        allList = await service.list()
         assert len(allList) == 20
 
-    def testOverwriteExistingFile(self, mockConfigManager):
+    async def testOverwriteExistingFile(self, mockConfigManager):
         """Test overwriting existing file"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
 
         key = "test-file.txt"
 
-        service.store(key, b"original data")
-        assert service.get(key) == b"original data"
+        await service.store(key, b"original data")
+        assert await service.get(key) == b"original data"
 
-        service.store(key, b"new data")
-        assert service.get(key) == b"new data"
+        await service.store(key, b"new data")
+        assert await service.get(key) == b"new data"
 
-        allFiles = service.list()
+        allFiles = await service.list()
         assert allFiles.count(key) == 1
 
-    def testLargeFileIntegration(self, mockConfigManager):
+    async def testLargeFileIntegration(self, mockConfigManager):
         """Test storing and retrieving large file"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
@@ -152,14 +152,14 @@ class TestStorageServiceIntegration:
         key = "large-file.bin"
         largeData = b"x" * (5 * 1024 * 1024)
 
-        service.store(key, largeData)
-        retrieved = service.get(key)
+        await service.store(key, largeData)
+        retrieved = await service.get(key)
 
         assert retrieved is not None
         assert retrieved == largeData
         assert len(retrieved) == 5 * 1024 * 1024
 
-    def testBinaryDataIntegration(self, mockConfigManager):
+    async def testBinaryDataIntegration(self, mockConfigManager):
         """Test storing various binary data types"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
@@ -171,11 +171,11 @@ class TestStorageServiceIntegration:
         }
 
         for key, data in testCases.items():
-            service.store(key, data)
-            retrieved = service.get(key)
+            await service.store(key, data)
+            retrieved = await service.get(key)
             assert retrieved == data
 
-    def testUnicodeDataIntegration(self, mockConfigManager):
+    async def testUnicodeDataIntegration(self, mockConfigManager):
         """Test storing unicode text as bytes"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
@@ -184,14 +184,14 @@ class TestStorageServiceIntegration:
         text = "Hello world"
         data = text.encode("utf-8")
 
-        service.store(key, data)
-        retrieved = service.get(key)
+        await service.store(key, data)
+        retrieved = await service.get(key)
 
         assert retrieved is not None
         assert retrieved == data
         assert retrieved.decode("utf-8") == text
 
-    def testEmptyFileIntegration(self, mockConfigManager):
+    async def testEmptyFileIntegration(self, mockConfigManager):
         """Test storing and retrieving empty file"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
@@ -199,10 +199,10 @@ class TestStorageServiceIntegration:
         key = "empty-file.txt"
         data = b""
 
-        service.store(key, data)
-        assert service.exists(key) is True
+        await service.store(key, data)
+        assert await service.exists(key) is True
 
-        retrieved = service.get(key)
+        retrieved = await service.get(key)
         assert retrieved == data
         assert len(retrieved) == 0
 
@@ -210,73 +210,73 @@ class TestStorageServiceIntegration:
 class TestStorageServicePersistence:
     """Test persistence across service instances, dood!"""
 
-    def testPersistenceAcrossInstances(self, mockConfigManager, tempDir):
+    async def testPersistenceAcrossInstances(self, mockConfigManager, tempDir):
         """Test that data persists across service instances"""
         service1 = StorageService.getInstance()
         service1.injectConfig(mockConfigManager)
-        service1.store("persistent-key", b"persistent data")
+        await service1.store("persistent-key", b"persistent data")
 
         StorageService._instance = None
 
         service2 = StorageService.getInstance()
         service2.injectConfig(mockConfigManager)
 
-        assert service2.exists("persistent-key") is True
-        assert service2.get("persistent-key") == b"persistent data"
+        assert await service2.exists("persistent-key") is True
+        assert await service2.get("persistent-key") == b"persistent data"
 
-    def testPersistenceAfterReconfiguration(self, mockConfigManager, tempDir):
+    async def testPersistenceAfterReconfiguration(self, mockConfigManager, tempDir):
         """Test that data persists after reconfiguration"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
 
-        service.store("test-key", b"test data")
+        await service.store("test-key", b"test data")
 
         service.injectConfig(mockConfigManager)
 
-        assert service.exists("test-key") is True
-        assert service.get("test-key") == b"test data"
+        assert await service.exists("test-key") is True
+        assert await service.get("test-key") == b"test data"
 
 
 class TestStorageServiceErrorHandling:
     """Test error handling in integration scenarios, dood!"""
 
-    def testGetNonExistentFile(self, mockConfigManager):
+    async def testGetNonExistentFile(self, mockConfigManager):
         """Test getting non-existent file returns None"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
 
-        result = service.get("non-existent-file.txt")
+        result = await service.get("non-existent-file.txt")
         assert result is None
 
-    def testExistsNonExistentFile(self, mockConfigManager):
+    async def testExistsNonExistentFile(self, mockConfigManager):
         """Test exists returns False for non-existent file"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
 
-        result = service.exists("non-existent-file.txt")
+        result = await service.exists("non-existent-file.txt")
         assert result is False
 
-    def testDeleteNonExistentFile(self, mockConfigManager):
+    async def testDeleteNonExistentFile(self, mockConfigManager):
         """Test delete returns False for non-existent file"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
 
-        result = service.delete("non-existent-file.txt")
+        result = await service.delete("non-existent-file.txt")
         assert result is False
 
-    def testListEmptyDirectory(self, mockConfigManager):
+    async def testListEmptyDirectory(self, mockConfigManager):
         """Test list returns empty list for empty directory"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
 
-        result = service.list()
+        result = await service.list()
         assert result == []
 
 
 class TestStorageServiceKeySanitization:
     """Test key sanitization in integration scenarios, dood!"""
 
-    def testPathTraversalPrevention(self, mockConfigManager, tempDir):
+    async def testPathTraversalPrevention(self, mockConfigManager, tempDir):
         """Test that path traversal is prevented"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
@@ -284,7 +284,7 @@ class TestStorageServiceKeySanitization:
         key = "../../../etc/passwd"
         data = b"malicious data"
 
-        service.store(key, data)
+        await service.store(key, data)
 
         sanitizedKey = "etc_passwd"
 
@@ -292,10 +292,10 @@ class TestStorageServiceKeySanitization:
         assert len(files) == 1
         assert files[0].name == sanitizedKey
 
-        retrieved = service.get(key)
+        retrieved = await service.get(key)
         assert retrieved == data
 
-    def testSpecialCharactersInKey(self, mockConfigManager):
+    async def testSpecialCharactersInKey(self, mockConfigManager):
         """Test that special characters are handled"""
         service = StorageService.getInstance()
         service.injectConfig(mockConfigManager)
@@ -308,7 +308,7 @@ class TestStorageServiceKeySanitization:
 
         for originalKey in testKeys:
             data = f"data for {originalKey}".encode()
-            service.store(originalKey, data)
+            await service.store(originalKey, data)
 
-            retrieved = service.get(originalKey)
+            retrieved = await service.get(originalKey)
             assert retrieved == data
@@ -0,0 +1,71 @@
+"""
+Tests for ObjectLRUCache, dood!
+
+This module tests the bounded in-memory cache of small stored objects.
+"""
+
+from internal.services.storage.object_cache import ObjectLRUCache
+
+
+class TestObjectLRUCache:
+    """Test ObjectLRUCache behavior, dood!"""
+
+    def testDisabledByDefault(self):
+        """Test that a cache without limits stores nothing"""
+        cache = ObjectLRUCache()
+        cache.put("key", b"data")
+
+        assert cache.enabled is False
+        assert cache.get("key") is None
+
+    def testGetAndPut(self):
+        """Test caching and counting hits and misses"""
+        cache = ObjectLRUCache(maxItems=10, maxBytes=100, maxObjectSize=10)
+        cache.put("key", b"data")
+
+        assert cache.get("key") == b"data"
+        assert cache.get("other") is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.size == 4
+
+    def testObjectTooLargeIsNotCached(self):
+        """Test that objects above maxObjectSize are skipped"""
+        cache = ObjectLRUCache(maxItems=10, maxBytes=100, maxObjectSize=4)
+        cache.put("key", b"12345")
+
+        assert len(cache) == 0
+
+    def testEvictsByItemCount(self):
+        """Test that the least recently used object is evicted first"""
+        cache = ObjectLRUCache(maxItems=2, maxBytes=100, maxObjectSize=10)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")
+        cache.put("c", b"3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.get("c") == b"3"
+
+    def testEvictsByTotalSize(self):
+        """Test that the total size stays within maxBytes"""
+        cache = ObjectLRUCache(maxItems=10, maxBytes=10, maxObjectSize=10)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        cache.put("c", b"123")
+
+        assert cache.get("a") is None
+        assert cache.size == 8
+
+    def testInvalidateAndReplace(self):
+        """Test invalidation and replacing keep the size consistent"""
+        cache = ObjectLRUCache(maxItems=10, maxBytes=100, maxObjectSize=10)
+        cache.put("a", b"12345")
+        cache.put("a", b"12")
+        assert cache.size == 2
+
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        assert cache.size == 0
+        assert cache.get("a") is None
@@ -10,7 +10,7 @@ from unittest.mock import Mock, patch
 import pytest
 from botocore.exceptions import ClientError
 
-from internal.services.storage.backends.s3 import S3StorageBackend
+from internal.services.storage.backends.s3 import S3_MIN_PART_SIZE, S3StorageBackend
 from internal.services.storage.exceptions import StorageBackendError, StorageKeyError
 
 
@@ -518,3 +518,76 @@ class TestS3BackendRealWorldScenarios:
         call_args = mockS3Client.put_object.call_args
         assert call_args[1]["Body"] == data
         assert call_args[1]["ContentType"] == "application/octet-stream"
+
+
+class TestS3BackendStreaming:
+    """Test streaming reads and multipart uploads, dood!"""
+
+    @pytest.fixture
+    def multipartBackend(self, s3Backend, mockS3Client):
+        """S3 backend with the smallest allowed multipart settings"""
+        s3Backend.multipartChunkSize = S3_MIN_PART_SIZE
+        s3Backend.multipartThreshold = S3_MIN_PART_SIZE
+        mockS3Client.create_multipart_upload = Mock(return_value={"UploadId": "upload-1"})
+        mockS3Client.upload_part = Mock(
+            side_effect=lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}-{len(kwargs['Body'])}"}
+        )
+        mockS3Client.complete_multipart_upload = Mock(return_value={})
+        mockS3Client.abort_multipart_upload = Mock(return_value={})
+        return s3Backend
+
+    def testSmallObjectUsesPutObject(self, multipartBackend, mockS3Client):
+        """Test that a writer below the chunk size stores the object with put_object"""
+        writer = multipartBackend.openWrite("small-key")
+        writer.write(b"small")
+        writer.commit()
+
+        mockS3Client.create_multipart_upload.assert_not_called()
+        mockS3Client.put_object.assert_called_once()
+        assert mockS3Client.put_object.call_args[1]["Body"] == b"small"
+
+    def testLargeStoreUsesMultipartUpload(self, multipartBackend, mockS3Client):
+        """Test that large objects are uploaded in ordered parts"""
+        data = b"x" * (2 * S3_MIN_PART_SIZE + 10)
+
+        multipartBackend.store("large-key", data)
+
+        mockS3Client.put_object.assert_not_called()
+        assert mockS3Client.upload_part.call_count == 3
+        mockS3Client.complete_multipart_upload.assert_called_once_with(
+            Bucket="test-bucket",
+            Key="test-prefix/large-key",
+            UploadId="upload-1",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": f"etag-1-{S3_MIN_PART_SIZE}", "PartNumber": 1},
+                    {"ETag": f"etag-2-{S3_MIN_PART_SIZE}", "PartNumber": 2},
+                    {"ETag": "etag-3-10", "PartNumber": 3},
+                ]
+            },
+        )
+
+    def testFailedPartAbortsUpload(self, multipartBackend, mockS3Client):
+        """Test that a failed part aborts the multipart upload"""
+        mockS3Client.upload_part.side_effect = Exception("Network error")
+
+        with pytest.raises(StorageBackendError, match="Failed to store object"):
+            multipartBackend.store("large-key", b"x" * (S3_MIN_PART_SIZE + 1))
+
+        mockS3Client.complete_multipart_upload.assert_not_called()
+        mockS3Client.abort_multipart_upload.assert_called_once_with(
+            Bucket="test-bucket", Key="test-prefix/large-key", UploadId="upload-1"
+        )
+
+    def testOpenReadReturnsBody(self, s3Backend, mockS3Client):
+        """Test that openRead returns the response body stream"""
+        body = Mock()
+        mockS3Client.get_object.return_value = {"Body": body}
+
+        assert s3Backend.openRead("test-key") is body
+
+    def testOpenReadMissing(self, s3Backend, mockS3Client):
+        """Test that openRead returns None for NoSuchKey"""
+        mockS3Client.get_object.side_effect = ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+
+        assert s3Backend.openRead("missing-key") is None
@@ -5,6 +5,8 @@ This module tests the StorageService singleton to ensure proper
 initialization, configuration, and operation delegation to backends.
 """
 
+import asyncio
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -162,6 +164,9 @@ class TestStorageServiceInjectConfigS3:
                 keySecret="test-key-secret",
                 bucket="test-bucket",
                 prefix="test-prefix/",
+                multipartThreshold=16 * 1024 * 1024,
+                multipartChunkSize=8 * 1024 * 1024,
+                multipartConcurrency=4,
             )
 
     def testInjectConfigS3WithoutPrefix(self, mockConfigManager):
@@ -261,51 +266,51 @@ class TestStorageServiceOperations:
         service.injectConfig(mockConfigManager)
         return service
 
-    def testStoreOperation(self, configuredService):
+    async def testStoreOperation(self, configuredService):
         """Test store operation delegates to backend"""
         configuredService.backend = Mock()
         configuredService.backend.store = Mock()
 
-        configuredService.store("test-key", b"data")
+        await configuredService.store("test-key", b"data")
 
         configuredService.backend.store.assert_called_once_with("test-key", b"data")
 
-    def testGetOperation(self, configuredService):
+    async def testGetOperation(self, configuredService):
         """Test get operation delegates to backend"""
         configuredService.backend = Mock()
         configuredService.backend.get = Mock(return_value=b"data")
 
-        result = configuredService.get("test-key")
+        result = await configuredService.get("test-key")
 
         assert result == b"data"
         configuredService.backend.get.assert_called_once_with("test-key")
 
-    def testExistsOperation(self, configuredService):
+    async def testExistsOperation(self, configuredService):
         """Test exists operation delegates to backend"""
         configuredService.backend = Mock()
         configuredService.backend.exists = Mock(return_value=True)
 
-        result = configuredService.exists("test-key")
+        result = await configuredService.exists("test-key")
 
         assert result is True
         configuredService.backend.exists.assert_called_once_with("test-key")
 
-    def testDeleteOperation(self, configuredService):
+    async def testDeleteOperation(self, configuredService):
         """Test delete operation delegates to backend"""
         configuredService.backend = Mock()
         configuredService.backend.delete = Mock(return_value=True)
 
-        result = configuredService.delete("test-key")
+        result = await configuredService.delete("test-key")
 
         assert result is True
         configuredService.backend.delete.assert_called_once_with("test-key")
 
-    def testListOperation(self, configuredService):
+    async def testListOperation(self, configuredService):
         """Test list operation delegates to backend"""
         configuredService.backend = Mock()
         configuredService.backend.list = Mock(return_value=["key1", "key2"])
 
-        result = configuredService.list(prefix="test-", limit=10)
+        result = await configuredService.list(prefix="test-", limit=10)
 
         assert result == ["key1", "key2"]
         configuredService.backend.list.assert_called_once_with(prefix="test-", limit=10)
@@ -314,40 +319,40 @@ class TestStorageServiceOperations:
 class TestStorageServiceUninitializedErrors:
     """Test that operations fail when service is not initialized, dood!"""
 
-    def testStoreWithoutInitRaisesError(self):
+    async def testStoreWithoutInitRaisesError(self):
         """Test that store without init raises error"""
         service = StorageService.getInstance()
 
         with pytest.raises(StorageConfigError, match="not initialized"):
-            service.store("test-key", b"data")
+            await service.store("test-key", b"data")
 
-    def testGetWithoutInitRaisesError(self):
+    async def testGetWithoutInitRaisesError(self):
         """Test that get without init raises error"""
         service = StorageService.getInstance()
 
         with pytest.raises(StorageConfigError, match="not initialized"):
-            service.get("test-key")
+            await service.get("test-key")
 
-    def testExistsWithoutInitRaisesError(self):
+    async def testExistsWithoutInitRaisesError(self):
         """Test that exists without init raises error"""
         service = StorageService.getInstance()
 
         with pytest.raises(StorageConfigError, match="not initialized"):
-            service.exists("test-key")
+            await service.exists("test-key")
 
-    def testDeleteWithoutInitRaisesError(self):
+    async def testDeleteWithoutInitRaisesError(self):
         """Test that delete without init raises error"""
         service = StorageService.getInstance()
 
         with pytest.raises(StorageConfigError, match="not initialized"):
-            service.delete("test-key")
+            await service.delete("test-key")
 
-    def testListWithoutInitRaisesError(self):
+    async def testListWithoutInitRaisesError(self):
         """Test that list without init raises error"""
         service = StorageService.getInstance()
 
         with pytest.raises(StorageConfigError, match="not initialized"):
-            service.list()
+            await service.list()
 
 
 class TestStorageServiceErrorPropagation:
@@ -362,39 +367,39 @@ class TestStorageServiceErrorPropagation:
         service.backend = Mock()
         return service
 
-    def testStoreKeyErrorPropagated(self, configuredService):
+    async def testStoreKeyErrorPropagated(self, configuredService):
         """Test that StorageKeyError is propagated"""
         configuredService.backend.store = Mock(side_effect=StorageKeyError("Invalid key"))
 
         with pytest.raises(StorageKeyError, match="Invalid key"):
-            configuredService.store("", b"data")
+            await configuredService.store("", b"data")
 
-    def testGetKeyErrorPropagated(self, configuredService):
+    async def testGetKeyErrorPropagated(self, configuredService):
         """Test that StorageKeyError from get is propagated"""
         configuredService.backend.get = Mock(side_effect=StorageKeyError("Invalid key"))
 
         with pytest.raises(StorageKeyError, match="Invalid key"):
-            configuredService.get("")
+            await configuredService.get("")
 
-    def testExistsKeyErrorPropagated(self, configuredService):
+    async def testExistsKeyErrorPropagated(self, configuredService):
         """Test that StorageKeyError from exists is propagated"""
         configuredService.backend.exists = Mock(side_effect=StorageKeyError("Invalid key"))
 
         with pytest.raises(StorageKeyError, match="Invalid key"):
-            configuredService.exists("")
+            await configuredService.exists("")
 
-    def testDeleteKeyErrorPropagated(self, configuredService):
+    async def testDeleteKeyErrorPropagated(self, configuredService):
         """Test that StorageKeyError from delete is propagated"""
         configuredService.backend.delete = Mock(side_effect=StorageKeyError("Invalid key"))
 
         with pytest.raises(StorageKeyError, match="Invalid key"):
-            configuredService.delete("")
+            await configuredService.delete("")
 
 
 class TestStorageServiceRealWorldScenarios:
     """Test real-world usage scenarios, dood!"""
 
-    def testCompleteWorkflow(self, mockConfigManager, tmp_path):
+    async def testCompleteWorkflow(self, mockConfigManager, tmp_path):
         """Test complete workflow from config to operations"""
         mockConfigManager.getStorageConfig.return_value = {"type": "fs", "fs": {"base-dir": str(tmp_path)}}
 
@@ -403,24 +408,24 @@ class TestStorageServiceRealWorldScenarios:
         service.injectConfig(mockConfigManager)
 
         # Store data
-        service.store("test-key", b"test data")
+        await service.store("test-key", b"test data")
 
         # Verify exists
-        assert service.exists("test-key") is True
+        assert await service.exists("test-key") is True
 
         # Retrieve data
-        data = service.get("test-key")
+        data = await service.get("test-key")
         assert data == b"test data"
 
         # List files
-        keys = service.list()
+        keys = await service.list()
         assert "test-key" in keys
 
         # Delete
-        assert service.delete("test-key") is True
-        assert service.exists("test-key") is False
+        assert await service.delete("test-key") is True
+        assert await service.exists("test-key") is False
 
-    def testMultipleFiles(self, mockConfigManager, tmp_path):
+    async def testMultipleFiles(self, mockConfigManager, tmp_path):
         """Test storing multiple files"""
         mockConfigManager.getStorageConfig.return_value = {"type": "fs", "fs": {"base-dir": str(tmp_path)}}
 
@@ -431,14 +436,14 @@ class TestStorageServiceRealWorldScenarios:
         files = {"file1.txt": b"data1", "file2.txt": b"data2", "file3.txt": b"data3"}
 
         for key, data in files.items():
-            service.store(key, data)
+            await service.store(key, data)
 
         # Verify all exist
         for key in files.keys():
-            assert service.exists(key) is True
+            assert await service.exists(key) is True
 
         # List all
-        keys = service.list()
+        keys = await service.list()
         assert len(keys) == 3
 
     def testSwitchingBackends(self, mockConfigManager, tmp_path):
@@ -453,3 +458,122 @@ class TestStorageServiceRealWorldScenarios:
         mockConfigManager.getStorageConfig.return_value = {"type": "fs", "fs": {"base-dir": str(tmp_path)}}
         service.injectConfig(mockConfigManager)
         assert isinstance(service.backend, FSStorageBackend)
+
+
+class TestStorageServiceStreaming:
+    """Test streaming reads and writes through the service, dood!"""
+
+    @pytest.fixture
+    def fsService(self, mockConfigManager, tmp_path):
+        """Create a service with filesystem backend"""
+        mockConfigManager.getStorageConfig.return_value = {"type": "fs", "fs": {"base-dir": str(tmp_path)}}
+        service = StorageService.getInstance()
+        service.injectConfig(mockConfigManager)
+        return service
+
+    async def testOpenWriteAndOpenRead(self, fsService):
+        """Test streaming an object in and out in chunks"""
+        async with fsService.openWrite("video.mp4") as writer:
+            for i in range(5):
+                await writer.write(bytes([i]) * 10)
+        assert writer.size == 50
+
+        reader = await fsService.openRead("video.mp4", chunkSize=20)
+        assert reader is not None
+        async with reader:
+            chunks = [chunk async for chunk in reader]
+
+        assert [len(chunk) for chunk in chunks] == [20, 20, 10]
+        assert b"".join(chunks) == await fsService.get("video.mp4")
+
+    async def testOpenWriteDiscardedOnError(self, fsService):
+        """Test that an object is not stored if the writing block raises"""
+        with pytest.raises(RuntimeError):
+            async with fsService.openWrite("broken.bin") as writer:
+                await writer.write(b"partial")
+                raise RuntimeError("download failed")
+
+        assert await fsService.exists("broken.bin") is False
+        assert await fsService.list() == []
+
+    async def testOpenReadMissing(self, fsService):
+        """Test that opening a missing object returns None"""
+        assert await fsService.openRead("missing.bin") is None
+
+    async def testBackendCallsDoNotBlockEventLoop(self, fsService):
+        """Test that a slow backend call runs off the event loop"""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slowStore(key: str, data: bytes) -> None:
+            started.set()
+            release.wait(5)
+
+        fsService.backend.store = slowStore
+        storeTask = asyncio.create_task(fsService.store("slow-key", b"data"))
+
+        # The loop keeps running while the backend call is blocked
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        assert not storeTask.done()
+        release.set()
+        await storeTask
+
+
+class TestStorageServiceObjectCache:
+    """Test the in-memory cache of small objects, dood!"""
+
+    @pytest.fixture
+    def cachedService(self, mockConfigManager, tmp_path):
+        """Create a filesystem service with object cache"""
+        mockConfigManager.getStorageConfig.return_value = {
+            "type": "fs",
+            "fs": {"base-dir": str(tmp_path)},
+            "cache": {"max-items": 10, "max-bytes": 1000, "max-object-size": 100},
+        }
+        service = StorageService.getInstance()
+        service.injectConfig(mockConfigManager)
+        return service
+
+    def testCacheDisabledByDefault(self, mockConfigManager):
+        """Test that the cache is disabled without cache configuration"""
+        mockConfigManager.getStorageConfig.return_value = {"type": "null"}
+        service = StorageService.getInstance()
+        service.injectConfig(mockConfigManager)
+
+        assert service.objectCache.enabled is False
+
+    async def testSmallObjectServedFromCache(self, cachedService):
+        """Test that repeated reads of a small object hit the backend once"""
+        await cachedService.store("sticker.webp", b"sticker")
+        backendGet = Mock(wraps=cachedService.backend.get)
+        cachedService.backend.get = backendGet
+
+        assert await cachedService.get("sticker.webp") == b"sticker"
+        assert await cachedService.get("sticker.webp") == b"sticker"
+
+        backendGet.assert_called_once_with("sticker.webp")
+        assert cachedService.objectCache.hits == 1
+
+    async def testLargeObjectNotCached(self, cachedService):
+        """Test that objects above max-object-size are not cached"""
+        await cachedService.store("video.mp4", b"x" * 101)
+
+        await cachedService.get("video.mp4")
+
+        assert len(cachedService.objectCache) == 0
+
+    async def testWritesInvalidateCache(self, cachedService):
+        """Test that store, openWrite and delete invalidate cached objects"""
+        await cachedService.store("avatar.jpg", b"v1")
+        assert await cachedService.get("avatar.jpg") == b"v1"
+
+        await cachedService.store("avatar.jpg", b"v2")
+        assert await cachedService.get("avatar.jpg") == b"v2"
+
+        async with cachedService.openWrite("avatar.jpg") as writer:
+            await writer.write(b"v3")
+        assert await cachedService.get("avatar.jpg") == b"v3"
+
+        assert await cachedService.delete("avatar.jpg") is True
+        assert await cachedService.get("avatar.jpg") is None